@@ -0,0 +1,2 @@
+pub const enable_raster_backend: bool = true;
+pub const enable_harmonious_generic_fallbacks: bool = true;
@@ -0,0 +1,9 @@
+pub const enable_raster_backend: bool = true;
+pub const enable_harmonious_generic_fallbacks: bool = true;
+pub const @"build.PrerenderedAssets" = enum (u2) {
+    none = 0,
+    compact = 1,
+    full = 2,
+};
+pub const prerendered_assets: @"build.PrerenderedAssets" = .none;
+pub const pack_sidecar_dir: []const u8 = "/root/package/zig-out/share/libmusictheory/packs";
@@ -0,0 +1 @@
+pub const pack_sidecar_dir: []const u8 = "";
@@ -0,0 +1 @@
+pub const enable_harmonious_generic_fallbacks: bool = false;
@@ -0,0 +1,1738 @@
+pub const __builtin_bswap16 = @import("std").zig.c_builtins.__builtin_bswap16;
+pub const __builtin_bswap32 = @import("std").zig.c_builtins.__builtin_bswap32;
+pub const __builtin_bswap64 = @import("std").zig.c_builtins.__builtin_bswap64;
+pub const __builtin_signbit = @import("std").zig.c_builtins.__builtin_signbit;
+pub const __builtin_signbitf = @import("std").zig.c_builtins.__builtin_signbitf;
+pub const __builtin_popcount = @import("std").zig.c_builtins.__builtin_popcount;
+pub const __builtin_ctz = @import("std").zig.c_builtins.__builtin_ctz;
+pub const __builtin_clz = @import("std").zig.c_builtins.__builtin_clz;
+pub const __builtin_sqrt = @import("std").zig.c_builtins.__builtin_sqrt;
+pub const __builtin_sqrtf = @import("std").zig.c_builtins.__builtin_sqrtf;
+pub const __builtin_sin = @import("std").zig.c_builtins.__builtin_sin;
+pub const __builtin_sinf = @import("std").zig.c_builtins.__builtin_sinf;
+pub const __builtin_cos = @import("std").zig.c_builtins.__builtin_cos;
+pub const __builtin_cosf = @import("std").zig.c_builtins.__builtin_cosf;
+pub const __builtin_exp = @import("std").zig.c_builtins.__builtin_exp;
+pub const __builtin_expf = @import("std").zig.c_builtins.__builtin_expf;
+pub const __builtin_exp2 = @import("std").zig.c_builtins.__builtin_exp2;
+pub const __builtin_exp2f = @import("std").zig.c_builtins.__builtin_exp2f;
+pub const __builtin_log = @import("std").zig.c_builtins.__builtin_log;
+pub const __builtin_logf = @import("std").zig.c_builtins.__builtin_logf;
+pub const __builtin_log2 = @import("std").zig.c_builtins.__builtin_log2;
+pub const __builtin_log2f = @import("std").zig.c_builtins.__builtin_log2f;
+pub const __builtin_log10 = @import("std").zig.c_builtins.__builtin_log10;
+pub const __builtin_log10f = @import("std").zig.c_builtins.__builtin_log10f;
+pub const __builtin_abs = @import("std").zig.c_builtins.__builtin_abs;
+pub const __builtin_labs = @import("std").zig.c_builtins.__builtin_labs;
+pub const __builtin_llabs = @import("std").zig.c_builtins.__builtin_llabs;
+pub const __builtin_fabs = @import("std").zig.c_builtins.__builtin_fabs;
+pub const __builtin_fabsf = @import("std").zig.c_builtins.__builtin_fabsf;
+pub const __builtin_floor = @import("std").zig.c_builtins.__builtin_floor;
+pub const __builtin_floorf = @import("std").zig.c_builtins.__builtin_floorf;
+pub const __builtin_ceil = @import("std").zig.c_builtins.__builtin_ceil;
+pub const __builtin_ceilf = @import("std").zig.c_builtins.__builtin_ceilf;
+pub const __builtin_trunc = @import("std").zig.c_builtins.__builtin_trunc;
+pub const __builtin_truncf = @import("std").zig.c_builtins.__builtin_truncf;
+pub const __builtin_round = @import("std").zig.c_builtins.__builtin_round;
+pub const __builtin_roundf = @import("std").zig.c_builtins.__builtin_roundf;
+pub const __builtin_strlen = @import("std").zig.c_builtins.__builtin_strlen;
+pub const __builtin_strcmp = @import("std").zig.c_builtins.__builtin_strcmp;
+pub const __builtin_object_size = @import("std").zig.c_builtins.__builtin_object_size;
+pub const __builtin___memset_chk = @import("std").zig.c_builtins.__builtin___memset_chk;
+pub const __builtin_memset = @import("std").zig.c_builtins.__builtin_memset;
+pub const __builtin___memcpy_chk = @import("std").zig.c_builtins.__builtin___memcpy_chk;
+pub const __builtin_memcpy = @import("std").zig.c_builtins.__builtin_memcpy;
+pub const __builtin_expect = @import("std").zig.c_builtins.__builtin_expect;
+pub const __builtin_nanf = @import("std").zig.c_builtins.__builtin_nanf;
+pub const __builtin_huge_valf = @import("std").zig.c_builtins.__builtin_huge_valf;
+pub const __builtin_inff = @import("std").zig.c_builtins.__builtin_inff;
+pub const __builtin_isnan = @import("std").zig.c_builtins.__builtin_isnan;
+pub const __builtin_isinf = @import("std").zig.c_builtins.__builtin_isinf;
+pub const __builtin_isinf_sign = @import("std").zig.c_builtins.__builtin_isinf_sign;
+pub const __has_builtin = @import("std").zig.c_builtins.__has_builtin;
+pub const __builtin_assume = @import("std").zig.c_builtins.__builtin_assume;
+pub const __builtin_unreachable = @import("std").zig.c_builtins.__builtin_unreachable;
+pub const __builtin_constant_p = @import("std").zig.c_builtins.__builtin_constant_p;
+pub const __builtin_mul_overflow = @import("std").zig.c_builtins.__builtin_mul_overflow;
+pub const int_least64_t = i64;
+pub const uint_least64_t = u64;
+pub const int_fast64_t = i64;
+pub const uint_fast64_t = u64;
+pub const int_least32_t = i32;
+pub const uint_least32_t = u32;
+pub const int_fast32_t = i32;
+pub const uint_fast32_t = u32;
+pub const int_least16_t = i16;
+pub const uint_least16_t = u16;
+pub const int_fast16_t = i16;
+pub const uint_fast16_t = u16;
+pub const int_least8_t = i8;
+pub const uint_least8_t = u8;
+pub const int_fast8_t = i8;
+pub const uint_fast8_t = u8;
+pub const intmax_t = c_long;
+pub const uintmax_t = c_ulong;
+pub const lmt_pitch_class_set = u16;
+pub const struct_lmt_context = opaque {};
+pub const lmt_context = struct_lmt_context;
+pub const lmt_write_fn = ?*const fn (?*anyopaque, [*c]const u8, u32) callconv(.c) u32;
+pub const lmt_rows_fn = ?*const fn (?*anyopaque, u32, u32, [*c]const u8, u32) callconv(.c) u32;
+pub const lmt_pitch_class = u8;
+pub const lmt_midi_note = u8;
+pub const lmt_interval = u8;
+pub const lmt_interval_class = u8;
+pub const lmt_scale_type = u8;
+pub const LMT_SCALE_DIATONIC: c_int = 0;
+pub const LMT_SCALE_ACOUSTIC: c_int = 1;
+pub const LMT_SCALE_DIMINISHED: c_int = 2;
+pub const LMT_SCALE_WHOLE_TONE: c_int = 3;
+pub const LMT_SCALE_HARMONIC_MINOR: c_int = 4;
+pub const LMT_SCALE_HARMONIC_MAJOR: c_int = 5;
+pub const LMT_SCALE_DOUBLE_AUGMENTED_HEXATONIC: c_int = 6;
+const enum_unnamed_1 = c_uint;
+pub const lmt_mode_type = u8;
+pub const LMT_MODE_IONIAN: c_int = 0;
+pub const LMT_MODE_DORIAN: c_int = 1;
+pub const LMT_MODE_PHRYGIAN: c_int = 2;
+pub const LMT_MODE_LYDIAN: c_int = 3;
+pub const LMT_MODE_MIXOLYDIAN: c_int = 4;
+pub const LMT_MODE_AEOLIAN: c_int = 5;
+pub const LMT_MODE_LOCRIAN: c_int = 6;
+pub const LMT_MODE_MELODIC_MINOR: c_int = 7;
+pub const LMT_MODE_DORIAN_B2: c_int = 8;
+pub const LMT_MODE_LYDIAN_AUG: c_int = 9;
+pub const LMT_MODE_LYDIAN_DOM: c_int = 10;
+pub const LMT_MODE_MIXOLYDIAN_B6: c_int = 11;
+pub const LMT_MODE_LOCRIAN_NAT2: c_int = 12;
+pub const LMT_MODE_SUPER_LOCRIAN: c_int = 13;
+pub const LMT_MODE_HARMONIC_MINOR: c_int = 14;
+pub const LMT_MODE_LOCRIAN_NAT6: c_int = 15;
+pub const LMT_MODE_IONIAN_AUG: c_int = 16;
+pub const LMT_MODE_DORIAN_SHARP4: c_int = 17;
+pub const LMT_MODE_PHRYGIAN_DOMINANT: c_int = 18;
+pub const LMT_MODE_LYDIAN_SHARP2: c_int = 19;
+pub const LMT_MODE_SUPER_LOCRIAN_DIM: c_int = 20;
+pub const LMT_MODE_HALF_WHOLE: c_int = 21;
+pub const LMT_MODE_WHOLE_HALF: c_int = 22;
+pub const LMT_MODE_WHOLE_TONE: c_int = 23;
+pub const LMT_MODE_DOUBLE_HARMONIC: c_int = 24;
+pub const LMT_MODE_HUNGARIAN_MINOR: c_int = 25;
+pub const LMT_MODE_ENIGMATIC: c_int = 26;
+pub const LMT_MODE_NEAPOLITAN_MINOR: c_int = 27;
+pub const LMT_MODE_NEAPOLITAN_MAJOR: c_int = 28;
+const enum_unnamed_2 = c_uint;
+pub const lmt_snap_tie_policy = u8;
+pub const LMT_SNAP_TIE_LOWER: c_int = 0;
+pub const LMT_SNAP_TIE_HIGHER: c_int = 1;
+const enum_unnamed_3 = c_uint;
+pub const lmt_barry_harris_parity_kind = u8;
+pub const LMT_BARRY_HARRIS_NOT_APPLICABLE: c_int = 0;
+pub const LMT_BARRY_HARRIS_CHORD_TONE: c_int = 1;
+pub const LMT_BARRY_HARRIS_PASSING_TONE: c_int = 2;
+const enum_unnamed_4 = c_uint;
+pub const lmt_chord_type = u8;
+pub const LMT_CHORD_MAJOR: c_int = 0;
+pub const LMT_CHORD_MINOR: c_int = 1;
+pub const LMT_CHORD_DIMINISHED: c_int = 2;
+pub const LMT_CHORD_AUGMENTED: c_int = 3;
+const enum_unnamed_5 = c_uint;
+pub const lmt_key_quality = u8;
+pub const LMT_KEY_MAJOR: c_int = 0;
+pub const LMT_KEY_MINOR: c_int = 1;
+const enum_unnamed_6 = c_uint;
+pub const lmt_png_compression = u8;
+pub const LMT_PNG_STORED: c_int = 0;
+pub const LMT_PNG_FAST: c_int = 1;
+const enum_unnamed_7 = c_uint;
+pub const lmt_key_context = extern struct {
+    tonic: u8 = @import("std").mem.zeroes(u8),
+    quality: u8 = @import("std").mem.zeroes(u8),
+};
+pub const lmt_fret_pos = extern struct {
+    string: u8 = @import("std").mem.zeroes(u8),
+    fret: u8 = @import("std").mem.zeroes(u8),
+};
+pub const lmt_guide_dot = extern struct {
+    position: lmt_fret_pos = @import("std").mem.zeroes(lmt_fret_pos),
+    pitch_class: u8 = @import("std").mem.zeroes(u8),
+    opacity: f32 = @import("std").mem.zeroes(f32),
+};
+pub const lmt_context_suggestion = extern struct {
+    score: i32 = @import("std").mem.zeroes(i32),
+    expanded_set: lmt_pitch_class_set = @import("std").mem.zeroes(lmt_pitch_class_set),
+    pitch_class: u8 = @import("std").mem.zeroes(u8),
+    overlap: u8 = @import("std").mem.zeroes(u8),
+    outside_count: u8 = @import("std").mem.zeroes(u8),
+    in_context: u8 = @import("std").mem.zeroes(u8),
+    cluster_free: u8 = @import("std").mem.zeroes(u8),
+    reads_as_named_chord: u8 = @import("std").mem.zeroes(u8),
+};
+pub const lmt_scale_snap_candidates = extern struct {
+    in_scale: u8 = @import("std").mem.zeroes(u8),
+    has_lower: u8 = @import("std").mem.zeroes(u8),
+    has_upper: u8 = @import("std").mem.zeroes(u8),
+    reserved0: u8 = @import("std").mem.zeroes(u8),
+    lower: lmt_midi_note = @import("std").mem.zeroes(lmt_midi_note),
+    upper: lmt_midi_note = @import("std").mem.zeroes(lmt_midi_note),
+    lower_distance: u8 = @import("std").mem.zeroes(u8),
+    upper_distance: u8 = @import("std").mem.zeroes(u8),
+};
+pub const lmt_containing_mode_match = extern struct {
+    mode: u8 = @import("std").mem.zeroes(u8),
+    degree: u8 = @import("std").mem.zeroes(u8),
+    reserved0: u8 = @import("std").mem.zeroes(u8),
+    reserved1: u8 = @import("std").mem.zeroes(u8),
+};
+pub const lmt_chord_match = extern struct {
+    root: u8 = @import("std").mem.zeroes(u8),
+    bass: u8 = @import("std").mem.zeroes(u8),
+    pattern: u8 = @import("std").mem.zeroes(u8),
+    interval_count: u8 = @import("std").mem.zeroes(u8),
+    bass_known: u8 = @import("std").mem.zeroes(u8),
+    root_is_bass: u8 = @import("std").mem.zeroes(u8),
+    bass_degree: u8 = @import("std").mem.zeroes(u8),
+    reserved0: u8 = @import("std").mem.zeroes(u8),
+};
+pub const lmt_playability_reason = u8;
+pub const LMT_PLAYABILITY_REASON_REACHABLE_LOCATION: c_int = 0;
+pub const LMT_PLAYABILITY_REASON_REACHABLE_IN_CURRENT_WINDOW: c_int = 1;
+pub const LMT_PLAYABILITY_REASON_MULTIPLE_LOCATIONS_AVAILABLE: c_int = 2;
+pub const LMT_PLAYABILITY_REASON_EXPANDS_CURRENT_WINDOW: c_int = 3;
+pub const LMT_PLAYABILITY_REASON_OPEN_STRING_RELIEF: c_int = 4;
+pub const LMT_PLAYABILITY_REASON_REUSES_CURRENT_ANCHOR: c_int = 5;
+pub const LMT_PLAYABILITY_REASON_BOTTLENECK_REDUCED: c_int = 6;
+pub const LMT_PLAYABILITY_REASON_TECHNIQUE_PROFILE_APPLIED: c_int = 7;
+pub const LMT_PLAYABILITY_REASON_HAND_CONTINUITY_RESET: c_int = 8;
+const enum_unnamed_8 = c_uint;
+pub const lmt_playability_warning = u8;
+pub const LMT_PLAYABILITY_WARNING_SHIFT_REQUIRED: c_int = 0;
+pub const LMT_PLAYABILITY_WARNING_COMFORT_WINDOW_EXCEEDED: c_int = 1;
+pub const LMT_PLAYABILITY_WARNING_HARD_LIMIT_EXCEEDED: c_int = 2;
+pub const LMT_PLAYABILITY_WARNING_AMBIGUOUS_HAND_ASSIGNMENT: c_int = 3;
+pub const LMT_PLAYABILITY_WARNING_EXCESSIVE_LONGITUDINAL_SHIFT: c_int = 4;
+pub const LMT_PLAYABILITY_WARNING_REPEATED_MAXIMAL_STRETCH: c_int = 5;
+pub const LMT_PLAYABILITY_WARNING_WEAK_FINGER_STRESS: c_int = 6;
+pub const LMT_PLAYABILITY_WARNING_UNSUPPORTED_EXTENSION: c_int = 7;
+pub const LMT_PLAYABILITY_WARNING_THUMB_ON_BLACK_UNDER_STRETCH: c_int = 8;
+pub const LMT_PLAYABILITY_WARNING_AWKWARD_THUMB_CROSSING: c_int = 9;
+pub const LMT_PLAYABILITY_WARNING_REPEATED_WEAK_ADJACENT_FINGER_SEQUENCE: c_int = 10;
+pub const LMT_PLAYABILITY_WARNING_FLUENCY_DEGRADATION_FROM_RECENT_MOTION: c_int = 11;
+const enum_unnamed_9 = c_uint;
+pub const lmt_playability_policy = u8;
+pub const LMT_PLAYABILITY_POLICY_BALANCED: c_int = 0;
+pub const LMT_PLAYABILITY_POLICY_MINIMAX_BOTTLENECK: c_int = 1;
+pub const LMT_PLAYABILITY_POLICY_CUMULATIVE_STRAIN: c_int = 2;
+const enum_unnamed_10 = c_uint;
+pub const lmt_playability_profile_preset = u8;
+pub const LMT_PLAYABILITY_PROFILE_COMPACT_BEGINNER: c_int = 0;
+pub const LMT_PLAYABILITY_PROFILE_BALANCED_STANDARD: c_int = 1;
+pub const LMT_PLAYABILITY_PROFILE_SPAN_TOLERANT: c_int = 2;
+pub const LMT_PLAYABILITY_PROFILE_SHIFT_TOLERANT: c_int = 3;
+const enum_unnamed_11 = c_uint;
+pub const lmt_playability_phrase_issue_scope = u8;
+pub const LMT_PLAYABILITY_PHRASE_ISSUE_EVENT: c_int = 0;
+pub const LMT_PLAYABILITY_PHRASE_ISSUE_TRANSITION: c_int = 1;
+const enum_unnamed_12 = c_uint;
+pub const lmt_playability_phrase_issue_severity = u8;
+pub const LMT_PLAYABILITY_PHRASE_SEVERITY_ADVISORY: c_int = 0;
+pub const LMT_PLAYABILITY_PHRASE_SEVERITY_WARNING: c_int = 1;
+pub const LMT_PLAYABILITY_PHRASE_SEVERITY_BLOCKED: c_int = 2;
+const enum_unnamed_13 = c_uint;
+pub const lmt_playability_phrase_family_domain = u8;
+pub const LMT_PLAYABILITY_PHRASE_DOMAIN_NONE: c_int = 0;
+pub const LMT_PLAYABILITY_PHRASE_DOMAIN_REASON: c_int = 1;
+pub const LMT_PLAYABILITY_PHRASE_DOMAIN_WARNING: c_int = 2;
+pub const LMT_PLAYABILITY_PHRASE_DOMAIN_FRET_BLOCKER: c_int = 3;
+pub const LMT_PLAYABILITY_PHRASE_DOMAIN_KEYBOARD_BLOCKER: c_int = 4;
+const enum_unnamed_14 = c_uint;
+pub const lmt_playability_phrase_strain_bucket = u8;
+pub const LMT_PLAYABILITY_PHRASE_STRAIN_NEUTRAL: c_int = 0;
+pub const LMT_PLAYABILITY_PHRASE_STRAIN_ELEVATED: c_int = 1;
+pub const LMT_PLAYABILITY_PHRASE_STRAIN_HIGH: c_int = 2;
+pub const LMT_PLAYABILITY_PHRASE_STRAIN_BLOCKED: c_int = 3;
+const enum_unnamed_15 = c_uint;
+pub const lmt_playability_repair_class = u8;
+pub const LMT_PLAYABILITY_REPAIR_REALIZATION_ONLY: c_int = 0;
+pub const LMT_PLAYABILITY_REPAIR_REGISTER_ADJUSTED: c_int = 1;
+pub const LMT_PLAYABILITY_REPAIR_TEXTURE_REDUCED: c_int = 2;
+const enum_unnamed_16 = c_uint;
+pub const lmt_fret_playability_blocker = u8;
+pub const LMT_FRET_PLAYABILITY_BLOCKER_SPAN_HARD_LIMIT: c_int = 0;
+pub const LMT_FRET_PLAYABILITY_BLOCKER_SHIFT_HARD_LIMIT: c_int = 1;
+pub const LMT_FRET_PLAYABILITY_BLOCKER_STRING_SPAN_HARD_LIMIT: c_int = 2;
+pub const LMT_FRET_PLAYABILITY_BLOCKER_FINGER_OVERLOAD: c_int = 3;
+pub const LMT_FRET_PLAYABILITY_BLOCKER_UNSUPPORTED_EXTENSION: c_int = 4;
+const enum_unnamed_17 = c_uint;
+pub const lmt_fret_technique_profile = u8;
+pub const LMT_FRET_TECHNIQUE_GENERIC_GUITAR: c_int = 0;
+pub const LMT_FRET_TECHNIQUE_BASS_SIMANDL: c_int = 1;
+pub const LMT_FRET_TECHNIQUE_BASS_OFPF: c_int = 2;
+pub const LMT_FRET_TECHNIQUE_EXTENDED_RANGE_CLASSICAL_THUMB: c_int = 3;
+const enum_unnamed_18 = c_uint;
+pub const lmt_keyboard_hand = u8;
+pub const LMT_KEYBOARD_HAND_LEFT: c_int = 0;
+pub const LMT_KEYBOARD_HAND_RIGHT: c_int = 1;
+const enum_unnamed_19 = c_uint;
+pub const lmt_keyboard_playability_blocker = u8;
+pub const LMT_KEYBOARD_PLAYABILITY_BLOCKER_SPAN_HARD_LIMIT: c_int = 0;
+pub const LMT_KEYBOARD_PLAYABILITY_BLOCKER_NOTE_COUNT_EXCEEDS_FINGERS: c_int = 1;
+pub const LMT_KEYBOARD_PLAYABILITY_BLOCKER_SHIFT_HARD_LIMIT: c_int = 2;
+pub const LMT_KEYBOARD_PLAYABILITY_BLOCKER_IMPOSSIBLE_THUMB_CROSSING: c_int = 3;
+const enum_unnamed_20 = c_uint;
+pub const LMT_MAX_FRET_PLAYABILITY_STRINGS: c_int = 16;
+pub const LMT_MAX_KEYBOARD_FINGERING_NOTES: c_int = 5;
+pub const LMT_MAX_PHRASE_EVENTS: c_int = 64;
+const enum_unnamed_21 = c_uint;
+pub const lmt_hand_profile = extern struct {
+    finger_count: u8 = @import("std").mem.zeroes(u8),
+    comfort_span_steps: u8 = @import("std").mem.zeroes(u8),
+    limit_span_steps: u8 = @import("std").mem.zeroes(u8),
+    comfort_shift_steps: u8 = @import("std").mem.zeroes(u8),
+    limit_shift_steps: u8 = @import("std").mem.zeroes(u8),
+    prefers_low_tension: u8 = @import("std").mem.zeroes(u8),
+    reserved0: u8 = @import("std").mem.zeroes(u8),
+    reserved1: u8 = @import("std").mem.zeroes(u8),
+};
+pub const lmt_playability_difficulty_summary = extern struct {
+    accepted: u8 = @import("std").mem.zeroes(u8),
+    blocker_count: u8 = @import("std").mem.zeroes(u8),
+    warning_count: u8 = @import("std").mem.zeroes(u8),
+    reason_count: u8 = @import("std").mem.zeroes(u8),
+    bottleneck_cost: u16 = @import("std").mem.zeroes(u16),
+    cumulative_cost: u16 = @import("std").mem.zeroes(u16),
+    span_steps: u8 = @import("std").mem.zeroes(u8),
+    shift_steps: u8 = @import("std").mem.zeroes(u8),
+    load_event_count: u8 = @import("std").mem.zeroes(u8),
+    peak_recent_span_steps: u8 = @import("std").mem.zeroes(u8),
+    peak_recent_shift_steps: u8 = @import("std").mem.zeroes(u8),
+    reserved0: u8 = @import("std").mem.zeroes(u8),
+    comfort_span_margin: i16 = @import("std").mem.zeroes(i16),
+    limit_span_margin: i16 = @import("std").mem.zeroes(i16),
+    comfort_shift_margin: i16 = @import("std").mem.zeroes(i16),
+    limit_shift_margin: i16 = @import("std").mem.zeroes(i16),
+};
+pub const lmt_keyboard_phrase_event = extern struct {
+    note_count: u8 = @import("std").mem.zeroes(u8),
+    hand: u8 = @import("std").mem.zeroes(u8),
+    reserved0: u8 = @import("std").mem.zeroes(u8),
+    reserved1: u8 = @import("std").mem.zeroes(u8),
+    notes: [5]u8 = @import("std").mem.zeroes([5]u8),
+};
+pub const lmt_fret_phrase_event = extern struct {
+    fret_count: u8 = @import("std").mem.zeroes(u8),
+    reserved0: u8 = @import("std").mem.zeroes(u8),
+    reserved1: u8 = @import("std").mem.zeroes(u8),
+    reserved2: u8 = @import("std").mem.zeroes(u8),
+    frets: [16]i8 = @import("std").mem.zeroes([16]i8),
+};
+pub const lmt_keyboard_committed_phrase_memory = extern struct {
+    event_count: u8 = @import("std").mem.zeroes(u8),
+    reserved0: u8 = @import("std").mem.zeroes(u8),
+    reserved1: u8 = @import("std").mem.zeroes(u8),
+    reserved2: u8 = @import("std").mem.zeroes(u8),
+    events: [64]lmt_keyboard_phrase_event = @import("std").mem.zeroes([64]lmt_keyboard_phrase_event),
+};
+pub const lmt_fret_committed_phrase_memory = extern struct {
+    event_count: u8 = @import("std").mem.zeroes(u8),
+    reserved0: u8 = @import("std").mem.zeroes(u8),
+    reserved1: u8 = @import("std").mem.zeroes(u8),
+    reserved2: u8 = @import("std").mem.zeroes(u8),
+    events: [64]lmt_fret_phrase_event = @import("std").mem.zeroes([64]lmt_fret_phrase_event),
+};
+pub const lmt_playability_phrase_issue = extern struct {
+    scope: u8 = @import("std").mem.zeroes(u8),
+    severity: u8 = @import("std").mem.zeroes(u8),
+    family_domain: u8 = @import("std").mem.zeroes(u8),
+    family_index: u8 = @import("std").mem.zeroes(u8),
+    event_index: u16 = @import("std").mem.zeroes(u16),
+    related_event_index: u16 = @import("std").mem.zeroes(u16),
+    magnitude: u16 = @import("std").mem.zeroes(u16),
+    reserved0: u16 = @import("std").mem.zeroes(u16),
+};
+pub const lmt_playability_phrase_summary = extern struct {
+    event_count: u16 = @import("std").mem.zeroes(u16),
+    issue_count: u16 = @import("std").mem.zeroes(u16),
+    first_blocked_event_index: u16 = @import("std").mem.zeroes(u16),
+    first_blocked_transition_from_index: u16 = @import("std").mem.zeroes(u16),
+    first_blocked_transition_to_index: u16 = @import("std").mem.zeroes(u16),
+    bottleneck_issue_index: u16 = @import("std").mem.zeroes(u16),
+    bottleneck_magnitude: u16 = @import("std").mem.zeroes(u16),
+    bottleneck_severity: u8 = @import("std").mem.zeroes(u8),
+    bottleneck_domain: u8 = @import("std").mem.zeroes(u8),
+    bottleneck_family_index: u8 = @import("std").mem.zeroes(u8),
+    strain_bucket: u8 = @import("std").mem.zeroes(u8),
+    dominant_reason_family: u8 = @import("std").mem.zeroes(u8),
+    dominant_warning_family: u8 = @import("std").mem.zeroes(u8),
+    reserved0: u8 = @import("std").mem.zeroes(u8),
+    severity_counts: [3]u16 = @import("std").mem.zeroes([3]u16),
+    reason_family_counts: [9]u16 = @import("std").mem.zeroes([9]u16),
+    warning_family_counts: [12]u16 = @import("std").mem.zeroes([12]u16),
+    recovery_deficit_start_index: u16 = @import("std").mem.zeroes(u16),
+    recovery_deficit_end_index: u16 = @import("std").mem.zeroes(u16),
+    longest_recovery_deficit_run: u16 = @import("std").mem.zeroes(u16),
+};
+pub const lmt_playability_repair_policy = extern struct {
+    max_class: u8 = @import("std").mem.zeroes(u8),
+    preserve_bass: u8 = @import("std").mem.zeroes(u8),
+    preserve_top_voice: u8 = @import("std").mem.zeroes(u8),
+    prefer_inner_changes: u8 = @import("std").mem.zeroes(u8),
+    allow_hand_reassignment: u8 = @import("std").mem.zeroes(u8),
+    reserved0: u8 = @import("std").mem.zeroes(u8),
+    reserved1: u8 = @import("std").mem.zeroes(u8),
+    reserved2: u8 = @import("std").mem.zeroes(u8),
+};
+pub const lmt_ranked_keyboard_phrase_repair = extern struct {
+    repair_class: u8 = @import("std").mem.zeroes(u8),
+    changed_from_index: u8 = @import("std").mem.zeroes(u8),
+    changed_to_index: u8 = @import("std").mem.zeroes(u8),
+    changed_from_value: u8 = @import("std").mem.zeroes(u8),
+    changed_to_value: u8 = @import("std").mem.zeroes(u8),
+    crossed_musical_change_boundary: u8 = @import("std").mem.zeroes(u8),
+    hand: u8 = @import("std").mem.zeroes(u8),
+    reserved0: u8 = @import("std").mem.zeroes(u8),
+    target_event_index: u16 = @import("std").mem.zeroes(u16),
+    reserved1: u16 = @import("std").mem.zeroes(u16),
+    preserved_mask: u32 = @import("std").mem.zeroes(u32),
+    change_mask: u32 = @import("std").mem.zeroes(u32),
+    bottleneck_lift: i16 = @import("std").mem.zeroes(i16),
+    issue_lift: i16 = @import("std").mem.zeroes(i16),
+    blocked_issue_lift: i16 = @import("std").mem.zeroes(i16),
+    warning_issue_lift: i16 = @import("std").mem.zeroes(i16),
+    before_summary: lmt_playability_phrase_summary = @import("std").mem.zeroes(lmt_playability_phrase_summary),
+    after_summary: lmt_playability_phrase_summary = @import("std").mem.zeroes(lmt_playability_phrase_summary),
+    replacement_event: lmt_keyboard_phrase_event = @import("std").mem.zeroes(lmt_keyboard_phrase_event),
+};
+pub const lmt_ranked_fret_phrase_repair = extern struct {
+    repair_class: u8 = @import("std").mem.zeroes(u8),
+    changed_from_index: u8 = @import("std").mem.zeroes(u8),
+    changed_to_index: u8 = @import("std").mem.zeroes(u8),
+    changed_from_value: i8 = @import("std").mem.zeroes(i8),
+    changed_to_value: i8 = @import("std").mem.zeroes(i8),
+    crossed_musical_change_boundary: u8 = @import("std").mem.zeroes(u8),
+    technique: u8 = @import("std").mem.zeroes(u8),
+    reserved0: u8 = @import("std").mem.zeroes(u8),
+    target_event_index: u16 = @import("std").mem.zeroes(u16),
+    reserved1: u16 = @import("std").mem.zeroes(u16),
+    preserved_mask: u32 = @import("std").mem.zeroes(u32),
+    change_mask: u32 = @import("std").mem.zeroes(u32),
+    bottleneck_lift: i16 = @import("std").mem.zeroes(i16),
+    issue_lift: i16 = @import("std").mem.zeroes(i16),
+    blocked_issue_lift: i16 = @import("std").mem.zeroes(i16),
+    warning_issue_lift: i16 = @import("std").mem.zeroes(i16),
+    before_summary: lmt_playability_phrase_summary = @import("std").mem.zeroes(lmt_playability_phrase_summary),
+    after_summary: lmt_playability_phrase_summary = @import("std").mem.zeroes(lmt_playability_phrase_summary),
+    replacement_event: lmt_fret_phrase_event = @import("std").mem.zeroes(lmt_fret_phrase_event),
+};
+pub const lmt_temporal_load_state = extern struct {
+    event_count: u8 = @import("std").mem.zeroes(u8),
+    last_anchor_step: u8 = @import("std").mem.zeroes(u8),
+    last_span_steps: u8 = @import("std").mem.zeroes(u8),
+    last_shift_steps: u8 = @import("std").mem.zeroes(u8),
+    peak_span_steps: u8 = @import("std").mem.zeroes(u8),
+    peak_shift_steps: u8 = @import("std").mem.zeroes(u8),
+    cumulative_span_steps: u16 = @import("std").mem.zeroes(u16),
+    cumulative_shift_steps: u16 = @import("std").mem.zeroes(u16),
+};
+pub const lmt_fret_candidate_location = extern struct {
+    position: lmt_fret_pos = @import("std").mem.zeroes(lmt_fret_pos),
+    in_window: u8 = @import("std").mem.zeroes(u8),
+    shift_steps: u8 = @import("std").mem.zeroes(u8),
+};
+pub const lmt_fret_play_state = extern struct {
+    anchor_fret: u8 = @import("std").mem.zeroes(u8),
+    window_start: u8 = @import("std").mem.zeroes(u8),
+    window_end: u8 = @import("std").mem.zeroes(u8),
+    lowest_string: u8 = @import("std").mem.zeroes(u8),
+    highest_string: u8 = @import("std").mem.zeroes(u8),
+    active_string_count: u8 = @import("std").mem.zeroes(u8),
+    fretted_note_count: u8 = @import("std").mem.zeroes(u8),
+    open_string_count: u8 = @import("std").mem.zeroes(u8),
+    span_steps: u8 = @import("std").mem.zeroes(u8),
+    comfort_fit: u8 = @import("std").mem.zeroes(u8),
+    limit_fit: u8 = @import("std").mem.zeroes(u8),
+    reserved0: u8 = @import("std").mem.zeroes(u8),
+    load: lmt_temporal_load_state = @import("std").mem.zeroes(lmt_temporal_load_state),
+};
+pub const lmt_fret_realization_assessment = extern struct {
+    state: lmt_fret_play_state = @import("std").mem.zeroes(lmt_fret_play_state),
+    string_span_steps: u8 = @import("std").mem.zeroes(u8),
+    profile: u8 = @import("std").mem.zeroes(u8),
+    bottleneck_cost: u16 = @import("std").mem.zeroes(u16),
+    cumulative_cost: u16 = @import("std").mem.zeroes(u16),
+    blocker_bits: u32 = @import("std").mem.zeroes(u32),
+    warning_bits: u32 = @import("std").mem.zeroes(u32),
+    reason_bits: u32 = @import("std").mem.zeroes(u32),
+    recommended_fingers: [16]u8 = @import("std").mem.zeroes([16]u8),
+};
+pub const lmt_fret_transition_assessment = extern struct {
+    from_state: lmt_fret_play_state = @import("std").mem.zeroes(lmt_fret_play_state),
+    to_state: lmt_fret_play_state = @import("std").mem.zeroes(lmt_fret_play_state),
+    anchor_delta_steps: u8 = @import("std").mem.zeroes(u8),
+    changed_string_count: u8 = @import("std").mem.zeroes(u8),
+    profile: u8 = @import("std").mem.zeroes(u8),
+    reserved0: u8 = @import("std").mem.zeroes(u8),
+    bottleneck_cost: u16 = @import("std").mem.zeroes(u16),
+    cumulative_cost: u16 = @import("std").mem.zeroes(u16),
+    blocker_bits: u32 = @import("std").mem.zeroes(u32),
+    warning_bits: u32 = @import("std").mem.zeroes(u32),
+    reason_bits: u32 = @import("std").mem.zeroes(u32),
+    recommended_fingers: [16]u8 = @import("std").mem.zeroes([16]u8),
+};
+pub const lmt_ranked_fret_realization = extern struct {
+    location: lmt_fret_candidate_location = @import("std").mem.zeroes(lmt_fret_candidate_location),
+    bottleneck_cost: u16 = @import("std").mem.zeroes(u16),
+    cumulative_cost: u16 = @import("std").mem.zeroes(u16),
+    blocker_bits: u32 = @import("std").mem.zeroes(u32),
+    warning_bits: u32 = @import("std").mem.zeroes(u32),
+    reason_bits: u32 = @import("std").mem.zeroes(u32),
+    recommended_finger: u8 = @import("std").mem.zeroes(u8),
+    profile: u8 = @import("std").mem.zeroes(u8),
+    reserved0: u8 = @import("std").mem.zeroes(u8),
+    reserved1: u8 = @import("std").mem.zeroes(u8),
+};
+pub const lmt_keybed_key_coord = extern struct {
+    midi: u8 = @import("std").mem.zeroes(u8),
+    is_black: u8 = @import("std").mem.zeroes(u8),
+    octave: u8 = @import("std").mem.zeroes(u8),
+    degree_in_octave: u8 = @import("std").mem.zeroes(u8),
+    x: f32 = @import("std").mem.zeroes(f32),
+    y: f32 = @import("std").mem.zeroes(f32),
+};
+pub const lmt_keyboard_play_state = extern struct {
+    anchor_midi: u8 = @import("std").mem.zeroes(u8),
+    low_midi: u8 = @import("std").mem.zeroes(u8),
+    high_midi: u8 = @import("std").mem.zeroes(u8),
+    active_note_count: u8 = @import("std").mem.zeroes(u8),
+    black_key_count: u8 = @import("std").mem.zeroes(u8),
+    white_key_count: u8 = @import("std").mem.zeroes(u8),
+    span_semitones: u8 = @import("std").mem.zeroes(u8),
+    comfort_fit: u8 = @import("std").mem.zeroes(u8),
+    limit_fit: u8 = @import("std").mem.zeroes(u8),
+    reserved0: u8 = @import("std").mem.zeroes(u8),
+    load: lmt_temporal_load_state = @import("std").mem.zeroes(lmt_temporal_load_state),
+};
+pub const lmt_keyboard_realization_assessment = extern struct {
+    state: lmt_keyboard_play_state = @import("std").mem.zeroes(lmt_keyboard_play_state),
+    hand: u8 = @import("std").mem.zeroes(u8),
+    note_count: u8 = @import("std").mem.zeroes(u8),
+    outer_black_count: u8 = @import("std").mem.zeroes(u8),
+    reserved0: u8 = @import("std").mem.zeroes(u8),
+    bottleneck_cost: u16 = @import("std").mem.zeroes(u16),
+    cumulative_cost: u16 = @import("std").mem.zeroes(u16),
+    blocker_bits: u32 = @import("std").mem.zeroes(u32),
+    warning_bits: u32 = @import("std").mem.zeroes(u32),
+    reason_bits: u32 = @import("std").mem.zeroes(u32),
+    recommended_fingers: [5]u8 = @import("std").mem.zeroes([5]u8),
+};
+pub const lmt_keyboard_transition_assessment = extern struct {
+    from_state: lmt_keyboard_play_state = @import("std").mem.zeroes(lmt_keyboard_play_state),
+    to_state: lmt_keyboard_play_state = @import("std").mem.zeroes(lmt_keyboard_play_state),
+    hand: u8 = @import("std").mem.zeroes(u8),
+    note_count: u8 = @import("std").mem.zeroes(u8),
+    anchor_delta_semitones: u8 = @import("std").mem.zeroes(u8),
+    reserved0: u8 = @import("std").mem.zeroes(u8),
+    bottleneck_cost: u16 = @import("std").mem.zeroes(u16),
+    cumulative_cost: u16 = @import("std").mem.zeroes(u16),
+    blocker_bits: u32 = @import("std").mem.zeroes(u32),
+    warning_bits: u32 = @import("std").mem.zeroes(u32),
+    reason_bits: u32 = @import("std").mem.zeroes(u32),
+    from_fingers: [5]u8 = @import("std").mem.zeroes([5]u8),
+    to_fingers: [5]u8 = @import("std").mem.zeroes([5]u8),
+};
+pub const lmt_ranked_keyboard_fingering = extern struct {
+    hand: u8 = @import("std").mem.zeroes(u8),
+    note_count: u8 = @import("std").mem.zeroes(u8),
+    reserved0: u8 = @import("std").mem.zeroes(u8),
+    reserved1: u8 = @import("std").mem.zeroes(u8),
+    bottleneck_cost: u16 = @import("std").mem.zeroes(u16),
+    cumulative_cost: u16 = @import("std").mem.zeroes(u16),
+    blocker_bits: u32 = @import("std").mem.zeroes(u32),
+    warning_bits: u32 = @import("std").mem.zeroes(u32),
+    reason_bits: u32 = @import("std").mem.zeroes(u32),
+    fingers: [5]u8 = @import("std").mem.zeroes([5]u8),
+};
+pub const lmt_cadence_state = u8;
+pub const LMT_CADENCE_NONE: c_int = 0;
+pub const LMT_CADENCE_STABLE: c_int = 1;
+pub const LMT_CADENCE_PRE_DOMINANT: c_int = 2;
+pub const LMT_CADENCE_DOMINANT: c_int = 3;
+pub const LMT_CADENCE_CADENTIAL_SIX_FOUR: c_int = 4;
+pub const LMT_CADENCE_AUTHENTIC_ARRIVAL: c_int = 5;
+pub const LMT_CADENCE_HALF_ARRIVAL: c_int = 6;
+pub const LMT_CADENCE_DECEPTIVE_PULL: c_int = 7;
+const enum_unnamed_22 = c_uint;
+pub const lmt_cadence_destination = u8;
+pub const LMT_CADENCE_DESTINATION_STABLE_CONTINUATION: c_int = 0;
+pub const LMT_CADENCE_DESTINATION_PRE_DOMINANT_ARRIVAL: c_int = 1;
+pub const LMT_CADENCE_DESTINATION_DOMINANT_ARRIVAL: c_int = 2;
+pub const LMT_CADENCE_DESTINATION_AUTHENTIC_ARRIVAL: c_int = 3;
+pub const LMT_CADENCE_DESTINATION_HALF_ARRIVAL: c_int = 4;
+pub const LMT_CADENCE_DESTINATION_DECEPTIVE_PULL: c_int = 5;
+const enum_unnamed_23 = c_uint;
+pub const lmt_suspension_state = u8;
+pub const LMT_SUSPENSION_NONE: c_int = 0;
+pub const LMT_SUSPENSION_PREPARATION: c_int = 1;
+pub const LMT_SUSPENSION_SUSPENSION: c_int = 2;
+pub const LMT_SUSPENSION_RESOLUTION: c_int = 3;
+pub const LMT_SUSPENSION_UNRESOLVED: c_int = 4;
+const enum_unnamed_24 = c_uint;
+pub const lmt_metric_position = extern struct {
+    beat_in_bar: u8 = @import("std").mem.zeroes(u8),
+    beats_per_bar: u8 = @import("std").mem.zeroes(u8),
+    subdivision: u8 = @import("std").mem.zeroes(u8),
+    reserved: u8 = @import("std").mem.zeroes(u8),
+};
+pub const lmt_voice = extern struct {
+    id: u8 = @import("std").mem.zeroes(u8),
+    midi: u8 = @import("std").mem.zeroes(u8),
+    octave: i8 = @import("std").mem.zeroes(i8),
+    pitch_class: u8 = @import("std").mem.zeroes(u8),
+    sustained: u8 = @import("std").mem.zeroes(u8),
+    reserved0: u8 = @import("std").mem.zeroes(u8),
+    reserved1: u8 = @import("std").mem.zeroes(u8),
+    reserved2: u8 = @import("std").mem.zeroes(u8),
+};
+pub const lmt_voiced_state = extern struct {
+    set_value: lmt_pitch_class_set = @import("std").mem.zeroes(lmt_pitch_class_set),
+    voice_count: u8 = @import("std").mem.zeroes(u8),
+    tonic: u8 = @import("std").mem.zeroes(u8),
+    mode_type: u8 = @import("std").mem.zeroes(u8),
+    key_quality: u8 = @import("std").mem.zeroes(u8),
+    metric: lmt_metric_position = @import("std").mem.zeroes(lmt_metric_position),
+    cadence_state: u8 = @import("std").mem.zeroes(u8),
+    state_index: u8 = @import("std").mem.zeroes(u8),
+    next_voice_id: u8 = @import("std").mem.zeroes(u8),
+    reserved: u8 = @import("std").mem.zeroes(u8),
+    voices: [8]lmt_voice = @import("std").mem.zeroes([8]lmt_voice),
+};
+pub const lmt_voiced_history = extern struct {
+    len: u8 = @import("std").mem.zeroes(u8),
+    next_voice_id: u8 = @import("std").mem.zeroes(u8),
+    reserved0: u8 = @import("std").mem.zeroes(u8),
+    reserved1: u8 = @import("std").mem.zeroes(u8),
+    states: [4]lmt_voiced_state = @import("std").mem.zeroes([4]lmt_voiced_state),
+};
+pub const LMT_VOICE_MOTION_STATIONARY: c_int = 0;
+pub const LMT_VOICE_MOTION_STEP: c_int = 1;
+pub const LMT_VOICE_MOTION_LEAP: c_int = 2;
+pub const lmt_voice_motion_class = c_uint;
+pub const LMT_PAIR_MOTION_NONE: c_int = 0;
+pub const LMT_PAIR_MOTION_CONTRARY: c_int = 1;
+pub const LMT_PAIR_MOTION_SIMILAR: c_int = 2;
+pub const LMT_PAIR_MOTION_PARALLEL: c_int = 3;
+pub const LMT_PAIR_MOTION_OBLIQUE: c_int = 4;
+pub const lmt_pair_motion_class = c_uint;
+pub const lmt_satb_voice = u8;
+pub const LMT_SATB_SOPRANO: c_int = 0;
+pub const LMT_SATB_ALTO: c_int = 1;
+pub const LMT_SATB_TENOR: c_int = 2;
+pub const LMT_SATB_BASS: c_int = 3;
+const enum_unnamed_25 = c_uint;
+pub const LMT_COUNTERPOINT_SPECIES: c_int = 0;
+pub const LMT_COUNTERPOINT_TONAL_CHORALE: c_int = 1;
+pub const LMT_COUNTERPOINT_MODAL_POLYPHONY: c_int = 2;
+pub const LMT_COUNTERPOINT_JAZZ_CLOSE_LEADING: c_int = 3;
+pub const LMT_COUNTERPOINT_FREE_CONTEMPORARY: c_int = 4;
+pub const lmt_counterpoint_rule_profile = c_uint;
+pub const LMT_VOICE_LEADING_PARALLEL_FIFTH: c_int = 0;
+pub const LMT_VOICE_LEADING_PARALLEL_OCTAVE_OR_UNISON: c_int = 1;
+pub const LMT_VOICE_LEADING_VOICE_CROSSING: c_int = 2;
+pub const LMT_VOICE_LEADING_UPPER_SPACING: c_int = 3;
+pub const lmt_voice_leading_violation_kind = c_uint;
+pub const lmt_voice_motion = extern struct {
+    voice_id: u8 = @import("std").mem.zeroes(u8),
+    from_midi: u8 = @import("std").mem.zeroes(u8),
+    to_midi: u8 = @import("std").mem.zeroes(u8),
+    delta: i8 = @import("std").mem.zeroes(i8),
+    abs_delta: u8 = @import("std").mem.zeroes(u8),
+    motion_class: u8 = @import("std").mem.zeroes(u8),
+    retained: u8 = @import("std").mem.zeroes(u8),
+    reserved: u8 = @import("std").mem.zeroes(u8),
+};
+pub const lmt_motion_summary = extern struct {
+    voice_motion_count: u8 = @import("std").mem.zeroes(u8),
+    common_tone_count: u8 = @import("std").mem.zeroes(u8),
+    step_count: u8 = @import("std").mem.zeroes(u8),
+    leap_count: u8 = @import("std").mem.zeroes(u8),
+    contrary_count: u8 = @import("std").mem.zeroes(u8),
+    similar_count: u8 = @import("std").mem.zeroes(u8),
+    parallel_count: u8 = @import("std").mem.zeroes(u8),
+    oblique_count: u8 = @import("std").mem.zeroes(u8),
+    crossing_count: u8 = @import("std").mem.zeroes(u8),
+    overlap_count: u8 = @import("std").mem.zeroes(u8),
+    total_motion: u16 = @import("std").mem.zeroes(u16),
+    outer_interval_before: i8 = @import("std").mem.zeroes(i8),
+    outer_interval_after: i8 = @import("std").mem.zeroes(i8),
+    outer_motion: u8 = @import("std").mem.zeroes(u8),
+    previous_cadence_state: u8 = @import("std").mem.zeroes(u8),
+    current_cadence_state: u8 = @import("std").mem.zeroes(u8),
+    voice_motions: [8]lmt_voice_motion = @import("std").mem.zeroes([8]lmt_voice_motion),
+};
+pub const lmt_motion_evaluation = extern struct {
+    score: i32 = @import("std").mem.zeroes(i32),
+    preferred_score: i16 = @import("std").mem.zeroes(i16),
+    penalty_score: i16 = @import("std").mem.zeroes(i16),
+    cadence_score: i16 = @import("std").mem.zeroes(i16),
+    spacing_penalty: i16 = @import("std").mem.zeroes(i16),
+    leap_penalty: i16 = @import("std").mem.zeroes(i16),
+    disallowed_count: u8 = @import("std").mem.zeroes(u8),
+    disallowed: u8 = @import("std").mem.zeroes(u8),
+};
+pub const lmt_voice_pair_violation = extern struct {
+    kind: u8 = @import("std").mem.zeroes(u8),
+    lower_voice_id: u8 = @import("std").mem.zeroes(u8),
+    upper_voice_id: u8 = @import("std").mem.zeroes(u8),
+    previous_interval_semitones: i8 = @import("std").mem.zeroes(i8),
+    current_interval_semitones: i8 = @import("std").mem.zeroes(i8),
+    reserved0: u8 = @import("std").mem.zeroes(u8),
+    reserved1: u8 = @import("std").mem.zeroes(u8),
+    reserved2: u8 = @import("std").mem.zeroes(u8),
+};
+pub const lmt_motion_independence_summary = extern struct {
+    collapsed: u8 = @import("std").mem.zeroes(u8),
+    direction: i8 = @import("std").mem.zeroes(i8),
+    moving_voice_count: u8 = @import("std").mem.zeroes(u8),
+    stationary_voice_count: u8 = @import("std").mem.zeroes(u8),
+    ascending_count: u8 = @import("std").mem.zeroes(u8),
+    descending_count: u8 = @import("std").mem.zeroes(u8),
+    retained_voice_count: u8 = @import("std").mem.zeroes(u8),
+    reserved0: u8 = @import("std").mem.zeroes(u8),
+};
+pub const lmt_satb_register_violation = extern struct {
+    voice_id: u8 = @import("std").mem.zeroes(u8),
+    satb_voice: u8 = @import("std").mem.zeroes(u8),
+    midi: u8 = @import("std").mem.zeroes(u8),
+    direction: i8 = @import("std").mem.zeroes(i8),
+    low: u8 = @import("std").mem.zeroes(u8),
+    high: u8 = @import("std").mem.zeroes(u8),
+    reserved0: u8 = @import("std").mem.zeroes(u8),
+    reserved1: u8 = @import("std").mem.zeroes(u8),
+};
+pub const lmt_next_step_suggestion = extern struct {
+    score: i32 = @import("std").mem.zeroes(i32),
+    reason_mask: u32 = @import("std").mem.zeroes(u32),
+    warning_mask: u32 = @import("std").mem.zeroes(u32),
+    cadence_effect: u8 = @import("std").mem.zeroes(u8),
+    tension_delta: i8 = @import("std").mem.zeroes(i8),
+    note_count: u8 = @import("std").mem.zeroes(u8),
+    reserved0: u8 = @import("std").mem.zeroes(u8),
+    reserved1: u8 = @import("std").mem.zeroes(u8),
+    set_value: lmt_pitch_class_set = @import("std").mem.zeroes(lmt_pitch_class_set),
+    notes: [8]lmt_midi_note = @import("std").mem.zeroes([8]lmt_midi_note),
+    motion: lmt_motion_summary = @import("std").mem.zeroes(lmt_motion_summary),
+    evaluation: lmt_motion_evaluation = @import("std").mem.zeroes(lmt_motion_evaluation),
+};
+pub const lmt_ranked_keyboard_context_suggestion = extern struct {
+    candidate: lmt_context_suggestion = @import("std").mem.zeroes(lmt_context_suggestion),
+    transition: lmt_keyboard_transition_assessment = @import("std").mem.zeroes(lmt_keyboard_transition_assessment),
+    realized_note: u8 = @import("std").mem.zeroes(u8),
+    candidate_index: u8 = @import("std").mem.zeroes(u8),
+    hand: u8 = @import("std").mem.zeroes(u8),
+    policy: u8 = @import("std").mem.zeroes(u8),
+    accepted: u8 = @import("std").mem.zeroes(u8),
+    reserved0: u8 = @import("std").mem.zeroes(u8),
+};
+pub const lmt_ranked_keyboard_next_step = extern struct {
+    candidate: lmt_next_step_suggestion = @import("std").mem.zeroes(lmt_next_step_suggestion),
+    transition: lmt_keyboard_transition_assessment = @import("std").mem.zeroes(lmt_keyboard_transition_assessment),
+    candidate_index: u8 = @import("std").mem.zeroes(u8),
+    hand: u8 = @import("std").mem.zeroes(u8),
+    policy: u8 = @import("std").mem.zeroes(u8),
+    accepted: u8 = @import("std").mem.zeroes(u8),
+};
+pub const lmt_cadence_destination_score = extern struct {
+    score: i32 = @import("std").mem.zeroes(i32),
+    destination: u8 = @import("std").mem.zeroes(u8),
+    candidate_count: u8 = @import("std").mem.zeroes(u8),
+    warning_count: u8 = @import("std").mem.zeroes(u8),
+    current_match: u8 = @import("std").mem.zeroes(u8),
+    tension_bias: i8 = @import("std").mem.zeroes(i8),
+    reserved0: u8 = @import("std").mem.zeroes(u8),
+    reserved1: u8 = @import("std").mem.zeroes(u8),
+};
+pub const lmt_suspension_machine_summary = extern struct {
+    state: u8 = @import("std").mem.zeroes(u8),
+    tracked_voice_id: u8 = @import("std").mem.zeroes(u8),
+    held_midi: u8 = @import("std").mem.zeroes(u8),
+    expected_resolution_midi: u8 = @import("std").mem.zeroes(u8),
+    resolution_direction: i8 = @import("std").mem.zeroes(i8),
+    obligation_count: u8 = @import("std").mem.zeroes(u8),
+    warning_count: u8 = @import("std").mem.zeroes(u8),
+    retained_count: u8 = @import("std").mem.zeroes(u8),
+    current_tension: i16 = @import("std").mem.zeroes(i16),
+    previous_tension: i16 = @import("std").mem.zeroes(i16),
+    candidate_resolution_count: u8 = @import("std").mem.zeroes(u8),
+    reserved0: u8 = @import("std").mem.zeroes(u8),
+    reserved1: u8 = @import("std").mem.zeroes(u8),
+    reserved2: u8 = @import("std").mem.zeroes(u8),
+};
+pub const lmt_orbifold_triad_node = extern struct {
+    set_value: lmt_pitch_class_set = @import("std").mem.zeroes(lmt_pitch_class_set),
+    root: u8 = @import("std").mem.zeroes(u8),
+    quality: u8 = @import("std").mem.zeroes(u8),
+    x: f32 = @import("std").mem.zeroes(f32),
+    y: f32 = @import("std").mem.zeroes(f32),
+};
+pub const lmt_orbifold_triad_edge = extern struct {
+    from_index: u8 = @import("std").mem.zeroes(u8),
+    to_index: u8 = @import("std").mem.zeroes(u8),
+    reserved0: u8 = @import("std").mem.zeroes(u8),
+    reserved1: u8 = @import("std").mem.zeroes(u8),
+};
+pub const lmt_set_class_info = extern struct {
+    prime: lmt_pitch_class_set = @import("std").mem.zeroes(lmt_pitch_class_set),
+    forte_prime: lmt_pitch_class_set = @import("std").mem.zeroes(lmt_pitch_class_set),
+    cardinality: u8 = @import("std").mem.zeroes(u8),
+    forte_ordinal: u8 = @import("std").mem.zeroes(u8),
+    forte_is_z: u8 = @import("std").mem.zeroes(u8),
+    transposition_count: u8 = @import("std").mem.zeroes(u8),
+    cluster_free: u8 = @import("std").mem.zeroes(u8),
+    symmetric: u8 = @import("std").mem.zeroes(u8),
+    limited_transposition: u8 = @import("std").mem.zeroes(u8),
+    reserved0: u8 = @import("std").mem.zeroes(u8),
+};
+pub extern fn lmt_pcs_from_list(pcs: [*c]const lmt_pitch_class, count: u8) lmt_pitch_class_set;
+pub extern fn lmt_pcs_to_list(set: lmt_pitch_class_set, out: [*c]lmt_pitch_class) u8;
+pub extern fn lmt_pcs_cardinality(set: lmt_pitch_class_set) u8;
+pub extern fn lmt_pcs_transpose(set: lmt_pitch_class_set, semitones: u8) lmt_pitch_class_set;
+pub extern fn lmt_pcs_invert(set: lmt_pitch_class_set) lmt_pitch_class_set;
+pub extern fn lmt_pcs_complement(set: lmt_pitch_class_set) lmt_pitch_class_set;
+pub extern fn lmt_pcs_is_subset(small: lmt_pitch_class_set, big: lmt_pitch_class_set) bool;
+pub extern fn lmt_prime_form(set: lmt_pitch_class_set) lmt_pitch_class_set;
+pub extern fn lmt_forte_prime(set: lmt_pitch_class_set) lmt_pitch_class_set;
+pub extern fn lmt_is_cluster_free(set: lmt_pitch_class_set) bool;
+pub extern fn lmt_evenness_distance(set: lmt_pitch_class_set) f32;
+pub extern fn lmt_pcs_cardinality_batch(sets: [*c]const lmt_pitch_class_set, count: u32, out: [*c]u8) u32;
+pub extern fn lmt_pcs_transpose_batch(sets: [*c]const lmt_pitch_class_set, count: u32, semitones: u8, out: [*c]lmt_pitch_class_set) u32;
+pub extern fn lmt_pcs_invert_batch(sets: [*c]const lmt_pitch_class_set, count: u32, out: [*c]lmt_pitch_class_set) u32;
+pub extern fn lmt_pcs_complement_batch(sets: [*c]const lmt_pitch_class_set, count: u32, out: [*c]lmt_pitch_class_set) u32;
+pub extern fn lmt_prime_form_batch(sets: [*c]const lmt_pitch_class_set, count: u32, out: [*c]lmt_pitch_class_set) u32;
+pub extern fn lmt_forte_prime_batch(sets: [*c]const lmt_pitch_class_set, count: u32, out: [*c]lmt_pitch_class_set) u32;
+pub extern fn lmt_is_cluster_free_batch(sets: [*c]const lmt_pitch_class_set, count: u32, out: [*c]bool) u32;
+pub extern fn lmt_evenness_distance_batch(sets: [*c]const lmt_pitch_class_set, count: u32, out: [*c]f32) u32;
+pub extern fn lmt_sizeof_set_class_info() u32;
+pub extern fn lmt_lookup_set_class(set: lmt_pitch_class_set, out: [*c]lmt_set_class_info) u32;
+pub extern fn lmt_lookup_set_class_batch(sets: [*c]const lmt_pitch_class_set, count: u32, out: [*c]lmt_set_class_info) u32;
+pub extern fn lmt_sizeof_context() u32;
+pub extern fn lmt_alignof_context() u32;
+pub extern fn lmt_context_init(storage: ?*anyopaque, storage_size: u32) ?*lmt_context;
+pub extern fn lmt_scale(@"type": lmt_scale_type, tonic: lmt_pitch_class) lmt_pitch_class_set;
+pub extern fn lmt_mode(@"type": lmt_mode_type, root: lmt_pitch_class) lmt_pitch_class_set;
+pub extern fn lmt_mode_type_count() u32;
+pub extern fn lmt_mode_type_name(index: u32) [*c]const u8;
+pub extern fn lmt_scale_degree(tonic: lmt_pitch_class, mode: lmt_mode_type, note: lmt_midi_note) u8;
+pub extern fn lmt_transpose_diatonic(tonic: lmt_pitch_class, mode: lmt_mode_type, note: lmt_midi_note, degrees: i8, out: [*c]lmt_midi_note) u32;
+pub extern fn lmt_nearest_scale_tones(tonic: lmt_pitch_class, mode: lmt_mode_type, note: lmt_midi_note, out: [*c]lmt_scale_snap_candidates) u32;
+pub extern fn lmt_snap_to_scale(tonic: lmt_pitch_class, mode: lmt_mode_type, note: lmt_midi_note, policy: lmt_snap_tie_policy, out: [*c]lmt_midi_note) u32;
+pub extern fn lmt_find_containing_modes(note_pc: lmt_pitch_class, tonic: lmt_pitch_class, modes: [*c]const lmt_mode_type, mode_count: u8, out: [*c]lmt_containing_mode_match, out_len: u8) u8;
+pub extern fn lmt_spell_note(pc: lmt_pitch_class, key: lmt_key_context) [*c]const u8;
+pub extern fn lmt_spell_note_parts(pc: lmt_pitch_class, tonic: lmt_pitch_class, quality: lmt_key_quality) [*c]const u8;
+pub extern fn lmt_chord(@"type": lmt_chord_type, root: lmt_pitch_class) lmt_pitch_class_set;
+pub extern fn lmt_chord_pattern_count() u32;
+pub extern fn lmt_chord_pattern_name(index: u32) [*c]const u8;
+pub extern fn lmt_chord_pattern_formula(index: u32) [*c]const u8;
+pub extern fn lmt_detect_chord_matches(set: lmt_pitch_class_set, bass: lmt_pitch_class, bass_known: bool, out: [*c]lmt_chord_match, out_len: u8) u16;
+pub extern fn lmt_chord_name(set: lmt_pitch_class_set) [*c]const u8;
+pub extern fn lmt_roman_numeral(chord: lmt_pitch_class_set, key: lmt_key_context) [*c]const u8;
+pub extern fn lmt_roman_numeral_parts(chord: lmt_pitch_class_set, tonic: lmt_pitch_class, quality: lmt_key_quality) [*c]const u8;
+pub extern fn lmt_fret_to_midi(string: u8, fret: u8, tuning: [*c]const u8) lmt_midi_note;
+pub extern fn lmt_midi_to_fret_positions(note: lmt_midi_note, tuning: [*c]const u8, out: [*c]lmt_fret_pos) u8;
+pub extern fn lmt_fret_to_midi_n(string: u32, fret: u8, tuning: [*c]const u8, tuning_count: u32) lmt_midi_note;
+pub extern fn lmt_midi_to_fret_positions_n(note: lmt_midi_note, tuning: [*c]const u8, tuning_count: u32, out: [*c]lmt_fret_pos, out_cap: u32) u32;
+pub extern fn lmt_generate_voicings_n(chord_set: lmt_pitch_class_set, tuning: [*c]const u8, tuning_count: u32, max_fret: u8, max_span: u8, out_frets: [*c]i8, out_voicing_cap: u32) u32;
+pub extern fn lmt_pitch_class_guide_n(selected: [*c]const lmt_fret_pos, selected_count: u32, min_fret: u8, max_fret: u8, tuning: [*c]const u8, tuning_count: u32, out: [*c]lmt_guide_dot, out_cap: u32) u32;
+pub extern fn lmt_frets_to_url_n(frets: [*c]const i8, fret_count: u32, buf: [*c]u8, buf_size: u32) u32;
+pub extern fn lmt_url_to_frets_n(url: [*c]const u8, out: [*c]i8, out_cap: u32) u32;
+pub extern fn lmt_svg_clock_optc(set: lmt_pitch_class_set, buf: [*c]u8, buf_size: u32) u32;
+pub extern fn lmt_svg_optic_k_group(set: lmt_pitch_class_set, buf: [*c]u8, buf_size: u32) u32;
+pub extern fn lmt_svg_evenness_chart(buf: [*c]u8, buf_size: u32) u32;
+pub extern fn lmt_svg_evenness_field(set: lmt_pitch_class_set, buf: [*c]u8, buf_size: u32) u32;
+pub extern fn lmt_svg_fret(frets: [*c]const i8, buf: [*c]u8, buf_size: u32) u32;
+pub extern fn lmt_svg_fret_n(frets: [*c]const i8, string_count: u32, window_start: u32, visible_frets: u32, buf: [*c]u8, buf_size: u32) u32;
+pub extern fn lmt_svg_fret_tuned_n(frets: [*c]const i8, string_count: u32, tuning: [*c]const u8, tuning_count: u32, window_start: u32, visible_frets: u32, buf: [*c]u8, buf_size: u32) u32;
+pub extern fn lmt_svg_chord_staff(@"type": lmt_chord_type, root: lmt_pitch_class, buf: [*c]u8, buf_size: u32) u32;
+pub extern fn lmt_svg_key_staff(tonic: lmt_pitch_class, quality: lmt_key_quality, buf: [*c]u8, buf_size: u32) u32;
+pub extern fn lmt_svg_keyboard(notes: [*c]const lmt_midi_note, note_count: u32, range_low: lmt_midi_note, range_high: lmt_midi_note, buf: [*c]u8, buf_size: u32) u32;
+pub extern fn lmt_svg_piano_staff(notes: [*c]const lmt_midi_note, note_count: u32, tonic: lmt_pitch_class, quality: lmt_key_quality, buf: [*c]u8, buf_size: u32) u32;
+pub extern fn lmt_raster_is_enabled() u32;
+pub extern fn lmt_raster_demo_rgba(width: u32, height: u32, out_rgba: [*c]u8, out_rgba_size: u32) u32;
+pub extern fn lmt_counterpoint_max_voices() u32;
+pub extern fn lmt_counterpoint_history_capacity() u32;
+pub extern fn lmt_counterpoint_rule_profile_count() u32;
+pub extern fn lmt_counterpoint_rule_profile_name(index: u32) [*c]const u8;
+pub extern fn lmt_voice_leading_violation_kind_count() u32;
+pub extern fn lmt_voice_leading_violation_kind_name(index: u32) [*c]const u8;
+pub extern fn lmt_ordered_scale_pattern_count() u32;
+pub extern fn lmt_ordered_scale_pattern_name(index: u32) [*c]const u8;
+pub extern fn lmt_ordered_scale_degree_count(index: u32) u8;
+pub extern fn lmt_ordered_scale_pitch_class_set(index: u32, tonic: lmt_pitch_class) lmt_pitch_class_set;
+pub extern fn lmt_barry_harris_parity(index: u32, tonic: lmt_pitch_class, note: lmt_midi_note, out_degree: [*c]u8) u8;
+pub extern fn lmt_playability_reason_count() u32;
+pub extern fn lmt_playability_reason_name(index: u32) [*c]const u8;
+pub extern fn lmt_playability_warning_count() u32;
+pub extern fn lmt_playability_warning_name(index: u32) [*c]const u8;
+pub extern fn lmt_playability_policy_count() u32;
+pub extern fn lmt_playability_policy_name(index: u32) [*c]const u8;
+pub extern fn lmt_playability_profile_preset_count() u32;
+pub extern fn lmt_playability_profile_preset_name(index: u32) [*c]const u8;
+pub extern fn lmt_playability_profile_from_preset(preset: u32, base_profile: [*c]const lmt_hand_profile, out: [*c]lmt_hand_profile) u32;
+pub extern fn lmt_playability_phrase_issue_scope_count() u32;
+pub extern fn lmt_playability_phrase_issue_scope_name(index: u32) [*c]const u8;
+pub extern fn lmt_playability_phrase_issue_severity_count() u32;
+pub extern fn lmt_playability_phrase_issue_severity_name(index: u32) [*c]const u8;
+pub extern fn lmt_playability_phrase_family_domain_count() u32;
+pub extern fn lmt_playability_phrase_family_domain_name(index: u32) [*c]const u8;
+pub extern fn lmt_playability_phrase_strain_bucket_count() u32;
+pub extern fn lmt_playability_phrase_strain_bucket_name(index: u32) [*c]const u8;
+pub extern fn lmt_playability_repair_class_count() u32;
+pub extern fn lmt_playability_repair_class_name(index: u32) [*c]const u8;
+pub extern fn lmt_fret_playability_blocker_count() u32;
+pub extern fn lmt_fret_playability_blocker_name(index: u32) [*c]const u8;
+pub extern fn lmt_fret_technique_profile_count() u32;
+pub extern fn lmt_fret_technique_profile_name(index: u32) [*c]const u8;
+pub extern fn lmt_keyboard_hand_count() u32;
+pub extern fn lmt_keyboard_hand_name(index: u32) [*c]const u8;
+pub extern fn lmt_keyboard_playability_blocker_count() u32;
+pub extern fn lmt_keyboard_playability_blocker_name(index: u32) [*c]const u8;
+pub extern fn lmt_sizeof_hand_profile() u32;
+pub extern fn lmt_sizeof_temporal_load_state() u32;
+pub extern fn lmt_sizeof_fret_candidate_location() u32;
+pub extern fn lmt_sizeof_fret_play_state() u32;
+pub extern fn lmt_sizeof_fret_realization_assessment() u32;
+pub extern fn lmt_sizeof_fret_transition_assessment() u32;
+pub extern fn lmt_sizeof_ranked_fret_realization() u32;
+pub extern fn lmt_sizeof_keybed_key_coord() u32;
+pub extern fn lmt_sizeof_keyboard_play_state() u32;
+pub extern fn lmt_sizeof_keyboard_realization_assessment() u32;
+pub extern fn lmt_sizeof_keyboard_transition_assessment() u32;
+pub extern fn lmt_sizeof_ranked_keyboard_fingering() u32;
+pub extern fn lmt_sizeof_ranked_keyboard_context_suggestion() u32;
+pub extern fn lmt_sizeof_ranked_keyboard_next_step() u32;
+pub extern fn lmt_sizeof_playability_difficulty_summary() u32;
+pub extern fn lmt_sizeof_keyboard_phrase_event() u32;
+pub extern fn lmt_sizeof_fret_phrase_event() u32;
+pub extern fn lmt_sizeof_keyboard_committed_phrase_memory() u32;
+pub extern fn lmt_sizeof_fret_committed_phrase_memory() u32;
+pub extern fn lmt_sizeof_playability_phrase_issue() u32;
+pub extern fn lmt_sizeof_playability_phrase_summary() u32;
+pub extern fn lmt_sizeof_playability_repair_policy() u32;
+pub extern fn lmt_sizeof_ranked_keyboard_phrase_repair() u32;
+pub extern fn lmt_sizeof_ranked_fret_phrase_repair() u32;
+pub extern fn lmt_default_fret_hand_profile(out: [*c]lmt_hand_profile) u32;
+pub extern fn lmt_default_fret_hand_profile_for_technique(profile: u32, out: [*c]lmt_hand_profile) u32;
+pub extern fn lmt_default_keyboard_hand_profile(out: [*c]lmt_hand_profile) u32;
+pub extern fn lmt_default_playability_repair_policy(max_class: u32, out: [*c]lmt_playability_repair_policy) u32;
+pub extern fn lmt_summarize_playability_phrase_issues(event_count: u32, issues: [*c]const lmt_playability_phrase_issue, issue_count: u32, out: [*c]lmt_playability_phrase_summary) u32;
+pub extern fn lmt_keyboard_committed_phrase_reset(memory: [*c]lmt_keyboard_committed_phrase_memory) void;
+pub extern fn lmt_keyboard_committed_phrase_push(memory: [*c]lmt_keyboard_committed_phrase_memory, event: [*c]const lmt_keyboard_phrase_event) u32;
+pub extern fn lmt_keyboard_committed_phrase_len(memory: [*c]const lmt_keyboard_committed_phrase_memory) u32;
+pub extern fn lmt_fret_committed_phrase_reset(memory: [*c]lmt_fret_committed_phrase_memory) void;
+pub extern fn lmt_fret_committed_phrase_push(memory: [*c]lmt_fret_committed_phrase_memory, event: [*c]const lmt_fret_phrase_event) u32;
+pub extern fn lmt_fret_committed_phrase_len(memory: [*c]const lmt_fret_committed_phrase_memory) u32;
+pub extern fn lmt_audit_fret_phrase_n(events: [*c]const lmt_fret_phrase_event, event_count: u32, tuning: [*c]const u8, tuning_count: u32, profile: u32, hand_profile: [*c]const lmt_hand_profile, issues_out: [*c]lmt_playability_phrase_issue, issues_cap: u32, summary_out: [*c]lmt_playability_phrase_summary) u32;
+pub extern fn lmt_audit_keyboard_phrase_n(events: [*c]const lmt_keyboard_phrase_event, event_count: u32, profile: [*c]const lmt_hand_profile, issues_out: [*c]lmt_playability_phrase_issue, issues_cap: u32, summary_out: [*c]lmt_playability_phrase_summary) u32;
+pub extern fn lmt_audit_committed_fret_phrase_n(memory: [*c]const lmt_fret_committed_phrase_memory, tuning: [*c]const u8, tuning_count: u32, profile: u32, hand_profile: [*c]const lmt_hand_profile, issues_out: [*c]lmt_playability_phrase_issue, issues_cap: u32, summary_out: [*c]lmt_playability_phrase_summary) u32;
+pub extern fn lmt_audit_committed_keyboard_phrase_n(memory: [*c]const lmt_keyboard_committed_phrase_memory, profile: [*c]const lmt_hand_profile, issues_out: [*c]lmt_playability_phrase_issue, issues_cap: u32, summary_out: [*c]lmt_playability_phrase_summary) u32;
+pub extern fn lmt_describe_fret_play_state(frets: [*c]const i8, fret_count: u32, profile: [*c]const lmt_hand_profile, previous_load: [*c]const lmt_temporal_load_state, out: [*c]lmt_fret_play_state) u32;
+pub extern fn lmt_windowed_fret_positions_n(note: lmt_midi_note, tuning: [*c]const u8, tuning_count: u32, anchor_fret: u8, profile: [*c]const lmt_hand_profile, out: [*c]lmt_fret_candidate_location, out_cap: u32) u32;
+pub extern fn lmt_assess_fret_realization_n(frets: [*c]const i8, fret_count: u32, tuning: [*c]const u8, tuning_count: u32, profile: u32, hand_profile: [*c]const lmt_hand_profile, previous_load: [*c]const lmt_temporal_load_state, out: [*c]lmt_fret_realization_assessment) u32;
+pub extern fn lmt_assess_fret_transition_n(from_frets: [*c]const i8, to_frets: [*c]const i8, fret_count: u32, tuning: [*c]const u8, tuning_count: u32, profile: u32, hand_profile: [*c]const lmt_hand_profile, out: [*c]lmt_fret_transition_assessment) u32;
+pub extern fn lmt_summarize_fret_realization_difficulty_n(frets: [*c]const i8, fret_count: u32, tuning: [*c]const u8, tuning_count: u32, profile: u32, hand_profile: [*c]const lmt_hand_profile, previous_load: [*c]const lmt_temporal_load_state, out: [*c]lmt_playability_difficulty_summary) u32;
+pub extern fn lmt_summarize_fret_transition_difficulty_n(from_frets: [*c]const i8, to_frets: [*c]const i8, fret_count: u32, tuning: [*c]const u8, tuning_count: u32, profile: u32, hand_profile: [*c]const lmt_hand_profile, out: [*c]lmt_playability_difficulty_summary) u32;
+pub extern fn lmt_rank_fret_realizations_n(note: lmt_midi_note, tuning: [*c]const u8, tuning_count: u32, anchor_fret: u8, profile: u32, hand_profile: [*c]const lmt_hand_profile, out: [*c]lmt_ranked_fret_realization, out_cap: u32) u32;
+pub extern fn lmt_suggest_easier_fret_realization_n(note: lmt_midi_note, tuning: [*c]const u8, tuning_count: u32, anchor_fret: u8, profile: u32, hand_profile: [*c]const lmt_hand_profile, out: [*c]lmt_ranked_fret_realization) u32;
+pub extern fn lmt_keyboard_key_coord(note: lmt_midi_note, out: [*c]lmt_keybed_key_coord) u32;
+pub extern fn lmt_describe_keyboard_play_state(notes: [*c]const lmt_midi_note, note_count: u32, profile: [*c]const lmt_hand_profile, previous_load: [*c]const lmt_temporal_load_state, out: [*c]lmt_keyboard_play_state) u32;
+pub extern fn lmt_assess_keyboard_realization_n(notes: [*c]const lmt_midi_note, note_count: u32, hand: u32, profile: [*c]const lmt_hand_profile, previous_load: [*c]const lmt_temporal_load_state, out: [*c]lmt_keyboard_realization_assessment) u32;
+pub extern fn lmt_assess_keyboard_transition_n(from_notes: [*c]const lmt_midi_note, from_count: u32, to_notes: [*c]const lmt_midi_note, to_count: u32, hand: u32, profile: [*c]const lmt_hand_profile, previous_load: [*c]const lmt_temporal_load_state, out: [*c]lmt_keyboard_transition_assessment) u32;
+pub extern fn lmt_summarize_keyboard_realization_difficulty_n(notes: [*c]const lmt_midi_note, note_count: u32, hand: u32, profile: [*c]const lmt_hand_profile, previous_load: [*c]const lmt_temporal_load_state, out: [*c]lmt_playability_difficulty_summary) u32;
+pub extern fn lmt_summarize_keyboard_transition_difficulty_n(from_notes: [*c]const lmt_midi_note, from_count: u32, to_notes: [*c]const lmt_midi_note, to_count: u32, hand: u32, profile: [*c]const lmt_hand_profile, previous_load: [*c]const lmt_temporal_load_state, out: [*c]lmt_playability_difficulty_summary) u32;
+pub extern fn lmt_rank_keyboard_fingerings_n(notes: [*c]const lmt_midi_note, note_count: u32, hand: u32, profile: [*c]const lmt_hand_profile, out: [*c]lmt_ranked_keyboard_fingering, out_cap: u32) u32;
+pub extern fn lmt_suggest_easier_keyboard_fingering_n(notes: [*c]const lmt_midi_note, note_count: u32, hand: u32, profile: [*c]const lmt_hand_profile, out: [*c]lmt_ranked_keyboard_fingering) u32;
+pub extern fn lmt_rank_keyboard_phrase_repairs_n(memory: [*c]const lmt_keyboard_committed_phrase_memory, profile: [*c]const lmt_hand_profile, policy: [*c]const lmt_playability_repair_policy, out: [*c]lmt_ranked_keyboard_phrase_repair, out_cap: u32) u32;
+pub extern fn lmt_rank_fret_phrase_repairs_n(memory: [*c]const lmt_fret_committed_phrase_memory, tuning: [*c]const u8, tuning_count: u32, profile: u32, hand_profile: [*c]const lmt_hand_profile, policy: [*c]const lmt_playability_repair_policy, out: [*c]lmt_ranked_fret_phrase_repair, out_cap: u32) u32;
+pub extern fn lmt_filter_next_steps_by_playability(history: [*c]const lmt_voiced_history, profile: u32, hand: u32, hand_profile: [*c]const lmt_hand_profile, policy: u32, out: [*c]lmt_next_step_suggestion, out_cap: u32) u32;
+pub extern fn lmt_rank_keyboard_next_steps_by_playability(history: [*c]const lmt_voiced_history, profile: u32, hand: u32, hand_profile: [*c]const lmt_hand_profile, policy: u32, out: [*c]lmt_ranked_keyboard_next_step, out_cap: u32) u32;
+pub extern fn lmt_rank_keyboard_next_steps_by_committed_phrase(memory: [*c]const lmt_keyboard_committed_phrase_memory, history: [*c]const lmt_voiced_history, profile: u32, hand_profile: [*c]const lmt_hand_profile, policy: u32, out: [*c]lmt_ranked_keyboard_next_step, out_cap: u32) u32;
+pub extern fn lmt_suggest_safer_keyboard_next_step_by_playability(history: [*c]const lmt_voiced_history, profile: u32, hand: u32, hand_profile: [*c]const lmt_hand_profile, policy: u32, out: [*c]lmt_ranked_keyboard_next_step) u32;
+pub extern fn lmt_suggest_safer_keyboard_next_step_by_committed_phrase(memory: [*c]const lmt_keyboard_committed_phrase_memory, history: [*c]const lmt_voiced_history, profile: u32, hand_profile: [*c]const lmt_hand_profile, policy: u32, out: [*c]lmt_ranked_keyboard_next_step) u32;
+pub extern fn lmt_satb_voice_count() u32;
+pub extern fn lmt_satb_voice_name(index: u32) [*c]const u8;
+pub extern fn lmt_sizeof_voiced_state() u32;
+pub extern fn lmt_sizeof_voiced_history() u32;
+pub extern fn lmt_sizeof_next_step_suggestion() u32;
+pub extern fn lmt_sizeof_voice_pair_violation() u32;
+pub extern fn lmt_sizeof_motion_independence_summary() u32;
+pub extern fn lmt_sizeof_satb_register_violation() u32;
+pub extern fn lmt_cadence_destination_count() u32;
+pub extern fn lmt_cadence_destination_name(index: u32) [*c]const u8;
+pub extern fn lmt_suspension_state_count() u32;
+pub extern fn lmt_suspension_state_name(index: u32) [*c]const u8;
+pub extern fn lmt_sizeof_cadence_destination_score() u32;
+pub extern fn lmt_sizeof_suspension_machine_summary() u32;
+pub extern fn lmt_orbifold_triad_node_count() u32;
+pub extern fn lmt_sizeof_orbifold_triad_node() u32;
+pub extern fn lmt_orbifold_triad_node_at(index: u32, out: [*c]lmt_orbifold_triad_node) u32;
+pub extern fn lmt_find_orbifold_triad_node(set: lmt_pitch_class_set) u32;
+pub extern fn lmt_orbifold_triad_edge_count() u32;
+pub extern fn lmt_sizeof_orbifold_triad_edge() u32;
+pub extern fn lmt_orbifold_triad_edge_at(index: u32, out: [*c]lmt_orbifold_triad_edge) u32;
+pub extern fn lmt_voiced_history_reset(history: [*c]lmt_voiced_history) void;
+pub extern fn lmt_build_voiced_state(notes: [*c]const lmt_midi_note, note_count: u32, sustained_notes: [*c]const lmt_midi_note, sustained_count: u32, tonic: lmt_pitch_class, mode_type: lmt_mode_type, beat_in_bar: u8, beats_per_bar: u8, subdivision: u8, cadence_hint: lmt_cadence_state, previous: [*c]const lmt_voiced_state, out: [*c]lmt_voiced_state) u32;
+pub extern fn lmt_voiced_history_push(history: [*c]lmt_voiced_history, notes: [*c]const lmt_midi_note, note_count: u32, sustained_notes: [*c]const lmt_midi_note, sustained_count: u32, tonic: lmt_pitch_class, mode_type: lmt_mode_type, beat_in_bar: u8, beats_per_bar: u8, subdivision: u8, cadence_hint: lmt_cadence_state, out: [*c]lmt_voiced_state) u32;
+pub extern fn lmt_classify_motion(previous: [*c]const lmt_voiced_state, current: [*c]const lmt_voiced_state, out: [*c]lmt_motion_summary) u32;
+pub extern fn lmt_evaluate_motion_profile(profile: lmt_counterpoint_rule_profile, summary: [*c]const lmt_motion_summary, out: [*c]lmt_motion_evaluation) u32;
+pub extern fn lmt_check_parallel_perfects(previous: [*c]const lmt_voiced_state, current: [*c]const lmt_voiced_state, out: [*c]lmt_voice_pair_violation, out_cap: u32) u32;
+pub extern fn lmt_check_voice_crossing(previous: [*c]const lmt_voiced_state, current: [*c]const lmt_voiced_state, out: [*c]lmt_voice_pair_violation, out_cap: u32) u32;
+pub extern fn lmt_check_spacing(current: [*c]const lmt_voiced_state, out: [*c]lmt_voice_pair_violation, out_cap: u32) u32;
+pub extern fn lmt_check_motion_independence(previous: [*c]const lmt_voiced_state, current: [*c]const lmt_voiced_state, out: [*c]lmt_motion_independence_summary) u32;
+pub extern fn lmt_satb_range_low(voice: lmt_satb_voice) u8;
+pub extern fn lmt_satb_range_high(voice: lmt_satb_voice) u8;
+pub extern fn lmt_satb_range_contains(voice: lmt_satb_voice, midi: lmt_midi_note) bool;
+pub extern fn lmt_check_satb_registers(current: [*c]const lmt_voiced_state, out: [*c]lmt_satb_register_violation, out_cap: u32) u32;
+pub extern fn lmt_rank_next_steps(history: [*c]const lmt_voiced_history, profile: lmt_counterpoint_rule_profile, out: [*c]lmt_next_step_suggestion, out_cap: u32) u32;
+pub extern fn lmt_rank_cadence_destinations(history: [*c]const lmt_voiced_history, profile: lmt_counterpoint_rule_profile, out: [*c]lmt_cadence_destination_score, out_cap: u32) u32;
+pub extern fn lmt_analyze_suspension_machine(history: [*c]const lmt_voiced_history, profile: lmt_counterpoint_rule_profile, out: [*c]lmt_suspension_machine_summary) u32;
+pub extern fn lmt_next_step_reason_count() u32;
+pub extern fn lmt_next_step_reason_name(index: u32) [*c]const u8;
+pub extern fn lmt_next_step_warning_count() u32;
+pub extern fn lmt_next_step_warning_name(index: u32) [*c]const u8;
+pub extern fn lmt_mode_spelling_quality(tonic: lmt_pitch_class, mode_type: lmt_mode_type) u8;
+pub extern fn lmt_rank_context_suggestions(set: lmt_pitch_class_set, midi_notes: [*c]const lmt_midi_note, note_count: u32, tonic: lmt_pitch_class, mode_type: lmt_mode_type, out: [*c]lmt_context_suggestion, out_cap: u32) u32;
+pub extern fn lmt_rank_keyboard_context_suggestions_by_playability(set: lmt_pitch_class_set, midi_notes: [*c]const lmt_midi_note, note_count: u32, tonic: lmt_pitch_class, mode_type: lmt_mode_type, hand: u32, hand_profile: [*c]const lmt_hand_profile, previous_load: [*c]const lmt_temporal_load_state, policy: u32, out: [*c]lmt_ranked_keyboard_context_suggestion, out_cap: u32) u32;
+pub extern fn lmt_rank_keyboard_context_suggestions_by_committed_phrase(memory: [*c]const lmt_keyboard_committed_phrase_memory, set: lmt_pitch_class_set, tonic: lmt_pitch_class, mode_type: lmt_mode_type, hand_profile: [*c]const lmt_hand_profile, policy: u32, out: [*c]lmt_ranked_keyboard_context_suggestion, out_cap: u32) u32;
+pub extern fn lmt_preferred_voicing_n(chord_set: lmt_pitch_class_set, tuning: [*c]const u8, tuning_count: u32, max_fret: u8, max_span: u8, preferred_bass_pc: u8, out_frets: [*c]i8, out_fret_cap: u32) u32;
+pub extern fn lmt_generate_voicings_n_ctx(ctx: ?*lmt_context, chord_set: lmt_pitch_class_set, tuning: [*c]const u8, tuning_count: u32, max_fret: u8, max_span: u8, out_frets: [*c]i8, out_voicing_cap: u32) u32;
+pub extern fn lmt_preferred_voicing_n_ctx(ctx: ?*lmt_context, chord_set: lmt_pitch_class_set, tuning: [*c]const u8, tuning_count: u32, max_fret: u8, max_span: u8, preferred_bass_pc: u8, out_frets: [*c]i8, out_fret_cap: u32) u32;
+pub extern fn lmt_svg_clock_optc_ctx(ctx: ?*lmt_context, set: lmt_pitch_class_set, buf: [*c]u8, buf_size: u32) u32;
+pub extern fn lmt_svg_optic_k_group_ctx(ctx: ?*lmt_context, set: lmt_pitch_class_set, buf: [*c]u8, buf_size: u32) u32;
+pub extern fn lmt_svg_evenness_chart_ctx(ctx: ?*lmt_context, buf: [*c]u8, buf_size: u32) u32;
+pub extern fn lmt_svg_evenness_field_ctx(ctx: ?*lmt_context, set: lmt_pitch_class_set, buf: [*c]u8, buf_size: u32) u32;
+pub extern fn lmt_svg_fret_ctx(ctx: ?*lmt_context, frets: [*c]const i8, buf: [*c]u8, buf_size: u32) u32;
+pub extern fn lmt_svg_fret_n_ctx(ctx: ?*lmt_context, frets: [*c]const i8, string_count: u32, window_start: u32, visible_frets: u32, buf: [*c]u8, buf_size: u32) u32;
+pub extern fn lmt_svg_fret_tuned_n_ctx(ctx: ?*lmt_context, frets: [*c]const i8, string_count: u32, tuning: [*c]const u8, tuning_count: u32, window_start: u32, visible_frets: u32, buf: [*c]u8, buf_size: u32) u32;
+pub extern fn lmt_svg_chord_staff_ctx(ctx: ?*lmt_context, @"type": lmt_chord_type, root: lmt_pitch_class, buf: [*c]u8, buf_size: u32) u32;
+pub extern fn lmt_svg_key_staff_ctx(ctx: ?*lmt_context, tonic: lmt_pitch_class, quality: lmt_key_quality, buf: [*c]u8, buf_size: u32) u32;
+pub extern fn lmt_svg_keyboard_ctx(ctx: ?*lmt_context, notes: [*c]const lmt_midi_note, note_count: u32, range_low: lmt_midi_note, range_high: lmt_midi_note, buf: [*c]u8, buf_size: u32) u32;
+pub extern fn lmt_svg_piano_staff_ctx(ctx: ?*lmt_context, notes: [*c]const lmt_midi_note, note_count: u32, tonic: lmt_pitch_class, quality: lmt_key_quality, buf: [*c]u8, buf_size: u32) u32;
+pub extern fn lmt_context_svg_len(ctx: ?*lmt_context) u32;
+pub extern fn lmt_context_svg_copy(ctx: ?*lmt_context, buf: [*c]u8, buf_size: u32) u32;
+pub extern fn lmt_svg_optic_k_group_stream(set: lmt_pitch_class_set, write: lmt_write_fn, user: ?*anyopaque) u32;
+pub extern fn lmt_svg_evenness_chart_stream(write: lmt_write_fn, user: ?*anyopaque) u32;
+pub extern fn lmt_svg_evenness_field_stream(set: lmt_pitch_class_set, write: lmt_write_fn, user: ?*anyopaque) u32;
+pub extern fn lmt_svg_clock_optc_batch(sets: [*c]const lmt_pitch_class_set, count: u32, offsets: [*c]u32, arena: [*c]u8, arena_size: u32) u32;
+pub extern fn lmt_svg_evenness_field_batch(sets: [*c]const lmt_pitch_class_set, count: u32, offsets: [*c]u32, arena: [*c]u8, arena_size: u32) u32;
+pub extern fn lmt_svg_fret_n_batch(frets: [*c]const i8, string_count: u32, count: u32, window_start: u32, visible_frets: u32, offsets: [*c]u32, arena: [*c]u8, arena_size: u32) u32;
+pub extern fn lmt_bitmap_clock_optc_batch_rgba(sets: [*c]const lmt_pitch_class_set, count: u32, width: u32, height: u32, out_rgba: [*c]u8, out_rgba_size: u32) u32;
+pub extern fn lmt_bitmap_evenness_field_batch_rgba(sets: [*c]const lmt_pitch_class_set, count: u32, width: u32, height: u32, out_rgba: [*c]u8, out_rgba_size: u32) u32;
+pub extern fn lmt_bitmap_fret_n_batch_rgba(frets: [*c]const i8, string_count: u32, count: u32, window_start: u32, visible_frets: u32, width: u32, height: u32, out_rgba: [*c]u8, out_rgba_size: u32) u32;
+pub extern fn lmt_bitmap_clock_optc_rgba(set: lmt_pitch_class_set, width: u32, height: u32, out_rgba: [*c]u8, out_rgba_size: u32) u32;
+pub extern fn lmt_bitmap_optic_k_group_rgba(set: lmt_pitch_class_set, width: u32, height: u32, out_rgba: [*c]u8, out_rgba_size: u32) u32;
+pub extern fn lmt_bitmap_evenness_chart_rgba(width: u32, height: u32, out_rgba: [*c]u8, out_rgba_size: u32) u32;
+pub extern fn lmt_bitmap_evenness_field_rgba(set: lmt_pitch_class_set, width: u32, height: u32, out_rgba: [*c]u8, out_rgba_size: u32) u32;
+pub extern fn lmt_bitmap_fret_rgba(frets: [*c]const i8, width: u32, height: u32, out_rgba: [*c]u8, out_rgba_size: u32) u32;
+pub extern fn lmt_bitmap_fret_n_rgba(frets: [*c]const i8, string_count: u32, window_start: u32, visible_frets: u32, width: u32, height: u32, out_rgba: [*c]u8, out_rgba_size: u32) u32;
+pub extern fn lmt_bitmap_fret_tuned_n_rgba(frets: [*c]const i8, string_count: u32, tuning: [*c]const u8, tuning_count: u32, window_start: u32, visible_frets: u32, width: u32, height: u32, out_rgba: [*c]u8, out_rgba_size: u32) u32;
+pub extern fn lmt_bitmap_chord_staff_rgba(@"type": lmt_chord_type, root: lmt_pitch_class, width: u32, height: u32, out_rgba: [*c]u8, out_rgba_size: u32) u32;
+pub extern fn lmt_bitmap_key_staff_rgba(tonic: lmt_pitch_class, quality: lmt_key_quality, width: u32, height: u32, out_rgba: [*c]u8, out_rgba_size: u32) u32;
+pub extern fn lmt_bitmap_keyboard_rgba(notes: [*c]const lmt_midi_note, note_count: u32, range_low: lmt_midi_note, range_high: lmt_midi_note, width: u32, height: u32, out_rgba: [*c]u8, out_rgba_size: u32) u32;
+pub extern fn lmt_bitmap_piano_staff_rgba(notes: [*c]const lmt_midi_note, note_count: u32, tonic: lmt_pitch_class, quality: lmt_key_quality, width: u32, height: u32, out_rgba: [*c]u8, out_rgba_size: u32) u32;
+pub extern fn lmt_bitmap_svg_stream_rgba(svg: [*c]const u8, svg_len: u32, width: u32, height: u32, band_rgba: [*c]u8, band_rgba_size: u32, rows: lmt_rows_fn, user: ?*anyopaque) u32;
+pub extern fn lmt_bitmap_evenness_field_stream_rgba(set: lmt_pitch_class_set, width: u32, height: u32, band_rgba: [*c]u8, band_rgba_size: u32, rows: lmt_rows_fn, user: ?*anyopaque) u32;
+pub extern fn lmt_bitmap_svg_png(svg: [*c]const u8, svg_len: u32, width: u32, height: u32, compression: lmt_png_compression, buf: [*c]u8, buf_size: u32) u32;
+pub extern fn lmt_bitmap_svg_qoi(svg: [*c]const u8, svg_len: u32, width: u32, height: u32, buf: [*c]u8, buf_size: u32) u32;
+pub extern fn lmt_bitmap_clock_optc_png(set: lmt_pitch_class_set, width: u32, height: u32, compression: lmt_png_compression, buf: [*c]u8, buf_size: u32) u32;
+pub extern fn lmt_bitmap_optic_k_group_png(set: lmt_pitch_class_set, width: u32, height: u32, compression: lmt_png_compression, buf: [*c]u8, buf_size: u32) u32;
+pub extern fn lmt_bitmap_evenness_chart_png(width: u32, height: u32, compression: lmt_png_compression, buf: [*c]u8, buf_size: u32) u32;
+pub extern fn lmt_bitmap_evenness_field_png(set: lmt_pitch_class_set, width: u32, height: u32, compression: lmt_png_compression, buf: [*c]u8, buf_size: u32) u32;
+pub extern fn lmt_bitmap_fret_n_png(frets: [*c]const i8, string_count: u32, window_start: u32, visible_frets: u32, width: u32, height: u32, compression: lmt_png_compression, buf: [*c]u8, buf_size: u32) u32;
+pub extern fn lmt_bitmap_chord_staff_png(@"type": lmt_chord_type, root: lmt_pitch_class, width: u32, height: u32, compression: lmt_png_compression, buf: [*c]u8, buf_size: u32) u32;
+pub extern fn lmt_bitmap_key_staff_png(tonic: lmt_pitch_class, quality: lmt_key_quality, width: u32, height: u32, compression: lmt_png_compression, buf: [*c]u8, buf_size: u32) u32;
+pub extern fn lmt_bitmap_keyboard_png(notes: [*c]const lmt_midi_note, note_count: u32, range_low: lmt_midi_note, range_high: lmt_midi_note, width: u32, height: u32, compression: lmt_png_compression, buf: [*c]u8, buf_size: u32) u32;
+pub extern fn lmt_bitmap_piano_staff_png(notes: [*c]const lmt_midi_note, note_count: u32, tonic: lmt_pitch_class, quality: lmt_key_quality, width: u32, height: u32, compression: lmt_png_compression, buf: [*c]u8, buf_size: u32) u32;
+pub const lmt_render_cache_stats = extern struct {
+    hits: u64 = @import("std").mem.zeroes(u64),
+    misses: u64 = @import("std").mem.zeroes(u64),
+    evictions: u64 = @import("std").mem.zeroes(u64),
+    insertions: u64 = @import("std").mem.zeroes(u64),
+    bytes: u64 = @import("std").mem.zeroes(u64),
+    budget_bytes: u64 = @import("std").mem.zeroes(u64),
+    entries: u32 = @import("std").mem.zeroes(u32),
+    reserved0: u32 = @import("std").mem.zeroes(u32),
+};
+pub extern fn lmt_render_cache_configure(budget_bytes: u32) void;
+pub extern fn lmt_render_cache_invalidate() void;
+pub extern fn lmt_render_cache_get_stats(out: [*c]lmt_render_cache_stats) u32;
+pub const lmt_pack_kind = u32;
+pub const LMT_PACK_NAMES: c_int = 1;
+pub const LMT_PACK_MAJMIN_SCENES: c_int = 2;
+pub const LMT_PACK_EVENNESS: c_int = 4;
+pub const LMT_PACK_ALL: c_int = 7;
+const enum_unnamed_26 = c_uint;
+pub const lmt_pack_stats = extern struct {
+    decode_ns: u64 = @import("std").mem.zeroes(u64),
+    resident_bytes: u64 = @import("std").mem.zeroes(u64),
+    ready: u32 = @import("std").mem.zeroes(u32),
+    reserved0: u32 = @import("std").mem.zeroes(u32),
+};
+pub extern fn lmt_warmup(kinds_mask: u32) u32;
+pub extern fn lmt_pack_get_stats(kind: lmt_pack_kind, out: [*c]lmt_pack_stats) u32;
+pub const lmt_prerendered_domain = u8;
+pub const LMT_PRERENDERED_CLOCK_OPTC: c_int = 0;
+pub const LMT_PRERENDERED_OPTIC_K_GROUP: c_int = 1;
+pub const LMT_PRERENDERED_KEY_STAFF: c_int = 2;
+pub const LMT_PRERENDERED_EVENNESS_CHART: c_int = 3;
+const enum_unnamed_27 = c_uint;
+pub extern fn lmt_svg_prerendered_count(domain: lmt_prerendered_domain) u32;
+pub extern fn lmt_svg_prerendered(domain: lmt_prerendered_domain, index: u32, buf: [*c]u8, buf_size: u32) u32;
+pub const lmt_dirty_rect = extern struct {
+    x: u32 = @import("std").mem.zeroes(u32),
+    y: u32 = @import("std").mem.zeroes(u32),
+    width: u32 = @import("std").mem.zeroes(u32),
+    height: u32 = @import("std").mem.zeroes(u32),
+};
+pub const struct_lmt_bitmap_view = opaque {};
+pub const lmt_bitmap_view = struct_lmt_bitmap_view;
+pub extern fn lmt_sizeof_bitmap_view() u32;
+pub extern fn lmt_alignof_bitmap_view() u32;
+pub extern fn lmt_bitmap_keyboard_view_init(storage: ?*anyopaque, storage_size: u32, range_low: lmt_midi_note, range_high: lmt_midi_note, width: u32, height: u32) ?*lmt_bitmap_view;
+pub extern fn lmt_bitmap_keyboard_view_update(view: ?*lmt_bitmap_view, notes: [*c]const lmt_midi_note, note_count: u32, out_rgba: [*c]u8, out_rgba_size: u32, rects: [*c]lmt_dirty_rect, rect_cap: u32) u32;
+pub extern fn lmt_bitmap_fret_view_init(storage: ?*anyopaque, storage_size: u32, string_count: u32, window_start: u32, visible_frets: u32, width: u32, height: u32) ?*lmt_bitmap_view;
+pub extern fn lmt_bitmap_fret_view_update(view: ?*lmt_bitmap_view, frets: [*c]const i8, string_count: u32, out_rgba: [*c]u8, out_rgba_size: u32, rects: [*c]lmt_dirty_rect, rect_cap: u32) u32;
+pub const __llvm__ = @as(c_int, 1);
+pub const __clang__ = @as(c_int, 1);
+pub const __clang_major__ = @as(c_int, 20);
+pub const __clang_minor__ = @as(c_int, 1);
+pub const __clang_patchlevel__ = @as(c_int, 2);
+pub const __clang_version__ = "20.1.2 (https://github.com/ziglang/zig-bootstrap 7ef74e656cf8ddbd6bf891a8475892aa1afa6891)";
+pub const __GNUC__ = @as(c_int, 4);
+pub const __GNUC_MINOR__ = @as(c_int, 2);
+pub const __GNUC_PATCHLEVEL__ = @as(c_int, 1);
+pub const __GXX_ABI_VERSION = @as(c_int, 1002);
+pub const __ATOMIC_RELAXED = @as(c_int, 0);
+pub const __ATOMIC_CONSUME = @as(c_int, 1);
+pub const __ATOMIC_ACQUIRE = @as(c_int, 2);
+pub const __ATOMIC_RELEASE = @as(c_int, 3);
+pub const __ATOMIC_ACQ_REL = @as(c_int, 4);
+pub const __ATOMIC_SEQ_CST = @as(c_int, 5);
+pub const __MEMORY_SCOPE_SYSTEM = @as(c_int, 0);
+pub const __MEMORY_SCOPE_DEVICE = @as(c_int, 1);
+pub const __MEMORY_SCOPE_WRKGRP = @as(c_int, 2);
+pub const __MEMORY_SCOPE_WVFRNT = @as(c_int, 3);
+pub const __MEMORY_SCOPE_SINGLE = @as(c_int, 4);
+pub const __OPENCL_MEMORY_SCOPE_WORK_ITEM = @as(c_int, 0);
+pub const __OPENCL_MEMORY_SCOPE_WORK_GROUP = @as(c_int, 1);
+pub const __OPENCL_MEMORY_SCOPE_DEVICE = @as(c_int, 2);
+pub const __OPENCL_MEMORY_SCOPE_ALL_SVM_DEVICES = @as(c_int, 3);
+pub const __OPENCL_MEMORY_SCOPE_SUB_GROUP = @as(c_int, 4);
+pub const __FPCLASS_SNAN = @as(c_int, 0x0001);
+pub const __FPCLASS_QNAN = @as(c_int, 0x0002);
+pub const __FPCLASS_NEGINF = @as(c_int, 0x0004);
+pub const __FPCLASS_NEGNORMAL = @as(c_int, 0x0008);
+pub const __FPCLASS_NEGSUBNORMAL = @as(c_int, 0x0010);
+pub const __FPCLASS_NEGZERO = @as(c_int, 0x0020);
+pub const __FPCLASS_POSZERO = @as(c_int, 0x0040);
+pub const __FPCLASS_POSSUBNORMAL = @as(c_int, 0x0080);
+pub const __FPCLASS_POSNORMAL = @as(c_int, 0x0100);
+pub const __FPCLASS_POSINF = @as(c_int, 0x0200);
+pub const __PRAGMA_REDEFINE_EXTNAME = @as(c_int, 1);
+pub const __VERSION__ = "Clang 20.1.2 (https://github.com/ziglang/zig-bootstrap 7ef74e656cf8ddbd6bf891a8475892aa1afa6891)";
+pub const __OBJC_BOOL_IS_BOOL = @as(c_int, 0);
+pub const __CONSTANT_CFSTRINGS__ = @as(c_int, 1);
+pub const __clang_literal_encoding__ = "UTF-8";
+pub const __clang_wide_literal_encoding__ = "UTF-32";
+pub const __OPTIMIZE__ = @as(c_int, 1);
+pub const __ORDER_LITTLE_ENDIAN__ = @as(c_int, 1234);
+pub const __ORDER_BIG_ENDIAN__ = @as(c_int, 4321);
+pub const __ORDER_PDP_ENDIAN__ = @as(c_int, 3412);
+pub const __BYTE_ORDER__ = __ORDER_LITTLE_ENDIAN__;
+pub const __LITTLE_ENDIAN__ = @as(c_int, 1);
+pub const _LP64 = @as(c_int, 1);
+pub const __LP64__ = @as(c_int, 1);
+pub const __CHAR_BIT__ = @as(c_int, 8);
+pub const __BOOL_WIDTH__ = @as(c_int, 1);
+pub const __SHRT_WIDTH__ = @as(c_int, 16);
+pub const __INT_WIDTH__ = @as(c_int, 32);
+pub const __LONG_WIDTH__ = @as(c_int, 64);
+pub const __LLONG_WIDTH__ = @as(c_int, 64);
+pub const __BITINT_MAXWIDTH__ = @import("std").zig.c_translation.promoteIntLiteral(c_int, 8388608, .decimal);
+pub const __SCHAR_MAX__ = @as(c_int, 127);
+pub const __SHRT_MAX__ = @as(c_int, 32767);
+pub const __INT_MAX__ = @import("std").zig.c_translation.promoteIntLiteral(c_int, 2147483647, .decimal);
+pub const __LONG_MAX__ = @import("std").zig.c_translation.promoteIntLiteral(c_long, 9223372036854775807, .decimal);
+pub const __LONG_LONG_MAX__ = @as(c_longlong, 9223372036854775807);
+pub const __WCHAR_MAX__ = @import("std").zig.c_translation.promoteIntLiteral(c_int, 2147483647, .decimal);
+pub const __WCHAR_WIDTH__ = @as(c_int, 32);
+pub const __WINT_MAX__ = @import("std").zig.c_translation.promoteIntLiteral(c_uint, 4294967295, .decimal);
+pub const __WINT_WIDTH__ = @as(c_int, 32);
+pub const __INTMAX_MAX__ = @import("std").zig.c_translation.promoteIntLiteral(c_long, 9223372036854775807, .decimal);
+pub const __INTMAX_WIDTH__ = @as(c_int, 64);
+pub const __SIZE_MAX__ = @import("std").zig.c_translation.promoteIntLiteral(c_ulong, 18446744073709551615, .decimal);
+pub const __SIZE_WIDTH__ = @as(c_int, 64);
+pub const __UINTMAX_MAX__ = @import("std").zig.c_translation.promoteIntLiteral(c_ulong, 18446744073709551615, .decimal);
+pub const __UINTMAX_WIDTH__ = @as(c_int, 64);
+pub const __PTRDIFF_MAX__ = @import("std").zig.c_translation.promoteIntLiteral(c_long, 9223372036854775807, .decimal);
+pub const __PTRDIFF_WIDTH__ = @as(c_int, 64);
+pub const __INTPTR_MAX__ = @import("std").zig.c_translation.promoteIntLiteral(c_long, 9223372036854775807, .decimal);
+pub const __INTPTR_WIDTH__ = @as(c_int, 64);
+pub const __UINTPTR_MAX__ = @import("std").zig.c_translation.promoteIntLiteral(c_ulong, 18446744073709551615, .decimal);
+pub const __UINTPTR_WIDTH__ = @as(c_int, 64);
+pub const __SIZEOF_DOUBLE__ = @as(c_int, 8);
+pub const __SIZEOF_FLOAT__ = @as(c_int, 4);
+pub const __SIZEOF_INT__ = @as(c_int, 4);
+pub const __SIZEOF_LONG__ = @as(c_int, 8);
+pub const __SIZEOF_LONG_DOUBLE__ = @as(c_int, 16);
+pub const __SIZEOF_LONG_LONG__ = @as(c_int, 8);
+pub const __SIZEOF_POINTER__ = @as(c_int, 8);
+pub const __SIZEOF_SHORT__ = @as(c_int, 2);
+pub const __SIZEOF_PTRDIFF_T__ = @as(c_int, 8);
+pub const __SIZEOF_SIZE_T__ = @as(c_int, 8);
+pub const __SIZEOF_WCHAR_T__ = @as(c_int, 4);
+pub const __SIZEOF_WINT_T__ = @as(c_int, 4);
+pub const __SIZEOF_INT128__ = @as(c_int, 16);
+pub const __INTMAX_TYPE__ = c_long;
+pub const __INTMAX_FMTd__ = "ld";
+pub const __INTMAX_FMTi__ = "li";
+pub const __INTMAX_C_SUFFIX__ = @compileError("unable to translate macro: undefined identifier `L`");
+// (no file):96:9
+pub const __INTMAX_C = @import("std").zig.c_translation.Macros.L_SUFFIX;
+pub const __UINTMAX_TYPE__ = c_ulong;
+pub const __UINTMAX_FMTo__ = "lo";
+pub const __UINTMAX_FMTu__ = "lu";
+pub const __UINTMAX_FMTx__ = "lx";
+pub const __UINTMAX_FMTX__ = "lX";
+pub const __UINTMAX_C_SUFFIX__ = @compileError("unable to translate macro: undefined identifier `UL`");
+// (no file):103:9
+pub const __UINTMAX_C = @import("std").zig.c_translation.Macros.UL_SUFFIX;
+pub const __PTRDIFF_TYPE__ = c_long;
+pub const __PTRDIFF_FMTd__ = "ld";
+pub const __PTRDIFF_FMTi__ = "li";
+pub const __INTPTR_TYPE__ = c_long;
+pub const __INTPTR_FMTd__ = "ld";
+pub const __INTPTR_FMTi__ = "li";
+pub const __SIZE_TYPE__ = c_ulong;
+pub const __SIZE_FMTo__ = "lo";
+pub const __SIZE_FMTu__ = "lu";
+pub const __SIZE_FMTx__ = "lx";
+pub const __SIZE_FMTX__ = "lX";
+pub const __WCHAR_TYPE__ = c_int;
+pub const __WINT_TYPE__ = c_uint;
+pub const __SIG_ATOMIC_MAX__ = @import("std").zig.c_translation.promoteIntLiteral(c_int, 2147483647, .decimal);
+pub const __SIG_ATOMIC_WIDTH__ = @as(c_int, 32);
+pub const __CHAR16_TYPE__ = c_ushort;
+pub const __CHAR32_TYPE__ = c_uint;
+pub const __UINTPTR_TYPE__ = c_ulong;
+pub const __UINTPTR_FMTo__ = "lo";
+pub const __UINTPTR_FMTu__ = "lu";
+pub const __UINTPTR_FMTx__ = "lx";
+pub const __UINTPTR_FMTX__ = "lX";
+pub const __FLT16_DENORM_MIN__ = @as(f16, 5.9604644775390625e-8);
+pub const __FLT16_NORM_MAX__ = @as(f16, 6.5504e+4);
+pub const __FLT16_HAS_DENORM__ = @as(c_int, 1);
+pub const __FLT16_DIG__ = @as(c_int, 3);
+pub const __FLT16_DECIMAL_DIG__ = @as(c_int, 5);
+pub const __FLT16_EPSILON__ = @as(f16, 9.765625e-4);
+pub const __FLT16_HAS_INFINITY__ = @as(c_int, 1);
+pub const __FLT16_HAS_QUIET_NAN__ = @as(c_int, 1);
+pub const __FLT16_MANT_DIG__ = @as(c_int, 11);
+pub const __FLT16_MAX_10_EXP__ = @as(c_int, 4);
+pub const __FLT16_MAX_EXP__ = @as(c_int, 16);
+pub const __FLT16_MAX__ = @as(f16, 6.5504e+4);
+pub const __FLT16_MIN_10_EXP__ = -@as(c_int, 4);
+pub const __FLT16_MIN_EXP__ = -@as(c_int, 13);
+pub const __FLT16_MIN__ = @as(f16, 6.103515625e-5);
+pub const __FLT_DENORM_MIN__ = @as(f32, 1.40129846e-45);
+pub const __FLT_NORM_MAX__ = @as(f32, 3.40282347e+38);
+pub const __FLT_HAS_DENORM__ = @as(c_int, 1);
+pub const __FLT_DIG__ = @as(c_int, 6);
+pub const __FLT_DECIMAL_DIG__ = @as(c_int, 9);
+pub const __FLT_EPSILON__ = @as(f32, 1.19209290e-7);
+pub const __FLT_HAS_INFINITY__ = @as(c_int, 1);
+pub const __FLT_HAS_QUIET_NAN__ = @as(c_int, 1);
+pub const __FLT_MANT_DIG__ = @as(c_int, 24);
+pub const __FLT_MAX_10_EXP__ = @as(c_int, 38);
+pub const __FLT_MAX_EXP__ = @as(c_int, 128);
+pub const __FLT_MAX__ = @as(f32, 3.40282347e+38);
+pub const __FLT_MIN_10_EXP__ = -@as(c_int, 37);
+pub const __FLT_MIN_EXP__ = -@as(c_int, 125);
+pub const __FLT_MIN__ = @as(f32, 1.17549435e-38);
+pub const __DBL_DENORM_MIN__ = @as(f64, 4.9406564584124654e-324);
+pub const __DBL_NORM_MAX__ = @as(f64, 1.7976931348623157e+308);
+pub const __DBL_HAS_DENORM__ = @as(c_int, 1);
+pub const __DBL_DIG__ = @as(c_int, 15);
+pub const __DBL_DECIMAL_DIG__ = @as(c_int, 17);
+pub const __DBL_EPSILON__ = @as(f64, 2.2204460492503131e-16);
+pub const __DBL_HAS_INFINITY__ = @as(c_int, 1);
+pub const __DBL_HAS_QUIET_NAN__ = @as(c_int, 1);
+pub const __DBL_MANT_DIG__ = @as(c_int, 53);
+pub const __DBL_MAX_10_EXP__ = @as(c_int, 308);
+pub const __DBL_MAX_EXP__ = @as(c_int, 1024);
+pub const __DBL_MAX__ = @as(f64, 1.7976931348623157e+308);
+pub const __DBL_MIN_10_EXP__ = -@as(c_int, 307);
+pub const __DBL_MIN_EXP__ = -@as(c_int, 1021);
+pub const __DBL_MIN__ = @as(f64, 2.2250738585072014e-308);
+pub const __LDBL_DENORM_MIN__ = @as(c_longdouble, 3.64519953188247460253e-4951);
+pub const __LDBL_NORM_MAX__ = @as(c_longdouble, 1.18973149535723176502e+4932);
+pub const __LDBL_HAS_DENORM__ = @as(c_int, 1);
+pub const __LDBL_DIG__ = @as(c_int, 18);
+pub const __LDBL_DECIMAL_DIG__ = @as(c_int, 21);
+pub const __LDBL_EPSILON__ = @as(c_longdouble, 1.08420217248550443401e-19);
+pub const __LDBL_HAS_INFINITY__ = @as(c_int, 1);
+pub const __LDBL_HAS_QUIET_NAN__ = @as(c_int, 1);
+pub const __LDBL_MANT_DIG__ = @as(c_int, 64);
+pub const __LDBL_MAX_10_EXP__ = @as(c_int, 4932);
+pub const __LDBL_MAX_EXP__ = @as(c_int, 16384);
+pub const __LDBL_MAX__ = @as(c_longdouble, 1.18973149535723176502e+4932);
+pub const __LDBL_MIN_10_EXP__ = -@as(c_int, 4931);
+pub const __LDBL_MIN_EXP__ = -@as(c_int, 16381);
+pub const __LDBL_MIN__ = @as(c_longdouble, 3.36210314311209350626e-4932);
+pub const __POINTER_WIDTH__ = @as(c_int, 64);
+pub const __BIGGEST_ALIGNMENT__ = @as(c_int, 16);
+pub const __WINT_UNSIGNED__ = @as(c_int, 1);
+pub const __INT8_TYPE__ = i8;
+pub const __INT8_FMTd__ = "hhd";
+pub const __INT8_FMTi__ = "hhi";
+pub const __INT8_C_SUFFIX__ = "";
+pub inline fn __INT8_C(c: anytype) @TypeOf(c) {
+    _ = &c;
+    return c;
+}
+pub const __INT16_TYPE__ = c_short;
+pub const __INT16_FMTd__ = "hd";
+pub const __INT16_FMTi__ = "hi";
+pub const __INT16_C_SUFFIX__ = "";
+pub inline fn __INT16_C(c: anytype) @TypeOf(c) {
+    _ = &c;
+    return c;
+}
+pub const __INT32_TYPE__ = c_int;
+pub const __INT32_FMTd__ = "d";
+pub const __INT32_FMTi__ = "i";
+pub const __INT32_C_SUFFIX__ = "";
+pub inline fn __INT32_C(c: anytype) @TypeOf(c) {
+    _ = &c;
+    return c;
+}
+pub const __INT64_TYPE__ = c_long;
+pub const __INT64_FMTd__ = "ld";
+pub const __INT64_FMTi__ = "li";
+pub const __INT64_C_SUFFIX__ = @compileError("unable to translate macro: undefined identifier `L`");
+// (no file):208:9
+pub const __INT64_C = @import("std").zig.c_translation.Macros.L_SUFFIX;
+pub const __UINT8_TYPE__ = u8;
+pub const __UINT8_FMTo__ = "hho";
+pub const __UINT8_FMTu__ = "hhu";
+pub const __UINT8_FMTx__ = "hhx";
+pub const __UINT8_FMTX__ = "hhX";
+pub const __UINT8_C_SUFFIX__ = "";
+pub inline fn __UINT8_C(c: anytype) @TypeOf(c) {
+    _ = &c;
+    return c;
+}
+pub const __UINT8_MAX__ = @as(c_int, 255);
+pub const __INT8_MAX__ = @as(c_int, 127);
+pub const __UINT16_TYPE__ = c_ushort;
+pub const __UINT16_FMTo__ = "ho";
+pub const __UINT16_FMTu__ = "hu";
+pub const __UINT16_FMTx__ = "hx";
+pub const __UINT16_FMTX__ = "hX";
+pub const __UINT16_C_SUFFIX__ = "";
+pub inline fn __UINT16_C(c: anytype) @TypeOf(c) {
+    _ = &c;
+    return c;
+}
+pub const __UINT16_MAX__ = @import("std").zig.c_translation.promoteIntLiteral(c_int, 65535, .decimal);
+pub const __INT16_MAX__ = @as(c_int, 32767);
+pub const __UINT32_TYPE__ = c_uint;
+pub const __UINT32_FMTo__ = "o";
+pub const __UINT32_FMTu__ = "u";
+pub const __UINT32_FMTx__ = "x";
+pub const __UINT32_FMTX__ = "X";
+pub const __UINT32_C_SUFFIX__ = @compileError("unable to translate macro: undefined identifier `U`");
+// (no file):233:9
+pub const __UINT32_C = @import("std").zig.c_translation.Macros.U_SUFFIX;
+pub const __UINT32_MAX__ = @import("std").zig.c_translation.promoteIntLiteral(c_uint, 4294967295, .decimal);
+pub const __INT32_MAX__ = @import("std").zig.c_translation.promoteIntLiteral(c_int, 2147483647, .decimal);
+pub const __UINT64_TYPE__ = c_ulong;
+pub const __UINT64_FMTo__ = "lo";
+pub const __UINT64_FMTu__ = "lu";
+pub const __UINT64_FMTx__ = "lx";
+pub const __UINT64_FMTX__ = "lX";
+pub const __UINT64_C_SUFFIX__ = @compileError("unable to translate macro: undefined identifier `UL`");
+// (no file):242:9
+pub const __UINT64_C = @import("std").zig.c_translation.Macros.UL_SUFFIX;
+pub const __UINT64_MAX__ = @import("std").zig.c_translation.promoteIntLiteral(c_ulong, 18446744073709551615, .decimal);
+pub const __INT64_MAX__ = @import("std").zig.c_translation.promoteIntLiteral(c_long, 9223372036854775807, .decimal);
+pub const __INT_LEAST8_TYPE__ = i8;
+pub const __INT_LEAST8_MAX__ = @as(c_int, 127);
+pub const __INT_LEAST8_WIDTH__ = @as(c_int, 8);
+pub const __INT_LEAST8_FMTd__ = "hhd";
+pub const __INT_LEAST8_FMTi__ = "hhi";
+pub const __UINT_LEAST8_TYPE__ = u8;
+pub const __UINT_LEAST8_MAX__ = @as(c_int, 255);
+pub const __UINT_LEAST8_FMTo__ = "hho";
+pub const __UINT_LEAST8_FMTu__ = "hhu";
+pub const __UINT_LEAST8_FMTx__ = "hhx";
+pub const __UINT_LEAST8_FMTX__ = "hhX";
+pub const __INT_LEAST16_TYPE__ = c_short;
+pub const __INT_LEAST16_MAX__ = @as(c_int, 32767);
+pub const __INT_LEAST16_WIDTH__ = @as(c_int, 16);
+pub const __INT_LEAST16_FMTd__ = "hd";
+pub const __INT_LEAST16_FMTi__ = "hi";
+pub const __UINT_LEAST16_TYPE__ = c_ushort;
+pub const __UINT_LEAST16_MAX__ = @import("std").zig.c_translation.promoteIntLiteral(c_int, 65535, .decimal);
+pub const __UINT_LEAST16_FMTo__ = "ho";
+pub const __UINT_LEAST16_FMTu__ = "hu";
+pub const __UINT_LEAST16_FMTx__ = "hx";
+pub const __UINT_LEAST16_FMTX__ = "hX";
+pub const __INT_LEAST32_TYPE__ = c_int;
+pub const __INT_LEAST32_MAX__ = @import("std").zig.c_translation.promoteIntLiteral(c_int, 2147483647, .decimal);
+pub const __INT_LEAST32_WIDTH__ = @as(c_int, 32);
+pub const __INT_LEAST32_FMTd__ = "d";
+pub const __INT_LEAST32_FMTi__ = "i";
+pub const __UINT_LEAST32_TYPE__ = c_uint;
+pub const __UINT_LEAST32_MAX__ = @import("std").zig.c_translation.promoteIntLiteral(c_uint, 4294967295, .decimal);
+pub const __UINT_LEAST32_FMTo__ = "o";
+pub const __UINT_LEAST32_FMTu__ = "u";
+pub const __UINT_LEAST32_FMTx__ = "x";
+pub const __UINT_LEAST32_FMTX__ = "X";
+pub const __INT_LEAST64_TYPE__ = c_long;
+pub const __INT_LEAST64_MAX__ = @import("std").zig.c_translation.promoteIntLiteral(c_long, 9223372036854775807, .decimal);
+pub const __INT_LEAST64_WIDTH__ = @as(c_int, 64);
+pub const __INT_LEAST64_FMTd__ = "ld";
+pub const __INT_LEAST64_FMTi__ = "li";
+pub const __UINT_LEAST64_TYPE__ = c_ulong;
+pub const __UINT_LEAST64_MAX__ = @import("std").zig.c_translation.promoteIntLiteral(c_ulong, 18446744073709551615, .decimal);
+pub const __UINT_LEAST64_FMTo__ = "lo";
+pub const __UINT_LEAST64_FMTu__ = "lu";
+pub const __UINT_LEAST64_FMTx__ = "lx";
+pub const __UINT_LEAST64_FMTX__ = "lX";
+pub const __INT_FAST8_TYPE__ = i8;
+pub const __INT_FAST8_MAX__ = @as(c_int, 127);
+pub const __INT_FAST8_WIDTH__ = @as(c_int, 8);
+pub const __INT_FAST8_FMTd__ = "hhd";
+pub const __INT_FAST8_FMTi__ = "hhi";
+pub const __UINT_FAST8_TYPE__ = u8;
+pub const __UINT_FAST8_MAX__ = @as(c_int, 255);
+pub const __UINT_FAST8_FMTo__ = "hho";
+pub const __UINT_FAST8_FMTu__ = "hhu";
+pub const __UINT_FAST8_FMTx__ = "hhx";
+pub const __UINT_FAST8_FMTX__ = "hhX";
+pub const __INT_FAST16_TYPE__ = c_short;
+pub const __INT_FAST16_MAX__ = @as(c_int, 32767);
+pub const __INT_FAST16_WIDTH__ = @as(c_int, 16);
+pub const __INT_FAST16_FMTd__ = "hd";
+pub const __INT_FAST16_FMTi__ = "hi";
+pub const __UINT_FAST16_TYPE__ = c_ushort;
+pub const __UINT_FAST16_MAX__ = @import("std").zig.c_translation.promoteIntLiteral(c_int, 65535, .decimal);
+pub const __UINT_FAST16_FMTo__ = "ho";
+pub const __UINT_FAST16_FMTu__ = "hu";
+pub const __UINT_FAST16_FMTx__ = "hx";
+pub const __UINT_FAST16_FMTX__ = "hX";
+pub const __INT_FAST32_TYPE__ = c_int;
+pub const __INT_FAST32_MAX__ = @import("std").zig.c_translation.promoteIntLiteral(c_int, 2147483647, .decimal);
+pub const __INT_FAST32_WIDTH__ = @as(c_int, 32);
+pub const __INT_FAST32_FMTd__ = "d";
+pub const __INT_FAST32_FMTi__ = "i";
+pub const __UINT_FAST32_TYPE__ = c_uint;
+pub const __UINT_FAST32_MAX__ = @import("std").zig.c_translation.promoteIntLiteral(c_uint, 4294967295, .decimal);
+pub const __UINT_FAST32_FMTo__ = "o";
+pub const __UINT_FAST32_FMTu__ = "u";
+pub const __UINT_FAST32_FMTx__ = "x";
+pub const __UINT_FAST32_FMTX__ = "X";
+pub const __INT_FAST64_TYPE__ = c_long;
+pub const __INT_FAST64_MAX__ = @import("std").zig.c_translation.promoteIntLiteral(c_long, 9223372036854775807, .decimal);
+pub const __INT_FAST64_WIDTH__ = @as(c_int, 64);
+pub const __INT_FAST64_FMTd__ = "ld";
+pub const __INT_FAST64_FMTi__ = "li";
+pub const __UINT_FAST64_TYPE__ = c_ulong;
+pub const __UINT_FAST64_MAX__ = @import("std").zig.c_translation.promoteIntLiteral(c_ulong, 18446744073709551615, .decimal);
+pub const __UINT_FAST64_FMTo__ = "lo";
+pub const __UINT_FAST64_FMTu__ = "lu";
+pub const __UINT_FAST64_FMTx__ = "lx";
+pub const __UINT_FAST64_FMTX__ = "lX";
+pub const __USER_LABEL_PREFIX__ = "";
+pub const __FINITE_MATH_ONLY__ = @as(c_int, 0);
+pub const __GNUC_STDC_INLINE__ = @as(c_int, 1);
+pub const __GCC_ATOMIC_TEST_AND_SET_TRUEVAL = @as(c_int, 1);
+pub const __GCC_DESTRUCTIVE_SIZE = @as(c_int, 64);
+pub const __GCC_CONSTRUCTIVE_SIZE = @as(c_int, 64);
+pub const __CLANG_ATOMIC_BOOL_LOCK_FREE = @as(c_int, 2);
+pub const __CLANG_ATOMIC_CHAR_LOCK_FREE = @as(c_int, 2);
+pub const __CLANG_ATOMIC_CHAR16_T_LOCK_FREE = @as(c_int, 2);
+pub const __CLANG_ATOMIC_CHAR32_T_LOCK_FREE = @as(c_int, 2);
+pub const __CLANG_ATOMIC_WCHAR_T_LOCK_FREE = @as(c_int, 2);
+pub const __CLANG_ATOMIC_SHORT_LOCK_FREE = @as(c_int, 2);
+pub const __CLANG_ATOMIC_INT_LOCK_FREE = @as(c_int, 2);
+pub const __CLANG_ATOMIC_LONG_LOCK_FREE = @as(c_int, 2);
+pub const __CLANG_ATOMIC_LLONG_LOCK_FREE = @as(c_int, 2);
+pub const __CLANG_ATOMIC_POINTER_LOCK_FREE = @as(c_int, 2);
+pub const __GCC_ATOMIC_BOOL_LOCK_FREE = @as(c_int, 2);
+pub const __GCC_ATOMIC_CHAR_LOCK_FREE = @as(c_int, 2);
+pub const __GCC_ATOMIC_CHAR16_T_LOCK_FREE = @as(c_int, 2);
+pub const __GCC_ATOMIC_CHAR32_T_LOCK_FREE = @as(c_int, 2);
+pub const __GCC_ATOMIC_WCHAR_T_LOCK_FREE = @as(c_int, 2);
+pub const __GCC_ATOMIC_SHORT_LOCK_FREE = @as(c_int, 2);
+pub const __GCC_ATOMIC_INT_LOCK_FREE = @as(c_int, 2);
+pub const __GCC_ATOMIC_LONG_LOCK_FREE = @as(c_int, 2);
+pub const __GCC_ATOMIC_LLONG_LOCK_FREE = @as(c_int, 2);
+pub const __GCC_ATOMIC_POINTER_LOCK_FREE = @as(c_int, 2);
+pub const __FLT_RADIX__ = @as(c_int, 2);
+pub const __DECIMAL_DIG__ = __LDBL_DECIMAL_DIG__;
+pub const __ELF__ = @as(c_int, 1);
+pub const __GCC_ASM_FLAG_OUTPUTS__ = @as(c_int, 1);
+pub const __code_model_small__ = @as(c_int, 1);
+pub const __amd64__ = @as(c_int, 1);
+pub const __amd64 = @as(c_int, 1);
+pub const __x86_64 = @as(c_int, 1);
+pub const __x86_64__ = @as(c_int, 1);
+pub const __SEG_GS = @as(c_int, 1);
+pub const __SEG_FS = @as(c_int, 1);
+pub const __seg_gs = @compileError("unable to translate macro: undefined identifier `address_space`");
+// (no file):373:9
+pub const __seg_fs = @compileError("unable to translate macro: undefined identifier `address_space`");
+// (no file):374:9
+pub const __corei7 = @as(c_int, 1);
+pub const __corei7__ = @as(c_int, 1);
+pub const __tune_corei7__ = @as(c_int, 1);
+pub const __REGISTER_PREFIX__ = "";
+pub const __NO_MATH_INLINES = @as(c_int, 1);
+pub const __AES__ = @as(c_int, 1);
+pub const __VAES__ = @as(c_int, 1);
+pub const __PCLMUL__ = @as(c_int, 1);
+pub const __VPCLMULQDQ__ = @as(c_int, 1);
+pub const __LAHF_SAHF__ = @as(c_int, 1);
+pub const __LZCNT__ = @as(c_int, 1);
+pub const __RDRND__ = @as(c_int, 1);
+pub const __FSGSBASE__ = @as(c_int, 1);
+pub const __BMI__ = @as(c_int, 1);
+pub const __BMI2__ = @as(c_int, 1);
+pub const __POPCNT__ = @as(c_int, 1);
+pub const __PRFCHW__ = @as(c_int, 1);
+pub const __RDSEED__ = @as(c_int, 1);
+pub const __ADX__ = @as(c_int, 1);
+pub const __MOVBE__ = @as(c_int, 1);
+pub const __FMA__ = @as(c_int, 1);
+pub const __F16C__ = @as(c_int, 1);
+pub const __GFNI__ = @as(c_int, 1);
+pub const __EVEX512__ = @as(c_int, 1);
+pub const __AVX512CD__ = @as(c_int, 1);
+pub const __AVX512VPOPCNTDQ__ = @as(c_int, 1);
+pub const __AVX512VNNI__ = @as(c_int, 1);
+pub const __AVX512BF16__ = @as(c_int, 1);
+pub const __AVX512FP16__ = @as(c_int, 1);
+pub const __AVX512DQ__ = @as(c_int, 1);
+pub const __AVX512BITALG__ = @as(c_int, 1);
+pub const __AVX512BW__ = @as(c_int, 1);
+pub const __AVX512VL__ = @as(c_int, 1);
+pub const __EVEX256__ = @as(c_int, 1);
+pub const __AVX512VBMI__ = @as(c_int, 1);
+pub const __AVX512VBMI2__ = @as(c_int, 1);
+pub const __AVX512IFMA__ = @as(c_int, 1);
+pub const __SHA__ = @as(c_int, 1);
+pub const __FXSR__ = @as(c_int, 1);
+pub const __XSAVE__ = @as(c_int, 1);
+pub const __XSAVEOPT__ = @as(c_int, 1);
+pub const __XSAVEC__ = @as(c_int, 1);
+pub const __XSAVES__ = @as(c_int, 1);
+pub const __PKU__ = @as(c_int, 1);
+pub const __CLFLUSHOPT__ = @as(c_int, 1);
+pub const __CLWB__ = @as(c_int, 1);
+pub const __WBNOINVD__ = @as(c_int, 1);
+pub const __SHSTK__ = @as(c_int, 1);
+pub const __RDPID__ = @as(c_int, 1);
+pub const __CLDEMOTE__ = @as(c_int, 1);
+pub const __MOVDIRI__ = @as(c_int, 1);
+pub const __MOVDIR64B__ = @as(c_int, 1);
+pub const __INVPCID__ = @as(c_int, 1);
+pub const __AMX_TILE__ = @as(c_int, 1);
+pub const __AMX_INT8__ = @as(c_int, 1);
+pub const __AMX_BF16__ = @as(c_int, 1);
+pub const __AVXVNNI__ = @as(c_int, 1);
+pub const __SERIALIZE__ = @as(c_int, 1);
+pub const __TSXLDTRK__ = @as(c_int, 1);
+pub const __CRC32__ = @as(c_int, 1);
+pub const __AVX512F__ = @as(c_int, 1);
+pub const __AVX2__ = @as(c_int, 1);
+pub const __AVX__ = @as(c_int, 1);
+pub const __SSE4_2__ = @as(c_int, 1);
+pub const __SSE4_1__ = @as(c_int, 1);
+pub const __SSSE3__ = @as(c_int, 1);
+pub const __SSE3__ = @as(c_int, 1);
+pub const __SSE2__ = @as(c_int, 1);
+pub const __SSE2_MATH__ = @as(c_int, 1);
+pub const __SSE__ = @as(c_int, 1);
+pub const __SSE_MATH__ = @as(c_int, 1);
+pub const __MMX__ = @as(c_int, 1);
+pub const __GCC_HAVE_SYNC_COMPARE_AND_SWAP_1 = @as(c_int, 1);
+pub const __GCC_HAVE_SYNC_COMPARE_AND_SWAP_2 = @as(c_int, 1);
+pub const __GCC_HAVE_SYNC_COMPARE_AND_SWAP_4 = @as(c_int, 1);
+pub const __GCC_HAVE_SYNC_COMPARE_AND_SWAP_8 = @as(c_int, 1);
+pub const __GCC_HAVE_SYNC_COMPARE_AND_SWAP_16 = @as(c_int, 1);
+pub const __SIZEOF_FLOAT128__ = @as(c_int, 16);
+pub const unix = @as(c_int, 1);
+pub const __unix = @as(c_int, 1);
+pub const __unix__ = @as(c_int, 1);
+pub const linux = @as(c_int, 1);
+pub const __linux = @as(c_int, 1);
+pub const __linux__ = @as(c_int, 1);
+pub const __gnu_linux__ = @as(c_int, 1);
+pub const __FLOAT128__ = @as(c_int, 1);
+pub const __STDC__ = @as(c_int, 1);
+pub const __STDC_HOSTED__ = @as(c_int, 1);
+pub const __STDC_VERSION__ = @as(c_long, 201710);
+pub const __STDC_UTF_16__ = @as(c_int, 1);
+pub const __STDC_UTF_32__ = @as(c_int, 1);
+pub const __STDC_EMBED_NOT_FOUND__ = @as(c_int, 0);
+pub const __STDC_EMBED_FOUND__ = @as(c_int, 1);
+pub const __STDC_EMBED_EMPTY__ = @as(c_int, 2);
+pub const NDEBUG = @as(c_int, 1);
+pub const __GCC_HAVE_DWARF2_CFI_ASM = @as(c_int, 1);
+pub const LIBMUSICTHEORY_H = "";
+pub const __STDBOOL_H = "";
+pub const __bool_true_false_are_defined = @as(c_int, 1);
+pub const @"bool" = bool;
+pub const @"true" = @as(c_int, 1);
+pub const @"false" = @as(c_int, 0);
+pub const __CLANG_STDINT_H = "";
+pub const __int_least64_t = i64;
+pub const __uint_least64_t = u64;
+pub const __int_least32_t = i64;
+pub const __uint_least32_t = u64;
+pub const __int_least16_t = i64;
+pub const __uint_least16_t = u64;
+pub const __int_least8_t = i64;
+pub const __uint_least8_t = u64;
+pub const __uint32_t_defined = "";
+pub const __int8_t_defined = "";
+pub const __stdint_join3 = @compileError("unable to translate C expr: unexpected token '##'");
+// /tmp/zigpkg/ex/ziglang/lib/include/stdint.h:291:9
+pub const __intptr_t_defined = "";
+pub const _INTPTR_T = "";
+pub const _UINTPTR_T = "";
+pub const __int_c_join = @compileError("unable to translate C expr: unexpected token '##'");
+// /tmp/zigpkg/ex/ziglang/lib/include/stdint.h:328:9
+pub inline fn __int_c(v: anytype, suffix: anytype) @TypeOf(__int_c_join(v, suffix)) {
+    _ = &v;
+    _ = &suffix;
+    return __int_c_join(v, suffix);
+}
+pub const __uint_c = @compileError("unable to translate macro: undefined identifier `U`");
+// /tmp/zigpkg/ex/ziglang/lib/include/stdint.h:330:9
+pub const __int64_c_suffix = __INT64_C_SUFFIX__;
+pub const __int32_c_suffix = __INT64_C_SUFFIX__;
+pub const __int16_c_suffix = __INT64_C_SUFFIX__;
+pub const __int8_c_suffix = __INT64_C_SUFFIX__;
+pub inline fn INT64_C(v: anytype) @TypeOf(__int_c(v, __int64_c_suffix)) {
+    _ = &v;
+    return __int_c(v, __int64_c_suffix);
+}
+pub inline fn UINT64_C(v: anytype) @TypeOf(__uint_c(v, __int64_c_suffix)) {
+    _ = &v;
+    return __uint_c(v, __int64_c_suffix);
+}
+pub inline fn INT32_C(v: anytype) @TypeOf(__int_c(v, __int32_c_suffix)) {
+    _ = &v;
+    return __int_c(v, __int32_c_suffix);
+}
+pub inline fn UINT32_C(v: anytype) @TypeOf(__uint_c(v, __int32_c_suffix)) {
+    _ = &v;
+    return __uint_c(v, __int32_c_suffix);
+}
+pub inline fn INT16_C(v: anytype) @TypeOf(__int_c(v, __int16_c_suffix)) {
+    _ = &v;
+    return __int_c(v, __int16_c_suffix);
+}
+pub inline fn UINT16_C(v: anytype) @TypeOf(__uint_c(v, __int16_c_suffix)) {
+    _ = &v;
+    return __uint_c(v, __int16_c_suffix);
+}
+pub inline fn INT8_C(v: anytype) @TypeOf(__int_c(v, __int8_c_suffix)) {
+    _ = &v;
+    return __int_c(v, __int8_c_suffix);
+}
+pub inline fn UINT8_C(v: anytype) @TypeOf(__uint_c(v, __int8_c_suffix)) {
+    _ = &v;
+    return __uint_c(v, __int8_c_suffix);
+}
+pub const INT64_MAX = INT64_C(@import("std").zig.c_translation.promoteIntLiteral(c_int, 9223372036854775807, .decimal));
+pub const INT64_MIN = -INT64_C(@import("std").zig.c_translation.promoteIntLiteral(c_int, 9223372036854775807, .decimal)) - @as(c_int, 1);
+pub const UINT64_MAX = UINT64_C(@import("std").zig.c_translation.promoteIntLiteral(c_int, 18446744073709551615, .decimal));
+pub const __INT_LEAST64_MIN = INT64_MIN;
+pub const __INT_LEAST64_MAX = INT64_MAX;
+pub const __UINT_LEAST64_MAX = UINT64_MAX;
+pub const __INT_LEAST32_MIN = INT64_MIN;
+pub const __INT_LEAST32_MAX = INT64_MAX;
+pub const __UINT_LEAST32_MAX = UINT64_MAX;
+pub const __INT_LEAST16_MIN = INT64_MIN;
+pub const __INT_LEAST16_MAX = INT64_MAX;
+pub const __UINT_LEAST16_MAX = UINT64_MAX;
+pub const __INT_LEAST8_MIN = INT64_MIN;
+pub const __INT_LEAST8_MAX = INT64_MAX;
+pub const __UINT_LEAST8_MAX = UINT64_MAX;
+pub const INT_LEAST64_MIN = __INT_LEAST64_MIN;
+pub const INT_LEAST64_MAX = __INT_LEAST64_MAX;
+pub const UINT_LEAST64_MAX = __UINT_LEAST64_MAX;
+pub const INT_FAST64_MIN = __INT_LEAST64_MIN;
+pub const INT_FAST64_MAX = __INT_LEAST64_MAX;
+pub const UINT_FAST64_MAX = __UINT_LEAST64_MAX;
+pub const INT32_MAX = INT32_C(@import("std").zig.c_translation.promoteIntLiteral(c_int, 2147483647, .decimal));
+pub const INT32_MIN = -INT32_C(@import("std").zig.c_translation.promoteIntLiteral(c_int, 2147483647, .decimal)) - @as(c_int, 1);
+pub const UINT32_MAX = UINT32_C(@import("std").zig.c_translation.promoteIntLiteral(c_int, 4294967295, .decimal));
+pub const INT_LEAST32_MIN = __INT_LEAST32_MIN;
+pub const INT_LEAST32_MAX = __INT_LEAST32_MAX;
+pub const UINT_LEAST32_MAX = __UINT_LEAST32_MAX;
+pub const INT_FAST32_MIN = __INT_LEAST32_MIN;
+pub const INT_FAST32_MAX = __INT_LEAST32_MAX;
+pub const UINT_FAST32_MAX = __UINT_LEAST32_MAX;
+pub const INT16_MAX = INT16_C(@as(c_int, 32767));
+pub const INT16_MIN = -INT16_C(@as(c_int, 32767)) - @as(c_int, 1);
+pub const UINT16_MAX = UINT16_C(@import("std").zig.c_translation.promoteIntLiteral(c_int, 65535, .decimal));
+pub const INT_LEAST16_MIN = __INT_LEAST16_MIN;
+pub const INT_LEAST16_MAX = __INT_LEAST16_MAX;
+pub const UINT_LEAST16_MAX = __UINT_LEAST16_MAX;
+pub const INT_FAST16_MIN = __INT_LEAST16_MIN;
+pub const INT_FAST16_MAX = __INT_LEAST16_MAX;
+pub const UINT_FAST16_MAX = __UINT_LEAST16_MAX;
+pub const INT8_MAX = INT8_C(@as(c_int, 127));
+pub const INT8_MIN = -INT8_C(@as(c_int, 127)) - @as(c_int, 1);
+pub const UINT8_MAX = UINT8_C(@as(c_int, 255));
+pub const INT_LEAST8_MIN = __INT_LEAST8_MIN;
+pub const INT_LEAST8_MAX = __INT_LEAST8_MAX;
+pub const UINT_LEAST8_MAX = __UINT_LEAST8_MAX;
+pub const INT_FAST8_MIN = __INT_LEAST8_MIN;
+pub const INT_FAST8_MAX = __INT_LEAST8_MAX;
+pub const UINT_FAST8_MAX = __UINT_LEAST8_MAX;
+pub const __INTN_MIN = @compileError("unable to translate macro: undefined identifier `INT`");
+// /tmp/zigpkg/ex/ziglang/lib/include/stdint.h:875:10
+pub const __INTN_MAX = @compileError("unable to translate macro: undefined identifier `INT`");
+// /tmp/zigpkg/ex/ziglang/lib/include/stdint.h:876:10
+pub const __UINTN_MAX = @compileError("unable to translate macro: undefined identifier `UINT`");
+// /tmp/zigpkg/ex/ziglang/lib/include/stdint.h:877:9
+pub const __INTN_C = @compileError("unable to translate macro: undefined identifier `INT`");
+// /tmp/zigpkg/ex/ziglang/lib/include/stdint.h:878:10
+pub const __UINTN_C = @compileError("unable to translate macro: undefined identifier `UINT`");
+// /tmp/zigpkg/ex/ziglang/lib/include/stdint.h:879:9
+pub const INTPTR_MIN = -__INTPTR_MAX__ - @as(c_int, 1);
+pub const INTPTR_MAX = __INTPTR_MAX__;
+pub const UINTPTR_MAX = __UINTPTR_MAX__;
+pub const PTRDIFF_MIN = -__PTRDIFF_MAX__ - @as(c_int, 1);
+pub const PTRDIFF_MAX = __PTRDIFF_MAX__;
+pub const SIZE_MAX = __SIZE_MAX__;
+pub const INTMAX_MIN = -__INTMAX_MAX__ - @as(c_int, 1);
+pub const INTMAX_MAX = __INTMAX_MAX__;
+pub const UINTMAX_MAX = __UINTMAX_MAX__;
+pub const SIG_ATOMIC_MIN = __INTN_MIN(__SIG_ATOMIC_WIDTH__);
+pub const SIG_ATOMIC_MAX = __INTN_MAX(__SIG_ATOMIC_WIDTH__);
+pub const WINT_MIN = __UINTN_C(__WINT_WIDTH__, @as(c_int, 0));
+pub const WINT_MAX = __UINTN_MAX(__WINT_WIDTH__);
+pub const WCHAR_MAX = __WCHAR_MAX__;
+pub const WCHAR_MIN = __INTN_MIN(__WCHAR_WIDTH__);
+pub inline fn INTMAX_C(v: anytype) @TypeOf(__int_c(v, __INTMAX_C_SUFFIX__)) {
+    _ = &v;
+    return __int_c(v, __INTMAX_C_SUFFIX__);
+}
+pub inline fn UINTMAX_C(v: anytype) @TypeOf(__int_c(v, __UINTMAX_C_SUFFIX__)) {
+    _ = &v;
+    return __int_c(v, __UINTMAX_C_SUFFIX__);
+}
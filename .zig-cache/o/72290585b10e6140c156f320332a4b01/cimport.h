@@ -0,0 +1 @@
+#include <libmusictheory.h>
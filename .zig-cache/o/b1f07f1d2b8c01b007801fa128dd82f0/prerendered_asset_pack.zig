@@ -0,0 +1 @@
+pub const PACK = @embedFile("prerendered_asset_pack.bin");
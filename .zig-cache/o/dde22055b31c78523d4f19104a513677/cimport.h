@@ -0,0 +1,2 @@
+#include <libmusictheory.h>
+#include <libmusictheory_compat.h>
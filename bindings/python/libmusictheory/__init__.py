@@ -0,0 +1,284 @@
+"""ctypes bindings for the libmusictheory C ABI.
+
+Every `lmt_*` export declared in `include/libmusictheory.h` is bound once at
+import time from the generated `_ffi.SIGNATURES` table, so calls through
+`lib` pay no per-call argtypes setup. Enum constants and struct layouts from
+the header are re-exported from this module.
+
+List, string, SVG, and RGBA outputs are written straight into caller-owned
+buffers (`bytearray`, writable `memoryview`, `array.array`, or ctypes arrays)
+without an intermediate copy. Reuse those buffers across calls on hot paths.
+
+The shared library is located through `LIBMUSICTHEORY_PATH`, then the repo's
+`zig-out/lib`, then the platform loader search path.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import sys
+from pathlib import Path
+
+from . import _ffi
+from ._ffi import *  # noqa: F401,F403 - header constants and struct layouts
+
+__all__ = [
+    "lib",
+    "load",
+    "out_view",
+    "in_view",
+    "struct_array",
+    "Context",
+    "pcs_from_list",
+    "pcs_to_list",
+    "detect_chord_matches",
+    "generate_voicings_n",
+    "string",
+    "svg_into",
+    "svg",
+    "svg_stream",
+    "svg_batch",
+    "bitmap_into",
+    "batch_into",
+]
+
+_LIB_NAMES = {
+    "darwin": "libmusictheory.dylib",
+    "win32": "musictheory.dll",
+}
+
+
+def _library_candidates() -> list[str]:
+    candidates = []
+    env_path = os.environ.get("LIBMUSICTHEORY_PATH")
+    if env_path:
+        candidates.append(env_path)
+    lib_name = _LIB_NAMES.get(sys.platform, "libmusictheory.so")
+    repo_root = Path(__file__).resolve().parents[3]
+    candidates.append(str(repo_root / "zig-out" / "lib" / lib_name))
+    found = ctypes.util.find_library("musictheory")
+    if found:
+        candidates.append(found)
+    return candidates
+
+
+def load(path: str | None = None) -> ctypes.CDLL:
+    """Open the shared library and declare every generated signature on it.
+
+    Exports listed in the header but missing from the loaded library (for
+    example an older build) are skipped rather than failing the import.
+    """
+    candidates = [path] if path is not None else _library_candidates()
+    errors = []
+    for candidate in candidates:
+        try:
+            handle = ctypes.CDLL(candidate)
+        except OSError as err:
+            errors.append(f"{candidate}: {err}")
+            continue
+        for name, (restype, argtypes) in _ffi.SIGNATURES.items():
+            try:
+                func = getattr(handle, name)
+            except AttributeError:
+                continue
+            func.restype = restype
+            func.argtypes = argtypes
+        return handle
+    raise OSError("libmusictheory shared library not found; build it with `zig build` or set LIBMUSICTHEORY_PATH\n" + "\n".join(errors))
+
+
+lib = load()
+
+
+def out_view(buf, ctype=ctypes.c_uint8):
+    """Return a `(ctype * n)` array sharing memory with a writable buffer.
+
+    `n` is the number of whole `ctype` elements that fit in `buf`. Passing
+    `None` returns `(None, 0)` so the C side sees a NULL sizing pass.
+    """
+    if buf is None:
+        return None, 0
+    if isinstance(buf, ctypes.Array):
+        return buf, len(buf)
+    view = memoryview(buf)
+    if view.readonly:
+        raise TypeError("output buffer must be writable")
+    count = view.nbytes // ctypes.sizeof(ctype)
+    return (ctype * count).from_buffer(view.cast("B")), count
+
+
+def in_view(data, ctype=ctypes.c_uint8):
+    """Return a `(ctype * n)` array for an input sequence.
+
+    Writable buffers are shared without a copy. Read-only buffers such as
+    `bytes` are copied once, and Python sequences are packed element-wise.
+    """
+    if data is None:
+        return None, 0
+    if isinstance(data, ctypes.Array):
+        return data, len(data)
+    if isinstance(data, (list, tuple)):
+        return (ctype * len(data))(*data), len(data)
+    view = memoryview(data)
+    count = view.nbytes // ctypes.sizeof(ctype)
+    if view.readonly:
+        return (ctype * count).from_buffer_copy(view), count
+    return (ctype * count).from_buffer(view.cast("B")), count
+
+
+def struct_array(ctype, count: int):
+    """Allocate a zeroed ctypes array of `count` header structs."""
+    return (ctype * count)()
+
+
+class Context:
+    """Scratch storage for the reentrant `_ctx` exports.
+
+    Create one per worker thread; calls holding different contexts never share
+    library scratch memory. Pass `ctx.handle` as the first argument.
+    """
+
+    def __init__(self) -> None:
+        size = lib.lmt_sizeof_context()
+        align = lib.lmt_alignof_context()
+        self._storage = (ctypes.c_uint8 * (size + align))()
+        base = ctypes.addressof(self._storage)
+        self.handle = lib.lmt_context_init(base + (-base) % align, size)
+        if not self.handle:
+            raise MemoryError("lmt_context_init rejected the context storage")
+        self._svg_buf = bytearray(16384)
+
+    def svg(self, name: str, *args) -> bytes:
+        """Render one SVG through the `_ctx` variant of `name`, exactly once.
+
+        A document larger than the reusable output buffer is finished with
+        `lmt_context_svg_copy` instead of a second render.
+        """
+        view, capacity = out_view(self._svg_buf, ctypes.c_char)
+        total = getattr(lib, name + "_ctx")(self.handle, *args, view, capacity)
+        if total >= capacity:
+            self._svg_buf = bytearray(total + 1)
+            view, capacity = out_view(self._svg_buf, ctypes.c_char)
+            lib.lmt_context_svg_copy(self.handle, view, capacity)
+        return bytes(self._svg_buf[:total])
+
+
+def pcs_from_list(pcs) -> int:
+    values, count = in_view(pcs, ctypes.c_uint8)
+    return lib.lmt_pcs_from_list(values, count)
+
+
+def pcs_to_list(pcs_set: int, out) -> int:
+    """Write the set members into `out` (at least 12 bytes) and return the count."""
+    view, capacity = out_view(out, ctypes.c_uint8)
+    if capacity < 12:
+        raise ValueError("pcs_to_list needs an output buffer of at least 12 bytes")
+    return lib.lmt_pcs_to_list(pcs_set, view)
+
+
+def detect_chord_matches(pcs_set: int, bass: int, bass_known: bool, out) -> int:
+    """Fill a `lmt_chord_match` array and return the logical match total."""
+    view, capacity = out_view(out, _ffi.lmt_chord_match)
+    return lib.lmt_detect_chord_matches(pcs_set, bass, bass_known, view, min(capacity, 255))
+
+
+def generate_voicings_n(chord_set: int, tuning, max_fret: int, max_span: int, out, ctx: Context | None = None) -> int:
+    """Write packed voicings (`len(tuning)` signed frets each) into `out`.
+
+    Returns the logical voicing total, which may exceed what fits in `out`.
+    Pass a `Context` to call the thread-safe `_ctx` export.
+    """
+    tuning_view, string_count = in_view(tuning, ctypes.c_uint8)
+    view, capacity = out_view(out, ctypes.c_int8)
+    voicing_cap = capacity // string_count if string_count else 0
+    if ctx is not None:
+        return lib.lmt_generate_voicings_n_ctx(ctx.handle, chord_set, tuning_view, string_count, max_fret, max_span, view, voicing_cap)
+    return lib.lmt_generate_voicings_n(chord_set, tuning_view, string_count, max_fret, max_span, view, voicing_cap)
+
+
+def string(name: str, *args) -> str:
+    """Call a string-returning export and decode the per-thread slot result."""
+    raw = getattr(lib, name)(*args)
+    return "" if raw is None else raw.decode("utf-8")
+
+
+def svg_into(name: str, *args, out) -> int:
+    """Render an SVG export into `out` and return the total SVG length.
+
+    The result is NUL-terminated inside `out` when it fits; compare the
+    return value against `len(out)` to detect truncation. `out=None`
+    performs the C sizing pass.
+    """
+    view, capacity = out_view(out, ctypes.c_char)
+    return getattr(lib, name)(*args, view, capacity)
+
+
+def svg(name: str, *args) -> bytes:
+    """Size, render, and return one SVG document as bytes."""
+    total = svg_into(name, *args, out=None)
+    buf = bytearray(total + 1)
+    svg_into(name, *args, out=buf)
+    return bytes(buf[:total])
+
+
+def svg_stream(name: str, *args, sink) -> int:
+    """Stream a `_stream` SVG export into `sink`, one bytes chunk per call.
+
+    `sink` is any callable taking bytes, such as `file.write` or a
+    compressor's `write`. Returns the total byte count. An exception raised by
+    `sink` aborts the render and is re-raised here.
+    """
+    failure = []
+
+    def write(_user, data, length):
+        try:
+            sink(ctypes.string_at(data, length))
+        except BaseException as err:  # noqa: BLE001 - re-raised below
+            failure.append(err)
+            return 0
+        return 1
+
+    total = getattr(lib, name)(*args, _ffi.lmt_write_fn(write), None)
+    if failure:
+        raise failure[0]
+    return total
+
+
+def svg_batch(name: str, *args, count: int) -> list[bytes]:
+    """Render a catalog through a `_batch` SVG export and split the arena.
+
+    `args` are the export's arguments before the offsets table, including its
+    own count. The first call sizes the arena and the second fills it.
+    """
+    func = getattr(lib, name)
+    offsets = (ctypes.c_uint32 * (count + 1))()
+    written = func(*args, offsets, None, 0)
+    if written == 0:
+        return []
+    arena = bytearray(offsets[written])
+    view, capacity = out_view(arena, ctypes.c_char)
+    written = func(*args, offsets, view, capacity)
+    return [bytes(arena[offsets[i] : offsets[i + 1]]) for i in range(written)]
+
+
+def bitmap_into(name: str, *args, out) -> int:
+    """Render an RGBA export into `out`; returns required bytes or 0."""
+    view, capacity = out_view(out, ctypes.c_uint8)
+    return getattr(lib, name)(*args, view, capacity)
+
+
+def batch_into(name: str, sets, out, *args) -> int:
+    """Run one `_batch` set export over a uint16 buffer in a single call.
+
+    `sets` is any uint16 buffer (`array('H')`, a NumPy `uint16` array, or a
+    writable `memoryview`); results land in `out` without copying. Extra
+    arguments such as the transpose amount go between the count and `out`.
+    Returns the number of sets processed.
+    """
+    out_type = _ffi.SIGNATURES[name][1][-1]._type_
+    sets_view, set_count = in_view(sets, ctypes.c_uint16)
+    out_buf, out_count = out_view(out, out_type)
+    count = min(set_count, out_count)
+    return getattr(lib, name)(sets_view, count, *args, out_buf)
@@ -0,0 +1,1124 @@
+# Auto-generated by scripts/generate_python_bindings.py from include/libmusictheory.h.
+# DO NOT EDIT MANUALLY.
+
+import ctypes
+
+LMT_SCALE_DIATONIC = 0
+LMT_SCALE_ACOUSTIC = 1
+LMT_SCALE_DIMINISHED = 2
+LMT_SCALE_WHOLE_TONE = 3
+LMT_SCALE_HARMONIC_MINOR = 4
+LMT_SCALE_HARMONIC_MAJOR = 5
+LMT_SCALE_DOUBLE_AUGMENTED_HEXATONIC = 6
+LMT_MODE_IONIAN = 0
+LMT_MODE_DORIAN = 1
+LMT_MODE_PHRYGIAN = 2
+LMT_MODE_LYDIAN = 3
+LMT_MODE_MIXOLYDIAN = 4
+LMT_MODE_AEOLIAN = 5
+LMT_MODE_LOCRIAN = 6
+LMT_MODE_MELODIC_MINOR = 7
+LMT_MODE_DORIAN_B2 = 8
+LMT_MODE_LYDIAN_AUG = 9
+LMT_MODE_LYDIAN_DOM = 10
+LMT_MODE_MIXOLYDIAN_B6 = 11
+LMT_MODE_LOCRIAN_NAT2 = 12
+LMT_MODE_SUPER_LOCRIAN = 13
+LMT_MODE_HARMONIC_MINOR = 14
+LMT_MODE_LOCRIAN_NAT6 = 15
+LMT_MODE_IONIAN_AUG = 16
+LMT_MODE_DORIAN_SHARP4 = 17
+LMT_MODE_PHRYGIAN_DOMINANT = 18
+LMT_MODE_LYDIAN_SHARP2 = 19
+LMT_MODE_SUPER_LOCRIAN_DIM = 20
+LMT_MODE_HALF_WHOLE = 21
+LMT_MODE_WHOLE_HALF = 22
+LMT_MODE_WHOLE_TONE = 23
+LMT_MODE_DOUBLE_HARMONIC = 24
+LMT_MODE_HUNGARIAN_MINOR = 25
+LMT_MODE_ENIGMATIC = 26
+LMT_MODE_NEAPOLITAN_MINOR = 27
+LMT_MODE_NEAPOLITAN_MAJOR = 28
+LMT_SNAP_TIE_LOWER = 0
+LMT_SNAP_TIE_HIGHER = 1
+LMT_BARRY_HARRIS_NOT_APPLICABLE = 0
+LMT_BARRY_HARRIS_CHORD_TONE = 1
+LMT_BARRY_HARRIS_PASSING_TONE = 2
+LMT_CHORD_MAJOR = 0
+LMT_CHORD_MINOR = 1
+LMT_CHORD_DIMINISHED = 2
+LMT_CHORD_AUGMENTED = 3
+LMT_KEY_MAJOR = 0
+LMT_KEY_MINOR = 1
+LMT_PNG_STORED = 0
+LMT_PNG_FAST = 1
+LMT_PLAYABILITY_REASON_REACHABLE_LOCATION = 0
+LMT_PLAYABILITY_REASON_REACHABLE_IN_CURRENT_WINDOW = 1
+LMT_PLAYABILITY_REASON_MULTIPLE_LOCATIONS_AVAILABLE = 2
+LMT_PLAYABILITY_REASON_EXPANDS_CURRENT_WINDOW = 3
+LMT_PLAYABILITY_REASON_OPEN_STRING_RELIEF = 4
+LMT_PLAYABILITY_REASON_REUSES_CURRENT_ANCHOR = 5
+LMT_PLAYABILITY_REASON_BOTTLENECK_REDUCED = 6
+LMT_PLAYABILITY_REASON_TECHNIQUE_PROFILE_APPLIED = 7
+LMT_PLAYABILITY_REASON_HAND_CONTINUITY_RESET = 8
+LMT_PLAYABILITY_WARNING_SHIFT_REQUIRED = 0
+LMT_PLAYABILITY_WARNING_COMFORT_WINDOW_EXCEEDED = 1
+LMT_PLAYABILITY_WARNING_HARD_LIMIT_EXCEEDED = 2
+LMT_PLAYABILITY_WARNING_AMBIGUOUS_HAND_ASSIGNMENT = 3
+LMT_PLAYABILITY_WARNING_EXCESSIVE_LONGITUDINAL_SHIFT = 4
+LMT_PLAYABILITY_WARNING_REPEATED_MAXIMAL_STRETCH = 5
+LMT_PLAYABILITY_WARNING_WEAK_FINGER_STRESS = 6
+LMT_PLAYABILITY_WARNING_UNSUPPORTED_EXTENSION = 7
+LMT_PLAYABILITY_WARNING_THUMB_ON_BLACK_UNDER_STRETCH = 8
+LMT_PLAYABILITY_WARNING_AWKWARD_THUMB_CROSSING = 9
+LMT_PLAYABILITY_WARNING_REPEATED_WEAK_ADJACENT_FINGER_SEQUENCE = 10
+LMT_PLAYABILITY_WARNING_FLUENCY_DEGRADATION_FROM_RECENT_MOTION = 11
+LMT_PLAYABILITY_POLICY_BALANCED = 0
+LMT_PLAYABILITY_POLICY_MINIMAX_BOTTLENECK = 1
+LMT_PLAYABILITY_POLICY_CUMULATIVE_STRAIN = 2
+LMT_PLAYABILITY_PROFILE_COMPACT_BEGINNER = 0
+LMT_PLAYABILITY_PROFILE_BALANCED_STANDARD = 1
+LMT_PLAYABILITY_PROFILE_SPAN_TOLERANT = 2
+LMT_PLAYABILITY_PROFILE_SHIFT_TOLERANT = 3
+LMT_PLAYABILITY_PHRASE_ISSUE_EVENT = 0
+LMT_PLAYABILITY_PHRASE_ISSUE_TRANSITION = 1
+LMT_PLAYABILITY_PHRASE_SEVERITY_ADVISORY = 0
+LMT_PLAYABILITY_PHRASE_SEVERITY_WARNING = 1
+LMT_PLAYABILITY_PHRASE_SEVERITY_BLOCKED = 2
+LMT_PLAYABILITY_PHRASE_DOMAIN_NONE = 0
+LMT_PLAYABILITY_PHRASE_DOMAIN_REASON = 1
+LMT_PLAYABILITY_PHRASE_DOMAIN_WARNING = 2
+LMT_PLAYABILITY_PHRASE_DOMAIN_FRET_BLOCKER = 3
+LMT_PLAYABILITY_PHRASE_DOMAIN_KEYBOARD_BLOCKER = 4
+LMT_PLAYABILITY_PHRASE_STRAIN_NEUTRAL = 0
+LMT_PLAYABILITY_PHRASE_STRAIN_ELEVATED = 1
+LMT_PLAYABILITY_PHRASE_STRAIN_HIGH = 2
+LMT_PLAYABILITY_PHRASE_STRAIN_BLOCKED = 3
+LMT_PLAYABILITY_REPAIR_REALIZATION_ONLY = 0
+LMT_PLAYABILITY_REPAIR_REGISTER_ADJUSTED = 1
+LMT_PLAYABILITY_REPAIR_TEXTURE_REDUCED = 2
+LMT_FRET_PLAYABILITY_BLOCKER_SPAN_HARD_LIMIT = 0
+LMT_FRET_PLAYABILITY_BLOCKER_SHIFT_HARD_LIMIT = 1
+LMT_FRET_PLAYABILITY_BLOCKER_STRING_SPAN_HARD_LIMIT = 2
+LMT_FRET_PLAYABILITY_BLOCKER_FINGER_OVERLOAD = 3
+LMT_FRET_PLAYABILITY_BLOCKER_UNSUPPORTED_EXTENSION = 4
+LMT_FRET_TECHNIQUE_GENERIC_GUITAR = 0
+LMT_FRET_TECHNIQUE_BASS_SIMANDL = 1
+LMT_FRET_TECHNIQUE_BASS_OFPF = 2
+LMT_FRET_TECHNIQUE_EXTENDED_RANGE_CLASSICAL_THUMB = 3
+LMT_KEYBOARD_HAND_LEFT = 0
+LMT_KEYBOARD_HAND_RIGHT = 1
+LMT_KEYBOARD_PLAYABILITY_BLOCKER_SPAN_HARD_LIMIT = 0
+LMT_KEYBOARD_PLAYABILITY_BLOCKER_NOTE_COUNT_EXCEEDS_FINGERS = 1
+LMT_KEYBOARD_PLAYABILITY_BLOCKER_SHIFT_HARD_LIMIT = 2
+LMT_KEYBOARD_PLAYABILITY_BLOCKER_IMPOSSIBLE_THUMB_CROSSING = 3
+LMT_MAX_FRET_PLAYABILITY_STRINGS = 16
+LMT_MAX_KEYBOARD_FINGERING_NOTES = 5
+LMT_MAX_PHRASE_EVENTS = 64
+LMT_CADENCE_NONE = 0
+LMT_CADENCE_STABLE = 1
+LMT_CADENCE_PRE_DOMINANT = 2
+LMT_CADENCE_DOMINANT = 3
+LMT_CADENCE_CADENTIAL_SIX_FOUR = 4
+LMT_CADENCE_AUTHENTIC_ARRIVAL = 5
+LMT_CADENCE_HALF_ARRIVAL = 6
+LMT_CADENCE_DECEPTIVE_PULL = 7
+LMT_CADENCE_DESTINATION_STABLE_CONTINUATION = 0
+LMT_CADENCE_DESTINATION_PRE_DOMINANT_ARRIVAL = 1
+LMT_CADENCE_DESTINATION_DOMINANT_ARRIVAL = 2
+LMT_CADENCE_DESTINATION_AUTHENTIC_ARRIVAL = 3
+LMT_CADENCE_DESTINATION_HALF_ARRIVAL = 4
+LMT_CADENCE_DESTINATION_DECEPTIVE_PULL = 5
+LMT_SUSPENSION_NONE = 0
+LMT_SUSPENSION_PREPARATION = 1
+LMT_SUSPENSION_SUSPENSION = 2
+LMT_SUSPENSION_RESOLUTION = 3
+LMT_SUSPENSION_UNRESOLVED = 4
+LMT_VOICE_MOTION_STATIONARY = 0
+LMT_VOICE_MOTION_STEP = 1
+LMT_VOICE_MOTION_LEAP = 2
+LMT_PAIR_MOTION_NONE = 0
+LMT_PAIR_MOTION_CONTRARY = 1
+LMT_PAIR_MOTION_SIMILAR = 2
+LMT_PAIR_MOTION_PARALLEL = 3
+LMT_PAIR_MOTION_OBLIQUE = 4
+LMT_SATB_SOPRANO = 0
+LMT_SATB_ALTO = 1
+LMT_SATB_TENOR = 2
+LMT_SATB_BASS = 3
+LMT_COUNTERPOINT_SPECIES = 0
+LMT_COUNTERPOINT_TONAL_CHORALE = 1
+LMT_COUNTERPOINT_MODAL_POLYPHONY = 2
+LMT_COUNTERPOINT_JAZZ_CLOSE_LEADING = 3
+LMT_COUNTERPOINT_FREE_CONTEMPORARY = 4
+LMT_VOICE_LEADING_PARALLEL_FIFTH = 0
+LMT_VOICE_LEADING_PARALLEL_OCTAVE_OR_UNISON = 1
+LMT_VOICE_LEADING_VOICE_CROSSING = 2
+LMT_VOICE_LEADING_UPPER_SPACING = 3
+LMT_PACK_NAMES = 1
+LMT_PACK_MAJMIN_SCENES = 2
+LMT_PACK_EVENNESS = 4
+LMT_PACK_ALL = 7
+LMT_PRERENDERED_CLOCK_OPTC = 0
+LMT_PRERENDERED_OPTIC_K_GROUP = 1
+LMT_PRERENDERED_KEY_STAFF = 2
+LMT_PRERENDERED_EVENNESS_CHART = 3
+
+
+class lmt_key_context(ctypes.Structure):
+    _fields_ = [
+        ("tonic", ctypes.c_uint8),
+        ("quality", ctypes.c_uint8),
+    ]
+
+
+class lmt_fret_pos(ctypes.Structure):
+    _fields_ = [
+        ("string", ctypes.c_uint8),
+        ("fret", ctypes.c_uint8),
+    ]
+
+
+class lmt_guide_dot(ctypes.Structure):
+    _fields_ = [
+        ("position", lmt_fret_pos),
+        ("pitch_class", ctypes.c_uint8),
+        ("opacity", ctypes.c_float),
+    ]
+
+
+class lmt_context_suggestion(ctypes.Structure):
+    _fields_ = [
+        ("score", ctypes.c_int32),
+        ("expanded_set", ctypes.c_uint16),
+        ("pitch_class", ctypes.c_uint8),
+        ("overlap", ctypes.c_uint8),
+        ("outside_count", ctypes.c_uint8),
+        ("in_context", ctypes.c_uint8),
+        ("cluster_free", ctypes.c_uint8),
+        ("reads_as_named_chord", ctypes.c_uint8),
+    ]
+
+
+class lmt_scale_snap_candidates(ctypes.Structure):
+    _fields_ = [
+        ("in_scale", ctypes.c_uint8),
+        ("has_lower", ctypes.c_uint8),
+        ("has_upper", ctypes.c_uint8),
+        ("reserved0", ctypes.c_uint8),
+        ("lower", ctypes.c_uint8),
+        ("upper", ctypes.c_uint8),
+        ("lower_distance", ctypes.c_uint8),
+        ("upper_distance", ctypes.c_uint8),
+    ]
+
+
+class lmt_containing_mode_match(ctypes.Structure):
+    _fields_ = [
+        ("mode", ctypes.c_uint8),
+        ("degree", ctypes.c_uint8),
+        ("reserved0", ctypes.c_uint8),
+        ("reserved1", ctypes.c_uint8),
+    ]
+
+
+class lmt_chord_match(ctypes.Structure):
+    _fields_ = [
+        ("root", ctypes.c_uint8),
+        ("bass", ctypes.c_uint8),
+        ("pattern", ctypes.c_uint8),
+        ("interval_count", ctypes.c_uint8),
+        ("bass_known", ctypes.c_uint8),
+        ("root_is_bass", ctypes.c_uint8),
+        ("bass_degree", ctypes.c_uint8),
+        ("reserved0", ctypes.c_uint8),
+    ]
+
+
+class lmt_hand_profile(ctypes.Structure):
+    _fields_ = [
+        ("finger_count", ctypes.c_uint8),
+        ("comfort_span_steps", ctypes.c_uint8),
+        ("limit_span_steps", ctypes.c_uint8),
+        ("comfort_shift_steps", ctypes.c_uint8),
+        ("limit_shift_steps", ctypes.c_uint8),
+        ("prefers_low_tension", ctypes.c_uint8),
+        ("reserved0", ctypes.c_uint8),
+        ("reserved1", ctypes.c_uint8),
+    ]
+
+
+class lmt_playability_difficulty_summary(ctypes.Structure):
+    _fields_ = [
+        ("accepted", ctypes.c_uint8),
+        ("blocker_count", ctypes.c_uint8),
+        ("warning_count", ctypes.c_uint8),
+        ("reason_count", ctypes.c_uint8),
+        ("bottleneck_cost", ctypes.c_uint16),
+        ("cumulative_cost", ctypes.c_uint16),
+        ("span_steps", ctypes.c_uint8),
+        ("shift_steps", ctypes.c_uint8),
+        ("load_event_count", ctypes.c_uint8),
+        ("peak_recent_span_steps", ctypes.c_uint8),
+        ("peak_recent_shift_steps", ctypes.c_uint8),
+        ("reserved0", ctypes.c_uint8),
+        ("comfort_span_margin", ctypes.c_int16),
+        ("limit_span_margin", ctypes.c_int16),
+        ("comfort_shift_margin", ctypes.c_int16),
+        ("limit_shift_margin", ctypes.c_int16),
+    ]
+
+
+class lmt_keyboard_phrase_event(ctypes.Structure):
+    _fields_ = [
+        ("note_count", ctypes.c_uint8),
+        ("hand", ctypes.c_uint8),
+        ("reserved0", ctypes.c_uint8),
+        ("reserved1", ctypes.c_uint8),
+        ("notes", ctypes.c_uint8 * 5),
+    ]
+
+
+class lmt_fret_phrase_event(ctypes.Structure):
+    _fields_ = [
+        ("fret_count", ctypes.c_uint8),
+        ("reserved0", ctypes.c_uint8),
+        ("reserved1", ctypes.c_uint8),
+        ("reserved2", ctypes.c_uint8),
+        ("frets", ctypes.c_int8 * 16),
+    ]
+
+
+class lmt_keyboard_committed_phrase_memory(ctypes.Structure):
+    _fields_ = [
+        ("event_count", ctypes.c_uint8),
+        ("reserved0", ctypes.c_uint8),
+        ("reserved1", ctypes.c_uint8),
+        ("reserved2", ctypes.c_uint8),
+        ("events", lmt_keyboard_phrase_event * 64),
+    ]
+
+
+class lmt_fret_committed_phrase_memory(ctypes.Structure):
+    _fields_ = [
+        ("event_count", ctypes.c_uint8),
+        ("reserved0", ctypes.c_uint8),
+        ("reserved1", ctypes.c_uint8),
+        ("reserved2", ctypes.c_uint8),
+        ("events", lmt_fret_phrase_event * 64),
+    ]
+
+
+class lmt_playability_phrase_issue(ctypes.Structure):
+    _fields_ = [
+        ("scope", ctypes.c_uint8),
+        ("severity", ctypes.c_uint8),
+        ("family_domain", ctypes.c_uint8),
+        ("family_index", ctypes.c_uint8),
+        ("event_index", ctypes.c_uint16),
+        ("related_event_index", ctypes.c_uint16),
+        ("magnitude", ctypes.c_uint16),
+        ("reserved0", ctypes.c_uint16),
+    ]
+
+
+class lmt_playability_phrase_summary(ctypes.Structure):
+    _fields_ = [
+        ("event_count", ctypes.c_uint16),
+        ("issue_count", ctypes.c_uint16),
+        ("first_blocked_event_index", ctypes.c_uint16),
+        ("first_blocked_transition_from_index", ctypes.c_uint16),
+        ("first_blocked_transition_to_index", ctypes.c_uint16),
+        ("bottleneck_issue_index", ctypes.c_uint16),
+        ("bottleneck_magnitude", ctypes.c_uint16),
+        ("bottleneck_severity", ctypes.c_uint8),
+        ("bottleneck_domain", ctypes.c_uint8),
+        ("bottleneck_family_index", ctypes.c_uint8),
+        ("strain_bucket", ctypes.c_uint8),
+        ("dominant_reason_family", ctypes.c_uint8),
+        ("dominant_warning_family", ctypes.c_uint8),
+        ("reserved0", ctypes.c_uint8),
+        ("severity_counts", ctypes.c_uint16 * 3),
+        ("reason_family_counts", ctypes.c_uint16 * 9),
+        ("warning_family_counts", ctypes.c_uint16 * 12),
+        ("recovery_deficit_start_index", ctypes.c_uint16),
+        ("recovery_deficit_end_index", ctypes.c_uint16),
+        ("longest_recovery_deficit_run", ctypes.c_uint16),
+    ]
+
+
+class lmt_playability_repair_policy(ctypes.Structure):
+    _fields_ = [
+        ("max_class", ctypes.c_uint8),
+        ("preserve_bass", ctypes.c_uint8),
+        ("preserve_top_voice", ctypes.c_uint8),
+        ("prefer_inner_changes", ctypes.c_uint8),
+        ("allow_hand_reassignment", ctypes.c_uint8),
+        ("reserved0", ctypes.c_uint8),
+        ("reserved1", ctypes.c_uint8),
+        ("reserved2", ctypes.c_uint8),
+    ]
+
+
+class lmt_ranked_keyboard_phrase_repair(ctypes.Structure):
+    _fields_ = [
+        ("repair_class", ctypes.c_uint8),
+        ("changed_from_index", ctypes.c_uint8),
+        ("changed_to_index", ctypes.c_uint8),
+        ("changed_from_value", ctypes.c_uint8),
+        ("changed_to_value", ctypes.c_uint8),
+        ("crossed_musical_change_boundary", ctypes.c_uint8),
+        ("hand", ctypes.c_uint8),
+        ("reserved0", ctypes.c_uint8),
+        ("target_event_index", ctypes.c_uint16),
+        ("reserved1", ctypes.c_uint16),
+        ("preserved_mask", ctypes.c_uint32),
+        ("change_mask", ctypes.c_uint32),
+        ("bottleneck_lift", ctypes.c_int16),
+        ("issue_lift", ctypes.c_int16),
+        ("blocked_issue_lift", ctypes.c_int16),
+        ("warning_issue_lift", ctypes.c_int16),
+        ("before_summary", lmt_playability_phrase_summary),
+        ("after_summary", lmt_playability_phrase_summary),
+        ("replacement_event", lmt_keyboard_phrase_event),
+    ]
+
+
+class lmt_ranked_fret_phrase_repair(ctypes.Structure):
+    _fields_ = [
+        ("repair_class", ctypes.c_uint8),
+        ("changed_from_index", ctypes.c_uint8),
+        ("changed_to_index", ctypes.c_uint8),
+        ("changed_from_value", ctypes.c_int8),
+        ("changed_to_value", ctypes.c_int8),
+        ("crossed_musical_change_boundary", ctypes.c_uint8),
+        ("technique", ctypes.c_uint8),
+        ("reserved0", ctypes.c_uint8),
+        ("target_event_index", ctypes.c_uint16),
+        ("reserved1", ctypes.c_uint16),
+        ("preserved_mask", ctypes.c_uint32),
+        ("change_mask", ctypes.c_uint32),
+        ("bottleneck_lift", ctypes.c_int16),
+        ("issue_lift", ctypes.c_int16),
+        ("blocked_issue_lift", ctypes.c_int16),
+        ("warning_issue_lift", ctypes.c_int16),
+        ("before_summary", lmt_playability_phrase_summary),
+        ("after_summary", lmt_playability_phrase_summary),
+        ("replacement_event", lmt_fret_phrase_event),
+    ]
+
+
+class lmt_temporal_load_state(ctypes.Structure):
+    _fields_ = [
+        ("event_count", ctypes.c_uint8),
+        ("last_anchor_step", ctypes.c_uint8),
+        ("last_span_steps", ctypes.c_uint8),
+        ("last_shift_steps", ctypes.c_uint8),
+        ("peak_span_steps", ctypes.c_uint8),
+        ("peak_shift_steps", ctypes.c_uint8),
+        ("cumulative_span_steps", ctypes.c_uint16),
+        ("cumulative_shift_steps", ctypes.c_uint16),
+    ]
+
+
+class lmt_fret_candidate_location(ctypes.Structure):
+    _fields_ = [
+        ("position", lmt_fret_pos),
+        ("in_window", ctypes.c_uint8),
+        ("shift_steps", ctypes.c_uint8),
+    ]
+
+
+class lmt_fret_play_state(ctypes.Structure):
+    _fields_ = [
+        ("anchor_fret", ctypes.c_uint8),
+        ("window_start", ctypes.c_uint8),
+        ("window_end", ctypes.c_uint8),
+        ("lowest_string", ctypes.c_uint8),
+        ("highest_string", ctypes.c_uint8),
+        ("active_string_count", ctypes.c_uint8),
+        ("fretted_note_count", ctypes.c_uint8),
+        ("open_string_count", ctypes.c_uint8),
+        ("span_steps", ctypes.c_uint8),
+        ("comfort_fit", ctypes.c_uint8),
+        ("limit_fit", ctypes.c_uint8),
+        ("reserved0", ctypes.c_uint8),
+        ("load", lmt_temporal_load_state),
+    ]
+
+
+class lmt_fret_realization_assessment(ctypes.Structure):
+    _fields_ = [
+        ("state", lmt_fret_play_state),
+        ("string_span_steps", ctypes.c_uint8),
+        ("profile", ctypes.c_uint8),
+        ("bottleneck_cost", ctypes.c_uint16),
+        ("cumulative_cost", ctypes.c_uint16),
+        ("blocker_bits", ctypes.c_uint32),
+        ("warning_bits", ctypes.c_uint32),
+        ("reason_bits", ctypes.c_uint32),
+        ("recommended_fingers", ctypes.c_uint8 * 16),
+    ]
+
+
+class lmt_fret_transition_assessment(ctypes.Structure):
+    _fields_ = [
+        ("from_state", lmt_fret_play_state),
+        ("to_state", lmt_fret_play_state),
+        ("anchor_delta_steps", ctypes.c_uint8),
+        ("changed_string_count", ctypes.c_uint8),
+        ("profile", ctypes.c_uint8),
+        ("reserved0", ctypes.c_uint8),
+        ("bottleneck_cost", ctypes.c_uint16),
+        ("cumulative_cost", ctypes.c_uint16),
+        ("blocker_bits", ctypes.c_uint32),
+        ("warning_bits", ctypes.c_uint32),
+        ("reason_bits", ctypes.c_uint32),
+        ("recommended_fingers", ctypes.c_uint8 * 16),
+    ]
+
+
+class lmt_ranked_fret_realization(ctypes.Structure):
+    _fields_ = [
+        ("location", lmt_fret_candidate_location),
+        ("bottleneck_cost", ctypes.c_uint16),
+        ("cumulative_cost", ctypes.c_uint16),
+        ("blocker_bits", ctypes.c_uint32),
+        ("warning_bits", ctypes.c_uint32),
+        ("reason_bits", ctypes.c_uint32),
+        ("recommended_finger", ctypes.c_uint8),
+        ("profile", ctypes.c_uint8),
+        ("reserved0", ctypes.c_uint8),
+        ("reserved1", ctypes.c_uint8),
+    ]
+
+
+class lmt_keybed_key_coord(ctypes.Structure):
+    _fields_ = [
+        ("midi", ctypes.c_uint8),
+        ("is_black", ctypes.c_uint8),
+        ("octave", ctypes.c_uint8),
+        ("degree_in_octave", ctypes.c_uint8),
+        ("x", ctypes.c_float),
+        ("y", ctypes.c_float),
+    ]
+
+
+class lmt_keyboard_play_state(ctypes.Structure):
+    _fields_ = [
+        ("anchor_midi", ctypes.c_uint8),
+        ("low_midi", ctypes.c_uint8),
+        ("high_midi", ctypes.c_uint8),
+        ("active_note_count", ctypes.c_uint8),
+        ("black_key_count", ctypes.c_uint8),
+        ("white_key_count", ctypes.c_uint8),
+        ("span_semitones", ctypes.c_uint8),
+        ("comfort_fit", ctypes.c_uint8),
+        ("limit_fit", ctypes.c_uint8),
+        ("reserved0", ctypes.c_uint8),
+        ("load", lmt_temporal_load_state),
+    ]
+
+
+class lmt_keyboard_realization_assessment(ctypes.Structure):
+    _fields_ = [
+        ("state", lmt_keyboard_play_state),
+        ("hand", ctypes.c_uint8),
+        ("note_count", ctypes.c_uint8),
+        ("outer_black_count", ctypes.c_uint8),
+        ("reserved0", ctypes.c_uint8),
+        ("bottleneck_cost", ctypes.c_uint16),
+        ("cumulative_cost", ctypes.c_uint16),
+        ("blocker_bits", ctypes.c_uint32),
+        ("warning_bits", ctypes.c_uint32),
+        ("reason_bits", ctypes.c_uint32),
+        ("recommended_fingers", ctypes.c_uint8 * 5),
+    ]
+
+
+class lmt_keyboard_transition_assessment(ctypes.Structure):
+    _fields_ = [
+        ("from_state", lmt_keyboard_play_state),
+        ("to_state", lmt_keyboard_play_state),
+        ("hand", ctypes.c_uint8),
+        ("note_count", ctypes.c_uint8),
+        ("anchor_delta_semitones", ctypes.c_uint8),
+        ("reserved0", ctypes.c_uint8),
+        ("bottleneck_cost", ctypes.c_uint16),
+        ("cumulative_cost", ctypes.c_uint16),
+        ("blocker_bits", ctypes.c_uint32),
+        ("warning_bits", ctypes.c_uint32),
+        ("reason_bits", ctypes.c_uint32),
+        ("from_fingers", ctypes.c_uint8 * 5),
+        ("to_fingers", ctypes.c_uint8 * 5),
+    ]
+
+
+class lmt_ranked_keyboard_fingering(ctypes.Structure):
+    _fields_ = [
+        ("hand", ctypes.c_uint8),
+        ("note_count", ctypes.c_uint8),
+        ("reserved0", ctypes.c_uint8),
+        ("reserved1", ctypes.c_uint8),
+        ("bottleneck_cost", ctypes.c_uint16),
+        ("cumulative_cost", ctypes.c_uint16),
+        ("blocker_bits", ctypes.c_uint32),
+        ("warning_bits", ctypes.c_uint32),
+        ("reason_bits", ctypes.c_uint32),
+        ("fingers", ctypes.c_uint8 * 5),
+    ]
+
+
+class lmt_metric_position(ctypes.Structure):
+    _fields_ = [
+        ("beat_in_bar", ctypes.c_uint8),
+        ("beats_per_bar", ctypes.c_uint8),
+        ("subdivision", ctypes.c_uint8),
+        ("reserved", ctypes.c_uint8),
+    ]
+
+
+class lmt_voice(ctypes.Structure):
+    _fields_ = [
+        ("id", ctypes.c_uint8),
+        ("midi", ctypes.c_uint8),
+        ("octave", ctypes.c_int8),
+        ("pitch_class", ctypes.c_uint8),
+        ("sustained", ctypes.c_uint8),
+        ("reserved0", ctypes.c_uint8),
+        ("reserved1", ctypes.c_uint8),
+        ("reserved2", ctypes.c_uint8),
+    ]
+
+
+class lmt_voiced_state(ctypes.Structure):
+    _fields_ = [
+        ("set_value", ctypes.c_uint16),
+        ("voice_count", ctypes.c_uint8),
+        ("tonic", ctypes.c_uint8),
+        ("mode_type", ctypes.c_uint8),
+        ("key_quality", ctypes.c_uint8),
+        ("metric", lmt_metric_position),
+        ("cadence_state", ctypes.c_uint8),
+        ("state_index", ctypes.c_uint8),
+        ("next_voice_id", ctypes.c_uint8),
+        ("reserved", ctypes.c_uint8),
+        ("voices", lmt_voice * 8),
+    ]
+
+
+class lmt_voiced_history(ctypes.Structure):
+    _fields_ = [
+        ("len", ctypes.c_uint8),
+        ("next_voice_id", ctypes.c_uint8),
+        ("reserved0", ctypes.c_uint8),
+        ("reserved1", ctypes.c_uint8),
+        ("states", lmt_voiced_state * 4),
+    ]
+
+
+class lmt_voice_motion(ctypes.Structure):
+    _fields_ = [
+        ("voice_id", ctypes.c_uint8),
+        ("from_midi", ctypes.c_uint8),
+        ("to_midi", ctypes.c_uint8),
+        ("delta", ctypes.c_int8),
+        ("abs_delta", ctypes.c_uint8),
+        ("motion_class", ctypes.c_uint8),
+        ("retained", ctypes.c_uint8),
+        ("reserved", ctypes.c_uint8),
+    ]
+
+
+class lmt_motion_summary(ctypes.Structure):
+    _fields_ = [
+        ("voice_motion_count", ctypes.c_uint8),
+        ("common_tone_count", ctypes.c_uint8),
+        ("step_count", ctypes.c_uint8),
+        ("leap_count", ctypes.c_uint8),
+        ("contrary_count", ctypes.c_uint8),
+        ("similar_count", ctypes.c_uint8),
+        ("parallel_count", ctypes.c_uint8),
+        ("oblique_count", ctypes.c_uint8),
+        ("crossing_count", ctypes.c_uint8),
+        ("overlap_count", ctypes.c_uint8),
+        ("total_motion", ctypes.c_uint16),
+        ("outer_interval_before", ctypes.c_int8),
+        ("outer_interval_after", ctypes.c_int8),
+        ("outer_motion", ctypes.c_uint8),
+        ("previous_cadence_state", ctypes.c_uint8),
+        ("current_cadence_state", ctypes.c_uint8),
+        ("voice_motions", lmt_voice_motion * 8),
+    ]
+
+
+class lmt_motion_evaluation(ctypes.Structure):
+    _fields_ = [
+        ("score", ctypes.c_int32),
+        ("preferred_score", ctypes.c_int16),
+        ("penalty_score", ctypes.c_int16),
+        ("cadence_score", ctypes.c_int16),
+        ("spacing_penalty", ctypes.c_int16),
+        ("leap_penalty", ctypes.c_int16),
+        ("disallowed_count", ctypes.c_uint8),
+        ("disallowed", ctypes.c_uint8),
+    ]
+
+
+class lmt_voice_pair_violation(ctypes.Structure):
+    _fields_ = [
+        ("kind", ctypes.c_uint8),
+        ("lower_voice_id", ctypes.c_uint8),
+        ("upper_voice_id", ctypes.c_uint8),
+        ("previous_interval_semitones", ctypes.c_int8),
+        ("current_interval_semitones", ctypes.c_int8),
+        ("reserved0", ctypes.c_uint8),
+        ("reserved1", ctypes.c_uint8),
+        ("reserved2", ctypes.c_uint8),
+    ]
+
+
+class lmt_motion_independence_summary(ctypes.Structure):
+    _fields_ = [
+        ("collapsed", ctypes.c_uint8),
+        ("direction", ctypes.c_int8),
+        ("moving_voice_count", ctypes.c_uint8),
+        ("stationary_voice_count", ctypes.c_uint8),
+        ("ascending_count", ctypes.c_uint8),
+        ("descending_count", ctypes.c_uint8),
+        ("retained_voice_count", ctypes.c_uint8),
+        ("reserved0", ctypes.c_uint8),
+    ]
+
+
+class lmt_satb_register_violation(ctypes.Structure):
+    _fields_ = [
+        ("voice_id", ctypes.c_uint8),
+        ("satb_voice", ctypes.c_uint8),
+        ("midi", ctypes.c_uint8),
+        ("direction", ctypes.c_int8),
+        ("low", ctypes.c_uint8),
+        ("high", ctypes.c_uint8),
+        ("reserved0", ctypes.c_uint8),
+        ("reserved1", ctypes.c_uint8),
+    ]
+
+
+class lmt_next_step_suggestion(ctypes.Structure):
+    _fields_ = [
+        ("score", ctypes.c_int32),
+        ("reason_mask", ctypes.c_uint32),
+        ("warning_mask", ctypes.c_uint32),
+        ("cadence_effect", ctypes.c_uint8),
+        ("tension_delta", ctypes.c_int8),
+        ("note_count", ctypes.c_uint8),
+        ("reserved0", ctypes.c_uint8),
+        ("reserved1", ctypes.c_uint8),
+        ("set_value", ctypes.c_uint16),
+        ("notes", ctypes.c_uint8 * 8),
+        ("motion", lmt_motion_summary),
+        ("evaluation", lmt_motion_evaluation),
+    ]
+
+
+class lmt_ranked_keyboard_context_suggestion(ctypes.Structure):
+    _fields_ = [
+        ("candidate", lmt_context_suggestion),
+        ("transition", lmt_keyboard_transition_assessment),
+        ("realized_note", ctypes.c_uint8),
+        ("candidate_index", ctypes.c_uint8),
+        ("hand", ctypes.c_uint8),
+        ("policy", ctypes.c_uint8),
+        ("accepted", ctypes.c_uint8),
+        ("reserved0", ctypes.c_uint8),
+    ]
+
+
+class lmt_ranked_keyboard_next_step(ctypes.Structure):
+    _fields_ = [
+        ("candidate", lmt_next_step_suggestion),
+        ("transition", lmt_keyboard_transition_assessment),
+        ("candidate_index", ctypes.c_uint8),
+        ("hand", ctypes.c_uint8),
+        ("policy", ctypes.c_uint8),
+        ("accepted", ctypes.c_uint8),
+    ]
+
+
+class lmt_cadence_destination_score(ctypes.Structure):
+    _fields_ = [
+        ("score", ctypes.c_int32),
+        ("destination", ctypes.c_uint8),
+        ("candidate_count", ctypes.c_uint8),
+        ("warning_count", ctypes.c_uint8),
+        ("current_match", ctypes.c_uint8),
+        ("tension_bias", ctypes.c_int8),
+        ("reserved0", ctypes.c_uint8),
+        ("reserved1", ctypes.c_uint8),
+    ]
+
+
+class lmt_suspension_machine_summary(ctypes.Structure):
+    _fields_ = [
+        ("state", ctypes.c_uint8),
+        ("tracked_voice_id", ctypes.c_uint8),
+        ("held_midi", ctypes.c_uint8),
+        ("expected_resolution_midi", ctypes.c_uint8),
+        ("resolution_direction", ctypes.c_int8),
+        ("obligation_count", ctypes.c_uint8),
+        ("warning_count", ctypes.c_uint8),
+        ("retained_count", ctypes.c_uint8),
+        ("current_tension", ctypes.c_int16),
+        ("previous_tension", ctypes.c_int16),
+        ("candidate_resolution_count", ctypes.c_uint8),
+        ("reserved0", ctypes.c_uint8),
+        ("reserved1", ctypes.c_uint8),
+        ("reserved2", ctypes.c_uint8),
+    ]
+
+
+class lmt_orbifold_triad_node(ctypes.Structure):
+    _fields_ = [
+        ("set_value", ctypes.c_uint16),
+        ("root", ctypes.c_uint8),
+        ("quality", ctypes.c_uint8),
+        ("x", ctypes.c_float),
+        ("y", ctypes.c_float),
+    ]
+
+
+class lmt_orbifold_triad_edge(ctypes.Structure):
+    _fields_ = [
+        ("from_index", ctypes.c_uint8),
+        ("to_index", ctypes.c_uint8),
+        ("reserved0", ctypes.c_uint8),
+        ("reserved1", ctypes.c_uint8),
+    ]
+
+
+class lmt_set_class_info(ctypes.Structure):
+    _fields_ = [
+        ("prime", ctypes.c_uint16),
+        ("forte_prime", ctypes.c_uint16),
+        ("cardinality", ctypes.c_uint8),
+        ("forte_ordinal", ctypes.c_uint8),
+        ("forte_is_z", ctypes.c_uint8),
+        ("transposition_count", ctypes.c_uint8),
+        ("cluster_free", ctypes.c_uint8),
+        ("symmetric", ctypes.c_uint8),
+        ("limited_transposition", ctypes.c_uint8),
+        ("reserved0", ctypes.c_uint8),
+    ]
+
+
+class lmt_render_cache_stats(ctypes.Structure):
+    _fields_ = [
+        ("hits", ctypes.c_uint64),
+        ("misses", ctypes.c_uint64),
+        ("evictions", ctypes.c_uint64),
+        ("insertions", ctypes.c_uint64),
+        ("bytes", ctypes.c_uint64),
+        ("budget_bytes", ctypes.c_uint64),
+        ("entries", ctypes.c_uint32),
+        ("reserved0", ctypes.c_uint32),
+    ]
+
+
+class lmt_pack_stats(ctypes.Structure):
+    _fields_ = [
+        ("decode_ns", ctypes.c_uint64),
+        ("resident_bytes", ctypes.c_uint64),
+        ("ready", ctypes.c_uint32),
+        ("mapped", ctypes.c_uint32),
+    ]
+
+
+class lmt_dirty_rect(ctypes.Structure):
+    _fields_ = [
+        ("x", ctypes.c_uint32),
+        ("y", ctypes.c_uint32),
+        ("width", ctypes.c_uint32),
+        ("height", ctypes.c_uint32),
+    ]
+
+
+lmt_write_fn = ctypes.CFUNCTYPE(ctypes.c_uint32, ctypes.c_void_p, ctypes.POINTER(ctypes.c_char), ctypes.c_uint32)
+
+
+lmt_rows_fn = ctypes.CFUNCTYPE(ctypes.c_uint32, ctypes.c_void_p, ctypes.c_uint32, ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32)
+
+
+SIGNATURES = {
+    "lmt_pcs_from_list": (ctypes.c_uint16, [ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint8]),
+    "lmt_pcs_to_list": (ctypes.c_uint8, [ctypes.c_uint16, ctypes.POINTER(ctypes.c_uint8)]),
+    "lmt_pcs_cardinality": (ctypes.c_uint8, [ctypes.c_uint16]),
+    "lmt_pcs_transpose": (ctypes.c_uint16, [ctypes.c_uint16, ctypes.c_uint8]),
+    "lmt_pcs_invert": (ctypes.c_uint16, [ctypes.c_uint16]),
+    "lmt_pcs_complement": (ctypes.c_uint16, [ctypes.c_uint16]),
+    "lmt_pcs_is_subset": (ctypes.c_bool, [ctypes.c_uint16, ctypes.c_uint16]),
+    "lmt_prime_form": (ctypes.c_uint16, [ctypes.c_uint16]),
+    "lmt_forte_prime": (ctypes.c_uint16, [ctypes.c_uint16]),
+    "lmt_is_cluster_free": (ctypes.c_bool, [ctypes.c_uint16]),
+    "lmt_evenness_distance": (ctypes.c_float, [ctypes.c_uint16]),
+    "lmt_pcs_cardinality_batch": (ctypes.c_uint32, [ctypes.POINTER(ctypes.c_uint16), ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint8)]),
+    "lmt_pcs_transpose_batch": (ctypes.c_uint32, [ctypes.POINTER(ctypes.c_uint16), ctypes.c_uint32, ctypes.c_uint8, ctypes.POINTER(ctypes.c_uint16)]),
+    "lmt_pcs_invert_batch": (ctypes.c_uint32, [ctypes.POINTER(ctypes.c_uint16), ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint16)]),
+    "lmt_pcs_complement_batch": (ctypes.c_uint32, [ctypes.POINTER(ctypes.c_uint16), ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint16)]),
+    "lmt_prime_form_batch": (ctypes.c_uint32, [ctypes.POINTER(ctypes.c_uint16), ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint16)]),
+    "lmt_forte_prime_batch": (ctypes.c_uint32, [ctypes.POINTER(ctypes.c_uint16), ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint16)]),
+    "lmt_is_cluster_free_batch": (ctypes.c_uint32, [ctypes.POINTER(ctypes.c_uint16), ctypes.c_uint32, ctypes.POINTER(ctypes.c_bool)]),
+    "lmt_evenness_distance_batch": (ctypes.c_uint32, [ctypes.POINTER(ctypes.c_uint16), ctypes.c_uint32, ctypes.POINTER(ctypes.c_float)]),
+    "lmt_sizeof_set_class_info": (ctypes.c_uint32, []),
+    "lmt_lookup_set_class": (ctypes.c_uint32, [ctypes.c_uint16, ctypes.POINTER(lmt_set_class_info)]),
+    "lmt_lookup_set_class_batch": (ctypes.c_uint32, [ctypes.POINTER(ctypes.c_uint16), ctypes.c_uint32, ctypes.POINTER(lmt_set_class_info)]),
+    "lmt_sizeof_context": (ctypes.c_uint32, []),
+    "lmt_alignof_context": (ctypes.c_uint32, []),
+    "lmt_context_init": (ctypes.c_void_p, [ctypes.c_void_p, ctypes.c_uint32]),
+    "lmt_scale": (ctypes.c_uint16, [ctypes.c_uint8, ctypes.c_uint8]),
+    "lmt_mode": (ctypes.c_uint16, [ctypes.c_uint8, ctypes.c_uint8]),
+    "lmt_mode_type_count": (ctypes.c_uint32, []),
+    "lmt_mode_type_name": (ctypes.c_char_p, [ctypes.c_uint32]),
+    "lmt_scale_degree": (ctypes.c_uint8, [ctypes.c_uint8, ctypes.c_uint8, ctypes.c_uint8]),
+    "lmt_transpose_diatonic": (ctypes.c_uint32, [ctypes.c_uint8, ctypes.c_uint8, ctypes.c_uint8, ctypes.c_int8, ctypes.POINTER(ctypes.c_uint8)]),
+    "lmt_nearest_scale_tones": (ctypes.c_uint32, [ctypes.c_uint8, ctypes.c_uint8, ctypes.c_uint8, ctypes.POINTER(lmt_scale_snap_candidates)]),
+    "lmt_snap_to_scale": (ctypes.c_uint32, [ctypes.c_uint8, ctypes.c_uint8, ctypes.c_uint8, ctypes.c_uint8, ctypes.POINTER(ctypes.c_uint8)]),
+    "lmt_find_containing_modes": (ctypes.c_uint8, [ctypes.c_uint8, ctypes.c_uint8, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint8, ctypes.POINTER(lmt_containing_mode_match), ctypes.c_uint8]),
+    "lmt_spell_note": (ctypes.c_char_p, [ctypes.c_uint8, lmt_key_context]),
+    "lmt_spell_note_parts": (ctypes.c_char_p, [ctypes.c_uint8, ctypes.c_uint8, ctypes.c_uint8]),
+    "lmt_chord": (ctypes.c_uint16, [ctypes.c_uint8, ctypes.c_uint8]),
+    "lmt_chord_pattern_count": (ctypes.c_uint32, []),
+    "lmt_chord_pattern_name": (ctypes.c_char_p, [ctypes.c_uint32]),
+    "lmt_chord_pattern_formula": (ctypes.c_char_p, [ctypes.c_uint32]),
+    "lmt_detect_chord_matches": (ctypes.c_uint16, [ctypes.c_uint16, ctypes.c_uint8, ctypes.c_bool, ctypes.POINTER(lmt_chord_match), ctypes.c_uint8]),
+    "lmt_chord_name": (ctypes.c_char_p, [ctypes.c_uint16]),
+    "lmt_roman_numeral": (ctypes.c_char_p, [ctypes.c_uint16, lmt_key_context]),
+    "lmt_roman_numeral_parts": (ctypes.c_char_p, [ctypes.c_uint16, ctypes.c_uint8, ctypes.c_uint8]),
+    "lmt_fret_to_midi": (ctypes.c_uint8, [ctypes.c_uint8, ctypes.c_uint8, ctypes.POINTER(ctypes.c_uint8)]),
+    "lmt_midi_to_fret_positions": (ctypes.c_uint8, [ctypes.c_uint8, ctypes.POINTER(ctypes.c_uint8), ctypes.POINTER(lmt_fret_pos)]),
+    "lmt_fret_to_midi_n": (ctypes.c_uint8, [ctypes.c_uint32, ctypes.c_uint8, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32]),
+    "lmt_midi_to_fret_positions_n": (ctypes.c_uint32, [ctypes.c_uint8, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32, ctypes.POINTER(lmt_fret_pos), ctypes.c_uint32]),
+    "lmt_generate_voicings_n": (ctypes.c_uint32, [ctypes.c_uint16, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32, ctypes.c_uint8, ctypes.c_uint8, ctypes.POINTER(ctypes.c_int8), ctypes.c_uint32]),
+    "lmt_pitch_class_guide_n": (ctypes.c_uint32, [ctypes.POINTER(lmt_fret_pos), ctypes.c_uint32, ctypes.c_uint8, ctypes.c_uint8, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32, ctypes.POINTER(lmt_guide_dot), ctypes.c_uint32]),
+    "lmt_frets_to_url_n": (ctypes.c_uint32, [ctypes.POINTER(ctypes.c_int8), ctypes.c_uint32, ctypes.POINTER(ctypes.c_char), ctypes.c_uint32]),
+    "lmt_url_to_frets_n": (ctypes.c_uint32, [ctypes.c_char_p, ctypes.POINTER(ctypes.c_int8), ctypes.c_uint32]),
+    "lmt_svg_clock_optc": (ctypes.c_uint32, [ctypes.c_uint16, ctypes.POINTER(ctypes.c_char), ctypes.c_uint32]),
+    "lmt_svg_optic_k_group": (ctypes.c_uint32, [ctypes.c_uint16, ctypes.POINTER(ctypes.c_char), ctypes.c_uint32]),
+    "lmt_svg_evenness_chart": (ctypes.c_uint32, [ctypes.POINTER(ctypes.c_char), ctypes.c_uint32]),
+    "lmt_svg_evenness_field": (ctypes.c_uint32, [ctypes.c_uint16, ctypes.POINTER(ctypes.c_char), ctypes.c_uint32]),
+    "lmt_svg_fret": (ctypes.c_uint32, [ctypes.POINTER(ctypes.c_int8), ctypes.POINTER(ctypes.c_char), ctypes.c_uint32]),
+    "lmt_svg_fret_n": (ctypes.c_uint32, [ctypes.POINTER(ctypes.c_int8), ctypes.c_uint32, ctypes.c_uint32, ctypes.c_uint32, ctypes.POINTER(ctypes.c_char), ctypes.c_uint32]),
+    "lmt_svg_fret_tuned_n": (ctypes.c_uint32, [ctypes.POINTER(ctypes.c_int8), ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32, ctypes.c_uint32, ctypes.c_uint32, ctypes.POINTER(ctypes.c_char), ctypes.c_uint32]),
+    "lmt_svg_chord_staff": (ctypes.c_uint32, [ctypes.c_uint8, ctypes.c_uint8, ctypes.POINTER(ctypes.c_char), ctypes.c_uint32]),
+    "lmt_svg_key_staff": (ctypes.c_uint32, [ctypes.c_uint8, ctypes.c_uint8, ctypes.POINTER(ctypes.c_char), ctypes.c_uint32]),
+    "lmt_svg_keyboard": (ctypes.c_uint32, [ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32, ctypes.c_uint8, ctypes.c_uint8, ctypes.POINTER(ctypes.c_char), ctypes.c_uint32]),
+    "lmt_svg_piano_staff": (ctypes.c_uint32, [ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32, ctypes.c_uint8, ctypes.c_uint8, ctypes.POINTER(ctypes.c_char), ctypes.c_uint32]),
+    "lmt_raster_is_enabled": (ctypes.c_uint32, []),
+    "lmt_raster_demo_rgba": (ctypes.c_uint32, [ctypes.c_uint32, ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32]),
+    "lmt_counterpoint_max_voices": (ctypes.c_uint32, []),
+    "lmt_counterpoint_history_capacity": (ctypes.c_uint32, []),
+    "lmt_counterpoint_rule_profile_count": (ctypes.c_uint32, []),
+    "lmt_counterpoint_rule_profile_name": (ctypes.c_char_p, [ctypes.c_uint32]),
+    "lmt_voice_leading_violation_kind_count": (ctypes.c_uint32, []),
+    "lmt_voice_leading_violation_kind_name": (ctypes.c_char_p, [ctypes.c_uint32]),
+    "lmt_ordered_scale_pattern_count": (ctypes.c_uint32, []),
+    "lmt_ordered_scale_pattern_name": (ctypes.c_char_p, [ctypes.c_uint32]),
+    "lmt_ordered_scale_degree_count": (ctypes.c_uint8, [ctypes.c_uint32]),
+    "lmt_ordered_scale_pitch_class_set": (ctypes.c_uint16, [ctypes.c_uint32, ctypes.c_uint8]),
+    "lmt_barry_harris_parity": (ctypes.c_uint8, [ctypes.c_uint32, ctypes.c_uint8, ctypes.c_uint8, ctypes.POINTER(ctypes.c_uint8)]),
+    "lmt_playability_reason_count": (ctypes.c_uint32, []),
+    "lmt_playability_reason_name": (ctypes.c_char_p, [ctypes.c_uint32]),
+    "lmt_playability_warning_count": (ctypes.c_uint32, []),
+    "lmt_playability_warning_name": (ctypes.c_char_p, [ctypes.c_uint32]),
+    "lmt_playability_policy_count": (ctypes.c_uint32, []),
+    "lmt_playability_policy_name": (ctypes.c_char_p, [ctypes.c_uint32]),
+    "lmt_playability_profile_preset_count": (ctypes.c_uint32, []),
+    "lmt_playability_profile_preset_name": (ctypes.c_char_p, [ctypes.c_uint32]),
+    "lmt_playability_profile_from_preset": (ctypes.c_uint32, [ctypes.c_uint32, ctypes.POINTER(lmt_hand_profile), ctypes.POINTER(lmt_hand_profile)]),
+    "lmt_playability_phrase_issue_scope_count": (ctypes.c_uint32, []),
+    "lmt_playability_phrase_issue_scope_name": (ctypes.c_char_p, [ctypes.c_uint32]),
+    "lmt_playability_phrase_issue_severity_count": (ctypes.c_uint32, []),
+    "lmt_playability_phrase_issue_severity_name": (ctypes.c_char_p, [ctypes.c_uint32]),
+    "lmt_playability_phrase_family_domain_count": (ctypes.c_uint32, []),
+    "lmt_playability_phrase_family_domain_name": (ctypes.c_char_p, [ctypes.c_uint32]),
+    "lmt_playability_phrase_strain_bucket_count": (ctypes.c_uint32, []),
+    "lmt_playability_phrase_strain_bucket_name": (ctypes.c_char_p, [ctypes.c_uint32]),
+    "lmt_playability_repair_class_count": (ctypes.c_uint32, []),
+    "lmt_playability_repair_class_name": (ctypes.c_char_p, [ctypes.c_uint32]),
+    "lmt_fret_playability_blocker_count": (ctypes.c_uint32, []),
+    "lmt_fret_playability_blocker_name": (ctypes.c_char_p, [ctypes.c_uint32]),
+    "lmt_fret_technique_profile_count": (ctypes.c_uint32, []),
+    "lmt_fret_technique_profile_name": (ctypes.c_char_p, [ctypes.c_uint32]),
+    "lmt_keyboard_hand_count": (ctypes.c_uint32, []),
+    "lmt_keyboard_hand_name": (ctypes.c_char_p, [ctypes.c_uint32]),
+    "lmt_keyboard_playability_blocker_count": (ctypes.c_uint32, []),
+    "lmt_keyboard_playability_blocker_name": (ctypes.c_char_p, [ctypes.c_uint32]),
+    "lmt_sizeof_hand_profile": (ctypes.c_uint32, []),
+    "lmt_sizeof_temporal_load_state": (ctypes.c_uint32, []),
+    "lmt_sizeof_fret_candidate_location": (ctypes.c_uint32, []),
+    "lmt_sizeof_fret_play_state": (ctypes.c_uint32, []),
+    "lmt_sizeof_fret_realization_assessment": (ctypes.c_uint32, []),
+    "lmt_sizeof_fret_transition_assessment": (ctypes.c_uint32, []),
+    "lmt_sizeof_ranked_fret_realization": (ctypes.c_uint32, []),
+    "lmt_sizeof_keybed_key_coord": (ctypes.c_uint32, []),
+    "lmt_sizeof_keyboard_play_state": (ctypes.c_uint32, []),
+    "lmt_sizeof_keyboard_realization_assessment": (ctypes.c_uint32, []),
+    "lmt_sizeof_keyboard_transition_assessment": (ctypes.c_uint32, []),
+    "lmt_sizeof_ranked_keyboard_fingering": (ctypes.c_uint32, []),
+    "lmt_sizeof_ranked_keyboard_context_suggestion": (ctypes.c_uint32, []),
+    "lmt_sizeof_ranked_keyboard_next_step": (ctypes.c_uint32, []),
+    "lmt_sizeof_playability_difficulty_summary": (ctypes.c_uint32, []),
+    "lmt_sizeof_keyboard_phrase_event": (ctypes.c_uint32, []),
+    "lmt_sizeof_fret_phrase_event": (ctypes.c_uint32, []),
+    "lmt_sizeof_keyboard_committed_phrase_memory": (ctypes.c_uint32, []),
+    "lmt_sizeof_fret_committed_phrase_memory": (ctypes.c_uint32, []),
+    "lmt_sizeof_playability_phrase_issue": (ctypes.c_uint32, []),
+    "lmt_sizeof_playability_phrase_summary": (ctypes.c_uint32, []),
+    "lmt_sizeof_playability_repair_policy": (ctypes.c_uint32, []),
+    "lmt_sizeof_ranked_keyboard_phrase_repair": (ctypes.c_uint32, []),
+    "lmt_sizeof_ranked_fret_phrase_repair": (ctypes.c_uint32, []),
+    "lmt_default_fret_hand_profile": (ctypes.c_uint32, [ctypes.POINTER(lmt_hand_profile)]),
+    "lmt_default_fret_hand_profile_for_technique": (ctypes.c_uint32, [ctypes.c_uint32, ctypes.POINTER(lmt_hand_profile)]),
+    "lmt_default_keyboard_hand_profile": (ctypes.c_uint32, [ctypes.POINTER(lmt_hand_profile)]),
+    "lmt_default_playability_repair_policy": (ctypes.c_uint32, [ctypes.c_uint32, ctypes.POINTER(lmt_playability_repair_policy)]),
+    "lmt_summarize_playability_phrase_issues": (ctypes.c_uint32, [ctypes.c_uint32, ctypes.POINTER(lmt_playability_phrase_issue), ctypes.c_uint32, ctypes.POINTER(lmt_playability_phrase_summary)]),
+    "lmt_keyboard_committed_phrase_reset": (None, [ctypes.POINTER(lmt_keyboard_committed_phrase_memory)]),
+    "lmt_keyboard_committed_phrase_push": (ctypes.c_uint32, [ctypes.POINTER(lmt_keyboard_committed_phrase_memory), ctypes.POINTER(lmt_keyboard_phrase_event)]),
+    "lmt_keyboard_committed_phrase_len": (ctypes.c_uint32, [ctypes.POINTER(lmt_keyboard_committed_phrase_memory)]),
+    "lmt_fret_committed_phrase_reset": (None, [ctypes.POINTER(lmt_fret_committed_phrase_memory)]),
+    "lmt_fret_committed_phrase_push": (ctypes.c_uint32, [ctypes.POINTER(lmt_fret_committed_phrase_memory), ctypes.POINTER(lmt_fret_phrase_event)]),
+    "lmt_fret_committed_phrase_len": (ctypes.c_uint32, [ctypes.POINTER(lmt_fret_committed_phrase_memory)]),
+    "lmt_audit_fret_phrase_n": (ctypes.c_uint32, [ctypes.POINTER(lmt_fret_phrase_event), ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32, ctypes.c_uint32, ctypes.POINTER(lmt_hand_profile), ctypes.POINTER(lmt_playability_phrase_issue), ctypes.c_uint32, ctypes.POINTER(lmt_playability_phrase_summary)]),
+    "lmt_audit_keyboard_phrase_n": (ctypes.c_uint32, [ctypes.POINTER(lmt_keyboard_phrase_event), ctypes.c_uint32, ctypes.POINTER(lmt_hand_profile), ctypes.POINTER(lmt_playability_phrase_issue), ctypes.c_uint32, ctypes.POINTER(lmt_playability_phrase_summary)]),
+    "lmt_audit_committed_fret_phrase_n": (ctypes.c_uint32, [ctypes.POINTER(lmt_fret_committed_phrase_memory), ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32, ctypes.c_uint32, ctypes.POINTER(lmt_hand_profile), ctypes.POINTER(lmt_playability_phrase_issue), ctypes.c_uint32, ctypes.POINTER(lmt_playability_phrase_summary)]),
+    "lmt_audit_committed_keyboard_phrase_n": (ctypes.c_uint32, [ctypes.POINTER(lmt_keyboard_committed_phrase_memory), ctypes.POINTER(lmt_hand_profile), ctypes.POINTER(lmt_playability_phrase_issue), ctypes.c_uint32, ctypes.POINTER(lmt_playability_phrase_summary)]),
+    "lmt_describe_fret_play_state": (ctypes.c_uint32, [ctypes.POINTER(ctypes.c_int8), ctypes.c_uint32, ctypes.POINTER(lmt_hand_profile), ctypes.POINTER(lmt_temporal_load_state), ctypes.POINTER(lmt_fret_play_state)]),
+    "lmt_windowed_fret_positions_n": (ctypes.c_uint32, [ctypes.c_uint8, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32, ctypes.c_uint8, ctypes.POINTER(lmt_hand_profile), ctypes.POINTER(lmt_fret_candidate_location), ctypes.c_uint32]),
+    "lmt_assess_fret_realization_n": (ctypes.c_uint32, [ctypes.POINTER(ctypes.c_int8), ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32, ctypes.c_uint32, ctypes.POINTER(lmt_hand_profile), ctypes.POINTER(lmt_temporal_load_state), ctypes.POINTER(lmt_fret_realization_assessment)]),
+    "lmt_assess_fret_transition_n": (ctypes.c_uint32, [ctypes.POINTER(ctypes.c_int8), ctypes.POINTER(ctypes.c_int8), ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32, ctypes.c_uint32, ctypes.POINTER(lmt_hand_profile), ctypes.POINTER(lmt_fret_transition_assessment)]),
+    "lmt_summarize_fret_realization_difficulty_n": (ctypes.c_uint32, [ctypes.POINTER(ctypes.c_int8), ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32, ctypes.c_uint32, ctypes.POINTER(lmt_hand_profile), ctypes.POINTER(lmt_temporal_load_state), ctypes.POINTER(lmt_playability_difficulty_summary)]),
+    "lmt_summarize_fret_transition_difficulty_n": (ctypes.c_uint32, [ctypes.POINTER(ctypes.c_int8), ctypes.POINTER(ctypes.c_int8), ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32, ctypes.c_uint32, ctypes.POINTER(lmt_hand_profile), ctypes.POINTER(lmt_playability_difficulty_summary)]),
+    "lmt_rank_fret_realizations_n": (ctypes.c_uint32, [ctypes.c_uint8, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32, ctypes.c_uint8, ctypes.c_uint32, ctypes.POINTER(lmt_hand_profile), ctypes.POINTER(lmt_ranked_fret_realization), ctypes.c_uint32]),
+    "lmt_suggest_easier_fret_realization_n": (ctypes.c_uint32, [ctypes.c_uint8, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32, ctypes.c_uint8, ctypes.c_uint32, ctypes.POINTER(lmt_hand_profile), ctypes.POINTER(lmt_ranked_fret_realization)]),
+    "lmt_keyboard_key_coord": (ctypes.c_uint32, [ctypes.c_uint8, ctypes.POINTER(lmt_keybed_key_coord)]),
+    "lmt_describe_keyboard_play_state": (ctypes.c_uint32, [ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32, ctypes.POINTER(lmt_hand_profile), ctypes.POINTER(lmt_temporal_load_state), ctypes.POINTER(lmt_keyboard_play_state)]),
+    "lmt_assess_keyboard_realization_n": (ctypes.c_uint32, [ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32, ctypes.c_uint32, ctypes.POINTER(lmt_hand_profile), ctypes.POINTER(lmt_temporal_load_state), ctypes.POINTER(lmt_keyboard_realization_assessment)]),
+    "lmt_assess_keyboard_transition_n": (ctypes.c_uint32, [ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32, ctypes.c_uint32, ctypes.POINTER(lmt_hand_profile), ctypes.POINTER(lmt_temporal_load_state), ctypes.POINTER(lmt_keyboard_transition_assessment)]),
+    "lmt_summarize_keyboard_realization_difficulty_n": (ctypes.c_uint32, [ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32, ctypes.c_uint32, ctypes.POINTER(lmt_hand_profile), ctypes.POINTER(lmt_temporal_load_state), ctypes.POINTER(lmt_playability_difficulty_summary)]),
+    "lmt_summarize_keyboard_transition_difficulty_n": (ctypes.c_uint32, [ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32, ctypes.c_uint32, ctypes.POINTER(lmt_hand_profile), ctypes.POINTER(lmt_temporal_load_state), ctypes.POINTER(lmt_playability_difficulty_summary)]),
+    "lmt_rank_keyboard_fingerings_n": (ctypes.c_uint32, [ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32, ctypes.c_uint32, ctypes.POINTER(lmt_hand_profile), ctypes.POINTER(lmt_ranked_keyboard_fingering), ctypes.c_uint32]),
+    "lmt_suggest_easier_keyboard_fingering_n": (ctypes.c_uint32, [ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32, ctypes.c_uint32, ctypes.POINTER(lmt_hand_profile), ctypes.POINTER(lmt_ranked_keyboard_fingering)]),
+    "lmt_rank_keyboard_phrase_repairs_n": (ctypes.c_uint32, [ctypes.POINTER(lmt_keyboard_committed_phrase_memory), ctypes.POINTER(lmt_hand_profile), ctypes.POINTER(lmt_playability_repair_policy), ctypes.POINTER(lmt_ranked_keyboard_phrase_repair), ctypes.c_uint32]),
+    "lmt_rank_fret_phrase_repairs_n": (ctypes.c_uint32, [ctypes.POINTER(lmt_fret_committed_phrase_memory), ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32, ctypes.c_uint32, ctypes.POINTER(lmt_hand_profile), ctypes.POINTER(lmt_playability_repair_policy), ctypes.POINTER(lmt_ranked_fret_phrase_repair), ctypes.c_uint32]),
+    "lmt_filter_next_steps_by_playability": (ctypes.c_uint32, [ctypes.POINTER(lmt_voiced_history), ctypes.c_uint32, ctypes.c_uint32, ctypes.POINTER(lmt_hand_profile), ctypes.c_uint32, ctypes.POINTER(lmt_next_step_suggestion), ctypes.c_uint32]),
+    "lmt_rank_keyboard_next_steps_by_playability": (ctypes.c_uint32, [ctypes.POINTER(lmt_voiced_history), ctypes.c_uint32, ctypes.c_uint32, ctypes.POINTER(lmt_hand_profile), ctypes.c_uint32, ctypes.POINTER(lmt_ranked_keyboard_next_step), ctypes.c_uint32]),
+    "lmt_rank_keyboard_next_steps_by_committed_phrase": (ctypes.c_uint32, [ctypes.POINTER(lmt_keyboard_committed_phrase_memory), ctypes.POINTER(lmt_voiced_history), ctypes.c_uint32, ctypes.POINTER(lmt_hand_profile), ctypes.c_uint32, ctypes.POINTER(lmt_ranked_keyboard_next_step), ctypes.c_uint32]),
+    "lmt_suggest_safer_keyboard_next_step_by_playability": (ctypes.c_uint32, [ctypes.POINTER(lmt_voiced_history), ctypes.c_uint32, ctypes.c_uint32, ctypes.POINTER(lmt_hand_profile), ctypes.c_uint32, ctypes.POINTER(lmt_ranked_keyboard_next_step)]),
+    "lmt_suggest_safer_keyboard_next_step_by_committed_phrase": (ctypes.c_uint32, [ctypes.POINTER(lmt_keyboard_committed_phrase_memory), ctypes.POINTER(lmt_voiced_history), ctypes.c_uint32, ctypes.POINTER(lmt_hand_profile), ctypes.c_uint32, ctypes.POINTER(lmt_ranked_keyboard_next_step)]),
+    "lmt_satb_voice_count": (ctypes.c_uint32, []),
+    "lmt_satb_voice_name": (ctypes.c_char_p, [ctypes.c_uint32]),
+    "lmt_sizeof_voiced_state": (ctypes.c_uint32, []),
+    "lmt_sizeof_voiced_history": (ctypes.c_uint32, []),
+    "lmt_sizeof_next_step_suggestion": (ctypes.c_uint32, []),
+    "lmt_sizeof_voice_pair_violation": (ctypes.c_uint32, []),
+    "lmt_sizeof_motion_independence_summary": (ctypes.c_uint32, []),
+    "lmt_sizeof_satb_register_violation": (ctypes.c_uint32, []),
+    "lmt_cadence_destination_count": (ctypes.c_uint32, []),
+    "lmt_cadence_destination_name": (ctypes.c_char_p, [ctypes.c_uint32]),
+    "lmt_suspension_state_count": (ctypes.c_uint32, []),
+    "lmt_suspension_state_name": (ctypes.c_char_p, [ctypes.c_uint32]),
+    "lmt_sizeof_cadence_destination_score": (ctypes.c_uint32, []),
+    "lmt_sizeof_suspension_machine_summary": (ctypes.c_uint32, []),
+    "lmt_orbifold_triad_node_count": (ctypes.c_uint32, []),
+    "lmt_sizeof_orbifold_triad_node": (ctypes.c_uint32, []),
+    "lmt_orbifold_triad_node_at": (ctypes.c_uint32, [ctypes.c_uint32, ctypes.POINTER(lmt_orbifold_triad_node)]),
+    "lmt_find_orbifold_triad_node": (ctypes.c_uint32, [ctypes.c_uint16]),
+    "lmt_orbifold_triad_edge_count": (ctypes.c_uint32, []),
+    "lmt_sizeof_orbifold_triad_edge": (ctypes.c_uint32, []),
+    "lmt_orbifold_triad_edge_at": (ctypes.c_uint32, [ctypes.c_uint32, ctypes.POINTER(lmt_orbifold_triad_edge)]),
+    "lmt_voiced_history_reset": (None, [ctypes.POINTER(lmt_voiced_history)]),
+    "lmt_build_voiced_state": (ctypes.c_uint32, [ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32, ctypes.c_uint8, ctypes.c_uint8, ctypes.c_uint8, ctypes.c_uint8, ctypes.c_uint8, ctypes.c_uint8, ctypes.POINTER(lmt_voiced_state), ctypes.POINTER(lmt_voiced_state)]),
+    "lmt_voiced_history_push": (ctypes.c_uint32, [ctypes.POINTER(lmt_voiced_history), ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32, ctypes.c_uint8, ctypes.c_uint8, ctypes.c_uint8, ctypes.c_uint8, ctypes.c_uint8, ctypes.c_uint8, ctypes.POINTER(lmt_voiced_state)]),
+    "lmt_classify_motion": (ctypes.c_uint32, [ctypes.POINTER(lmt_voiced_state), ctypes.POINTER(lmt_voiced_state), ctypes.POINTER(lmt_motion_summary)]),
+    "lmt_evaluate_motion_profile": (ctypes.c_uint32, [ctypes.c_int, ctypes.POINTER(lmt_motion_summary), ctypes.POINTER(lmt_motion_evaluation)]),
+    "lmt_check_parallel_perfects": (ctypes.c_uint32, [ctypes.POINTER(lmt_voiced_state), ctypes.POINTER(lmt_voiced_state), ctypes.POINTER(lmt_voice_pair_violation), ctypes.c_uint32]),
+    "lmt_check_voice_crossing": (ctypes.c_uint32, [ctypes.POINTER(lmt_voiced_state), ctypes.POINTER(lmt_voiced_state), ctypes.POINTER(lmt_voice_pair_violation), ctypes.c_uint32]),
+    "lmt_check_spacing": (ctypes.c_uint32, [ctypes.POINTER(lmt_voiced_state), ctypes.POINTER(lmt_voice_pair_violation), ctypes.c_uint32]),
+    "lmt_check_motion_independence": (ctypes.c_uint32, [ctypes.POINTER(lmt_voiced_state), ctypes.POINTER(lmt_voiced_state), ctypes.POINTER(lmt_motion_independence_summary)]),
+    "lmt_satb_range_low": (ctypes.c_uint8, [ctypes.c_uint8]),
+    "lmt_satb_range_high": (ctypes.c_uint8, [ctypes.c_uint8]),
+    "lmt_satb_range_contains": (ctypes.c_bool, [ctypes.c_uint8, ctypes.c_uint8]),
+    "lmt_check_satb_registers": (ctypes.c_uint32, [ctypes.POINTER(lmt_voiced_state), ctypes.POINTER(lmt_satb_register_violation), ctypes.c_uint32]),
+    "lmt_rank_next_steps": (ctypes.c_uint32, [ctypes.POINTER(lmt_voiced_history), ctypes.c_int, ctypes.POINTER(lmt_next_step_suggestion), ctypes.c_uint32]),
+    "lmt_rank_cadence_destinations": (ctypes.c_uint32, [ctypes.POINTER(lmt_voiced_history), ctypes.c_int, ctypes.POINTER(lmt_cadence_destination_score), ctypes.c_uint32]),
+    "lmt_analyze_suspension_machine": (ctypes.c_uint32, [ctypes.POINTER(lmt_voiced_history), ctypes.c_int, ctypes.POINTER(lmt_suspension_machine_summary)]),
+    "lmt_next_step_reason_count": (ctypes.c_uint32, []),
+    "lmt_next_step_reason_name": (ctypes.c_char_p, [ctypes.c_uint32]),
+    "lmt_next_step_warning_count": (ctypes.c_uint32, []),
+    "lmt_next_step_warning_name": (ctypes.c_char_p, [ctypes.c_uint32]),
+    "lmt_mode_spelling_quality": (ctypes.c_uint8, [ctypes.c_uint8, ctypes.c_uint8]),
+    "lmt_rank_context_suggestions": (ctypes.c_uint32, [ctypes.c_uint16, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32, ctypes.c_uint8, ctypes.c_uint8, ctypes.POINTER(lmt_context_suggestion), ctypes.c_uint32]),
+    "lmt_rank_keyboard_context_suggestions_by_playability": (ctypes.c_uint32, [ctypes.c_uint16, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32, ctypes.c_uint8, ctypes.c_uint8, ctypes.c_uint32, ctypes.POINTER(lmt_hand_profile), ctypes.POINTER(lmt_temporal_load_state), ctypes.c_uint32, ctypes.POINTER(lmt_ranked_keyboard_context_suggestion), ctypes.c_uint32]),
+    "lmt_rank_keyboard_context_suggestions_by_committed_phrase": (ctypes.c_uint32, [ctypes.POINTER(lmt_keyboard_committed_phrase_memory), ctypes.c_uint16, ctypes.c_uint8, ctypes.c_uint8, ctypes.POINTER(lmt_hand_profile), ctypes.c_uint32, ctypes.POINTER(lmt_ranked_keyboard_context_suggestion), ctypes.c_uint32]),
+    "lmt_preferred_voicing_n": (ctypes.c_uint32, [ctypes.c_uint16, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32, ctypes.c_uint8, ctypes.c_uint8, ctypes.c_uint8, ctypes.POINTER(ctypes.c_int8), ctypes.c_uint32]),
+    "lmt_generate_voicings_n_ctx": (ctypes.c_uint32, [ctypes.c_void_p, ctypes.c_uint16, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32, ctypes.c_uint8, ctypes.c_uint8, ctypes.POINTER(ctypes.c_int8), ctypes.c_uint32]),
+    "lmt_preferred_voicing_n_ctx": (ctypes.c_uint32, [ctypes.c_void_p, ctypes.c_uint16, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32, ctypes.c_uint8, ctypes.c_uint8, ctypes.c_uint8, ctypes.POINTER(ctypes.c_int8), ctypes.c_uint32]),
+    "lmt_svg_clock_optc_ctx": (ctypes.c_uint32, [ctypes.c_void_p, ctypes.c_uint16, ctypes.POINTER(ctypes.c_char), ctypes.c_uint32]),
+    "lmt_svg_optic_k_group_ctx": (ctypes.c_uint32, [ctypes.c_void_p, ctypes.c_uint16, ctypes.POINTER(ctypes.c_char), ctypes.c_uint32]),
+    "lmt_svg_evenness_chart_ctx": (ctypes.c_uint32, [ctypes.c_void_p, ctypes.POINTER(ctypes.c_char), ctypes.c_uint32]),
+    "lmt_svg_evenness_field_ctx": (ctypes.c_uint32, [ctypes.c_void_p, ctypes.c_uint16, ctypes.POINTER(ctypes.c_char), ctypes.c_uint32]),
+    "lmt_svg_fret_ctx": (ctypes.c_uint32, [ctypes.c_void_p, ctypes.POINTER(ctypes.c_int8), ctypes.POINTER(ctypes.c_char), ctypes.c_uint32]),
+    "lmt_svg_fret_n_ctx": (ctypes.c_uint32, [ctypes.c_void_p, ctypes.POINTER(ctypes.c_int8), ctypes.c_uint32, ctypes.c_uint32, ctypes.c_uint32, ctypes.POINTER(ctypes.c_char), ctypes.c_uint32]),
+    "lmt_svg_fret_tuned_n_ctx": (ctypes.c_uint32, [ctypes.c_void_p, ctypes.POINTER(ctypes.c_int8), ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32, ctypes.c_uint32, ctypes.c_uint32, ctypes.POINTER(ctypes.c_char), ctypes.c_uint32]),
+    "lmt_svg_chord_staff_ctx": (ctypes.c_uint32, [ctypes.c_void_p, ctypes.c_uint8, ctypes.c_uint8, ctypes.POINTER(ctypes.c_char), ctypes.c_uint32]),
+    "lmt_svg_key_staff_ctx": (ctypes.c_uint32, [ctypes.c_void_p, ctypes.c_uint8, ctypes.c_uint8, ctypes.POINTER(ctypes.c_char), ctypes.c_uint32]),
+    "lmt_svg_keyboard_ctx": (ctypes.c_uint32, [ctypes.c_void_p, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32, ctypes.c_uint8, ctypes.c_uint8, ctypes.POINTER(ctypes.c_char), ctypes.c_uint32]),
+    "lmt_svg_piano_staff_ctx": (ctypes.c_uint32, [ctypes.c_void_p, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32, ctypes.c_uint8, ctypes.c_uint8, ctypes.POINTER(ctypes.c_char), ctypes.c_uint32]),
+    "lmt_context_svg_len": (ctypes.c_uint32, [ctypes.c_void_p]),
+    "lmt_context_svg_copy": (ctypes.c_uint32, [ctypes.c_void_p, ctypes.POINTER(ctypes.c_char), ctypes.c_uint32]),
+    "lmt_svg_optic_k_group_stream": (ctypes.c_uint32, [ctypes.c_uint16, lmt_write_fn, ctypes.c_void_p]),
+    "lmt_svg_evenness_chart_stream": (ctypes.c_uint32, [lmt_write_fn, ctypes.c_void_p]),
+    "lmt_svg_evenness_field_stream": (ctypes.c_uint32, [ctypes.c_uint16, lmt_write_fn, ctypes.c_void_p]),
+    "lmt_svg_clock_optc_batch": (ctypes.c_uint32, [ctypes.POINTER(ctypes.c_uint16), ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint32), ctypes.POINTER(ctypes.c_char), ctypes.c_uint32]),
+    "lmt_svg_evenness_field_batch": (ctypes.c_uint32, [ctypes.POINTER(ctypes.c_uint16), ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint32), ctypes.POINTER(ctypes.c_char), ctypes.c_uint32]),
+    "lmt_svg_fret_n_batch": (ctypes.c_uint32, [ctypes.POINTER(ctypes.c_int8), ctypes.c_uint32, ctypes.c_uint32, ctypes.c_uint32, ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint32), ctypes.POINTER(ctypes.c_char), ctypes.c_uint32]),
+    "lmt_bitmap_clock_optc_batch_rgba": (ctypes.c_uint32, [ctypes.POINTER(ctypes.c_uint16), ctypes.c_uint32, ctypes.c_uint32, ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32]),
+    "lmt_bitmap_evenness_field_batch_rgba": (ctypes.c_uint32, [ctypes.POINTER(ctypes.c_uint16), ctypes.c_uint32, ctypes.c_uint32, ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32]),
+    "lmt_bitmap_fret_n_batch_rgba": (ctypes.c_uint32, [ctypes.POINTER(ctypes.c_int8), ctypes.c_uint32, ctypes.c_uint32, ctypes.c_uint32, ctypes.c_uint32, ctypes.c_uint32, ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32]),
+    "lmt_bitmap_clock_optc_rgba": (ctypes.c_uint32, [ctypes.c_uint16, ctypes.c_uint32, ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32]),
+    "lmt_bitmap_optic_k_group_rgba": (ctypes.c_uint32, [ctypes.c_uint16, ctypes.c_uint32, ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32]),
+    "lmt_bitmap_evenness_chart_rgba": (ctypes.c_uint32, [ctypes.c_uint32, ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32]),
+    "lmt_bitmap_evenness_field_rgba": (ctypes.c_uint32, [ctypes.c_uint16, ctypes.c_uint32, ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32]),
+    "lmt_bitmap_fret_rgba": (ctypes.c_uint32, [ctypes.POINTER(ctypes.c_int8), ctypes.c_uint32, ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32]),
+    "lmt_bitmap_fret_n_rgba": (ctypes.c_uint32, [ctypes.POINTER(ctypes.c_int8), ctypes.c_uint32, ctypes.c_uint32, ctypes.c_uint32, ctypes.c_uint32, ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32]),
+    "lmt_bitmap_fret_tuned_n_rgba": (ctypes.c_uint32, [ctypes.POINTER(ctypes.c_int8), ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32, ctypes.c_uint32, ctypes.c_uint32, ctypes.c_uint32, ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32]),
+    "lmt_bitmap_chord_staff_rgba": (ctypes.c_uint32, [ctypes.c_uint8, ctypes.c_uint8, ctypes.c_uint32, ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32]),
+    "lmt_bitmap_key_staff_rgba": (ctypes.c_uint32, [ctypes.c_uint8, ctypes.c_uint8, ctypes.c_uint32, ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32]),
+    "lmt_bitmap_keyboard_rgba": (ctypes.c_uint32, [ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32, ctypes.c_uint8, ctypes.c_uint8, ctypes.c_uint32, ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32]),
+    "lmt_bitmap_piano_staff_rgba": (ctypes.c_uint32, [ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32, ctypes.c_uint8, ctypes.c_uint8, ctypes.c_uint32, ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32]),
+    "lmt_bitmap_svg_stream_rgba": (ctypes.c_uint32, [ctypes.c_char_p, ctypes.c_uint32, ctypes.c_uint32, ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32, lmt_rows_fn, ctypes.c_void_p]),
+    "lmt_bitmap_evenness_field_stream_rgba": (ctypes.c_uint32, [ctypes.c_uint16, ctypes.c_uint32, ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32, lmt_rows_fn, ctypes.c_void_p]),
+    "lmt_bitmap_svg_png": (ctypes.c_uint32, [ctypes.c_char_p, ctypes.c_uint32, ctypes.c_uint32, ctypes.c_uint32, ctypes.c_uint8, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32]),
+    "lmt_bitmap_svg_qoi": (ctypes.c_uint32, [ctypes.c_char_p, ctypes.c_uint32, ctypes.c_uint32, ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32]),
+    "lmt_bitmap_clock_optc_png": (ctypes.c_uint32, [ctypes.c_uint16, ctypes.c_uint32, ctypes.c_uint32, ctypes.c_uint8, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32]),
+    "lmt_bitmap_optic_k_group_png": (ctypes.c_uint32, [ctypes.c_uint16, ctypes.c_uint32, ctypes.c_uint32, ctypes.c_uint8, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32]),
+    "lmt_bitmap_evenness_chart_png": (ctypes.c_uint32, [ctypes.c_uint32, ctypes.c_uint32, ctypes.c_uint8, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32]),
+    "lmt_bitmap_evenness_field_png": (ctypes.c_uint32, [ctypes.c_uint16, ctypes.c_uint32, ctypes.c_uint32, ctypes.c_uint8, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32]),
+    "lmt_bitmap_fret_n_png": (ctypes.c_uint32, [ctypes.POINTER(ctypes.c_int8), ctypes.c_uint32, ctypes.c_uint32, ctypes.c_uint32, ctypes.c_uint32, ctypes.c_uint32, ctypes.c_uint8, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32]),
+    "lmt_bitmap_chord_staff_png": (ctypes.c_uint32, [ctypes.c_uint8, ctypes.c_uint8, ctypes.c_uint32, ctypes.c_uint32, ctypes.c_uint8, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32]),
+    "lmt_bitmap_key_staff_png": (ctypes.c_uint32, [ctypes.c_uint8, ctypes.c_uint8, ctypes.c_uint32, ctypes.c_uint32, ctypes.c_uint8, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32]),
+    "lmt_bitmap_keyboard_png": (ctypes.c_uint32, [ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32, ctypes.c_uint8, ctypes.c_uint8, ctypes.c_uint32, ctypes.c_uint32, ctypes.c_uint8, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32]),
+    "lmt_bitmap_piano_staff_png": (ctypes.c_uint32, [ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32, ctypes.c_uint8, ctypes.c_uint8, ctypes.c_uint32, ctypes.c_uint32, ctypes.c_uint8, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32]),
+    "lmt_render_cache_configure": (None, [ctypes.c_uint32]),
+    "lmt_render_cache_invalidate": (None, []),
+    "lmt_render_cache_get_stats": (ctypes.c_uint32, [ctypes.POINTER(lmt_render_cache_stats)]),
+    "lmt_warmup": (ctypes.c_uint32, [ctypes.c_uint32]),
+    "lmt_pack_get_stats": (ctypes.c_uint32, [ctypes.c_uint32, ctypes.POINTER(lmt_pack_stats)]),
+    "lmt_svg_prerendered_count": (ctypes.c_uint32, [ctypes.c_uint8]),
+    "lmt_svg_prerendered": (ctypes.c_uint32, [ctypes.c_uint8, ctypes.c_uint32, ctypes.POINTER(ctypes.c_char), ctypes.c_uint32]),
+    "lmt_sizeof_bitmap_view": (ctypes.c_uint32, []),
+    "lmt_alignof_bitmap_view": (ctypes.c_uint32, []),
+    "lmt_bitmap_keyboard_view_init": (ctypes.c_void_p, [ctypes.c_void_p, ctypes.c_uint32, ctypes.c_uint8, ctypes.c_uint8, ctypes.c_uint32, ctypes.c_uint32]),
+    "lmt_bitmap_keyboard_view_update": (ctypes.c_uint32, [ctypes.c_void_p, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32, ctypes.POINTER(lmt_dirty_rect), ctypes.c_uint32]),
+    "lmt_bitmap_fret_view_init": (ctypes.c_void_p, [ctypes.c_void_p, ctypes.c_uint32, ctypes.c_uint32, ctypes.c_uint32, ctypes.c_uint32, ctypes.c_uint32, ctypes.c_uint32]),
+    "lmt_bitmap_fret_view_update": (ctypes.c_uint32, [ctypes.c_void_p, ctypes.POINTER(ctypes.c_int8), ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint32, ctypes.POINTER(lmt_dirty_rect), ctypes.c_uint32]),
+}
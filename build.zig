@@ -23,6 +23,22 @@ const full_demo_export_symbols = [_][]const u8{
     "lmt_forte_prime",
     "lmt_is_cluster_free",
     "lmt_evenness_distance",
+    "lmt_pcs_cardinality_batch",
+    "lmt_pcs_transpose_batch",
+    "lmt_pcs_invert_batch",
+    "lmt_pcs_complement_batch",
+    "lmt_prime_form_batch",
+    "lmt_forte_prime_batch",
+    "lmt_is_cluster_free_batch",
+    "lmt_evenness_distance_batch",
+    "lmt_sizeof_context",
+    "lmt_alignof_context",
+    "lmt_context_init",
+    "lmt_context_svg_len",
+    "lmt_context_svg_copy",
+    "lmt_sizeof_set_class_info",
+    "lmt_lookup_set_class",
+    "lmt_lookup_set_class_batch",
     "lmt_scale",
     "lmt_mode",
     "lmt_mode_type_count",
@@ -169,10 +185,12 @@ const full_demo_export_symbols = [_][]const u8{
     "lmt_midi_to_fret_positions",
     "lmt_midi_to_fret_positions_n",
     "lmt_generate_voicings_n",
+    "lmt_generate_voicings_n_ctx",
     "lmt_rank_context_suggestions",
     "lmt_rank_keyboard_context_suggestions_by_playability",
     "lmt_rank_keyboard_context_suggestions_by_committed_phrase",
     "lmt_preferred_voicing_n",
+    "lmt_preferred_voicing_n_ctx",
     "lmt_describe_fret_play_state",
     "lmt_windowed_fret_positions_n",
     "lmt_assess_fret_realization_n",
@@ -197,16 +215,33 @@ const full_demo_export_symbols = [_][]const u8{
     "lmt_frets_to_url_n",
     "lmt_url_to_frets_n",
     "lmt_svg_clock_optc",
+    "lmt_svg_clock_optc_ctx",
     "lmt_svg_optic_k_group",
+    "lmt_svg_optic_k_group_ctx",
+    "lmt_svg_optic_k_group_stream",
     "lmt_svg_evenness_chart",
+    "lmt_svg_evenness_chart_ctx",
+    "lmt_svg_evenness_chart_stream",
     "lmt_svg_evenness_field",
+    "lmt_svg_evenness_field_ctx",
+    "lmt_svg_evenness_field_stream",
+    "lmt_svg_clock_optc_batch",
+    "lmt_svg_evenness_field_batch",
+    "lmt_svg_fret_n_batch",
     "lmt_svg_fret",
+    "lmt_svg_fret_ctx",
     "lmt_svg_fret_n",
+    "lmt_svg_fret_n_ctx",
     "lmt_svg_fret_tuned_n",
+    "lmt_svg_fret_tuned_n_ctx",
     "lmt_svg_chord_staff",
+    "lmt_svg_chord_staff_ctx",
     "lmt_svg_key_staff",
+    "lmt_svg_key_staff_ctx",
     "lmt_svg_keyboard",
+    "lmt_svg_keyboard_ctx",
     "lmt_svg_piano_staff",
+    "lmt_svg_piano_staff_ctx",
     "lmt_raster_is_enabled",
     "lmt_bitmap_clock_optc_rgba",
     "lmt_bitmap_optic_k_group_rgba",
@@ -214,11 +249,40 @@ const full_demo_export_symbols = [_][]const u8{
     "lmt_bitmap_evenness_field_rgba",
     "lmt_bitmap_fret_rgba",
     "lmt_bitmap_fret_n_rgba",
+    "lmt_bitmap_clock_optc_batch_rgba",
+    "lmt_bitmap_evenness_field_batch_rgba",
+    "lmt_bitmap_fret_n_batch_rgba",
     "lmt_bitmap_fret_tuned_n_rgba",
     "lmt_bitmap_chord_staff_rgba",
     "lmt_bitmap_key_staff_rgba",
     "lmt_bitmap_keyboard_rgba",
     "lmt_bitmap_piano_staff_rgba",
+    "lmt_render_cache_configure",
+    "lmt_render_cache_invalidate",
+    "lmt_render_cache_get_stats",
+    "lmt_warmup",
+    "lmt_pack_get_stats",
+    "lmt_svg_prerendered_count",
+    "lmt_svg_prerendered",
+    "lmt_sizeof_bitmap_view",
+    "lmt_alignof_bitmap_view",
+    "lmt_bitmap_keyboard_view_init",
+    "lmt_bitmap_keyboard_view_update",
+    "lmt_bitmap_fret_view_init",
+    "lmt_bitmap_fret_view_update",
+    "lmt_bitmap_svg_stream_rgba",
+    "lmt_bitmap_evenness_field_stream_rgba",
+    "lmt_bitmap_svg_png",
+    "lmt_bitmap_svg_qoi",
+    "lmt_bitmap_clock_optc_png",
+    "lmt_bitmap_optic_k_group_png",
+    "lmt_bitmap_evenness_chart_png",
+    "lmt_bitmap_evenness_field_png",
+    "lmt_bitmap_fret_n_png",
+    "lmt_bitmap_chord_staff_png",
+    "lmt_bitmap_key_staff_png",
+    "lmt_bitmap_keyboard_png",
+    "lmt_bitmap_piano_staff_png",
     "lmt_wasm_scratch_ptr",
     "lmt_wasm_scratch_size",
     "lmt_svg_compat_kind_count",
@@ -227,6 +291,7 @@ const full_demo_export_symbols = [_][]const u8{
     "lmt_svg_compat_image_count",
     "lmt_svg_compat_image_name",
     "lmt_svg_compat_generate",
+    "lmt_svg_compat_generate_ctx",
 };
 
 const gallery_export_symbols = [_][]const u8{
@@ -240,6 +305,22 @@ const gallery_export_symbols = [_][]const u8{
     "lmt_forte_prime",
     "lmt_is_cluster_free",
     "lmt_evenness_distance",
+    "lmt_pcs_cardinality_batch",
+    "lmt_pcs_transpose_batch",
+    "lmt_pcs_invert_batch",
+    "lmt_pcs_complement_batch",
+    "lmt_prime_form_batch",
+    "lmt_forte_prime_batch",
+    "lmt_is_cluster_free_batch",
+    "lmt_evenness_distance_batch",
+    "lmt_sizeof_context",
+    "lmt_alignof_context",
+    "lmt_context_init",
+    "lmt_context_svg_len",
+    "lmt_context_svg_copy",
+    "lmt_sizeof_set_class_info",
+    "lmt_lookup_set_class",
+    "lmt_lookup_set_class_batch",
     "lmt_scale",
     "lmt_mode",
     "lmt_mode_type_count",
@@ -384,10 +465,12 @@ const gallery_export_symbols = [_][]const u8{
     "lmt_fret_to_midi_n",
     "lmt_midi_to_fret_positions_n",
     "lmt_generate_voicings_n",
+    "lmt_generate_voicings_n_ctx",
     "lmt_rank_context_suggestions",
     "lmt_rank_keyboard_context_suggestions_by_playability",
     "lmt_rank_keyboard_context_suggestions_by_committed_phrase",
     "lmt_preferred_voicing_n",
+    "lmt_preferred_voicing_n_ctx",
     "lmt_describe_fret_play_state",
     "lmt_windowed_fret_positions_n",
     "lmt_assess_fret_realization_n",
@@ -412,27 +495,73 @@ const gallery_export_symbols = [_][]const u8{
     "lmt_frets_to_url_n",
     "lmt_url_to_frets_n",
     "lmt_svg_clock_optc",
+    "lmt_svg_clock_optc_ctx",
     "lmt_svg_optic_k_group",
+    "lmt_svg_optic_k_group_ctx",
+    "lmt_svg_optic_k_group_stream",
     "lmt_svg_evenness_chart",
+    "lmt_svg_evenness_chart_ctx",
+    "lmt_svg_evenness_chart_stream",
     "lmt_svg_evenness_field",
+    "lmt_svg_evenness_field_ctx",
+    "lmt_svg_evenness_field_stream",
+    "lmt_svg_clock_optc_batch",
+    "lmt_svg_evenness_field_batch",
+    "lmt_svg_fret_n_batch",
     "lmt_svg_fret",
+    "lmt_svg_fret_ctx",
     "lmt_svg_fret_n",
+    "lmt_svg_fret_n_ctx",
     "lmt_svg_fret_tuned_n",
+    "lmt_svg_fret_tuned_n_ctx",
     "lmt_svg_chord_staff",
+    "lmt_svg_chord_staff_ctx",
     "lmt_svg_key_staff",
+    "lmt_svg_key_staff_ctx",
     "lmt_svg_keyboard",
+    "lmt_svg_keyboard_ctx",
     "lmt_svg_piano_staff",
+    "lmt_svg_piano_staff_ctx",
     "lmt_bitmap_clock_optc_rgba",
     "lmt_bitmap_optic_k_group_rgba",
     "lmt_bitmap_evenness_chart_rgba",
     "lmt_bitmap_evenness_field_rgba",
     "lmt_bitmap_fret_rgba",
     "lmt_bitmap_fret_n_rgba",
+    "lmt_bitmap_clock_optc_batch_rgba",
+    "lmt_bitmap_evenness_field_batch_rgba",
+    "lmt_bitmap_fret_n_batch_rgba",
     "lmt_bitmap_fret_tuned_n_rgba",
     "lmt_bitmap_chord_staff_rgba",
     "lmt_bitmap_key_staff_rgba",
     "lmt_bitmap_keyboard_rgba",
     "lmt_bitmap_piano_staff_rgba",
+    "lmt_render_cache_configure",
+    "lmt_render_cache_invalidate",
+    "lmt_render_cache_get_stats",
+    "lmt_warmup",
+    "lmt_pack_get_stats",
+    "lmt_svg_prerendered_count",
+    "lmt_svg_prerendered",
+    "lmt_sizeof_bitmap_view",
+    "lmt_alignof_bitmap_view",
+    "lmt_bitmap_keyboard_view_init",
+    "lmt_bitmap_keyboard_view_update",
+    "lmt_bitmap_fret_view_init",
+    "lmt_bitmap_fret_view_update",
+    "lmt_bitmap_svg_stream_rgba",
+    "lmt_bitmap_evenness_field_stream_rgba",
+    "lmt_bitmap_svg_png",
+    "lmt_bitmap_svg_qoi",
+    "lmt_bitmap_clock_optc_png",
+    "lmt_bitmap_optic_k_group_png",
+    "lmt_bitmap_evenness_chart_png",
+    "lmt_bitmap_evenness_field_png",
+    "lmt_bitmap_fret_n_png",
+    "lmt_bitmap_chord_staff_png",
+    "lmt_bitmap_key_staff_png",
+    "lmt_bitmap_keyboard_png",
+    "lmt_bitmap_piano_staff_png",
 };
 
 const render_compare_export_symbols = [_][]const u8{
@@ -497,6 +626,50 @@ fn createEmptyRootModule(
     });
 }
 
+const PrerenderedAssets = enum { none, compact, full };
+
+/// Renders the selected prerendered asset domains on the host, packs them
+/// into xz chunks, and returns a Zig root file that embeds the pack.
+fn addPrerenderedAssetPack(b: *std.Build, assets: PrerenderedAssets) std.Build.LazyPath {
+    const render_options = b.addOptions();
+    render_options.addOption(bool, "enable_raster_backend", true);
+    render_options.addOption(bool, "enable_harmonious_generic_fallbacks", true);
+    render_options.addOption(PrerenderedAssets, "prerendered_assets", .none);
+    const render_mod = b.createModule(.{
+        .root_source_file = b.path("src/prerender_main.zig"),
+        .target = b.graph.host,
+        .optimize = .ReleaseFast,
+    });
+    render_mod.addOptions("build_options", render_options);
+    const render_exe = b.addExecutable(.{
+        .name = "prerender-assets",
+        .root_module = render_mod,
+    });
+
+    const render = b.addRunArtifact(render_exe);
+    const raw = render.addOutputFileArg("prerendered_assets.raw");
+    render.addArgs(switch (assets) {
+        .none => unreachable,
+        .compact => &.{ "clock_optc", "key_staff", "evenness_chart" },
+        .full => &.{ "clock_optc", "optic_k_group", "key_staff", "evenness_chart" },
+    });
+
+    const pack_cmd = b.addSystemCommand(&.{"python3"});
+    pack_cmd.addFileArg(b.path("scripts/generate_prerendered_asset_pack.py"));
+    pack_cmd.addArg("--raw");
+    pack_cmd.addFileArg(raw);
+    pack_cmd.addArg("--out");
+    const pack = pack_cmd.addOutputFileArg("prerendered_asset_pack.bin");
+
+    const pack_files = b.addWriteFiles();
+    _ = pack_files.addCopyFile(pack, "prerendered_asset_pack.bin");
+    return pack_files.add("prerendered_asset_pack.zig", "pub const PACK = @embedFile(\"prerendered_asset_pack.bin\");\n");
+}
+
+fn addPrerenderedAssetImport(mod: *std.Build.Module, pack: ?std.Build.LazyPath) void {
+    if (pack) |root_source_file| mod.addAnonymousImport("prerendered_asset_pack", .{ .root_source_file = root_source_file });
+}
+
 fn createAbiRootModule(
     b: *std.Build,
     target: std.Build.ResolvedTarget,
@@ -512,6 +685,19 @@ fn createAbiRootModule(
 pub fn build(b: *std.Build) void {
     const target = b.standardTargetOptions(.{});
     const optimize = b.standardOptimizeOption(.{});
+    const prerendered_assets = b.option(
+        PrerenderedAssets,
+        "prerendered-assets",
+        "Embed prerendered SVGs for the finite diagram domains: none (default), compact (OPTC clocks, key staves, evenness chart), or full (adds optic K groups). Trades binary size for render latency.",
+    ) orelse .none;
+    const prerendered_pack: ?std.Build.LazyPath = if (prerendered_assets == .none) null else addPrerenderedAssetPack(b, prerendered_assets);
+    const pack_sidecar_option = b.option(
+        []const u8,
+        "pack-sidecar-dir",
+        "Map the uncompressed xz pack sidecars written by `zig build pack-sidecars` from this directory at run time instead of decoding the embedded packs in every process. A relative path is resolved against the project root at configure time, so the library finds the sidecars whatever the process working directory. Native targets only; a missing or stale sidecar falls back to decoding.",
+    ) orelse "";
+    // Compiled in as an absolute path; the library never consults its cwd.
+    const pack_sidecar_dir = if (pack_sidecar_option.len == 0) "" else b.pathFromRoot(pack_sidecar_option);
 
     // ── Zig module ──────────────────────────────────────────────
     const lib_mod = b.addModule("libmusictheory", .{
@@ -522,11 +708,15 @@ pub fn build(b: *std.Build) void {
     const native_build_options = b.addOptions();
     native_build_options.addOption(bool, "enable_raster_backend", true);
     native_build_options.addOption(bool, "enable_harmonious_generic_fallbacks", true);
+    native_build_options.addOption(PrerenderedAssets, "prerendered_assets", prerendered_assets);
+    native_build_options.addOption([]const u8, "pack_sidecar_dir", pack_sidecar_dir);
     lib_mod.addOptions("build_options", native_build_options);
+    addPrerenderedAssetImport(lib_mod, prerendered_pack);
 
     // ── Static library (C ABI) ──────────────────────────────────
     const static_mod = createAbiRootModule(b, target, optimize);
     static_mod.addOptions("build_options", native_build_options);
+    addPrerenderedAssetImport(static_mod, prerendered_pack);
 
     const static_lib = b.addLibrary(.{
         .name = "musictheory",
@@ -539,6 +729,7 @@ pub fn build(b: *std.Build) void {
     // ── Shared library (C ABI) ──────────────────────────────────
     const shared_mod = createAbiRootModule(b, target, optimize);
     shared_mod.addOptions("build_options", native_build_options);
+    addPrerenderedAssetImport(shared_mod, prerendered_pack);
 
     const shared_lib = b.addLibrary(.{
         .name = "musictheory",
@@ -620,7 +811,9 @@ pub fn build(b: *std.Build) void {
     const wasm_docs_build_options = b.addOptions();
     wasm_docs_build_options.addOption(bool, "enable_raster_backend", true);
     wasm_docs_build_options.addOption(bool, "enable_harmonious_generic_fallbacks", true);
+    wasm_docs_build_options.addOption(PrerenderedAssets, "prerendered_assets", prerendered_assets);
     wasm_docs_mod.addOptions("build_options", wasm_docs_build_options);
+    addPrerenderedAssetImport(wasm_docs_mod, prerendered_pack);
     wasm_docs_mod.export_symbol_names = &full_demo_export_symbols;
 
     const wasm_docs_exe = b.addExecutable(.{
@@ -692,7 +885,9 @@ pub fn build(b: *std.Build) void {
     const wasm_gallery_build_options = b.addOptions();
     wasm_gallery_build_options.addOption(bool, "enable_raster_backend", true);
     wasm_gallery_build_options.addOption(bool, "enable_harmonious_generic_fallbacks", false);
+    wasm_gallery_build_options.addOption(PrerenderedAssets, "prerendered_assets", prerendered_assets);
     wasm_gallery_mod.addOptions("build_options", wasm_gallery_build_options);
+    addPrerenderedAssetImport(wasm_gallery_mod, prerendered_pack);
     wasm_gallery_mod.export_symbol_names = &gallery_export_symbols;
 
     const wasm_gallery_exe = b.addExecutable(.{
@@ -948,6 +1143,77 @@ pub fn build(b: *std.Build) void {
     c_smoke_step.dependOn(&run_c_compat_smoke_static.step);
     c_smoke_step.dependOn(&run_c_compat_smoke_shared.step);
 
+    // ── Compat catalog bulk renderer ────────────────────────────
+    const compat_catalog_mod = b.createModule(.{
+        .root_source_file = b.path("src/compat_catalog_main.zig"),
+        .target = target,
+        .optimize = optimize,
+    });
+    compat_catalog_mod.addOptions("build_options", native_build_options);
+    addPrerenderedAssetImport(compat_catalog_mod, prerendered_pack);
+
+    const compat_catalog_exe = b.addExecutable(.{
+        .name = "compat-catalog",
+        .root_module = compat_catalog_mod,
+    });
+
+    const run_compat_catalog = b.addRunArtifact(compat_catalog_exe);
+    if (b.args) |args| {
+        run_compat_catalog.addArgs(args);
+    } else {
+        run_compat_catalog.addArg(b.pathJoin(&.{ b.install_path, "compat-catalog" }));
+    }
+
+    const compat_catalog_step = b.step("compat-catalog", "Render the Harmonious compat catalog on all cores (args: [--format svg|rgba] [--archive] [--threads N] [--kinds a,b] OUT)");
+    compat_catalog_step.dependOn(&run_compat_catalog.step);
+
+    // ── Uncompressed pack sidecars ──────────────────────────────
+    const sidecar_build_options = b.addOptions();
+    sidecar_build_options.addOption([]const u8, "pack_sidecar_dir", "");
+    const pack_sidecar_mod = b.createModule(.{
+        .root_source_file = b.path("src/pack_sidecar_main.zig"),
+        .target = b.graph.host,
+        .optimize = .ReleaseFast,
+    });
+    pack_sidecar_mod.addOptions("build_options", sidecar_build_options);
+
+    const pack_sidecar_exe = b.addExecutable(.{
+        .name = "pack-sidecars",
+        .root_module = pack_sidecar_mod,
+    });
+
+    const run_pack_sidecars = b.addRunArtifact(pack_sidecar_exe);
+    if (b.args) |args| {
+        run_pack_sidecars.addArgs(args);
+    } else {
+        run_pack_sidecars.addArg(b.pathJoin(&.{ b.install_path, "share", "libmusictheory", "packs" }));
+    }
+
+    const pack_sidecars_step = b.step("pack-sidecars", "Write the uncompressed .lmtpack sidecars for -Dpack-sidecar-dir (args: [OUT_DIR])");
+    pack_sidecars_step.dependOn(&run_pack_sidecars.step);
+
+    // ── Micro-benchmarks (always ReleaseFast) ───────────────────
+    const bench_mod = b.createModule(.{
+        .root_source_file = b.path("src/bench_main.zig"),
+        .target = target,
+        .optimize = .ReleaseFast,
+    });
+    bench_mod.addOptions("build_options", native_build_options);
+    addPrerenderedAssetImport(bench_mod, prerendered_pack);
+    bench_mod.addIncludePath(b.path("include"));
+
+    const bench_exe = b.addExecutable(.{
+        .name = "bench",
+        .root_module = bench_mod,
+    });
+
+    const run_bench = b.addRunArtifact(bench_exe);
+    run_bench.setCwd(b.path("."));
+    if (b.args) |args| run_bench.addArgs(args);
+
+    const bench_step = b.step("bench", "Time the hot C ABI entry points against bench/baseline.json (args: [--filter S] [--json OUT] [--baseline FILE] [--max-regression PCT])");
+    bench_step.dependOn(&run_bench.step);
+
     // ── Format check ────────────────────────────────────────────
     const fmt = b.addFmt(.{
         .paths = &.{ "build.zig", "src", "include", "examples", "scripts" },
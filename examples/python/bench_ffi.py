@@ -0,0 +1,202 @@
+"""Time libmusictheory calls through ctypes and split FFI overhead from native cost.
+
+Each operation is timed in up to four ways:
+
+  helper  the convenience wrappers in `libmusictheory`, which allocate their
+          results on every call (`Context.svg` for SVG exports, so each
+          document is rendered once)
+  reuse   direct `lmt.lib` calls on preallocated ctypes arrays
+  batch   one `_batch` export call, reported per item (only where one exists)
+  probe   a call with the same argument shapes that the library rejects on
+          entry, so it measures ctypes marshalling with no native work
+
+Native cost per call is estimated as `reuse - probe`, and overhead is each
+pattern's time per call minus that native cost. A batch call pays the probe
+once for all of its items, so its per-item figures are `(batch - probe) / n`
+native and `probe / n` overhead. Pass `--native` with a `zig build bench --
+--json FILE` report to take the single-call native ns/op from the native
+harness instead. For a fair comparison, build the shared library with
+`zig build -Doptimize=ReleaseFast`.
+
+    python3 examples/python/bench_ffi.py [--min-time-ms N] [--json OUT] [--native FILE]
+"""
+
+from __future__ import annotations
+
+import argparse
+import ctypes
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "bindings" / "python"))
+
+import libmusictheory as lmt  # noqa: E402
+
+# Same fixtures as src/bench_main.zig so native and Python numbers line up.
+CHORD_SETS = [0x091, 0x089, 0x049, 0x111, 0x491, 0x891, 0x249, 0x4A9]
+STANDARD_TUNING = bytes([40, 45, 50, 55, 59, 64])
+FRETS = [-1, 3, 2, 0, 1, 0]
+VOICING_CAP = 512
+BATCH_SIZE = 64
+
+
+def time_per_call(fn, min_time_ns: int, repeat: int = 3) -> float:
+    """Return the best ns/call over `repeat` runs of a calibrated loop."""
+    fn()
+    iterations = 1
+    while True:
+        started = time.perf_counter_ns()
+        for _ in range(iterations):
+            fn()
+        elapsed = time.perf_counter_ns() - started
+        if elapsed >= min_time_ns:
+            break
+        iterations *= 2
+    best = elapsed / iterations
+    for _ in range(repeat - 1):
+        started = time.perf_counter_ns()
+        for _ in range(iterations):
+            fn()
+        best = min(best, (time.perf_counter_ns() - started) / iterations)
+    return best
+
+
+def cycler(values):
+    state = [0]
+
+    def next_value():
+        state[0] = (state[0] + 1) % len(values)
+        return values[state[0]]
+
+    return next_value
+
+
+def chord_name_cases():
+    next_set = cycler(CHORD_SETS)
+    chord_name = lmt.lib.lmt_chord_name
+    # lmt_chord_name accepts every set, so the probe is the same one-int,
+    # string-returning shape rejected on entry: the first out-of-range pattern
+    # index, for which lmt_chord_pattern_name returns NULL without a lookup.
+    pattern_name = lmt.lib.lmt_chord_pattern_name
+    missing_pattern = lmt.lib.lmt_chord_pattern_count()
+    return {
+        "helper": lambda: lmt.string("lmt_chord_name", next_set()),
+        "reuse": lambda: chord_name(next_set()),
+        "probe": lambda: pattern_name(missing_pattern),
+    }
+
+
+def voicing_cases():
+    next_set = cycler(CHORD_SETS)
+    generate = lmt.lib.lmt_generate_voicings_n
+    tuning, string_count = lmt.in_view(STANDARD_TUNING)
+    frets = (ctypes.c_int8 * (VOICING_CAP * string_count))()
+    return {
+        "helper": lambda: lmt.generate_voicings_n(next_set(), STANDARD_TUNING, 12, 4, bytearray(VOICING_CAP * string_count)),
+        "reuse": lambda: generate(next_set(), tuning, string_count, 12, 4, frets, VOICING_CAP),
+        "probe": lambda: generate(next_set(), tuning, 0, 12, 4, frets, VOICING_CAP),
+    }
+
+
+def next_step_cases():
+    history = lmt.lmt_voiced_history()
+    lmt.lib.lmt_voiced_history_reset(history)
+    steps = [(60, 64, 67), (60, 65, 69), (59, 65, 67)]
+    for beat, notes in enumerate(steps):
+        cadence = lmt.LMT_CADENCE_DOMINANT if beat + 1 == len(steps) else lmt.LMT_CADENCE_STABLE
+        view, count = lmt.in_view(list(notes))
+        lmt.lib.lmt_voiced_history_push(history, view, count, None, 0, 0, lmt.LMT_MODE_IONIAN, beat, 4, 0, cadence, None)
+    rank = lmt.lib.lmt_rank_next_steps
+    out = lmt.struct_array(lmt.lmt_next_step_suggestion, 16)
+    species = lmt.LMT_COUNTERPOINT_SPECIES
+    return {
+        "helper": lambda: rank(history, species, lmt.struct_array(lmt.lmt_next_step_suggestion, 16), 16),
+        "reuse": lambda: rank(history, species, out, 16),
+        "probe": lambda: rank(history, species, out, 0),
+    }
+
+
+def svg_fret_cases():
+    svg_fret = lmt.lib.lmt_svg_fret_n
+    fret_batch = lmt.lib.lmt_svg_fret_n_batch
+    frets, string_count = lmt.in_view(FRETS, ctypes.c_int8)
+    svg_buf = (ctypes.c_char * 8192)()
+    batch_frets, _ = lmt.in_view(FRETS * BATCH_SIZE, ctypes.c_int8)
+    offsets = (ctypes.c_uint32 * (BATCH_SIZE + 1))()
+    fret_batch(batch_frets, string_count, BATCH_SIZE, 0, 5, offsets, None, 0)
+    arena = (ctypes.c_char * offsets[BATCH_SIZE])()
+    ctx = lmt.Context()
+    # lmt_svg_fret_n has no early exit, so the batch export's NULL-offsets
+    # rejection stands in as the probe for both the single and batch calls.
+    return {
+        "helper": lambda: ctx.svg("lmt_svg_fret_n", frets, string_count, 0, 5),
+        "reuse": lambda: svg_fret(frets, string_count, 0, 5, svg_buf, len(svg_buf)),
+        "batch": lambda: fret_batch(batch_frets, string_count, BATCH_SIZE, 0, 5, offsets, arena, len(arena)),
+        "probe": lambda: fret_batch(batch_frets, string_count, BATCH_SIZE, 0, 5, None, arena, len(arena)),
+    }
+
+
+OPERATIONS = [
+    ("lmt_chord_name", "chord_name", chord_name_cases, 1),
+    ("lmt_generate_voicings_n", "generate_voicings_n", voicing_cases, 1),
+    ("lmt_rank_next_steps", "rank_next_steps", next_step_cases, 1),
+    ("lmt_svg_fret_n", "svg_fret_n", svg_fret_cases, BATCH_SIZE),
+]
+
+
+def load_native(path: str | None) -> dict[str, float]:
+    if path is None:
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return {case["name"]: case["ns_per_op"] for case in json.load(f)["cases"]}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--min-time-ms", type=float, default=100.0, help="minimum time per measurement loop")
+    parser.add_argument("--json", metavar="OUT", help="write the results as JSON")
+    parser.add_argument("--native", metavar="FILE", help="`zig build bench` JSON report to take native ns/op from")
+    args = parser.parse_args()
+
+    min_time_ns = int(args.min_time_ms * 1e6)
+    native_report = load_native(args.native)
+    rows = []
+    print(f"{'export':<26} {'pattern':<7} {'ns/call':>11} {'native ns':>11} {'overhead ns':>12} {'overhead %':>10}")
+    for export, bench_name, make_cases, batch_items in OPERATIONS:
+        timings = {pattern: time_per_call(fn, min_time_ns) for pattern, fn in make_cases().items()}
+        probe_ns = timings.pop("probe")
+        native_ns = native_report.get(bench_name, max(timings["reuse"] - probe_ns, 0.0))
+        for pattern, ns in timings.items():
+            if pattern == "batch":
+                per_item = ns / batch_items
+                pattern_native = max(ns - probe_ns, 0.0) / batch_items
+            else:
+                per_item = ns
+                pattern_native = native_ns
+            overhead = max(per_item - pattern_native, 0.0)
+            share = 100.0 * overhead / per_item if per_item else 0.0
+            rows.append(
+                {
+                    "export": export,
+                    "pattern": pattern,
+                    "ns_per_call": per_item,
+                    "native_ns": pattern_native,
+                    "overhead_ns": overhead,
+                    "probe_ns": probe_ns,
+                    "native_source": "bench" if pattern != "batch" and bench_name in native_report else "probe",
+                }
+            )
+            print(f"{export:<26} {pattern:<7} {per_item:>11.1f} {pattern_native:>11.1f} {overhead:>12.1f} {share:>9.1f}%")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"schema": 1, "min_time_ms": args.min_time_ms, "rows": rows}, f, indent=2)
+            f.write("\n")
+        print(f"wrote {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
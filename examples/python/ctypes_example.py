@@ -1,19 +1,20 @@
-import ctypes
+import sys
 from pathlib import Path
 
-# Adjust this to the built shared library path for your platform.
-LIB_NAME = {
-    "darwin": "libmusictheory.dylib",
-    "linux": "libmusictheory.so",
-}.get(__import__("sys").platform, "libmusictheory.so")
+# Build the shared library first with `zig build`, or point LIBMUSICTHEORY_PATH
+# at an installed copy. The binding package declares every C signature once at
+# import, so calls below pay no per-call argtypes setup.
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "bindings" / "python"))
 
-lib = ctypes.CDLL(str(Path("zig-out/lib") / LIB_NAME))
+import libmusictheory as lmt  # noqa: E402
 
-lib.lmt_pcs_cardinality.argtypes = [ctypes.c_uint16]
-lib.lmt_pcs_cardinality.restype = ctypes.c_uint8
+major = lmt.lib.lmt_chord(lmt.LMT_CHORD_MAJOR, 0)
+print("C major set:", hex(major), "cardinality:", lmt.lib.lmt_pcs_cardinality(major))
 
-lib.lmt_chord.argtypes = [ctypes.c_uint8, ctypes.c_uint8]
-lib.lmt_chord.restype = ctypes.c_uint16
+members = bytearray(12)
+count = lmt.pcs_to_list(major, members)
+print("members:", list(members[:count]), "name:", lmt.string("lmt_chord_name", major))
 
-major = lib.lmt_chord(0, 0)
-print("C major set:", hex(major), "cardinality:", lib.lmt_pcs_cardinality(major))
+svg_buf = bytearray(16384)
+svg_len = lmt.svg_into("lmt_svg_clock_optc", major, out=svg_buf)
+print("clock svg bytes:", svg_len)
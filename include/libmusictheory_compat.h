@@ -7,6 +7,28 @@
 extern "C" {
 #endif
 
+enum {
+    LMT_COMPAT_CATALOG_SVG = 0,
+    LMT_COMPAT_CATALOG_RGBA = 1,
+};
+
+enum {
+    LMT_COMPAT_CATALOG_DIRECTORY = 0,
+    LMT_COMPAT_CATALOG_ARCHIVE = 1,
+};
+
+#define LMT_COMPAT_CATALOG_ALL_KINDS 0xffffffffu
+
+typedef struct lmt_compat_catalog_stats {
+    uint32_t kind_index;
+    uint32_t images;
+    uint32_t failures;
+    uint32_t reserved0;
+    uint64_t bytes;
+    uint64_t render_ns;
+    uint64_t wall_ns;
+} lmt_compat_catalog_stats;
+
 uint32_t lmt_bitmap_proof_scale_numerator(void);
 uint32_t lmt_bitmap_proof_scale_denominator(void);
 uint32_t lmt_bitmap_compat_kind_supported(uint32_t kind_index);
@@ -18,7 +40,17 @@ uint32_t lmt_bitmap_compat_target_height(uint32_t kind_index, uint32_t image_ind
 uint32_t lmt_bitmap_compat_required_rgba_bytes_scaled(uint32_t kind_index, uint32_t image_index, uint32_t scale_numerator, uint32_t scale_denominator);
 uint32_t lmt_bitmap_compat_required_rgba_bytes(uint32_t kind_index, uint32_t image_index);
 uint32_t lmt_bitmap_compat_render_candidate_rgba_scaled(uint32_t kind_index, uint32_t image_index, uint32_t scale_numerator, uint32_t scale_denominator, uint8_t *out_rgba, uint32_t out_rgba_size);
+/* Same bytes as lmt_bitmap_compat_render_candidate_rgba_scaled, rendered as
+ * band_count horizontal bands on thread_count workers (0 meaning one per
+ * core for either). Bands shorter than 16 rows are merged. WebAssembly
+ * builds render in one pass. */
+uint32_t lmt_bitmap_compat_render_candidate_rgba_scaled_tiled(uint32_t kind_index, uint32_t image_index, uint32_t scale_numerator, uint32_t scale_denominator, uint32_t band_count, uint32_t thread_count, uint8_t *out_rgba, uint32_t out_rgba_size);
 uint32_t lmt_bitmap_compat_render_candidate_rgba(uint32_t kind_index, uint32_t image_index, uint8_t *out_rgba, uint32_t out_rgba_size);
+/* Same bytes as the context-free calls above. Generated-SVG kinds use ctx's
+ * SVG scratch instead of a process-wide buffer, so threads holding distinct
+ * contexts may render candidates concurrently. */
+uint32_t lmt_bitmap_compat_render_candidate_rgba_scaled_ctx(lmt_context *ctx, uint32_t kind_index, uint32_t image_index, uint32_t scale_numerator, uint32_t scale_denominator, uint8_t *out_rgba, uint32_t out_rgba_size);
+uint32_t lmt_bitmap_compat_render_candidate_rgba_ctx(lmt_context *ctx, uint32_t kind_index, uint32_t image_index, uint8_t *out_rgba, uint32_t out_rgba_size);
 uint32_t lmt_bitmap_compat_render_reference_svg_rgba_scaled(uint32_t kind_index, uint32_t scale_numerator, uint32_t scale_denominator, const char *svg_ptr, uint32_t svg_len, uint8_t *out_rgba, uint32_t out_rgba_size);
 uint32_t lmt_bitmap_compat_render_reference_svg_rgba(uint32_t kind_index, const char *svg_ptr, uint32_t svg_len, uint8_t *out_rgba, uint32_t out_rgba_size);
 char *lmt_wasm_scratch_ptr(void);
@@ -29,6 +61,13 @@ const char *lmt_svg_compat_kind_directory(uint32_t kind_index);
 uint32_t lmt_svg_compat_image_count(uint32_t kind_index);
 uint32_t lmt_svg_compat_image_name(uint32_t kind_index, uint32_t image_index, char *buf, uint32_t buf_size);
 uint32_t lmt_svg_compat_generate(uint32_t kind_index, uint32_t image_index, char *buf, uint32_t buf_size);
+uint32_t lmt_svg_compat_generate_ctx(lmt_context *ctx, uint32_t kind_index, uint32_t image_index, char *buf, uint32_t buf_size);
+/* Renders every (kind, image) pair selected by kinds_mask (bit i = kind i) on
+ * thread_count workers, 0 meaning one per core, into a directory or one
+ * packed archive at out_path. Output bytes do not depend on the thread count.
+ * stats[k] receives the totals for kind k for k < stats_cap. Returns the
+ * number of images written, or 0 on failure and on WebAssembly builds. */
+uint32_t lmt_compat_catalog_render(const char *out_path, uint32_t format, uint32_t layout, uint32_t thread_count, uint32_t kinds_mask, lmt_compat_catalog_stats *stats, uint32_t stats_cap);
 
 #ifdef __cplusplus
 }
@@ -20,6 +20,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Iterable, List, Sequence, Tuple
 
+from lib.svg_path_template import make_template
+
 
 EXPECTED_FAMILIES: Sequence[str] = ("dntri", "hex", "rhomb", "uptri")
 EXPECTED_TRANS: Sequence[int] = tuple(range(12))
@@ -35,42 +37,10 @@ EXPECTED_CROSS_FAMILY_SHARED_PATH_SLOTS = 323
 
 TAG_RE = re.compile(r"<(/?)([a-zA-Z]+)([^>]*)>")
 ATTR_RE = re.compile(r'([a-zA-Z_:][\w:.-]*)="([^"]*)"')
-NUM_RE = re.compile(r"[+-]?(?:\d+\.\d*|\.\d+|\d+)(?:[eE][+-]?\d+)?")
 
 MARKER_HREF = "\x1d"
 MARKER_STYLE = "\x1e"
 MARKER_D = "\x1f"
-MARKER_NUM = "\x01"
-SCALE = 10**17
-
-ARG_FLAGS = {
-    "M": ["x", "y"],
-    "L": ["x", "y"],
-    "T": ["x", "y"],
-    "H": ["x"],
-    "V": ["y"],
-    "S": ["x", "y", "x", "y"],
-    "Q": ["x", "y", "x", "y"],
-    "C": ["x", "y", "x", "y", "x", "y"],
-    "A": ["n", "n", "n", "n", "n", "x", "y"],
-    "m": ["x", "y"],
-    "l": ["x", "y"],
-    "t": ["x", "y"],
-    "h": ["x"],
-    "v": ["y"],
-    "s": ["x", "y", "x", "y"],
-    "q": ["x", "y", "x", "y"],
-    "c": ["x", "y", "x", "y", "x", "y"],
-    "a": ["n", "n", "n", "n", "n", "x", "y"],
-    "Z": [],
-    "z": [],
-}
-
-
-@dataclass(frozen=True)
-class Token:
-    kind: str
-    value: str
 
 
 @dataclass(frozen=True)
@@ -135,131 +105,6 @@ def parse_regular_scale_stem(stem: str) -> Tuple[int, str, int]:
     return trans, family, rotation
 
 
-def dec_to_i128(text: str) -> int:
-    neg = False
-    if text.startswith("+"):
-        text = text[1:]
-    elif text.startswith("-"):
-        neg = True
-        text = text[1:]
-
-    if "." in text:
-        int_part, frac_part = text.split(".", 1)
-    else:
-        int_part, frac_part = text, ""
-
-    if int_part == "":
-        int_part = "0"
-
-    frac_part = (frac_part + ("0" * 17))[:17]
-    value = int(int_part) * SCALE + int(frac_part)
-    return -value if neg else value
-
-
-def tokenize_path(path_d: str) -> List[Token]:
-    out: List[Token] = []
-    i = 0
-    n = len(path_d)
-    while i < n:
-        ch = path_d[i]
-        if ch.isalpha():
-            out.append(Token("cmd", ch))
-            i += 1
-            continue
-
-        m = NUM_RE.match(path_d, i)
-        if m:
-            out.append(Token("num", m.group(0)))
-            i = m.end()
-            continue
-
-        j = i + 1
-        while j < n:
-            if path_d[j].isalpha() or NUM_RE.match(path_d, j):
-                break
-            j += 1
-        out.append(Token("sep", path_d[i:j]))
-        i = j
-    return out
-
-
-def make_template(path_d: str) -> PathRef:
-    toks = tokenize_path(path_d)
-
-    cmd = None
-    first_pair: List[int] = []
-    for tok in toks:
-        if tok.kind == "cmd":
-            cmd = tok.value
-            continue
-        if tok.kind == "num" and cmd == "M":
-            first_pair.append(dec_to_i128(tok.value))
-            if len(first_pair) == 2:
-                break
-
-    dx = first_pair[0] if len(first_pair) > 0 else 0
-    dy = first_pair[1] if len(first_pair) > 1 else 0
-
-    parts: List[Tuple[str, str | int]] = []
-    bases: List[int] = []
-    flags: List[int] = []
-
-    cmd = None
-    arg_i = 0
-    set_count = 0
-
-    for tok in toks:
-        if tok.kind == "cmd":
-            cmd = tok.value
-            arg_i = 0
-            set_count = 0
-            parts.append(("lit", tok.value))
-            continue
-        if tok.kind == "sep":
-            parts.append(("lit", tok.value))
-            continue
-        if cmd is None:
-            parts.append(("lit", tok.value))
-            continue
-
-        arg_flags = ARG_FLAGS.get(cmd, [])
-        if not arg_flags:
-            parts.append(("lit", tok.value))
-            continue
-
-        if arg_i >= len(arg_flags):
-            set_count += 1
-            arg_i = 0
-            if cmd == "M" and set_count >= 1:
-                cmd = "L"
-                arg_flags = ARG_FLAGS[cmd]
-            elif cmd == "m" and set_count >= 1:
-                cmd = "l"
-                arg_flags = ARG_FLAGS[cmd]
-            else:
-                arg_flags = ARG_FLAGS.get(cmd, [])
-
-        axis_flag = arg_flags[arg_i] if arg_i < len(arg_flags) else "n"
-        v = dec_to_i128(tok.value)
-        out_flag = 0
-        if cmd.isupper():
-            if axis_flag == "x":
-                v -= dx
-                out_flag = 1
-            elif axis_flag == "y":
-                v -= dy
-                out_flag = 2
-
-        bases.append(v)
-        flags.append(out_flag)
-        parts.append(("slot", len(bases) - 1))
-        arg_i += 1
-
-    fmt = "".join(payload if kind == "lit" else MARKER_NUM for kind, payload in parts)
-    key = (fmt, tuple(bases), bytes(flags))
-    return PathRef(template_key=key, offset=(dx, dy))
-
-
 def parse_svg_model(svg_text: str) -> Tuple[str, List[str], List[str], List[PathRef]]:
     pos = 0
     out_parts: List[str] = []
@@ -290,7 +135,7 @@ def parse_svg_model(svg_text: str) -> Tuple[str, List[str], List[str], List[Path
                     style_values.append(value)
                     rebuilt.append(f'{key}="{MARKER_STYLE}"')
                 elif lname == "path" and key == "d":
-                    path_refs.append(make_template(value))
+                    path_refs.append(PathRef(*make_template(value)))
                     rebuilt.append(f'{key}="{MARKER_D}"')
                 else:
                     rebuilt.append(am.group(0))
@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""Check scripts/lib/svg_path_template.py against the code it replaced.
+
+The per-character tokenizer and string-splitting decimal parser that the
+majmin generators and audits used to carry their own copies of are kept
+below, verbatim, as the reference. Every path in a fixed corpus of edge
+cases, a seeded random corpus, and (when present) every `d` attribute under
+--root/majmin must give identical tokens, fixed-point values and templates,
+or raise ValueError in both.
+
+With --bench, also time both implementations on the same paths.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Sequence
+
+from lib import svg_path_template
+
+# ---------------------------------------------------------------------------
+# Reference implementation, as previously copied into
+# generate_harmonious_majmin_compat.py, generate_harmonious_majmin_scene_pack.py
+# and audit_majmin_scales_parametric.py.
+
+SCALE = 10**17
+NUM_RE = re.compile(r"[+-]?(?:\d+\.\d*|\.\d+|\d+)(?:[eE][+-]?\d+)?")
+MARKER_NUM = "\x01"
+ARG_FLAGS = svg_path_template.ARG_FLAGS
+
+
+@dataclass(frozen=True)
+class Token:
+    kind: str
+    value: str
+
+
+def dec_to_i128(text: str) -> int:
+    neg = False
+    if text.startswith("+"):
+        text = text[1:]
+    elif text.startswith("-"):
+        neg = True
+        text = text[1:]
+
+    if "." in text:
+        int_part, frac_part = text.split(".", 1)
+    else:
+        int_part, frac_part = text, ""
+
+    if int_part == "":
+        int_part = "0"
+
+    frac_part = (frac_part + ("0" * 17))[:17]
+    value = int(int_part) * SCALE + int(frac_part)
+    return -value if neg else value
+
+
+def tokenize_path(path_d: str) -> list[Token]:
+    out: list[Token] = []
+    i = 0
+    n = len(path_d)
+    while i < n:
+        ch = path_d[i]
+        if ch.isalpha():
+            out.append(Token("cmd", ch))
+            i += 1
+            continue
+
+        m = NUM_RE.match(path_d, i)
+        if m:
+            out.append(Token("num", m.group(0)))
+            i = m.end()
+            continue
+
+        j = i + 1
+        while j < n:
+            if path_d[j].isalpha() or NUM_RE.match(path_d, j):
+                break
+            j += 1
+        out.append(Token("sep", path_d[i:j]))
+        i = j
+    return out
+
+
+def make_template(path_d: str) -> tuple[tuple[str, tuple[int, ...], bytes], tuple[int, int]]:
+    toks = tokenize_path(path_d)
+
+    cmd = None
+    first_pair: list[int] = []
+    for tok in toks:
+        if tok.kind == "cmd":
+            cmd = tok.value
+            continue
+        if tok.kind == "num" and cmd == "M":
+            first_pair.append(dec_to_i128(tok.value))
+            if len(first_pair) == 2:
+                break
+    dx = first_pair[0] if len(first_pair) > 0 else 0
+    dy = first_pair[1] if len(first_pair) > 1 else 0
+
+    parts: list[tuple[str, str | int]] = []
+    bases: list[int] = []
+    flags: list[int] = []
+
+    cmd = None
+    arg_i = 0
+    set_count = 0
+
+    for tok in toks:
+        if tok.kind == "cmd":
+            cmd = tok.value
+            arg_i = 0
+            set_count = 0
+            parts.append(("lit", tok.value))
+            continue
+
+        if tok.kind == "sep":
+            parts.append(("lit", tok.value))
+            continue
+
+        # Number token.
+        if cmd is None:
+            parts.append(("lit", tok.value))
+            continue
+
+        arg_flags = ARG_FLAGS.get(cmd, [])
+        if not arg_flags:
+            parts.append(("lit", tok.value))
+            continue
+
+        if arg_i >= len(arg_flags):
+            set_count += 1
+            arg_i = 0
+            if cmd == "M" and set_count >= 1:
+                cmd = "L"
+                arg_flags = ARG_FLAGS[cmd]
+            elif cmd == "m" and set_count >= 1:
+                cmd = "l"
+                arg_flags = ARG_FLAGS[cmd]
+            else:
+                arg_flags = ARG_FLAGS.get(cmd, [])
+
+        axis_flag = arg_flags[arg_i] if arg_i < len(arg_flags) else "n"
+        v = dec_to_i128(tok.value)
+        out_flag = 0
+
+        if cmd.isupper():
+            if axis_flag == "x":
+                v -= dx
+                out_flag = 1
+            elif axis_flag == "y":
+                v -= dy
+                out_flag = 2
+
+        bases.append(v)
+        flags.append(out_flag)
+        parts.append(("slot", len(bases) - 1))
+        arg_i += 1
+
+    fmt_parts: list[str] = []
+    for kind, payload in parts:
+        if kind == "lit":
+            fmt_parts.append(payload)  # type: ignore[arg-type]
+        else:
+            fmt_parts.append(MARKER_NUM)
+    fmt = "".join(fmt_parts)
+
+    key = (fmt, tuple(bases), bytes(flags))
+    return key, (dx, dy)
+
+
+# ---------------------------------------------------------------------------
+
+EDGE_CASES = [
+    "",
+    "M10.5,20.25L30,40Z",
+    "M1 2 3 4 5 6",
+    "m1 2 3 4 5 6",
+    "M1,2 h3 v4 H5 V6 c1 2 3 4 5 6 C1 2 3 4 5 6 s1 2 3 4 S1 2 3 4 q1 2 3 4 Q1 2 3 4 t1 2 T3 4",
+    "M1 2A5 5 0 1 0 10 10a5 5 0 1 1 -10 -10z",
+    "L1 2 M3 4",
+    "M1 L2 M3 4",
+    "1 2 M3 4",
+    "Z1 2",
+    "x5 5 M1 2",
+    "M1-2-3.5.5",
+    "M1..2",
+    "M+.5-.5",
+    "M- 1",
+    "M-.,5",
+    "M0.123456789012345678901 -0.99999999999999999999",
+    "M00012.0001000 -000",
+    "M1e5 2",
+    "M1.e5 2",
+    "M.5e-3 2",
+    "M0.12345678901234567e5 2",
+    "M1 2 L0.123456789012345678E+9 1",
+    "Z1e5",
+    "M 1 , 2\n\tL\r\n3 4",
+    "M1 2 ;; L3 4 !",
+]
+
+RANDOM_COMMANDS = "MLHVCSQTAZmlhvcsqtazxe"
+RANDOM_SEPARATORS = [" ", ",", ", ", "\n", "\t", "-", "+", ".", "..", " - "]
+
+
+def random_number(rng: random.Random) -> str:
+    sign = rng.choice(["", "", "-", "+"])
+    whole = "".join(rng.choice("0123456789") for _ in range(rng.randint(0, 4)))
+    frac = "".join(rng.choice("0123456789") for _ in range(rng.choice([0, 1, 3, 8, 16, 17, 18, 22])))
+    if not whole and not frac:
+        whole = "0"
+    text = whole + ("." + frac if frac or rng.random() < 0.1 else "")
+    if rng.random() < 0.02:
+        text += rng.choice("eE") + rng.choice(["", "-", "+"]) + str(rng.randint(0, 9))
+    return sign + text
+
+
+def random_path(rng: random.Random) -> str:
+    out: list[str] = []
+    for _ in range(rng.randint(0, 40)):
+        roll = rng.random()
+        if roll < 0.2:
+            out.append(rng.choice(RANDOM_COMMANDS))
+        elif roll < 0.75:
+            out.append(random_number(rng))
+        else:
+            out.append(rng.choice(RANDOM_SEPARATORS))
+    return "".join(out)
+
+
+def reference_paths(root: Path) -> list[str]:
+    """Every path `d` under root/majmin, in file order, repeats included."""
+    d_re = re.compile(r'<path[^>]*?\sd="([^"]*)"')
+    out: list[str] = []
+    for svg_path in sorted((root / "majmin").glob("*.svg")):
+        out.extend(d_re.findall(svg_path.read_text(encoding="utf-8")))
+    return out
+
+
+def outcome(fn: Callable[[str], Any], arg: str) -> Any:
+    try:
+        result = fn(arg)
+    except ValueError:
+        return ValueError
+    if isinstance(result, list):
+        return [(tok.kind, tok.value) for tok in result]
+    return result
+
+
+def check(paths: Sequence[str]) -> int:
+    mismatches = 0
+    numbers = 0
+    for path_d in paths:
+        checks = [("tokenize_path", tokenize_path, svg_path_template.tokenize_path, path_d)]
+        checks.append(("make_template", make_template, svg_path_template.make_template, path_d))
+        for tok in tokenize_path(path_d):
+            if tok.kind == "num":
+                numbers += 1
+                checks.append(("dec_to_i128", dec_to_i128, svg_path_template.dec_to_i128, tok.value))
+        for name, old, new, arg in checks:
+            expected = outcome(old, arg)
+            got = outcome(new, arg)
+            if got != expected:
+                mismatches += 1
+                if mismatches <= 5:
+                    print(f"[check_svg_path_template] FAIL {name}({arg!r}): expected {expected!r}, got {got!r}", file=sys.stderr)
+    print(f"[check_svg_path_template] paths={len(paths)} numbers={numbers} mismatches={mismatches}")
+    return mismatches
+
+
+def best_of(repeat: int, fn: Callable[[str], Any], paths: Sequence[str]) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        svg_path_template.clear_caches()
+        start = time.perf_counter()
+        for path_d in paths:
+            fn(path_d)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench(paths: Sequence[str], workload: Sequence[str], repeat: int) -> None:
+    """Time each function over distinct `paths`, starting from empty caches,
+    then the new make_template over `workload` as a generator sees it."""
+    parseable = [p for p in paths if outcome(make_template, p) is not ValueError]
+    numbers = [tok.value for p in parseable for tok in tokenize_path(p) if tok.kind == "num"]
+    total_bytes = sum(len(p) for p in parseable)
+    print(f"[check_svg_path_template] bench: {len(parseable)} paths, {total_bytes} bytes, {len(numbers)} numbers, best of {repeat}")
+    cases = [
+        ("tokenize_path", tokenize_path, svg_path_template.tokenize_path, parseable),
+        ("dec_to_i128", dec_to_i128, svg_path_template.dec_to_i128, numbers),
+        ("make_template", make_template, svg_path_template.make_template, parseable),
+    ]
+    for name, old, new, args in cases:
+        old_s = best_of(repeat, old, args)
+        new_s = best_of(repeat, new, args)
+        print(f"  {name:<14} old {old_s * 1e3:9.2f} ms  new {new_s * 1e3:9.2f} ms  x{old_s / new_s:5.1f}")
+    if workload:
+        new_s = best_of(repeat, svg_path_template.make_template, workload)
+        print(f"  make_template over all {len(workload)} majmin paths in file order: new {new_s * 1e3:9.2f} ms")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--root", default="tmp/harmoniousapp.net", help="also check every majmin/*.svg path under this root when present")
+    parser.add_argument("--random-paths", type=int, default=5000, help="number of seeded random paths to check")
+    parser.add_argument("--seed", type=int, default=0x1D)
+    parser.add_argument("--bench", action="store_true", help="time the old and new implementations")
+    parser.add_argument("--repeat", type=int, default=3, help="benchmark repetitions; the best is reported")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    paths = list(EDGE_CASES) + [random_path(rng) for _ in range(args.random_paths)]
+    workload = reference_paths(Path(args.root)) if (Path(args.root) / "majmin").is_dir() else []
+    real_paths = list(dict.fromkeys(workload))
+    if not real_paths:
+        print(f"[check_svg_path_template] {args.root}/majmin not found; checking synthetic paths only")
+
+    if check(paths + real_paths):
+        return 1
+    if args.bench:
+        bench(real_paths or paths, workload, args.repeat)
+    print("[check_svg_path_template] PASS")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -27,6 +27,22 @@ const REQUIRED_EXPORTS_BY_PROFILE = {
     'lmt_forte_prime',
     'lmt_is_cluster_free',
     'lmt_evenness_distance',
+    'lmt_pcs_cardinality_batch',
+    'lmt_pcs_transpose_batch',
+    'lmt_pcs_invert_batch',
+    'lmt_pcs_complement_batch',
+    'lmt_prime_form_batch',
+    'lmt_forte_prime_batch',
+    'lmt_is_cluster_free_batch',
+    'lmt_evenness_distance_batch',
+    'lmt_sizeof_context',
+    'lmt_alignof_context',
+    'lmt_context_init',
+    'lmt_context_svg_len',
+    'lmt_context_svg_copy',
+    'lmt_sizeof_set_class_info',
+    'lmt_lookup_set_class',
+    'lmt_lookup_set_class_batch',
     'lmt_scale',
     'lmt_mode',
     'lmt_mode_type_count',
@@ -173,10 +189,12 @@ const REQUIRED_EXPORTS_BY_PROFILE = {
     'lmt_midi_to_fret_positions',
     'lmt_midi_to_fret_positions_n',
     'lmt_generate_voicings_n',
+    'lmt_generate_voicings_n_ctx',
     'lmt_rank_context_suggestions',
     'lmt_rank_keyboard_context_suggestions_by_playability',
     'lmt_rank_keyboard_context_suggestions_by_committed_phrase',
     'lmt_preferred_voicing_n',
+    'lmt_preferred_voicing_n_ctx',
     'lmt_describe_fret_play_state',
     'lmt_windowed_fret_positions_n',
     'lmt_assess_fret_realization_n',
@@ -201,16 +219,33 @@ const REQUIRED_EXPORTS_BY_PROFILE = {
     'lmt_frets_to_url_n',
     'lmt_url_to_frets_n',
     'lmt_svg_clock_optc',
+    'lmt_svg_clock_optc_ctx',
     'lmt_svg_optic_k_group',
+    'lmt_svg_optic_k_group_ctx',
+    'lmt_svg_optic_k_group_stream',
     'lmt_svg_evenness_chart',
+    'lmt_svg_evenness_chart_ctx',
+    'lmt_svg_evenness_chart_stream',
     'lmt_svg_evenness_field',
+    'lmt_svg_evenness_field_ctx',
+    'lmt_svg_evenness_field_stream',
+    'lmt_svg_clock_optc_batch',
+    'lmt_svg_evenness_field_batch',
+    'lmt_svg_fret_n_batch',
     'lmt_svg_fret',
+    'lmt_svg_fret_ctx',
     'lmt_svg_fret_n',
+    'lmt_svg_fret_n_ctx',
     'lmt_svg_fret_tuned_n',
+    'lmt_svg_fret_tuned_n_ctx',
     'lmt_svg_chord_staff',
+    'lmt_svg_chord_staff_ctx',
     'lmt_svg_key_staff',
+    'lmt_svg_key_staff_ctx',
     'lmt_svg_keyboard',
+    'lmt_svg_keyboard_ctx',
     'lmt_svg_piano_staff',
+    'lmt_svg_piano_staff_ctx',
     'lmt_raster_is_enabled',
     'lmt_bitmap_clock_optc_rgba',
     'lmt_bitmap_optic_k_group_rgba',
@@ -218,11 +253,40 @@ const REQUIRED_EXPORTS_BY_PROFILE = {
     'lmt_bitmap_evenness_field_rgba',
     'lmt_bitmap_fret_rgba',
     'lmt_bitmap_fret_n_rgba',
+    'lmt_bitmap_clock_optc_batch_rgba',
+    'lmt_bitmap_evenness_field_batch_rgba',
+    'lmt_bitmap_fret_n_batch_rgba',
     'lmt_bitmap_fret_tuned_n_rgba',
     'lmt_bitmap_chord_staff_rgba',
     'lmt_bitmap_key_staff_rgba',
     'lmt_bitmap_keyboard_rgba',
     'lmt_bitmap_piano_staff_rgba',
+    'lmt_render_cache_configure',
+    'lmt_render_cache_invalidate',
+    'lmt_render_cache_get_stats',
+    'lmt_warmup',
+    'lmt_pack_get_stats',
+    'lmt_svg_prerendered_count',
+    'lmt_svg_prerendered',
+    'lmt_sizeof_bitmap_view',
+    'lmt_alignof_bitmap_view',
+    'lmt_bitmap_keyboard_view_init',
+    'lmt_bitmap_keyboard_view_update',
+    'lmt_bitmap_fret_view_init',
+    'lmt_bitmap_fret_view_update',
+    'lmt_bitmap_svg_stream_rgba',
+    'lmt_bitmap_evenness_field_stream_rgba',
+    'lmt_bitmap_svg_png',
+    'lmt_bitmap_svg_qoi',
+    'lmt_bitmap_clock_optc_png',
+    'lmt_bitmap_optic_k_group_png',
+    'lmt_bitmap_evenness_chart_png',
+    'lmt_bitmap_evenness_field_png',
+    'lmt_bitmap_fret_n_png',
+    'lmt_bitmap_chord_staff_png',
+    'lmt_bitmap_key_staff_png',
+    'lmt_bitmap_keyboard_png',
+    'lmt_bitmap_piano_staff_png',
     'lmt_wasm_scratch_ptr',
     'lmt_wasm_scratch_size',
     'lmt_svg_compat_kind_count',
@@ -231,6 +295,7 @@ const REQUIRED_EXPORTS_BY_PROFILE = {
     'lmt_svg_compat_image_count',
     'lmt_svg_compat_image_name',
     'lmt_svg_compat_generate',
+    'lmt_svg_compat_generate_ctx',
   ],
   gallery: [
     'memory',
@@ -244,6 +309,22 @@ const REQUIRED_EXPORTS_BY_PROFILE = {
     'lmt_forte_prime',
     'lmt_is_cluster_free',
     'lmt_evenness_distance',
+    'lmt_pcs_cardinality_batch',
+    'lmt_pcs_transpose_batch',
+    'lmt_pcs_invert_batch',
+    'lmt_pcs_complement_batch',
+    'lmt_prime_form_batch',
+    'lmt_forte_prime_batch',
+    'lmt_is_cluster_free_batch',
+    'lmt_evenness_distance_batch',
+    'lmt_sizeof_context',
+    'lmt_alignof_context',
+    'lmt_context_init',
+    'lmt_context_svg_len',
+    'lmt_context_svg_copy',
+    'lmt_sizeof_set_class_info',
+    'lmt_lookup_set_class',
+    'lmt_lookup_set_class_batch',
     'lmt_scale',
     'lmt_mode',
     'lmt_mode_type_count',
@@ -388,10 +469,12 @@ const REQUIRED_EXPORTS_BY_PROFILE = {
     'lmt_fret_to_midi_n',
     'lmt_midi_to_fret_positions_n',
     'lmt_generate_voicings_n',
+    'lmt_generate_voicings_n_ctx',
     'lmt_rank_context_suggestions',
     'lmt_rank_keyboard_context_suggestions_by_playability',
     'lmt_rank_keyboard_context_suggestions_by_committed_phrase',
     'lmt_preferred_voicing_n',
+    'lmt_preferred_voicing_n_ctx',
     'lmt_describe_fret_play_state',
     'lmt_windowed_fret_positions_n',
     'lmt_assess_fret_realization_n',
@@ -416,27 +499,73 @@ const REQUIRED_EXPORTS_BY_PROFILE = {
     'lmt_frets_to_url_n',
     'lmt_url_to_frets_n',
     'lmt_svg_clock_optc',
+    'lmt_svg_clock_optc_ctx',
     'lmt_svg_optic_k_group',
+    'lmt_svg_optic_k_group_ctx',
+    'lmt_svg_optic_k_group_stream',
     'lmt_svg_evenness_chart',
+    'lmt_svg_evenness_chart_ctx',
+    'lmt_svg_evenness_chart_stream',
     'lmt_svg_evenness_field',
+    'lmt_svg_evenness_field_ctx',
+    'lmt_svg_evenness_field_stream',
+    'lmt_svg_clock_optc_batch',
+    'lmt_svg_evenness_field_batch',
+    'lmt_svg_fret_n_batch',
     'lmt_svg_fret',
+    'lmt_svg_fret_ctx',
     'lmt_svg_fret_n',
+    'lmt_svg_fret_n_ctx',
     'lmt_svg_fret_tuned_n',
+    'lmt_svg_fret_tuned_n_ctx',
     'lmt_svg_chord_staff',
+    'lmt_svg_chord_staff_ctx',
     'lmt_svg_key_staff',
+    'lmt_svg_key_staff_ctx',
     'lmt_svg_keyboard',
+    'lmt_svg_keyboard_ctx',
     'lmt_svg_piano_staff',
+    'lmt_svg_piano_staff_ctx',
     'lmt_bitmap_clock_optc_rgba',
     'lmt_bitmap_optic_k_group_rgba',
     'lmt_bitmap_evenness_chart_rgba',
     'lmt_bitmap_evenness_field_rgba',
     'lmt_bitmap_fret_rgba',
     'lmt_bitmap_fret_n_rgba',
+    'lmt_bitmap_clock_optc_batch_rgba',
+    'lmt_bitmap_evenness_field_batch_rgba',
+    'lmt_bitmap_fret_n_batch_rgba',
     'lmt_bitmap_fret_tuned_n_rgba',
     'lmt_bitmap_chord_staff_rgba',
     'lmt_bitmap_key_staff_rgba',
     'lmt_bitmap_keyboard_rgba',
     'lmt_bitmap_piano_staff_rgba',
+    'lmt_render_cache_configure',
+    'lmt_render_cache_invalidate',
+    'lmt_render_cache_get_stats',
+    'lmt_warmup',
+    'lmt_pack_get_stats',
+    'lmt_svg_prerendered_count',
+    'lmt_svg_prerendered',
+    'lmt_sizeof_bitmap_view',
+    'lmt_alignof_bitmap_view',
+    'lmt_bitmap_keyboard_view_init',
+    'lmt_bitmap_keyboard_view_update',
+    'lmt_bitmap_fret_view_init',
+    'lmt_bitmap_fret_view_update',
+    'lmt_bitmap_svg_stream_rgba',
+    'lmt_bitmap_evenness_field_stream_rgba',
+    'lmt_bitmap_svg_png',
+    'lmt_bitmap_svg_qoi',
+    'lmt_bitmap_clock_optc_png',
+    'lmt_bitmap_optic_k_group_png',
+    'lmt_bitmap_evenness_chart_png',
+    'lmt_bitmap_evenness_field_png',
+    'lmt_bitmap_fret_n_png',
+    'lmt_bitmap_chord_staff_png',
+    'lmt_bitmap_key_staff_png',
+    'lmt_bitmap_keyboard_png',
+    'lmt_bitmap_piano_staff_png',
   ],
   scaled_render_parity: [
     'memory',
@@ -7,6 +7,8 @@ import argparse
 import lzma
 from pathlib import Path
 
+from pack_sidecar import write_sidecar
+
 
 LINE_ANCHOR = (
     b'  <line stroke-width="1" stroke="black" style="fill: transparent; stroke: #888; '
@@ -22,6 +24,7 @@ def parse_args() -> argparse.Namespace:
         default="src/generated/harmonious_even_segment_xz.zig",
         help="output Zig module path",
     )
+    parser.add_argument("--sidecar-dir", help="also write the uncompressed .lmtpack sidecar here (see -Dpack-sidecar-dir)")
     return parser.parse_args()
 
 
@@ -105,6 +108,10 @@ def main() -> int:
 
     out_path.parent.mkdir(parents=True, exist_ok=True)
     out_path.write_text("\n".join(out), encoding="utf-8")
+    if args.sidecar_dir:
+        raw_parts = (compat_prefix, index_prefix, common_body, grad_tail, line_tail, index_tail)
+        sidecar = write_sidecar(args.sidecar_dir, "evenness", list(zip(raw_parts, xz_parts.values())))
+        print("wrote", sidecar)
 
     total = sum(len(payload) for payload in xz_parts.values())
     print(
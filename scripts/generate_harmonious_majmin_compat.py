@@ -19,46 +19,17 @@ import re
 import struct
 from dataclasses import dataclass
 
-SCALE = 10**17
+from generator_cache import add_arguments, compress_xz, decode_text, parse_files
+from lib.svg_path_template import make_template
+
 
 TAG_RE = re.compile(r"<(/?)([a-zA-Z]+)([^>]*)>")
 ATTR_RE = re.compile(r'([a-zA-Z_:][\w:.-]*)="([^"]*)"')
-NUM_RE = re.compile(r"[+-]?(?:\d+\.\d*|\.\d+|\d+)(?:[eE][+-]?\d+)?")
 
 # Marker bytes embedded directly in skeleton/template strings.
 MARKER_HREF = "\x1d"
 MARKER_STYLE = "\x1e"
 MARKER_D = "\x1f"
-MARKER_NUM = "\x01"
-
-ARG_FLAGS = {
-    "M": ["x", "y"],
-    "L": ["x", "y"],
-    "T": ["x", "y"],
-    "H": ["x"],
-    "V": ["y"],
-    "S": ["x", "y", "x", "y"],
-    "Q": ["x", "y", "x", "y"],
-    "C": ["x", "y", "x", "y", "x", "y"],
-    "A": ["n", "n", "n", "n", "n", "x", "y"],
-    "m": ["x", "y"],
-    "l": ["x", "y"],
-    "t": ["x", "y"],
-    "h": ["x"],
-    "v": ["y"],
-    "s": ["x", "y", "x", "y"],
-    "q": ["x", "y", "x", "y"],
-    "c": ["x", "y", "x", "y", "x", "y"],
-    "a": ["n", "n", "n", "n", "n", "x", "y"],
-    "Z": [],
-    "z": [],
-}
-
-
-@dataclass(frozen=True)
-class Token:
-    kind: str
-    value: str
 
 
 @dataclass
@@ -69,141 +40,6 @@ class FileRecord:
     d_refs: list[tuple[int, int]]
 
 
-def dec_to_i128(text: str) -> int:
-    neg = False
-    if text.startswith("+"):
-        text = text[1:]
-    elif text.startswith("-"):
-        neg = True
-        text = text[1:]
-
-    if "." in text:
-        int_part, frac_part = text.split(".", 1)
-    else:
-        int_part, frac_part = text, ""
-
-    if int_part == "":
-        int_part = "0"
-
-    frac_part = (frac_part + ("0" * 17))[:17]
-    value = int(int_part) * SCALE + int(frac_part)
-    return -value if neg else value
-
-
-def tokenize_path(path_d: str) -> list[Token]:
-    out: list[Token] = []
-    i = 0
-    n = len(path_d)
-    while i < n:
-        ch = path_d[i]
-        if ch.isalpha():
-            out.append(Token("cmd", ch))
-            i += 1
-            continue
-
-        m = NUM_RE.match(path_d, i)
-        if m:
-            out.append(Token("num", m.group(0)))
-            i = m.end()
-            continue
-
-        j = i + 1
-        while j < n:
-            if path_d[j].isalpha() or NUM_RE.match(path_d, j):
-                break
-            j += 1
-        out.append(Token("sep", path_d[i:j]))
-        i = j
-    return out
-
-
-def make_template(path_d: str) -> tuple[tuple[str, tuple[int, ...], bytes], tuple[int, int]]:
-    toks = tokenize_path(path_d)
-
-    cmd = None
-    first_pair: list[int] = []
-    for tok in toks:
-        if tok.kind == "cmd":
-            cmd = tok.value
-            continue
-        if tok.kind == "num" and cmd == "M":
-            first_pair.append(dec_to_i128(tok.value))
-            if len(first_pair) == 2:
-                break
-    dx = first_pair[0] if len(first_pair) > 0 else 0
-    dy = first_pair[1] if len(first_pair) > 1 else 0
-
-    parts: list[tuple[str, str | int]] = []
-    bases: list[int] = []
-    flags: list[int] = []
-
-    cmd = None
-    arg_i = 0
-    set_count = 0
-
-    for tok in toks:
-        if tok.kind == "cmd":
-            cmd = tok.value
-            arg_i = 0
-            set_count = 0
-            parts.append(("lit", tok.value))
-            continue
-
-        if tok.kind == "sep":
-            parts.append(("lit", tok.value))
-            continue
-
-        # Number token.
-        if cmd is None:
-            parts.append(("lit", tok.value))
-            continue
-
-        arg_flags = ARG_FLAGS.get(cmd, [])
-        if not arg_flags:
-            parts.append(("lit", tok.value))
-            continue
-
-        if arg_i >= len(arg_flags):
-            set_count += 1
-            arg_i = 0
-            if cmd == "M" and set_count >= 1:
-                cmd = "L"
-                arg_flags = ARG_FLAGS[cmd]
-            elif cmd == "m" and set_count >= 1:
-                cmd = "l"
-                arg_flags = ARG_FLAGS[cmd]
-            else:
-                arg_flags = ARG_FLAGS.get(cmd, [])
-
-        axis_flag = arg_flags[arg_i] if arg_i < len(arg_flags) else "n"
-        v = dec_to_i128(tok.value)
-        out_flag = 0
-
-        if cmd.isupper():
-            if axis_flag == "x":
-                v -= dx
-                out_flag = 1
-            elif axis_flag == "y":
-                v -= dy
-                out_flag = 2
-
-        bases.append(v)
-        flags.append(out_flag)
-        parts.append(("slot", len(bases) - 1))
-        arg_i += 1
-
-    fmt_parts: list[str] = []
-    for kind, payload in parts:
-        if kind == "lit":
-            fmt_parts.append(payload)  # type: ignore[arg-type]
-        else:
-            fmt_parts.append(MARKER_NUM)
-    fmt = "".join(fmt_parts)
-
-    key = (fmt, tuple(bases), bytes(flags))
-    return key, (dx, dy)
-
-
 def parse_file(svg_text: str) -> tuple[str, list[str], list[str], list[str]]:
     pos = 0
     out_parts: list[str] = []
@@ -273,6 +109,11 @@ def write_i128(buf: bytearray, value: int):
     buf.extend(int(value).to_bytes(16, byteorder="little", signed=True))
 
 
+def scan_svg(data: bytes) -> tuple[str, list[str], list[str], list[tuple[tuple[str, tuple[int, ...], bytes], tuple[int, int]]]]:
+    skeleton, href_vals, style_vals, d_vals = parse_file(decode_text(data))
+    return skeleton, href_vals, style_vals, [make_template(d) for d in d_vals]
+
+
 def collect_names(majmin_dir: str, prefix: str) -> list[str]:
     out = []
     for path in glob.glob(os.path.join(majmin_dir, "*.svg")):
@@ -282,7 +123,7 @@ def collect_names(majmin_dir: str, prefix: str) -> list[str]:
     return sorted(set(out))
 
 
-def generate_pack(majmin_dir: str) -> tuple[bytes, dict[str, int]]:
+def generate_pack(majmin_dir: str, args: argparse.Namespace) -> tuple[bytes, dict[str, int]]:
     mode_names = collect_names(majmin_dir, "modes,")
     scale_names = collect_names(majmin_dir, "scales,")
 
@@ -302,18 +143,21 @@ def generate_pack(majmin_dir: str) -> tuple[bytes, dict[str, int]]:
     # Deterministic ordering aligned with harmonious_manifest generation.
     ordered = [(True, n) for n in mode_names] + [(False, n) for n in scale_names]
 
-    for _is_mode, name in ordered:
-        path = os.path.join(majmin_dir, name)
-        svg_text = open(path, "r", encoding="utf-8").read()
-        skeleton, href_vals, style_vals, d_vals = parse_file(svg_text)
-
+    # Parsing runs in parallel; interning stays in this order so ids match a
+    # single-process run.
+    scanned_files = parse_files(
+        scan_svg,
+        [(os.path.join(majmin_dir, name), ()) for _is_mode, name in ordered],
+        args,
+        "majmin_compat",
+    )
+    for skeleton, href_vals, style_vals, d_templates in scanned_files:
         sid = intern(skeleton_map, skeletons, skeleton)
         href_ids = [intern(href_map, hrefs, h) for h in href_vals]
         style_ids = [intern(style_map, styles, s) for s in style_vals]
 
         d_refs: list[tuple[int, int]] = []
-        for d in d_vals:
-            tpl_key, off = make_template(d)
+        for tpl_key, off in d_templates:
             tid = intern(template_map, templates, tpl_key)
             oid = intern(offset_map, offsets, off)
             d_refs.append((tid, oid))
@@ -436,14 +280,11 @@ def main():
     parser.add_argument(
         "--out-zig", default="src/generated/harmonious_majmin_compat_xz.zig"
     )
+    add_arguments(parser)
     args = parser.parse_args()
 
-    raw, stats = generate_pack(args.majmin_dir)
-    xz_payload = lzma.compress(
-        raw,
-        format=lzma.FORMAT_XZ,
-        preset=9 | lzma.PRESET_EXTREME,
-    )
+    raw, stats = generate_pack(args.majmin_dir, args)
+    xz_payload = compress_xz(raw, 9 | lzma.PRESET_EXTREME, args, "majmin_compat")
     os.makedirs(os.path.dirname(args.out_zig), exist_ok=True)
     write_zig(args.out_zig, raw, xz_payload, stats)
 
@@ -20,17 +20,18 @@ import struct
 from dataclasses import dataclass
 from typing import Dict, List, Tuple
 
-SCALE = 10**17
+from generator_cache import add_arguments, compress_xz, decode_text, parse_files
+from lib.svg_path_template import make_template
+from pack_sidecar import write_sidecar
+
 
 TAG_RE = re.compile(r"<(/?)([a-zA-Z]+)([^>]*)>")
 ATTR_RE = re.compile(r'([a-zA-Z_:][\w:.-]*)="([^"]*)"')
-NUM_RE = re.compile(r"[+-]?(?:\d+\.\d*|\.\d+|\d+)(?:[eE][+-]?\d+)?")
 LINEAR_PATH_RE = re.compile(r"^[MLHVZmlhvz0-9eE+.,\-\s]+$")
 
 MARKER_HREF = "\x1d"
 MARKER_STYLE = "\x1e"
 MARKER_D = "\x1f"
-MARKER_NUM = "\x01"
 
 FAMILIES = ("dntri", "hex", "rhomb", "uptri")
 MODE_TRANS_ORDER = (-1, 0, 1, 10, 11, 2, 3, 4, 5, 6, 7, 8, 9)
@@ -55,35 +56,6 @@ LEGACY_FILES = (
 FAMILY_ID = {"dntri": 0, "hex": 1, "rhomb": 2, "uptri": 3}
 KIND_ID = {"modes": 0, "scales": 1}
 
-ARG_FLAGS = {
-    "M": ["x", "y"],
-    "L": ["x", "y"],
-    "T": ["x", "y"],
-    "H": ["x"],
-    "V": ["y"],
-    "S": ["x", "y", "x", "y"],
-    "Q": ["x", "y", "x", "y"],
-    "C": ["x", "y", "x", "y", "x", "y"],
-    "A": ["n", "n", "n", "n", "n", "x", "y"],
-    "m": ["x", "y"],
-    "l": ["x", "y"],
-    "t": ["x", "y"],
-    "h": ["x"],
-    "v": ["y"],
-    "s": ["x", "y", "x", "y"],
-    "q": ["x", "y", "x", "y"],
-    "c": ["x", "y", "x", "y", "x", "y"],
-    "a": ["n", "n", "n", "n", "n", "x", "y"],
-    "Z": [],
-    "z": [],
-}
-
-
-@dataclass(frozen=True)
-class Token:
-    kind: str
-    value: str
-
 
 @dataclass
 class ParsedFile:
@@ -94,6 +66,15 @@ class ParsedFile:
     geometry_slot_count: int
 
 
+@dataclass(frozen=True)
+class ScannedFile:
+    skeleton: str
+    href_values: List[str]
+    style_values: List[str]
+    geometry_slot_count: int
+    templates: List[tuple[tuple[str, tuple[int, ...], bytes], tuple[int, int]]]
+
+
 @dataclass
 class ModeGroupRecord:
     family: str
@@ -121,140 +102,6 @@ class ScaleFamilyRecord:
     d_map: List[List[Tuple[int, int]]]
 
 
-def dec_to_i128(text: str) -> int:
-    neg = False
-    if text.startswith("+"):
-        text = text[1:]
-    elif text.startswith("-"):
-        neg = True
-        text = text[1:]
-
-    if "." in text:
-        int_part, frac_part = text.split(".", 1)
-    else:
-        int_part, frac_part = text, ""
-
-    if int_part == "":
-        int_part = "0"
-
-    frac_part = (frac_part + ("0" * 17))[:17]
-    value = int(int_part) * SCALE + int(frac_part)
-    return -value if neg else value
-
-
-def tokenize_path(path_d: str) -> List[Token]:
-    out: List[Token] = []
-    i = 0
-    n = len(path_d)
-    while i < n:
-        ch = path_d[i]
-        if ch.isalpha():
-            out.append(Token("cmd", ch))
-            i += 1
-            continue
-
-        m = NUM_RE.match(path_d, i)
-        if m:
-            out.append(Token("num", m.group(0)))
-            i = m.end()
-            continue
-
-        j = i + 1
-        while j < n:
-            if path_d[j].isalpha() or NUM_RE.match(path_d, j):
-                break
-            j += 1
-        out.append(Token("sep", path_d[i:j]))
-        i = j
-    return out
-
-
-def make_template(path_d: str) -> tuple[tuple[str, tuple[int, ...], bytes], tuple[int, int]]:
-    toks = tokenize_path(path_d)
-
-    cmd = None
-    first_pair: List[int] = []
-    for tok in toks:
-        if tok.kind == "cmd":
-            cmd = tok.value
-            continue
-        if tok.kind == "num" and cmd == "M":
-            first_pair.append(dec_to_i128(tok.value))
-            if len(first_pair) == 2:
-                break
-    dx = first_pair[0] if len(first_pair) > 0 else 0
-    dy = first_pair[1] if len(first_pair) > 1 else 0
-
-    parts: List[Tuple[str, str | int]] = []
-    bases: List[int] = []
-    flags: List[int] = []
-
-    cmd = None
-    arg_i = 0
-    set_count = 0
-
-    for tok in toks:
-        if tok.kind == "cmd":
-            cmd = tok.value
-            arg_i = 0
-            set_count = 0
-            parts.append(("lit", tok.value))
-            continue
-
-        if tok.kind == "sep":
-            parts.append(("lit", tok.value))
-            continue
-
-        if cmd is None:
-            parts.append(("lit", tok.value))
-            continue
-
-        arg_flags = ARG_FLAGS.get(cmd, [])
-        if not arg_flags:
-            parts.append(("lit", tok.value))
-            continue
-
-        if arg_i >= len(arg_flags):
-            set_count += 1
-            arg_i = 0
-            if cmd == "M" and set_count >= 1:
-                cmd = "L"
-                arg_flags = ARG_FLAGS[cmd]
-            elif cmd == "m" and set_count >= 1:
-                cmd = "l"
-                arg_flags = ARG_FLAGS[cmd]
-            else:
-                arg_flags = ARG_FLAGS.get(cmd, [])
-
-        axis_flag = arg_flags[arg_i] if arg_i < len(arg_flags) else "n"
-        v = dec_to_i128(tok.value)
-        out_flag = 0
-
-        if cmd.isupper():
-            if axis_flag == "x":
-                v -= dx
-                out_flag = 1
-            elif axis_flag == "y":
-                v -= dy
-                out_flag = 2
-
-        bases.append(v)
-        flags.append(out_flag)
-        parts.append(("slot", len(bases) - 1))
-        arg_i += 1
-
-    fmt_parts: List[str] = []
-    for kind, payload in parts:
-        if kind == "lit":
-            fmt_parts.append(payload)  # type: ignore[arg-type]
-        else:
-            fmt_parts.append(MARKER_NUM)
-    fmt = "".join(fmt_parts)
-
-    key = (fmt, tuple(bases), bytes(flags))
-    return key, (dx, dy)
-
-
 def parse_file(svg_text: str) -> tuple[str, List[str], List[str], List[str]]:
     pos = 0
     out_parts: List[str] = []
@@ -320,32 +167,10 @@ def intern(intern_map: Dict, arr: List, value):
     return idx
 
 
-def read_svg(path: str) -> str:
-    with open(path, "r", encoding="utf-8") as f:
-        return f.read()
-
-
-def parse_regular_svg(
-    kind: str,
-    path: str,
-    skeleton_map: Dict[str, int],
-    style_map: Dict[str, int],
-    href_map: Dict[str, int],
-    template_map: Dict[tuple[str, tuple[int, ...], bytes], int],
-    offset_map: Dict[tuple[int, int], int],
-    skeletons: List[str],
-    styles: List[str],
-    hrefs: List[str],
-    templates: List[tuple[str, tuple[int, ...], bytes]],
-    offsets: List[tuple[int, int]],
-) -> ParsedFile:
-    svg_text = read_svg(path)
+def scan_regular_svg(data: bytes, path: str, kind: str) -> ScannedFile:
+    svg_text = decode_text(data)
     skeleton, href_vals, style_vals, d_vals = parse_file(svg_text)
 
-    skeleton_id = intern(skeleton_map, skeletons, skeleton)
-    href_ids = [intern(href_map, hrefs, h) for h in href_vals]
-    style_ids = [intern(style_map, styles, s) for s in style_vals]
-
     if len(style_vals) != len(d_vals):
         raise ValueError(f"{path}: style/d slot mismatch ({len(style_vals)} vs {len(d_vals)})")
 
@@ -359,11 +184,40 @@ def parse_regular_svg(
         else:
             seen_non_geometry = True
 
-    d_refs: List[Tuple[int, int]] = []
+    templates = []
     for d_i, d in enumerate(d_vals):
         if kind == "scales" and d_i < SCALE_GEOMETRY_D_SLOT_COUNT:
             continue
-        tpl_key, off = make_template(d)
+        templates.append(make_template(d))
+
+    return ScannedFile(
+        skeleton=skeleton,
+        href_values=href_vals,
+        style_values=style_vals,
+        geometry_slot_count=geometry_slot_count,
+        templates=templates,
+    )
+
+
+def parse_regular_svg(
+    scanned: ScannedFile,
+    skeleton_map: Dict[str, int],
+    style_map: Dict[str, int],
+    href_map: Dict[str, int],
+    template_map: Dict[tuple[str, tuple[int, ...], bytes], int],
+    offset_map: Dict[tuple[int, int], int],
+    skeletons: List[str],
+    styles: List[str],
+    hrefs: List[str],
+    templates: List[tuple[str, tuple[int, ...], bytes]],
+    offsets: List[tuple[int, int]],
+) -> ParsedFile:
+    skeleton_id = intern(skeleton_map, skeletons, scanned.skeleton)
+    href_ids = [intern(href_map, hrefs, h) for h in scanned.href_values]
+    style_ids = [intern(style_map, styles, s) for s in scanned.style_values]
+
+    d_refs: List[Tuple[int, int]] = []
+    for tpl_key, off in scanned.templates:
         tid = intern(template_map, templates, tpl_key)
         oid = intern(offset_map, offsets, off)
         d_refs.append((tid, oid))
@@ -373,7 +227,7 @@ def parse_regular_svg(
         href_ids=href_ids,
         style_ids=style_ids,
         d_refs=d_refs,
-        geometry_slot_count=geometry_slot_count,
+        geometry_slot_count=scanned.geometry_slot_count,
     )
 
 
@@ -612,7 +466,7 @@ def write_i128(buf: bytearray, value: int) -> None:
     buf.extend(int(value).to_bytes(16, byteorder="little", signed=True))
 
 
-def build_pack(majmin_dir: str) -> tuple[bytes, dict[str, int], List[ModeGroupRecord]]:
+def build_pack(majmin_dir: str, args: argparse.Namespace) -> tuple[bytes, dict[str, int], List[ModeGroupRecord]]:
     skeleton_map: Dict[str, int] = {}
     style_map: Dict[str, int] = {}
     href_map: Dict[str, int] = {}
@@ -627,6 +481,7 @@ def build_pack(majmin_dir: str) -> tuple[bytes, dict[str, int], List[ModeGroupRe
 
     regular: Dict[tuple[str, int, str, int], ParsedFile] = {}
 
+    regular_files: List[tuple[tuple[str, int, str, int], str]] = []
     for path in sorted(glob.glob(os.path.join(majmin_dir, "*.svg"))):
         name = os.path.basename(path)
         stem = name[:-4] if name.endswith(".svg") else name
@@ -643,9 +498,19 @@ def build_pack(majmin_dir: str) -> tuple[bytes, dict[str, int], List[ModeGroupRe
             raise ValueError(f"unexpected family in {name}")
         transposition = int(trans_tok)
         rotation = int(rotation_tok)
-        regular[(kind, transposition, family, rotation)] = parse_regular_svg(
-            kind,
-            path,
+        regular_files.append(((kind, transposition, family, rotation), path))
+
+    # Parsing runs in parallel; interning stays in sorted file order so ids
+    # match a single-process run.
+    scanned_files = parse_files(
+        scan_regular_svg,
+        [(path, (path, key[0])) for key, path in regular_files],
+        args,
+        "majmin_scene_pack",
+    )
+    for (key, _), scanned in zip(regular_files, scanned_files):
+        regular[key] = parse_regular_svg(
+            scanned,
             skeleton_map,
             style_map,
             href_map,
@@ -861,14 +726,18 @@ def main() -> None:
     parser.add_argument("--majmin-dir", default="tmp/harmoniousapp.net/majmin")
     parser.add_argument("--out-zig", default="src/generated/harmonious_majmin_scene_pack_xz.zig")
     parser.add_argument("--out-mode-geometry-zig", default="src/generated/harmonious_majmin_modes_geometry_refs.zig")
+    add_arguments(parser)
+    parser.add_argument("--sidecar-dir", help="also write the uncompressed .lmtpack sidecar here (see -Dpack-sidecar-dir)")
     args = parser.parse_args()
 
-    raw, stats, mode_groups = build_pack(args.majmin_dir)
-    xz_payload = lzma.compress(raw, format=lzma.FORMAT_XZ, preset=9 | lzma.PRESET_EXTREME)
+    raw, stats, mode_groups = build_pack(args.majmin_dir, args)
+    xz_payload = compress_xz(raw, 9 | lzma.PRESET_EXTREME, args, "majmin_scene_pack")
     os.makedirs(os.path.dirname(args.out_zig), exist_ok=True)
     write_zig(args.out_zig, xz_payload, stats)
     os.makedirs(os.path.dirname(args.out_mode_geometry_zig), exist_ok=True)
     write_modes_geometry_zig(args.out_mode_geometry_zig, mode_groups, stats)
+    if args.sidecar_dir:
+        print(f"Wrote {write_sidecar(args.sidecar_dir, 'majmin_scenes', [(raw, xz_payload)])}")
 
     print(
         f"Wrote {args.out_zig} | raw={len(raw)} bytes | xz={len(xz_payload)} bytes"
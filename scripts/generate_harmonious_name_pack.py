@@ -15,6 +15,8 @@ import lzma
 import struct
 from pathlib import Path
 
+from pack_sidecar import write_sidecar
+
 
 KIND_SPECS = (
     ("vert-text-black", "vert-text-black", True),
@@ -43,6 +45,7 @@ def parse_args() -> argparse.Namespace:
         default="src/generated/harmonious_name_pack_xz.zig",
         help="output Zig module",
     )
+    p.add_argument("--sidecar-dir", help="also write the uncompressed .lmtpack sidecar here (see -Dpack-sidecar-dir)")
     return p.parse_args()
 
 
@@ -119,6 +122,8 @@ def main() -> int:
 
     out.parent.mkdir(parents=True, exist_ok=True)
     out.write_text("\n".join(out_text), encoding="utf-8")
+    if args.sidecar_dir:
+        print("wrote", write_sidecar(args.sidecar_dir, "names", [(raw, packed)]))
 
     print(
         "wrote",
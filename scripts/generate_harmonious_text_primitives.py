@@ -18,6 +18,8 @@ import sys
 from dataclasses import dataclass
 from typing import Dict, Iterable, List, Sequence, Tuple
 
+from generator_cache import add_arguments, decode_text, parse_files
+
 
 SCALE = 10_000
 EXPECTED_VERTICAL_FILE_COUNTS = {
@@ -58,6 +60,7 @@ def parse_args() -> argparse.Namespace:
         default="src/generated/harmonious_text_primitives.zig",
         help="output zig file",
     )
+    add_arguments(p)
     return p.parse_args()
 
 
@@ -135,8 +138,8 @@ def zig_str(text: str) -> str:
     return f'"{escaped}"'
 
 
-def parse_vertical_record(kind: str, svg_path: pathlib.Path) -> VerticalRecord:
-    text = svg_path.read_text(encoding="utf-8")
+def parse_vertical_record(data: bytes, kind: str, svg_path: pathlib.Path) -> VerticalRecord:
+    text = decode_text(data)
     m = PATH_D_RE.search(text)
     if not m:
         fail(f"{svg_path}: missing path d attribute")
@@ -168,8 +171,15 @@ def parse_vertical_record(kind: str, svg_path: pathlib.Path) -> VerticalRecord:
     return VerticalRecord(kind=kind, stem=stem, text=stem, subpaths=tuple(subpaths))
 
 
-def collect_vertical_records(root: pathlib.Path) -> List[VerticalRecord]:
-    out: List[VerticalRecord] = []
+def parse_center_record(data: bytes, svg_path: pathlib.Path) -> CenterRecord:
+    m = PATH_D_RE.search(decode_text(data))
+    if not m:
+        fail(f"{svg_path}: missing path d attribute")
+    return CenterRecord(stem=svg_path.stem, path_d=m.group(1))
+
+
+def collect_vertical_records(root: pathlib.Path, args: argparse.Namespace) -> List[VerticalRecord]:
+    items: List[Tuple[pathlib.Path, Tuple[str, pathlib.Path]]] = []
     for kind, expected_count in EXPECTED_VERTICAL_FILE_COUNTS.items():
         d = root / kind
         if not d.is_dir():
@@ -177,25 +187,18 @@ def collect_vertical_records(root: pathlib.Path) -> List[VerticalRecord]:
         files = sorted(d.glob("*.svg"))
         if len(files) != expected_count:
             fail(f"{kind}: expected {expected_count} files, found {len(files)}")
-        for p in files:
-            out.append(parse_vertical_record(kind, p))
-    return out
+        items.extend((p, (kind, p)) for p in files)
+    return parse_files(parse_vertical_record, items, args, "text_primitives")
 
 
-def collect_center_records(root: pathlib.Path) -> List[CenterRecord]:
+def collect_center_records(root: pathlib.Path, args: argparse.Namespace) -> List[CenterRecord]:
     d = root / "center-square-text"
     if not d.is_dir():
         fail(f"missing directory: {d}")
     files = sorted(d.glob("*.svg"))
     if len(files) != EXPECTED_CENTER_FILE_COUNT:
         fail(f"center-square-text: expected {EXPECTED_CENTER_FILE_COUNT} files, found {len(files)}")
-    out: List[CenterRecord] = []
-    for p in files:
-        m = PATH_D_RE.search(p.read_text(encoding="utf-8"))
-        if not m:
-            fail(f"{p}: missing path d attribute")
-        out.append(CenterRecord(stem=p.stem, path_d=m.group(1)))
-    return out
+    return parse_files(parse_center_record, [(p, (p,)) for p in files], args, "text_primitives")
 
 
 def assign_symbol_parts(records: Sequence[VerticalRecord]):
@@ -630,8 +633,8 @@ def main() -> int:
     root = pathlib.Path(args.root)
     out = pathlib.Path(args.out)
 
-    vertical_records = collect_vertical_records(root)
-    center_records = collect_center_records(root)
+    vertical_records = collect_vertical_records(root, args)
+    center_records = collect_center_records(root, args)
 
     primitive_bodies, symbol_parts_new, record_symbol_parts = assign_symbol_parts(vertical_records)
     symbol_offsets = derive_symbol_offsets(symbol_parts_new, record_symbol_parts)
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Chunk and xz-compress prerendered SVG documents into an indexed asset pack.
+
+Input:
+  the raw document dump written by `prerender-assets` (src/prerender_main.zig)
+
+Output:
+  a binary pack that src/prerendered_assets.zig embeds when the library is
+  built with -Dprerendered-assets=compact|full
+
+Documents of one domain are grouped into chunks of about --chunk-kib raw bytes
+and each chunk is its own xz stream, so a lookup decodes one chunk rather than
+the whole pack. Larger chunks compress better; smaller chunks decode faster on
+first use.
+"""
+
+from __future__ import annotations
+
+import argparse
+import lzma
+import struct
+from pathlib import Path
+
+
+RAW_MAGIC = b"LPR1"
+PACK_MAGIC = b"LPA1"
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--raw", required=True, help="document dump from prerender-assets")
+    p.add_argument("--out", required=True, help="output pack path")
+    p.add_argument("--chunk-kib", type=int, default=512, help="target raw bytes per xz chunk, in KiB")
+    return p.parse_args()
+
+
+def read_raw(data: bytes) -> tuple[int, dict[int, list[bytes]]]:
+    if data[:4] != RAW_MAGIC:
+        raise SystemExit("prerendered dump has a bad header")
+    domain_count, packed_count = struct.unpack_from("<II", data, 4)
+    cursor = 12
+    domains: dict[int, list[bytes]] = {}
+    for _ in range(packed_count):
+        domain = data[cursor]
+        (entry_count,) = struct.unpack_from("<I", data, cursor + 1)
+        cursor += 5
+        docs = []
+        for _ in range(entry_count):
+            (length,) = struct.unpack_from("<I", data, cursor)
+            cursor += 4
+            docs.append(data[cursor : cursor + length])
+            cursor += length
+        if domain >= domain_count or domain in domains:
+            raise SystemExit(f"prerendered dump repeats or misnumbers domain {domain}")
+        domains[domain] = docs
+    if cursor != len(data):
+        raise SystemExit("prerendered dump has trailing bytes")
+    return domain_count, domains
+
+
+def chunk_documents(docs: list[bytes], target: int) -> list[list[bytes]]:
+    chunks: list[list[bytes]] = []
+    current: list[bytes] = []
+    size = 0
+    for doc in docs:
+        if current and size + len(doc) > target:
+            chunks.append(current)
+            current, size = [], 0
+        current.append(doc)
+        size += len(doc)
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def compress(raw: bytes) -> bytes:
+    # The dictionary never needs to outgrow the chunk, which keeps the
+    # decoder's window allocation as small as the chunk it restores.
+    dict_size = max(4096, 1 << (len(raw) - 1).bit_length())
+    filters = [{"id": lzma.FILTER_LZMA2, "preset": 9, "dict_size": dict_size}]
+    return lzma.compress(raw, format=lzma.FORMAT_XZ, filters=filters)
+
+
+def build_pack(domain_count: int, domains: dict[int, list[bytes]], target: int) -> tuple[bytes, int, int]:
+    domain_table = []
+    chunk_table = []
+    entry_table = []
+    payload = bytearray()
+    raw_total = 0
+    for domain in range(domain_count):
+        docs = domains.get(domain, [])
+        domain_table.append((len(entry_table), len(docs)))
+        for chunk in chunk_documents(docs, target):
+            chunk_index = len(chunk_table)
+            offset = 0
+            for doc in chunk:
+                entry_table.append((chunk_index, offset, len(doc)))
+                offset += len(doc)
+            packed = compress(b"".join(chunk))
+            chunk_table.append((len(payload), len(packed), offset))
+            payload += packed
+            raw_total += offset
+
+    out = bytearray(PACK_MAGIC)
+    out += struct.pack("<III", domain_count, len(chunk_table), len(entry_table))
+    for record in domain_table:
+        out += struct.pack("<II", *record)
+    for record in chunk_table:
+        out += struct.pack("<III", *record)
+    for record in entry_table:
+        out += struct.pack("<III", *record)
+    out += payload
+    return bytes(out), len(chunk_table), raw_total
+
+
+def main() -> int:
+    args = parse_args()
+    domain_count, domains = read_raw(Path(args.raw).read_bytes())
+    pack, chunk_count, raw_total = build_pack(domain_count, domains, args.chunk_kib * 1024)
+
+    out = Path(args.out)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_bytes(pack)
+    entries = sum(len(docs) for docs in domains.values())
+    print("wrote", out, f"(entries={entries}, chunks={chunk_count}, raw={raw_total}, pack={len(pack)})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
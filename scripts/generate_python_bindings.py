@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""Generate the ctypes signature module for the Python binding package.
+
+Input:
+  include/libmusictheory.h
+
+Output:
+  bindings/python/libmusictheory/_ffi.py
+
+The generated module declares every enum constant, every struct layout, and
+one (restype, argtypes) pair per `lmt_*` export so the package can bind the
+whole C ABI once at import time. Use `--check` to fail when the checked-in
+module is stale.
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+from pathlib import Path
+
+
+SCALAR_CTYPES = {
+    "void": None,
+    "bool": "ctypes.c_bool",
+    "char": "ctypes.c_char",
+    "float": "ctypes.c_float",
+    "double": "ctypes.c_double",
+    "int": "ctypes.c_int",
+    "int8_t": "ctypes.c_int8",
+    "int16_t": "ctypes.c_int16",
+    "int32_t": "ctypes.c_int32",
+    "int64_t": "ctypes.c_int64",
+    "uint8_t": "ctypes.c_uint8",
+    "uint16_t": "ctypes.c_uint16",
+    "uint32_t": "ctypes.c_uint32",
+    "uint64_t": "ctypes.c_uint64",
+    "size_t": "ctypes.c_size_t",
+}
+
+COMMENT_RE = re.compile(r"/\*.*?\*/|//[^\n]*", re.S)
+TYPEDEF_SCALAR_RE = re.compile(r"typedef\s+(\w+)\s+(lmt_\w+)\s*;")
+OPAQUE_RE = re.compile(r"typedef\s+struct\s+lmt_\w+\s+(lmt_\w+)\s*;")
+FNPTR_RE = re.compile(r"typedef\s+((?:const\s+)?\w+\s*\**)\s*\(\s*\*\s*(lmt_\w+)\s*\)\s*\(([^)]*)\)\s*;")
+ENUM_RE = re.compile(r"(typedef\s+)?enum\s*\{(.*?)\}\s*(lmt_\w+)?\s*;", re.S)
+STRUCT_RE = re.compile(r"typedef\s+struct\s*\{(.*?)\}\s*(lmt_\w+)\s*;", re.S)
+FIELD_RE = re.compile(r"^(?:const\s+)?(\w+)\s*(\*?)\s*(\w+)\s*(?:\[(\w+)\])?$")
+PROTO_RE = re.compile(r"^((?:const\s+)?\w+\s*\**)\s*(lmt_\w+)\s*\(([^)]*)\)\s*;", re.M)
+PARAM_RE = re.compile(r"^(const\s+)?(\w+)\s*(\*?)\s*(\w+)?$")
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--header", default="include/libmusictheory.h", help="public C header")
+    p.add_argument("--out", default="bindings/python/libmusictheory/_ffi.py", help="output Python module")
+    p.add_argument("--check", action="store_true", help="fail if the output file is out of date")
+    return p.parse_args()
+
+
+class Header:
+    def __init__(self, text: str) -> None:
+        self.text = COMMENT_RE.sub("", text)
+        self.aliases: dict[str, str] = {}
+        self.constants: list[tuple[str, int]] = []
+        self.structs: list[tuple[str, list[tuple[str, str]]]] = []
+        self.callbacks: list[tuple[str, str, list[str]]] = []
+        self.prototypes: list[tuple[str, str, list[str]]] = []
+        self._parse()
+
+    def _parse(self) -> None:
+        for base, name in TYPEDEF_SCALAR_RE.findall(self.text):
+            self.aliases[name] = base
+        # Opaque handles are only ever passed by pointer.
+        for name in OPAQUE_RE.findall(self.text):
+            self.aliases[name] = "void"
+
+        known: dict[str, int] = {}
+        for match in ENUM_RE.finditer(self.text):
+            next_value = 0
+            for item in match.group(2).split(","):
+                item = item.strip()
+                if not item:
+                    continue
+                if "=" in item:
+                    name, value = (part.strip() for part in item.split("=", 1))
+                    next_value = known[value] if value in known else int(value, 0)
+                else:
+                    name = item
+                known[name] = next_value
+                self.constants.append((name, next_value))
+                next_value += 1
+            if match.group(1) and match.group(3):
+                self.aliases[match.group(3)] = "int"
+        self.known_constants = known
+
+        for body, name in STRUCT_RE.findall(self.text):
+            fields = []
+            for raw in body.split(";"):
+                raw = " ".join(raw.split())
+                if not raw:
+                    continue
+                field = FIELD_RE.match(raw)
+                if field is None:
+                    raise RuntimeError(f"unsupported field in {name}: {raw}")
+                base, star, field_name, length = field.groups()
+                ctype = self.ctype(base, star)
+                if length is not None:
+                    count = self.known_constants[length] if length in self.known_constants else int(length, 0)
+                    ctype = f"{ctype} * {count}"
+                fields.append((field_name, ctype))
+            self.structs.append((name, fields))
+
+        for ret, name, params in FNPTR_RE.findall(self.text):
+            restype, argtypes = self.signature(name, ret, params)
+            # c_char_p would read callback chunks up to a NUL; keep them raw.
+            argtypes = ["ctypes.POINTER(ctypes.c_char)" if t == "ctypes.c_char_p" else t for t in argtypes]
+            self.callbacks.append((name, restype, argtypes))
+
+        for ret, name, params in PROTO_RE.findall(self.text):
+            self.prototypes.append((name, *self.signature(name, ret, params)))
+
+    def signature(self, name: str, ret: str, params: str) -> tuple[str, list[str]]:
+        argtypes = []
+        params = params.strip()
+        if params and params != "void":
+            for raw in params.split(","):
+                param = PARAM_RE.match(" ".join(raw.split()))
+                if param is None:
+                    raise RuntimeError(f"unsupported parameter in {name}: {raw.strip()}")
+                const, base, star, _ = param.groups()
+                argtypes.append(self.ctype(base, star, const is not None))
+        ret_param = PARAM_RE.match(" ".join(ret.split()) + " ret")
+        assert ret_param is not None
+        const, base, star, _ = ret_param.groups()
+        return self.ctype(base, star, const is not None), argtypes
+
+    def resolve(self, name: str) -> str:
+        while name in self.aliases:
+            name = self.aliases[name]
+        return name
+
+    def ctype(self, base: str, star: str, const: bool = False) -> str:
+        struct_names = {name for name, _ in self.structs}
+        if not star and any(name == base for name, _, _ in self.callbacks):
+            return base
+        resolved = self.resolve(base)
+        if resolved in struct_names or base in struct_names:
+            inner = base
+        elif resolved in SCALAR_CTYPES:
+            inner = SCALAR_CTYPES[resolved]
+        else:
+            raise RuntimeError(f"unknown C type: {base}")
+        if not star:
+            return "None" if inner is None else inner
+        if resolved == "char" and const:
+            return "ctypes.c_char_p"
+        if inner is None:
+            return "ctypes.c_void_p"
+        return f"ctypes.POINTER({inner})"
+
+
+def render(header: Header, header_path: str) -> str:
+    lines = [
+        f"# Auto-generated by scripts/generate_python_bindings.py from {header_path}.",
+        "# DO NOT EDIT MANUALLY.",
+        "",
+        "import ctypes",
+        "",
+    ]
+    for name, value in header.constants:
+        lines.append(f"{name} = {value}")
+    lines.append("")
+
+    for name, fields in header.structs:
+        lines.append("")
+        lines.append(f"class {name}(ctypes.Structure):")
+        lines.append("    _fields_ = [")
+        for field_name, ctype in fields:
+            lines.append(f'        ("{field_name}", {ctype}),')
+        lines.append("    ]")
+        lines.append("")
+
+    for name, restype, argtypes in header.callbacks:
+        lines.append("")
+        lines.append(f"{name} = ctypes.CFUNCTYPE({', '.join([restype, *argtypes])})")
+        lines.append("")
+
+    lines.append("")
+    lines.append("SIGNATURES = {")
+    for name, restype, argtypes in header.prototypes:
+        lines.append(f'    "{name}": ({restype}, [{", ".join(argtypes)}]),')
+    lines.append("}")
+    lines.append("")
+    return "\n".join(lines)
+
+
+def main() -> int:
+    args = parse_args()
+    header_path = Path(args.header)
+    out = Path(args.out)
+
+    header = Header(header_path.read_text(encoding="utf-8"))
+    text = render(header, args.header)
+
+    if args.check:
+        current = out.read_text(encoding="utf-8") if out.exists() else ""
+        if current != text:
+            print(f"{out} is out of date; run scripts/generate_python_bindings.py", file=sys.stderr)
+            return 1
+        print(f"{out} is up to date ({len(header.prototypes)} functions)")
+        return 0
+
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(text, encoding="utf-8")
+    print(
+        f"wrote {out}: functions={len(header.prototypes)} structs={len(header.structs)} "
+        f"constants={len(header.constants)}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,163 @@
+"""Parallel, content-hash cached per-file parsing for the asset generators.
+
+`parse_files` runs a generator's pure per-file parse function over its
+reference SVGs in a process pool and caches each result on disk, keyed by
+the file bytes, the extra arguments, and the source of every module loaded
+from scripts/ (the generator, this module, scripts/lib helpers). Results come back in input order, so the caller interns them
+in exactly the order a cold single-process run does and the emitted bytes
+are identical. `compress_xz` caches the final xz payload the same way.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import lzma
+import os
+import pickle
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Sequence
+
+DEFAULT_CACHE_DIR = ".cache/harmonious-generators"
+CACHE_FORMAT = b"lmt-generator-cache-1"
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="parse reference files in this many processes (1 parses in-process)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=DEFAULT_CACHE_DIR,
+        help="per-file parse cache keyed by content hash",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="ignore and do not update the parse cache")
+
+
+def decode_text(data: bytes) -> str:
+    """Decode like open(path, "r", encoding="utf-8"), universal newlines included."""
+    return data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _source_digest(fn: Callable[..., Any]) -> bytes:
+    scripts_dir = Path(__file__).resolve().parent
+    sources: set[Path] = set()
+    for module in list(sys.modules.values()):
+        source = getattr(module, "__file__", None)
+        if source and Path(source).resolve().is_relative_to(scripts_dir):
+            sources.add(Path(source).resolve())
+    h = hashlib.sha256(CACHE_FORMAT)
+    for source in sorted(sources):
+        h.update(source.relative_to(scripts_dir).as_posix().encode())
+        h.update(Path(source).read_bytes())
+    h.update(fn.__qualname__.encode())
+    return h.digest()
+
+
+class _Cache:
+    def __init__(self, args: argparse.Namespace, namespace: str) -> None:
+        self.root = None if args.no_cache else Path(args.cache_dir) / namespace
+        self.hits = 0
+        self.misses = 0
+
+    def path(self, key: str) -> Path | None:
+        if self.root is None:
+            return None
+        return self.root / key[:2] / f"{key}.pickle"
+
+    def load(self, key: str) -> tuple[bool, Any]:
+        path = self.path(key)
+        if path is None or not path.is_file():
+            self.misses += 1
+            return False, None
+        try:
+            value = pickle.loads(path.read_bytes())
+        except Exception:  # unreadable, truncated, or written by an older generator
+            self.misses += 1
+            return False, None
+        self.hits += 1
+        return True, value
+
+    def store(self, key: str, value: Any) -> None:
+        path = self.path(key)
+        if path is None:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_bytes(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        os.replace(tmp, path)
+
+
+def _call(fn: Callable[..., Any], data: bytes, extra: tuple) -> Any:
+    return fn(data, *extra)
+
+
+def parse_files(
+    fn: Callable[..., Any],
+    items: Sequence[tuple[str | os.PathLike[str], tuple]],
+    args: argparse.Namespace,
+    namespace: str,
+) -> list[Any]:
+    """Return [fn(file_bytes, *extra) for path, extra in items], in order.
+
+    `fn` must be a module-level function of its arguments alone so results
+    can be computed in worker processes and reused across runs.
+    """
+    cache = _Cache(args, namespace)
+    salt = _source_digest(fn)
+    results: list[Any] = [None] * len(items)
+    pending: list[tuple[int, str, bytes, tuple]] = []
+    for index, (path, extra) in enumerate(items):
+        data = Path(path).read_bytes()
+        h = hashlib.sha256(salt)
+        h.update(pickle.dumps(extra, protocol=pickle.HIGHEST_PROTOCOL))
+        h.update(data)
+        key = h.hexdigest()
+        hit, value = cache.load(key)
+        if hit:
+            results[index] = value
+        else:
+            pending.append((index, key, data, extra))
+
+    if pending:
+        jobs = max(1, min(args.jobs, len(pending)))
+        if jobs == 1:
+            values = [_call(fn, data, extra) for _, _, data, extra in pending]
+        else:
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                chunksize = max(1, len(pending) // (jobs * 4))
+                values = list(
+                    pool.map(
+                        _call,
+                        [fn] * len(pending),
+                        [data for _, _, data, _ in pending],
+                        [extra for _, _, _, extra in pending],
+                        chunksize=chunksize,
+                    )
+                )
+        for (index, key, _, _), value in zip(pending, values):
+            results[index] = value
+            cache.store(key, value)
+
+    print(f"[{namespace}] parsed {len(pending)} files, {cache.hits} from cache", file=sys.stderr)
+    return results
+
+
+def compress_xz(raw: bytes, preset: int, args: argparse.Namespace, namespace: str) -> bytes:
+    """lzma.compress(raw, FORMAT_XZ, preset), reusing the last result for identical input."""
+    cache = _Cache(args, namespace)
+    h = hashlib.sha256(CACHE_FORMAT)
+    h.update(f"xz:{preset}:{sys.version}".encode())
+    h.update(raw)
+    key = h.hexdigest()
+    hit, value = cache.load(key)
+    if hit:
+        return value
+    value = lzma.compress(raw, format=lzma.FORMAT_XZ, preset=preset)
+    cache.store(key, value)
+    return value
@@ -0,0 +1 @@
+"""Python helpers shared by the generator and audit scripts."""
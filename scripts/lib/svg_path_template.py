@@ -0,0 +1,195 @@
+"""Shared SVG path tokenizer and fixed-point templates for the majmin scripts.
+
+`make_template` turns a path `d` attribute into a translation-free template:
+the text with every coordinate replaced by MARKER_NUM, the coordinates as
+fixed-point integers (SCALE = 10**17) relative to the first `M` pair, and a
+flag per coordinate saying which axis it was shifted on. Paths that differ
+only by a translation share a template.
+
+The path is scanned once as ASCII bytes with a single regex; each number's
+sign, integer and fraction digits come out as match groups and are combined
+as integers, so no Decimal or substring parsing is involved. Results match
+the per-character tokenizer this module replaced byte for byte, including
+its quirks (see `check_svg_path_template.py`).
+"""
+
+from __future__ import annotations
+
+import functools
+import re
+from dataclasses import dataclass
+
+SCALE_DIGITS = 17
+SCALE = 10**SCALE_DIGITS
+
+MARKER_NUM = "\x01"
+
+ARG_FLAGS = {
+    "M": ["x", "y"],
+    "L": ["x", "y"],
+    "T": ["x", "y"],
+    "H": ["x"],
+    "V": ["y"],
+    "S": ["x", "y", "x", "y"],
+    "Q": ["x", "y", "x", "y"],
+    "C": ["x", "y", "x", "y", "x", "y"],
+    "A": ["n", "n", "n", "n", "n", "x", "y"],
+    "m": ["x", "y"],
+    "l": ["x", "y"],
+    "t": ["x", "y"],
+    "h": ["x"],
+    "v": ["y"],
+    "s": ["x", "y", "x", "y"],
+    "q": ["x", "y", "x", "y"],
+    "c": ["x", "y", "x", "y", "x", "y"],
+    "a": ["n", "n", "n", "n", "n", "x", "y"],
+    "Z": [],
+    "z": [],
+}
+
+TemplateKey = tuple[str, tuple[int, ...], bytes]
+
+# A command letter or a number; whatever lies between two matches is a
+# separator. `split` yields [sep, cmd, num, sep, cmd, num, ..., sep] with the
+# unmatched group None, so one C-level pass hands back every token.
+_TOKEN_RE = re.compile(rb"([A-Za-z])|([+-]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?)")
+_NUMBER_RE = re.compile(rb"([+-]?)(?:(\d+)(?:\.(\d*))?|\.(\d+))([eE][+-]?\d+)?")
+
+_POW10 = [10**n for n in range(SCALE_DIGITS + 1)]
+_MARKER_NUM_BYTES = MARKER_NUM.encode()
+
+# Coordinates repeat heavily across the reference paths, and whole paths
+# repeat across files (about 7k distinct among 152k in majmin/), so both are
+# remembered. Templates are immutable tuples and safe to share.
+_FIXED_CACHE_LIMIT = 1 << 16
+_TEMPLATE_CACHE_SIZE = 1 << 14
+_fixed_cache: dict[bytes, int] = {}
+
+# Argument axis per command byte; 0 = not shifted, 1 = x, 2 = y.
+_AXES = {
+    ord(cmd): bytes({"n": 0, "x": 1, "y": 2}[flag] for flag in flags) for cmd, flags in ARG_FLAGS.items()
+}
+_MOVE = ord("M")
+_IMPLICIT_NEXT = {_MOVE: ord("L"), ord("m"): ord("l")}
+
+
+@dataclass(frozen=True)
+class Token:
+    kind: str
+    value: str
+
+
+def _parse_fixed(number: bytes) -> int:
+    m = _NUMBER_RE.fullmatch(number)
+    if m is None:
+        raise ValueError(f"invalid path number {number.decode()!r}")
+    sign, int_digits, frac, lead_frac, exp = m.groups()
+    if lead_frac is not None:
+        frac = lead_frac
+    # The fraction keeps its first 17 digits. An exponent is rejected unless
+    # that cut drops it, as the string-splitting parser this replaces did.
+    if exp is not None and (frac is None or len(frac) < SCALE_DIGITS):
+        raise ValueError(f"exponent in path number {number.decode()!r}")
+    value = int(int_digits) * SCALE if int_digits else 0
+    if frac:
+        n = len(frac)
+        value += int(frac) * _POW10[SCALE_DIGITS - n] if n <= SCALE_DIGITS else int(frac) // _POW10[n - SCALE_DIGITS]
+    return -value if sign == b"-" else value
+
+
+def _fixed(number: bytes) -> int:
+    value = _fixed_cache.get(number)
+    if value is None:
+        value = _parse_fixed(number)
+        if len(_fixed_cache) >= _FIXED_CACHE_LIMIT:
+            _fixed_cache.clear()
+        _fixed_cache[number] = value
+    return value
+
+
+def clear_caches() -> None:
+    """Forget remembered numbers and templates (for benchmarking cold runs)."""
+    _fixed_cache.clear()
+    make_template.cache_clear()
+
+
+def dec_to_i128(text: str) -> int:
+    """Parse one path number as a SCALE fixed-point integer, truncating."""
+    return _fixed(text.encode("ascii"))
+
+
+def tokenize_path(path_d: str) -> list[Token]:
+    """Split path data into "cmd", "num" and "sep" tokens covering all of it."""
+    parts = iter(_TOKEN_RE.split(path_d.encode("ascii")))
+    out: list[Token] = []
+    sep = next(parts)
+    while True:
+        if sep:
+            out.append(Token("sep", sep.decode()))
+        cmd = next(parts, None)
+        num = next(parts, None)
+        if cmd is None and num is None:
+            return out
+        out.append(Token("cmd", cmd.decode()) if cmd is not None else Token("num", num.decode()))
+        sep = next(parts)
+
+
+@functools.lru_cache(maxsize=_TEMPLATE_CACHE_SIZE)
+def make_template(path_d: str) -> tuple[TemplateKey, tuple[int, int]]:
+    """Return ((fmt, bases, flags), (dx, dy)) for path data `path_d`.
+
+    `dx, dy` are the first two numbers that follow an explicit `M`; absolute
+    x and y arguments are stored relative to them. Path data must be ASCII.
+    """
+    parts = iter(_TOKEN_RE.split(path_d.encode("ascii")))
+    fmt_parts: list[bytes] = []
+    literal = [next(parts)]
+    bases: list[int] = []
+    flags = bytearray()
+    first_pair: list[int] = []
+
+    explicit_cmd = 0
+    cmd = 0
+    axes = b""
+    arg_i = 0
+
+    for letter, number, sep in zip(parts, parts, parts):
+        if letter is not None:
+            explicit_cmd = cmd = letter[0]
+            axes = _AXES.get(cmd, b"")
+            arg_i = 0
+            literal.append(letter)
+            literal.append(sep)
+            continue
+
+        value = None
+        if explicit_cmd == _MOVE and len(first_pair) < 2:
+            value = _fixed(number)
+            first_pair.append(value)
+        if not axes:
+            literal.append(number)
+            literal.append(sep)
+            continue
+
+        if arg_i >= len(axes):
+            arg_i = 0
+            cmd = _IMPLICIT_NEXT.get(cmd, cmd)
+            axes = _AXES[cmd]
+        if value is None:
+            value = _fixed(number)
+        fmt_parts.append(b"".join(literal))
+        literal = [sep]
+        bases.append(value)
+        # Lowercase (relative) commands are never shifted.
+        flags.append(axes[arg_i] if cmd < 97 else 0)
+        arg_i += 1
+
+    fmt_parts.append(b"".join(literal))
+    dx = first_pair[0] if first_pair else 0
+    dy = first_pair[1] if len(first_pair) > 1 else 0
+    if dx or dy:
+        shift = (0, dx, dy)
+        bases = [base - shift[flag] for base, flag in zip(bases, flags)]
+
+    fmt = _MARKER_NUM_BYTES.join(fmt_parts).decode()
+    return (fmt, tuple(bases), bytes(flags)), (dx, dy)
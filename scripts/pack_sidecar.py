@@ -0,0 +1,51 @@
+"""Write uncompressed .lmtpack sidecars for the embedded xz packs.
+
+The generators call `write_sidecar` when run with `--sidecar-dir`; the
+bytes match `zig build pack-sidecars` (see src/pack_sidecar.zig for the
+layout). A library built with `-Dpack-sidecar-dir=DIR` maps these files
+instead of decoding the xz streams it embeds.
+"""
+
+from __future__ import annotations
+
+import struct
+import zlib
+from pathlib import Path
+
+MAGIC = b"LMTS"
+VERSION = 1
+SEGMENT_ALIGN = 64
+HEADER_LEN = 16
+RECORD_LEN = 24
+
+# Bit index of each pack in lmt_warmup's kinds_mask; also the file stem.
+KIND_INDEX = {
+    "names": 0,
+    "majmin_scenes": 1,
+    "evenness": 2,
+}
+
+
+def align(value: int) -> int:
+    return (value + SEGMENT_ALIGN - 1) // SEGMENT_ALIGN * SEGMENT_ALIGN
+
+
+def encode_sidecar(kind: str, segments: list[tuple[bytes, bytes]]) -> bytes:
+    """Build a sidecar from (raw, xz) pairs in the pack's segment order."""
+    out = bytearray(MAGIC)
+    out += struct.pack("<III", VERSION, KIND_INDEX[kind], len(segments))
+    offset = align(HEADER_LEN + len(segments) * RECORD_LEN)
+    for raw, xz in segments:
+        out += struct.pack("<QQII", offset, len(raw), len(xz), zlib.crc32(xz))
+        offset = align(offset + len(raw))
+    for raw, _ in segments:
+        out += bytes(align(len(out)) - len(out))
+        out += raw
+    return bytes(out)
+
+
+def write_sidecar(sidecar_dir: str | Path, kind: str, segments: list[tuple[bytes, bytes]]) -> Path:
+    path = Path(sidecar_dir) / f"{kind}.lmtpack"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(encode_sidecar(kind, segments))
+    return path
@@ -0,0 +1,515 @@
+//! `zig build bench -- [options]` times the hot C ABI entry points and
+//! compares the result against a stored baseline.
+
+const std = @import("std");
+const builtin = @import("builtin");
+const api = @import("c_api.zig");
+const heap = @import("heap.zig");
+const scanline = @import("render/scanline.zig");
+
+const c = @cImport({
+    @cInclude("libmusictheory.h");
+});
+
+const usage =
+    \\usage: bench [--filter SUBSTR] [--min-time-ms N] [--json OUT]
+    \\             [--baseline FILE] [--no-baseline] [--max-regression PCT]
+    \\
+    \\Runs every case for at least --min-time-ms (default 200) and prints
+    \\ns/op, ops/sec, heap allocations per op and, for pixel cases, Mpx/s. --json writes the report;
+    \\pass the baseline path to refresh it. Cases more than --max-regression
+    \\percent slower than the baseline (default: report only) fail the run.
+    \\
+;
+
+const DEFAULT_BASELINE = "bench/baseline.json";
+const SCHEMA_VERSION: u32 = 1;
+
+pub const CaseResult = struct {
+    name: []const u8,
+    iterations: u64,
+    ns_per_op: f64,
+    ops_per_sec: f64,
+    allocations_per_op: f64,
+    bytes_per_op: f64,
+    /// Megapixels per second for cases that touch a known pixel count.
+    mpx_per_sec: f64 = 0,
+};
+
+pub const Report = struct {
+    schema: u32 = SCHEMA_VERSION,
+    optimize: []const u8,
+    cases: []const CaseResult,
+};
+
+const Case = struct {
+    name: []const u8,
+    run: *const fn () u32,
+    /// Pixels touched per call, when the case is a raster kernel.
+    pixels: u64 = 0,
+    /// Render cache budget while the case runs; 0 leaves the cache off.
+    cache_budget: u32 = 0,
+};
+
+const RENDER_CACHE_BUDGET: u32 = 16 * 1024 * 1024;
+
+const cases = [_]Case{
+    .{ .name = "chord_name", .run = runChordName },
+    .{ .name = "detect_chord_matches", .run = runDetectChordMatches },
+    .{ .name = "generate_voicings_n", .run = runGenerateVoicings },
+    .{ .name = "rank_next_steps", .run = runRankNextSteps },
+    .{ .name = "rank_fret_realizations_n", .run = runRankFretRealizations },
+    .{ .name = "audit_keyboard_phrase_n", .run = runAuditKeyboardPhrase },
+    .{ .name = "rank_keyboard_phrase_repairs_n", .run = runRankKeyboardPhraseRepairs },
+    .{ .name = "svg_clock_optc", .run = runSvgClockOptc },
+    .{ .name = "svg_clock_optc_cached", .run = runSvgClockOptc, .cache_budget = RENDER_CACHE_BUDGET },
+    .{ .name = "svg_optic_k_group", .run = runSvgOpticKGroup },
+    .{ .name = "orbifold_triad_edge_at", .run = runOrbifoldTriadEdgeAt },
+    .{ .name = "svg_evenness_field", .run = runSvgEvennessField },
+    .{ .name = "svg_fret_n", .run = runSvgFretN },
+    .{ .name = "svg_chord_staff", .run = runSvgChordStaff },
+    .{ .name = "svg_key_staff", .run = runSvgKeyStaff },
+    .{ .name = "svg_keyboard", .run = runSvgKeyboard },
+    .{ .name = "svg_compat_even", .run = runSvgCompatEven },
+    .{ .name = "svg_compat_majmin_modes", .run = runSvgCompatMajminModes },
+    .{ .name = "raster_demo_rgba_256", .run = runRasterDemo },
+    .{ .name = "bitmap_clock_optc_rgba_256", .run = runBitmapClockOptc },
+    .{ .name = "bitmap_clock_optc_rgba_256_cached", .run = runBitmapClockOptc, .cache_budget = RENDER_CACHE_BUDGET },
+    .{ .name = "bitmap_keyboard_rgba_784", .run = runBitmapKeyboard, .pixels = KEYBOARD_WIDTH * KEYBOARD_HEIGHT },
+    .{ .name = "bitmap_keyboard_view_rgba_784", .run = runBitmapKeyboardView, .pixels = KEYBOARD_WIDTH * KEYBOARD_HEIGHT },
+    .{ .name = "bitmap_chord_staff_rgba_420", .run = runBitmapChordStaff, .pixels = CHORD_STAFF_WIDTH * STAFF_HEIGHT },
+    .{ .name = "bitmap_key_staff_rgba_1040", .run = runBitmapKeyStaff, .pixels = KEY_STAFF_WIDTH * STAFF_HEIGHT },
+    .{ .name = "bitmap_evenness_field_rgba_1024", .run = runBitmapEvennessField, .pixels = POSTER_SIDE * POSTER_SIDE },
+    .{ .name = "bitmap_evenness_field_stream_rgba_1024", .run = runBitmapEvennessFieldStream, .pixels = POSTER_SIDE * POSTER_SIDE },
+    .{ .name = "bitmap_evenness_field_png_stored_1024", .run = runBitmapEvennessFieldPngStored, .pixels = POSTER_SIDE * POSTER_SIDE },
+    .{ .name = "bitmap_evenness_field_png_fast_1024", .run = runBitmapEvennessFieldPngFast, .pixels = POSTER_SIDE * POSTER_SIDE },
+    .{ .name = "bitmap_compat_opc_rgba_x4", .run = runBitmapCompatOpc },
+    .{ .name = "bitmap_compat_opc_rgba_x4_tiled", .run = runBitmapCompatOpcTiled },
+    .{ .name = "coverage_row_scalar_1024", .run = runCoverageRowScalar, .pixels = COVERAGE_ROW_PIXELS },
+    .{ .name = "coverage_row_simd_1024", .run = runCoverageRowSimd, .pixels = COVERAGE_ROW_PIXELS },
+};
+
+// ── Fixtures ────────────────────────────────────────────────
+
+const CHORD_SETS = [_]u16{ 0x091, 0x089, 0x049, 0x111, 0x491, 0x891, 0x249, 0x4a9 };
+const STANDARD_TUNING = [_]u8{ 40, 45, 50, 55, 59, 64 };
+const FRETS = [_]i8{ -1, 3, 2, 0, 1, 0 };
+const KEYBOARD_NOTES = [_]u8{ 60, 64, 67, 71 };
+// Consecutive keyboard frames differ by one key, as when a player moves a
+// single finger. 48-72 is a 392x156 document, drawn here at 2x.
+const KEYBOARD_FRAMES = [_][4]u8{ .{ 60, 64, 67, 71 }, .{ 60, 64, 67, 72 } };
+const KEYBOARD_WIDTH: u32 = 784;
+const KEYBOARD_HEIGHT: u32 = 312;
+const RGBA_SIDE: u32 = 256;
+// The opc compat kind is 100x100 at scale 1, so x4 is 400x400.
+const COMPAT_SCALE: u32 = 4;
+const COMPAT_SIDE: u32 = 100 * COMPAT_SCALE;
+
+var svg_buf: [512 * 1024]u8 = undefined;
+var rgba_buf: [RGBA_SIDE * RGBA_SIDE * 4]u8 = undefined;
+var compat_rgba_buf: [COMPAT_SIDE * COMPAT_SIDE * 4]u8 = undefined;
+var keyboard_rgba_buf: [KEYBOARD_WIDTH * KEYBOARD_HEIGHT * 4]u8 = undefined;
+// Chord (210x126) and key (520x126) staff documents, also drawn at 2x.
+const CHORD_STAFF_WIDTH: u32 = 420;
+const KEY_STAFF_WIDTH: u32 = 1040;
+const STAFF_HEIGHT: u32 = 252;
+var staff_rgba_buf: [KEY_STAFF_WIDTH * STAFF_HEIGHT * 4]u8 = undefined;
+var keyboard_view_storage: [1024]u8 align(16) = undefined;
+var keyboard_view: ?*anyopaque = null;
+var dirty_rects: [16]api.LmtDirtyRect = undefined;
+// Streaming renders the same image through a 64-row band instead of a
+// full-size buffer.
+const POSTER_SIDE: u32 = 1024;
+const POSTER_BAND_ROWS: u32 = 64;
+var poster_rgba_buf: [POSTER_SIDE * POSTER_SIDE * 4]u8 = undefined;
+var poster_band_buf: [POSTER_SIDE * POSTER_BAND_ROWS * 4]u8 = undefined;
+const COVERAGE_ROW_PIXELS: u32 = 1024;
+var coverage_row: [COVERAGE_ROW_PIXELS]f64 = undefined;
+var coverage_pixels: [COVERAGE_ROW_PIXELS * 4]u8 = undefined;
+var chord_matches: [32]api.LmtChordMatch = undefined;
+var voicing_frets: [512 * STANDARD_TUNING.len]i8 = undefined;
+var history: api.LmtVoicedHistory = undefined;
+var suggestions: [16]api.LmtNextStepSuggestion = undefined;
+var fret_realizations: [16]api.LmtRankedFretRealization = undefined;
+var hand_profile: api.LmtHandProfile = undefined;
+var phrase_events: [8]api.LmtKeyboardPhraseEvent = undefined;
+var phrase_issues: [64]api.LmtPlayabilityPhraseIssue = undefined;
+var phrase_summary: api.LmtPlayabilityPhraseSummary = undefined;
+var phrase_memory: api.LmtKeyboardCommittedPhraseMemory = undefined;
+var repair_policy: api.LmtPlayabilityRepairPolicy = undefined;
+var repairs: [32]api.LmtRankedKeyboardPhraseRepair = undefined;
+var compat_even_kind: u32 = 0;
+var compat_majmin_kind: u32 = 0;
+var compat_opc_kind: u32 = 0;
+var cursor: u32 = 0;
+
+fn setupFixtures() !void {
+    api.lmt_voiced_history_reset(&history);
+    const steps = [_][3]u8{ .{ 60, 64, 67 }, .{ 60, 65, 69 }, .{ 59, 65, 67 } };
+    for (steps, 0..) |notes, beat| {
+        const cadence: u8 = if (beat + 1 == steps.len) c.LMT_CADENCE_DOMINANT else c.LMT_CADENCE_STABLE;
+        _ = api.lmt_voiced_history_push(&history, &notes, notes.len, null, 0, 0, c.LMT_MODE_IONIAN, @intCast(beat), 4, 0, cadence, null);
+    }
+
+    if (api.lmt_default_keyboard_hand_profile(&hand_profile) != 1) return error.FixtureSetup;
+    const phrase = [_][2]u8{ .{ 60, 67 }, .{ 62, 71 }, .{ 48, 72 }, .{ 64, 67 }, .{ 60, 76 }, .{ 65, 69 }, .{ 55, 79 }, .{ 60, 64 } };
+    for (phrase, &phrase_events) |notes, *event| {
+        event.* = std.mem.zeroes(api.LmtKeyboardPhraseEvent);
+        event.note_count = 2;
+        event.hand = c.LMT_KEYBOARD_HAND_RIGHT;
+        event.notes[0] = notes[0];
+        event.notes[1] = notes[1];
+    }
+
+    api.lmt_keyboard_committed_phrase_reset(&phrase_memory);
+    for (phrase_events[0..4]) |*event| {
+        if (api.lmt_keyboard_committed_phrase_push(&phrase_memory, event) == 0) return error.FixtureSetup;
+    }
+    if (api.lmt_default_playability_repair_policy(c.LMT_PLAYABILITY_REPAIR_REGISTER_ADJUSTED, &repair_policy) != 1) return error.FixtureSetup;
+
+    if (api.lmt_sizeof_bitmap_view() > keyboard_view_storage.len or api.lmt_alignof_bitmap_view() > 16) return error.FixtureSetup;
+    keyboard_view = api.lmt_bitmap_keyboard_view_init(&keyboard_view_storage, keyboard_view_storage.len, 48, 72, KEYBOARD_WIDTH, KEYBOARD_HEIGHT);
+
+    compat_even_kind = try compatKind("even");
+    compat_majmin_kind = try compatKind("majmin/modes");
+    compat_opc_kind = try compatKind("opc");
+}
+
+fn compatKind(name: []const u8) !u32 {
+    for (0..api.lmt_svg_compat_kind_count()) |index| {
+        const kind: u32 = @intCast(index);
+        if (std.mem.eql(u8, std.mem.span(api.lmt_svg_compat_kind_name(kind)), name)) return kind;
+    }
+    return error.FixtureSetup;
+}
+
+fn nextIndex(len: usize) usize {
+    cursor +%= 1;
+    return cursor % len;
+}
+
+// ── Cases ───────────────────────────────────────────────────
+
+fn runChordName() u32 {
+    const set = CHORD_SETS[nextIndex(CHORD_SETS.len)];
+    return @intCast(std.mem.len(api.lmt_chord_name(set)));
+}
+
+fn runDetectChordMatches() u32 {
+    const set = CHORD_SETS[nextIndex(CHORD_SETS.len)];
+    return api.lmt_detect_chord_matches(set, 0, true, &chord_matches, chord_matches.len);
+}
+
+fn runGenerateVoicings() u32 {
+    const set = CHORD_SETS[nextIndex(CHORD_SETS.len)];
+    return api.lmt_generate_voicings_n(set, &STANDARD_TUNING, STANDARD_TUNING.len, 12, 4, &voicing_frets, voicing_frets.len / STANDARD_TUNING.len);
+}
+
+fn runRankNextSteps() u32 {
+    return api.lmt_rank_next_steps(&history, c.LMT_COUNTERPOINT_SPECIES, &suggestions, suggestions.len);
+}
+
+fn runRankFretRealizations() u32 {
+    const note: u8 = @intCast(48 + nextIndex(24));
+    return api.lmt_rank_fret_realizations_n(note, &STANDARD_TUNING, STANDARD_TUNING.len, 5, c.LMT_FRET_TECHNIQUE_GENERIC_GUITAR, null, &fret_realizations, fret_realizations.len);
+}
+
+fn runAuditKeyboardPhrase() u32 {
+    return api.lmt_audit_keyboard_phrase_n(&phrase_events, phrase_events.len, &hand_profile, &phrase_issues, phrase_issues.len, &phrase_summary);
+}
+
+fn runRankKeyboardPhraseRepairs() u32 {
+    return api.lmt_rank_keyboard_phrase_repairs_n(&phrase_memory, &hand_profile, &repair_policy, &repairs, repairs.len);
+}
+
+fn runSvgClockOptc() u32 {
+    const set = CHORD_SETS[nextIndex(CHORD_SETS.len)];
+    return api.lmt_svg_clock_optc(set, &svg_buf, svg_buf.len);
+}
+
+fn runSvgOpticKGroup() u32 {
+    const set = CHORD_SETS[nextIndex(CHORD_SETS.len)];
+    return api.lmt_svg_optic_k_group(set, &svg_buf, svg_buf.len);
+}
+
+fn runOrbifoldTriadEdgeAt() u32 {
+    var edge: api.LmtOrbifoldTriadEdge = undefined;
+    return api.lmt_orbifold_triad_edge_at(@intCast(nextIndex(48)), &edge);
+}
+
+fn runSvgEvennessField() u32 {
+    const set = CHORD_SETS[nextIndex(CHORD_SETS.len)];
+    return api.lmt_svg_evenness_field(set, &svg_buf, svg_buf.len);
+}
+
+fn runSvgFretN() u32 {
+    return api.lmt_svg_fret_n(&FRETS, FRETS.len, 0, 5, &svg_buf, svg_buf.len);
+}
+
+fn runSvgChordStaff() u32 {
+    return api.lmt_svg_chord_staff(c.LMT_CHORD_MAJOR, @intCast(nextIndex(12)), &svg_buf, svg_buf.len);
+}
+
+fn runSvgKeyStaff() u32 {
+    return api.lmt_svg_key_staff(@intCast(nextIndex(12)), c.LMT_KEY_MAJOR, &svg_buf, svg_buf.len);
+}
+
+fn runSvgKeyboard() u32 {
+    return api.lmt_svg_keyboard(&KEYBOARD_NOTES, KEYBOARD_NOTES.len, 48, 72, &svg_buf, svg_buf.len);
+}
+
+fn runSvgCompatEven() u32 {
+    return api.lmt_svg_compat_generate(compat_even_kind, 0, &svg_buf, svg_buf.len);
+}
+
+fn runSvgCompatMajminModes() u32 {
+    return api.lmt_svg_compat_generate(compat_majmin_kind, 0, &svg_buf, svg_buf.len);
+}
+
+fn runRasterDemo() u32 {
+    return api.lmt_raster_demo_rgba(RGBA_SIDE, RGBA_SIDE, &rgba_buf, rgba_buf.len);
+}
+
+fn runBitmapClockOptc() u32 {
+    const set = CHORD_SETS[nextIndex(CHORD_SETS.len)];
+    return api.lmt_bitmap_clock_optc_rgba(set, RGBA_SIDE, RGBA_SIDE, &rgba_buf, rgba_buf.len);
+}
+
+fn runBitmapKeyboard() u32 {
+    const notes = &KEYBOARD_FRAMES[nextIndex(KEYBOARD_FRAMES.len)];
+    return api.lmt_bitmap_keyboard_rgba(notes, notes.len, 48, 72, KEYBOARD_WIDTH, KEYBOARD_HEIGHT, &keyboard_rgba_buf, keyboard_rgba_buf.len);
+}
+
+fn runBitmapChordStaff() u32 {
+    return api.lmt_bitmap_chord_staff_rgba(c.LMT_CHORD_MAJOR, @intCast(nextIndex(12)), CHORD_STAFF_WIDTH, STAFF_HEIGHT, &staff_rgba_buf, CHORD_STAFF_WIDTH * STAFF_HEIGHT * 4);
+}
+
+fn runBitmapKeyStaff() u32 {
+    return api.lmt_bitmap_key_staff_rgba(@intCast(nextIndex(12)), c.LMT_KEY_MAJOR, KEY_STAFF_WIDTH, STAFF_HEIGHT, &staff_rgba_buf, staff_rgba_buf.len);
+}
+
+fn runBitmapKeyboardView() u32 {
+    const notes = &KEYBOARD_FRAMES[nextIndex(KEYBOARD_FRAMES.len)];
+    return api.lmt_bitmap_keyboard_view_update(keyboard_view, notes, notes.len, &keyboard_rgba_buf, keyboard_rgba_buf.len, &dirty_rects, dirty_rects.len);
+}
+
+fn runBitmapEvennessField() u32 {
+    const set = CHORD_SETS[nextIndex(CHORD_SETS.len)];
+    return api.lmt_bitmap_evenness_field_rgba(set, POSTER_SIDE, POSTER_SIDE, &poster_rgba_buf, poster_rgba_buf.len);
+}
+
+fn discardRows(_: ?*anyopaque, _: u32, _: u32, rgba: [*]const u8, _: u32) callconv(.c) u32 {
+    std.mem.doNotOptimizeAway(rgba[0]);
+    return 1;
+}
+
+fn runBitmapEvennessFieldStream() u32 {
+    const set = CHORD_SETS[nextIndex(CHORD_SETS.len)];
+    return api.lmt_bitmap_evenness_field_stream_rgba(set, POSTER_SIDE, POSTER_SIDE, &poster_band_buf, poster_band_buf.len, discardRows, null);
+}
+
+fn runBitmapEvennessFieldPngStored() u32 {
+    const set = CHORD_SETS[nextIndex(CHORD_SETS.len)];
+    return api.lmt_bitmap_evenness_field_png(set, POSTER_SIDE, POSTER_SIDE, 0, &poster_rgba_buf, poster_rgba_buf.len);
+}
+
+fn runBitmapEvennessFieldPngFast() u32 {
+    const set = CHORD_SETS[nextIndex(CHORD_SETS.len)];
+    return api.lmt_bitmap_evenness_field_png(set, POSTER_SIDE, POSTER_SIDE, 1, &poster_rgba_buf, poster_rgba_buf.len);
+}
+
+fn runBitmapCompatOpc() u32 {
+    return api.lmt_bitmap_compat_render_candidate_rgba_scaled(compat_opc_kind, @intCast(nextIndex(64)), COMPAT_SCALE, 1, &compat_rgba_buf, compat_rgba_buf.len);
+}
+
+fn runBitmapCompatOpcTiled() u32 {
+    return api.lmt_bitmap_compat_render_candidate_rgba_scaled_tiled(compat_opc_kind, @intCast(nextIndex(64)), COMPAT_SCALE, 1, 0, 0, &compat_rgba_buf, compat_rgba_buf.len);
+}
+
+/// Four sub-row spans per call, as the anti-aliased fill makes for one
+/// pixel row, then one source-over blend of the accumulated row.
+fn runCoverageRow(accumulate: anytype, apply: anytype) u32 {
+    const shift: f64 = @floatFromInt(nextIndex(8));
+    @memset(&coverage_row, 0.0);
+    var sub_row: u32 = 0;
+    while (sub_row < scanline.AA_SUBPIXEL_GRID) : (sub_row += 1) {
+        const inset = shift + @as(f64, @floatFromInt(sub_row)) * 0.37;
+        accumulate(&coverage_row, 3.25 + inset, 900.6 - inset, 0.25);
+        accumulate(&coverage_row, 950.1, 1010.9 + inset, 0.25);
+    }
+    var surface = scanline.Surface{ .pixels = &coverage_pixels, .width = COVERAGE_ROW_PIXELS, .height = 1, .stride = COVERAGE_ROW_PIXELS * 4 };
+    @memset(&coverage_pixels, 0x40);
+    apply(&surface, 0, &coverage_row, .{ 17, 102, 187, 200 });
+    return coverage_pixels[COVERAGE_ROW_PIXELS * 2] +% 1;
+}
+
+fn runCoverageRowScalar() u32 {
+    return runCoverageRow(scanline.accumulateScanlineCoverageScalar, scanline.applyCoverageRowScalar);
+}
+
+fn runCoverageRowSimd() u32 {
+    return runCoverageRow(scanline.accumulateScanlineCoverage, scanline.applyCoverageRow);
+}
+
+// ── Runner ──────────────────────────────────────────────────
+
+/// Doubles the batch size until one batch lasts `min_time_ns`, then reports
+/// that final batch. The first call runs untimed so one-time pack decoding is
+/// excluded from the steady-state numbers.
+fn measure(case: Case, min_time_ns: u64) !CaseResult {
+    api.lmt_render_cache_configure(case.cache_budget);
+    defer api.lmt_render_cache_configure(0);
+    if (case.run() == 0) return error.CaseProducedNothing;
+
+    var iterations: u64 = 1;
+    while (true) {
+        const heap_before = heap.stats();
+        var timer = try std.time.Timer.start();
+        var sink: u32 = 0;
+        var i: u64 = 0;
+        while (i < iterations) : (i += 1) {
+            sink +%= case.run();
+        }
+        const elapsed_ns = timer.read();
+        std.mem.doNotOptimizeAway(sink);
+        const heap_after = heap.stats();
+
+        if (elapsed_ns >= min_time_ns or iterations >= 1 << 40) {
+            const ops: f64 = @floatFromInt(iterations);
+            const ns_per_op = @as(f64, @floatFromInt(elapsed_ns)) / ops;
+            return .{
+                .name = case.name,
+                .iterations = iterations,
+                .ns_per_op = ns_per_op,
+                .ops_per_sec = if (ns_per_op > 0) std.time.ns_per_s / ns_per_op else 0,
+                .allocations_per_op = @as(f64, @floatFromInt(heap_after.allocations - heap_before.allocations)) / ops,
+                .bytes_per_op = @as(f64, @floatFromInt(heap_after.bytes - heap_before.bytes)) / ops,
+                .mpx_per_sec = if (ns_per_op > 0) @as(f64, @floatFromInt(case.pixels)) / ns_per_op * 1000.0 else 0,
+            };
+        }
+        iterations *= 2;
+    }
+}
+
+fn findBaseline(baseline: []const CaseResult, name: []const u8) ?CaseResult {
+    for (baseline) |entry| {
+        if (std.mem.eql(u8, entry.name, name)) return entry;
+    }
+    return null;
+}
+
+pub fn main() !void {
+    const allocator = std.heap.smp_allocator;
+    const args = try std.process.argsAlloc(allocator);
+    defer std.process.argsFree(allocator, args);
+
+    var stdout_buf: [4096]u8 = undefined;
+    var stdout_writer = std.fs.File.stdout().writer(&stdout_buf);
+    const out = &stdout_writer.interface;
+
+    var filter: ?[]const u8 = null;
+    var min_time_ms: u64 = 200;
+    var json_path: ?[]const u8 = null;
+    var baseline_path: ?[]const u8 = DEFAULT_BASELINE;
+    var max_regression_pct: ?f64 = null;
+    var i: usize = 1;
+    while (i < args.len) : (i += 1) {
+        const arg = args[i];
+        if (std.mem.eql(u8, arg, "--no-baseline")) {
+            baseline_path = null;
+        } else if (i + 1 >= args.len) {
+            return fail(out, "unknown option or missing value");
+        } else if (std.mem.eql(u8, arg, "--filter")) {
+            i += 1;
+            filter = args[i];
+        } else if (std.mem.eql(u8, arg, "--min-time-ms")) {
+            i += 1;
+            min_time_ms = std.fmt.parseInt(u64, args[i], 10) catch return fail(out, "invalid --min-time-ms");
+        } else if (std.mem.eql(u8, arg, "--json")) {
+            i += 1;
+            json_path = args[i];
+        } else if (std.mem.eql(u8, arg, "--baseline")) {
+            i += 1;
+            baseline_path = args[i];
+        } else if (std.mem.eql(u8, arg, "--max-regression")) {
+            i += 1;
+            max_regression_pct = std.fmt.parseFloat(f64, args[i]) catch return fail(out, "invalid --max-regression");
+        } else {
+            return fail(out, "unknown option");
+        }
+    }
+
+    var baseline: ?std.json.Parsed(Report) = null;
+    defer if (baseline) |parsed| parsed.deinit();
+    if (baseline_path) |path| {
+        if (std.fs.cwd().readFileAlloc(allocator, path, 1 << 20)) |data| {
+            defer allocator.free(data);
+            baseline = std.json.parseFromSlice(Report, allocator, data, .{ .ignore_unknown_fields = true, .allocate = .alloc_always }) catch
+                return fail(out, "baseline is not a bench report");
+        } else |err| switch (err) {
+            error.FileNotFound => {},
+            else => return err,
+        }
+    }
+    const baseline_cases: []const CaseResult = if (baseline) |parsed| parsed.value.cases else &.{};
+
+    try setupFixtures();
+
+    var results: [cases.len]CaseResult = undefined;
+    var result_count: usize = 0;
+    var regressions: usize = 0;
+
+    try out.print("{s:<32} {s:>12} {s:>14} {s:>10} {s:>10} {s:>10}\n", .{ "case", "ns/op", "ops/sec", "allocs/op", "vs base", "Mpx/s" });
+    for (cases) |case| {
+        if (filter) |needle| {
+            if (std.mem.indexOf(u8, case.name, needle) == null) continue;
+        }
+        const result = try measure(case, min_time_ms * std.time.ns_per_ms);
+        results[result_count] = result;
+        result_count += 1;
+
+        try out.print("{s:<32} {d:>12.1} {d:>14.0} {d:>10.2}", .{ result.name, result.ns_per_op, result.ops_per_sec, result.allocations_per_op });
+        if (findBaseline(baseline_cases, result.name)) |base| {
+            const delta_pct = (result.ns_per_op - base.ns_per_op) / base.ns_per_op * 100.0;
+            var delta_buf: [32]u8 = undefined;
+            const delta = try std.fmt.bufPrint(&delta_buf, "{s}{d:.1}%", .{ if (delta_pct >= 0) "+" else "-", @abs(delta_pct) });
+            try out.print(" {s:>10}", .{delta});
+            if (max_regression_pct) |limit| {
+                if (delta_pct > limit) {
+                    regressions += 1;
+                    try out.writeAll("  REGRESSION");
+                }
+            }
+        } else {
+            try out.print(" {s:>10}", .{"-"});
+        }
+        if (result.mpx_per_sec > 0) try out.print(" {d:>10.1}", .{result.mpx_per_sec});
+        try out.writeAll("\n");
+        try out.flush();
+    }
+
+    if (json_path) |path| {
+        const report = Report{ .optimize = @tagName(builtin.mode), .cases = results[0..result_count] };
+        var file = try std.fs.cwd().createFile(path, .{});
+        defer file.close();
+        var file_buf: [4096]u8 = undefined;
+        var file_writer = file.writer(&file_buf);
+        try std.json.Stringify.value(report, .{ .whitespace = .indent_2 }, &file_writer.interface);
+        try file_writer.interface.writeAll("\n");
+        try file_writer.interface.flush();
+        try out.print("wrote {s}\n", .{path});
+    }
+
+    if (regressions > 0) {
+        try out.print("{d} case(s) regressed more than {d:.1}%\n", .{ regressions, max_regression_pct.? });
+        try out.flush();
+        std.process.exit(1);
+    }
+    try out.flush();
+}
+
+fn fail(out: *std.Io.Writer, message: []const u8) !void {
+    try out.print("bench: {s}\n\n{s}", .{ message, usage });
+    try out.flush();
+    std.process.exit(2);
+}
@@ -1,4 +1,5 @@
 const std = @import("std");
+const builtin = @import("builtin");
 
 const svg_compat = @import("harmonious_svg_compat.zig");
 const cluster = @import("cluster.zig");
@@ -11,6 +12,23 @@ const svg_fret = @import("svg/fret.zig");
 const chord_compat = @import("svg/chord_compat.zig");
 const svg_clock_compat = @import("svg/clock_compat.zig");
 const text_misc = @import("svg/text_misc.zig");
+const scanline = @import("render/scanline.zig");
+
+const Point = scanline.Point;
+const Edge = scanline.Edge;
+const Matrix = scanline.Matrix;
+const PathBuilder = scanline.PathBuilder;
+const fillEdges = scanline.fillEdges;
+const blendCoverage = scanline.blendCoverage;
+const strokeEdges = scanline.strokeEdges;
+const drawLineSegment = scanline.drawLineSegment;
+const isAxisAligned = scanline.isAxisAligned;
+const buildEllipseEdges = scanline.buildEllipseEdges;
+const buildRoundedRectEdges = scanline.buildRoundedRectEdges;
+const clear = scanline.clear;
+const drawRect = scanline.drawRect;
+const drawCircle = scanline.drawCircle;
+const pixelPtr = scanline.pixelPtr;
 
 pub const SCALE_NUMERATOR: u32 = 55;
 pub const SCALE_DENOMINATOR: u32 = 100;
@@ -24,15 +42,10 @@ pub const TARGET_HEIGHT_VERTICAL_TEXT: u32 = scaledDimDefault(90);
 pub const MAX_TEST_TARGET_WIDTH: usize = 800;
 pub const MAX_TEST_TARGET_HEIGHT: usize = 512;
 
-const PATH_EDGE_LIMIT: usize = 4096;
 const TAG_TRANSFORM_STACK_LIMIT: usize = 16;
 const OC_TEMPLATE_BUFFER_LIMIT: usize = 8 * 1024;
 const CHORD_COMPAT_SVG_BUFFER_LIMIT: usize = 64 * 1024;
-const GENERATED_COMPAT_SVG_BUFFER_LIMIT: usize = 512 * 1024;
-const AA_SUBPIXEL_GRID: u32 = 4;
-const AA_ROW_COVERAGE_LIMIT: usize = 8192;
-const CIRCLE_AA_SUBPIXEL_GRID: u32 = 16;
-const PIXEL_CORNER_RADIUS: f64 = 0.7071067811865476;
+pub const GENERATED_COMPAT_SVG_BUFFER_LIMIT: usize = 512 * 1024;
 const SCALE_SOURCE_WIDTH: f64 = 363.0;
 const SCALE_SOURCE_HEIGHT: f64 = 113.0;
 const EVEN_SOURCE_WIDTH: u32 = 500;
@@ -104,12 +117,8 @@ const OPC_FILL_COLORS = [_][4]u8{
     hexColor("#ff0"), hexColor("#1e0"), hexColor("#094"), hexColor("#0bb"), hexColor("#16b"), hexColor("#28f"),
 };
 
-pub const Surface = struct {
-    pixels: []u8,
-    width: u32,
-    height: u32,
-    stride: u32,
-};
+pub const Surface = scanline.Surface;
+pub const PixelRect = scanline.PixelRect;
 
 pub fn renderSvgMarkupRgba(width: u32, height: u32, svg: []const u8, out_rgba: []u8) Error!usize {
     const required: u64 = @as(u64, width) * @as(u64, height) * 4;
@@ -126,6 +135,77 @@ pub fn renderSvgMarkupRgba(width: u32, height: u32, svg: []const u8, out_rgba: [
     return @as(usize, @intCast(required));
 }
 
+/// Composites `svg` over the pixels already in `out_rgba` instead of clearing
+/// them first. Batch renderers rasterize a shared base once, copy it per item,
+/// and overlay only the markup that differs.
+pub fn overlaySvgMarkupRgba(width: u32, height: u32, svg: []const u8, out_rgba: []u8) Error!usize {
+    const required: u64 = @as(u64, width) * @as(u64, height) * 4;
+    if (width == 0 or height == 0 or required == 0 or required > out_rgba.len) return error.OutputTooSmall;
+
+    var surface = Surface{
+        .pixels = out_rgba[0..@as(usize, @intCast(required))],
+        .width = width,
+        .height = height,
+        .stride = width * 4,
+    };
+    try drawSvgDocumentExtended(&surface, svg);
+    return @as(usize, @intCast(required));
+}
+
+/// Re-renders `svg` inside `rect` only, leaving every other pixel of
+/// `out_rgba` as it was. The rectangle is cleared and every draw replays
+/// clipped to it, so its pixels match `renderSvgMarkupRgba` exactly.
+pub fn redrawSvgMarkupRgbaRect(width: u32, height: u32, svg: []const u8, out_rgba: []u8, rect: PixelRect) Error!usize {
+    const required: u64 = @as(u64, width) * @as(u64, height) * 4;
+    if (width == 0 or height == 0 or required == 0 or required > out_rgba.len) return error.OutputTooSmall;
+
+    const surface = Surface{
+        .pixels = out_rgba[0..@as(usize, @intCast(required))],
+        .width = width,
+        .height = height,
+        .stride = width * 4,
+    };
+    var clipped = surface.clip(rect);
+    clear(&clipped, .{ 0, 0, 0, 0 });
+    try drawSvgDocumentExtended(&clipped, svg);
+    return @as(usize, @intCast(required));
+}
+
+/// Largest width or height `streamSvgMarkupRgba` accepts; it keeps row
+/// strides within u32 and pixel coordinates within i32.
+pub const STREAM_DIMENSION_LIMIT: u32 = 1 << 28;
+
+/// Renders `svg` at `width` x `height` one band of rows at a time, so peak
+/// memory is `band_rgba` however large the image is. Each band is cleared,
+/// drawn with everything outside it culled, and passed to
+/// `sink.emit(first_row, row_count, rgba)`; concatenated, the bands match
+/// `renderSvgMarkupRgba` byte for byte. A false return from `emit` stops
+/// the render. Returns the number of rows delivered.
+pub fn streamSvgMarkupRgba(width: u32, height: u32, svg: []const u8, band_rgba: []u8, sink: anytype) Error!u32 {
+    if (width == 0 or height == 0 or width > STREAM_DIMENSION_LIMIT or height > STREAM_DIMENSION_LIMIT) return error.InvalidImage;
+    const stride = width * 4;
+    const band_rows: u32 = @intCast(@min(height, band_rgba.len / stride));
+    if (band_rows == 0) return error.OutputTooSmall;
+
+    var first_row: u32 = 0;
+    while (first_row < height) {
+        const row_count = @min(band_rows, height - first_row);
+        const band = Surface{
+            .pixels = band_rgba[0 .. @as(usize, row_count) * stride],
+            .width = width,
+            .height = height,
+            .stride = stride,
+            .origin_row = first_row,
+        };
+        var surface = band.band(first_row, first_row + row_count);
+        try renderSvgDocumentExtended(&surface, svg);
+        const keep_going = sink.emit(first_row, row_count, surface.pixels);
+        first_row += row_count;
+        if (!keep_going) break;
+    }
+    return first_row;
+}
+
 pub fn renderPublicOpticKGroupRgba(width: u32, height: u32, set: pcs.PitchClassSet, out_rgba: []u8) Error!usize {
     const required: u64 = @as(u64, width) * @as(u64, height) * 4;
     if (width == 0 or height == 0 or required == 0 or required > out_rgba.len) return error.OutputTooSmall;
@@ -404,11 +484,6 @@ fn publicGridBottom(window: PublicFretWindow) f64 {
     return 20.0 + @as(f64, @floatFromInt(window.end - window.start)) * 15.0;
 }
 
-const Point = struct {
-    x: f64,
-    y: f64,
-};
-
 const ViewBox = struct {
     min_x: f64,
     min_y: f64,
@@ -416,49 +491,6 @@ const ViewBox = struct {
     height: f64,
 };
 
-const Edge = struct {
-    a: Point,
-    b: Point,
-};
-
-const ScanIntersection = struct {
-    x: f64,
-    delta: i32,
-};
-
-const Matrix = struct {
-    a: f64 = 1.0,
-    b: f64 = 0.0,
-    c: f64 = 0.0,
-    d: f64 = 1.0,
-    e: f64 = 0.0,
-    f: f64 = 0.0,
-
-    fn multiply(lhs: Matrix, rhs: Matrix) Matrix {
-        return .{
-            .a = lhs.a * rhs.a + lhs.c * rhs.b,
-            .b = lhs.b * rhs.a + lhs.d * rhs.b,
-            .c = lhs.a * rhs.c + lhs.c * rhs.d,
-            .d = lhs.b * rhs.c + lhs.d * rhs.d,
-            .e = lhs.a * rhs.e + lhs.c * rhs.f + lhs.e,
-            .f = lhs.b * rhs.e + lhs.d * rhs.f + lhs.f,
-        };
-    }
-
-    fn apply(self: Matrix, x: f64, y: f64) Point {
-        return .{
-            .x = self.a * x + self.c * y + self.e,
-            .y = self.b * x + self.d * y + self.f,
-        };
-    }
-
-    fn approxUniformScale(self: Matrix) f64 {
-        const sx = @sqrt(self.a * self.a + self.b * self.b);
-        const sy = @sqrt(self.c * self.c + self.d * self.d);
-        return (sx + sy) / 2.0;
-    }
-};
-
 const Paint = struct {
     fill: [4]u8 = .{ 0, 0, 0, 0 },
     stroke: [4]u8 = .{ 0, 0, 0, 0 },
@@ -468,81 +500,6 @@ const Paint = struct {
     non_scaling_stroke: bool = false,
 };
 
-const PathBuilder = struct {
-    edges: [PATH_EDGE_LIMIT]Edge = undefined,
-    edge_count: usize = 0,
-    current: Point = .{ .x = 0.0, .y = 0.0 },
-    subpath_start: Point = .{ .x = 0.0, .y = 0.0 },
-    has_current: bool = false,
-    last_cubic_ctrl: ?Point = null,
-    last_quadratic_ctrl: ?Point = null,
-    prev_cmd: u8 = 0,
-
-    fn moveTo(self: *PathBuilder, point: Point) void {
-        self.current = point;
-        self.subpath_start = point;
-        self.has_current = true;
-        self.last_cubic_ctrl = null;
-        self.last_quadratic_ctrl = null;
-    }
-
-    fn lineTo(self: *PathBuilder, transform: Matrix, point: Point) Error!void {
-        if (!self.has_current) {
-            self.moveTo(point);
-            return;
-        }
-        if (self.edge_count >= self.edges.len) return error.PathOverflow;
-        self.edges[self.edge_count] = .{
-            .a = transform.apply(self.current.x, self.current.y),
-            .b = transform.apply(point.x, point.y),
-        };
-        self.edge_count += 1;
-        self.current = point;
-        self.last_cubic_ctrl = null;
-        self.last_quadratic_ctrl = null;
-    }
-
-    fn cubicTo(self: *PathBuilder, transform: Matrix, ctrl1: Point, ctrl2: Point, point: Point) Error!void {
-        const start = self.current;
-        const steps = cubicStepCount(start, ctrl1, ctrl2, point, transform.approxUniformScale());
-
-        var i: u32 = 1;
-        while (i <= steps) : (i += 1) {
-            const t = @as(f64, @floatFromInt(i)) / @as(f64, @floatFromInt(steps));
-            const next = cubicPoint(start, ctrl1, ctrl2, point, t);
-            try self.lineTo(transform, next);
-        }
-        self.current = point;
-        self.last_cubic_ctrl = ctrl2;
-        self.last_quadratic_ctrl = null;
-    }
-
-    fn quadraticTo(self: *PathBuilder, transform: Matrix, ctrl: Point, point: Point) Error!void {
-        const start = self.current;
-        const steps = quadraticStepCount(start, ctrl, point, transform.approxUniformScale());
-
-        var i: u32 = 1;
-        while (i <= steps) : (i += 1) {
-            const t = @as(f64, @floatFromInt(i)) / @as(f64, @floatFromInt(steps));
-            const next = quadraticPoint(start, ctrl, point, t);
-            try self.lineTo(transform, next);
-        }
-        self.current = point;
-        self.last_cubic_ctrl = null;
-        self.last_quadratic_ctrl = ctrl;
-    }
-
-    fn closePath(self: *PathBuilder, transform: Matrix) Error!void {
-        if (!self.has_current) return;
-        if (@abs(self.current.x - self.subpath_start.x) > 0.0000001 or @abs(self.current.y - self.subpath_start.y) > 0.0000001) {
-            try self.lineTo(transform, self.subpath_start);
-        }
-        self.current = self.subpath_start;
-        self.last_cubic_ctrl = null;
-        self.last_quadratic_ctrl = null;
-    }
-};
-
 const PathReader = struct {
     text: []const u8,
     index: usize = 0,
@@ -680,6 +637,17 @@ pub fn renderCandidateRgba(kind_index: usize, image_index: usize, out_rgba: []u8
 }
 
 pub fn renderCandidateRgbaScaled(kind_index: usize, image_index: usize, scale_numerator: u32, scale_denominator: u32, out_rgba: []u8) Error!usize {
+    return renderCandidateRgbaScaledWithScratch(kind_index, image_index, scale_numerator, scale_denominator, &generated_compat_svg_buffer, out_rgba);
+}
+
+/// Same as `renderCandidateRgba`, but generated-SVG kinds render their
+/// markup into `svg_scratch` instead of the module's shared buffer, so
+/// threads with their own scratch may render concurrently.
+pub fn renderCandidateRgbaWithScratch(kind_index: usize, image_index: usize, svg_scratch: []u8, out_rgba: []u8) Error!usize {
+    return renderCandidateRgbaScaledWithScratch(kind_index, image_index, SCALE_NUMERATOR, SCALE_DENOMINATOR, svg_scratch, out_rgba);
+}
+
+pub fn renderCandidateRgbaScaledWithScratch(kind_index: usize, image_index: usize, scale_numerator: u32, scale_denominator: u32, svg_scratch: []u8, out_rgba: []u8) Error!usize {
     const kind_id = svg_compat.kindId(kind_index) orelse return error.UnsupportedKind;
     if (!kindSupported(kind_index)) return error.UnsupportedKind;
 
@@ -687,29 +655,121 @@ pub fn renderCandidateRgbaScaled(kind_index: usize, image_index: usize, scale_nu
     if (required == 0) return error.UnsupportedKind;
     if (out_rgba.len < required) return error.OutputTooSmall;
 
-    const image_name = svg_compat.imageName(kind_index, image_index) orelse return error.InvalidImage;
+    if (svg_compat.imageName(kind_index, image_index) == null) return error.InvalidImage;
     var surface = try initSurface(kind_id, required, out_rgba, scale_numerator, scale_denominator);
+    try renderCandidateInto(&surface, kind_index, image_index, scale_numerator, scale_denominator, svg_scratch);
+    return required;
+}
 
-    switch (kind_id) {
-        .even => try renderGeneratedCompatCandidateExtended(&surface, kind_index, image_index),
-        .scale => try renderGeneratedCompatCandidate(&surface, kind_index, image_index),
-        .opc => try renderOpcCandidate(&surface, image_name, scale_numerator, scale_denominator),
-        .oc => try renderOcCandidate(&surface, image_name),
-        .optc => try renderOptcCandidate(&surface, image_name),
-        .eadgbe => try renderEadgbeCandidate(&surface, image_name, scale_numerator, scale_denominator),
-        .grand_chord => try renderChordCompatCandidate(&surface, image_name, .grand_chord),
-        .chord => try renderChordCompatCandidate(&surface, image_name, .chord),
-        .wide_chord => try renderChordCompatCandidate(&surface, image_name, .wide_chord),
-        .chord_clipped => try renderChordCompatCandidate(&surface, image_name, .chord_clipped),
-        .center_square_text => try renderCenterSquareCandidate(&surface, image_name, scale_numerator, scale_denominator),
-        .vert_text_black => try renderVerticalTextCandidate(&surface, image_name, false, scale_numerator, scale_denominator),
-        .vert_text_b2t_black => try renderVerticalTextCandidate(&surface, image_name, true, scale_numerator, scale_denominator),
-        .majmin_modes, .majmin_scales => try renderGeneratedCompatCandidateExtended(&surface, kind_index, image_index),
+pub const TiledOptions = struct {
+    /// Horizontal bands; 0 uses one per worker thread.
+    band_count: usize = 0,
+    /// Worker threads; 0 uses the CPU count.
+    thread_count: usize = 0,
+};
+
+pub const TiledError = Error || std.mem.Allocator.Error || std.Thread.SpawnError;
+
+/// Bands are only rendered concurrently where threads exist; elsewhere they
+/// run one after another, which gives the same bytes.
+const tiled_threads_supported = !builtin.single_threaded and !builtin.target.cpu.arch.isWasm();
+const TILED_MIN_BAND_ROWS: u32 = 16;
+
+const Band = struct {
+    surface: Surface,
+    kind_index: usize,
+    image_index: usize,
+    scale_numerator: u32,
+    scale_denominator: u32,
+    svg_scratch: []u8,
+    result: Error!void = {},
+    done: std.Thread.ResetEvent = .{},
+};
+
+fn renderBand(band: *Band) void {
+    defer band.done.set();
+    band.result = renderCandidateInto(&band.surface, band.kind_index, band.image_index, band.scale_numerator, band.scale_denominator, band.svg_scratch);
+}
+
+/// Same bytes as `renderCandidateRgbaScaledWithScratch`, rendered as
+/// horizontal bands on a `std.Thread.Pool`. Each band replays the image
+/// clipped to its rows and only keeps the path edges that reach them.
+/// `allocator` must be thread-safe.
+pub fn renderCandidateRgbaScaledTiled(allocator: std.mem.Allocator, kind_index: usize, image_index: usize, scale_numerator: u32, scale_denominator: u32, out_rgba: []u8, options: TiledOptions) TiledError!usize {
+    const kind_id = svg_compat.kindId(kind_index) orelse return error.UnsupportedKind;
+    if (!kindSupported(kind_index)) return error.UnsupportedKind;
+
+    const required = requiredRgbaBytesScaled(kind_index, image_index, scale_numerator, scale_denominator);
+    if (required == 0) return error.UnsupportedKind;
+    if (out_rgba.len < required) return error.OutputTooSmall;
+    if (svg_compat.imageName(kind_index, image_index) == null) return error.InvalidImage;
+    const surface = try initSurface(kind_id, required, out_rgba, scale_numerator, scale_denominator);
+
+    const thread_count = if (options.thread_count != 0) options.thread_count else std.Thread.getCpuCount() catch 1;
+    const requested = if (options.band_count != 0) options.band_count else thread_count;
+    const band_count = @max(1, @min(requested, surface.height / TILED_MIN_BAND_ROWS));
+    const scratch_bytes: usize = switch (kind_id) {
+        .even, .scale, .majmin_modes, .majmin_scales => GENERATED_COMPAT_SVG_BUFFER_LIMIT,
+        else => 0,
+    };
+
+    const bands = try allocator.alloc(Band, band_count);
+    defer allocator.free(bands);
+    const scratch = try allocator.alloc(u8, scratch_bytes * band_count);
+    defer allocator.free(scratch);
+
+    // Decode the lazily unpacked name and template packs on this thread so
+    // workers only ever read them.
+    if (scratch_bytes != 0) _ = svg_compat.generateByIndex(kind_index, image_index, scratch[0..scratch_bytes]);
+
+    const rows_per_band: u32 = @intCast(std.math.divCeil(usize, surface.height, band_count) catch unreachable);
+    for (bands, 0..) |*band, i| {
+        const start: u32 = @intCast(i * rows_per_band);
+        band.* = .{
+            .surface = surface.band(start, @min(surface.height, start + rows_per_band)),
+            .kind_index = kind_index,
+            .image_index = image_index,
+            .scale_numerator = scale_numerator,
+            .scale_denominator = scale_denominator,
+            .svg_scratch = scratch[i * scratch_bytes ..][0..scratch_bytes],
+        };
+    }
+
+    if (!tiled_threads_supported or band_count == 1 or thread_count == 1) {
+        for (bands) |*band| renderBand(band);
+    } else {
+        var pool: std.Thread.Pool = undefined;
+        try pool.init(.{ .allocator = allocator, .n_jobs = @min(thread_count, band_count) });
+        defer pool.deinit();
+        for (bands) |*band| pool.spawn(renderBand, .{band}) catch renderBand(band);
+        for (bands) |*band| band.done.wait();
     }
 
+    for (bands) |band| try band.result;
     return required;
 }
 
+fn renderCandidateInto(surface: *Surface, kind_index: usize, image_index: usize, scale_numerator: u32, scale_denominator: u32, svg_scratch: []u8) Error!void {
+    const kind_id = svg_compat.kindId(kind_index) orelse return error.UnsupportedKind;
+    const image_name = svg_compat.imageName(kind_index, image_index) orelse return error.InvalidImage;
+    switch (kind_id) {
+        .even => try renderGeneratedCompatCandidateExtended(surface, kind_index, image_index, svg_scratch),
+        .scale => try renderGeneratedCompatCandidate(surface, kind_index, image_index, svg_scratch),
+        .opc => try renderOpcCandidate(surface, image_name, scale_numerator, scale_denominator),
+        .oc => try renderOcCandidate(surface, image_name),
+        .optc => try renderOptcCandidate(surface, image_name),
+        .eadgbe => try renderEadgbeCandidate(surface, image_name, scale_numerator, scale_denominator),
+        .grand_chord => try renderChordCompatCandidate(surface, image_name, .grand_chord),
+        .chord => try renderChordCompatCandidate(surface, image_name, .chord),
+        .wide_chord => try renderChordCompatCandidate(surface, image_name, .wide_chord),
+        .chord_clipped => try renderChordCompatCandidate(surface, image_name, .chord_clipped),
+        .center_square_text => try renderCenterSquareCandidate(surface, image_name, scale_numerator, scale_denominator),
+        .vert_text_black => try renderVerticalTextCandidate(surface, image_name, false, scale_numerator, scale_denominator),
+        .vert_text_b2t_black => try renderVerticalTextCandidate(surface, image_name, true, scale_numerator, scale_denominator),
+        .majmin_modes, .majmin_scales => try renderGeneratedCompatCandidateExtended(surface, kind_index, image_index, svg_scratch),
+    }
+}
+
 pub fn renderReferenceSvgRgba(kind_index: usize, svg: []const u8, out_rgba: []u8) Error!usize {
     return renderReferenceSvgRgbaScaled(kind_index, svg, SCALE_NUMERATOR, SCALE_DENOMINATOR, out_rgba);
 }
@@ -1090,6 +1150,10 @@ fn renderSvgDocument(surface: *Surface, svg: []const u8) Error!void {
 
 fn renderSvgDocumentExtended(surface: *Surface, svg: []const u8) Error!void {
     clear(surface, .{ 0, 0, 0, 0 });
+    try drawSvgDocumentExtended(surface, svg);
+}
+
+fn drawSvgDocumentExtended(surface: *Surface, svg: []const u8) Error!void {
     const root = try svgDocumentMatrix(surface, svg);
     var gradients = GradientRegistry{};
     try collectLinearGradients(svg, &gradients);
@@ -1263,14 +1327,14 @@ fn renderChordCompatCandidate(surface: *Surface, image_name: []const u8, kind: c
     try renderSvgDocument(surface, svg);
 }
 
-fn renderGeneratedCompatCandidate(surface: *Surface, kind_index: usize, image_index: usize) Error!void {
-    const svg = svg_compat.generateByIndex(kind_index, image_index, &generated_compat_svg_buffer);
+fn renderGeneratedCompatCandidate(surface: *Surface, kind_index: usize, image_index: usize, svg_buf: []u8) Error!void {
+    const svg = svg_compat.generateByIndex(kind_index, image_index, svg_buf);
     if (svg.len == 0) return error.InvalidImage;
     try renderSvgDocument(surface, svg);
 }
 
-fn renderGeneratedCompatCandidateExtended(surface: *Surface, kind_index: usize, image_index: usize) Error!void {
-    const svg = svg_compat.generateByIndex(kind_index, image_index, &generated_compat_svg_buffer);
+fn renderGeneratedCompatCandidateExtended(surface: *Surface, kind_index: usize, image_index: usize, svg_buf: []u8) Error!void {
+    const svg = svg_compat.generateByIndex(kind_index, image_index, svg_buf);
     if (svg.len == 0) return error.InvalidImage;
     try renderSvgDocumentExtended(surface, svg);
 }
@@ -1844,54 +1908,6 @@ fn renderRectTag(tag_text: []const u8, root: Matrix, surface: *Surface) Error!vo
     }
 }
 
-fn buildRoundedRectEdges(x: f64, y: f64, width: f64, height: f64, rx: f64, ry: f64, transform: Matrix, edges: *[40]Edge) usize {
-    const arc_segments: usize = 8;
-
-    var points: [41]Point = undefined;
-    var point_count: usize = 0;
-
-    points[point_count] = transform.apply(x + rx, y);
-    point_count += 1;
-    points[point_count] = transform.apply(x + width - rx, y);
-    point_count += 1;
-
-    appendRoundedCornerPoints(&points, &point_count, transform, x + width - rx, y + ry, rx, ry, -std.math.pi / 2.0, 0.0, arc_segments);
-    points[point_count] = transform.apply(x + width, y + height - ry);
-    point_count += 1;
-
-    appendRoundedCornerPoints(&points, &point_count, transform, x + width - rx, y + height - ry, rx, ry, 0.0, std.math.pi / 2.0, arc_segments);
-    points[point_count] = transform.apply(x + rx, y + height);
-    point_count += 1;
-
-    appendRoundedCornerPoints(&points, &point_count, transform, x + rx, y + height - ry, rx, ry, std.math.pi / 2.0, std.math.pi, arc_segments);
-    points[point_count] = transform.apply(x, y + ry);
-    point_count += 1;
-
-    appendRoundedCornerPoints(&points, &point_count, transform, x + rx, y + ry, rx, ry, std.math.pi, 3.0 * std.math.pi / 2.0, arc_segments);
-
-    var edge_count: usize = 0;
-    var i: usize = 0;
-    while (i < point_count) : (i += 1) {
-        const next = (i + 1) % point_count;
-        edges[edge_count] = .{ .a = points[i], .b = points[next] };
-        edge_count += 1;
-    }
-    return edge_count;
-}
-
-fn appendRoundedCornerPoints(points: *[41]Point, point_count: *usize, transform: Matrix, cx: f64, cy: f64, rx: f64, ry: f64, start_angle: f64, end_angle: f64, segments: usize) void {
-    var segment: usize = 1;
-    while (segment <= segments) : (segment += 1) {
-        const t = @as(f64, @floatFromInt(segment)) / @as(f64, @floatFromInt(segments));
-        const angle = start_angle + (end_angle - start_angle) * t;
-        points[point_count.*] = transform.apply(
-            cx + std.math.cos(angle) * rx,
-            cy + std.math.sin(angle) * ry,
-        );
-        point_count.* += 1;
-    }
-}
-
 fn renderLineTag(tag_text: []const u8, parent_transform: Matrix, surface: *Surface) Error!void {
     var paint = Paint{};
     applyPaintAttrs(tag_text, &paint);
@@ -1987,19 +2003,6 @@ fn renderPathTagExtended(tag_text: []const u8, parent_transform: Matrix, surface
     }
 }
 
-fn buildEllipseEdges(cx: f64, cy: f64, rx: f64, ry: f64, transform: Matrix, edges: *[96]Edge) usize {
-    const step_count = edges.len;
-    var prev = transform.apply(cx + rx, cy);
-    var index: usize = 0;
-    while (index < step_count) : (index += 1) {
-        const angle = (2.0 * std.math.pi * @as(f64, @floatFromInt(index + 1))) / @as(f64, @floatFromInt(step_count));
-        const next = transform.apply(cx + std.math.cos(angle) * rx, cy + std.math.sin(angle) * ry);
-        edges[index] = .{ .a = prev, .b = next };
-        prev = next;
-    }
-    return step_count;
-}
-
 fn renderPathFill(surface: *Surface, d: []const u8, transform: Matrix, fill: [4]u8) Error!void {
     if (fill[3] == 0) return;
 
@@ -2155,222 +2158,26 @@ fn buildPathEdges(d: []const u8, transform: Matrix, builder: *PathBuilder) Error
     }
 }
 
-fn edgeBounds(edges: []const Edge) struct { min_x: f64, max_x: f64, min_y: f64, max_y: f64 } {
-    var min_x = edges[0].a.x;
-    var max_x = edges[0].a.x;
-    var min_y = edges[0].a.y;
-    var max_y = edges[0].a.y;
-    for (edges) |edge| {
-        min_x = @min(min_x, @min(edge.a.x, edge.b.x));
-        max_x = @max(max_x, @max(edge.a.x, edge.b.x));
-        min_y = @min(min_y, @min(edge.a.y, edge.b.y));
-        max_y = @max(max_y, @max(edge.a.y, edge.b.y));
-    }
-    return .{ .min_x = min_x, .max_x = max_x, .min_y = min_y, .max_y = max_y };
-}
-
-fn sortScanIntersections(items: []ScanIntersection) void {
-    var i: usize = 1;
-    while (i < items.len) : (i += 1) {
-        const value = items[i];
-        var j = i;
-        while (j > 0 and items[j - 1].x > value.x) : (j -= 1) {
-            items[j] = items[j - 1];
-        }
-        items[j] = value;
-    }
-}
-
-fn collectScanIntersections(edges: []const Edge, y: f64, out: *[PATH_EDGE_LIMIT]ScanIntersection) usize {
-    var count: usize = 0;
-    for (edges) |edge| {
-        const ay = edge.a.y;
-        const by = edge.b.y;
-        if ((ay <= y and by > y) or (by <= y and ay > y)) {
-            if (count >= out.len) break;
-            const t = (y - ay) / (by - ay);
-            out[count] = .{
-                .x = edge.a.x + (edge.b.x - edge.a.x) * t,
-                .delta = if (by > ay) 1 else -1,
-            };
-            count += 1;
-        }
-    }
-    sortScanIntersections(out[0..count]);
-    return count;
-}
-
-fn fillEdgesHard(surface: *Surface, edges: []const Edge, fill: [4]u8) void {
-    if (edges.len == 0 or fill[3] == 0) return;
-    const bounds = edgeBounds(edges);
-    const y0: i32 = @as(i32, @intFromFloat(@floor(bounds.min_y))) - 1;
-    const y1: i32 = @as(i32, @intFromFloat(@ceil(bounds.max_y))) + 1;
-    var intersections: [PATH_EDGE_LIMIT]ScanIntersection = undefined;
-
-    var py = y0;
-    while (py <= y1) : (py += 1) {
-        const y = @as(f64, @floatFromInt(py)) + 0.5;
-        const count = collectScanIntersections(edges, y, &intersections);
-        if (count == 0) continue;
-
-        var winding: i32 = 0;
-        var prev_x: f64 = intersections[0].x;
-        var i: usize = 0;
-        while (i < count) {
-            const current_x = intersections[i].x;
-            if (winding != 0) {
-                const px0 = @max(0, @as(i32, @intFromFloat(@floor(prev_x))));
-                const px1 = @min(@as(i32, @intCast(surface.width)), @as(i32, @intFromFloat(@ceil(current_x))));
-                var px = px0;
-                while (px < px1) : (px += 1) {
-                    const coverage = intervalCoverage(prev_x, current_x, px);
-                    if (coverage <= 0.0) continue;
-                    if (pixelPtr(surface, px, py)) |dst| blendCoverage(dst, fill, coverage);
-                }
-            }
-
-            var delta_sum: i32 = 0;
-            while (i < count and @abs(intersections[i].x - current_x) <= 0.0000001) : (i += 1) {
-                delta_sum += intersections[i].delta;
-            }
-            winding += delta_sum;
-            prev_x = current_x;
-        }
-    }
-}
-
-fn fillEdges(surface: *Surface, edges: []const Edge, fill: [4]u8) void {
-    if (edges.len == 0 or fill[3] == 0) return;
-    if (surface.width > AA_ROW_COVERAGE_LIMIT) {
-        fillEdgesHard(surface, edges, fill);
-        return;
-    }
-
-    const bounds = edgeBounds(edges);
-    const y0: i32 = @as(i32, @intFromFloat(@floor(bounds.min_y))) - 1;
-    const y1: i32 = @as(i32, @intFromFloat(@ceil(bounds.max_y))) + 1;
-    var intersections: [PATH_EDGE_LIMIT]ScanIntersection = undefined;
-    var row_coverage: [AA_ROW_COVERAGE_LIMIT]f64 = undefined;
-    const subpixel_grid_f64 = @as(f64, @floatFromInt(AA_SUBPIXEL_GRID));
-    const row_weight = 1.0 / subpixel_grid_f64;
-
-    var py = y0;
-    while (py <= y1) : (py += 1) {
-        @memset(row_coverage[0..surface.width], 0.0);
-
-        var sub_row: u32 = 0;
-        while (sub_row < AA_SUBPIXEL_GRID) : (sub_row += 1) {
-            const y = @as(f64, @floatFromInt(py)) + (@as(f64, @floatFromInt(sub_row)) + 0.5) / subpixel_grid_f64;
-            const count = collectScanIntersections(edges, y, &intersections);
-            if (count == 0) continue;
-
-            var winding: i32 = 0;
-            var prev_x: f64 = intersections[0].x;
-            var i: usize = 0;
-            while (i < count) {
-                const current_x = intersections[i].x;
-                if (winding != 0) accumulateScanlineCoverage(row_coverage[0..surface.width], prev_x, current_x, row_weight);
-
-                var delta_sum: i32 = 0;
-                while (i < count and @abs(intersections[i].x - current_x) <= 0.0000001) : (i += 1) {
-                    delta_sum += intersections[i].delta;
-                }
-                winding += delta_sum;
-                prev_x = current_x;
-            }
-        }
-
-        applyCoverageRow(surface, py, row_coverage[0..surface.width], fill);
-    }
-}
-
-fn fillEdgesGradientHard(surface: *Surface, edges: []const Edge, gradient: LinearGradient, path_transform: Matrix) void {
+fn fillEdgesGradient(surface: *Surface, edges: []const Edge, gradient: LinearGradient, path_transform: Matrix) void {
     if (edges.len == 0) return;
-    const bounds = edgeBounds(edges);
-    const y0: i32 = @as(i32, @intFromFloat(@floor(bounds.min_y))) - 1;
-    const y1: i32 = @as(i32, @intFromFloat(@ceil(bounds.max_y))) + 1;
-    var intersections: [PATH_EDGE_LIMIT]ScanIntersection = undefined;
-
-    var py = y0;
-    while (py <= y1) : (py += 1) {
-        const y = @as(f64, @floatFromInt(py)) + 0.5;
-        const count = collectScanIntersections(edges, y, &intersections);
-        if (count == 0) continue;
-
-        var winding: i32 = 0;
-        var prev_x: f64 = intersections[0].x;
-        var i: usize = 0;
-        while (i < count) {
-            const current_x = intersections[i].x;
-            if (winding != 0) {
-                const px0 = @max(0, @as(i32, @intFromFloat(@floor(prev_x))));
-                const px1 = @min(@as(i32, @intCast(surface.width)), @as(i32, @intFromFloat(@ceil(current_x))));
-                var px = px0;
-                while (px < px1) : (px += 1) {
-                    const coverage = intervalCoverage(prev_x, current_x, px);
-                    if (coverage <= 0.0) continue;
-                    if (pixelPtr(surface, px, py)) |dst| {
-                        const x = @as(f64, @floatFromInt(px)) + 0.5;
-                        const sample_y = @as(f64, @floatFromInt(py)) + 0.5;
-                        blendCoverage(dst, sampleLinearGradient(gradient, path_transform, x, sample_y), coverage);
-                    }
-                }
-            }
-
-            var delta_sum: i32 = 0;
-            while (i < count and @abs(intersections[i].x - current_x) <= 0.0000001) : (i += 1) {
-                delta_sum += intersections[i].delta;
-            }
-            winding += delta_sum;
-            prev_x = current_x;
-        }
-    }
+    scanline.fillCoverageRows(surface, edges, GradientRowSink{ .gradient = gradient, .path_transform = path_transform });
 }
 
-fn fillEdgesGradient(surface: *Surface, edges: []const Edge, gradient: LinearGradient, path_transform: Matrix) void {
-    if (edges.len == 0) return;
-    if (surface.width > AA_ROW_COVERAGE_LIMIT) {
-        fillEdgesGradientHard(surface, edges, gradient, path_transform);
-        return;
-    }
+const GradientRowSink = struct {
+    gradient: LinearGradient,
+    path_transform: Matrix,
 
-    const bounds = edgeBounds(edges);
-    const y0: i32 = @as(i32, @intFromFloat(@floor(bounds.min_y))) - 1;
-    const y1: i32 = @as(i32, @intFromFloat(@ceil(bounds.max_y))) + 1;
-    var intersections: [PATH_EDGE_LIMIT]ScanIntersection = undefined;
-    var row_coverage: [AA_ROW_COVERAGE_LIMIT]f64 = undefined;
-    const subpixel_grid_f64 = @as(f64, @floatFromInt(AA_SUBPIXEL_GRID));
-    const row_weight = 1.0 / subpixel_grid_f64;
-
-    var py = y0;
-    while (py <= y1) : (py += 1) {
-        @memset(row_coverage[0..surface.width], 0.0);
-
-        var sub_row: u32 = 0;
-        while (sub_row < AA_SUBPIXEL_GRID) : (sub_row += 1) {
-            const y = @as(f64, @floatFromInt(py)) + (@as(f64, @floatFromInt(sub_row)) + 0.5) / subpixel_grid_f64;
-            const count = collectScanIntersections(edges, y, &intersections);
-            if (count == 0) continue;
-
-            var winding: i32 = 0;
-            var prev_x: f64 = intersections[0].x;
-            var i: usize = 0;
-            while (i < count) {
-                const current_x = intersections[i].x;
-                if (winding != 0) accumulateScanlineCoverage(row_coverage[0..surface.width], prev_x, current_x, row_weight);
-
-                var delta_sum: i32 = 0;
-                while (i < count and @abs(intersections[i].x - current_x) <= 0.0000001) : (i += 1) {
-                    delta_sum += intersections[i].delta;
-                }
-                winding += delta_sum;
-                prev_x = current_x;
+    pub fn apply(self: GradientRowSink, surface: *Surface, py: i32, first_column: u32, row: []const f64) void {
+        for (row, first_column..) |coverage, px| {
+            if (coverage <= 0.0) continue;
+            if (pixelPtr(surface, @intCast(px), py)) |dst| {
+                const x = @as(f64, @floatFromInt(px)) + 0.5;
+                const y = @as(f64, @floatFromInt(py)) + 0.5;
+                blendCoverage(dst, sampleLinearGradient(self.gradient, self.path_transform, x, y), coverage);
             }
         }
-
-        applyCoverageRowGradient(surface, py, row_coverage[0..surface.width], gradient, path_transform);
     }
-}
+};
 
 fn sampleLinearGradient(gradient: LinearGradient, path_transform: Matrix, x: f64, y: f64) [4]u8 {
     const transform = path_transform.multiply(gradient.transform);
@@ -2407,261 +2214,11 @@ fn lerpChannel(a: u8, b: u8, t: f64) u8 {
     return @as(u8, @intFromFloat(std.math.clamp(@floor(value + 0.5), 0.0, 255.0)));
 }
 
-fn clamp01(value: f64) f64 {
-    return std.math.clamp(value, 0.0, 1.0);
-}
-
-fn intervalCoverage(start: f64, end: f64, pixel_index: i32) f64 {
-    if (end <= start) return 0.0;
-    const pixel_start = @as(f64, @floatFromInt(pixel_index));
-    const pixel_end = pixel_start + 1.0;
-    return clamp01(@min(end, pixel_end) - @max(start, pixel_start));
-}
-
-fn fillCoverageForDistance(dist: f64, radius: f64) f64 {
-    return clamp01(radius + 0.5 - dist);
-}
-
-fn annulusCoverageForDistance(dist: f64, inner_radius: f64, outer_radius: f64) f64 {
-    const outer = fillCoverageForDistance(dist, outer_radius);
-    const inner = if (inner_radius <= 0.0) 0.0 else fillCoverageForDistance(dist, inner_radius);
-    return clamp01(outer - inner);
-}
-
-fn sampleCircleCoverage(cx: f64, cy: f64, radius: f64, px: i32, py: i32) f64 {
-    var inside: u32 = 0;
-    var sy: u32 = 0;
-    while (sy < CIRCLE_AA_SUBPIXEL_GRID) : (sy += 1) {
-        var sx: u32 = 0;
-        while (sx < CIRCLE_AA_SUBPIXEL_GRID) : (sx += 1) {
-            const sample_x = @as(f64, @floatFromInt(px)) + (@as(f64, @floatFromInt(sx)) + 0.5) / @as(f64, @floatFromInt(CIRCLE_AA_SUBPIXEL_GRID));
-            const sample_y = @as(f64, @floatFromInt(py)) + (@as(f64, @floatFromInt(sy)) + 0.5) / @as(f64, @floatFromInt(CIRCLE_AA_SUBPIXEL_GRID));
-            const dx = sample_x - cx;
-            const dy = sample_y - cy;
-            if (dx * dx + dy * dy <= radius * radius) inside += 1;
-        }
-    }
-    const total = @as(f64, @floatFromInt(CIRCLE_AA_SUBPIXEL_GRID * CIRCLE_AA_SUBPIXEL_GRID));
-    return @as(f64, @floatFromInt(inside)) / total;
-}
-
-fn sampleAnnulusCoverage(cx: f64, cy: f64, inner_radius: f64, outer_radius: f64, px: i32, py: i32) f64 {
-    var inside: u32 = 0;
-    const inner_sq = inner_radius * inner_radius;
-    const outer_sq = outer_radius * outer_radius;
-    var sy: u32 = 0;
-    while (sy < CIRCLE_AA_SUBPIXEL_GRID) : (sy += 1) {
-        var sx: u32 = 0;
-        while (sx < CIRCLE_AA_SUBPIXEL_GRID) : (sx += 1) {
-            const sample_x = @as(f64, @floatFromInt(px)) + (@as(f64, @floatFromInt(sx)) + 0.5) / @as(f64, @floatFromInt(CIRCLE_AA_SUBPIXEL_GRID));
-            const sample_y = @as(f64, @floatFromInt(py)) + (@as(f64, @floatFromInt(sy)) + 0.5) / @as(f64, @floatFromInt(CIRCLE_AA_SUBPIXEL_GRID));
-            const dx = sample_x - cx;
-            const dy = sample_y - cy;
-            const dist_sq = dx * dx + dy * dy;
-            if (dist_sq <= outer_sq and dist_sq >= inner_sq) inside += 1;
-        }
-    }
-    const total = @as(f64, @floatFromInt(CIRCLE_AA_SUBPIXEL_GRID * CIRCLE_AA_SUBPIXEL_GRID));
-    return @as(f64, @floatFromInt(inside)) / total;
-}
-
-fn rectCoverage(x0: f64, y0: f64, x1: f64, y1: f64, px: i32, py: i32) f64 {
-    return intervalCoverage(x0, x1, px) * intervalCoverage(y0, y1, py);
-}
-
-fn scaledAlpha(alpha: u8, coverage: f64) u8 {
-    const scaled = @as(f64, @floatFromInt(alpha)) * clamp01(coverage);
-    return @as(u8, @intFromFloat(std.math.clamp(@floor(scaled + 0.5), 0.0, 255.0)));
-}
-
-fn blendCoverage(dst: *[4]u8, src: [4]u8, coverage: f64) void {
-    if (src[3] == 0 or coverage <= 0.0) return;
-    if (coverage >= 0.999999) {
-        blend(dst, src);
-        return;
-    }
-
-    var adjusted = src;
-    adjusted[3] = scaledAlpha(src[3], coverage);
-    if (adjusted[3] == 0) return;
-    blend(dst, adjusted);
-}
-
-fn accumulateScanlineCoverage(row: []f64, x_start: f64, x_end: f64, row_weight: f64) void {
-    if (row_weight <= 0.0 or x_end <= x_start or row.len == 0) return;
-    const px0 = @max(0, @as(i32, @intFromFloat(@floor(x_start))));
-    const px1 = @min(@as(i32, @intCast(row.len)), @as(i32, @intFromFloat(@ceil(x_end))));
-    var px = px0;
-    while (px < px1) : (px += 1) {
-        const coverage = intervalCoverage(x_start, x_end, px) * row_weight;
-        if (coverage <= 0.0) continue;
-        const index: usize = @intCast(px);
-        row[index] = @min(1.0, row[index] + coverage);
-    }
-}
-
-fn applyCoverageRow(surface: *Surface, py: i32, row: []const f64, fill: [4]u8) void {
-    var px: usize = 0;
-    while (px < row.len) : (px += 1) {
-        const coverage = row[px];
-        if (coverage <= 0.0) continue;
-        if (pixelPtr(surface, @intCast(px), py)) |dst| {
-            blendCoverage(dst, fill, coverage);
-        }
-    }
-}
-
-fn applyCoverageRowGradient(surface: *Surface, py: i32, row: []const f64, gradient: LinearGradient, path_transform: Matrix) void {
-    var px: usize = 0;
-    while (px < row.len) : (px += 1) {
-        const coverage = row[px];
-        if (coverage <= 0.0) continue;
-        if (pixelPtr(surface, @intCast(px), py)) |dst| {
-            const x = @as(f64, @floatFromInt(px)) + 0.5;
-            const y = @as(f64, @floatFromInt(py)) + 0.5;
-            blendCoverage(dst, sampleLinearGradient(gradient, path_transform, x, y), coverage);
-        }
-    }
-}
-
-fn strokeEdges(surface: *Surface, edges: []const Edge, stroke: [4]u8, stroke_width: f64, dash_on: f64, dash_off: f64) void {
-    if (edges.len == 0 or stroke[3] == 0 or stroke_width <= 0.0) return;
-    for (edges) |edge| {
-        strokeEdge(surface, edge, stroke, stroke_width, dash_on, dash_off);
-    }
-}
-
-fn strokeEdge(surface: *Surface, edge: Edge, stroke: [4]u8, stroke_width: f64, dash_on: f64, dash_off: f64) void {
-    const edge_length = distance(edge.a, edge.b);
-    if (edge_length <= 0.0000001) {
-        drawLineSegment(surface, edge.a, edge.b, stroke, stroke_width);
-        return;
-    }
-
-    if (dash_on <= 0.0 or dash_off <= 0.0) {
-        drawLineSegment(surface, edge.a, edge.b, stroke, stroke_width);
-        return;
-    }
-
-    var cursor: f64 = 0.0;
-    var draw = true;
-    while (cursor < edge_length - 0.0000001) {
-        const span = if (draw) dash_on else dash_off;
-        if (span <= 0.0) break;
-        const next = @min(edge_length, cursor + span);
-        if (draw and next > cursor) {
-            drawLineSegment(
-                surface,
-                lerpPoint(edge.a, edge.b, cursor / edge_length),
-                lerpPoint(edge.a, edge.b, next / edge_length),
-                stroke,
-                stroke_width,
-            );
-        }
-        cursor = next;
-        draw = !draw;
-    }
-}
-
-fn drawLineSegment(surface: *Surface, a: Point, b: Point, stroke: [4]u8, stroke_width: f64) void {
-    if (stroke[3] == 0 or stroke_width <= 0.0) return;
-    const half = stroke_width / 2.0;
-    const min_x: i32 = @intFromFloat(@floor(@min(a.x, b.x) - half - 1.0));
-    const max_x: i32 = @intFromFloat(@ceil(@max(a.x, b.x) + half + 1.0));
-    const min_y: i32 = @intFromFloat(@floor(@min(a.y, b.y) - half - 1.0));
-    const max_y: i32 = @intFromFloat(@ceil(@max(a.y, b.y) + half + 1.0));
-
-    var py = min_y;
-    while (py <= max_y) : (py += 1) {
-        var px = min_x;
-        while (px <= max_x) : (px += 1) {
-            if (pixelPtr(surface, px, py)) |dst| {
-                const p = Point{
-                    .x = @as(f64, @floatFromInt(px)) + 0.5,
-                    .y = @as(f64, @floatFromInt(py)) + 0.5,
-                };
-                const coverage = fillCoverageForDistance(distancePointToSegment(p, a, b), half);
-                if (coverage > 0.0) blendCoverage(dst, stroke, coverage);
-            }
-        }
-    }
-}
-
-fn distancePointToSegment(p: Point, a: Point, b: Point) f64 {
-    const dx = b.x - a.x;
-    const dy = b.y - a.y;
-    const len_sq = dx * dx + dy * dy;
-    if (len_sq <= 0.0000001) return distance(p, a);
-
-    const t = std.math.clamp(((p.x - a.x) * dx + (p.y - a.y) * dy) / len_sq, 0.0, 1.0);
-    const proj = Point{
-        .x = a.x + dx * t,
-        .y = a.y + dy * t,
-    };
-    return distance(p, proj);
-}
-
-fn lerpPoint(a: Point, b: Point, t: f64) Point {
-    return .{
-        .x = a.x + (b.x - a.x) * t,
-        .y = a.y + (b.y - a.y) * t,
-    };
-}
-
-fn isLeft(a: Point, b: Point, p: Point) f64 {
-    return (b.x - a.x) * (p.y - a.y) - (p.x - a.x) * (b.y - a.y);
-}
-
-fn cubicPoint(p0: Point, p1: Point, p2: Point, p3: Point, t: f64) Point {
-    const u = 1.0 - t;
-    const tt = t * t;
-    const uu = u * u;
-    const uuu = uu * u;
-    const ttt = tt * t;
-    return .{
-        .x = uuu * p0.x + 3.0 * uu * t * p1.x + 3.0 * u * tt * p2.x + ttt * p3.x,
-        .y = uuu * p0.y + 3.0 * uu * t * p1.y + 3.0 * u * tt * p2.y + ttt * p3.y,
-    };
-}
-
-fn cubicStepCount(p0: Point, p1: Point, p2: Point, p3: Point, scale: f64) u32 {
-    const scaled_len = (distance(p0, p1) + distance(p1, p2) + distance(p2, p3)) * @max(scale, 0.0001);
-    const steps = @as(u32, @intFromFloat(@ceil(scaled_len / 4.0)));
-    return @max(@as(u32, 4), @min(@as(u32, 24), steps));
-}
-
-fn quadraticPoint(p0: Point, p1: Point, p2: Point, t: f64) Point {
-    const u = 1.0 - t;
-    const tt = t * t;
-    const uu = u * u;
-    return .{
-        .x = uu * p0.x + 2.0 * u * t * p1.x + tt * p2.x,
-        .y = uu * p0.y + 2.0 * u * t * p1.y + tt * p2.y,
-    };
-}
-
-fn quadraticStepCount(p0: Point, p1: Point, p2: Point, scale: f64) u32 {
-    const scaled_len = (distance(p0, p1) + distance(p1, p2)) * @max(scale, 0.0001);
-    const steps = @as(u32, @intFromFloat(@ceil(scaled_len / 4.0)));
-    return @max(@as(u32, 4), @min(@as(u32, 20), steps));
-}
-
-fn distance(a: Point, b: Point) f64 {
-    const dx = b.x - a.x;
-    const dy = b.y - a.y;
-    return @sqrt(dx * dx + dy * dy);
-}
-
 fn rootScaleMatrix(scale_numerator: u32, scale_denominator: u32) Matrix {
     const scale = @as(f64, @floatFromInt(scale_numerator)) / @as(f64, @floatFromInt(scale_denominator));
     return .{ .a = scale, .d = scale };
 }
 
-fn isAxisAligned(m: Matrix) bool {
-    const eps = 0.0000001;
-    return @abs(m.b) < eps and @abs(m.c) < eps;
-}
-
 fn applyPaintAttrs(tag_text: []const u8, paint: *Paint) void {
     if (parseAttr(tag_text, "fill")) |value| paint.fill = parseColor(value);
     if (parseAttr(tag_text, "stroke")) |value| paint.stroke = parseColor(value);
@@ -3069,123 +2626,6 @@ fn fillGradientId(tag_text: []const u8) ?[]const u8 {
     return fill_value[5 .. fill_value.len - 1];
 }
 
-fn clear(surface: *Surface, rgba: [4]u8) void {
-    var y: u32 = 0;
-    while (y < surface.height) : (y += 1) {
-        var x: u32 = 0;
-        while (x < surface.width) : (x += 1) {
-            const offset = @as(usize, @intCast(y)) * @as(usize, @intCast(surface.stride)) + @as(usize, @intCast(x)) * 4;
-            surface.pixels[offset + 0] = rgba[0];
-            surface.pixels[offset + 1] = rgba[1];
-            surface.pixels[offset + 2] = rgba[2];
-            surface.pixels[offset + 3] = rgba[3];
-        }
-    }
-}
-
-fn drawRect(surface: *Surface, x: f64, y: f64, width: f64, height: f64, fill: [4]u8, stroke: [4]u8, stroke_width: f64) void {
-    const x0: i32 = @intFromFloat(@floor(x));
-    const y0: i32 = @intFromFloat(@floor(y));
-    const x1: i32 = @intFromFloat(@ceil(x + width));
-    const y1: i32 = @intFromFloat(@ceil(y + height));
-    const half_stroke = stroke_width / 2.0;
-
-    var py = y0;
-    while (py < y1) : (py += 1) {
-        var px = x0;
-        while (px < x1) : (px += 1) {
-            if (pixelPtr(surface, px, py)) |dst| {
-                const fill_coverage = if (fill[3] > 0)
-                    rectCoverage(x, y, x + width, y + height, px, py)
-                else
-                    0.0;
-                const outer_coverage = if (stroke[3] > 0 and stroke_width > 0.0)
-                    rectCoverage(x - half_stroke, y - half_stroke, x + width + half_stroke, y + height + half_stroke, px, py)
-                else
-                    0.0;
-                const inner_coverage = if (stroke[3] > 0 and stroke_width > 0.0 and width > stroke_width and height > stroke_width)
-                    rectCoverage(x + half_stroke, y + half_stroke, x + width - half_stroke, y + height - half_stroke, px, py)
-                else
-                    0.0;
-                const stroke_coverage = clamp01(outer_coverage - inner_coverage);
-                if (fill_coverage > 0.0) blendCoverage(dst, fill, fill_coverage);
-                if (stroke_coverage > 0.0) blendCoverage(dst, stroke, stroke_coverage);
-            }
-        }
-    }
-}
-
-fn drawCircle(surface: *Surface, cx: f64, cy: f64, r: f64, fill: [4]u8, stroke: [4]u8, stroke_width: f64) void {
-    const half_stroke = stroke_width / 2.0;
-    const inner_radius = @max(0.0, r - half_stroke);
-    const outer_radius = r + half_stroke;
-    const min_x: i32 = @intFromFloat(@floor(cx - r - half_stroke - 1.0));
-    const max_x: i32 = @intFromFloat(@ceil(cx + r + half_stroke + 1.0));
-    const min_y: i32 = @intFromFloat(@floor(cy - r - half_stroke - 1.0));
-    const max_y: i32 = @intFromFloat(@ceil(cy + r + half_stroke + 1.0));
-
-    var py = min_y;
-    while (py <= max_y) : (py += 1) {
-        var px = min_x;
-        while (px <= max_x) : (px += 1) {
-            const dx = (@as(f64, @floatFromInt(px)) + 0.5) - cx;
-            const dy = (@as(f64, @floatFromInt(py)) + 0.5) - cy;
-            const dist = @sqrt(dx * dx + dy * dy);
-            if (pixelPtr(surface, px, py)) |dst| {
-                const fill_coverage = if (fill[3] > 0)
-                    if (dist <= r - PIXEL_CORNER_RADIUS)
-                        1.0
-                    else if (dist >= r + PIXEL_CORNER_RADIUS)
-                        0.0
-                    else
-                        sampleCircleCoverage(cx, cy, r, px, py)
-                else
-                    0.0;
-                const stroke_coverage = if (stroke[3] > 0 and stroke_width > 0.0)
-                    if (dist >= inner_radius + PIXEL_CORNER_RADIUS and dist <= outer_radius - PIXEL_CORNER_RADIUS)
-                        1.0
-                    else if (dist <= inner_radius - PIXEL_CORNER_RADIUS or dist >= outer_radius + PIXEL_CORNER_RADIUS)
-                        0.0
-                    else
-                        sampleAnnulusCoverage(cx, cy, inner_radius, outer_radius, px, py)
-                else
-                    0.0;
-                if (fill_coverage > 0.0) blendCoverage(dst, fill, fill_coverage);
-                if (stroke_coverage > 0.0) blendCoverage(dst, stroke, stroke_coverage);
-            }
-        }
-    }
-}
-
-fn pixelPtr(surface: *Surface, x: i32, y: i32) ?*[4]u8 {
-    if (x < 0 or y < 0) return null;
-    if (x >= @as(i32, @intCast(surface.width)) or y >= @as(i32, @intCast(surface.height))) return null;
-    const offset = @as(usize, @intCast(y)) * @as(usize, @intCast(surface.stride)) + @as(usize, @intCast(x)) * 4;
-    return @ptrCast(surface.pixels[offset .. offset + 4]);
-}
-
-fn blend(dst: *[4]u8, src: [4]u8) void {
-    const src_a: u32 = src[3];
-    if (src_a == 0) return;
-    const dst_a: u32 = dst[3];
-    const out_a: u32 = src_a + ((dst_a * (255 - src_a) + 127) / 255);
-    if (out_a == 0) {
-        dst.* = .{ 0, 0, 0, 0 };
-        return;
-    }
-
-    var channel: usize = 0;
-    while (channel < 3) : (channel += 1) {
-        const src_c: u32 = src[channel];
-        const dst_c: u32 = dst[channel];
-        const numer = src_c * src_a * 255 + dst_c * dst_a * (255 - src_a);
-        const denom = out_a * 255;
-        const value = if (denom == 0) 0 else (numer + (denom / 2)) / denom;
-        dst[channel] = @intCast(@min(value, 255));
-    }
-    dst[3] = @intCast(@min(out_a, 255));
-}
-
 fn findKindIndex(kind_id: svg_compat.KindId) usize {
     var i: usize = 0;
     while (i < svg_compat.kindCount()) : (i += 1) {
@@ -3486,3 +2926,99 @@ test "even native RGBA candidate matches generated svg raster at 55 and 200 perc
     try runScaledBitmapParity(.even, findImageIndexByName(.even, "line.svg"), 55, 100, &svg_buf);
     try runScaledBitmapParity(.even, findImageIndexByName(.even, "line.svg"), 200, 100, &svg_buf);
 }
+
+fn runTiledParity(kind_id: svg_compat.KindId, image_index: usize, scale_numerator: u32, scale_denominator: u32, options: TiledOptions) !void {
+    const allocator = std.testing.allocator;
+    const kind_index = findKindIndex(kind_id);
+    const required = requiredRgbaBytesScaled(kind_index, image_index, scale_numerator, scale_denominator);
+    const single = try allocator.alloc(u8, required);
+    defer allocator.free(single);
+    const tiled = try allocator.alloc(u8, required);
+    defer allocator.free(tiled);
+    const scratch = try allocator.alloc(u8, GENERATED_COMPAT_SVG_BUFFER_LIMIT);
+    defer allocator.free(scratch);
+
+    @memset(tiled, 0xaa);
+    const single_len = try renderCandidateRgbaScaledWithScratch(kind_index, image_index, scale_numerator, scale_denominator, scratch, single);
+    const tiled_len = try renderCandidateRgbaScaledTiled(allocator, kind_index, image_index, scale_numerator, scale_denominator, tiled, options);
+    try std.testing.expectEqual(single_len, tiled_len);
+    try std.testing.expectEqualSlices(u8, single, tiled);
+}
+
+test "tiled candidate render is bit-identical to the single-threaded render" {
+    const options = TiledOptions{ .band_count = 7, .thread_count = 3 };
+    try runTiledParity(.even, findImageIndexByName(.even, "grad.svg"), 200, 100, options);
+    try runTiledParity(.even, findImageIndexByName(.even, "line.svg"), 200, 100, options);
+    try runTiledParity(.scale, findImageIndexByName(.scale, "A,A-4,B-4,C-5,D-5,E-5,F-5,G-5,A-5.svg"), 400, 100, options);
+    try runTiledParity(.opc, 3, 400, 100, options);
+    try runTiledParity(.oc, 0, 400, 100, options);
+    try runTiledParity(.optc, 0, 400, 100, options);
+    try runTiledParity(.eadgbe, 0, 400, 100, options);
+    try runTiledParity(.chord, 0, 200, 100, options);
+    try runTiledParity(.vert_text_b2t_black, 0, 400, 100, options);
+    try runTiledParity(.majmin_modes, 0, 200, 100, options);
+    // More bands than rows collapses to fewer, taller bands.
+    try runTiledParity(.center_square_text, 0, 55, 100, .{ .band_count = 1000, .thread_count = 2 });
+}
+
+test "streamed bands match the full render" {
+    const svg =
+        \\<svg xmlns="http://www.w3.org/2000/svg" width="40" height="40" viewBox="0 0 40 40">
+        \\<defs><linearGradient id="g" x1="0" y1="0" x2="40" y2="30"><stop offset="0" stop-color="#f00" /><stop offset="1" stop-color="#00f" /></linearGradient></defs>
+        \\<rect x="2" y="3" width="30" height="20" rx="4" fill="url(#g)" stroke="#111" stroke-width="1.5" />
+        \\<circle cx="24" cy="24" r="9.5" fill="rgba(20,120,220,0.6)" stroke="#000" stroke-width="1.1" />
+        \\<path d="M 4 36 L 36 30 L 20 12 Z" fill="rgba(10,200,90,0.5)" />
+        \\</svg>
+    ;
+    const Collector = struct {
+        out: []u8,
+        next_row: u32 = 0,
+        stop_after: u32 = std.math.maxInt(u32),
+
+        pub fn emit(self: *@This(), first_row: u32, row_count: u32, rgba: []const u8) bool {
+            std.debug.assert(first_row == self.next_row);
+            @memcpy(self.out[first_row * 57 * 4 ..][0..rgba.len], rgba);
+            self.next_row += row_count;
+            return self.next_row < self.stop_after;
+        }
+    };
+
+    var full: [57 * 43 * 4]u8 = undefined;
+    _ = try renderSvgMarkupRgba(57, 43, svg, &full);
+    for ([_]usize{ 1, 5, 43, 64 }) |band_rows| {
+        var streamed: [57 * 43 * 4]u8 = undefined;
+        var band: [57 * 64 * 4]u8 = undefined;
+        var collector = Collector{ .out = &streamed };
+        try std.testing.expectEqual(@as(u32, 43), try streamSvgMarkupRgba(57, 43, svg, band[0 .. band_rows * 57 * 4], &collector));
+        try std.testing.expectEqualSlices(u8, &full, &streamed);
+    }
+
+    var band: [57 * 4 * 4]u8 = undefined;
+    var scratch: [57 * 43 * 4]u8 = undefined;
+    var stopping = Collector{ .out = &scratch, .stop_after = 10 };
+    try std.testing.expectEqual(@as(u32, 12), try streamSvgMarkupRgba(57, 43, svg, &band, &stopping));
+    try std.testing.expectError(error.OutputTooSmall, streamSvgMarkupRgba(57, 43, svg, band[0..100], &stopping));
+    try std.testing.expectError(error.InvalidImage, streamSvgMarkupRgba(STREAM_DIMENSION_LIMIT + 1, 1, svg, &band, &stopping));
+}
+
+test "rect redraw matches the full render inside and outside the rect" {
+    const svg =
+        \\<svg xmlns="http://www.w3.org/2000/svg" width="40" height="40" viewBox="0 0 40 40">
+        \\<rect x="2" y="3" width="30" height="20" rx="4" fill="rgb(200,40,40)" stroke="#111" stroke-width="1.5" />
+        \\<circle cx="24" cy="24" r="9.5" fill="rgba(20,120,220,0.6)" stroke="#000" stroke-width="1.1" />
+        \\<path d="M 4 36 L 36 30 L 20 12 Z" fill="rgba(10,200,90,0.5)" />
+        \\</svg>
+    ;
+    var full: [57 * 43 * 4]u8 = undefined;
+    var redrawn: [57 * 43 * 4]u8 = undefined;
+    _ = try renderSvgMarkupRgba(57, 43, svg, &full);
+    @memcpy(&redrawn, &full);
+
+    const rect = PixelRect{ .x = 13, .y = 9, .width = 21, .height = 17 };
+    var y: usize = rect.y;
+    while (y < rect.y + rect.height) : (y += 1) {
+        @memset(redrawn[(y * 57 + rect.x) * 4 ..][0 .. rect.width * 4], 0xaa);
+    }
+    _ = try redrawSvgMarkupRgbaRect(57, 43, svg, &redrawn, rect);
+    try std.testing.expectEqualSlices(u8, &full, &redrawn);
+}
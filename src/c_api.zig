@@ -1,10 +1,12 @@
 const std = @import("std");
+const builtin = @import("builtin");
 const build_options = @import("build_options");
 const pitch = @import("pitch.zig");
 const pcs = @import("pitch_class_set.zig");
 const set_class = @import("set_class.zig");
-const cluster = @import("cluster.zig");
 const evenness = @import("evenness.zig");
+const pcs_batch = @import("pcs_batch.zig");
+const set_tables = @import("tables/set_classes.zig");
 const scale = @import("scale.zig");
 const mode = @import("mode.zig");
 const ordered_scale = @import("ordered_scale.zig");
@@ -29,7 +31,53 @@ const svg_orbifold = @import("svg/orbifold.zig");
 const svg_staff = @import("svg/staff.zig");
 const svg_compat = @import("harmonious_svg_compat.zig");
 const raster = @import("render/raster.zig");
+const render_ir = @import("render/ir.zig");
 const bitmap_compat = @import("bitmap_compat.zig");
+const render_cache = @import("render/cache.zig");
+const render_incremental = @import("render/incremental.zig");
+const render_png = @import("render/png.zig");
+const render_qoi = @import("render/qoi.zig");
+const heap = @import("heap.zig");
+const xz_pack = @import("xz_pack.zig");
+const prerendered_assets = @import("prerendered_assets.zig");
+// The bulk catalog renderer needs threads and a filesystem.
+const compat_catalog_supported = !builtin.single_threaded and !builtin.target.cpu.arch.isWasm();
+const compat_catalog = if (compat_catalog_supported) @import("compat_catalog.zig") else struct {};
+
+pub const LmtCompatCatalogStats = extern struct {
+    kind_index: u32,
+    images: u32,
+    failures: u32,
+    reserved0: u32,
+    bytes: u64,
+    render_ns: u64,
+    wall_ns: u64,
+};
+
+pub const LmtRenderCacheStats = extern struct {
+    hits: u64,
+    misses: u64,
+    evictions: u64,
+    insertions: u64,
+    bytes: u64,
+    budget_bytes: u64,
+    entries: u32,
+    reserved0: u32,
+};
+
+pub const LmtPackStats = extern struct {
+    decode_ns: u64,
+    resident_bytes: u64,
+    ready: u32,
+    mapped: u32,
+};
+
+pub const LmtDirtyRect = extern struct {
+    x: u32,
+    y: u32,
+    width: u32,
+    height: u32,
+};
 
 pub const LmtKeyContext = extern struct {
     tonic: u8,
@@ -555,6 +603,19 @@ pub const LmtSuspensionMachineSummary = extern struct {
     reserved2: u8,
 };
 
+pub const LmtSetClassInfo = extern struct {
+    prime: u16,
+    forte_prime: u16,
+    cardinality: u8,
+    forte_ordinal: u8,
+    forte_is_z: u8,
+    transposition_count: u8,
+    cluster_free: u8,
+    symmetric: u8,
+    limited_transposition: u8,
+    reserved0: u8,
+};
+
 pub const LmtOrbifoldTriadNode = extern struct {
     set_value: u16,
     root: u8,
@@ -603,15 +664,40 @@ const MINOR_SEVENTH = pcs.fromList(&[_]pitch.PitchClass{ 0, 3, 7, 10 });
 const HALF_DIMINISHED_SEVENTH = pcs.fromList(&[_]pitch.PitchClass{ 0, 3, 6, 10 });
 const DIMINISHED_SEVENTH = pcs.fromList(&[_]pitch.PitchClass{ 0, 3, 6, 9 });
 
-var c_string_slots: [8][64]u8 = [_][64]u8{[_]u8{0} ** 64} ** 8;
-var c_string_slot_index: usize = 0;
-var compat_svg_buf: [4 * 1024 * 1024]u8 = undefined;
+// String results rotate through a per-thread ring, so concurrent callers on
+// different threads never overwrite each other's pointers.
+threadlocal var c_string_slots: [8][64]u8 = [_][64]u8{[_]u8{0} ** 64} ** 8;
+threadlocal var c_string_slot_index: usize = 0;
 var wasm_client_scratch: [8 * 1024 * 1024]u8 = undefined;
 const MAX_PARAMETRIC_FRET_STRINGS: usize = 64;
 const MAX_KEYBOARD_RENDER_NOTES: usize = 128;
 const MAX_C_API_GENERIC_VOICINGS: usize = MAX_PARAMETRIC_FRET_STRINGS * MAX_PARAMETRIC_FRET_STRINGS;
-var generic_voicing_meta_buf: [MAX_C_API_GENERIC_VOICINGS]guitar.GenericVoicing = undefined;
-var generic_voicing_fret_buf: [MAX_C_API_GENERIC_VOICINGS * MAX_PARAMETRIC_FRET_STRINGS]i8 = undefined;
+// Largest stack buffer any public `lmt_svg_*` export renders into.
+const PUBLIC_SVG_MAX_BYTES: usize = 128 * 1024;
+const COMPAT_SVG_SCRATCH_BYTES: usize = 4 * 1024 * 1024;
+
+// Scratch owned by one `lmt_context`. The `_ctx` exports use only the context
+// they are handed, so threads holding distinct contexts never share memory.
+// The legacy exports run against `default_context`. The most recent SVG
+// rendered on a context stays in `svg_buf[0..svg_len]` until the next render,
+// so callers can size an output buffer without rendering twice.
+const Context = struct {
+    magic: u32,
+    svg_len: usize,
+    svg_buf: [COMPAT_SVG_SCRATCH_BYTES]u8,
+    voicing_meta_buf: [MAX_C_API_GENERIC_VOICINGS]guitar.GenericVoicing,
+    voicing_fret_buf: [MAX_C_API_GENERIC_VOICINGS * MAX_PARAMETRIC_FRET_STRINGS]i8,
+};
+
+const CONTEXT_MAGIC: u32 = 0x4c4d5443;
+var default_context: Context = undefined;
+
+fn resolveContext(ctx: ?*anyopaque) ?*Context {
+    const raw = ctx orelse return null;
+    const context: *Context = @ptrCast(@alignCast(raw));
+    if (context.magic != CONTEXT_MAGIC) return null;
+    return context;
+}
 
 fn maskPitchClassSet(raw: u16) pcs.PitchClassSet {
     return @as(pcs.PitchClassSet, @intCast(raw & 0x0fff));
@@ -1718,6 +1804,63 @@ fn copySvgOut(svg: []const u8, buf: [*c]u8, buf_size: u32) u32 {
     return total;
 }
 
+const StreamWriteFn = *const fn (user: ?*anyopaque, data: [*]const u8, len: u32) callconv(.c) u32;
+
+// Buffers renderer output and hands it to a host callback in chunks of at
+// most STREAM_CHUNK_BYTES. A callback returning 0 aborts the render.
+const STREAM_CHUNK_BYTES: usize = 4096;
+
+const StreamSink = struct {
+    write_fn: StreamWriteFn,
+    user: ?*anyopaque,
+    buf: [STREAM_CHUNK_BYTES]u8 = undefined,
+    len: usize = 0,
+    total: usize = 0,
+
+    const Error = error{StreamAborted};
+    const Writer = std.io.GenericWriter(*StreamSink, Error, append);
+
+    fn writer(self: *StreamSink) Writer {
+        return .{ .context = self };
+    }
+
+    fn append(self: *StreamSink, bytes: []const u8) Error!usize {
+        var rest = bytes;
+        while (rest.len > 0) {
+            if (self.len == self.buf.len) try self.flush();
+            const copy_len = @min(rest.len, self.buf.len - self.len);
+            @memcpy(self.buf[self.len..][0..copy_len], rest[0..copy_len]);
+            self.len += copy_len;
+            rest = rest[copy_len..];
+        }
+        return bytes.len;
+    }
+
+    fn flush(self: *StreamSink) Error!void {
+        if (self.len == 0) return;
+        const pending = self.len;
+        self.len = 0;
+        try self.emit(self.buf[0..pending]);
+    }
+
+    fn emit(self: *StreamSink, bytes: []const u8) Error!void {
+        if (self.write_fn(self.user, bytes.ptr, @as(u32, @intCast(bytes.len))) == 0) return error.StreamAborted;
+        self.total += bytes.len;
+    }
+};
+
+fn streamSvg(write_fn: ?StreamWriteFn, user: ?*anyopaque, comptime render: anytype, args: anytype) u32 {
+    var sink = StreamSink{ .write_fn = write_fn orelse return 0, .user = user };
+    @call(.auto, render, args ++ .{sink.writer()}) catch return 0;
+    sink.flush() catch return 0;
+    return @as(u32, @intCast(sink.total));
+}
+
+fn keepContextSvg(context: *Context, svg: []const u8, buf: [*c]u8, buf_size: u32) u32 {
+    context.svg_len = svg.len;
+    return copySvgOut(svg, buf, buf_size);
+}
+
 fn requiredRgbaBytes(width: u32, height: u32) ?u32 {
     const required: u64 = @as(u64, width) * @as(u64, height) * 4;
     if (width == 0 or height == 0 or required == 0 or required > std.math.maxInt(u32)) return null;
@@ -1726,7 +1869,7 @@ fn requiredRgbaBytes(width: u32, height: u32) ?u32 {
 
 fn renderPublicSvgBitmap(svg: []const u8, width: u32, height: u32, out_rgba: [*c]u8, out_rgba_size: u32) u32 {
     if (!build_options.enable_raster_backend) return 0;
-    if (out_rgba == null) return 0;
+    if (out_rgba == null or svg.len == 0) return 0;
 
     const required = requiredRgbaBytes(width, height) orelse return 0;
     if (required > out_rgba_size) return 0;
@@ -1736,6 +1879,238 @@ fn renderPublicSvgBitmap(svg: []const u8, width: u32, height: u32, out_rgba: [*c
     return @as(u32, @intCast(written));
 }
 
+/// Rasterizes a numeric scene under a `0 0 view_width view_height` viewBox.
+/// The staff and keyboard bitmaps build their scene directly instead of
+/// printing markup and parsing it back; pixels match `renderPublicSvgBitmap`.
+fn renderPublicSceneBitmap(scene: render_ir.NumericScene, view_width: f64, view_height: f64, width: u32, height: u32, out_rgba: [*c]u8, out_rgba_size: u32) u32 {
+    if (!build_options.enable_raster_backend) return 0;
+    if (out_rgba == null) return 0;
+
+    const required = requiredRgbaBytes(width, height) orelse return 0;
+    if (required > out_rgba_size) return 0;
+
+    var surface = raster.Surface{
+        .pixels = out_rgba[0..@as(usize, required)],
+        .width = width,
+        .height = height,
+        .stride = width * 4,
+    };
+    raster.clear(&surface, .{ 0, 0, 0, 0 });
+    raster.renderNumericSceneTransformed(scene, &surface, raster.viewBoxTransform(&surface, 0.0, 0.0, view_width, view_height)) catch return 0;
+    return required;
+}
+
+/// Draws a staff scene, or its markup when the scene outgrows its storage.
+fn renderStaffSceneBitmap(staff_scene: render_ir.BuildError!svg_staff.StaffScene, input: StaffInput, comptime render_svg: fn ([]const pitch.MidiNote, key.Key, []u8) []u8, width: u32, height: u32, out_rgba: [*c]u8, out_rgba_size: u32) u32 {
+    const built = staff_scene catch return renderStaffMarkupBitmap(input, render_svg, width, height, out_rgba, out_rgba_size);
+    return renderPublicSceneBitmap(built.scene, built.view_width, built.view_height, width, height, out_rgba, out_rgba_size);
+}
+
+/// Kept out of line so the markup buffer is only on the stack when used.
+noinline fn renderStaffMarkupBitmap(input: StaffInput, comptime render_svg: fn ([]const pitch.MidiNote, key.Key, []u8) []u8, width: u32, height: u32, out_rgba: [*c]u8, out_rgba_size: u32) u32 {
+    var svg_buf: [PUBLIC_SVG_MAX_BYTES]u8 = undefined;
+    return renderPublicSvgBitmap(render_svg(input.notes, input.key, &svg_buf), width, height, out_rgba, out_rgba_size);
+}
+
+const StreamRowsFn = *const fn (user: ?*anyopaque, first_row: u32, row_count: u32, rgba: [*]const u8, len: u32) callconv(.c) u32;
+
+const RowsSink = struct {
+    rows_fn: StreamRowsFn,
+    user: ?*anyopaque,
+
+    pub fn emit(self: RowsSink, first_row: u32, row_count: u32, rgba: []const u8) bool {
+        return self.rows_fn(self.user, first_row, row_count, rgba.ptr, @as(u32, @intCast(rgba.len))) != 0;
+    }
+};
+
+/// Rasterizes `svg` through the caller's band buffer, handing each band to
+/// `rows_fn`. Returns `height` once every row was delivered, or 0.
+fn streamPublicSvgBitmap(svg: []const u8, width: u32, height: u32, band_rgba: [*c]u8, band_rgba_size: u32, rows_fn: ?StreamRowsFn, user: ?*anyopaque) u32 {
+    if (!build_options.enable_raster_backend) return 0;
+    if (band_rgba == null or svg.len == 0) return 0;
+    const sink = RowsSink{ .rows_fn = rows_fn orelse return 0, .user = user };
+    const delivered = bitmap_compat.streamSvgMarkupRgba(width, height, svg, band_rgba[0..band_rgba_size], sink) catch return 0;
+    return if (delivered == height) height else 0;
+}
+
+// Encoded bitmaps render in bands of about ENCODE_BAND_BYTES straight into
+// the PNG or QOI encoder, so the whole RGBA image is never held at once.
+const ENCODE_BAND_BYTES: usize = 256 * 1024;
+
+// Copies encoder output while it fits and counts the full length, so a NULL
+// or short buffer doubles as a size query.
+const EncodedOut = struct {
+    buf: [*c]u8,
+    buf_size: u32,
+    total: usize = 0,
+
+    const Writer = std.io.GenericWriter(*EncodedOut, error{}, append);
+
+    fn writer(self: *EncodedOut) Writer {
+        return .{ .context = self };
+    }
+
+    fn append(self: *EncodedOut, bytes: []const u8) error{}!usize {
+        if (self.buf != null and self.total < self.buf_size) {
+            const copy_len = @min(bytes.len, self.buf_size - self.total);
+            @memcpy(self.buf[self.total..][0..copy_len], bytes[0..copy_len]);
+        }
+        self.total += bytes.len;
+        return bytes.len;
+    }
+};
+
+const EncodedFormat = union(enum) {
+    png: render_png.Compression,
+    qoi,
+};
+
+/// Rasterizes `svg` band by band into a PNG or QOI stream. Returns the full
+/// encoded length; the image is complete in `buf` only when that length is
+/// at most `buf_size`. Returns 0 on failure.
+fn encodePublicSvgBitmap(svg: []const u8, width: u32, height: u32, format: EncodedFormat, buf: [*c]u8, buf_size: u32) u32 {
+    if (!build_options.enable_raster_backend) return 0;
+    if (svg.len == 0 or width == 0 or height == 0 or width > bitmap_compat.STREAM_DIMENSION_LIMIT) return 0;
+    const stride = @as(usize, width) * 4;
+    const band_rows = @min(height, @max(1, ENCODE_BAND_BYTES / stride));
+    const allocator = heap.allocator();
+    const band = allocator.alloc(u8, band_rows * stride) catch return 0;
+    defer allocator.free(band);
+
+    var out = EncodedOut{ .buf = buf, .buf_size = buf_size };
+    switch (format) {
+        .png => |compression| {
+            var encoder = render_png.encoder(allocator, out.writer(), width, height, compression) catch return 0;
+            defer encoder.deinit();
+            _ = bitmap_compat.streamSvgMarkupRgba(width, height, svg, band, &encoder) catch return 0;
+            encoder.finish() catch return 0;
+        },
+        .qoi => {
+            var encoder = render_qoi.encoder(out.writer(), width, height) catch return 0;
+            _ = bitmap_compat.streamSvgMarkupRgba(width, height, svg, band, &encoder) catch return 0;
+            encoder.finish() catch return 0;
+        },
+    }
+    return std.math.cast(u32, out.total) orelse 0;
+}
+
+fn pngCompression(raw: u8) ?render_png.Compression {
+    return std.meta.intToEnum(render_png.Compression, raw) catch null;
+}
+
+fn encodePublicSvgPng(svg: []const u8, width: u32, height: u32, compression_raw: u8, buf: [*c]u8, buf_size: u32) u32 {
+    const compression = pngCompression(compression_raw) orelse return 0;
+    return encodePublicSvgBitmap(svg, width, height, .{ .png = compression }, buf, buf_size);
+}
+
+// Render cache plumbing. Writers build a key from their sanitized inputs,
+// serve a hit as one copy, and otherwise render and offer the result.
+
+const SvgCacheServer = struct {
+    buf: [*c]u8,
+    buf_size: u32,
+
+    pub fn serve(self: SvgCacheServer, svg: []const u8) u32 {
+        return copySvgOut(svg, self.buf, self.buf_size);
+    }
+};
+
+const RgbaCacheServer = struct {
+    out_rgba: [*c]u8,
+    out_rgba_size: u32,
+
+    pub fn serve(self: RgbaCacheServer, rgba: []const u8) u32 {
+        if (self.out_rgba == null or rgba.len > self.out_rgba_size) return 0;
+        @memcpy(self.out_rgba[0..rgba.len], rgba);
+        return @as(u32, @intCast(rgba.len));
+    }
+};
+
+fn cachedSvgOut(cache_key: *const render_cache.Key, buf: [*c]u8, buf_size: u32) ?u32 {
+    return render_cache.serve(cache_key, SvgCacheServer{ .buf = buf, .buf_size = buf_size });
+}
+
+fn storeSvgOut(cache_key: *const render_cache.Key, svg: []const u8, buf: [*c]u8, buf_size: u32) u32 {
+    render_cache.store(cache_key, svg);
+    return copySvgOut(svg, buf, buf_size);
+}
+
+fn cachedRgbaOut(cache_key: *const render_cache.Key, out_rgba: [*c]u8, out_rgba_size: u32) ?u32 {
+    return render_cache.serve(cache_key, RgbaCacheServer{ .out_rgba = out_rgba, .out_rgba_size = out_rgba_size });
+}
+
+fn storeRgbaOut(cache_key: *const render_cache.Key, written: u32, out_rgba: [*c]u8) u32 {
+    if (written != 0) render_cache.store(cache_key, out_rgba[0..@as(usize, written)]);
+    return written;
+}
+
+fn withRgbaSize(cache_key: render_cache.Key, width: u32, height: u32) render_cache.Key {
+    var sized = cache_key;
+    sized.int(u32, width);
+    sized.int(u32, height);
+    return sized;
+}
+
+fn setCacheKey(renderer: render_cache.Renderer, set: u16) render_cache.Key {
+    var cache_key = render_cache.Key.init(renderer);
+    cache_key.int(u16, maskPitchClassSet(set));
+    return cache_key;
+}
+
+fn standardFretCacheKey(renderer: render_cache.Renderer, frets_ptr: [*c]const i8) render_cache.Key {
+    var cache_key = render_cache.Key.init(renderer);
+    const frets = decodeStandardFrets(frets_ptr);
+    cache_key.add(std.mem.asBytes(&frets));
+    return cache_key;
+}
+
+fn fretCacheKey(renderer: render_cache.Renderer, frets_ptr: [*c]const i8, string_count: u32, tuning: ?[]const pitch.MidiNote, window_start: u32, visible_frets: u32) render_cache.Key {
+    var cache_key = render_cache.Key.init(renderer);
+    if (frets_ptr == null or string_count == 0) return cache_key;
+    if (string_count > render_cache.KEY_CAPACITY) {
+        cache_key.overflow = true;
+        return cache_key;
+    }
+    cache_key.slice(std.mem.sliceAsBytes(frets_ptr[0..@as(usize, string_count)]));
+    if (tuning) |notes| cache_key.byteInts(notes);
+    cache_key.int(u32, window_start);
+    cache_key.int(u32, visible_frets);
+    return cache_key;
+}
+
+fn chordStaffCacheKey(renderer: render_cache.Renderer, chord_kind: u8, root: u8) render_cache.Key {
+    var cache_key = render_cache.Key.init(renderer);
+    cache_key.int(u8, chord_kind);
+    cache_key.int(u8, root % 12);
+    return cache_key;
+}
+
+fn keyStaffCacheKey(renderer: render_cache.Renderer, tonic: u8, quality_raw: u8) render_cache.Key {
+    var cache_key = render_cache.Key.init(renderer);
+    cache_key.int(u8, tonic % 12);
+    cache_key.int(u8, @intFromBool(quality_raw == KEY_MINOR));
+    return cache_key;
+}
+
+fn keyboardCacheKey(renderer: render_cache.Renderer, notes_ptr: [*c]const u8, note_count: u32, range_low: u8, range_high: u8) render_cache.Key {
+    var cache_key = render_cache.Key.init(renderer);
+    var notes_buf: [MAX_KEYBOARD_RENDER_NOTES]pitch.MidiNote = undefined;
+    cache_key.byteInts(decodeMidiNotes(notes_ptr, note_count, &notes_buf));
+    const range = sanitizeKeyboardRange(range_low, range_high);
+    cache_key.int(u8, range.low);
+    cache_key.int(u8, range.high);
+    return cache_key;
+}
+
+fn pianoStaffCacheKey(renderer: render_cache.Renderer, notes_ptr: [*c]const u8, note_count: u32, tonic: u8, quality_raw: u8) render_cache.Key {
+    var cache_key = render_cache.Key.init(renderer);
+    var notes_buf: [MAX_KEYBOARD_RENDER_NOTES]pitch.MidiNote = undefined;
+    cache_key.byteInts(decodeMidiNotes(notes_ptr, note_count, &notes_buf));
+    cache_key.int(u8, tonic % 12);
+    cache_key.int(u8, @intFromBool(quality_raw == KEY_MINOR));
+    return cache_key;
+}
+
 pub export fn lmt_wasm_scratch_ptr() callconv(.c) [*c]u8 {
     return &wasm_client_scratch[0];
 }
@@ -1793,21 +2168,122 @@ pub export fn lmt_pcs_is_subset(small: u16, big: u16) callconv(.c) bool {
 }
 
 pub export fn lmt_prime_form(set: u16) callconv(.c) u16 {
-    return toCSet(set_class.primeForm(maskPitchClassSet(set)));
+    return toCSet(set_tables.info(maskPitchClassSet(set)).prime);
 }
 
 pub export fn lmt_forte_prime(set: u16) callconv(.c) u16 {
-    return toCSet(set_class.fortePrime(maskPitchClassSet(set)));
+    return toCSet(set_tables.info(maskPitchClassSet(set)).forte_prime);
 }
 
 pub export fn lmt_is_cluster_free(set: u16) callconv(.c) bool {
-    return !cluster.hasCluster(maskPitchClassSet(set));
+    return set_tables.info(maskPitchClassSet(set)).flags.cluster_free;
 }
 
 pub export fn lmt_evenness_distance(set: u16) callconv(.c) f32 {
     return evenness.evennessDistance(maskPitchClassSet(set));
 }
 
+pub export fn lmt_pcs_cardinality_batch(sets: [*c]const u16, count: u32, out: [*c]u8) callconv(.c) u32 {
+    if (sets == null or out == null) return 0;
+    const n = @as(usize, count);
+    return @as(u32, @intCast(pcs_batch.cardinality(sets[0..n], out[0..n])));
+}
+
+pub export fn lmt_pcs_transpose_batch(sets: [*c]const u16, count: u32, semitones: u8, out: [*c]u16) callconv(.c) u32 {
+    if (sets == null or out == null) return 0;
+    const n = @as(usize, count);
+    return @as(u32, @intCast(pcs_batch.transpose(sets[0..n], @as(u4, @intCast(semitones % 12)), out[0..n])));
+}
+
+pub export fn lmt_pcs_invert_batch(sets: [*c]const u16, count: u32, out: [*c]u16) callconv(.c) u32 {
+    if (sets == null or out == null) return 0;
+    const n = @as(usize, count);
+    return @as(u32, @intCast(pcs_batch.invert(sets[0..n], out[0..n])));
+}
+
+pub export fn lmt_pcs_complement_batch(sets: [*c]const u16, count: u32, out: [*c]u16) callconv(.c) u32 {
+    if (sets == null or out == null) return 0;
+    const n = @as(usize, count);
+    return @as(u32, @intCast(pcs_batch.complement(sets[0..n], out[0..n])));
+}
+
+pub export fn lmt_prime_form_batch(sets: [*c]const u16, count: u32, out: [*c]u16) callconv(.c) u32 {
+    if (sets == null or out == null) return 0;
+    const n = @as(usize, count);
+    return @as(u32, @intCast(pcs_batch.primeForm(sets[0..n], out[0..n])));
+}
+
+pub export fn lmt_forte_prime_batch(sets: [*c]const u16, count: u32, out: [*c]u16) callconv(.c) u32 {
+    if (sets == null or out == null) return 0;
+    const n = @as(usize, count);
+    return @as(u32, @intCast(pcs_batch.fortePrime(sets[0..n], out[0..n])));
+}
+
+pub export fn lmt_is_cluster_free_batch(sets: [*c]const u16, count: u32, out: [*c]bool) callconv(.c) u32 {
+    if (sets == null or out == null) return 0;
+    const n = @as(usize, count);
+    return @as(u32, @intCast(pcs_batch.isClusterFree(sets[0..n], out[0..n])));
+}
+
+pub export fn lmt_evenness_distance_batch(sets: [*c]const u16, count: u32, out: [*c]f32) callconv(.c) u32 {
+    if (sets == null or out == null) return 0;
+    const n = @as(usize, count);
+    return @as(u32, @intCast(pcs_batch.evennessDistance(sets[0..n], out[0..n])));
+}
+
+pub export fn lmt_sizeof_context() callconv(.c) u32 {
+    return @as(u32, @intCast(@sizeOf(Context)));
+}
+
+pub export fn lmt_alignof_context() callconv(.c) u32 {
+    return @as(u32, @intCast(@alignOf(Context)));
+}
+
+pub export fn lmt_context_init(storage: ?*anyopaque, storage_size: u32) callconv(.c) ?*anyopaque {
+    const raw = storage orelse return null;
+    if (@as(usize, storage_size) < @sizeOf(Context)) return null;
+    if (@intFromPtr(raw) % @alignOf(Context) != 0) return null;
+
+    const context: *Context = @ptrCast(@alignCast(raw));
+    context.magic = CONTEXT_MAGIC;
+    context.svg_len = 0;
+    return raw;
+}
+
+pub export fn lmt_sizeof_set_class_info() callconv(.c) u32 {
+    return @as(u32, @intCast(@sizeOf(LmtSetClassInfo)));
+}
+
+fn writeSetClassInfo(out: *LmtSetClassInfo, set: u16) void {
+    const entry = set_tables.info(maskPitchClassSet(set));
+    out.* = .{
+        .prime = toCSet(entry.prime),
+        .forte_prime = toCSet(entry.forte_prime),
+        .cardinality = entry.forte_cardinality,
+        .forte_ordinal = entry.forte_ordinal,
+        .forte_is_z = @intFromBool(entry.forte_is_z),
+        .transposition_count = entry.transpositions,
+        .cluster_free = @intFromBool(entry.flags.cluster_free),
+        .symmetric = @intFromBool(entry.flags.symmetric),
+        .limited_transposition = @intFromBool(entry.flags.limited_transposition),
+        .reserved0 = 0,
+    };
+}
+
+pub export fn lmt_lookup_set_class(set: u16, out: [*c]LmtSetClassInfo) callconv(.c) u32 {
+    if (out == null) return 0;
+    writeSetClassInfo(@ptrCast(out), set);
+    return 1;
+}
+
+pub export fn lmt_lookup_set_class_batch(sets: [*c]const u16, count: u32, out: [*c]LmtSetClassInfo) callconv(.c) u32 {
+    if (sets == null or out == null) return 0;
+    for (sets[0..count], out[0..count]) |set, *slot| {
+        writeSetClassInfo(slot, set);
+    }
+    return count;
+}
+
 pub export fn lmt_scale(scale_type: u8, tonic: u8) callconv(.c) u16 {
     const st = decodeScaleType(scale_type) orelse return 0;
     const root = @as(pitch.PitchClass, @intCast(tonic % 12));
@@ -2333,17 +2809,14 @@ pub export fn lmt_sizeof_orbifold_triad_node() callconv(.c) u32 {
 pub export fn lmt_orbifold_triad_node_at(index: u32, out: [*c]LmtOrbifoldTriadNode) callconv(.c) u32 {
     if (out == null or index >= svg_orbifold.NODE_COUNT) return 0;
 
-    var nodes_buf: [svg_orbifold.NODE_COUNT]svg_orbifold.Node = undefined;
-    const nodes = svg_orbifold.enumerateTriadNodes(&nodes_buf);
     const out_node: *LmtOrbifoldTriadNode = @ptrCast(out);
-    writeOrbifoldTriadNode(out_node, nodes[index]);
+    writeOrbifoldTriadNode(out_node, svg_orbifold.triad_nodes[index]);
     return 1;
 }
 
 pub export fn lmt_find_orbifold_triad_node(set: u16) callconv(.c) u32 {
     const safe_set = maskPitchClassSet(set);
-    var nodes_buf: [svg_orbifold.NODE_COUNT]svg_orbifold.Node = undefined;
-    const nodes = svg_orbifold.enumerateTriadNodes(&nodes_buf);
+    const nodes = &svg_orbifold.triad_nodes;
     if (safe_set == 0) return @as(u32, @intCast(svg_orbifold.NODE_COUNT));
     for (nodes, 0..) |node, index| {
         if (node.set == safe_set) return @as(u32, @intCast(index));
@@ -2373,11 +2846,7 @@ pub export fn lmt_find_orbifold_triad_node(set: u16) callconv(.c) u32 {
 }
 
 pub export fn lmt_orbifold_triad_edge_count() callconv(.c) u32 {
-    var nodes_buf: [svg_orbifold.NODE_COUNT]svg_orbifold.Node = undefined;
-    const nodes = svg_orbifold.enumerateTriadNodes(&nodes_buf);
-    var edges_buf: [svg_orbifold.MAX_EDGES]svg_orbifold.Edge = undefined;
-    const edges = svg_orbifold.buildTriadEdges(nodes, &edges_buf);
-    return @as(u32, @intCast(edges.len));
+    return @as(u32, @intCast(svg_orbifold.triad_edges.len));
 }
 
 pub export fn lmt_sizeof_orbifold_triad_edge() callconv(.c) u32 {
@@ -2751,14 +3220,10 @@ pub export fn lmt_rank_fret_phrase_repairs_n(
 pub export fn lmt_orbifold_triad_edge_at(index: u32, out: [*c]LmtOrbifoldTriadEdge) callconv(.c) u32 {
     if (out == null) return 0;
 
-    var nodes_buf: [svg_orbifold.NODE_COUNT]svg_orbifold.Node = undefined;
-    const nodes = svg_orbifold.enumerateTriadNodes(&nodes_buf);
-    var edges_buf: [svg_orbifold.MAX_EDGES]svg_orbifold.Edge = undefined;
-    const edges = svg_orbifold.buildTriadEdges(nodes, &edges_buf);
-    if (index >= edges.len) return 0;
+    if (index >= svg_orbifold.triad_edges.len) return 0;
 
     const out_edge: *LmtOrbifoldTriadEdge = @ptrCast(out);
-    writeOrbifoldTriadEdge(out_edge, edges[index]);
+    writeOrbifoldTriadEdge(out_edge, svg_orbifold.triad_edges[index]);
     return 1;
 }
 
@@ -3389,7 +3854,7 @@ pub export fn lmt_midi_to_fret_positions_n(note: u8, tuning_ptr: [*c]const u8, t
     return @as(u32, @intCast(positions.len));
 }
 
-pub export fn lmt_generate_voicings_n(chord_set: u16, tuning_ptr: [*c]const u8, tuning_count: u32, max_fret: u8, max_span: u8, out_frets: [*c]i8, out_voicing_cap: u32) callconv(.c) u32 {
+fn generateVoicingsInto(context: *Context, chord_set: u16, tuning_ptr: [*c]const u8, tuning_count: u32, max_fret: u8, max_span: u8, out_frets: [*c]i8, out_voicing_cap: u32) u32 {
     var tuning_buf: [MAX_PARAMETRIC_FRET_STRINGS]pitch.MidiNote = undefined;
     const tuning = decodeTuningGeneric(tuning_ptr, tuning_count, &tuning_buf);
     if (tuning.len == 0 or out_frets == null or out_voicing_cap == 0) return 0;
@@ -3402,8 +3867,8 @@ pub export fn lmt_generate_voicings_n(chord_set: u16, tuning_ptr: [*c]const u8,
         tuning,
         max_fret,
         max_span,
-        generic_voicing_meta_buf[0..row_cap],
-        generic_voicing_fret_buf[0 .. row_cap * tuning.len],
+        context.voicing_meta_buf[0..row_cap],
+        context.voicing_fret_buf[0 .. row_cap * tuning.len],
     );
 
     for (generated, 0..) |voicing, row| {
@@ -3414,7 +3879,16 @@ pub export fn lmt_generate_voicings_n(chord_set: u16, tuning_ptr: [*c]const u8,
     return @as(u32, @intCast(generated.len));
 }
 
-pub export fn lmt_preferred_voicing_n(chord_set: u16, tuning_ptr: [*c]const u8, tuning_count: u32, max_fret: u8, max_span: u8, preferred_bass_pc: u8, out_frets: [*c]i8, out_fret_cap: u32) callconv(.c) u32 {
+pub export fn lmt_generate_voicings_n(chord_set: u16, tuning_ptr: [*c]const u8, tuning_count: u32, max_fret: u8, max_span: u8, out_frets: [*c]i8, out_voicing_cap: u32) callconv(.c) u32 {
+    return generateVoicingsInto(&default_context, chord_set, tuning_ptr, tuning_count, max_fret, max_span, out_frets, out_voicing_cap);
+}
+
+pub export fn lmt_generate_voicings_n_ctx(ctx: ?*anyopaque, chord_set: u16, tuning_ptr: [*c]const u8, tuning_count: u32, max_fret: u8, max_span: u8, out_frets: [*c]i8, out_voicing_cap: u32) callconv(.c) u32 {
+    const context = resolveContext(ctx) orelse return 0;
+    return generateVoicingsInto(context, chord_set, tuning_ptr, tuning_count, max_fret, max_span, out_frets, out_voicing_cap);
+}
+
+fn preferredVoicingInto(context: *Context, chord_set: u16, tuning_ptr: [*c]const u8, tuning_count: u32, max_fret: u8, max_span: u8, preferred_bass_pc: u8, out_frets: [*c]i8, out_fret_cap: u32) u32 {
     var tuning_buf: [MAX_PARAMETRIC_FRET_STRINGS]pitch.MidiNote = undefined;
     const tuning = decodeTuningGeneric(tuning_ptr, tuning_count, &tuning_buf);
     if (tuning.len == 0 or out_frets == null) return 0;
@@ -3433,14 +3907,23 @@ pub export fn lmt_preferred_voicing_n(chord_set: u16, tuning_ptr: [*c]const u8,
         max_fret,
         max_span,
         preferred_pc,
-        generic_voicing_meta_buf[0..MAX_C_API_GENERIC_VOICINGS],
-        generic_voicing_fret_buf[0 .. MAX_C_API_GENERIC_VOICINGS * tuning.len],
+        context.voicing_meta_buf[0..MAX_C_API_GENERIC_VOICINGS],
+        context.voicing_fret_buf[0 .. MAX_C_API_GENERIC_VOICINGS * tuning.len],
     ) orelse return 0;
 
     @memcpy(out_frets[0..tuning.len], preferred.voicing.frets);
     return @as(u32, @intCast(preferred.row_count));
 }
 
+pub export fn lmt_preferred_voicing_n(chord_set: u16, tuning_ptr: [*c]const u8, tuning_count: u32, max_fret: u8, max_span: u8, preferred_bass_pc: u8, out_frets: [*c]i8, out_fret_cap: u32) callconv(.c) u32 {
+    return preferredVoicingInto(&default_context, chord_set, tuning_ptr, tuning_count, max_fret, max_span, preferred_bass_pc, out_frets, out_fret_cap);
+}
+
+pub export fn lmt_preferred_voicing_n_ctx(ctx: ?*anyopaque, chord_set: u16, tuning_ptr: [*c]const u8, tuning_count: u32, max_fret: u8, max_span: u8, preferred_bass_pc: u8, out_frets: [*c]i8, out_fret_cap: u32) callconv(.c) u32 {
+    const context = resolveContext(ctx) orelse return 0;
+    return preferredVoicingInto(context, chord_set, tuning_ptr, tuning_count, max_fret, max_span, preferred_bass_pc, out_frets, out_fret_cap);
+}
+
 pub export fn lmt_rank_context_suggestions(set: u16, midi_notes_ptr: [*c]const u8, note_count: u32, tonic: u8, mode_type: u8, out: [*c]LmtContextSuggestion, out_cap: u32) callconv(.c) u32 {
     const mt = decodeModeType(mode_type) orelse return 0;
     const tonic_pc = @as(pitch.PitchClass, @intCast(tonic % 12));
@@ -4161,38 +4644,55 @@ pub export fn lmt_suggest_easier_keyboard_fingering_n(
     return 1;
 }
 
-pub export fn lmt_svg_clock_optc(set: u16, buf: [*c]u8, buf_size: u32) callconv(.c) u32 {
-    var svg_buf: [16384]u8 = undefined;
+fn renderClockOptcSvg(set: u16, svg_buf: []u8) []const u8 {
     var label_buf: [12]u8 = undefined;
 
     const safe_set = maskPitchClassSet(set);
     const label = pcs.format(safe_set, &label_buf);
-    const svg = svg_clock.renderOPTC(safe_set, label, &svg_buf);
+    return svg_clock.renderOPTC(safe_set, label, svg_buf);
+}
 
-    return copySvgOut(svg, buf, buf_size);
+pub export fn lmt_svg_clock_optc(set: u16, buf: [*c]u8, buf_size: u32) callconv(.c) u32 {
+    if (prerendered_assets.lookup(.clock_optc, maskPitchClassSet(set))) |svg| return copySvgOut(svg, buf, buf_size);
+    const cache_key = setCacheKey(.svg_clock_optc, set);
+    if (cachedSvgOut(&cache_key, buf, buf_size)) |len| return len;
+    var svg_buf: [16384]u8 = undefined;
+    return storeSvgOut(&cache_key, renderClockOptcSvg(set, &svg_buf), buf, buf_size);
+}
+
+fn renderOpticKGroupSvg(set: u16, svg_buf: []u8) []const u8 {
+    return svg_clock.renderOpticKGroup(maskPitchClassSet(set), svg_buf);
 }
 
 pub export fn lmt_svg_optic_k_group(set: u16, buf: [*c]u8, buf_size: u32) callconv(.c) u32 {
+    if (prerendered_assets.lookup(.optic_k_group, maskPitchClassSet(set))) |svg| return copySvgOut(svg, buf, buf_size);
+    const cache_key = setCacheKey(.svg_optic_k_group, set);
+    if (cachedSvgOut(&cache_key, buf, buf_size)) |len| return len;
     var svg_buf: [128 * 1024]u8 = undefined;
-    const safe_set = maskPitchClassSet(set);
-    const svg = svg_clock.renderOpticKGroup(safe_set, &svg_buf);
-    return copySvgOut(svg, buf, buf_size);
+    return storeSvgOut(&cache_key, renderOpticKGroupSvg(set, &svg_buf), buf, buf_size);
 }
 
 pub export fn lmt_svg_evenness_chart(buf: [*c]u8, buf_size: u32) callconv(.c) u32 {
+    if (prerendered_assets.lookup(.evenness_chart, 0)) |svg| return copySvgOut(svg, buf, buf_size);
+    const cache_key = render_cache.Key.init(.svg_evenness_chart);
+    if (cachedSvgOut(&cache_key, buf, buf_size)) |len| return len;
     var svg_buf: [128 * 1024]u8 = undefined;
     const svg = svg_evenness_chart.renderEvennessChart(&svg_buf);
-    return copySvgOut(svg, buf, buf_size);
+    return storeSvgOut(&cache_key, svg, buf, buf_size);
+}
+
+fn renderEvennessFieldSvg(set: u16, svg_buf: []u8) []const u8 {
+    return svg_evenness_chart.renderEvennessField(maskPitchClassSet(set), svg_buf);
 }
 
 pub export fn lmt_svg_evenness_field(set: u16, buf: [*c]u8, buf_size: u32) callconv(.c) u32 {
+    const cache_key = setCacheKey(.svg_evenness_field, set);
+    if (cachedSvgOut(&cache_key, buf, buf_size)) |len| return len;
     var svg_buf: [128 * 1024]u8 = undefined;
-    const safe_set = maskPitchClassSet(set);
-    const svg = svg_evenness_chart.renderEvennessField(safe_set, &svg_buf);
-    return copySvgOut(svg, buf, buf_size);
+    return storeSvgOut(&cache_key, renderEvennessFieldSvg(set, &svg_buf), buf, buf_size);
 }
 
-pub export fn lmt_svg_fret(frets_ptr: [*c]const i8, buf: [*c]u8, buf_size: u32) callconv(.c) u32 {
+fn decodeStandardFrets(frets_ptr: [*c]const i8) [guitar.NUM_STRINGS]i8 {
     var frets: [guitar.NUM_STRINGS]i8 = [_]i8{-1} ** guitar.NUM_STRINGS;
     if (frets_ptr != null) {
         var i: usize = 0;
@@ -4201,34 +4701,44 @@ pub export fn lmt_svg_fret(frets_ptr: [*c]const i8, buf: [*c]u8, buf_size: u32)
             frets[i] = if (raw < -1) -1 else if (raw > guitar.MAX_FRET) @as(i8, @intCast(guitar.MAX_FRET)) else raw;
         }
     }
+    return frets;
+}
 
+fn renderStandardFretSvg(frets_ptr: [*c]const i8, svg_buf: []u8) []const u8 {
     const voicing = guitar.GuitarVoicing{
-        .frets = frets,
+        .frets = decodeStandardFrets(frets_ptr),
         .tuning = guitar.tunings.STANDARD,
     };
 
+    return svg_fret.renderFretDiagram(voicing, svg_buf);
+}
+
+pub export fn lmt_svg_fret(frets_ptr: [*c]const i8, buf: [*c]u8, buf_size: u32) callconv(.c) u32 {
+    const cache_key = standardFretCacheKey(.svg_fret, frets_ptr);
+    if (cachedSvgOut(&cache_key, buf, buf_size)) |len| return len;
     var svg_buf: [4096]u8 = undefined;
-    const svg = svg_fret.renderFretDiagram(voicing, &svg_buf);
-    return copySvgOut(svg, buf, buf_size);
+    return storeSvgOut(&cache_key, renderStandardFretSvg(frets_ptr, &svg_buf), buf, buf_size);
 }
 
-pub export fn lmt_svg_fret_n(frets_ptr: [*c]const i8, string_count: u32, window_start: u32, visible_frets: u32, buf: [*c]u8, buf_size: u32) callconv(.c) u32 {
+fn renderFretDiagramSvg(frets_ptr: [*c]const i8, string_count: u32, tuning: ?[]const pitch.MidiNote, window_start: u32, visible_frets: u32, svg_buf: []u8) []const u8 {
     if (frets_ptr == null or string_count == 0) {
-        var empty_svg_buf: [256]u8 = undefined;
-        const svg = svg_fret.renderDiagram(.{ .frets = &[_]i8{} }, &empty_svg_buf);
-        return copySvgOut(svg, buf, buf_size);
+        return svg_fret.renderDiagram(.{ .frets = &[_]i8{} }, svg_buf);
     }
 
     const count = @as(usize, @intCast(string_count));
-    const raw_frets = frets_ptr[0..count];
-
-    var svg_buf: [8192]u8 = undefined;
-    const svg = svg_fret.renderDiagram(.{
-        .frets = raw_frets,
+    return svg_fret.renderDiagram(.{
+        .frets = frets_ptr[0..count],
         .window_start = if (window_start == 0 and visible_frets == 0) null else window_start,
         .visible_frets = visible_frets,
-    }, &svg_buf);
-    return copySvgOut(svg, buf, buf_size);
+        .tuning = tuning,
+    }, svg_buf);
+}
+
+pub export fn lmt_svg_fret_n(frets_ptr: [*c]const i8, string_count: u32, window_start: u32, visible_frets: u32, buf: [*c]u8, buf_size: u32) callconv(.c) u32 {
+    const cache_key = fretCacheKey(.svg_fret_n, frets_ptr, string_count, null, window_start, visible_frets);
+    if (cachedSvgOut(&cache_key, buf, buf_size)) |len| return len;
+    var svg_buf: [8192]u8 = undefined;
+    return storeSvgOut(&cache_key, renderFretDiagramSvg(frets_ptr, string_count, null, window_start, visible_frets, &svg_buf), buf, buf_size);
 }
 
 pub export fn lmt_svg_fret_tuned_n(
@@ -4241,32 +4751,31 @@ pub export fn lmt_svg_fret_tuned_n(
     buf: [*c]u8,
     buf_size: u32,
 ) callconv(.c) u32 {
-    if (frets_ptr == null or string_count == 0) {
-        var empty_svg_buf: [256]u8 = undefined;
-        const svg = svg_fret.renderDiagram(.{ .frets = &[_]i8{} }, &empty_svg_buf);
-        return copySvgOut(svg, buf, buf_size);
-    }
-
-    const count = @as(usize, @intCast(string_count));
-    const raw_frets = frets_ptr[0..count];
     var tuning_buf: [MAX_PARAMETRIC_FRET_STRINGS]pitch.MidiNote = undefined;
     const tuning = decodeTuningGeneric(tuning_ptr, tuning_count, &tuning_buf);
+    const cache_key = fretCacheKey(.svg_fret_tuned_n, frets_ptr, string_count, tuning, window_start, visible_frets);
+    if (cachedSvgOut(&cache_key, buf, buf_size)) |len| return len;
 
     var svg_buf: [8192]u8 = undefined;
-    const svg = svg_fret.renderDiagram(.{
-        .frets = raw_frets,
-        .window_start = if (window_start == 0 and visible_frets == 0) null else window_start,
-        .visible_frets = visible_frets,
-        .tuning = tuning,
-    }, &svg_buf);
-    return copySvgOut(svg, buf, buf_size);
+    return storeSvgOut(&cache_key, renderFretDiagramSvg(frets_ptr, string_count, tuning, window_start, visible_frets, &svg_buf), buf, buf_size);
 }
 
-pub export fn lmt_svg_chord_staff(chord_kind: u8, root: u8, buf: [*c]u8, buf_size: u32) callconv(.c) u32 {
+/// Notes and key a staff writer draws, decoded from the public arguments.
+const StaffInput = struct {
+    notes: []const pitch.MidiNote,
+    key: key.Key,
+};
+
+fn renderChordStaffSvg(chord_kind: u8, root: u8, svg_buf: []u8) []const u8 {
+    var notes: [4]pitch.MidiNote = undefined;
+    const input = chordStaffInput(chord_kind, root, &notes);
+    return svg_staff.renderChordStaff(input.notes, input.key, svg_buf);
+}
+
+fn chordStaffInput(chord_kind: u8, root: u8, notes: *[4]pitch.MidiNote) StaffInput {
     const root_pc = @as(pitch.PitchClass, @intCast(root % 12));
     const root_midi: pitch.MidiNote = @as(pitch.MidiNote, @intCast(60 + @as(u8, root_pc)));
 
-    var notes: [4]pitch.MidiNote = undefined;
     const count: usize = switch (chord_kind) {
         CHORD_MINOR => blk: {
             notes[0] = root_midi;
@@ -4294,46 +4803,311 @@ pub export fn lmt_svg_chord_staff(chord_kind: u8, root: u8, buf: [*c]u8, buf_siz
         },
     };
 
-    const k = key.Key.init(root_pc, .major);
+    return .{ .notes = notes[0..count], .key = key.Key.init(root_pc, .major) };
+}
 
+pub export fn lmt_svg_chord_staff(chord_kind: u8, root: u8, buf: [*c]u8, buf_size: u32) callconv(.c) u32 {
+    const cache_key = chordStaffCacheKey(.svg_chord_staff, chord_kind, root);
+    if (cachedSvgOut(&cache_key, buf, buf_size)) |len| return len;
     var svg_buf: [16384]u8 = undefined;
-    const svg = svg_staff.renderChordStaff(notes[0..count], k, &svg_buf);
-    return copySvgOut(svg, buf, buf_size);
+    return storeSvgOut(&cache_key, renderChordStaffSvg(chord_kind, root, &svg_buf), buf, buf_size);
 }
 
-pub export fn lmt_svg_key_staff(tonic: u8, quality_raw: u8, buf: [*c]u8, buf_size: u32) callconv(.c) u32 {
+fn renderKeyStaffSvg(tonic: u8, quality_raw: u8, svg_buf: []u8) []const u8 {
+    var notes: [8]pitch.MidiNote = undefined;
+    const input = keyStaffInput(tonic, quality_raw, &notes);
+    return svg_staff.renderKeyStaff(input.notes, input.key, svg_buf);
+}
+
+fn keyStaffInput(tonic: u8, quality_raw: u8, notes: *[8]pitch.MidiNote) StaffInput {
     const tonic_pc = @as(pitch.PitchClass, @intCast(tonic % 12));
     const quality: key.KeyQuality = if (quality_raw == KEY_MINOR) .minor else .major;
-    const k = key.Key.init(tonic_pc, quality);
-
-    var notes: [8]pitch.MidiNote = undefined;
-    const key_notes = buildKeyStaffNotes(tonic_pc, quality, &notes);
+    return .{ .notes = buildKeyStaffNotes(tonic_pc, quality, notes), .key = key.Key.init(tonic_pc, quality) };
+}
 
+pub export fn lmt_svg_key_staff(tonic: u8, quality_raw: u8, buf: [*c]u8, buf_size: u32) callconv(.c) u32 {
+    if (prerendered_assets.lookup(.key_staff, prerendered_assets.keyStaffIndex(tonic, quality_raw == KEY_MINOR))) |svg| return copySvgOut(svg, buf, buf_size);
+    const cache_key = keyStaffCacheKey(.svg_key_staff, tonic, quality_raw);
+    if (cachedSvgOut(&cache_key, buf, buf_size)) |len| return len;
     var svg_buf: [24576]u8 = undefined;
-    const svg = svg_staff.renderKeyStaff(key_notes, k, &svg_buf);
-    return copySvgOut(svg, buf, buf_size);
+    return storeSvgOut(&cache_key, renderKeyStaffSvg(tonic, quality_raw, &svg_buf), buf, buf_size);
 }
 
-pub export fn lmt_svg_keyboard(notes_ptr: [*c]const u8, note_count: u32, range_low: u8, range_high: u8, buf: [*c]u8, buf_size: u32) callconv(.c) u32 {
+fn renderKeyboardSvg(notes_ptr: [*c]const u8, note_count: u32, range_low: u8, range_high: u8, svg_buf: []u8) []const u8 {
     var notes_buf: [MAX_KEYBOARD_RENDER_NOTES]pitch.MidiNote = undefined;
     const notes = decodeMidiNotes(notes_ptr, note_count, &notes_buf);
     const range = sanitizeKeyboardRange(range_low, range_high);
+    return svg_keyboard.renderKeyboard(notes, range.low, range.high, svg_buf);
+}
 
+pub export fn lmt_svg_keyboard(notes_ptr: [*c]const u8, note_count: u32, range_low: u8, range_high: u8, buf: [*c]u8, buf_size: u32) callconv(.c) u32 {
+    const cache_key = keyboardCacheKey(.svg_keyboard, notes_ptr, note_count, range_low, range_high);
+    if (cachedSvgOut(&cache_key, buf, buf_size)) |len| return len;
     var svg_buf: [128 * 1024]u8 = undefined;
-    const svg = svg_keyboard.renderKeyboard(notes, range.low, range.high, &svg_buf);
-    return copySvgOut(svg, buf, buf_size);
+    return storeSvgOut(&cache_key, renderKeyboardSvg(notes_ptr, note_count, range_low, range_high, &svg_buf), buf, buf_size);
 }
 
-pub export fn lmt_svg_piano_staff(notes_ptr: [*c]const u8, note_count: u32, tonic: u8, quality_raw: u8, buf: [*c]u8, buf_size: u32) callconv(.c) u32 {
+fn renderPianoStaffSvg(notes_ptr: [*c]const u8, note_count: u32, tonic: u8, quality_raw: u8, svg_buf: []u8) []const u8 {
     var notes_buf: [MAX_KEYBOARD_RENDER_NOTES]pitch.MidiNote = undefined;
-    const notes = decodeMidiNotes(notes_ptr, note_count, &notes_buf);
+    const input = pianoStaffInput(notes_ptr, note_count, tonic, quality_raw, &notes_buf);
+    return svg_staff.renderPianoStaff(input.notes, input.key, svg_buf);
+}
+
+fn pianoStaffInput(notes_ptr: [*c]const u8, note_count: u32, tonic: u8, quality_raw: u8, notes_buf: *[MAX_KEYBOARD_RENDER_NOTES]pitch.MidiNote) StaffInput {
     const tonic_pc = @as(pitch.PitchClass, @intCast(tonic % 12));
     const quality: key.KeyQuality = if (quality_raw == KEY_MINOR) .minor else .major;
-    const k = key.Key.init(tonic_pc, quality);
+    return .{ .notes = decodeMidiNotes(notes_ptr, note_count, notes_buf), .key = key.Key.init(tonic_pc, quality) };
+}
 
+pub export fn lmt_svg_piano_staff(notes_ptr: [*c]const u8, note_count: u32, tonic: u8, quality_raw: u8, buf: [*c]u8, buf_size: u32) callconv(.c) u32 {
+    const cache_key = pianoStaffCacheKey(.svg_piano_staff, notes_ptr, note_count, tonic, quality_raw);
+    if (cachedSvgOut(&cache_key, buf, buf_size)) |len| return len;
     var svg_buf: [32 * 1024]u8 = undefined;
-    const svg = svg_staff.renderPianoStaff(notes, k, &svg_buf);
-    return copySvgOut(svg, buf, buf_size);
+    return storeSvgOut(&cache_key, renderPianoStaffSvg(notes_ptr, note_count, tonic, quality_raw, &svg_buf), buf, buf_size);
+}
+
+// Render-once variants of the public SVG writers. Each renders into the
+// context, copies what fits into `buf`, and keeps the full document so a
+// too-small first call can be finished with `lmt_context_svg_copy`. Scratch
+// windows match the legacy stack buffers, so output is byte-identical.
+
+pub export fn lmt_svg_clock_optc_ctx(ctx: ?*anyopaque, set: u16, buf: [*c]u8, buf_size: u32) callconv(.c) u32 {
+    const context = resolveContext(ctx) orelse return 0;
+    return keepContextSvg(context, renderClockOptcSvg(set, context.svg_buf[0..16384]), buf, buf_size);
+}
+
+pub export fn lmt_svg_optic_k_group_ctx(ctx: ?*anyopaque, set: u16, buf: [*c]u8, buf_size: u32) callconv(.c) u32 {
+    const context = resolveContext(ctx) orelse return 0;
+    return keepContextSvg(context, renderOpticKGroupSvg(set, context.svg_buf[0 .. 128 * 1024]), buf, buf_size);
+}
+
+pub export fn lmt_svg_evenness_chart_ctx(ctx: ?*anyopaque, buf: [*c]u8, buf_size: u32) callconv(.c) u32 {
+    const context = resolveContext(ctx) orelse return 0;
+    return keepContextSvg(context, svg_evenness_chart.renderEvennessChart(context.svg_buf[0 .. 128 * 1024]), buf, buf_size);
+}
+
+pub export fn lmt_svg_evenness_field_ctx(ctx: ?*anyopaque, set: u16, buf: [*c]u8, buf_size: u32) callconv(.c) u32 {
+    const context = resolveContext(ctx) orelse return 0;
+    return keepContextSvg(context, renderEvennessFieldSvg(set, context.svg_buf[0 .. 128 * 1024]), buf, buf_size);
+}
+
+pub export fn lmt_svg_fret_ctx(ctx: ?*anyopaque, frets_ptr: [*c]const i8, buf: [*c]u8, buf_size: u32) callconv(.c) u32 {
+    const context = resolveContext(ctx) orelse return 0;
+    return keepContextSvg(context, renderStandardFretSvg(frets_ptr, context.svg_buf[0..4096]), buf, buf_size);
+}
+
+pub export fn lmt_svg_fret_n_ctx(ctx: ?*anyopaque, frets_ptr: [*c]const i8, string_count: u32, window_start: u32, visible_frets: u32, buf: [*c]u8, buf_size: u32) callconv(.c) u32 {
+    const context = resolveContext(ctx) orelse return 0;
+    return keepContextSvg(context, renderFretDiagramSvg(frets_ptr, string_count, null, window_start, visible_frets, context.svg_buf[0..8192]), buf, buf_size);
+}
+
+pub export fn lmt_svg_fret_tuned_n_ctx(
+    ctx: ?*anyopaque,
+    frets_ptr: [*c]const i8,
+    string_count: u32,
+    tuning_ptr: [*c]const u8,
+    tuning_count: u32,
+    window_start: u32,
+    visible_frets: u32,
+    buf: [*c]u8,
+    buf_size: u32,
+) callconv(.c) u32 {
+    const context = resolveContext(ctx) orelse return 0;
+    var tuning_buf: [MAX_PARAMETRIC_FRET_STRINGS]pitch.MidiNote = undefined;
+    const tuning = decodeTuningGeneric(tuning_ptr, tuning_count, &tuning_buf);
+    return keepContextSvg(context, renderFretDiagramSvg(frets_ptr, string_count, tuning, window_start, visible_frets, context.svg_buf[0..8192]), buf, buf_size);
+}
+
+pub export fn lmt_svg_chord_staff_ctx(ctx: ?*anyopaque, chord_kind: u8, root: u8, buf: [*c]u8, buf_size: u32) callconv(.c) u32 {
+    const context = resolveContext(ctx) orelse return 0;
+    return keepContextSvg(context, renderChordStaffSvg(chord_kind, root, context.svg_buf[0..16384]), buf, buf_size);
+}
+
+pub export fn lmt_svg_key_staff_ctx(ctx: ?*anyopaque, tonic: u8, quality_raw: u8, buf: [*c]u8, buf_size: u32) callconv(.c) u32 {
+    const context = resolveContext(ctx) orelse return 0;
+    return keepContextSvg(context, renderKeyStaffSvg(tonic, quality_raw, context.svg_buf[0..24576]), buf, buf_size);
+}
+
+pub export fn lmt_svg_keyboard_ctx(ctx: ?*anyopaque, notes_ptr: [*c]const u8, note_count: u32, range_low: u8, range_high: u8, buf: [*c]u8, buf_size: u32) callconv(.c) u32 {
+    const context = resolveContext(ctx) orelse return 0;
+    return keepContextSvg(context, renderKeyboardSvg(notes_ptr, note_count, range_low, range_high, context.svg_buf[0 .. 128 * 1024]), buf, buf_size);
+}
+
+pub export fn lmt_svg_piano_staff_ctx(ctx: ?*anyopaque, notes_ptr: [*c]const u8, note_count: u32, tonic: u8, quality_raw: u8, buf: [*c]u8, buf_size: u32) callconv(.c) u32 {
+    const context = resolveContext(ctx) orelse return 0;
+    return keepContextSvg(context, renderPianoStaffSvg(notes_ptr, note_count, tonic, quality_raw, context.svg_buf[0 .. 32 * 1024]), buf, buf_size);
+}
+
+pub export fn lmt_context_svg_len(ctx: ?*anyopaque) callconv(.c) u32 {
+    const context = resolveContext(ctx) orelse return 0;
+    return @as(u32, @intCast(context.svg_len));
+}
+
+pub export fn lmt_context_svg_copy(ctx: ?*anyopaque, buf: [*c]u8, buf_size: u32) callconv(.c) u32 {
+    const context = resolveContext(ctx) orelse return 0;
+    return copySvgOut(context.svg_buf[0..context.svg_len], buf, buf_size);
+}
+
+// Streaming writers push bytes straight from the renderer to a host callback
+// through one 4 KiB chunk buffer, so memory stays bounded for large scenes.
+pub export fn lmt_svg_optic_k_group_stream(set: u16, write_fn: ?StreamWriteFn, user: ?*anyopaque) callconv(.c) u32 {
+    return streamSvg(write_fn, user, svg_clock.writeOpticKGroup, .{maskPitchClassSet(set)});
+}
+
+pub export fn lmt_svg_evenness_chart_stream(write_fn: ?StreamWriteFn, user: ?*anyopaque) callconv(.c) u32 {
+    return streamSvg(write_fn, user, svg_evenness_chart.writeEvennessChart, .{});
+}
+
+pub export fn lmt_svg_evenness_field_stream(set: u16, write_fn: ?StreamWriteFn, user: ?*anyopaque) callconv(.c) u32 {
+    return streamSvg(write_fn, user, svg_evenness_chart.writeEvennessField, .{maskPitchClassSet(set)});
+}
+
+// Batch renderers write a whole catalog in one call. Document i occupies
+// arena[offsets[i]..offsets[i + 1]] with no NUL terminator, so `offsets`
+// holds count + 1 entries. Setup shared by every item (clock prelude and node
+// geometry, evenness dot layout and background, fret grid per window) is
+// built once per batch and copied in front of each item's own markup.
+const BatchDoc = struct {
+    prefix: []const u8,
+    body: []const u8,
+};
+
+const OptcBatch = struct {
+    sets: [*c]const u16,
+    prefix_buf: [4096]u8 = undefined,
+    prefix_len: usize = 0,
+    body_buf: [16384]u8 = undefined,
+
+    fn init(self: *OptcBatch, sets: [*c]const u16) bool {
+        self.sets = sets;
+        var stream = std.io.fixedBufferStream(&self.prefix_buf);
+        svg_clock.writeOPTCPrefix(stream.writer()) catch return false;
+        self.prefix_len = stream.pos;
+        return true;
+    }
+
+    fn render(self: *OptcBatch, index: usize) ?BatchDoc {
+        var label_buf: [12]u8 = undefined;
+        const set = maskPitchClassSet(self.sets[index]);
+        var stream = std.io.fixedBufferStream(&self.body_buf);
+        svg_clock.writeOPTCBody(set, pcs.format(set, &label_buf), stream.writer()) catch return null;
+        return .{ .prefix = self.prefix_buf[0..self.prefix_len], .body = self.body_buf[0..stream.pos] };
+    }
+};
+
+const EvennessFieldBatch = struct {
+    sets: [*c]const u16,
+    layout: svg_evenness_chart.FieldLayout,
+    prefix_buf: [64 * 1024]u8 = undefined,
+    prefix_len: usize = 0,
+    body_buf: [64 * 1024]u8 = undefined,
+
+    fn init(self: *EvennessFieldBatch, sets: [*c]const u16) bool {
+        self.sets = sets;
+        self.layout.init();
+        var stream = std.io.fixedBufferStream(&self.prefix_buf);
+        svg_evenness_chart.writeFieldBackground(&self.layout, stream.writer()) catch return false;
+        self.prefix_len = stream.pos;
+        return true;
+    }
+
+    fn render(self: *EvennessFieldBatch, index: usize) ?BatchDoc {
+        var stream = std.io.fixedBufferStream(&self.body_buf);
+        const w = stream.writer();
+        svg_evenness_chart.writeFieldHighlight(&self.layout, maskPitchClassSet(self.sets[index]), w) catch return null;
+        w.writeAll(svg_evenness_chart.FIELD_CLOSE) catch return null;
+        return .{ .prefix = self.prefix_buf[0..self.prefix_len], .body = self.body_buf[0..stream.pos] };
+    }
+};
+
+const FretBatch = struct {
+    frets: [*c]const i8,
+    string_count: usize,
+    window_start: ?u32,
+    visible_frets: u32,
+    grid: svg_fret.GridCache = .{},
+    body_buf: [8192]u8 = undefined,
+
+    fn init(self: *FretBatch, frets: [*c]const i8, string_count: u32, window_start: u32, visible_frets: u32) bool {
+        self.* = .{
+            .frets = frets,
+            .string_count = @as(usize, @intCast(string_count)),
+            .window_start = if (window_start == 0 and visible_frets == 0) null else window_start,
+            .visible_frets = visible_frets,
+        };
+        return true;
+    }
+
+    fn render(self: *FretBatch, index: usize) ?BatchDoc {
+        const row = if (self.string_count == 0) &[_]i8{} else self.frets[index * self.string_count ..][0..self.string_count];
+        const parts = svg_fret.renderDiagramParts(.{
+            .frets = row,
+            .window_start = self.window_start,
+            .visible_frets = self.visible_frets,
+        }, &self.grid, &self.body_buf) catch return null;
+        return .{ .prefix = parts.prefix, .body = parts.body };
+    }
+};
+
+fn packSvgBatch(batch: anytype, count: u32, offsets: [*c]u32, arena: [*c]u8, arena_size: u32) u32 {
+    offsets[0] = 0;
+    var pos: usize = 0;
+    var written: u32 = 0;
+    while (written < count) : (written += 1) {
+        const doc = batch.render(written) orelse break;
+        const end = pos + doc.prefix.len + doc.body.len;
+        if (end > std.math.maxInt(u32)) break;
+        if (arena != null) {
+            if (end > arena_size) break;
+            @memcpy(arena[pos..][0..doc.prefix.len], doc.prefix);
+            @memcpy(arena[pos + doc.prefix.len .. end], doc.body);
+        }
+        pos = end;
+        offsets[written + 1] = @as(u32, @intCast(pos));
+    }
+    return written;
+}
+
+fn rasterSvgBatch(batch: anytype, count: u32, width: u32, height: u32, out_rgba: [*c]u8, out_rgba_size: u32) u32 {
+    const image_bytes = requiredRgbaBytes(width, height) orelse return 0;
+    const fit = @min(count, out_rgba_size / image_bytes);
+
+    var svg_buf: [PUBLIC_SVG_MAX_BYTES]u8 = undefined;
+    var written: u32 = 0;
+    while (written < fit) : (written += 1) {
+        const doc = batch.render(written) orelse break;
+        const len = doc.prefix.len + doc.body.len;
+        if (len > svg_buf.len) break;
+        @memcpy(svg_buf[0..doc.prefix.len], doc.prefix);
+        @memcpy(svg_buf[doc.prefix.len..len], doc.body);
+        const image = out_rgba[@as(usize, written) * image_bytes ..][0..image_bytes];
+        _ = bitmap_compat.renderSvgMarkupRgba(width, height, svg_buf[0..len], image) catch break;
+    }
+    return written;
+}
+
+/// Writes one OPTC clock per set into `arena` and returns how many documents
+/// fit. A NULL arena fills `offsets` with the sizes the full batch needs.
+pub export fn lmt_svg_clock_optc_batch(sets: [*c]const u16, count: u32, offsets: [*c]u32, arena: [*c]u8, arena_size: u32) callconv(.c) u32 {
+    if (sets == null or offsets == null) return 0;
+    var batch: OptcBatch = undefined;
+    if (!batch.init(sets)) return 0;
+    return packSvgBatch(&batch, count, offsets, arena, arena_size);
+}
+
+pub export fn lmt_svg_evenness_field_batch(sets: [*c]const u16, count: u32, offsets: [*c]u32, arena: [*c]u8, arena_size: u32) callconv(.c) u32 {
+    if (sets == null or offsets == null) return 0;
+    var batch: EvennessFieldBatch = undefined;
+    if (!batch.init(sets)) return 0;
+    return packSvgBatch(&batch, count, offsets, arena, arena_size);
+}
+
+/// `frets` holds `count` rows of `string_count` frets, one diagram per row.
+pub export fn lmt_svg_fret_n_batch(frets: [*c]const i8, string_count: u32, count: u32, window_start: u32, visible_frets: u32, offsets: [*c]u32, arena: [*c]u8, arena_size: u32) callconv(.c) u32 {
+    if ((frets == null and string_count != 0) or offsets == null) return 0;
+    var batch: FretBatch = undefined;
+    if (!batch.init(frets, string_count, window_start, visible_frets)) return 0;
+    return packSvgBatch(&batch, count, offsets, arena, arena_size);
 }
 
 pub export fn lmt_raster_is_enabled() callconv(.c) u32 {
@@ -4361,52 +5135,169 @@ pub export fn lmt_raster_demo_rgba(width: u32, height: u32, out_rgba: [*c]u8, ou
 }
 
 pub export fn lmt_bitmap_clock_optc_rgba(set: u16, width: u32, height: u32, out_rgba: [*c]u8, out_rgba_size: u32) callconv(.c) u32 {
-    const total = lmt_svg_clock_optc(set, null, 0);
-    if (total == 0 or total >= compat_svg_buf.len) return 0;
-    const written_total = lmt_svg_clock_optc(set, @ptrCast(&compat_svg_buf), @intCast(compat_svg_buf.len));
-    if (written_total != total) return 0;
-    return renderPublicSvgBitmap(compat_svg_buf[0..@as(usize, total)], width, height, out_rgba, out_rgba_size);
+    const cache_key = withRgbaSize(setCacheKey(.bitmap_clock_optc, set), width, height);
+    if (cachedRgbaOut(&cache_key, out_rgba, out_rgba_size)) |len| return len;
+    var svg_buf: [PUBLIC_SVG_MAX_BYTES]u8 = undefined;
+    return storeRgbaOut(&cache_key, renderPublicSvgBitmap(prerendered_assets.lookup(.clock_optc, maskPitchClassSet(set)) orelse renderClockOptcSvg(set, &svg_buf), width, height, out_rgba, out_rgba_size), out_rgba);
 }
 
 pub export fn lmt_bitmap_optic_k_group_rgba(set: u16, width: u32, height: u32, out_rgba: [*c]u8, out_rgba_size: u32) callconv(.c) u32 {
-    const total = lmt_svg_optic_k_group(set, null, 0);
-    if (total == 0 or total >= compat_svg_buf.len) return 0;
-    const written_total = lmt_svg_optic_k_group(set, @ptrCast(&compat_svg_buf), @intCast(compat_svg_buf.len));
-    if (written_total != total) return 0;
-    return renderPublicSvgBitmap(compat_svg_buf[0..@as(usize, total)], width, height, out_rgba, out_rgba_size);
+    const cache_key = withRgbaSize(setCacheKey(.bitmap_optic_k_group, set), width, height);
+    if (cachedRgbaOut(&cache_key, out_rgba, out_rgba_size)) |len| return len;
+    var svg_buf: [PUBLIC_SVG_MAX_BYTES]u8 = undefined;
+    return storeRgbaOut(&cache_key, renderPublicSvgBitmap(prerendered_assets.lookup(.optic_k_group, maskPitchClassSet(set)) orelse renderOpticKGroupSvg(set, &svg_buf), width, height, out_rgba, out_rgba_size), out_rgba);
 }
 
 pub export fn lmt_bitmap_evenness_chart_rgba(width: u32, height: u32, out_rgba: [*c]u8, out_rgba_size: u32) callconv(.c) u32 {
-    const total = lmt_svg_evenness_chart(null, 0);
-    if (total == 0 or total >= compat_svg_buf.len) return 0;
-    const written_total = lmt_svg_evenness_chart(@ptrCast(&compat_svg_buf), @intCast(compat_svg_buf.len));
-    if (written_total != total) return 0;
-    return renderPublicSvgBitmap(compat_svg_buf[0..@as(usize, total)], width, height, out_rgba, out_rgba_size);
+    const cache_key = withRgbaSize(render_cache.Key.init(.bitmap_evenness_chart), width, height);
+    if (cachedRgbaOut(&cache_key, out_rgba, out_rgba_size)) |len| return len;
+    var svg_buf: [PUBLIC_SVG_MAX_BYTES]u8 = undefined;
+    return storeRgbaOut(&cache_key, renderPublicSvgBitmap(prerendered_assets.lookup(.evenness_chart, 0) orelse svg_evenness_chart.renderEvennessChart(&svg_buf), width, height, out_rgba, out_rgba_size), out_rgba);
 }
 
 pub export fn lmt_bitmap_evenness_field_rgba(set: u16, width: u32, height: u32, out_rgba: [*c]u8, out_rgba_size: u32) callconv(.c) u32 {
-    const total = lmt_svg_evenness_field(set, null, 0);
-    if (total == 0 or total >= compat_svg_buf.len) return 0;
-    const written_total = lmt_svg_evenness_field(set, @ptrCast(&compat_svg_buf), @intCast(compat_svg_buf.len));
-    if (written_total != total) return 0;
-    return renderPublicSvgBitmap(compat_svg_buf[0..@as(usize, total)], width, height, out_rgba, out_rgba_size);
+    const cache_key = withRgbaSize(setCacheKey(.bitmap_evenness_field, set), width, height);
+    if (cachedRgbaOut(&cache_key, out_rgba, out_rgba_size)) |len| return len;
+    var svg_buf: [PUBLIC_SVG_MAX_BYTES]u8 = undefined;
+    return storeRgbaOut(&cache_key, renderPublicSvgBitmap(renderEvennessFieldSvg(set, &svg_buf), width, height, out_rgba, out_rgba_size), out_rgba);
+}
+
+// Band streams rasterize through a caller-owned buffer of whole rows, so
+// poster-size images never need width * height * 4 bytes at once.
+pub export fn lmt_bitmap_svg_stream_rgba(svg_ptr: [*c]const u8, svg_len: u32, width: u32, height: u32, band_rgba: [*c]u8, band_rgba_size: u32, rows_fn: ?StreamRowsFn, user: ?*anyopaque) callconv(.c) u32 {
+    if (svg_ptr == null) return 0;
+    return streamPublicSvgBitmap(svg_ptr[0..svg_len], width, height, band_rgba, band_rgba_size, rows_fn, user);
+}
+
+pub export fn lmt_bitmap_evenness_field_stream_rgba(set: u16, width: u32, height: u32, band_rgba: [*c]u8, band_rgba_size: u32, rows_fn: ?StreamRowsFn, user: ?*anyopaque) callconv(.c) u32 {
+    var svg_buf: [PUBLIC_SVG_MAX_BYTES]u8 = undefined;
+    return streamPublicSvgBitmap(renderEvennessFieldSvg(set, &svg_buf), width, height, band_rgba, band_rgba_size, rows_fn, user);
+}
+
+// PNG and QOI writers follow the SVG size-query convention: they return the
+// full encoded length, and a NULL or short buffer receives a prefix only.
+pub export fn lmt_bitmap_svg_png(svg_ptr: [*c]const u8, svg_len: u32, width: u32, height: u32, compression: u8, buf: [*c]u8, buf_size: u32) callconv(.c) u32 {
+    if (svg_ptr == null) return 0;
+    return encodePublicSvgPng(svg_ptr[0..svg_len], width, height, compression, buf, buf_size);
+}
+
+pub export fn lmt_bitmap_svg_qoi(svg_ptr: [*c]const u8, svg_len: u32, width: u32, height: u32, buf: [*c]u8, buf_size: u32) callconv(.c) u32 {
+    if (svg_ptr == null) return 0;
+    return encodePublicSvgBitmap(svg_ptr[0..svg_len], width, height, .qoi, buf, buf_size);
+}
+
+pub export fn lmt_bitmap_clock_optc_png(set: u16, width: u32, height: u32, compression: u8, buf: [*c]u8, buf_size: u32) callconv(.c) u32 {
+    var svg_buf: [PUBLIC_SVG_MAX_BYTES]u8 = undefined;
+    return encodePublicSvgPng(prerendered_assets.lookup(.clock_optc, maskPitchClassSet(set)) orelse renderClockOptcSvg(set, &svg_buf), width, height, compression, buf, buf_size);
+}
+
+pub export fn lmt_bitmap_optic_k_group_png(set: u16, width: u32, height: u32, compression: u8, buf: [*c]u8, buf_size: u32) callconv(.c) u32 {
+    var svg_buf: [PUBLIC_SVG_MAX_BYTES]u8 = undefined;
+    return encodePublicSvgPng(prerendered_assets.lookup(.optic_k_group, maskPitchClassSet(set)) orelse renderOpticKGroupSvg(set, &svg_buf), width, height, compression, buf, buf_size);
+}
+
+pub export fn lmt_bitmap_evenness_chart_png(width: u32, height: u32, compression: u8, buf: [*c]u8, buf_size: u32) callconv(.c) u32 {
+    var svg_buf: [PUBLIC_SVG_MAX_BYTES]u8 = undefined;
+    return encodePublicSvgPng(prerendered_assets.lookup(.evenness_chart, 0) orelse svg_evenness_chart.renderEvennessChart(&svg_buf), width, height, compression, buf, buf_size);
+}
+
+pub export fn lmt_bitmap_evenness_field_png(set: u16, width: u32, height: u32, compression: u8, buf: [*c]u8, buf_size: u32) callconv(.c) u32 {
+    var svg_buf: [PUBLIC_SVG_MAX_BYTES]u8 = undefined;
+    return encodePublicSvgPng(renderEvennessFieldSvg(set, &svg_buf), width, height, compression, buf, buf_size);
+}
+
+pub export fn lmt_bitmap_fret_n_png(frets_ptr: [*c]const i8, string_count: u32, window_start: u32, visible_frets: u32, width: u32, height: u32, compression: u8, buf: [*c]u8, buf_size: u32) callconv(.c) u32 {
+    var svg_buf: [PUBLIC_SVG_MAX_BYTES]u8 = undefined;
+    return encodePublicSvgPng(renderFretDiagramSvg(frets_ptr, string_count, null, window_start, visible_frets, &svg_buf), width, height, compression, buf, buf_size);
+}
+
+pub export fn lmt_bitmap_chord_staff_png(chord_kind: u8, root: u8, width: u32, height: u32, compression: u8, buf: [*c]u8, buf_size: u32) callconv(.c) u32 {
+    var svg_buf: [PUBLIC_SVG_MAX_BYTES]u8 = undefined;
+    return encodePublicSvgPng(renderChordStaffSvg(chord_kind, root, &svg_buf), width, height, compression, buf, buf_size);
+}
+
+pub export fn lmt_bitmap_key_staff_png(tonic: u8, quality_raw: u8, width: u32, height: u32, compression: u8, buf: [*c]u8, buf_size: u32) callconv(.c) u32 {
+    var svg_buf: [PUBLIC_SVG_MAX_BYTES]u8 = undefined;
+    return encodePublicSvgPng(prerendered_assets.lookup(.key_staff, prerendered_assets.keyStaffIndex(tonic, quality_raw == KEY_MINOR)) orelse renderKeyStaffSvg(tonic, quality_raw, &svg_buf), width, height, compression, buf, buf_size);
+}
+
+pub export fn lmt_bitmap_keyboard_png(notes_ptr: [*c]const u8, note_count: u32, range_low: u8, range_high: u8, width: u32, height: u32, compression: u8, buf: [*c]u8, buf_size: u32) callconv(.c) u32 {
+    var svg_buf: [PUBLIC_SVG_MAX_BYTES]u8 = undefined;
+    return encodePublicSvgPng(renderKeyboardSvg(notes_ptr, note_count, range_low, range_high, &svg_buf), width, height, compression, buf, buf_size);
+}
+
+pub export fn lmt_bitmap_piano_staff_png(notes_ptr: [*c]const u8, note_count: u32, tonic: u8, quality_raw: u8, width: u32, height: u32, compression: u8, buf: [*c]u8, buf_size: u32) callconv(.c) u32 {
+    var svg_buf: [PUBLIC_SVG_MAX_BYTES]u8 = undefined;
+    return encodePublicSvgPng(renderPianoStaffSvg(notes_ptr, note_count, tonic, quality_raw, &svg_buf), width, height, compression, buf, buf_size);
+}
+
+// RGBA batches write image i at byte offset i * width * height * 4 and return
+// the number of complete images.
+pub export fn lmt_bitmap_clock_optc_batch_rgba(sets: [*c]const u16, count: u32, width: u32, height: u32, out_rgba: [*c]u8, out_rgba_size: u32) callconv(.c) u32 {
+    if (!build_options.enable_raster_backend) return 0;
+    if (sets == null or out_rgba == null) return 0;
+    var batch: OptcBatch = undefined;
+    if (!batch.init(sets)) return 0;
+    return rasterSvgBatch(&batch, count, width, height, out_rgba, out_rgba_size);
+}
+
+/// Rasterizes the shared dot field once, copies it into every slot, and
+/// composites only each set's highlight on top.
+pub export fn lmt_bitmap_evenness_field_batch_rgba(sets: [*c]const u16, count: u32, width: u32, height: u32, out_rgba: [*c]u8, out_rgba_size: u32) callconv(.c) u32 {
+    if (!build_options.enable_raster_backend) return 0;
+    if (sets == null or out_rgba == null) return 0;
+    const image_bytes = requiredRgbaBytes(width, height) orelse return 0;
+    const fit = @min(count, out_rgba_size / image_bytes);
+    if (fit == 0) return 0;
+
+    var layout: svg_evenness_chart.FieldLayout = undefined;
+    layout.init();
+    var svg_buf: [PUBLIC_SVG_MAX_BYTES]u8 = undefined;
+    var base_stream = std.io.fixedBufferStream(&svg_buf);
+    svg_evenness_chart.writeFieldBackground(&layout, base_stream.writer()) catch return 0;
+    base_stream.writer().writeAll(svg_evenness_chart.FIELD_CLOSE) catch return 0;
+
+    const base = out_rgba[0..image_bytes];
+    _ = bitmap_compat.renderSvgMarkupRgba(width, height, svg_buf[0..base_stream.pos], base) catch return 0;
+    var slot: usize = 1;
+    while (slot < fit) : (slot += 1) {
+        @memcpy(out_rgba[slot * image_bytes ..][0..image_bytes], base);
+    }
+
+    var written: u32 = 0;
+    while (written < fit) : (written += 1) {
+        var stream = std.io.fixedBufferStream(&svg_buf);
+        svg_evenness_chart.writeFieldOverlay(&layout, maskPitchClassSet(sets[written]), stream.writer()) catch break;
+        const image = out_rgba[@as(usize, written) * image_bytes ..][0..image_bytes];
+        _ = bitmap_compat.overlaySvgMarkupRgba(width, height, svg_buf[0..stream.pos], image) catch break;
+    }
+    return written;
+}
+
+pub export fn lmt_bitmap_fret_n_batch_rgba(frets: [*c]const i8, string_count: u32, count: u32, window_start: u32, visible_frets: u32, width: u32, height: u32, out_rgba: [*c]u8, out_rgba_size: u32) callconv(.c) u32 {
+    if (!build_options.enable_raster_backend) return 0;
+    if ((frets == null and string_count != 0) or out_rgba == null) return 0;
+    var batch: FretBatch = undefined;
+    if (!batch.init(frets, string_count, window_start, visible_frets)) return 0;
+    return rasterSvgBatch(&batch, count, width, height, out_rgba, out_rgba_size);
 }
 
 pub export fn lmt_bitmap_fret_rgba(frets_ptr: [*c]const i8, width: u32, height: u32, out_rgba: [*c]u8, out_rgba_size: u32) callconv(.c) u32 {
     if (frets_ptr == null or out_rgba == null or width == 0 or height == 0) return 0;
     const required: u64 = @as(u64, width) * @as(u64, height) * 4;
     if (required == 0 or required > @as(u64, out_rgba_size)) return 0;
+    const cache_key = withRgbaSize(standardFretCacheKey(.bitmap_fret, frets_ptr), width, height);
+    if (cachedRgbaOut(&cache_key, out_rgba, out_rgba_size)) |len| return len;
     const out = out_rgba[0..@as(usize, @intCast(required))];
     const rendered = bitmap_compat.renderPublicStandardFretDiagramRgba(width, height, frets_ptr[0..guitar.tunings.STANDARD.len], out) catch return 0;
-    return @as(u32, @intCast(rendered));
+    return storeRgbaOut(&cache_key, @as(u32, @intCast(rendered)), out_rgba);
 }
 
 pub export fn lmt_bitmap_fret_n_rgba(frets_ptr: [*c]const i8, string_count: u32, window_start: u32, visible_frets: u32, width: u32, height: u32, out_rgba: [*c]u8, out_rgba_size: u32) callconv(.c) u32 {
-    const total = lmt_svg_fret_n(frets_ptr, string_count, window_start, visible_frets, null, 0);
-    if (total == 0 or total >= compat_svg_buf.len) return 0;
-    const written_total = lmt_svg_fret_n(frets_ptr, string_count, window_start, visible_frets, @ptrCast(&compat_svg_buf), @intCast(compat_svg_buf.len));
-    if (written_total != total) return 0;
-    return renderPublicSvgBitmap(compat_svg_buf[0..@as(usize, total)], width, height, out_rgba, out_rgba_size);
+    const cache_key = withRgbaSize(fretCacheKey(.bitmap_fret_n, frets_ptr, string_count, null, window_start, visible_frets), width, height);
+    if (cachedRgbaOut(&cache_key, out_rgba, out_rgba_size)) |len| return len;
+    var svg_buf: [PUBLIC_SVG_MAX_BYTES]u8 = undefined;
+    return storeRgbaOut(&cache_key, renderPublicSvgBitmap(renderFretDiagramSvg(frets_ptr, string_count, null, window_start, visible_frets, &svg_buf), width, height, out_rgba, out_rgba_size), out_rgba);
 }
 
 pub export fn lmt_bitmap_fret_tuned_n_rgba(
@@ -4421,43 +5312,222 @@ pub export fn lmt_bitmap_fret_tuned_n_rgba(
     out_rgba: [*c]u8,
     out_rgba_size: u32,
 ) callconv(.c) u32 {
-    const total = lmt_svg_fret_tuned_n(frets_ptr, string_count, tuning_ptr, tuning_count, window_start, visible_frets, null, 0);
-    if (total == 0 or total >= compat_svg_buf.len) return 0;
-    const written_total = lmt_svg_fret_tuned_n(frets_ptr, string_count, tuning_ptr, tuning_count, window_start, visible_frets, @ptrCast(&compat_svg_buf), @intCast(compat_svg_buf.len));
-    if (written_total != total) return 0;
-    return renderPublicSvgBitmap(compat_svg_buf[0..@as(usize, total)], width, height, out_rgba, out_rgba_size);
+    var tuning_buf: [MAX_PARAMETRIC_FRET_STRINGS]pitch.MidiNote = undefined;
+    const tuning = decodeTuningGeneric(tuning_ptr, tuning_count, &tuning_buf);
+    const cache_key = withRgbaSize(fretCacheKey(.bitmap_fret_tuned_n, frets_ptr, string_count, tuning, window_start, visible_frets), width, height);
+    if (cachedRgbaOut(&cache_key, out_rgba, out_rgba_size)) |len| return len;
+
+    var svg_buf: [PUBLIC_SVG_MAX_BYTES]u8 = undefined;
+    return storeRgbaOut(&cache_key, renderPublicSvgBitmap(renderFretDiagramSvg(frets_ptr, string_count, tuning, window_start, visible_frets, &svg_buf), width, height, out_rgba, out_rgba_size), out_rgba);
 }
 
 pub export fn lmt_bitmap_chord_staff_rgba(chord_kind: u8, root: u8, width: u32, height: u32, out_rgba: [*c]u8, out_rgba_size: u32) callconv(.c) u32 {
-    const total = lmt_svg_chord_staff(chord_kind, root, null, 0);
-    if (total == 0 or total >= compat_svg_buf.len) return 0;
-    const written_total = lmt_svg_chord_staff(chord_kind, root, @ptrCast(&compat_svg_buf), @intCast(compat_svg_buf.len));
-    if (written_total != total) return 0;
-    return renderPublicSvgBitmap(compat_svg_buf[0..@as(usize, total)], width, height, out_rgba, out_rgba_size);
+    const cache_key = withRgbaSize(chordStaffCacheKey(.bitmap_chord_staff, chord_kind, root), width, height);
+    if (cachedRgbaOut(&cache_key, out_rgba, out_rgba_size)) |len| return len;
+    var notes: [4]pitch.MidiNote = undefined;
+    const input = chordStaffInput(chord_kind, root, &notes);
+    var storage: svg_staff.SceneStorage = undefined;
+    return storeRgbaOut(&cache_key, renderStaffSceneBitmap(svg_staff.chordStaffScene(input.notes, input.key, &storage), input, svg_staff.renderChordStaff, width, height, out_rgba, out_rgba_size), out_rgba);
 }
 
 pub export fn lmt_bitmap_key_staff_rgba(tonic: u8, quality_raw: u8, width: u32, height: u32, out_rgba: [*c]u8, out_rgba_size: u32) callconv(.c) u32 {
-    const total = lmt_svg_key_staff(tonic, quality_raw, null, 0);
-    if (total == 0 or total >= compat_svg_buf.len) return 0;
-    const written_total = lmt_svg_key_staff(tonic, quality_raw, @ptrCast(&compat_svg_buf), @intCast(compat_svg_buf.len));
-    if (written_total != total) return 0;
-    return renderPublicSvgBitmap(compat_svg_buf[0..@as(usize, total)], width, height, out_rgba, out_rgba_size);
+    const cache_key = withRgbaSize(keyStaffCacheKey(.bitmap_key_staff, tonic, quality_raw), width, height);
+    if (cachedRgbaOut(&cache_key, out_rgba, out_rgba_size)) |len| return len;
+    var notes: [8]pitch.MidiNote = undefined;
+    const input = keyStaffInput(tonic, quality_raw, &notes);
+    var storage: svg_staff.SceneStorage = undefined;
+    return storeRgbaOut(&cache_key, renderStaffSceneBitmap(svg_staff.keyStaffScene(input.notes, input.key, &storage), input, svg_staff.renderKeyStaff, width, height, out_rgba, out_rgba_size), out_rgba);
 }
 
 pub export fn lmt_bitmap_keyboard_rgba(notes_ptr: [*c]const u8, note_count: u32, range_low: u8, range_high: u8, width: u32, height: u32, out_rgba: [*c]u8, out_rgba_size: u32) callconv(.c) u32 {
-    const total = lmt_svg_keyboard(notes_ptr, note_count, range_low, range_high, null, 0);
-    if (total == 0 or total >= compat_svg_buf.len) return 0;
-    const written_total = lmt_svg_keyboard(notes_ptr, note_count, range_low, range_high, @ptrCast(&compat_svg_buf), @intCast(compat_svg_buf.len));
-    if (written_total != total) return 0;
-    return renderPublicSvgBitmap(compat_svg_buf[0..@as(usize, total)], width, height, out_rgba, out_rgba_size);
+    const cache_key = withRgbaSize(keyboardCacheKey(.bitmap_keyboard, notes_ptr, note_count, range_low, range_high), width, height);
+    if (cachedRgbaOut(&cache_key, out_rgba, out_rgba_size)) |len| return len;
+    var notes_buf: [MAX_KEYBOARD_RENDER_NOTES]pitch.MidiNote = undefined;
+    const notes = decodeMidiNotes(notes_ptr, note_count, &notes_buf);
+    const range = sanitizeKeyboardRange(range_low, range_high);
+    var ops: [svg_keyboard.SCENE_OP_LIMIT]render_ir.NumericOp = undefined;
+    const scene = svg_keyboard.keyboardScene(notes, range.low, range.high, &ops) catch unreachable;
+    const size = svg_keyboard.documentSize(range.low, range.high);
+    return storeRgbaOut(&cache_key, renderPublicSceneBitmap(scene, size.width, size.height, width, height, out_rgba, out_rgba_size), out_rgba);
 }
 
 pub export fn lmt_bitmap_piano_staff_rgba(notes_ptr: [*c]const u8, note_count: u32, tonic: u8, quality_raw: u8, width: u32, height: u32, out_rgba: [*c]u8, out_rgba_size: u32) callconv(.c) u32 {
-    const total = lmt_svg_piano_staff(notes_ptr, note_count, tonic, quality_raw, null, 0);
-    if (total == 0 or total >= compat_svg_buf.len) return 0;
-    const written_total = lmt_svg_piano_staff(notes_ptr, note_count, tonic, quality_raw, @ptrCast(&compat_svg_buf), @intCast(compat_svg_buf.len));
-    if (written_total != total) return 0;
-    return renderPublicSvgBitmap(compat_svg_buf[0..@as(usize, total)], width, height, out_rgba, out_rgba_size);
+    const cache_key = withRgbaSize(pianoStaffCacheKey(.bitmap_piano_staff, notes_ptr, note_count, tonic, quality_raw), width, height);
+    if (cachedRgbaOut(&cache_key, out_rgba, out_rgba_size)) |len| return len;
+    var notes_buf: [MAX_KEYBOARD_RENDER_NOTES]pitch.MidiNote = undefined;
+    const input = pianoStaffInput(notes_ptr, note_count, tonic, quality_raw, &notes_buf);
+    var storage: svg_staff.SceneStorage = undefined;
+    return storeRgbaOut(&cache_key, renderStaffSceneBitmap(svg_staff.pianoStaffScene(input.notes, input.key, &storage), input, svg_staff.renderPianoStaff, width, height, out_rgba, out_rgba_size), out_rgba);
+}
+
+/// Sets the render cache budget in bytes; 0 (the default) disables the cache
+/// and frees its entries.
+pub export fn lmt_render_cache_configure(budget_bytes: u32) callconv(.c) void {
+    render_cache.configure(budget_bytes);
+}
+
+pub export fn lmt_render_cache_invalidate() callconv(.c) void {
+    render_cache.invalidate();
+}
+
+pub export fn lmt_render_cache_get_stats(out: [*c]LmtRenderCacheStats) callconv(.c) u32 {
+    if (out == null) return 0;
+    const stats = render_cache.stats();
+    out[0] = .{
+        .hits = stats.hits,
+        .misses = stats.misses,
+        .evictions = stats.evictions,
+        .insertions = stats.insertions,
+        .bytes = stats.bytes,
+        .budget_bytes = stats.budget_bytes,
+        .entries = stats.entries,
+        .reserved0 = 0,
+    };
+    return 1;
+}
+
+/// Decodes the embedded xz packs named by `kinds_mask` (LMT_PACK_* bits) so
+/// the first request that needs one does not pay for it. Safe to call from
+/// several threads; each pack is decoded once. Returns the requested bits
+/// whose packs are ready; unknown bits are ignored.
+pub export fn lmt_warmup(kinds_mask: u32) callconv(.c) u32 {
+    var ready: u32 = 0;
+    for (std.enums.values(xz_pack.Kind)) |kind| {
+        if (kinds_mask & kind.bit() == 0) continue;
+        if (svg_compat.warmPack(kind)) ready |= kind.bit();
+    }
+    return ready;
+}
+
+/// Writes decode time and resident size for the one pack named by the single
+/// LMT_PACK_* bit `kind`. A pack that has not been decoded yet reports all
+/// zeros.
+pub export fn lmt_pack_get_stats(kind: u32, out: [*c]LmtPackStats) callconv(.c) u32 {
+    if (out == null or @popCount(kind) != 1 or kind & xz_pack.ALL_KINDS_MASK == 0) return 0;
+    const stats = svg_compat.packStats(@enumFromInt(@ctz(kind)));
+    out[0] = .{
+        .decode_ns = stats.decode_ns,
+        .resident_bytes = stats.resident_bytes,
+        .ready = @intFromBool(stats.ready),
+        .mapped = @intFromBool(stats.mapped),
+    };
+    return 1;
+}
+
+fn decodePrerenderedDomain(domain_raw: u8) ?prerendered_assets.Domain {
+    return std.meta.intToEnum(prerendered_assets.Domain, domain_raw) catch null;
+}
+
+pub export fn lmt_svg_prerendered_count(domain_raw: u8) callconv(.c) u32 {
+    const domain = decodePrerenderedDomain(domain_raw) orelse return 0;
+    return prerendered_assets.count(domain);
+}
+
+pub export fn lmt_svg_prerendered(domain_raw: u8, index: u32, buf: [*c]u8, buf_size: u32) callconv(.c) u32 {
+    const domain = decodePrerenderedDomain(domain_raw) orelse return 0;
+    const svg = prerendered_assets.lookup(domain, index) orelse return 0;
+    return copySvgOut(svg, buf, buf_size);
+}
+
+// Incremental bitmap views keep the state of the previous frame in caller
+// storage and redraw only the keys or strings an update changed.
+
+const BitmapView = struct {
+    magic: u32,
+    state: union(enum) {
+        empty,
+        keyboard: render_incremental.KeyboardView,
+        fret: render_incremental.FretView,
+    },
+};
+
+const BITMAP_VIEW_MAGIC: u32 = 0x4c4d5456;
+// Updates return this instead of a rectangle count on any failure, so 0 only
+// ever means "nothing changed".
+const BITMAP_VIEW_UPDATE_ERROR: u32 = std.math.maxInt(u32);
+
+fn initBitmapView(storage: ?*anyopaque, storage_size: u32) ?*BitmapView {
+    if (!build_options.enable_raster_backend) return null;
+    const raw = storage orelse return null;
+    if (@as(usize, storage_size) < @sizeOf(BitmapView)) return null;
+    if (@intFromPtr(raw) % @alignOf(BitmapView) != 0) return null;
+
+    const view: *BitmapView = @ptrCast(@alignCast(raw));
+    view.* = .{ .magic = BITMAP_VIEW_MAGIC, .state = .empty };
+    return view;
+}
+
+fn resolveBitmapView(raw: ?*anyopaque) ?*BitmapView {
+    const view: *BitmapView = @ptrCast(@alignCast(raw orelse return null));
+    if (view.magic != BITMAP_VIEW_MAGIC) return null;
+    return view;
+}
+
+/// Copies the redrawn rectangles out, merged into their bounding rectangle
+/// when they outnumber `rect_cap`, and returns how many were reported.
+fn copyDirtyRects(rects: *const render_incremental.DirtyRects, out: [*c]LmtDirtyRect, rect_cap: u32) u32 {
+    if (rects.len == 0) return 0;
+    const merged = [_]render_incremental.PixelRect{rects.bounding(rects.items[0])};
+    const reported = if (rects.len <= rect_cap) rects.slice() else merged[0..];
+    if (out != null and rect_cap != 0) {
+        for (reported, 0..) |rect, i| out[i] = .{ .x = rect.x, .y = rect.y, .width = rect.width, .height = rect.height };
+    }
+    return @as(u32, @intCast(reported.len));
+}
+
+pub export fn lmt_sizeof_bitmap_view() callconv(.c) u32 {
+    return @as(u32, @intCast(@sizeOf(BitmapView)));
+}
+
+pub export fn lmt_alignof_bitmap_view() callconv(.c) u32 {
+    return @as(u32, @intCast(@alignOf(BitmapView)));
+}
+
+pub export fn lmt_bitmap_keyboard_view_init(storage: ?*anyopaque, storage_size: u32, range_low: u8, range_high: u8, width: u32, height: u32) callconv(.c) ?*anyopaque {
+    _ = requiredRgbaBytes(width, height) orelse return null;
+    const view = initBitmapView(storage, storage_size) orelse return null;
+    const range = sanitizeKeyboardRange(range_low, range_high);
+    view.state = .{ .keyboard = render_incremental.KeyboardView.init(range.low, range.high, width, height) };
+    return view;
+}
+
+pub export fn lmt_bitmap_keyboard_view_update(view_raw: ?*anyopaque, notes_ptr: [*c]const u8, note_count: u32, out_rgba: [*c]u8, out_rgba_size: u32, rects_out: [*c]LmtDirtyRect, rect_cap: u32) callconv(.c) u32 {
+    const view = resolveBitmapView(view_raw) orelse return BITMAP_VIEW_UPDATE_ERROR;
+    const keyboard_view = switch (view.state) {
+        .keyboard => |*state| state,
+        else => return BITMAP_VIEW_UPDATE_ERROR,
+    };
+    if (out_rgba == null) return BITMAP_VIEW_UPDATE_ERROR;
+
+    var notes_buf: [MAX_KEYBOARD_RENDER_NOTES]pitch.MidiNote = undefined;
+    const notes = decodeMidiNotes(notes_ptr, note_count, &notes_buf);
+    var svg_buf: [PUBLIC_SVG_MAX_BYTES]u8 = undefined;
+    var rects = render_incremental.DirtyRects{};
+    keyboard_view.update(notes, &svg_buf, out_rgba[0..out_rgba_size], &rects) catch return BITMAP_VIEW_UPDATE_ERROR;
+    return copyDirtyRects(&rects, rects_out, rect_cap);
+}
+
+pub export fn lmt_bitmap_fret_view_init(storage: ?*anyopaque, storage_size: u32, string_count: u32, window_start: u32, visible_frets: u32, width: u32, height: u32) callconv(.c) ?*anyopaque {
+    if (string_count == 0 or string_count > MAX_PARAMETRIC_FRET_STRINGS) return null;
+    _ = requiredRgbaBytes(width, height) orelse return null;
+    const view = initBitmapView(storage, storage_size) orelse return null;
+    const start: ?u32 = if (window_start == 0 and visible_frets == 0) null else window_start;
+    view.state = .{ .fret = render_incremental.FretView.init(string_count, start, visible_frets, width, height) };
+    return view;
+}
+
+pub export fn lmt_bitmap_fret_view_update(view_raw: ?*anyopaque, frets_ptr: [*c]const i8, string_count: u32, out_rgba: [*c]u8, out_rgba_size: u32, rects_out: [*c]LmtDirtyRect, rect_cap: u32) callconv(.c) u32 {
+    const view = resolveBitmapView(view_raw) orelse return BITMAP_VIEW_UPDATE_ERROR;
+    const fret_view = switch (view.state) {
+        .fret => |*state| state,
+        else => return BITMAP_VIEW_UPDATE_ERROR,
+    };
+    if (out_rgba == null or frets_ptr == null) return BITMAP_VIEW_UPDATE_ERROR;
+
+    var svg_buf: [PUBLIC_SVG_MAX_BYTES]u8 = undefined;
+    var rects = render_incremental.DirtyRects{};
+    fret_view.update(frets_ptr[0..string_count], &svg_buf, out_rgba[0..out_rgba_size], &rects) catch return BITMAP_VIEW_UPDATE_ERROR;
+    return copyDirtyRects(&rects, rects_out, rect_cap);
 }
 
 pub export fn lmt_bitmap_proof_scale_numerator() callconv(.c) u32 {
@@ -4516,6 +5586,20 @@ pub export fn lmt_bitmap_compat_render_candidate_rgba_scaled(kind_index: u32, im
     return @as(u32, @intCast(len));
 }
 
+pub export fn lmt_bitmap_compat_render_candidate_rgba_scaled_tiled(kind_index: u32, image_index: u32, scale_numerator: u32, scale_denominator: u32, band_count: u32, thread_count: u32, out_rgba: [*c]u8, out_rgba_size: u32) callconv(.c) u32 {
+    if (!build_options.enable_raster_backend) return 0;
+    if (out_rgba == null) return 0;
+    const out = out_rgba[0..@as(usize, out_rgba_size)];
+    if (!compat_catalog_supported) {
+        const len = bitmap_compat.renderCandidateRgbaScaled(@as(usize, kind_index), @as(usize, image_index), scale_numerator, scale_denominator, out) catch return 0;
+        return @as(u32, @intCast(len));
+    } else {
+        const options = bitmap_compat.TiledOptions{ .band_count = band_count, .thread_count = thread_count };
+        const len = bitmap_compat.renderCandidateRgbaScaledTiled(std.heap.smp_allocator, @as(usize, kind_index), @as(usize, image_index), scale_numerator, scale_denominator, out, options) catch return 0;
+        return @as(u32, @intCast(len));
+    }
+}
+
 pub export fn lmt_bitmap_compat_render_candidate_rgba(kind_index: u32, image_index: u32, out_rgba: [*c]u8, out_rgba_size: u32) callconv(.c) u32 {
     if (!build_options.enable_raster_backend) return 0;
     if (out_rgba == null) return 0;
@@ -4524,6 +5608,28 @@ pub export fn lmt_bitmap_compat_render_candidate_rgba(kind_index: u32, image_ind
     return @as(u32, @intCast(len));
 }
 
+// Generated-SVG kinds render their markup into the context's SVG scratch, so
+// threads holding distinct contexts can rasterize candidates concurrently.
+// The scratch no longer holds a finished document afterwards.
+fn renderCompatCandidateInto(context: *Context, kind_index: u32, image_index: u32, scale_numerator: u32, scale_denominator: u32, out_rgba: [*c]u8, out_rgba_size: u32) u32 {
+    context.svg_len = 0;
+    if (!build_options.enable_raster_backend) return 0;
+    if (out_rgba == null) return 0;
+    const out = out_rgba[0..@as(usize, out_rgba_size)];
+    const len = bitmap_compat.renderCandidateRgbaScaledWithScratch(@as(usize, kind_index), @as(usize, image_index), scale_numerator, scale_denominator, &context.svg_buf, out) catch return 0;
+    return @as(u32, @intCast(len));
+}
+
+pub export fn lmt_bitmap_compat_render_candidate_rgba_scaled_ctx(ctx: ?*anyopaque, kind_index: u32, image_index: u32, scale_numerator: u32, scale_denominator: u32, out_rgba: [*c]u8, out_rgba_size: u32) callconv(.c) u32 {
+    const context = resolveContext(ctx) orelse return 0;
+    return renderCompatCandidateInto(context, kind_index, image_index, scale_numerator, scale_denominator, out_rgba, out_rgba_size);
+}
+
+pub export fn lmt_bitmap_compat_render_candidate_rgba_ctx(ctx: ?*anyopaque, kind_index: u32, image_index: u32, out_rgba: [*c]u8, out_rgba_size: u32) callconv(.c) u32 {
+    const context = resolveContext(ctx) orelse return 0;
+    return renderCompatCandidateInto(context, kind_index, image_index, bitmap_compat.SCALE_NUMERATOR, bitmap_compat.SCALE_DENOMINATOR, out_rgba, out_rgba_size);
+}
+
 pub export fn lmt_bitmap_compat_render_reference_svg_rgba_scaled(kind_index: u32, scale_numerator: u32, scale_denominator: u32, svg_ptr: [*c]const u8, svg_len: u32, out_rgba: [*c]u8, out_rgba_size: u32) callconv(.c) u32 {
     if (!build_options.enable_raster_backend) return 0;
     if (svg_ptr == null or out_rgba == null or svg_len == 0) return 0;
@@ -4565,8 +5671,58 @@ pub export fn lmt_svg_compat_image_name(kind_index: u32, image_index: u32, buf:
     return copySvgOut(name, buf, buf_size);
 }
 
-pub export fn lmt_svg_compat_generate(kind_index: u32, image_index: u32, buf: [*c]u8, buf_size: u32) callconv(.c) u32 {
-    const svg = svg_compat.generateByIndex(@as(usize, kind_index), @as(usize, image_index), &compat_svg_buf);
+fn generateCompatSvgInto(context: *Context, kind_index: u32, image_index: u32, buf: [*c]u8, buf_size: u32) u32 {
+    const svg = svg_compat.generateByIndex(@as(usize, kind_index), @as(usize, image_index), &context.svg_buf);
+    context.svg_len = svg.len;
     if (svg.len == 0) return 0;
     return copySvgOut(svg, buf, buf_size);
 }
+
+pub export fn lmt_svg_compat_generate(kind_index: u32, image_index: u32, buf: [*c]u8, buf_size: u32) callconv(.c) u32 {
+    return generateCompatSvgInto(&default_context, kind_index, image_index, buf, buf_size);
+}
+
+pub export fn lmt_svg_compat_generate_ctx(ctx: ?*anyopaque, kind_index: u32, image_index: u32, buf: [*c]u8, buf_size: u32) callconv(.c) u32 {
+    const context = resolveContext(ctx) orelse return 0;
+    return generateCompatSvgInto(context, kind_index, image_index, buf, buf_size);
+}
+
+pub export fn lmt_compat_catalog_render(
+    out_path: [*c]const u8,
+    format: u32,
+    layout: u32,
+    thread_count: u32,
+    kinds_mask: u32,
+    stats_out: [*c]LmtCompatCatalogStats,
+    stats_cap: u32,
+) callconv(.c) u32 {
+    if (!compat_catalog_supported) {
+        return 0;
+    } else {
+        if (out_path == null) return 0;
+        const options = compat_catalog.Options{
+            .format = std.meta.intToEnum(compat_catalog.Format, format) catch return 0,
+            .layout = std.meta.intToEnum(compat_catalog.Layout, layout) catch return 0,
+            .thread_count = thread_count,
+            .kinds_mask = kinds_mask,
+        };
+        var stats: [compat_catalog.MAX_KINDS]compat_catalog.KindStats = undefined;
+        const written = compat_catalog.render(std.heap.smp_allocator, std.mem.span(out_path), options, &stats) catch return 0;
+
+        if (stats_out != null) {
+            const count = @min(@as(usize, stats_cap), svg_compat.kindCount());
+            for (stats[0..count], 0..) |entry, k| {
+                stats_out[k] = .{
+                    .kind_index = entry.kind_index,
+                    .images = entry.images,
+                    .failures = entry.failures,
+                    .reserved0 = 0,
+                    .bytes = entry.bytes,
+                    .render_ns = entry.render_ns,
+                    .wall_ns = entry.wall_ns,
+                };
+            }
+        }
+        return written;
+    }
+}
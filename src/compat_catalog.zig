@@ -0,0 +1,337 @@
+//! Multi-threaded bulk renderer for the Harmonious compat catalog.
+//!
+//! Every selected (kind, image) pair is rendered on a `std.Thread.Pool` in
+//! chunks of `CHUNK_IMAGES`. The calling thread writes finished chunks
+//! strictly in catalog order, so directory contents and archive bytes do not
+//! depend on the thread count or scheduling.
+//!
+//! Archive layout (little-endian): `ARCHIVE_MAGIC`, u32 format, u32 entry
+//! count, then per entry u16 kind index, u16 path length, u32 width, u32
+//! height, u32 data length, the `kind-directory/name` path, and the data.
+//! SVG entries record width and height as 0.
+
+const std = @import("std");
+const svg_compat = @import("harmonious_svg_compat.zig");
+const bitmap_compat = @import("bitmap_compat.zig");
+
+pub const Format = enum(u32) {
+    svg = 0,
+    rgba = 1,
+};
+
+pub const Layout = enum(u32) {
+    directory = 0,
+    archive = 1,
+};
+
+pub const ARCHIVE_MAGIC = "LMTCAT01";
+pub const ALL_KINDS: u32 = std.math.maxInt(u32);
+pub const MAX_KINDS: usize = 32;
+
+const CHUNK_IMAGES: usize = 32;
+const SVG_SCRATCH_BYTES: usize = 4 * 1024 * 1024;
+const ARCHIVE_HEADER_BYTES: u64 = ARCHIVE_MAGIC.len + 8;
+
+comptime {
+    std.debug.assert(svg_compat.kindCount() <= MAX_KINDS);
+}
+
+pub const Options = struct {
+    format: Format = .svg,
+    layout: Layout = .directory,
+    /// Worker threads; 0 uses the CPU count.
+    thread_count: usize = 0,
+    /// Bit i selects kind i.
+    kinds_mask: u32 = ALL_KINDS,
+};
+
+pub const KindStats = struct {
+    kind_index: u32 = 0,
+    images: u32 = 0,
+    failures: u32 = 0,
+    bytes: u64 = 0,
+    /// Render time summed over every worker that handled the kind.
+    render_ns: u64 = 0,
+    /// Time from the kind's first submitted chunk to its last written chunk.
+    wall_ns: u64 = 0,
+};
+
+pub fn kindSelected(kind_index: usize, options: Options) bool {
+    if (kind_index >= svg_compat.kindCount()) return false;
+    if ((options.kinds_mask >> @as(u5, @intCast(kind_index))) & 1 == 0) return false;
+    return options.format == .svg or bitmap_compat.kindSupported(kind_index);
+}
+
+const Chunk = struct {
+    kind_index: usize,
+    first: usize,
+    count: usize,
+    format: Format,
+    allocator: std.mem.Allocator,
+    data: std.ArrayListUnmanaged(u8) = .empty,
+    ends: [CHUNK_IMAGES]usize = undefined,
+    ok: [CHUNK_IMAGES]bool = undefined,
+    render_ns: u64 = 0,
+    done: std.Thread.ResetEvent = .{},
+
+    fn image(self: *const Chunk, i: usize) []const u8 {
+        const start = if (i == 0) 0 else self.ends[i - 1];
+        return self.data.items[start..self.ends[i]];
+    }
+};
+
+fn renderChunk(chunk: *Chunk) void {
+    defer chunk.done.set();
+    const started = std.time.nanoTimestamp();
+    defer chunk.render_ns = @intCast(@max(0, std.time.nanoTimestamp() - started));
+
+    @memset(chunk.ok[0..chunk.count], false);
+    const scratch = chunk.allocator.alloc(u8, SVG_SCRATCH_BYTES) catch {
+        @memset(chunk.ends[0..chunk.count], 0);
+        return;
+    };
+    defer chunk.allocator.free(scratch);
+
+    for (0..chunk.count) |i| {
+        const image_index = chunk.first + i;
+        chunk.ok[i] = switch (chunk.format) {
+            .svg => appendSvg(chunk, image_index, scratch),
+            .rgba => appendRgba(chunk, image_index, scratch),
+        };
+        chunk.ends[i] = chunk.data.items.len;
+    }
+}
+
+fn appendSvg(chunk: *Chunk, image_index: usize, scratch: []u8) bool {
+    const svg = svg_compat.generateByIndex(chunk.kind_index, image_index, scratch);
+    if (svg.len == 0) return false;
+    chunk.data.appendSlice(chunk.allocator, svg) catch return false;
+    return true;
+}
+
+fn appendRgba(chunk: *Chunk, image_index: usize, scratch: []u8) bool {
+    const required: usize = bitmap_compat.requiredRgbaBytes(chunk.kind_index, image_index);
+    if (required == 0) return false;
+    chunk.data.ensureUnusedCapacity(chunk.allocator, required) catch return false;
+    const out = chunk.data.unusedCapacitySlice()[0..required];
+    _ = bitmap_compat.renderCandidateRgbaWithScratch(chunk.kind_index, image_index, scratch, out) catch return false;
+    chunk.data.items.len += required;
+    return true;
+}
+
+const Sink = struct {
+    options: Options,
+    dir: ?std.fs.Dir = null,
+    file: ?std.fs.File = null,
+    file_writer: std.fs.File.Writer = undefined,
+    file_buf: [64 * 1024]u8 = undefined,
+    entries: u32 = 0,
+
+    fn open(self: *Sink, out_path: []const u8) !void {
+        const cwd = std.fs.cwd();
+        switch (self.options.layout) {
+            .directory => {
+                try cwd.makePath(out_path);
+                self.dir = try cwd.openDir(out_path, .{});
+            },
+            .archive => {
+                if (std.fs.path.dirname(out_path)) |parent| try cwd.makePath(parent);
+                const file = try cwd.createFile(out_path, .{});
+                self.file = file;
+                self.file_writer = file.writer(&self.file_buf);
+                const w = &self.file_writer.interface;
+                try w.writeAll(ARCHIVE_MAGIC);
+                try w.writeInt(u32, @intFromEnum(self.options.format), .little);
+                try w.writeInt(u32, 0, .little);
+            },
+        }
+    }
+
+    fn close(self: *Sink) void {
+        if (self.dir) |*dir| dir.close();
+        if (self.file) |file| file.close();
+    }
+
+    fn finish(self: *Sink) !void {
+        if (self.file) |file| {
+            try self.file_writer.interface.flush();
+            var count: [4]u8 = undefined;
+            std.mem.writeInt(u32, &count, self.entries, .little);
+            try file.pwriteAll(&count, ARCHIVE_HEADER_BYTES - 4);
+        }
+    }
+
+    fn write(self: *Sink, kind_index: usize, image_index: usize, data: []const u8) !void {
+        const kind_dir = svg_compat.kindDirectory(kind_index) orelse return error.InvalidKind;
+        const name = svg_compat.imageName(kind_index, image_index) orelse return error.InvalidImage;
+        const stem = if (std.mem.endsWith(u8, name, ".svg")) name[0 .. name.len - 4] else name;
+        const width: u32 = if (self.options.format == .rgba) bitmap_compat.targetWidth(kind_index, image_index) else 0;
+        const height: u32 = if (self.options.format == .rgba) bitmap_compat.targetHeight(kind_index, image_index) else 0;
+
+        var path_buf: [std.fs.max_path_bytes]u8 = undefined;
+        const path = switch (self.options.format) {
+            .svg => try std.fmt.bufPrint(&path_buf, "{s}/{s}.svg", .{ kind_dir, stem }),
+            .rgba => try std.fmt.bufPrint(&path_buf, "{s}/{s}.{d}x{d}.rgba", .{ kind_dir, stem, width, height }),
+        };
+
+        if (self.dir) |dir| {
+            if (std.fs.path.dirname(path)) |parent| try dir.makePath(parent);
+            try dir.writeFile(.{ .sub_path = path, .data = data });
+        } else {
+            const w = &self.file_writer.interface;
+            try w.writeInt(u16, @intCast(kind_index), .little);
+            try w.writeInt(u16, @intCast(path.len), .little);
+            try w.writeInt(u32, width, .little);
+            try w.writeInt(u32, height, .little);
+            try w.writeInt(u32, @intCast(data.len), .little);
+            try w.writeAll(path);
+            try w.writeAll(data);
+        }
+        self.entries += 1;
+    }
+};
+
+/// Renders the selected catalog into `out_path` and returns the number of
+/// images written. `allocator` must be thread-safe. When `stats` is large
+/// enough, `stats[k]` receives the totals for kind `k`.
+pub fn render(allocator: std.mem.Allocator, out_path: []const u8, options: Options, stats: []KindStats) !u32 {
+    const kind_count = svg_compat.kindCount();
+    for (stats, 0..) |*entry, k| entry.* = .{ .kind_index = @intCast(k) };
+
+    var chunk_count: usize = 0;
+    for (0..kind_count) |k| {
+        if (!kindSelected(k, options)) continue;
+        chunk_count += std.math.divCeil(usize, svg_compat.imageCount(k), CHUNK_IMAGES) catch unreachable;
+    }
+
+    const chunks = try allocator.alloc(Chunk, chunk_count);
+    defer allocator.free(chunks);
+    var next_chunk: usize = 0;
+    for (0..kind_count) |k| {
+        if (!kindSelected(k, options)) continue;
+        const images = svg_compat.imageCount(k);
+        var first: usize = 0;
+        while (first < images) : (first += CHUNK_IMAGES) {
+            chunks[next_chunk] = .{
+                .kind_index = k,
+                .first = first,
+                .count = @min(CHUNK_IMAGES, images - first),
+                .format = options.format,
+                .allocator = allocator,
+            };
+            next_chunk += 1;
+        }
+    }
+
+    // Decode the lazily unpacked name and template packs on this thread so
+    // workers only ever read them.
+    {
+        const scratch = try allocator.alloc(u8, SVG_SCRATCH_BYTES);
+        defer allocator.free(scratch);
+        for (0..kind_count) |k| {
+            if (kindSelected(k, options)) _ = svg_compat.generateByIndex(k, 0, scratch);
+        }
+    }
+
+    var sink = Sink{ .options = options };
+    try sink.open(out_path);
+    defer sink.close();
+
+    const thread_count = if (options.thread_count != 0) options.thread_count else std.Thread.getCpuCount() catch 1;
+    var pool: std.Thread.Pool = undefined;
+    try pool.init(.{ .allocator = allocator, .n_jobs = thread_count });
+    defer pool.deinit();
+
+    var kind_started: [MAX_KINDS]i128 = undefined;
+    const window = thread_count * 2;
+    var submitted: usize = 0;
+    var written: u32 = 0;
+
+    errdefer for (chunks[0..submitted]) |*chunk| {
+        chunk.done.wait();
+        chunk.data.deinit(allocator);
+    };
+
+    while (submitted < @min(window, chunks.len)) : (submitted += 1) {
+        submit(&pool, &chunks[submitted], &kind_started);
+    }
+
+    for (chunks) |*chunk| {
+        chunk.done.wait();
+        const k = chunk.kind_index;
+        for (0..chunk.count) |i| {
+            if (!chunk.ok[i]) {
+                if (k < stats.len) stats[k].failures += 1;
+                continue;
+            }
+            const image = chunk.image(i);
+            try sink.write(k, chunk.first + i, image);
+            written += 1;
+            if (k < stats.len) {
+                stats[k].images += 1;
+                stats[k].bytes += image.len;
+            }
+        }
+        if (k < stats.len) {
+            stats[k].render_ns += chunk.render_ns;
+            stats[k].wall_ns = @intCast(@max(0, std.time.nanoTimestamp() - kind_started[k]));
+        }
+        chunk.data.deinit(allocator);
+        chunk.data = .empty;
+
+        if (submitted < chunks.len) {
+            submit(&pool, &chunks[submitted], &kind_started);
+            submitted += 1;
+        }
+    }
+
+    try sink.finish();
+    return written;
+}
+
+fn submit(pool: *std.Thread.Pool, chunk: *Chunk, kind_started: *[MAX_KINDS]i128) void {
+    if (chunk.first == 0) kind_started[chunk.kind_index] = std.time.nanoTimestamp();
+    pool.spawn(renderChunk, .{chunk}) catch renderChunk(chunk);
+}
+
+test "catalog archive is identical across thread counts" {
+    const allocator = std.testing.allocator;
+    var tmp = std.testing.tmpDir(.{});
+    defer tmp.cleanup();
+
+    const root = try tmp.dir.realpathAlloc(allocator, ".");
+    defer allocator.free(root);
+    const one_path = try std.fs.path.join(allocator, &.{ root, "one.lmtcat" });
+    defer allocator.free(one_path);
+    const four_path = try std.fs.path.join(allocator, &.{ root, "four.lmtcat" });
+    defer allocator.free(four_path);
+
+    // optc and oc: small, generated kinds with several chunks each.
+    const mask: u32 = (1 << 4) | (1 << 5);
+    var stats: [MAX_KINDS]KindStats = undefined;
+    const one = try render(allocator, one_path, .{ .layout = .archive, .thread_count = 1, .kinds_mask = mask }, &stats);
+    try std.testing.expectEqual(@as(usize, one), svg_compat.imageCount(4) + svg_compat.imageCount(5));
+    try std.testing.expectEqual(@as(u32, @intCast(svg_compat.imageCount(5))), stats[5].images);
+    try std.testing.expectEqual(@as(u32, 0), stats[5].failures);
+    try std.testing.expectEqual(@as(u32, 0), stats[0].images);
+
+    const four = try render(allocator, four_path, .{ .layout = .archive, .thread_count = 4, .kinds_mask = mask }, &stats);
+    try std.testing.expectEqual(one, four);
+
+    const one_bytes = try tmp.dir.readFileAlloc(allocator, "one.lmtcat", 64 * 1024 * 1024);
+    defer allocator.free(one_bytes);
+    const four_bytes = try tmp.dir.readFileAlloc(allocator, "four.lmtcat", 64 * 1024 * 1024);
+    defer allocator.free(four_bytes);
+    try std.testing.expectEqualSlices(u8, one_bytes, four_bytes);
+    try std.testing.expectEqualStrings(ARCHIVE_MAGIC, one_bytes[0..ARCHIVE_MAGIC.len]);
+    try std.testing.expectEqual(one, std.mem.readInt(u32, one_bytes[12..16], .little));
+
+    // The first entry is oc image 0 and matches a direct render.
+    var expected_buf: [64 * 1024]u8 = undefined;
+    const expected = svg_compat.generateByIndex(4, 0, &expected_buf);
+    const path_len = std.mem.readInt(u16, one_bytes[18..20], .little);
+    const data_len = std.mem.readInt(u32, one_bytes[28..32], .little);
+    const data_start = 32 + @as(usize, path_len);
+    try std.testing.expect(std.mem.startsWith(u8, one_bytes[32..data_start], "oc/"));
+    try std.testing.expectEqualSlices(u8, expected, one_bytes[data_start..][0..data_len]);
+}
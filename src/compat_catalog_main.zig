@@ -0,0 +1,93 @@
+//! `zig build compat-catalog -- [options] OUT` renders the Harmonious compat
+//! catalog on every core and prints per-kind timing.
+
+const std = @import("std");
+const compat_catalog = @import("compat_catalog.zig");
+const svg_compat = @import("harmonious_svg_compat.zig");
+
+const usage =
+    \\usage: compat-catalog [--format svg|rgba] [--archive] [--threads N] [--kinds a,b,...] OUT
+    \\
+    \\Renders every (kind, image) pair into directory OUT, or into one packed
+    \\archive file OUT with --archive. Output is identical for any thread count.
+    \\
+;
+
+pub fn main() !void {
+    const allocator = std.heap.smp_allocator;
+    const args = try std.process.argsAlloc(allocator);
+    defer std.process.argsFree(allocator, args);
+
+    var stdout_buf: [4096]u8 = undefined;
+    var stdout_writer = std.fs.File.stdout().writer(&stdout_buf);
+    const out = &stdout_writer.interface;
+
+    var options = compat_catalog.Options{};
+    var out_path: ?[]const u8 = null;
+    var i: usize = 1;
+    while (i < args.len) : (i += 1) {
+        const arg = args[i];
+        if (std.mem.eql(u8, arg, "--archive")) {
+            options.layout = .archive;
+        } else if (std.mem.eql(u8, arg, "--format") and i + 1 < args.len) {
+            i += 1;
+            options.format = std.meta.stringToEnum(compat_catalog.Format, args[i]) orelse return fail(out, "unknown format");
+        } else if (std.mem.eql(u8, arg, "--threads") and i + 1 < args.len) {
+            i += 1;
+            options.thread_count = std.fmt.parseInt(usize, args[i], 10) catch return fail(out, "invalid thread count");
+        } else if (std.mem.eql(u8, arg, "--kinds") and i + 1 < args.len) {
+            i += 1;
+            options.kinds_mask = parseKinds(args[i]) orelse return fail(out, "unknown kind");
+        } else if (std.mem.startsWith(u8, arg, "-")) {
+            return fail(out, "unknown option");
+        } else {
+            out_path = arg;
+        }
+    }
+
+    const path = out_path orelse return fail(out, "missing OUT");
+    var stats: [compat_catalog.MAX_KINDS]compat_catalog.KindStats = undefined;
+    const started = std.time.nanoTimestamp();
+    const written = try compat_catalog.render(allocator, path, options, &stats);
+    const elapsed_ns: u64 = @intCast(std.time.nanoTimestamp() - started);
+
+    try out.print("{s:<22} {s:>7} {s:>5} {s:>12} {s:>10} {s:>10}\n", .{ "kind", "images", "fail", "bytes", "render ms", "wall ms" });
+    for (stats[0..svg_compat.kindCount()], 0..) |entry, k| {
+        if (!compat_catalog.kindSelected(k, options)) continue;
+        try out.print("{s:<22} {d:>7} {d:>5} {d:>12} {d:>10.1} {d:>10.1}\n", .{
+            svg_compat.kindName(k) orelse "?",
+            entry.images,
+            entry.failures,
+            entry.bytes,
+            nsToMs(entry.render_ns),
+            nsToMs(entry.wall_ns),
+        });
+    }
+    try out.print("{d} images to {s} in {d:.1} ms\n", .{ written, path, nsToMs(elapsed_ns) });
+    try out.flush();
+}
+
+fn parseKinds(list: []const u8) ?u32 {
+    var mask: u32 = 0;
+    var names = std.mem.splitScalar(u8, list, ',');
+    next: while (names.next()) |name| {
+        for (0..svg_compat.kindCount()) |k| {
+            if (std.mem.eql(u8, name, svg_compat.kindName(k).?)) {
+                mask |= @as(u32, 1) << @as(u5, @intCast(k));
+                continue :next;
+            }
+        }
+        return null;
+    }
+    return mask;
+}
+
+fn nsToMs(ns: u64) f64 {
+    return @as(f64, @floatFromInt(ns)) / std.time.ns_per_ms;
+}
+
+fn fail(out: *std.Io.Writer, message: []const u8) !void {
+    try out.print("compat-catalog: {s}\n\n{s}", .{ message, usage });
+    try out.flush();
+    std.process.exit(2);
+}
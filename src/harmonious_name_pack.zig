@@ -1,52 +1,41 @@
 const std = @import("std");
-const builtin = @import("builtin");
+const heap = @import("heap.zig");
+const xz_pack = @import("xz_pack.zig");
 const pack_data = @import("generated/harmonious_name_pack_xz.zig");
 
-var decoded_ready: bool = false;
-var decoded_pack: []u8 = &[_]u8{};
+var pack_once: xz_pack.Once = .{};
+var decoded_pack: []const u8 = &[_]u8{};
 
 var kind_counts: []u32 = &[_]u32{};
 var kind_starts: []u32 = &[_]u32{};
 var name_offsets: []u32 = &[_]u32{};
 var name_lengths: []u16 = &[_]u16{};
 
-fn allocator() std.mem.Allocator {
-    return if (builtin.target.cpu.arch == .wasm32)
-        std.heap.wasm_allocator
-    else
-        std.heap.page_allocator;
-}
-
 fn decodeIfNeeded() bool {
-    if (decoded_ready) return true;
-
-    const alloc = allocator();
-
-    var in_stream = std.io.fixedBufferStream(pack_data.PACK_XZ[0..]);
-    var dec = std.compress.xz.decompress(alloc, in_stream.reader()) catch return false;
-    defer dec.deinit();
+    return pack_once.run(decodePack);
+}
 
-    const out = alloc.alloc(u8, pack_data.PACK_RAW_LEN) catch return false;
-    var keep_out = false;
-    defer if (!keep_out) alloc.free(out);
+/// Decodes and indexes the pack on first use; the result lives for the rest
+/// of the process.
+pub fn warmup() bool {
+    return decodeIfNeeded();
+}
 
-    var out_pos: usize = 0;
-    while (true) {
-        if (out_pos > out.len) return false;
-        const n = dec.reader().read(out[out_pos..]) catch return false;
-        if (n == 0) break;
-        out_pos += n;
-    }
-    if (out_pos != out.len) return false;
+pub fn packStats() xz_pack.Stats {
+    return pack_once.stats();
+}
 
-    decoded_pack = out;
+fn decodePack() ?xz_pack.Resident {
+    var raw: [1][]const u8 = undefined;
+    const expanded = xz_pack.expand(.names, &raw) orelse return null;
+    decoded_pack = raw[0];
     if (!parseDecoded()) {
         decoded_pack = &[_]u8{};
-        return false;
+        xz_pack.release(.names, &raw);
+        return null;
     }
-    keep_out = true;
-    decoded_ready = true;
-    return true;
+    const index_bytes = @sizeOf(u32) * (kind_counts.len + kind_starts.len + name_offsets.len) + @sizeOf(u16) * name_lengths.len;
+    return .{ .bytes = expanded.bytes + index_bytes, .mapped = expanded.mapped };
 }
 
 fn readU16At(off: usize) ?u16 {
@@ -77,7 +66,7 @@ fn parseDecoded() bool {
     if (kind_count != pack_data.KIND_COUNT) return false;
     if (total_names != pack_data.TOTAL_NAME_COUNT) return false;
 
-    const alloc = allocator();
+    const alloc = heap.allocator();
     const tmp_kind_counts = alloc.alloc(u32, kind_count) catch return false;
     errdefer alloc.free(tmp_kind_counts);
     const tmp_kind_starts = alloc.alloc(u32, kind_count + 1) catch return false;
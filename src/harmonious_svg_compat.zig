@@ -2,6 +2,7 @@ const std = @import("std");
 const build_options = @import("build_options");
 
 const name_pack = @import("harmonious_name_pack.zig");
+const xz_pack = @import("xz_pack.zig");
 const oc_templates = @import("generated/harmonious_oc_templates.zig");
 const pitch = @import("pitch.zig");
 const pcs = @import("pitch_class_set.zig");
@@ -96,6 +97,24 @@ pub fn imageName(kind_index: usize, image_index: usize) ?[]const u8 {
     return name_pack.imageName(kind_index, image_index);
 }
 
+/// Decodes one embedded xz pack now instead of on the first request that
+/// needs it. Returns false when the decode fails; a later call retries.
+pub fn warmPack(kind: xz_pack.Kind) bool {
+    return switch (kind) {
+        .names => name_pack.warmup(),
+        .majmin_scenes => svg_majmin_compat.warmup(),
+        .evenness => svg_evenness_compat.warmup(),
+    };
+}
+
+pub fn packStats(kind: xz_pack.Kind) xz_pack.Stats {
+    return switch (kind) {
+        .names => name_pack.packStats(),
+        .majmin_scenes => svg_majmin_compat.packStats(),
+        .evenness => svg_evenness_compat.packStats(),
+    };
+}
+
 pub fn generateByIndex(kind_index: usize, image_index: usize, buf: []u8) []u8 {
     const info = kindInfo(kind_index) orelse return "";
     if (majminSceneKindFromId(info.id)) |scene_kind| {
@@ -0,0 +1,73 @@
+//! Process allocator for the few library paths that need heap memory (the
+//! xz-compressed compat packs). Every allocation is counted so `zig build
+//! bench` can report allocations per operation.
+
+const std = @import("std");
+const builtin = @import("builtin");
+
+pub const Stats = struct {
+    allocations: u64,
+    bytes: u64,
+};
+
+// usize rather than u64 so the counters stay lock-free on wasm32.
+var allocation_count = std.atomic.Value(usize).init(0);
+var allocated_bytes = std.atomic.Value(usize).init(0);
+
+const backing = if (builtin.target.cpu.arch == .wasm32)
+    std.heap.wasm_allocator
+else
+    std.heap.page_allocator;
+
+const counting_vtable = std.mem.Allocator.VTable{
+    .alloc = alloc,
+    .resize = resize,
+    .remap = remap,
+    .free = free,
+};
+
+pub fn allocator() std.mem.Allocator {
+    return .{ .ptr = undefined, .vtable = &counting_vtable };
+}
+
+/// Running totals since process start; diff two snapshots to measure a call.
+pub fn stats() Stats {
+    return .{
+        .allocations = allocation_count.load(.monotonic),
+        .bytes = allocated_bytes.load(.monotonic),
+    };
+}
+
+fn record(len: usize) void {
+    _ = allocation_count.fetchAdd(1, .monotonic);
+    _ = allocated_bytes.fetchAdd(len, .monotonic);
+}
+
+fn alloc(_: *anyopaque, len: usize, alignment: std.mem.Alignment, ret_addr: usize) ?[*]u8 {
+    const ptr = backing.rawAlloc(len, alignment, ret_addr) orelse return null;
+    record(len);
+    return ptr;
+}
+
+fn resize(_: *anyopaque, memory: []u8, alignment: std.mem.Alignment, new_len: usize, ret_addr: usize) bool {
+    return backing.rawResize(memory, alignment, new_len, ret_addr);
+}
+
+fn remap(_: *anyopaque, memory: []u8, alignment: std.mem.Alignment, new_len: usize, ret_addr: usize) ?[*]u8 {
+    const ptr = backing.rawRemap(memory, alignment, new_len, ret_addr) orelse return null;
+    if (ptr != memory.ptr) record(new_len);
+    return ptr;
+}
+
+fn free(_: *anyopaque, memory: []u8, alignment: std.mem.Alignment, ret_addr: usize) void {
+    backing.rawFree(memory, alignment, ret_addr);
+}
+
+test "heap allocator counts allocations" {
+    const before = stats();
+    const bytes = try allocator().alloc(u8, 100);
+    allocator().free(bytes);
+    const after = stats();
+    try std.testing.expectEqual(before.allocations + 1, after.allocations);
+    try std.testing.expectEqual(before.bytes + 100, after.bytes);
+}
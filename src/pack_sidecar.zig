@@ -0,0 +1,140 @@
+//! Uncompressed sidecar files for the embedded xz packs. A build configured
+//! with `-Dpack-sidecar-dir=DIR` (made absolute against the project root
+//! at configure time) looks for `DIR/<kind>.lmtpack` before it
+//! decodes a pack and maps the file read-only instead, so forked workers
+//! share one set of page-cache pages and skip the decode. `zig build
+//! pack-sidecars` writes the files from the packs embedded in this build;
+//! the generator scripts write the same bytes with `--sidecar-dir`.
+//!
+//! Layout, integers little-endian:
+//!
+//!   "LMTS" version:u32 kind:u32 segment_count:u32
+//!   segment_count x (offset:u64, raw_len:u64, xz_len:u32, xz_crc32:u32)
+//!   zero padding, each segment starting at a SEGMENT_ALIGN multiple
+//!
+//! A sidecar is used only when every record names the xz stream embedded in
+//! this build (length and CRC-32), so a stale file falls back to decoding.
+
+const std = @import("std");
+const builtin = @import("builtin");
+const build_options = @import("build_options");
+const xz_pack = @import("xz_pack.zig");
+
+pub const MAGIC = "LMTS";
+pub const VERSION: u32 = 1;
+pub const SEGMENT_ALIGN: usize = 64;
+pub const FILE_EXTENSION = ".lmtpack";
+
+const HEADER_LEN = 16;
+const RECORD_LEN = 24;
+
+/// Directory the library maps sidecars from; empty unless the build set one.
+pub const dir: []const u8 = if (@hasDecl(build_options, "pack_sidecar_dir")) build_options.pack_sidecar_dir else "";
+pub const enabled = dir.len != 0 and !builtin.target.cpu.arch.isWasm() and builtin.os.tag != .windows;
+
+pub fn fileName(comptime kind: xz_pack.Kind) []const u8 {
+    return @tagName(kind) ++ FILE_EXTENSION;
+}
+
+pub const Mapping = struct {
+    bytes: []align(std.heap.page_size_min) const u8,
+
+    pub fn unmap(self: Mapping) void {
+        std.posix.munmap(self.bytes);
+    }
+};
+
+/// Maps `sub_path` and points `out` at its segments when the file was
+/// written for `segments` of pack `kind`; null when it is missing or stale.
+pub fn map(base: std.fs.Dir, sub_path: []const u8, kind: xz_pack.Kind, segments: []const xz_pack.Segment, out: [][]const u8) ?Mapping {
+    const file = base.openFile(sub_path, .{}) catch return null;
+    defer file.close();
+    const size = std.math.cast(usize, file.getEndPos() catch return null) orelse return null;
+    if (size < HEADER_LEN + segments.len * RECORD_LEN) return null;
+
+    const bytes = std.posix.mmap(null, size, std.posix.PROT.READ, .{ .TYPE = .SHARED }, file.handle, 0) catch return null;
+    const mapping = Mapping{ .bytes = bytes };
+    if (!resolve(bytes, kind, segments, out)) {
+        mapping.unmap();
+        return null;
+    }
+    return mapping;
+}
+
+fn resolve(bytes: []const u8, kind: xz_pack.Kind, segments: []const xz_pack.Segment, out: [][]const u8) bool {
+    if (!std.mem.eql(u8, bytes[0..4], MAGIC)) return false;
+    if (readInt(u32, bytes, 4) != VERSION) return false;
+    if (readInt(u32, bytes, 8) != @intFromEnum(kind)) return false;
+    if (readInt(u32, bytes, 12) != segments.len) return false;
+
+    for (segments, out, 0..) |segment, *slot, i| {
+        const record = HEADER_LEN + i * RECORD_LEN;
+        const offset = std.math.cast(usize, readInt(u64, bytes, record)) orelse return false;
+        const raw_len = std.math.cast(usize, readInt(u64, bytes, record + 8)) orelse return false;
+        if (readInt(u32, bytes, record + 16) != segment.xz.len) return false;
+        if (readInt(u32, bytes, record + 20) != std.hash.Crc32.hash(segment.xz)) return false;
+        if (segment.raw_len) |expected| if (raw_len != expected) return false;
+        if (offset % SEGMENT_ALIGN != 0 or offset > bytes.len or raw_len > bytes.len - offset) return false;
+        slot.* = bytes[offset..][0..raw_len];
+    }
+    return true;
+}
+
+fn readInt(comptime T: type, bytes: []const u8, at: usize) T {
+    return std.mem.readInt(T, bytes[at..][0..@sizeOf(T)], .little);
+}
+
+/// Writes a sidecar holding `raw`, the expanded form of each of `segments`.
+pub fn write(writer: *std.Io.Writer, kind: xz_pack.Kind, segments: []const xz_pack.Segment, raw: []const []const u8) std.Io.Writer.Error!void {
+    std.debug.assert(segments.len == raw.len);
+    try writer.writeAll(MAGIC);
+    try writer.writeInt(u32, VERSION, .little);
+    try writer.writeInt(u32, @intFromEnum(kind), .little);
+    try writer.writeInt(u32, @intCast(segments.len), .little);
+
+    var offset = std.mem.alignForward(usize, HEADER_LEN + segments.len * RECORD_LEN, SEGMENT_ALIGN);
+    for (segments, raw) |segment, bytes| {
+        try writer.writeInt(u64, offset, .little);
+        try writer.writeInt(u64, bytes.len, .little);
+        try writer.writeInt(u32, @intCast(segment.xz.len), .little);
+        try writer.writeInt(u32, std.hash.Crc32.hash(segment.xz), .little);
+        offset = std.mem.alignForward(usize, offset + bytes.len, SEGMENT_ALIGN);
+    }
+
+    var written = HEADER_LEN + segments.len * RECORD_LEN;
+    for (raw) |bytes| {
+        const start = std.mem.alignForward(usize, written, SEGMENT_ALIGN);
+        try writer.splatByteAll(0, start - written);
+        try writer.writeAll(bytes);
+        written = start + bytes.len;
+    }
+}
+
+test "sidecar round-trips segments and rejects a stale pack" {
+    if (builtin.os.tag == .windows or builtin.target.cpu.arch.isWasm()) return error.SkipZigTest;
+    const allocator = std.testing.allocator;
+
+    const first_xz = "not really xz, only hashed";
+    const segments = [_]xz_pack.Segment{ .{ .xz = first_xz, .raw_len = 5 }, .{ .xz = "second" } };
+    const raw = [_][]const u8{ "hello", "a longer second segment" };
+
+    var tmp = std.testing.tmpDir(.{});
+    defer tmp.cleanup();
+    var out: std.Io.Writer.Allocating = .init(allocator);
+    defer out.deinit();
+    try write(&out.writer, .evenness, &segments, &raw);
+    try tmp.dir.writeFile(.{ .sub_path = "evenness.lmtpack", .data = out.written() });
+
+    var views: [2][]const u8 = undefined;
+    const mapping = map(tmp.dir, "evenness.lmtpack", .evenness, &segments, &views) orelse return error.TestUnexpectedResult;
+    defer mapping.unmap();
+    for (raw, views) |expected, view| {
+        try std.testing.expectEqualStrings(expected, view);
+        try std.testing.expectEqual(@as(usize, 0), (@intFromPtr(view.ptr) - @intFromPtr(mapping.bytes.ptr)) % SEGMENT_ALIGN);
+    }
+
+    const rebuilt = [_]xz_pack.Segment{ .{ .xz = "not really xz, only hashed!", .raw_len = 5 }, segments[1] };
+    try std.testing.expect(map(tmp.dir, "evenness.lmtpack", .evenness, &rebuilt, &views) == null);
+    try std.testing.expect(map(tmp.dir, "evenness.lmtpack", .names, &segments, &views) == null);
+    try std.testing.expect(map(tmp.dir, "missing.lmtpack", .evenness, &segments, &views) == null);
+}
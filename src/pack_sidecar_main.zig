@@ -0,0 +1,48 @@
+//! `pack-sidecars OUT_DIR` decodes every xz pack embedded in this build and
+//! writes `OUT_DIR/<kind>.lmtpack` for libraries built with
+//! `-Dpack-sidecar-dir`. `zig build pack-sidecars` runs it; see
+//! `pack_sidecar.zig` for the file layout.
+
+const std = @import("std");
+const xz_pack = @import("xz_pack.zig");
+const pack_sidecar = @import("pack_sidecar.zig");
+
+const usage =
+    \\usage: pack-sidecars OUT_DIR
+    \\
+;
+
+const MAX_SEGMENTS = 8;
+
+pub fn main() !void {
+    const allocator = std.heap.smp_allocator;
+    const args = try std.process.argsAlloc(allocator);
+    defer std.process.argsFree(allocator, args);
+    if (args.len != 2) return fail(usage);
+
+    var out_dir = try std.fs.cwd().makeOpenPath(args[1], .{});
+    defer out_dir.close();
+
+    inline for (comptime std.enums.values(xz_pack.Kind)) |kind| {
+        const segments = xz_pack.segments(kind);
+        var raw_buf: [MAX_SEGMENTS][]const u8 = undefined;
+        const raw = raw_buf[0..segments.len];
+        if (!xz_pack.decodeAll(kind, raw)) return fail("failed to decode an embedded pack\n");
+
+        var file = try out_dir.createFile(pack_sidecar.fileName(kind), .{});
+        defer file.close();
+        var file_buf: [64 * 1024]u8 = undefined;
+        var file_writer = file.writer(&file_buf);
+        try pack_sidecar.write(&file_writer.interface, kind, segments, raw);
+        try file_writer.interface.flush();
+
+        var total: usize = 0;
+        for (raw) |bytes| total += bytes.len;
+        std.debug.print("wrote {s}/{s}: {d} bytes in {d} segments\n", .{ args[1], pack_sidecar.fileName(kind), total, segments.len });
+    }
+}
+
+fn fail(message: []const u8) error{InvalidArguments} {
+    std.fs.File.stderr().writeAll(message) catch {};
+    return error.InvalidArguments;
+}
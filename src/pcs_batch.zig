@@ -0,0 +1,125 @@
+const std = @import("std");
+const pcs = @import("pitch_class_set.zig");
+const evenness = @import("evenness.zig");
+
+// Span variants of the scalar set operations. Inputs are raw 16-bit sets
+// (upper bits ignored) so C and Python callers can hand over a uint16 array
+// without a conversion pass. Every function processes min(sets.len, out.len)
+// entries and returns that count. Results match the scalar functions in
+// pitch_class_set.zig, set_class.zig, cluster.zig, and evenness.zig exactly.
+
+pub const LANES: comptime_int = std.simd.suggestVectorLength(u16) orelse 8;
+
+const Lanes = @Vector(LANES, u16);
+const Shift = @Vector(LANES, u4);
+const MASK: Lanes = @splat(@as(u16, pcs.CHROMATIC));
+
+fn rotateUp(v: Lanes, semitones: u4) Lanes {
+    const left: Shift = @splat(semitones);
+    const right: Shift = @splat(@as(u4, @intCast(12 - @as(u5, semitones))));
+    return ((v << left) | (v >> right)) & MASK;
+}
+
+fn invertLanes(v: Lanes) Lanes {
+    const reversed = @bitReverse(v) >> @as(Shift, @splat(4));
+    return rotateUp(reversed, 1);
+}
+
+fn primeLanes(v: Lanes) Lanes {
+    var best = v;
+    var t: u4 = 1;
+    while (t < 12) : (t += 1) {
+        best = @min(best, rotateUp(v, t));
+    }
+    return best;
+}
+
+fn cardinalityOp(v: Lanes, _: u4) @Vector(LANES, u8) {
+    return @intCast(@popCount(v));
+}
+
+fn transposeOp(v: Lanes, semitones: u4) Lanes {
+    return rotateUp(v, semitones);
+}
+
+fn invertOp(v: Lanes, _: u4) Lanes {
+    return invertLanes(v);
+}
+
+fn complementOp(v: Lanes, _: u4) Lanes {
+    return v ^ MASK;
+}
+
+fn primeFormOp(v: Lanes, _: u4) Lanes {
+    return primeLanes(v);
+}
+
+fn fortePrimeOp(v: Lanes, _: u4) Lanes {
+    return @min(primeLanes(v), primeLanes(invertLanes(v)));
+}
+
+fn clusterFreeOp(v: Lanes, _: u4) @Vector(LANES, bool) {
+    const runs = v & rotateUp(v, 1) & rotateUp(v, 2);
+    return runs == @as(Lanes, @splat(0));
+}
+
+fn apply(
+    comptime T: type,
+    sets: []const u16,
+    out: []T,
+    semitones: u4,
+    comptime op: fn (Lanes, u4) @Vector(LANES, T),
+) usize {
+    const n = @min(sets.len, out.len);
+
+    var i: usize = 0;
+    while (i + LANES <= n) : (i += LANES) {
+        const v: Lanes = sets[i..][0..LANES].*;
+        out[i..][0..LANES].* = op(v & MASK, semitones);
+    }
+
+    if (i < n) {
+        var tail = [_]u16{0} ** LANES;
+        @memcpy(tail[0 .. n - i], sets[i..n]);
+        const result: [LANES]T = op(@as(Lanes, tail) & MASK, semitones);
+        @memcpy(out[i..n], result[0 .. n - i]);
+    }
+
+    return n;
+}
+
+pub fn cardinality(sets: []const u16, out: []u8) usize {
+    return apply(u8, sets, out, 0, cardinalityOp);
+}
+
+pub fn transpose(sets: []const u16, semitones: u4, out: []u16) usize {
+    return apply(u16, sets, out, @intCast(semitones % 12), transposeOp);
+}
+
+pub fn invert(sets: []const u16, out: []u16) usize {
+    return apply(u16, sets, out, 0, invertOp);
+}
+
+pub fn complement(sets: []const u16, out: []u16) usize {
+    return apply(u16, sets, out, 0, complementOp);
+}
+
+pub fn primeForm(sets: []const u16, out: []u16) usize {
+    return apply(u16, sets, out, 0, primeFormOp);
+}
+
+pub fn fortePrime(sets: []const u16, out: []u16) usize {
+    return apply(u16, sets, out, 0, fortePrimeOp);
+}
+
+pub fn isClusterFree(sets: []const u16, out: []bool) usize {
+    return apply(bool, sets, out, 0, clusterFreeOp);
+}
+
+pub fn evennessDistance(sets: []const u16, out: []f32) usize {
+    const n = @min(sets.len, out.len);
+    for (sets[0..n], out[0..n]) |raw, *dst| {
+        dst.* = evenness.evennessDistance(@as(pcs.PitchClassSet, @truncate(raw)));
+    }
+    return n;
+}
@@ -0,0 +1,79 @@
+//! `prerender-assets OUT DOMAIN...` renders every input of the named
+//! prerendered asset domains through the live C ABI writers and writes them
+//! to OUT for scripts/generate_prerendered_asset_pack.py to chunk and
+//! compress. The build runs it for `-Dprerendered-assets=compact|full`.
+//!
+//! OUT layout, integers little-endian u32 unless noted:
+//!
+//!   "LPR1" domain_count packed_count
+//!   packed_count x (domain u8, entry_count, entry_count x (len, bytes))
+
+const std = @import("std");
+const api = @import("c_api.zig");
+const prerendered_assets = @import("prerendered_assets.zig");
+
+const Domain = prerendered_assets.Domain;
+
+const usage =
+    \\usage: prerender-assets OUT DOMAIN...
+    \\
+    \\DOMAIN is one of clock_optc, optic_k_group, key_staff, evenness_chart.
+    \\
+;
+
+pub fn main() !void {
+    const allocator = std.heap.smp_allocator;
+    const args = try std.process.argsAlloc(allocator);
+    defer std.process.argsFree(allocator, args);
+
+    if (args.len < 3) return fail(usage);
+    var domains: [prerendered_assets.DOMAIN_COUNT]Domain = undefined;
+    for (args[2..], 0..) |name, i| {
+        if (i >= domains.len) return fail("too many domains\n");
+        domains[i] = std.meta.stringToEnum(Domain, name) orelse return fail("unknown domain\n");
+    }
+    const selected = domains[0 .. args.len - 2];
+
+    var file = try std.fs.cwd().createFile(args[1], .{});
+    defer file.close();
+    var file_buf: [64 * 1024]u8 = undefined;
+    var file_writer = file.writer(&file_buf);
+    const out = &file_writer.interface;
+
+    try out.writeAll("LPR1");
+    try out.writeInt(u32, prerendered_assets.DOMAIN_COUNT, .little);
+    try out.writeInt(u32, @intCast(selected.len), .little);
+
+    const svg_buf = try allocator.alloc(u8, 128 * 1024);
+    defer allocator.free(svg_buf);
+    for (selected) |domain| {
+        try out.writeByte(@intFromEnum(domain));
+        try out.writeInt(u32, domain.inputCount(), .little);
+        var index: u32 = 0;
+        while (index < domain.inputCount()) : (index += 1) {
+            const svg = render(domain, index, svg_buf);
+            if (svg.len == 0) return fail("renderer produced no output\n");
+            try out.writeInt(u32, @intCast(svg.len), .little);
+            try out.writeAll(svg);
+        }
+    }
+    try out.flush();
+}
+
+fn render(domain: Domain, index: u32, svg_buf: []u8) []const u8 {
+    const buf_size: u32 = @intCast(svg_buf.len);
+    const len = switch (domain) {
+        .clock_optc => api.lmt_svg_clock_optc(@intCast(index), svg_buf.ptr, buf_size),
+        .optic_k_group => api.lmt_svg_optic_k_group(@intCast(index), svg_buf.ptr, buf_size),
+        .key_staff => api.lmt_svg_key_staff(@intCast(index % 12), @intCast(index / 12), svg_buf.ptr, buf_size),
+        .evenness_chart => api.lmt_svg_evenness_chart(svg_buf.ptr, buf_size),
+    };
+    // A document that does not fit would be truncated; refuse to pack it.
+    if (len >= svg_buf.len) return "";
+    return svg_buf[0..len];
+}
+
+fn fail(message: []const u8) error{InvalidArguments} {
+    std.fs.File.stderr().writeAll(message) catch {};
+    return error.InvalidArguments;
+}
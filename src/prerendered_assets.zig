@@ -0,0 +1,132 @@
+//! Prerendered SVG documents for the diagram renderers whose whole input
+//! domain is small enough to enumerate ahead of time.
+//!
+//! `zig build -Dprerendered-assets=compact|full` runs `src/prerender_main.zig`
+//! and scripts/generate_prerendered_asset_pack.py to build an indexed pack of
+//! xz chunks, then embeds it here. A lookup reads the entry record straight
+//! from the index and decodes its chunk once, on first use. Without the flag
+//! the pack is empty and every lookup misses at compile time.
+//!
+//! Pack layout, all integers little-endian u32:
+//!
+//!   "LPA1" domain_count chunk_count entry_count
+//!   domain_count x (first_entry, entry_count)
+//!   chunk_count x (xz_offset, xz_len, raw_len)
+//!   entry_count x (chunk, offset, len)
+//!   xz streams, offsets relative to the end of the entry table
+
+const std = @import("std");
+const build_options = @import("build_options");
+const xz_pack = @import("xz_pack.zig");
+
+pub const Domain = enum(u8) {
+    clock_optc,
+    optic_k_group,
+    key_staff,
+    evenness_chart,
+
+    /// Distinct inputs the public writer accepts once they are sanitized.
+    pub fn inputCount(self: Domain) u32 {
+        return switch (self) {
+            .clock_optc, .optic_k_group => 4096,
+            .key_staff => 24,
+            .evenness_chart => 1,
+        };
+    }
+};
+
+pub const DOMAIN_COUNT: u32 = @typeInfo(Domain).@"enum".fields.len;
+pub const PACK_MAGIC = "LPA1";
+
+/// Key signature staves are indexed major 0-11, then minor 12-23.
+pub fn keyStaffIndex(tonic: u8, minor: bool) u32 {
+    return @as(u32, tonic % 12) + if (minor) @as(u32, 12) else 0;
+}
+
+const pack: []const u8 = if (build_options.prerendered_assets == .none)
+    ""
+else
+    @import("prerendered_asset_pack").PACK;
+
+const HEADER_LEN = 16;
+const DOMAIN_RECORD_LEN = 8;
+const CHUNK_RECORD_LEN = 12;
+const ENTRY_RECORD_LEN = 12;
+
+fn word(at: usize) u32 {
+    return std.mem.readInt(u32, pack[at..][0..4], .little);
+}
+
+const chunk_count: usize = if (pack.len == 0) 0 else word(8);
+const entry_total: usize = if (pack.len == 0) 0 else word(12);
+const domains_at = HEADER_LEN;
+const chunks_at = domains_at + DOMAIN_COUNT * DOMAIN_RECORD_LEN;
+const entries_at = chunks_at + chunk_count * CHUNK_RECORD_LEN;
+const data_at = entries_at + entry_total * ENTRY_RECORD_LEN;
+
+comptime {
+    if (pack.len != 0) {
+        if (pack.len < HEADER_LEN or !std.mem.eql(u8, pack[0..4], PACK_MAGIC)) @compileError("prerendered asset pack has a bad header");
+        if (word(4) != DOMAIN_COUNT) @compileError("prerendered asset pack was built for another domain list");
+        if (data_at > pack.len) @compileError("prerendered asset pack index is truncated");
+    }
+}
+
+var decode_mutex: std.Thread.Mutex = .{};
+var chunk_ready = [_]std.atomic.Value(bool){std.atomic.Value(bool).init(false)} ** chunk_count;
+var chunk_bytes = [_][]const u8{&.{}} ** chunk_count;
+
+pub fn isEmbedded() bool {
+    return pack.len != 0;
+}
+
+/// Entries the pack holds for `domain`: 0 when the domain was left out of
+/// this build, otherwise `domain.inputCount()`.
+pub fn count(domain: Domain) u32 {
+    if (pack.len == 0) return 0;
+    return word(domains_at + @as(usize, @intFromEnum(domain)) * DOMAIN_RECORD_LEN + 4);
+}
+
+/// Returns the prerendered document for input `index`, or null when the
+/// domain is not packed or its chunk cannot be decoded. The slice stays
+/// valid for the life of the process.
+pub fn lookup(domain: Domain, index: u32) ?[]const u8 {
+    if (pack.len == 0) return null;
+    if (index >= count(domain)) return null;
+    const first = word(domains_at + @as(usize, @intFromEnum(domain)) * DOMAIN_RECORD_LEN);
+    const entry = entries_at + (@as(usize, first) + index) * ENTRY_RECORD_LEN;
+    const chunk = word(entry);
+    const offset = word(entry + 4);
+    const len = word(entry + 8);
+    if (chunk >= chunk_count) return null;
+    const bytes = chunkBytes(chunk) orelse return null;
+    if (@as(usize, offset) + len > bytes.len) return null;
+    return bytes[offset..][0..len];
+}
+
+fn chunkBytes(chunk: usize) ?[]const u8 {
+    if (chunk_ready[chunk].load(.acquire)) return chunk_bytes[chunk];
+
+    decode_mutex.lock();
+    defer decode_mutex.unlock();
+    if (chunk_ready[chunk].load(.monotonic)) return chunk_bytes[chunk];
+
+    const record = chunks_at + chunk * CHUNK_RECORD_LEN;
+    const xz_offset = data_at + @as(usize, word(record));
+    const xz_len = word(record + 4);
+    if (xz_offset + xz_len > pack.len) return null;
+    const raw = xz_pack.decode(pack[xz_offset..][0..xz_len], word(record + 8)) orelse return null;
+    chunk_bytes[chunk] = raw;
+    chunk_ready[chunk].store(true, .release);
+    return raw;
+}
+
+test "prerendered asset index covers each packed domain" {
+    for (std.enums.values(Domain)) |domain| {
+        const packed_count = count(domain);
+        try std.testing.expect(packed_count == 0 or packed_count == domain.inputCount());
+        try std.testing.expectEqual(packed_count != 0, lookup(domain, 0) != null);
+        try std.testing.expectEqual(@as(?[]const u8, null), lookup(domain, domain.inputCount()));
+    }
+    try std.testing.expectEqual(@as(u32, 13), keyStaffIndex(13, true));
+}
@@ -0,0 +1,307 @@
+//! Opt-in, content-addressed LRU cache for finished SVG and RGBA output.
+//!
+//! A key is a renderer id followed by the canonical input bytes of one call
+//! (sanitized arguments plus any output size). Entries hold the whole
+//! document, so a hit is served as one copy. The byte budget starts at 0,
+//! which disables the cache: writers then pay one flag load per call until a
+//! caller opts in with `configure`. All state sits behind one mutex, so
+//! writers on different threads may share the cache.
+
+const std = @import("std");
+const heap = @import("../heap.zig");
+
+pub const Renderer = enum(u8) {
+    svg_clock_optc,
+    svg_optic_k_group,
+    svg_evenness_chart,
+    svg_evenness_field,
+    svg_fret,
+    svg_fret_n,
+    svg_fret_tuned_n,
+    svg_chord_staff,
+    svg_key_staff,
+    svg_keyboard,
+    svg_piano_staff,
+    bitmap_clock_optc,
+    bitmap_optic_k_group,
+    bitmap_evenness_chart,
+    bitmap_evenness_field,
+    bitmap_fret,
+    bitmap_fret_n,
+    bitmap_fret_tuned_n,
+    bitmap_chord_staff,
+    bitmap_key_staff,
+    bitmap_keyboard,
+    bitmap_piano_staff,
+};
+
+/// Longest canonical input a key may hold; longer calls are never cached.
+pub const KEY_CAPACITY: usize = 512;
+
+/// Bytes charged per entry on top of its key and document, covering the
+/// entry header and its hash map slot.
+pub const ENTRY_OVERHEAD: usize = @sizeOf(Entry) + 32;
+
+pub const Key = struct {
+    bytes: [KEY_CAPACITY]u8 = undefined,
+    len: usize = 0,
+    overflow: bool = false,
+
+    pub fn init(renderer: Renderer) Key {
+        var key = Key{};
+        key.bytes[0] = @intFromEnum(renderer);
+        key.len = 1;
+        return key;
+    }
+
+    pub fn add(self: *Key, bytes: []const u8) void {
+        if (self.overflow or bytes.len > KEY_CAPACITY - self.len) {
+            self.overflow = true;
+            return;
+        }
+        @memcpy(self.bytes[self.len..][0..bytes.len], bytes);
+        self.len += bytes.len;
+    }
+
+    /// Appends `value` little-endian, so keys match across hosts.
+    pub fn int(self: *Key, comptime T: type, value: T) void {
+        var buf: [@sizeOf(T)]u8 = undefined;
+        std.mem.writeInt(T, &buf, value, .little);
+        self.add(&buf);
+    }
+
+    /// Appends a length-prefixed byte string.
+    pub fn slice(self: *Key, bytes: []const u8) void {
+        self.int(u32, @intCast(@min(bytes.len, std.math.maxInt(u32))));
+        self.add(bytes);
+    }
+
+    /// Appends a length-prefixed list of integers that fit in a byte, such
+    /// as MIDI notes.
+    pub fn byteInts(self: *Key, values: anytype) void {
+        self.int(u32, @intCast(@min(values.len, std.math.maxInt(u32))));
+        for (values) |value| self.int(u8, value);
+    }
+
+    fn items(self: *const Key) []const u8 {
+        return self.bytes[0..self.len];
+    }
+};
+
+pub const Stats = struct {
+    hits: u64 = 0,
+    misses: u64 = 0,
+    /// Entries dropped to stay within the budget.
+    evictions: u64 = 0,
+    insertions: u64 = 0,
+    entries: u32 = 0,
+    bytes: u64 = 0,
+    budget_bytes: u64 = 0,
+};
+
+const Entry = struct {
+    node: std.DoublyLinkedList.Node = .{},
+    hash: u64,
+    key_len: usize,
+    /// Key bytes followed by the document.
+    data: []u8,
+
+    fn key(self: *const Entry) []const u8 {
+        return self.data[0..self.key_len];
+    }
+
+    fn value(self: *const Entry) []const u8 {
+        return self.data[self.key_len..];
+    }
+
+    fn cost(self: *const Entry) usize {
+        return self.data.len + ENTRY_OVERHEAD;
+    }
+};
+
+var mutex: std.Thread.Mutex = .{};
+var enabled = std.atomic.Value(bool).init(false);
+var budget: usize = 0;
+var used: usize = 0;
+var map: std.AutoHashMapUnmanaged(u64, *Entry) = .empty;
+/// Most recently used first.
+var lru: std.DoublyLinkedList = .{};
+var counters: Stats = .{};
+
+pub fn isEnabled() bool {
+    return enabled.load(.acquire);
+}
+
+/// Sets the byte budget, evicting least recently used entries to fit. A
+/// budget of 0 frees every entry and disables the cache.
+pub fn configure(budget_bytes: usize) void {
+    mutex.lock();
+    defer mutex.unlock();
+    budget = budget_bytes;
+    if (budget_bytes == 0) {
+        dropAll();
+        map.deinit(heap.allocator());
+        map = .empty;
+    } else {
+        evictToFit(0);
+    }
+    enabled.store(budget_bytes != 0, .release);
+}
+
+/// Drops every entry. Counters and the budget are kept.
+pub fn invalidate() void {
+    mutex.lock();
+    defer mutex.unlock();
+    dropAll();
+}
+
+pub fn stats() Stats {
+    mutex.lock();
+    defer mutex.unlock();
+    var out = counters;
+    out.entries = map.count();
+    out.bytes = used;
+    out.budget_bytes = budget;
+    return out;
+}
+
+/// On a hit, returns `server.serve(document)`, called under the cache lock
+/// so the entry cannot be evicted mid-copy. Returns null on a miss, when the
+/// cache is disabled, or when the key overflowed.
+pub fn serve(key: *const Key, server: anytype) ?u32 {
+    if (!isEnabled() or key.overflow) return null;
+    const hash = std.hash.Wyhash.hash(0, key.items());
+    mutex.lock();
+    defer mutex.unlock();
+    const entry = map.get(hash) orelse {
+        counters.misses += 1;
+        return null;
+    };
+    if (!std.mem.eql(u8, entry.key(), key.items())) {
+        counters.misses += 1;
+        return null;
+    }
+    counters.hits += 1;
+    lru.remove(&entry.node);
+    lru.prepend(&entry.node);
+    return server.serve(entry.value());
+}
+
+/// Keeps a copy of `document` under `key`. Documents that cannot fit the
+/// budget, and allocation failures, are skipped silently.
+pub fn store(key: *const Key, document: []const u8) void {
+    if (!isEnabled() or key.overflow or document.len == 0) return;
+    const key_bytes = key.items();
+    const size = key_bytes.len + document.len;
+    const hash = std.hash.Wyhash.hash(0, key_bytes);
+
+    mutex.lock();
+    defer mutex.unlock();
+    if (size + ENTRY_OVERHEAD > budget) return;
+
+    const allocator = heap.allocator();
+    const data = allocator.alloc(u8, size) catch return;
+    @memcpy(data[0..key_bytes.len], key_bytes);
+    @memcpy(data[key_bytes.len..], document);
+    const entry = allocator.create(Entry) catch {
+        allocator.free(data);
+        return;
+    };
+    entry.* = .{ .hash = hash, .key_len = key_bytes.len, .data = data };
+
+    // A colliding or concurrently stored entry is replaced.
+    if (map.get(hash)) |old| drop(old);
+    evictToFit(entry.cost());
+    map.put(allocator, hash, entry) catch {
+        destroy(entry);
+        return;
+    };
+    lru.prepend(&entry.node);
+    used += entry.cost();
+    counters.insertions += 1;
+}
+
+fn evictToFit(incoming: usize) void {
+    while (used + incoming > budget) {
+        const node = lru.last orelse break;
+        drop(entryOf(node));
+        counters.evictions += 1;
+    }
+}
+
+fn dropAll() void {
+    while (lru.first) |node| drop(entryOf(node));
+}
+
+fn entryOf(node: *std.DoublyLinkedList.Node) *Entry {
+    // Entry outranks its node's alignment where u64 is wider than a pointer.
+    return @alignCast(@fieldParentPtr("node", node));
+}
+
+fn drop(entry: *Entry) void {
+    lru.remove(&entry.node);
+    _ = map.remove(entry.hash);
+    used -= entry.cost();
+    destroy(entry);
+}
+
+fn destroy(entry: *Entry) void {
+    heap.allocator().free(entry.data);
+    heap.allocator().destroy(entry);
+}
+
+const TestServer = struct {
+    out: []u8,
+
+    pub fn serve(self: TestServer, document: []const u8) u32 {
+        @memcpy(self.out[0..document.len], document);
+        return @intCast(document.len);
+    }
+};
+
+test "render cache serves hits, evicts least recently used, and invalidates" {
+    defer configure(0);
+    var out: [64]u8 = undefined;
+    const server = TestServer{ .out = &out };
+
+    var a = Key.init(.svg_clock_optc);
+    a.int(u16, 0x091);
+    var b = Key.init(.svg_clock_optc);
+    b.int(u16, 0x089);
+    var c = Key.init(.bitmap_clock_optc);
+    c.int(u16, 0x091);
+
+    store(&a, "disabled");
+    try std.testing.expectEqual(@as(?u32, null), serve(&a, server));
+
+    // Room for two 16-byte documents with their keys.
+    configure(2 * (ENTRY_OVERHEAD + 3 + 16));
+    const before = stats();
+    store(&a, "aaaaaaaaaaaaaaaa");
+    store(&b, "bbbbbbbbbbbbbbbb");
+    try std.testing.expectEqual(@as(?u32, 16), serve(&a, server));
+    try std.testing.expectEqualStrings("aaaaaaaaaaaaaaaa", out[0..16]);
+
+    // b is now least recently used, so storing c evicts it.
+    store(&c, "cccccccccccccccc");
+    try std.testing.expectEqual(@as(?u32, null), serve(&b, server));
+    try std.testing.expectEqual(@as(?u32, 16), serve(&c, server));
+    try std.testing.expectEqual(@as(?u32, 16), serve(&a, server));
+
+    const after = stats();
+    try std.testing.expectEqual(before.hits + 3, after.hits);
+    try std.testing.expectEqual(before.misses + 1, after.misses);
+    try std.testing.expectEqual(before.evictions + 1, after.evictions);
+    try std.testing.expectEqual(@as(u32, 2), after.entries);
+
+    invalidate();
+    try std.testing.expectEqual(@as(u32, 0), stats().entries);
+    try std.testing.expectEqual(@as(u64, 0), stats().bytes);
+    try std.testing.expectEqual(@as(?u32, null), serve(&a, server));
+
+    var long = Key.init(.svg_keyboard);
+    long.add(&([_]u8{0} ** KEY_CAPACITY));
+    try std.testing.expect(long.overflow);
+    store(&long, "x");
+    try std.testing.expectEqual(@as(?u32, null), serve(&long, server));
+}
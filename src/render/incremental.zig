@@ -0,0 +1,285 @@
+//! Dirty-rectangle redraws for keyboard and fret diagram bitmaps.
+//!
+//! A view remembers what the previous frame drew and the bitmap it drew
+//! into. An update compares the new input with that state, maps the keys or
+//! strings that changed to padded device rectangles, and re-rasterizes the
+//! new document inside those rectangles only. Every redraw clears its
+//! rectangle and replays the whole document clipped to it, so after any
+//! sequence of updates the bitmap matches a full render of the last input.
+
+const std = @import("std");
+const pitch = @import("../pitch.zig");
+const bitmap_compat = @import("../bitmap_compat.zig");
+const svg_keyboard = @import("../svg/keyboard_svg.zig");
+const svg_fret = @import("../svg/fret.zig");
+const svg_quality = @import("../svg/quality.zig");
+
+pub const PixelRect = bitmap_compat.PixelRect;
+pub const Error = bitmap_compat.Error;
+
+pub const MAX_KEYS: usize = 128;
+pub const MAX_STRINGS: usize = 64;
+
+/// Margin added around changed geometry before it is snapped to pixels:
+/// one viewBox unit for strokes the renderer does not scale, plus whole
+/// pixels for anti-aliased edges.
+const PAD_UNITS: f32 = 1.0;
+const PAD_PIXELS: f32 = 2.0;
+
+/// Rectangles one update redrew. Overlapping rectangles merge, since each
+/// redraw replays the whole document; past `MAX_DIRTY_RECTS` they collapse
+/// into their bounding rectangle.
+pub const DirtyRects = struct {
+    pub const MAX_DIRTY_RECTS: usize = MAX_KEYS;
+
+    items: [MAX_DIRTY_RECTS]PixelRect = undefined,
+    len: usize = 0,
+
+    pub fn slice(self: *const DirtyRects) []const PixelRect {
+        return self.items[0..self.len];
+    }
+
+    pub fn add(self: *DirtyRects, rect: PixelRect) void {
+        if (rect.width == 0 or rect.height == 0) return;
+        var merged = rect;
+        var i: usize = 0;
+        while (i < self.len) {
+            if (!overlaps(self.items[i], merged)) {
+                i += 1;
+                continue;
+            }
+            merged = unionRect(self.items[i], merged);
+            self.len -= 1;
+            self.items[i] = self.items[self.len];
+            i = 0;
+        }
+        if (self.len == self.items.len) {
+            self.items[0] = self.bounding(merged);
+            self.len = 1;
+            return;
+        }
+        self.items[self.len] = merged;
+        self.len += 1;
+    }
+
+    /// Smallest rectangle covering every rectangle so far and `extra`.
+    pub fn bounding(self: *const DirtyRects, extra: PixelRect) PixelRect {
+        var out = extra;
+        for (self.slice()) |rect| out = unionRect(out, rect);
+        return out;
+    }
+};
+
+fn overlaps(a: PixelRect, b: PixelRect) bool {
+    return a.x < b.x + b.width and b.x < a.x + a.width and a.y < b.y + b.height and b.y < a.y + a.height;
+}
+
+fn unionRect(a: PixelRect, b: PixelRect) PixelRect {
+    const x0 = @min(a.x, b.x);
+    const y0 = @min(a.y, b.y);
+    const x1 = @max(a.x + a.width, b.x + b.width);
+    const y1 = @max(a.y + a.height, b.y + b.height);
+    return .{ .x = x0, .y = y0, .width = x1 - x0, .height = y1 - y0 };
+}
+
+/// Maps viewBox `bounds` of a `doc_width` x `doc_height` document drawn at
+/// `width` x `height` to a padded pixel rectangle clamped to the bitmap.
+pub fn deviceRect(bounds: svg_quality.Bounds, doc_width: f32, doc_height: f32, width: u32, height: u32) PixelRect {
+    const sx = @as(f32, @floatFromInt(width)) / doc_width;
+    const sy = @as(f32, @floatFromInt(height)) / doc_height;
+    const x0 = clampPixel(@floor((bounds.min_x - PAD_UNITS) * sx - PAD_PIXELS), width);
+    const y0 = clampPixel(@floor((bounds.min_y - PAD_UNITS) * sy - PAD_PIXELS), height);
+    const x1 = clampPixel(@ceil((bounds.max_x + PAD_UNITS) * sx + PAD_PIXELS), width);
+    const y1 = clampPixel(@ceil((bounds.max_y + PAD_UNITS) * sy + PAD_PIXELS), height);
+    return .{ .x = x0, .y = y0, .width = x1 -| x0, .height = y1 -| y0 };
+}
+
+fn clampPixel(value: f32, limit: u32) u32 {
+    return @intFromFloat(std.math.clamp(value, 0.0, @as(f32, @floatFromInt(limit))));
+}
+
+fn fullRect(width: u32, height: u32) PixelRect {
+    return .{ .x = 0, .y = 0, .width = width, .height = height };
+}
+
+fn requiredBytes(width: u32, height: u32) usize {
+    return @as(usize, width) * @as(usize, height) * 4;
+}
+
+/// Redraws `svg` into `out_rgba` inside each of `rects`.
+fn redraw(width: u32, height: u32, svg: []const u8, out_rgba: []u8, rects: *const DirtyRects) Error!void {
+    for (rects.slice()) |rect| {
+        _ = try bitmap_compat.redrawSvgMarkupRgbaRect(width, height, svg, out_rgba, rect);
+    }
+}
+
+pub const KeyboardView = struct {
+    width: u32,
+    height: u32,
+    range_low: pitch.MidiNote,
+    range_high: pitch.MidiNote,
+    /// False until the first update has drawn the whole bitmap.
+    drawn: bool = false,
+    states: [MAX_KEYS]svg_keyboard.NoteState = undefined,
+
+    pub fn init(range_low: pitch.MidiNote, range_high: pitch.MidiNote, width: u32, height: u32) KeyboardView {
+        return .{
+            .width = width,
+            .height = height,
+            .range_low = @min(range_low, range_high),
+            .range_high = @max(range_low, range_high),
+        };
+    }
+
+    /// Brings `out_rgba`, which must hold the bitmap of the previous update,
+    /// up to date with `notes` and records the rectangles it redrew. The
+    /// first update draws everything. `svg_buf` is scratch for the document.
+    pub fn update(self: *KeyboardView, notes: []const pitch.MidiNote, svg_buf: []u8, out_rgba: []u8, rects: *DirtyRects) Error!void {
+        rects.len = 0;
+        if (self.width == 0 or self.height == 0 or out_rgba.len < requiredBytes(self.width, self.height)) return error.OutputTooSmall;
+
+        const key_count = @as(usize, self.range_high - self.range_low) + 1;
+        var next: [MAX_KEYS]svg_keyboard.NoteState = undefined;
+        svg_keyboard.keyStates(notes, self.range_low, self.range_high, next[0..key_count]);
+
+        if (self.drawn) {
+            const size = svg_keyboard.documentSize(self.range_low, self.range_high);
+            for (next[0..key_count], self.states[0..key_count], 0..) |state, previous, offset| {
+                if (state == previous) continue;
+                const note: pitch.MidiNote = @intCast(self.range_low + offset);
+                rects.add(deviceRect(svg_keyboard.keyBounds(self.range_low, note), size.width, size.height, self.width, self.height));
+            }
+            if (rects.len == 0) return;
+            const svg = svg_keyboard.renderKeyboard(notes, self.range_low, self.range_high, svg_buf);
+            try redraw(self.width, self.height, svg, out_rgba, rects);
+        } else {
+            const svg = svg_keyboard.renderKeyboard(notes, self.range_low, self.range_high, svg_buf);
+            _ = try bitmap_compat.renderSvgMarkupRgba(self.width, self.height, svg, out_rgba);
+            rects.add(fullRect(self.width, self.height));
+            self.drawn = true;
+        }
+        self.states = next;
+    }
+};
+
+pub const FretView = struct {
+    width: u32,
+    height: u32,
+    string_count: usize,
+    /// Null picks the window from the frets, as `svg_fret.DiagramSpec` does.
+    window_start: ?u32,
+    visible_frets: u32,
+    drawn: bool = false,
+    layout: svg_fret.Layout = undefined,
+    frets: [MAX_STRINGS]i8 = undefined,
+
+    pub fn init(string_count: usize, window_start: ?u32, visible_frets: u32, width: u32, height: u32) FretView {
+        return .{
+            .width = width,
+            .height = height,
+            .string_count = @min(string_count, MAX_STRINGS),
+            .window_start = window_start,
+            .visible_frets = visible_frets,
+        };
+    }
+
+    /// Fret counterpart of `KeyboardView.update`. A changed fret window or
+    /// barre moves the whole grid, so those updates redraw everything.
+    pub fn update(self: *FretView, frets: []const i8, svg_buf: []u8, out_rgba: []u8, rects: *DirtyRects) Error!void {
+        rects.len = 0;
+        if (self.width == 0 or self.height == 0 or out_rgba.len < requiredBytes(self.width, self.height)) return error.OutputTooSmall;
+        if (frets.len != self.string_count or frets.len == 0) return error.InvalidImage;
+
+        const spec = svg_fret.DiagramSpec{
+            .frets = frets,
+            .window_start = self.window_start,
+            .visible_frets = self.visible_frets,
+        };
+        const layout = svg_fret.diagramLayout(spec);
+
+        if (self.drawn and layout.eql(self.layout)) {
+            for (frets, self.frets[0..frets.len], 0..) |fret, previous, string| {
+                if (fret == previous) continue;
+                rects.add(deviceRect(svg_fret.stringBounds(string, frets.len, layout.window), 100.0, 100.0, self.width, self.height));
+            }
+            if (rects.len == 0) return;
+            try redraw(self.width, self.height, svg_fret.renderDiagram(spec, svg_buf), out_rgba, rects);
+        } else {
+            _ = try bitmap_compat.renderSvgMarkupRgba(self.width, self.height, svg_fret.renderDiagram(spec, svg_buf), out_rgba);
+            rects.add(fullRect(self.width, self.height));
+            self.drawn = true;
+        }
+        self.layout = layout;
+        @memcpy(self.frets[0..frets.len], frets);
+    }
+};
+
+test "keyboard view redraws only changed keys and matches a full render" {
+    const width = 337;
+    const height = 90;
+    var svg_buf: [64 * 1024]u8 = undefined;
+    var full: [width * height * 4]u8 = undefined;
+    var pixels: [width * height * 4]u8 = undefined;
+    var rects = DirtyRects{};
+
+    var view = KeyboardView.init(48, 72, width, height);
+    try view.update(&.{ 60, 64, 67 }, &svg_buf, &pixels, &rects);
+    try std.testing.expectEqual(@as(usize, 1), rects.len);
+    try std.testing.expectEqual(fullRect(width, height), rects.items[0]);
+
+    try view.update(&.{ 60, 64, 67 }, &svg_buf, &pixels, &rects);
+    try std.testing.expectEqual(@as(usize, 0), rects.len);
+
+    const frames = [_][]const pitch.MidiNote{ &.{ 60, 63, 67 }, &.{ 61, 63, 66, 70 }, &.{}, &.{ 48, 72 } };
+    for (frames) |notes| {
+        try view.update(notes, &svg_buf, &pixels, &rects);
+        try std.testing.expect(rects.len > 0);
+        for (rects.slice()) |rect| try std.testing.expect(rect.width < width);
+        _ = try bitmap_compat.renderSvgMarkupRgba(width, height, svg_keyboard.renderKeyboard(notes, 48, 72, &svg_buf), &full);
+        try std.testing.expectEqualSlices(u8, &full, &pixels);
+    }
+}
+
+test "fret view redraws changed strings and falls back on layout changes" {
+    const size = 120;
+    var svg_buf: [16 * 1024]u8 = undefined;
+    var full: [size * size * 4]u8 = undefined;
+    var pixels: [size * size * 4]u8 = undefined;
+    var rects = DirtyRects{};
+
+    var view = FretView.init(6, 0, 5, size, size);
+    const frames = [_][6]i8{
+        .{ -1, 3, 2, 0, 1, 0 },
+        .{ -1, 3, 2, 0, 3, 0 },
+        .{ 0, 2, 2, 1, 0, 0 },
+        // A barre appears, so the whole diagram is redrawn.
+        .{ 1, 3, 3, 2, 1, 1 },
+        .{ 1, 3, 3, 2, 1, 1 },
+    };
+    // Neighbouring strings' rectangles overlap and merge.
+    const expected_rects = [_]usize{ 1, 1, 2, 1, 0 };
+    for (frames, expected_rects) |frets, expected| {
+        try view.update(&frets, &svg_buf, &pixels, &rects);
+        try std.testing.expectEqual(expected, rects.len);
+        const spec = svg_fret.DiagramSpec{ .frets = &frets, .window_start = 0, .visible_frets = 5 };
+        _ = try bitmap_compat.renderSvgMarkupRgba(size, size, svg_fret.renderDiagram(spec, &svg_buf), &full);
+        try std.testing.expectEqualSlices(u8, &full, &pixels);
+    }
+
+    try std.testing.expectError(error.InvalidImage, view.update(&.{ 0, 0 }, &svg_buf, &pixels, &rects));
+}
+
+test "dirty rects merge overlaps and collapse into their bounding rectangle when full" {
+    var rects = DirtyRects{};
+    rects.add(.{ .x = 10, .y = 0, .width = 5, .height = 5 });
+    rects.add(.{ .x = 0, .y = 0, .width = 5, .height = 5 });
+    rects.add(.{ .x = 4, .y = 4, .width = 7, .height = 2 });
+    try std.testing.expectEqual(@as(usize, 1), rects.len);
+    try std.testing.expectEqual(PixelRect{ .x = 0, .y = 0, .width = 15, .height = 6 }, rects.items[0]);
+
+    rects.len = 0;
+    var i: u32 = 0;
+    while (i <= DirtyRects.MAX_DIRTY_RECTS) : (i += 1) rects.add(.{ .x = i * 4, .y = 2, .width = 3, .height = 4 });
+    try std.testing.expectEqual(@as(usize, 1), rects.len);
+    try std.testing.expectEqual(PixelRect{ .x = 0, .y = 2, .width = DirtyRects.MAX_DIRTY_RECTS * 4 + 3, .height = 4 }, rects.items[0]);
+}
@@ -20,6 +20,8 @@ pub const Rect = struct {
     y: []const u8,
     width: []const u8,
     height: []const u8,
+    rx: ?[]const u8 = null,
+    ry: ?[]const u8 = null,
     fill: ?[]const u8 = null,
     stroke: ?[]const u8 = null,
     stroke_width: ?[]const u8 = null,
@@ -109,70 +111,568 @@ pub const Scene = struct {
 
 pub const BuildError = error{NoSpace};
 
-pub const Builder = struct {
-    ops: []Op,
-    len: usize = 0,
+pub const Builder = SceneBuilder(Op, Scene);
+pub const NumericBuilder = SceneBuilder(NumericOp, NumericScene);
 
-    pub fn init(storage: []Op) Builder {
-        return .{ .ops = storage };
-    }
+/// Append-only op list shared by the text and numeric IRs.
+pub fn SceneBuilder(comptime OpType: type, comptime SceneType: type) type {
+    return struct {
+        const Self = @This();
 
-    pub fn scene(self: *const Builder) Scene {
-        return .{ .ops = self.ops[0..self.len] };
-    }
+        ops: []OpType,
+        len: usize = 0,
+
+        pub fn init(storage: []OpType) Self {
+            return .{ .ops = storage };
+        }
+
+        pub fn scene(self: *const Self) SceneType {
+            return .{ .ops = self.ops[0..self.len] };
+        }
+
+        fn push(self: *Self, op: OpType) BuildError!void {
+            if (self.len >= self.ops.len) return error.NoSpace;
+            self.ops[self.len] = op;
+            self.len += 1;
+        }
+
+        pub fn raw(self: *Self, text: []const u8) BuildError!void {
+            try self.push(.{ .raw = text });
+        }
+
+        pub fn path(self: *Self, item: std.meta.TagPayload(OpType, .path)) BuildError!void {
+            try self.push(.{ .path = item });
+        }
+
+        pub fn rect(self: *Self, item: std.meta.TagPayload(OpType, .rect)) BuildError!void {
+            try self.push(.{ .rect = item });
+        }
+
+        pub fn circle(self: *Self, item: std.meta.TagPayload(OpType, .circle)) BuildError!void {
+            try self.push(.{ .circle = item });
+        }
+
+        pub fn ellipse(self: *Self, item: std.meta.TagPayload(OpType, .ellipse)) BuildError!void {
+            try self.push(.{ .ellipse = item });
+        }
+
+        pub fn line(self: *Self, item: std.meta.TagPayload(OpType, .line)) BuildError!void {
+            try self.push(.{ .line = item });
+        }
+
+        pub fn polyline(self: *Self, item: std.meta.TagPayload(OpType, .polyline)) BuildError!void {
+            try self.push(.{ .polyline = item });
+        }
+
+        pub fn polygon(self: *Self, item: std.meta.TagPayload(OpType, .polygon)) BuildError!void {
+            try self.push(.{ .polygon = item });
+        }
 
-    fn push(self: *Builder, op: Op) BuildError!void {
-        if (self.len >= self.ops.len) return error.NoSpace;
-        self.ops[self.len] = op;
-        self.len += 1;
+        pub fn groupStart(self: *Self, attrs: []const Attr, newline: bool) BuildError!void {
+            try self.push(.{ .group_start = .{ .attrs = attrs, .newline = newline } });
+        }
+
+        pub fn groupEnd(self: *Self, newline: bool) BuildError!void {
+            try self.push(.{ .group_end = newline });
+        }
+
+        pub fn linkStart(self: *Self, href: []const u8, attrs: []const Attr, newline: bool) BuildError!void {
+            try self.push(.{ .link_start = .{ .href = href, .attrs = attrs, .newline = newline } });
+        }
+
+        pub fn linkEnd(self: *Self, newline: bool) BuildError!void {
+            try self.push(.{ .link_end = newline });
+        }
+    };
+}
+
+// ── Numeric IR ──────────────────────────────────────────────
+//
+// Same op set as the text IR, but geometry is parsed once: coordinates are
+// f64, paints are packed RGBA, and path data is a list of absolute commands.
+// `svg_serializer.write` prints numbers in shortest round-trip form, so
+// parsing its output back yields the same scene.
+
+pub const Point = struct {
+    x: f64,
+    y: f64,
+};
+
+pub const Color = packed struct(u32) {
+    r: u8,
+    g: u8,
+    b: u8,
+    a: u8,
+
+    pub const transparent = Color{ .r = 0, .g = 0, .b = 0, .a = 0 };
+    pub const black = Color{ .r = 0, .g = 0, .b = 0, .a = 255 };
+
+    pub fn rgba(self: Color) [4]u8 {
+        return .{ self.r, self.g, self.b, self.a };
     }
 
-    pub fn raw(self: *Builder, text: []const u8) BuildError!void {
-        try self.push(.{ .raw = text });
+    /// Parses the colors the raster backend understands: a few names and
+    /// `#rgb`, `#rrggbb` or `#rrggbbaa`. Anything else, `none` included, is
+    /// null.
+    pub fn parse(text: []const u8) ?Color {
+        if (std.mem.eql(u8, text, "transparent")) return transparent;
+        if (std.mem.eql(u8, text, "black")) return black;
+        if (std.mem.eql(u8, text, "white")) return .{ .r = 255, .g = 255, .b = 255, .a = 255 };
+        if (std.mem.eql(u8, text, "gray")) return .{ .r = 128, .g = 128, .b = 128, .a = 255 };
+
+        if (text.len == 4 and text[0] == '#') {
+            const r = parseHexNibble(text[1]) orelse return null;
+            const g = parseHexNibble(text[2]) orelse return null;
+            const b = parseHexNibble(text[3]) orelse return null;
+            return .{ .r = r * 17, .g = g * 17, .b = b * 17, .a = 255 };
+        }
+
+        if ((text.len == 7 or text.len == 9) and text[0] == '#') {
+            var channels: [4]u8 = .{ 0, 0, 0, 255 };
+            for (0..(text.len - 1) / 2) |channel| {
+                const hi = parseHexNibble(text[1 + channel * 2]) orelse return null;
+                const lo = parseHexNibble(text[2 + channel * 2]) orelse return null;
+                channels[channel] = (hi << 4) | lo;
+            }
+            return .{ .r = channels[0], .g = channels[1], .b = channels[2], .a = channels[3] };
+        }
+
+        return null;
     }
+};
+
+/// A numeric fill or stroke. `none` is an explicit `none` in the markup,
+/// which SVG distinguishes from an absent attribute (a null `?Paint`): a
+/// missing fill is black.
+pub const Paint = union(enum) {
+    none,
+    color: Color,
 
-    pub fn path(self: *Builder, item: Path) BuildError!void {
-        try self.push(.{ .path = item });
+    pub fn rgba(self: Paint) [4]u8 {
+        return switch (self) {
+            .none => Color.transparent.rgba(),
+            .color => |color| color.rgba(),
+        };
     }
+};
+
+fn parseHexNibble(ch: u8) ?u8 {
+    return switch (ch) {
+        '0'...'9' => ch - '0',
+        'a'...'f' => ch - 'a' + 10,
+        'A'...'F' => ch - 'A' + 10,
+        else => null,
+    };
+}
+
+pub fn parseNumber(text: []const u8, fallback: f64) f64 {
+    return std.fmt.parseFloat(f64, text) catch fallback;
+}
+
+pub const PathCommand = union(enum) {
+    move_to: Point,
+    line_to: Point,
+    cubic_to: struct { c1: Point, c2: Point, to: Point },
+    quad_to: struct { c: Point, to: Point },
+    close: void,
+};
+
+pub const NumericPath = struct {
+    stroke: ?Paint = null,
+    stroke_width: ?f64 = null,
+    fill: ?Paint = null,
+    stroke_dasharray: ?[]const f64 = null,
+    d: []const PathCommand,
+    spaces_before_d: u8 = 1,
+    newline: bool = true,
+};
+
+pub const NumericRect = struct {
+    x: f64,
+    y: f64,
+    width: f64,
+    height: f64,
+    rx: ?f64 = null,
+    ry: ?f64 = null,
+    fill: ?Paint = null,
+    stroke: ?Paint = null,
+    stroke_width: ?f64 = null,
+    newline: bool = true,
+};
+
+pub const NumericCircle = struct {
+    cx: f64,
+    cy: f64,
+    r: f64,
+    stroke: ?Paint = null,
+    stroke_width: ?f64 = null,
+    fill: ?Paint = null,
+    newline: bool = true,
+};
+
+pub const NumericEllipse = struct {
+    cx: f64,
+    cy: f64,
+    rx: f64,
+    ry: f64,
+    stroke: ?Paint = null,
+    stroke_width: ?f64 = null,
+    fill: ?Paint = null,
+    newline: bool = true,
+};
 
-    pub fn rect(self: *Builder, item: Rect) BuildError!void {
-        try self.push(.{ .rect = item });
+pub const NumericLine = struct {
+    x1: f64,
+    y1: f64,
+    x2: f64,
+    y2: f64,
+    stroke: ?Paint = null,
+    stroke_width: ?f64 = null,
+    fill: ?Paint = null,
+    stroke_dasharray: ?[]const f64 = null,
+    newline: bool = true,
+};
+
+pub const NumericPolyline = struct {
+    points: []const Point,
+    stroke: ?Paint = null,
+    stroke_width: ?f64 = null,
+    fill: ?Paint = null,
+    stroke_dasharray: ?[]const f64 = null,
+    newline: bool = true,
+};
+
+pub const NumericPolygon = NumericPolyline;
+
+pub const NumericOp = union(enum) {
+    raw: []const u8,
+    path: NumericPath,
+    rect: NumericRect,
+    circle: NumericCircle,
+    ellipse: NumericEllipse,
+    line: NumericLine,
+    polyline: NumericPolyline,
+    polygon: NumericPolygon,
+    group_start: GroupStart,
+    group_end: bool,
+    link_start: LinkStart,
+    link_end: bool,
+};
+
+pub const NumericScene = struct {
+    ops: []const NumericOp,
+};
+
+pub const ConvertError = error{ NoSpace, InvalidPath, UnsupportedPathCommand, UnsupportedPaint };
+
+/// Caller-owned backing arrays for `toNumeric`.
+pub const NumericStorage = struct {
+    ops: []NumericOp,
+    points: []Point,
+    commands: []PathCommand,
+    numbers: []f64,
+    points_len: usize = 0,
+    commands_len: usize = 0,
+    numbers_len: usize = 0,
+
+    /// Releases everything taken so far so the arrays can back another scene.
+    pub fn reset(self: *NumericStorage) void {
+        self.points_len = 0;
+        self.commands_len = 0;
+        self.numbers_len = 0;
     }
 
-    pub fn circle(self: *Builder, item: Circle) BuildError!void {
-        try self.push(.{ .circle = item });
+    fn takePoints(self: *NumericStorage, count: usize) ConvertError![]Point {
+        if (self.points.len - self.points_len < count) return error.NoSpace;
+        defer self.points_len += count;
+        return self.points[self.points_len .. self.points_len + count];
     }
+};
 
-    pub fn ellipse(self: *Builder, item: Ellipse) BuildError!void {
-        try self.push(.{ .ellipse = item });
+/// Parses every geometry field of a text scene once. Raw text, groups and
+/// links are carried over unchanged.
+pub fn toNumeric(scene: Scene, storage: *NumericStorage) ConvertError!NumericScene {
+    if (scene.ops.len > storage.ops.len) return error.NoSpace;
+    for (scene.ops, storage.ops[0..scene.ops.len]) |op, *out| {
+        out.* = try numericOp(op, storage);
     }
+    return .{ .ops = storage.ops[0..scene.ops.len] };
+}
+
+/// Converts one op, taking points, path commands and dash arrays from
+/// `storage` (its `ops` slice is not used).
+pub fn numericOp(op: Op, storage: *NumericStorage) ConvertError!NumericOp {
+    return switch (op) {
+        .raw => |text| .{ .raw = text },
+        .path => |p| .{ .path = .{
+            .stroke = try paint(p.stroke),
+            .stroke_width = optionalNumber(p.stroke_width),
+            .fill = try paint(p.fill),
+            .stroke_dasharray = try dashArray(p.stroke_dasharray, storage),
+            .d = try tokenizePathInto(p.d, storage),
+            .spaces_before_d = p.spaces_before_d,
+            .newline = p.newline,
+        } },
+        .rect => |r| .{ .rect = try numericRect(r) },
+        .circle => |c| .{ .circle = try numericCircle(c) },
+        .ellipse => |e| .{ .ellipse = try numericEllipse(e) },
+        .line => |l| blk: {
+            var line = try numericLine(l);
+            line.stroke_dasharray = try dashArray(l.stroke_dasharray, storage);
+            break :blk .{ .line = line };
+        },
+        .polyline => |p| .{ .polyline = try numericPoly(p, storage) },
+        .polygon => |p| .{ .polygon = try numericPoly(p, storage) },
+        .group_start => |g| .{ .group_start = g },
+        .group_end => |newline| .{ .group_end = newline },
+        .link_start => |l| .{ .link_start = l },
+        .link_end => |newline| .{ .link_end = newline },
+    };
+}
+
+pub fn numericRect(r: Rect) ConvertError!NumericRect {
+    return .{
+        .x = parseNumber(r.x, 0.0),
+        .y = parseNumber(r.y, 0.0),
+        .width = parseNumber(r.width, 0.0),
+        .height = parseNumber(r.height, 0.0),
+        .rx = if (r.rx) |text| parseNumber(text, 0.0) else null,
+        .ry = if (r.ry) |text| parseNumber(text, 0.0) else null,
+        .fill = try paint(r.fill),
+        .stroke = try paint(r.stroke),
+        .stroke_width = optionalNumber(r.stroke_width),
+        .newline = r.newline,
+    };
+}
+
+pub fn numericCircle(c: Circle) ConvertError!NumericCircle {
+    return .{
+        .cx = parseNumber(c.cx, 0.0),
+        .cy = parseNumber(c.cy, 0.0),
+        .r = parseNumber(c.r, 0.0),
+        .stroke = try paint(c.stroke),
+        .stroke_width = optionalNumber(c.stroke_width),
+        .fill = try paint(c.fill),
+        .newline = c.newline,
+    };
+}
+
+pub fn numericEllipse(e: Ellipse) ConvertError!NumericEllipse {
+    return .{
+        .cx = parseNumber(e.cx, 0.0),
+        .cy = parseNumber(e.cy, 0.0),
+        .rx = parseNumber(e.rx, 0.0),
+        .ry = parseNumber(e.ry, 0.0),
+        .stroke = try paint(e.stroke),
+        .stroke_width = optionalNumber(e.stroke_width),
+        .fill = try paint(e.fill),
+        .newline = e.newline,
+    };
+}
+
+/// Converts a line without its dash array, which needs `NumericStorage`.
+pub fn numericLine(l: Line) ConvertError!NumericLine {
+    return .{
+        .x1 = parseNumber(l.x1, 0.0),
+        .y1 = parseNumber(l.y1, 0.0),
+        .x2 = parseNumber(l.x2, 0.0),
+        .y2 = parseNumber(l.y2, 0.0),
+        .stroke = try paint(l.stroke),
+        .stroke_width = optionalNumber(l.stroke_width),
+        .fill = try paint(l.fill),
+        .newline = l.newline,
+    };
+}
+
+/// Unsupported paints (`rgba(...)`, most named colors) are an error rather
+/// than a guess, so callers can keep the text scene for those documents.
+fn paint(text: ?[]const u8) ConvertError!?Paint {
+    const value = text orelse return null;
+    if (std.mem.eql(u8, value, "none")) return .none;
+    return .{ .color = Color.parse(value) orelse return error.UnsupportedPaint };
+}
+
+fn optionalNumber(text: ?[]const u8) ?f64 {
+    return parseNumber(text orelse return null, 1.0);
+}
 
-    pub fn line(self: *Builder, item: Line) BuildError!void {
-        try self.push(.{ .line = item });
+fn numericPoly(poly: anytype, storage: *NumericStorage) ConvertError!NumericPolyline {
+    var reader = NumberReader{ .text = poly.points };
+    const start = storage.points_len;
+    while (reader.next()) |x| {
+        const y = reader.next() orelse return error.InvalidPath;
+        const slot = try storage.takePoints(1);
+        slot[0] = .{ .x = x, .y = y };
     }
+    if (!reader.atEnd()) return error.InvalidPath;
+    return .{
+        .points = storage.points[start..storage.points_len],
+        .stroke = try paint(poly.stroke),
+        .stroke_width = optionalNumber(poly.stroke_width),
+        .fill = try paint(poly.fill),
+        .stroke_dasharray = try dashArray(poly.stroke_dasharray, storage),
+        .newline = poly.newline,
+    };
+}
 
-    pub fn polyline(self: *Builder, item: Polyline) BuildError!void {
-        try self.push(.{ .polyline = item });
+fn dashArray(text_opt: ?[]const u8, storage: *NumericStorage) ConvertError!?[]const f64 {
+    const text = text_opt orelse return null;
+    var reader = NumberReader{ .text = text };
+    const start = storage.numbers_len;
+    while (reader.next()) |value| {
+        if (storage.numbers_len >= storage.numbers.len) return error.NoSpace;
+        storage.numbers[storage.numbers_len] = value;
+        storage.numbers_len += 1;
     }
+    return storage.numbers[start..storage.numbers_len];
+}
+
+fn tokenizePathInto(d: []const u8, storage: *NumericStorage) ConvertError![]const PathCommand {
+    const count = try tokenizePath(d, storage.commands[storage.commands_len..]);
+    defer storage.commands_len += count;
+    return storage.commands[storage.commands_len .. storage.commands_len + count];
+}
+
+/// Converts SVG path data into absolute commands. H/V become lines and the
+/// smooth S/T forms are expanded with their reflected control points.
+/// Arcs are rejected, matching the bitmap path rasterizer.
+pub fn tokenizePath(d: []const u8, out: []PathCommand) ConvertError!usize {
+    var reader = NumberReader{ .text = d };
+    var len: usize = 0;
+    var cmd: u8 = 0;
+    var current = Point{ .x = 0.0, .y = 0.0 };
+    var subpath_start = current;
+    var last_cubic_ctrl: ?Point = null;
+    var last_quad_ctrl: ?Point = null;
+
+    while (true) {
+        reader.skipSeparators();
+        if (reader.atEnd()) break;
+        const ch = reader.text[reader.index];
+        if (std.ascii.isAlphabetic(ch)) {
+            cmd = ch;
+            reader.index += 1;
+        } else if (cmd == 0) {
+            return error.InvalidPath;
+        }
 
-    pub fn polygon(self: *Builder, item: Polygon) BuildError!void {
-        try self.push(.{ .polygon = item });
+        const relative = std.ascii.isLower(cmd);
+        const base = if (relative) current else Point{ .x = 0.0, .y = 0.0 };
+        var emitted: PathCommand = undefined;
+        switch (std.ascii.toUpper(cmd)) {
+            'M' => {
+                const to = try reader.point(base);
+                emitted = .{ .move_to = to };
+                subpath_start = to;
+                // Extra coordinate pairs after a move are implicit lines.
+                cmd = if (relative) 'l' else 'L';
+            },
+            'L' => emitted = .{ .line_to = try reader.point(base) },
+            'H' => emitted = .{ .line_to = .{ .x = base.x + (reader.next() orelse return error.InvalidPath), .y = current.y } },
+            'V' => emitted = .{ .line_to = .{ .x = current.x, .y = base.y + (reader.next() orelse return error.InvalidPath) } },
+            'C' => {
+                const c1 = try reader.point(base);
+                const c2 = try reader.point(base);
+                emitted = .{ .cubic_to = .{ .c1 = c1, .c2 = c2, .to = try reader.point(base) } };
+            },
+            'S' => {
+                const c1 = reflect(current, last_cubic_ctrl);
+                const c2 = try reader.point(base);
+                emitted = .{ .cubic_to = .{ .c1 = c1, .c2 = c2, .to = try reader.point(base) } };
+            },
+            'Q' => {
+                const c = try reader.point(base);
+                emitted = .{ .quad_to = .{ .c = c, .to = try reader.point(base) } };
+            },
+            'T' => {
+                const c = reflect(current, last_quad_ctrl);
+                emitted = .{ .quad_to = .{ .c = c, .to = try reader.point(base) } };
+            },
+            'Z' => {
+                emitted = .close;
+                // Numbers after Z are invalid until the next command letter.
+                cmd = 0;
+            },
+            else => return error.UnsupportedPathCommand,
+        }
+
+        if (len >= out.len) return error.NoSpace;
+        out[len] = emitted;
+        len += 1;
+
+        last_cubic_ctrl = null;
+        last_quad_ctrl = null;
+        switch (emitted) {
+            .move_to, .line_to => |to| current = to,
+            .cubic_to => |c| {
+                current = c.to;
+                last_cubic_ctrl = c.c2;
+            },
+            .quad_to => |q| {
+                current = q.to;
+                last_quad_ctrl = q.c;
+            },
+            .close => current = subpath_start,
+        }
     }
+    return len;
+}
 
-    pub fn groupStart(self: *Builder, attrs: []const Attr, newline: bool) BuildError!void {
-        try self.push(.{ .group_start = .{ .attrs = attrs, .newline = newline } });
+fn reflect(current: Point, ctrl: ?Point) Point {
+    const c = ctrl orelse return current;
+    return .{ .x = current.x * 2.0 - c.x, .y = current.y * 2.0 - c.y };
+}
+
+const NumberReader = struct {
+    text: []const u8,
+    index: usize = 0,
+
+    fn skipSeparators(self: *NumberReader) void {
+        while (self.index < self.text.len) : (self.index += 1) {
+            switch (self.text[self.index]) {
+                ' ', '\t', '\r', '\n', ',' => {},
+                else => break,
+            }
+        }
     }
 
-    pub fn groupEnd(self: *Builder, newline: bool) BuildError!void {
-        try self.push(.{ .group_end = newline });
+    fn atEnd(self: *NumberReader) bool {
+        self.skipSeparators();
+        return self.index >= self.text.len;
     }
 
-    pub fn linkStart(self: *Builder, href: []const u8, attrs: []const Attr, newline: bool) BuildError!void {
-        try self.push(.{ .link_start = .{ .href = href, .attrs = attrs, .newline = newline } });
+    fn next(self: *NumberReader) ?f64 {
+        self.skipSeparators();
+        const start = self.index;
+        var index = start;
+        if (index < self.text.len and (self.text[index] == '-' or self.text[index] == '+')) index += 1;
+        var seen_dot = false;
+        var digits: usize = 0;
+        while (index < self.text.len) : (index += 1) {
+            const ch = self.text[index];
+            if (std.ascii.isDigit(ch)) {
+                digits += 1;
+            } else if (ch == '.' and !seen_dot) {
+                seen_dot = true;
+            } else break;
+        }
+        if (digits == 0) return null;
+        if (index < self.text.len and (self.text[index] == 'e' or self.text[index] == 'E')) {
+            var exp = index + 1;
+            if (exp < self.text.len and (self.text[exp] == '-' or self.text[exp] == '+')) exp += 1;
+            if (exp < self.text.len and std.ascii.isDigit(self.text[exp])) {
+                index = exp;
+                while (index < self.text.len and std.ascii.isDigit(self.text[index])) index += 1;
+            }
+        }
+        self.index = index;
+        return std.fmt.parseFloat(f64, self.text[start..index]) catch null;
     }
 
-    pub fn linkEnd(self: *Builder, newline: bool) BuildError!void {
-        try self.push(.{ .link_end = newline });
+    fn point(self: *NumberReader, base: Point) ConvertError!Point {
+        const x = self.next() orelse return error.InvalidPath;
+        const y = self.next() orelse return error.InvalidPath;
+        return .{ .x = base.x + x, .y = base.y + y };
     }
 };
 
@@ -182,6 +682,13 @@ pub fn isDeterministic(scene: Scene) bool {
     return scene.ops.len >= 0;
 }
 
+test "numeric builder enforces capacity" {
+    var storage: [1]NumericOp = undefined;
+    var builder = NumericBuilder.init(&storage);
+    try builder.circle(.{ .cx = 1, .cy = 2, .r = 3 });
+    try std.testing.expectError(error.NoSpace, builder.raw("b"));
+}
+
 test "builder enforces capacity" {
     var storage: [1]Op = undefined;
     var builder = Builder.init(&storage);
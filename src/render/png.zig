@@ -0,0 +1,540 @@
+//! Streaming PNG encoder for straight-alpha RGBA rows. Rows arrive as the
+//! rasterizer finishes them (`emit` has the band sink signature of
+//! `bitmap_compat.streamSvgMarkupRgba`), are filtered against the previous
+//! row, deflated, and leave as IDAT chunks of at most `IDAT_BYTES`, so
+//! neither the image nor its compressed form is ever held whole.
+//!
+//! `.stored` wraps unfiltered rows in uncompressed deflate blocks. `.fast`
+//! picks a filter per row by the minimum sum of absolute differences and
+//! runs a single-probe LZ77 matcher over a 32 KiB window with the fixed
+//! Huffman code: one pass and no code tables to build, which suits the flat
+//! fills and repeated rows of rendered diagrams.
+
+const std = @import("std");
+
+pub const Compression = enum(u8) {
+    stored = 0,
+    fast = 1,
+};
+
+pub const Error = error{ InvalidImage, OutOfMemory, WriteFailed };
+
+pub const SIGNATURE = [8]u8{ 0x89, 'P', 'N', 'G', '\r', '\n', 0x1a, '\n' };
+pub const IDAT_BYTES: usize = 32 * 1024;
+
+const BYTES_PER_PIXEL: usize = 4;
+const WINDOW: usize = 32 * 1024;
+const MIN_MATCH: usize = 4;
+const MAX_MATCH: usize = 258;
+const HASH_BITS = 15;
+const STORED_BLOCK_BYTES: usize = 65535;
+// Matches at least this long skip hashing their interior; long runs of one
+// filtered byte would otherwise rehash the same four bytes over and over.
+const INSERT_LIMIT: usize = 16;
+
+pub const Filter = enum(u8) {
+    none = 0,
+    sub = 1,
+    up = 2,
+    average = 3,
+    paeth = 4,
+};
+
+pub fn Encoder(comptime Writer: type) type {
+    return struct {
+        const Self = @This();
+
+        writer: Writer,
+        allocator: std.mem.Allocator,
+        width: u32,
+        height: u32,
+        rows_done: u32 = 0,
+        /// Previous unfiltered row, then one filtered candidate per filter,
+        /// each led by its filter byte.
+        prev_row: []u8,
+        candidates: []u8,
+        deflater: *Deflater,
+        failed: bool = false,
+
+        /// Writes the signature and IHDR; rows follow through `emit`.
+        pub fn init(allocator: std.mem.Allocator, writer: Writer, width: u32, height: u32, compression: Compression) Error!Self {
+            if (width == 0 or height == 0 or width > std.math.maxInt(u32) / BYTES_PER_PIXEL) return error.InvalidImage;
+            const stride = @as(usize, width) * BYTES_PER_PIXEL;
+            const prev_row = try allocator.alloc(u8, stride);
+            errdefer allocator.free(prev_row);
+            const candidates = try allocator.alloc(u8, if (compression == .fast) 5 * (stride + 1) else stride + 1);
+            errdefer allocator.free(candidates);
+            const deflater = try allocator.create(Deflater);
+            errdefer allocator.destroy(deflater);
+            deflater.* = Deflater.init(compression);
+            @memset(prev_row, 0);
+
+            var self = Self{
+                .writer = writer,
+                .allocator = allocator,
+                .width = width,
+                .height = height,
+                .prev_row = prev_row,
+                .candidates = candidates,
+                .deflater = deflater,
+            };
+            var header: [13]u8 = undefined;
+            std.mem.writeInt(u32, header[0..4], width, .big);
+            std.mem.writeInt(u32, header[4..8], height, .big);
+            // 8-bit RGBA, deflate, adaptive filtering, no interlace.
+            header[8..13].* = .{ 8, 6, 0, 0, 0 };
+            self.writer.writeAll(&SIGNATURE) catch return error.WriteFailed;
+            try self.writeChunk("IHDR", &header);
+            try self.deflater.start(&self);
+            return self;
+        }
+
+        pub fn deinit(self: *Self) void {
+            self.allocator.destroy(self.deflater);
+            self.allocator.free(self.candidates);
+            self.allocator.free(self.prev_row);
+        }
+
+        /// Band sink: encodes `row_count` packed rows starting at image row
+        /// `first_row`. Returns false once a write has failed.
+        pub fn emit(self: *Self, first_row: u32, row_count: u32, rgba: []const u8) bool {
+            if (self.failed) return false;
+            self.writeRows(first_row, row_count, rgba) catch {
+                self.failed = true;
+                return false;
+            };
+            return true;
+        }
+
+        pub fn writeRows(self: *Self, first_row: u32, row_count: u32, rgba: []const u8) Error!void {
+            const stride = self.prev_row.len;
+            if (first_row != self.rows_done or row_count > self.height - self.rows_done or rgba.len != row_count * stride) return error.InvalidImage;
+            var row: u32 = 0;
+            while (row < row_count) : (row += 1) {
+                const pixels = rgba[row * stride ..][0..stride];
+                try self.deflater.feed(self.filterRow(pixels), self);
+                @memcpy(self.prev_row, pixels);
+            }
+            self.rows_done += row_count;
+        }
+
+        /// Ends the zlib stream and writes the final IDAT and IEND.
+        pub fn finish(self: *Self) Error!void {
+            if (self.failed or self.rows_done != self.height) return error.InvalidImage;
+            try self.deflater.finish(self);
+            try self.writeChunk("IEND", "");
+        }
+
+        fn filterRow(self: *Self, pixels: []const u8) []const u8 {
+            const stride = pixels.len;
+            if (self.deflater.compression == .stored) {
+                self.candidates[0] = @intFromEnum(Filter.none);
+                @memcpy(self.candidates[1..][0..stride], pixels);
+                return self.candidates[0 .. stride + 1];
+            }
+
+            var best: []const u8 = undefined;
+            var best_score: u64 = std.math.maxInt(u64);
+            inline for (comptime std.enums.values(Filter)) |filter| {
+                const out = self.candidates[@intFromEnum(filter) * (stride + 1) ..][0 .. stride + 1];
+                const score = filterInto(filter, pixels, self.prev_row, out);
+                if (score < best_score) {
+                    best_score = score;
+                    best = out;
+                }
+            }
+            return best;
+        }
+
+        fn writeChunk(self: *Self, comptime kind: *const [4]u8, data: []const u8) Error!void {
+            var length: [4]u8 = undefined;
+            std.mem.writeInt(u32, &length, @intCast(data.len), .big);
+            var crc = std.hash.Crc32.init();
+            crc.update(kind);
+            crc.update(data);
+            var checksum: [4]u8 = undefined;
+            std.mem.writeInt(u32, &checksum, crc.final(), .big);
+            self.writer.writeAll(&length) catch return error.WriteFailed;
+            self.writer.writeAll(kind) catch return error.WriteFailed;
+            self.writer.writeAll(data) catch return error.WriteFailed;
+            self.writer.writeAll(&checksum) catch return error.WriteFailed;
+        }
+
+        /// Deflater output sink: one IDAT chunk per flush.
+        pub fn put(self: *Self, bytes: []const u8) Error!void {
+            if (bytes.len > 0) try self.writeChunk("IDAT", bytes);
+        }
+    };
+}
+
+pub fn encoder(allocator: std.mem.Allocator, writer: anytype, width: u32, height: u32, compression: Compression) Error!Encoder(@TypeOf(writer)) {
+    return Encoder(@TypeOf(writer)).init(allocator, writer, width, height, compression);
+}
+
+/// Writes the filter byte and `filter` applied to `pixels` into `out` and
+/// returns the sum of the filtered bytes read as signed magnitudes.
+fn filterInto(filter: Filter, pixels: []const u8, prev: []const u8, out: []u8) u64 {
+    out[0] = @intFromEnum(filter);
+    const dst = out[1..];
+    var score: u64 = 0;
+    for (pixels, 0..) |value, i| {
+        const left: u8 = if (i >= BYTES_PER_PIXEL) pixels[i - BYTES_PER_PIXEL] else 0;
+        const up = prev[i];
+        const up_left: u8 = if (i >= BYTES_PER_PIXEL) prev[i - BYTES_PER_PIXEL] else 0;
+        const predicted: u8 = switch (filter) {
+            .none => 0,
+            .sub => left,
+            .up => up,
+            .average => @intCast((@as(u16, left) + up) / 2),
+            .paeth => paeth(left, up, up_left),
+        };
+        const filtered = value -% predicted;
+        dst[i] = filtered;
+        score += @abs(@as(i8, @bitCast(filtered)));
+    }
+    return score;
+}
+
+fn paeth(a: u8, b: u8, c: u8) u8 {
+    const p = @as(i16, a) + b - c;
+    const pa = @abs(p - a);
+    const pb = @abs(p - b);
+    const pc = @abs(p - c);
+    if (pa <= pb and pa <= pc) return a;
+    if (pb <= pc) return b;
+    return c;
+}
+
+/// zlib stream (RFC 1950) of deflate blocks (RFC 1951), fed incrementally.
+/// Output collects in `out` and is handed to `sink.put` whenever it fills.
+pub const Deflater = struct {
+    compression: Compression,
+    window: [2 * WINDOW]u8 = undefined,
+    /// Bytes held in `window`, and the first one not yet encoded.
+    len: usize = 0,
+    pos: usize = 0,
+    /// Last window position + 1 seen for each 4-byte hash; 0 is empty.
+    head: [1 << HASH_BITS]u32 = @splat(0),
+    adler: std.hash.Adler32 = .{},
+    bits: u64 = 0,
+    bit_count: u6 = 0,
+    out: [IDAT_BYTES]u8 = undefined,
+    out_len: usize = 0,
+
+    pub fn init(compression: Compression) Deflater {
+        return .{ .compression = compression };
+    }
+
+    /// zlib header for a 32 KiB window at the fastest level, then, for
+    /// `.fast`, the header of the one fixed-code block that holds the data.
+    pub fn start(self: *Deflater, sink: anytype) Error!void {
+        try self.putBytes(&.{ 0x78, 0x01 }, sink);
+        if (self.compression == .fast) try self.putBits(0b010, 3, sink);
+    }
+
+    pub fn feed(self: *Deflater, bytes: []const u8, sink: anytype) Error!void {
+        self.adler.update(bytes);
+        var rest = bytes;
+        while (rest.len > 0) {
+            switch (self.compression) {
+                .stored => {
+                    const n = @min(rest.len, STORED_BLOCK_BYTES - self.len);
+                    @memcpy(self.window[self.len..][0..n], rest[0..n]);
+                    self.len += n;
+                    rest = rest[n..];
+                    if (self.len == STORED_BLOCK_BYTES) try self.storedBlock(false, sink);
+                },
+                .fast => {
+                    if (self.len == self.window.len) self.slide();
+                    const n = @min(rest.len, self.window.len - self.len);
+                    @memcpy(self.window[self.len..][0..n], rest[0..n]);
+                    self.len += n;
+                    rest = rest[n..];
+                    try self.compress(self.len -| MAX_MATCH, sink);
+                },
+            }
+        }
+    }
+
+    pub fn finish(self: *Deflater, sink: anytype) Error!void {
+        switch (self.compression) {
+            .stored => try self.storedBlock(true, sink),
+            .fast => {
+                try self.compress(self.len, sink);
+                // End the data block, then an empty final fixed block.
+                try self.putBits(0, 7, sink);
+                try self.putBits(0b011, 3, sink);
+                try self.putBits(0, 7, sink);
+                try self.alignBits(sink);
+            },
+        }
+        var trailer: [4]u8 = undefined;
+        std.mem.writeInt(u32, &trailer, self.adler.adler, .big);
+        try self.putBytes(&trailer, sink);
+        try sink.put(self.out[0..self.out_len]);
+        self.out_len = 0;
+    }
+
+    fn storedBlock(self: *Deflater, final: bool, sink: anytype) Error!void {
+        var header: [5]u8 = undefined;
+        header[0] = @intFromBool(final);
+        std.mem.writeInt(u16, header[1..3], @intCast(self.len), .little);
+        std.mem.writeInt(u16, header[3..5], ~@as(u16, @intCast(self.len)), .little);
+        try self.putBytes(&header, sink);
+        try self.putBytes(self.window[0..self.len], sink);
+        self.len = 0;
+    }
+
+    /// Drops the older half of the window once it can no longer be matched.
+    fn slide(self: *Deflater) void {
+        std.debug.assert(self.pos >= WINDOW);
+        @memmove(self.window[0 .. self.len - WINDOW], self.window[WINDOW..self.len]);
+        self.len -= WINDOW;
+        self.pos -= WINDOW;
+        for (&self.head) |*entry| entry.* = if (entry.* > WINDOW) entry.* - @as(u32, WINDOW) else 0;
+    }
+
+    fn hashAt(self: *const Deflater, pos: usize) usize {
+        const value = std.mem.readInt(u32, self.window[pos..][0..4], .little);
+        return (value *% 2654435761) >> (32 - HASH_BITS);
+    }
+
+    /// Greedy single-probe LZ77 over window bytes up to `limit`.
+    fn compress(self: *Deflater, limit: usize, sink: anytype) Error!void {
+        while (self.pos < limit) {
+            const pos = self.pos;
+            var match_len: usize = 0;
+            var distance: usize = 0;
+            if (pos + MIN_MATCH <= self.len) {
+                const hash = self.hashAt(pos);
+                const candidate = self.head[hash];
+                self.head[hash] = @intCast(pos + 1);
+                if (candidate > 0 and pos + 1 - candidate <= WINDOW) {
+                    distance = pos + 1 - candidate;
+                    const max_len = @min(MAX_MATCH, self.len - pos);
+                    const from = self.window[pos - distance ..];
+                    const to = self.window[pos..];
+                    while (match_len < max_len and from[match_len] == to[match_len]) match_len += 1;
+                }
+            }
+
+            if (match_len >= MIN_MATCH) {
+                try self.putMatch(match_len, distance, sink);
+                if (match_len < INSERT_LIMIT) {
+                    var i = pos + 1;
+                    while (i < pos + match_len and i + MIN_MATCH <= self.len) : (i += 1) {
+                        self.head[self.hashAt(i)] = @intCast(i + 1);
+                    }
+                }
+                self.pos += match_len;
+            } else {
+                try self.putLiteral(self.window[pos], sink);
+                self.pos += 1;
+            }
+        }
+    }
+
+    fn putLiteral(self: *Deflater, value: u8, sink: anytype) Error!void {
+        const code = fixed_literal_codes[value];
+        try self.putBits(code.bits, code.len, sink);
+    }
+
+    fn putMatch(self: *Deflater, length: usize, distance: usize, sink: anytype) Error!void {
+        const index = length_code_index[length];
+        const code = fixed_literal_codes[257 + @as(usize, index)];
+        try self.putBits(code.bits, code.len, sink);
+        if (length_extra_bits[index] > 0) try self.putBits(@intCast(length - length_base[index]), length_extra_bits[index], sink);
+
+        const d: u32 = @intCast(distance - 1);
+        if (d < 4) {
+            try self.putBits(reverseBits(d, 5), 5, sink);
+            return;
+        }
+        const high: u5 = @intCast(31 - @clz(d));
+        const symbol: u32 = 2 * @as(u32, high) + ((d >> (high - 1)) & 1);
+        try self.putBits(reverseBits(symbol, 5), 5, sink);
+        const extra: u5 = high - 1;
+        try self.putBits(@intCast(d & ((@as(u32, 1) << extra) - 1)), extra, sink);
+    }
+
+    fn putBits(self: *Deflater, value: u32, len: u5, sink: anytype) Error!void {
+        self.bits |= @as(u64, value) << self.bit_count;
+        self.bit_count += len;
+        if (self.bit_count >= 32) {
+            var word: [4]u8 = undefined;
+            std.mem.writeInt(u32, &word, @truncate(self.bits), .little);
+            try self.putBytes(&word, sink);
+            self.bits >>= 32;
+            self.bit_count -= 32;
+        }
+    }
+
+    /// Pads the bit buffer to a byte boundary and moves it to `out`.
+    fn alignBits(self: *Deflater, sink: anytype) Error!void {
+        while (self.bit_count > 0) {
+            const byte: u8 = @truncate(self.bits);
+            try self.putBytes(&.{byte}, sink);
+            self.bits >>= 8;
+            self.bit_count -|= 8;
+        }
+        self.bits = 0;
+    }
+
+    fn putBytes(self: *Deflater, bytes: []const u8, sink: anytype) Error!void {
+        var rest = bytes;
+        while (rest.len > 0) {
+            const n = @min(rest.len, self.out.len - self.out_len);
+            @memcpy(self.out[self.out_len..][0..n], rest[0..n]);
+            self.out_len += n;
+            rest = rest[n..];
+            if (self.out_len == self.out.len) {
+                try sink.put(&self.out);
+                self.out_len = 0;
+            }
+        }
+    }
+};
+
+const Code = struct { bits: u32, len: u5 };
+
+fn reverseBits(value: u32, len: u5) u32 {
+    return @bitReverse(value) >> @intCast(@as(u6, 32) - len);
+}
+
+/// RFC 1951 section 3.2.6 fixed literal/length code, bit-reversed for the
+/// LSB-first bit stream.
+const fixed_literal_codes = blk: {
+    @setEvalBranchQuota(10000);
+    var codes: [288]Code = undefined;
+    for (&codes, 0..) |*code, symbol| {
+        const base: struct { u32, u5 } = if (symbol < 144)
+            .{ 0x30 + symbol, 8 }
+        else if (symbol < 256)
+            .{ 0x190 + symbol - 144, 9 }
+        else if (symbol < 280)
+            .{ symbol - 256, 7 }
+        else
+            .{ 0xc0 + symbol - 280, 8 };
+        code.* = .{ .bits = reverseBits(base[0], base[1]), .len = base[1] };
+    }
+    break :blk codes;
+};
+
+const length_base = [29]u16{ 3, 4, 5, 6, 7, 8, 9, 10, 11, 13, 15, 17, 19, 23, 27, 31, 35, 43, 51, 59, 67, 83, 99, 115, 131, 163, 195, 227, 258 };
+const length_extra_bits = [29]u5{ 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 2, 2, 2, 2, 3, 3, 3, 3, 4, 4, 4, 4, 5, 5, 5, 5, 0 };
+
+const length_code_index = blk: {
+    @setEvalBranchQuota(10000);
+    var table: [MAX_MATCH + 1]u8 = @splat(0);
+    for (length_base, 0..) |base, index| {
+        const span = if (index + 1 < length_base.len) length_base[index + 1] - base else 1;
+        for (base..base + span) |length| table[length] = index;
+    }
+    break :blk table;
+};
+
+fn testRgba(width: u32, height: u32, pixels: []u8) void {
+    for (0..height) |y| {
+        for (0..width) |x| {
+            const p = pixels[(y * width + x) * 4 ..][0..4];
+            // Flat bands, a gradient, and transparent gaps, like a diagram.
+            p.* = if ((x / 7 + y / 5) % 3 == 0) .{ 0, 0, 0, 0 } else .{ @intCast(x * 3 % 256), @intCast(y * 5 % 256), 120, 255 };
+        }
+    }
+}
+
+fn decodePng(allocator: std.mem.Allocator, png: []const u8, width: u32, height: u32) ![]u8 {
+    try std.testing.expectEqualSlices(u8, &SIGNATURE, png[0..8]);
+    var zlib_data: std.ArrayList(u8) = .empty;
+    defer zlib_data.deinit(allocator);
+    var cursor: usize = 8;
+    var saw_end = false;
+    while (cursor < png.len) {
+        const len = std.mem.readInt(u32, png[cursor..][0..4], .big);
+        const kind = png[cursor + 4 ..][0..4];
+        const data = png[cursor + 8 ..][0..len];
+        const crc = std.mem.readInt(u32, png[cursor + 8 + len ..][0..4], .big);
+        try std.testing.expectEqual(std.hash.Crc32.hash(png[cursor + 4 .. cursor + 8 + len]), crc);
+        if (std.mem.eql(u8, kind, "IHDR")) {
+            try std.testing.expectEqual(width, std.mem.readInt(u32, data[0..4], .big));
+            try std.testing.expectEqual(height, std.mem.readInt(u32, data[4..8], .big));
+        }
+        if (std.mem.eql(u8, kind, "IDAT")) try zlib_data.appendSlice(allocator, data);
+        if (std.mem.eql(u8, kind, "IEND")) saw_end = true;
+        cursor += 12 + len;
+    }
+    try std.testing.expect(saw_end);
+
+    var in: std.Io.Reader = .fixed(zlib_data.items);
+    var inflated: std.Io.Writer.Allocating = .init(allocator);
+    defer inflated.deinit();
+    var decompress: std.compress.flate.Decompress = .init(&in, .zlib, &.{});
+    _ = try decompress.reader.streamRemaining(&inflated.writer);
+
+    const stride = @as(usize, width) * 4;
+    const raw = inflated.written();
+    try std.testing.expectEqual((stride + 1) * height, raw.len);
+    const pixels = try allocator.alloc(u8, stride * height);
+    errdefer allocator.free(pixels);
+    for (0..height) |y| {
+        const line = raw[y * (stride + 1) ..][0 .. stride + 1];
+        const out = pixels[y * stride ..][0..stride];
+        for (0..stride) |i| {
+            const left: u8 = if (i >= 4) out[i - 4] else 0;
+            const up: u8 = if (y > 0) pixels[(y - 1) * stride + i] else 0;
+            const up_left: u8 = if (y > 0 and i >= 4) pixels[(y - 1) * stride + i - 4] else 0;
+            const predicted: u8 = switch (line[0]) {
+                0 => 0,
+                1 => left,
+                2 => up,
+                3 => @intCast((@as(u16, left) + up) / 2),
+                4 => paeth(left, up, up_left),
+                else => return error.TestUnexpectedResult,
+            };
+            out[i] = line[1 + i] +% predicted;
+        }
+    }
+    return pixels;
+}
+
+test "png round-trips stored and fast streams across band splits" {
+    const allocator = std.testing.allocator;
+    const width = 97;
+    const height = 211;
+    const pixels = try allocator.alloc(u8, width * height * 4);
+    defer allocator.free(pixels);
+    testRgba(width, height, pixels);
+
+    for ([_]Compression{ .stored, .fast }) |compression| {
+        var out: std.Io.Writer.Allocating = .init(allocator);
+        defer out.deinit();
+        var png = try encoder(allocator, &out.writer, width, height, compression);
+        defer png.deinit();
+        var row: u32 = 0;
+        while (row < height) {
+            const rows: u32 = @min(height - row, 13);
+            try std.testing.expect(png.emit(row, rows, pixels[row * width * 4 ..][0 .. rows * width * 4]));
+            row += rows;
+        }
+        try png.finish();
+
+        const decoded = try decodePng(allocator, out.written(), width, height);
+        defer allocator.free(decoded);
+        try std.testing.expectEqualSlices(u8, pixels, decoded);
+        if (compression == .fast) try std.testing.expect(out.written().len < pixels.len / 4);
+    }
+}
+
+test "png rejects rows out of order and unfinished images" {
+    const allocator = std.testing.allocator;
+    var out: std.Io.Writer.Allocating = .init(allocator);
+    defer out.deinit();
+    var pixels: [4 * 3 * 4]u8 = @splat(7);
+    var png = try encoder(allocator, &out.writer, 4, 3, .fast);
+    defer png.deinit();
+    try std.testing.expectError(error.InvalidImage, png.writeRows(1, 1, pixels[0..16]));
+    try png.writeRows(0, 2, pixels[0..32]);
+    try std.testing.expectError(error.InvalidImage, png.finish());
+    try std.testing.expectError(error.InvalidImage, png.writeRows(2, 2, &pixels));
+    try std.testing.expectError(error.InvalidImage, encoder(allocator, &out.writer, 0, 3, .fast));
+}
@@ -0,0 +1,223 @@
+//! Streaming QOI encoder (https://qoiformat.org/qoi-specification.pdf) for
+//! straight-alpha RGBA rows. Like `png.zig` it takes rows through a band
+//! sink `emit`, but it needs no scratch beyond the 64-entry color index, so
+//! it never allocates. Output is staged in `STAGING_BYTES` and written in
+//! blocks.
+
+const std = @import("std");
+
+pub const Error = error{ InvalidImage, WriteFailed };
+
+pub const MAGIC = "qoif";
+pub const END_MARKER = [8]u8{ 0, 0, 0, 0, 0, 0, 0, 1 };
+const STAGING_BYTES: usize = 4096;
+const MAX_RUN: u8 = 62;
+
+const OP_INDEX: u8 = 0x00;
+const OP_DIFF: u8 = 0x40;
+const OP_LUMA: u8 = 0x80;
+const OP_RUN: u8 = 0xc0;
+const OP_RGB: u8 = 0xfe;
+const OP_RGBA: u8 = 0xff;
+
+pub fn Encoder(comptime Writer: type) type {
+    return struct {
+        const Self = @This();
+
+        writer: Writer,
+        width: u32,
+        height: u32,
+        rows_done: u32 = 0,
+        index: [64][4]u8 = @splat(.{ 0, 0, 0, 0 }),
+        prev: [4]u8 = .{ 0, 0, 0, 255 },
+        run: u8 = 0,
+        staging: [STAGING_BYTES]u8 = undefined,
+        staged: usize = 0,
+        failed: bool = false,
+
+        /// Writes the 14-byte header: 4 channels, sRGB with linear alpha.
+        pub fn init(writer: Writer, width: u32, height: u32) Error!Self {
+            if (width == 0 or height == 0) return error.InvalidImage;
+            var self = Self{ .writer = writer, .width = width, .height = height };
+            var header: [14]u8 = undefined;
+            header[0..4].* = MAGIC.*;
+            std.mem.writeInt(u32, header[4..8], width, .big);
+            std.mem.writeInt(u32, header[8..12], height, .big);
+            header[12] = 4;
+            header[13] = 0;
+            try self.put(&header);
+            return self;
+        }
+
+        /// Band sink: encodes `row_count` packed rows starting at image row
+        /// `first_row`. Returns false once a write has failed.
+        pub fn emit(self: *Self, first_row: u32, row_count: u32, rgba: []const u8) bool {
+            if (self.failed) return false;
+            self.writeRows(first_row, row_count, rgba) catch {
+                self.failed = true;
+                return false;
+            };
+            return true;
+        }
+
+        pub fn writeRows(self: *Self, first_row: u32, row_count: u32, rgba: []const u8) Error!void {
+            const stride = @as(usize, self.width) * 4;
+            if (first_row != self.rows_done or row_count > self.height - self.rows_done or rgba.len != row_count * stride) return error.InvalidImage;
+            var offset: usize = 0;
+            while (offset < rgba.len) : (offset += 4) try self.pixel(rgba[offset..][0..4].*);
+            self.rows_done += row_count;
+        }
+
+        /// Flushes the pending run and writes the end marker.
+        pub fn finish(self: *Self) Error!void {
+            if (self.failed or self.rows_done != self.height) return error.InvalidImage;
+            if (self.run > 0) try self.put(&.{OP_RUN | (self.run - 1)});
+            self.run = 0;
+            try self.put(&END_MARKER);
+            self.writer.writeAll(self.staging[0..self.staged]) catch return error.WriteFailed;
+            self.staged = 0;
+        }
+
+        fn pixel(self: *Self, px: [4]u8) Error!void {
+            if (std.mem.eql(u8, &px, &self.prev)) {
+                self.run += 1;
+                if (self.run == MAX_RUN) {
+                    try self.put(&.{OP_RUN | (self.run - 1)});
+                    self.run = 0;
+                }
+                return;
+            }
+            if (self.run > 0) {
+                try self.put(&.{OP_RUN | (self.run - 1)});
+                self.run = 0;
+            }
+
+            const slot = indexPosition(px);
+            if (std.mem.eql(u8, &self.index[slot], &px)) {
+                try self.put(&.{OP_INDEX | @as(u8, @intCast(slot))});
+            } else {
+                self.index[slot] = px;
+                if (px[3] == self.prev[3]) {
+                    const vr: i8 = @bitCast(px[0] -% self.prev[0]);
+                    const vg: i8 = @bitCast(px[1] -% self.prev[1]);
+                    const vb: i8 = @bitCast(px[2] -% self.prev[2]);
+                    const vg_r = vr -% vg;
+                    const vg_b = vb -% vg;
+                    if (vr >= -2 and vr <= 1 and vg >= -2 and vg <= 1 and vb >= -2 and vb <= 1) {
+                        try self.put(&.{OP_DIFF | biased(vr, 2) << 4 | biased(vg, 2) << 2 | biased(vb, 2)});
+                    } else if (vg >= -32 and vg <= 31 and vg_r >= -8 and vg_r <= 7 and vg_b >= -8 and vg_b <= 7) {
+                        try self.put(&.{ OP_LUMA | biased(vg, 32), biased(vg_r, 8) << 4 | biased(vg_b, 8) });
+                    } else {
+                        try self.put(&.{ OP_RGB, px[0], px[1], px[2] });
+                    }
+                } else {
+                    try self.put(&.{ OP_RGBA, px[0], px[1], px[2], px[3] });
+                }
+            }
+            self.prev = px;
+        }
+
+        fn put(self: *Self, bytes: []const u8) Error!void {
+            if (self.staged + bytes.len > self.staging.len) {
+                self.writer.writeAll(self.staging[0..self.staged]) catch return error.WriteFailed;
+                self.staged = 0;
+            }
+            @memcpy(self.staging[self.staged..][0..bytes.len], bytes);
+            self.staged += bytes.len;
+        }
+    };
+}
+
+pub fn encoder(writer: anytype, width: u32, height: u32) Error!Encoder(@TypeOf(writer)) {
+    return Encoder(@TypeOf(writer)).init(writer, width, height);
+}
+
+fn indexPosition(px: [4]u8) usize {
+    return (@as(usize, px[0]) * 3 + @as(usize, px[1]) * 5 + @as(usize, px[2]) * 7 + @as(usize, px[3]) * 11) % 64;
+}
+
+fn biased(value: i8, bias: i8) u8 {
+    return @intCast(value + bias);
+}
+
+fn decodeQoi(allocator: std.mem.Allocator, data: []const u8) ![]u8 {
+    try std.testing.expectEqualSlices(u8, MAGIC, data[0..4]);
+    const width = std.mem.readInt(u32, data[4..8], .big);
+    const height = std.mem.readInt(u32, data[8..12], .big);
+    const pixels = try allocator.alloc(u8, @as(usize, width) * height * 4);
+    errdefer allocator.free(pixels);
+    var index: [64][4]u8 = @splat(.{ 0, 0, 0, 0 });
+    var px = [4]u8{ 0, 0, 0, 255 };
+    var cursor: usize = 14;
+    var out: usize = 0;
+    while (out < pixels.len) {
+        const op = data[cursor];
+        cursor += 1;
+        var repeat: usize = 1;
+        if (op == OP_RGB) {
+            px[0..3].* = data[cursor..][0..3].*;
+            cursor += 3;
+        } else if (op == OP_RGBA) {
+            px = data[cursor..][0..4].*;
+            cursor += 4;
+        } else switch (op & 0xc0) {
+            OP_INDEX => px = index[op],
+            OP_DIFF => {
+                px[0] +%= ((op >> 4) & 3) -% 2;
+                px[1] +%= ((op >> 2) & 3) -% 2;
+                px[2] +%= (op & 3) -% 2;
+            },
+            OP_LUMA => {
+                const vg = (op & 0x3f) -% 32;
+                const next = data[cursor];
+                cursor += 1;
+                px[0] +%= vg +% ((next >> 4) -% 8);
+                px[1] +%= vg;
+                px[2] +%= vg +% ((next & 0x0f) -% 8);
+            },
+            else => repeat = (op & 0x3f) + 1,
+        }
+        index[indexPosition(px)] = px;
+        for (0..repeat) |_| {
+            pixels[out..][0..4].* = px;
+            out += 4;
+        }
+    }
+    try std.testing.expectEqualSlices(u8, &END_MARKER, data[cursor..]);
+    return pixels;
+}
+
+test "qoi round-trips rows fed in bands" {
+    const allocator = std.testing.allocator;
+    const width = 83;
+    const height = 157;
+    const pixels = try allocator.alloc(u8, width * height * 4);
+    defer allocator.free(pixels);
+    for (0..height) |y| {
+        for (0..width) |x| {
+            const p = pixels[(y * width + x) * 4 ..][0..4];
+            p.* = if ((x / 9 + y / 4) % 3 == 0)
+                .{ 0, 0, 0, 0 }
+            else if (x % 5 == 0)
+                .{ @intCast(x * 7 % 256), @intCast(y * 3 % 256), @intCast((x + y) % 256), @intCast(128 + y % 100) }
+            else
+                .{ @intCast(x % 256), @intCast((x + 1) % 256), 40, 255 };
+        }
+    }
+
+    var out: std.Io.Writer.Allocating = .init(allocator);
+    defer out.deinit();
+    var qoi = try encoder(&out.writer, width, height);
+    var row: u32 = 0;
+    while (row < height) {
+        const rows: u32 = @min(height - row, 10);
+        try std.testing.expect(qoi.emit(row, rows, pixels[row * width * 4 ..][0 .. rows * width * 4]));
+        row += rows;
+    }
+    try qoi.finish();
+
+    const decoded = try decodeQoi(allocator, out.written());
+    defer allocator.free(decoded);
+    try std.testing.expectEqualSlices(u8, pixels, decoded);
+    try std.testing.expect(out.written().len < pixels.len / 2);
+}
@@ -1,306 +1,301 @@
 const std = @import("std");
 const ir = @import("ir.zig");
+const scanline = @import("scanline.zig");
 
-pub const Surface = struct {
-    pixels: []u8,
-    width: u32,
-    height: u32,
-    stride: u32,
-};
+pub const Surface = scanline.Surface;
+pub const Matrix = scanline.Matrix;
+
+pub const Error = scanline.Error || ir.ConvertError || error{ InvalidTransform, GroupOverflow };
+
+const GROUP_STACK_LIMIT: usize = 16;
+const OP_POINT_LIMIT: usize = 1024;
+const OP_COMMAND_LIMIT: usize = 1024;
+const OP_NUMBER_LIMIT: usize = 16;
 
-fn parseNumber(text: []const u8, fallback: f64) f64 {
-    return std.fmt.parseFloat(f64, text) catch fallback;
+pub fn clear(surface: *Surface, rgba: [4]u8) void {
+    scanline.clear(surface, rgba);
 }
 
-fn parseHexNibble(ch: u8) ?u8 {
-    return switch (ch) {
-        '0'...'9' => ch - '0',
-        'a'...'f' => ch - 'a' + 10,
-        'A'...'F' => ch - 'A' + 10,
-        else => null,
-    };
+/// Maps an SVG `viewBox` onto the whole surface, the same way the compat
+/// bitmap renderers map a parsed document (no aspect-ratio preservation).
+pub fn viewBoxTransform(surface: *const Surface, min_x: f64, min_y: f64, width: f64, height: f64) Matrix {
+    const sx = @as(f64, @floatFromInt(surface.width)) / width;
+    const sy = @as(f64, @floatFromInt(surface.height)) / height;
+    return .{ .a = sx, .d = sy, .e = -min_x * sx, .f = -min_y * sy };
 }
 
-fn parseColor(text_opt: ?[]const u8) [4]u8 {
-    const text = text_opt orelse return .{ 0, 0, 0, 0 };
+/// Renders a text scene, converting each op to numeric form as it is drawn.
+/// Prefer `renderNumericScene` for scenes drawn more than once.
+pub fn renderScene(scene: ir.Scene, surface: *Surface) Error!void {
+    try renderSceneTransformed(scene, surface, .{});
+}
 
-    if (std.mem.eql(u8, text, "transparent")) return .{ 0, 0, 0, 0 };
-    if (std.mem.eql(u8, text, "black")) return .{ 0, 0, 0, 255 };
-    if (std.mem.eql(u8, text, "white")) return .{ 255, 255, 255, 255 };
-    if (std.mem.eql(u8, text, "gray")) return .{ 128, 128, 128, 255 };
+pub fn renderSceneTransformed(scene: ir.Scene, surface: *Surface, root: Matrix) Error!void {
+    var points: [OP_POINT_LIMIT]ir.Point = undefined;
+    var commands: [OP_COMMAND_LIMIT]ir.PathCommand = undefined;
+    var numbers: [OP_NUMBER_LIMIT]f64 = undefined;
+    var storage = ir.NumericStorage{ .ops = &.{}, .points = &points, .commands = &commands, .numbers = &numbers };
 
-    if (text.len == 4 and text[0] == '#') {
-        const r = parseHexNibble(text[1]) orelse return .{ 0, 0, 0, 255 };
-        const g = parseHexNibble(text[2]) orelse return .{ 0, 0, 0, 255 };
-        const b = parseHexNibble(text[3]) orelse return .{ 0, 0, 0, 255 };
-        return .{ r * 17, g * 17, b * 17, 255 };
+    var renderer = Renderer.init(surface, root);
+    for (scene.ops) |op| {
+        storage.reset();
+        try renderer.draw(try ir.numericOp(op, &storage));
     }
+}
 
-    if (text.len == 7 and text[0] == '#') {
-        const r_hi = parseHexNibble(text[1]) orelse return .{ 0, 0, 0, 255 };
-        const r_lo = parseHexNibble(text[2]) orelse return .{ 0, 0, 0, 255 };
-        const g_hi = parseHexNibble(text[3]) orelse return .{ 0, 0, 0, 255 };
-        const g_lo = parseHexNibble(text[4]) orelse return .{ 0, 0, 0, 255 };
-        const b_hi = parseHexNibble(text[5]) orelse return .{ 0, 0, 0, 255 };
-        const b_lo = parseHexNibble(text[6]) orelse return .{ 0, 0, 0, 255 };
-        return .{ (r_hi << 4) | r_lo, (g_hi << 4) | g_lo, (b_hi << 4) | b_lo, 255 };
-    }
+pub fn renderNumericScene(scene: ir.NumericScene, surface: *Surface) Error!void {
+    try renderNumericSceneTransformed(scene, surface, .{});
+}
 
-    return .{ 0, 0, 0, 255 };
+/// Draws every op of `scene` under `root`. Raw markup is skipped; groups and
+/// links push their `transform` attribute, if any.
+pub fn renderNumericSceneTransformed(scene: ir.NumericScene, surface: *Surface, root: Matrix) Error!void {
+    var renderer = Renderer.init(surface, root);
+    for (scene.ops) |op| try renderer.draw(op);
 }
 
-fn blendPixel(dst: *[4]u8, src: [4]u8) void {
-    const src_a: u32 = src[3];
-    if (src_a == 0) return;
+const Renderer = struct {
+    surface: *Surface,
+    stack: [GROUP_STACK_LIMIT]Matrix = undefined,
+    depth: usize = 1,
 
-    const dst_a: u32 = dst[3];
-    const out_a: u32 = src_a + ((dst_a * (255 - src_a) + 127) / 255);
+    fn init(surface: *Surface, root: Matrix) Renderer {
+        var renderer = Renderer{ .surface = surface };
+        renderer.stack[0] = root;
+        return renderer;
+    }
 
-    if (out_a == 0) {
-        dst.* = .{ 0, 0, 0, 0 };
-        return;
+    fn transform(self: *const Renderer) Matrix {
+        return self.stack[self.depth - 1];
     }
 
-    var channel: usize = 0;
-    while (channel < 3) : (channel += 1) {
-        const src_c: u32 = src[channel];
-        const dst_c: u32 = dst[channel];
-        const numer = src_c * src_a * 255 + dst_c * dst_a * (255 - src_a);
-        const denom = out_a * 255;
-        const value = if (denom == 0) 0 else (numer + (denom / 2)) / denom;
-        dst[channel] = @as(u8, @intCast(@min(value, 255)));
+    fn push(self: *Renderer, attrs: []const ir.Attr) Error!void {
+        if (self.depth >= self.stack.len) return error.GroupOverflow;
+        var next = self.transform();
+        for (attrs) |attr| {
+            if (std.mem.eql(u8, attr.key, "transform")) next = next.multiply(try parseTransform(attr.value));
+        }
+        self.stack[self.depth] = next;
+        self.depth += 1;
     }
 
-    dst[3] = @as(u8, @intCast(@min(out_a, 255)));
-}
+    fn pop(self: *Renderer) void {
+        if (self.depth > 1) self.depth -= 1;
+    }
 
-fn clamp01(value: f64) f64 {
-    return std.math.clamp(value, 0.0, 1.0);
-}
+    fn draw(self: *Renderer, op: ir.NumericOp) Error!void {
+        switch (op) {
+            .raw => {},
+            .path => |path| try drawPath(self.surface, path, self.transform()),
+            .rect => |rect| drawRect(self.surface, rect, self.transform()),
+            .circle => |circle| drawCircle(self.surface, circle, self.transform()),
+            .ellipse => |ellipse| drawEllipse(self.surface, ellipse, self.transform()),
+            .line => |line| drawLine(self.surface, line, self.transform()),
+            .polyline => |poly| try drawPoly(self.surface, poly, false, self.transform()),
+            .polygon => |poly| try drawPoly(self.surface, poly, true, self.transform()),
+            .group_start => |group| try self.push(group.attrs),
+            .link_start => |link| try self.push(link.attrs),
+            .group_end, .link_end => self.pop(),
+        }
+    }
+};
 
-fn intervalCoverage(start: f64, end: f64, pixel_index: i32) f64 {
-    if (end <= start) return 0.0;
-    const pixel_start = @as(f64, @floatFromInt(pixel_index));
-    const pixel_end = pixel_start + 1.0;
-    return clamp01(@min(end, pixel_end) - @max(start, pixel_start));
+fn paintRgba(paint: ?ir.Paint) [4]u8 {
+    const resolved: ir.Paint = paint orelse .none;
+    return resolved.rgba();
 }
 
-fn rectCoverage(x0: f64, y0: f64, x1: f64, y1: f64, px: i32, py: i32) f64 {
-    return intervalCoverage(x0, x1, px) * intervalCoverage(y0, y1, py);
+fn strokeScale(transform: Matrix) f64 {
+    return transform.approxUniformScale();
 }
 
-fn fillCoverageForDistance(dist: f64, radius: f64) f64 {
-    return clamp01(radius + 0.5 - dist);
-}
+const Dash = struct {
+    on: f64 = 0.0,
+    off: f64 = 0.0,
+};
 
-fn annulusCoverageForDistance(dist: f64, inner_radius: f64, outer_radius: f64) f64 {
-    const outer = fillCoverageForDistance(dist, outer_radius);
-    const inner = if (inner_radius <= 0.0) 0.0 else fillCoverageForDistance(dist, inner_radius);
-    return clamp01(outer - inner);
+fn dashPattern(values: ?[]const f64, scale: f64) Dash {
+    const dash = values orelse return .{};
+    if (dash.len == 0) return .{};
+    const on = dash[0];
+    const off = if (dash.len > 1) dash[1] else on;
+    return .{ .on = on * scale, .off = off * scale };
 }
 
-fn scaledAlpha(alpha: u8, coverage: f64) u8 {
-    const scaled = @as(f64, @floatFromInt(alpha)) * clamp01(coverage);
-    return @as(u8, @intFromFloat(std.math.clamp(@floor(scaled + 0.5), 0.0, 255.0)));
-}
+fn drawRect(surface: *Surface, rect: ir.NumericRect, transform: Matrix) void {
+    const fill = paintRgba(rect.fill);
+    const stroke = paintRgba(rect.stroke);
+    const stroke_width = rect.stroke_width orelse 1.0;
+
+    // Corner radii resolve as in SVG: a missing one copies the other, and
+    // both clamp to half the side.
+    var rx = rect.rx orelse 0.0;
+    var ry = rect.ry orelse 0.0;
+    if (rx > 0.0 and ry <= 0.0) ry = rx;
+    if (ry > 0.0 and rx <= 0.0) rx = ry;
+    rx = std.math.clamp(rx, 0.0, rect.width / 2.0);
+    ry = std.math.clamp(ry, 0.0, rect.height / 2.0);
+    if (rx > 0.0 and ry > 0.0) {
+        var rounded: [40]scanline.Edge = undefined;
+        const count = scanline.buildRoundedRectEdges(rect.x, rect.y, rect.width, rect.height, rx, ry, transform, &rounded);
+        scanline.fillEdges(surface, rounded[0..count], fill);
+        scanline.strokeEdges(surface, rounded[0..count], stroke, stroke_width * strokeScale(transform), 0.0, 0.0);
+        return;
+    }
 
-fn blendCoverage(dst: *[4]u8, src: [4]u8, coverage: f64) void {
-    if (src[3] == 0 or coverage <= 0.0) return;
-    if (coverage >= 0.999999) {
-        blendPixel(dst, src);
+    if (scanline.isAxisAligned(transform)) {
+        const p = transform.apply(rect.x, rect.y);
+        const sx = @sqrt(transform.a * transform.a + transform.b * transform.b);
+        const sy = @sqrt(transform.c * transform.c + transform.d * transform.d);
+        scanline.drawRect(surface, p.x, p.y, rect.width * sx, rect.height * sy, fill, stroke, stroke_width * @max(sx, sy));
         return;
     }
-    var adjusted = src;
-    adjusted[3] = scaledAlpha(src[3], coverage);
-    if (adjusted[3] == 0) return;
-    blendPixel(dst, adjusted);
+
+    const x0 = rect.x;
+    const y0 = rect.y;
+    const x1 = rect.x + rect.width;
+    const y1 = rect.y + rect.height;
+    const edges = [_]scanline.Edge{
+        .{ .a = transform.apply(x0, y0), .b = transform.apply(x1, y0) },
+        .{ .a = transform.apply(x1, y0), .b = transform.apply(x1, y1) },
+        .{ .a = transform.apply(x1, y1), .b = transform.apply(x0, y1) },
+        .{ .a = transform.apply(x0, y1), .b = transform.apply(x0, y0) },
+    };
+    scanline.fillEdges(surface, &edges, fill);
+    scanline.strokeEdges(surface, &edges, stroke, stroke_width * strokeScale(transform), 0.0, 0.0);
 }
 
-fn pixelPtr(surface: *Surface, x: i32, y: i32) ?*[4]u8 {
-    if (x < 0 or y < 0) return null;
-    if (x >= @as(i32, @intCast(surface.width)) or y >= @as(i32, @intCast(surface.height))) return null;
-    const offset = @as(usize, @intCast(y)) * @as(usize, @intCast(surface.stride)) + @as(usize, @intCast(x)) * 4;
-    return @ptrCast(surface.pixels[offset .. offset + 4]);
+fn drawCircle(surface: *Surface, circle: ir.NumericCircle, transform: Matrix) void {
+    const scale = strokeScale(transform);
+    const center = transform.apply(circle.cx, circle.cy);
+    scanline.drawCircle(
+        surface,
+        center.x,
+        center.y,
+        circle.r * scale,
+        paintRgba(circle.fill),
+        paintRgba(circle.stroke),
+        (circle.stroke_width orelse 1.0) * scale,
+    );
 }
 
-fn drawRect(surface: *Surface, rect: ir.Rect) void {
-    const x = @as(i32, @intFromFloat(@floor(parseNumber(rect.x, 0.0))));
-    const y = @as(i32, @intFromFloat(@floor(parseNumber(rect.y, 0.0))));
-    const w = @as(i32, @intFromFloat(@floor(parseNumber(rect.width, 0.0))));
-    const h = @as(i32, @intFromFloat(@floor(parseNumber(rect.height, 0.0))));
-    if (w <= 0 or h <= 0) return;
-
-    const fill = parseColor(rect.fill);
-    const stroke = parseColor(rect.stroke);
-    const stroke_width = @max(1.0, parseNumber(rect.stroke_width orelse "1", 1.0));
-    const half_stroke = stroke_width / 2.0;
-
-    var py: i32 = y;
-    while (py < y + h) : (py += 1) {
-        var px: i32 = x;
-        while (px < x + w) : (px += 1) {
-            if (pixelPtr(surface, px, py)) |dst| {
-                const fill_coverage = if (fill[3] > 0)
-                    rectCoverage(@floatFromInt(x), @floatFromInt(y), @floatFromInt(x + w), @floatFromInt(y + h), px, py)
-                else
-                    0.0;
-                const outer_coverage = if (stroke[3] > 0 and stroke_width > 0.0)
-                    rectCoverage(@as(f64, @floatFromInt(x)) - half_stroke, @as(f64, @floatFromInt(y)) - half_stroke, @as(f64, @floatFromInt(x + w)) + half_stroke, @as(f64, @floatFromInt(y + h)) + half_stroke, px, py)
-                else
-                    0.0;
-                const inner_coverage = if (stroke[3] > 0 and stroke_width > 0.0 and w > 0 and h > 0 and @as(f64, @floatFromInt(w)) > stroke_width and @as(f64, @floatFromInt(h)) > stroke_width)
-                    rectCoverage(@as(f64, @floatFromInt(x)) + half_stroke, @as(f64, @floatFromInt(y)) + half_stroke, @as(f64, @floatFromInt(x + w)) - half_stroke, @as(f64, @floatFromInt(y + h)) - half_stroke, px, py)
-                else
-                    0.0;
-                if (fill_coverage > 0.0) blendCoverage(dst, fill, fill_coverage);
-                const stroke_coverage = clamp01(outer_coverage - inner_coverage);
-                if (stroke_coverage > 0.0) blendCoverage(dst, stroke, stroke_coverage);
-            }
-        }
-    }
+fn drawEllipse(surface: *Surface, ellipse: ir.NumericEllipse, transform: Matrix) void {
+    var edges: [96]scanline.Edge = undefined;
+    const edge_count = scanline.buildEllipseEdges(ellipse.cx, ellipse.cy, ellipse.rx, ellipse.ry, transform, &edges);
+    scanline.fillEdges(surface, edges[0..edge_count], paintRgba(ellipse.fill));
+    scanline.strokeEdges(surface, edges[0..edge_count], paintRgba(ellipse.stroke), (ellipse.stroke_width orelse 1.0) * strokeScale(transform), 0.0, 0.0);
 }
 
-fn drawCircle(surface: *Surface, circle: ir.Circle) void {
-    const cx = parseNumber(circle.cx, 0.0);
-    const cy = parseNumber(circle.cy, 0.0);
-    const r = parseNumber(circle.r, 0.0);
-    if (r <= 0.0) return;
-
-    const fill = parseColor(circle.fill);
-    const stroke = parseColor(circle.stroke);
-    const stroke_width = parseNumber(circle.stroke_width orelse "1", 1.0);
-    const half_stroke = stroke_width / 2.0;
-
-    const min_x = @as(i32, @intFromFloat(@floor(cx - r - half_stroke - 1.0)));
-    const max_x = @as(i32, @intFromFloat(@ceil(cx + r + half_stroke + 1.0)));
-    const min_y = @as(i32, @intFromFloat(@floor(cy - r - half_stroke - 1.0)));
-    const max_y = @as(i32, @intFromFloat(@ceil(cy + r + half_stroke + 1.0)));
-
-    var py = min_y;
-    while (py <= max_y) : (py += 1) {
-        var px = min_x;
-        while (px <= max_x) : (px += 1) {
-            const dx = (@as(f64, @floatFromInt(px)) + 0.5) - cx;
-            const dy = (@as(f64, @floatFromInt(py)) + 0.5) - cy;
-            const dist = @sqrt(dx * dx + dy * dy);
-
-            if (pixelPtr(surface, px, py)) |dst| {
-                const fill_coverage = if (fill[3] > 0) fillCoverageForDistance(dist, r) else 0.0;
-                const stroke_coverage = if (stroke[3] > 0 and stroke_width > 0.0)
-                    annulusCoverageForDistance(dist, @max(0.0, r - half_stroke), r + half_stroke)
-                else
-                    0.0;
-                if (fill_coverage > 0.0) blendCoverage(dst, fill, fill_coverage);
-                if (stroke_coverage > 0.0) blendCoverage(dst, stroke, stroke_coverage);
-            }
-        }
-    }
+fn drawLine(surface: *Surface, line: ir.NumericLine, transform: Matrix) void {
+    const scale = strokeScale(transform);
+    const dash = dashPattern(line.stroke_dasharray, scale);
+    const edge = [_]scanline.Edge{.{ .a = transform.apply(line.x1, line.y1), .b = transform.apply(line.x2, line.y2) }};
+    scanline.strokeEdges(surface, &edge, paintRgba(line.stroke), (line.stroke_width orelse 1.0) * scale, dash.on, dash.off);
 }
 
-fn drawLine(surface: *Surface, line: ir.Line) void {
-    const x1 = parseNumber(line.x1, 0.0);
-    const y1 = parseNumber(line.y1, 0.0);
-    const x2 = parseNumber(line.x2, 0.0);
-    const y2 = parseNumber(line.y2, 0.0);
-    const color = parseColor(line.stroke);
-    if (color[3] == 0) return;
-
-    const thickness = @max(1.0, parseNumber(line.stroke_width orelse "1", 1.0));
-    const radius = thickness / 2.0;
-
-    const min_x = @as(i32, @intFromFloat(@floor(@min(x1, x2) - radius - 1.0)));
-    const max_x = @as(i32, @intFromFloat(@ceil(@max(x1, x2) + radius + 1.0)));
-    const min_y = @as(i32, @intFromFloat(@floor(@min(y1, y2) - radius - 1.0)));
-    const max_y = @as(i32, @intFromFloat(@ceil(@max(y1, y2) + radius + 1.0)));
-
-    const vx = x2 - x1;
-    const vy = y2 - y1;
-    const vv = vx * vx + vy * vy;
-
-    var py = min_y;
-    while (py <= max_y) : (py += 1) {
-        var px = min_x;
-        while (px <= max_x) : (px += 1) {
-            const fx = @as(f64, @floatFromInt(px)) + 0.5;
-            const fy = @as(f64, @floatFromInt(py)) + 0.5;
-
-            var t: f64 = 0.0;
-            if (vv > 0.0) {
-                t = ((fx - x1) * vx + (fy - y1) * vy) / vv;
-                t = @max(0.0, @min(1.0, t));
-            }
-
-            const cx = x1 + t * vx;
-            const cy = y1 + t * vy;
-            const dx = fx - cx;
-            const dy = fy - cy;
-            const dist = @sqrt(dx * dx + dy * dy);
-
-            if (pixelPtr(surface, px, py)) |dst| {
-                const coverage = fillCoverageForDistance(dist, radius);
-                if (coverage > 0.0) blendCoverage(dst, color, coverage);
-            }
-        }
+/// Polylines fill as if closed, like SVG, but only polygons stroke the
+/// closing edge. More than `OP_POINT_LIMIT` points is `error.NoSpace`.
+fn drawPoly(surface: *Surface, poly: ir.NumericPolyline, closed: bool, transform: Matrix) Error!void {
+    if (poly.points.len < 2) return;
+    var edges: [OP_POINT_LIMIT]scanline.Edge = undefined;
+    if (poly.points.len > edges.len) return error.NoSpace;
+    const count = poly.points.len;
+    for (0..count) |i| {
+        const next = poly.points[(i + 1) % count];
+        edges[i] = .{ .a = transform.apply(poly.points[i].x, poly.points[i].y), .b = transform.apply(next.x, next.y) };
     }
+
+    const scale = strokeScale(transform);
+    const dash = dashPattern(poly.stroke_dasharray, scale);
+    scanline.fillEdges(surface, edges[0..count], paintRgba(poly.fill));
+    const stroked = if (closed) count else count - 1;
+    scanline.strokeEdges(surface, edges[0..stroked], paintRgba(poly.stroke), (poly.stroke_width orelse 1.0) * scale, dash.on, dash.off);
 }
 
-pub fn clear(surface: *Surface, rgba: [4]u8) void {
-    var y: u32 = 0;
-    while (y < surface.height) : (y += 1) {
-        var x: u32 = 0;
-        while (x < surface.width) : (x += 1) {
-            const offset = @as(usize, @intCast(y)) * @as(usize, @intCast(surface.stride)) + @as(usize, @intCast(x)) * 4;
-            surface.pixels[offset + 0] = rgba[0];
-            surface.pixels[offset + 1] = rgba[1];
-            surface.pixels[offset + 2] = rgba[2];
-            surface.pixels[offset + 3] = rgba[3];
+fn drawPath(surface: *Surface, path: ir.NumericPath, transform: Matrix) Error!void {
+    const fill = paintRgba(path.fill);
+    const stroke = paintRgba(path.stroke);
+    const stroke_width = (path.stroke_width orelse 1.0) * strokeScale(transform);
+    if (fill[3] == 0 and (stroke[3] == 0 or stroke_width <= 0.0)) return;
+
+    var builder = scanline.PathBuilder{};
+    for (path.d) |command| {
+        switch (command) {
+            .move_to => |to| builder.moveTo(to),
+            .line_to => |to| try builder.lineTo(transform, to),
+            .cubic_to => |c| try builder.cubicTo(transform, c.c1, c.c2, c.to),
+            .quad_to => |q| try builder.quadraticTo(transform, q.c, q.to),
+            .close => try builder.closePath(transform),
         }
     }
+
+    const edges = builder.edges[0..builder.edge_count];
+    const dash = dashPattern(path.stroke_dasharray, strokeScale(transform));
+    scanline.fillEdges(surface, edges, fill);
+    scanline.strokeEdges(surface, edges, stroke, stroke_width, dash.on, dash.off);
 }
 
-pub fn renderScene(scene: ir.Scene, surface: *Surface) void {
-    for (scene.ops) |op| {
-        switch (op) {
-            .rect => |rect| drawRect(surface, rect),
-            .circle => |circle| drawCircle(surface, circle),
-            .line => |line| drawLine(surface, line),
-            else => {},
+/// Parses an SVG transform list (`matrix`, `translate`, `scale`, `rotate`).
+pub fn parseTransform(text: []const u8) Error!Matrix {
+    var out = Matrix{};
+    var cursor: usize = 0;
+    while (cursor < text.len) {
+        while (cursor < text.len and std.mem.indexOfScalar(u8, " \t\r\n,", text[cursor]) != null) : (cursor += 1) {}
+        if (cursor >= text.len) break;
+        const open = std.mem.indexOfScalarPos(u8, text, cursor, '(') orelse return error.InvalidTransform;
+        const close = std.mem.indexOfScalarPos(u8, text, open + 1, ')') orelse return error.InvalidTransform;
+        const name = std.mem.trim(u8, text[cursor..open], " \t\r\n");
+
+        var args: [6]f64 = undefined;
+        var arg_count: usize = 0;
+        var tokens = std.mem.tokenizeAny(u8, text[open + 1 .. close], " \t\r\n,");
+        while (tokens.next()) |token| {
+            if (arg_count >= args.len) return error.InvalidTransform;
+            args[arg_count] = std.fmt.parseFloat(f64, token) catch return error.InvalidTransform;
+            arg_count += 1;
         }
+        const a = args[0..arg_count];
+
+        const step: Matrix = if (std.mem.eql(u8, name, "matrix")) blk: {
+            if (a.len != 6) return error.InvalidTransform;
+            break :blk .{ .a = a[0], .b = a[1], .c = a[2], .d = a[3], .e = a[4], .f = a[5] };
+        } else if (std.mem.eql(u8, name, "translate")) blk: {
+            if (a.len < 1 or a.len > 2) return error.InvalidTransform;
+            break :blk .{ .e = a[0], .f = if (a.len > 1) a[1] else 0.0 };
+        } else if (std.mem.eql(u8, name, "scale")) blk: {
+            if (a.len < 1 or a.len > 2) return error.InvalidTransform;
+            break :blk .{ .a = a[0], .d = if (a.len > 1) a[1] else a[0] };
+        } else if (std.mem.eql(u8, name, "rotate")) blk: {
+            if (a.len != 1 and a.len != 3) return error.InvalidTransform;
+            const radians = a[0] * std.math.pi / 180.0;
+            const rotate = Matrix{ .a = @cos(radians), .b = @sin(radians), .c = -@sin(radians), .d = @cos(radians) };
+            if (a.len == 1) break :blk rotate;
+            const to_center = Matrix{ .e = a[1], .f = a[2] };
+            const from_center = Matrix{ .e = -a[1], .f = -a[2] };
+            break :blk to_center.multiply(rotate).multiply(from_center);
+        } else return error.InvalidTransform;
+
+        out = out.multiply(step);
+        cursor = close + 1;
     }
+    return out;
 }
 
 pub fn renderDemoScene(surface: *Surface) void {
     clear(surface, .{ 245, 245, 245, 255 });
 
-    var ops: [6]ir.Op = undefined;
-    var builder = ir.Builder.init(&ops);
-    builder.rect(.{
-        .x = "4",
-        .y = "4",
-        .width = "92",
-        .height = "92",
-        .fill = "white",
-        .stroke = "#333",
-        .stroke_width = "2",
-    }) catch unreachable;
-    builder.circle(.{
-        .cx = "50",
-        .cy = "50",
-        .r = "22",
-        .fill = "#16b",
-        .stroke = "black",
-        .stroke_width = "2",
-    }) catch unreachable;
-    builder.line(.{
-        .x1 = "18",
-        .y1 = "80",
-        .x2 = "82",
-        .y2 = "20",
-        .stroke = "black",
-        .stroke_width = "3",
-    }) catch unreachable;
-
-    renderScene(builder.scene(), surface);
+    const white = ir.Paint{ .color = .{ .r = 255, .g = 255, .b = 255, .a = 255 } };
+    const dark_gray = ir.Paint{ .color = .{ .r = 0x33, .g = 0x33, .b = 0x33, .a = 255 } };
+    const blue = ir.Paint{ .color = .{ .r = 0x11, .g = 0x66, .b = 0xbb, .a = 255 } };
+    const black = ir.Paint{ .color = ir.Color.black };
+
+    var ops: [6]ir.NumericOp = undefined;
+    var builder = ir.NumericBuilder.init(&ops);
+    builder.rect(.{ .x = 4, .y = 4, .width = 92, .height = 92, .fill = white, .stroke = dark_gray, .stroke_width = 2 }) catch unreachable;
+    builder.circle(.{ .cx = 50, .cy = 50, .r = 22, .fill = blue, .stroke = black, .stroke_width = 2 }) catch unreachable;
+    builder.line(.{ .x1 = 18, .y1 = 80, .x2 = 82, .y2 = 20, .stroke = black, .stroke_width = 3 }) catch unreachable;
+
+    renderNumericScene(builder.scene(), surface) catch unreachable;
 }
 
 pub fn hashSurface(surface: Surface) u64 {
@@ -0,0 +1,966 @@
+//! Scanline rasterizer shared by the render IR backend (`raster.zig`) and the
+//! compatibility bitmap renderers (`bitmap_compat.zig`). Geometry arrives as
+//! device-space edges; fills accumulate 4x vertical subsample coverage per
+//! row and blend it in one pass, strokes are distance-field line segments.
+
+const std = @import("std");
+const ir = @import("ir.zig");
+
+pub const Surface = struct {
+    pixels: []u8,
+    width: u32,
+    height: u32,
+    stride: u32,
+    /// Only rows in [band_start, band_end) are written. Band renderers hand
+    /// each worker its own band of one surface; every pixel still sees the
+    /// same draws in the same order, so the result matches an unbanded pass.
+    band_start: u32 = 0,
+    band_end: u32 = std.math.maxInt(u32),
+    /// Only columns in [column_start, column_end) are written. Together with
+    /// the band this clips a redraw to one dirty rectangle.
+    column_start: u32 = 0,
+    column_end: u32 = std.math.maxInt(u32),
+    /// Device row held by the first row of `pixels`. Streaming renderers
+    /// point `pixels` at a buffer that holds only their current band.
+    origin_row: u32 = 0,
+
+    pub fn band(self: Surface, start: u32, end: u32) Surface {
+        var out = self;
+        out.band_start = start;
+        out.band_end = end;
+        return out;
+    }
+
+    pub fn clip(self: Surface, rect: PixelRect) Surface {
+        var out = self.band(rect.y, rect.y +| rect.height);
+        out.column_start = rect.x;
+        out.column_end = rect.x +| rect.width;
+        return out;
+    }
+
+    pub fn isBanded(self: Surface) bool {
+        return self.band_start > 0 or self.band_end < self.height;
+    }
+
+    fn firstRow(self: Surface) i32 {
+        return @intCast(@min(self.band_start, self.height));
+    }
+
+    fn endRow(self: Surface) i32 {
+        return @intCast(@min(self.band_end, self.height));
+    }
+
+    fn firstColumn(self: Surface) u32 {
+        return @min(self.column_start, self.width);
+    }
+
+    fn endColumn(self: Surface) u32 {
+        return @min(self.column_end, self.width);
+    }
+
+    /// Byte offset of device pixel (x, y) in `pixels`.
+    fn offset(self: Surface, x: usize, y: usize) usize {
+        return (y - self.origin_row) * @as(usize, self.stride) + x * 4;
+    }
+
+    /// Clamps the inclusive row range [first, last] to the drawable band.
+    pub fn rows(self: Surface, first: i32, last: i32) struct { first: i32, last: i32 } {
+        return .{ .first = @max(first, self.firstRow()), .last = @min(last, self.endRow() - 1) };
+    }
+
+    /// Clamps the inclusive column range [first, last] to the drawable clip.
+    pub fn columns(self: Surface, first: i32, last: i32) struct { first: i32, last: i32 } {
+        return .{ .first = @max(first, @as(i32, @intCast(self.firstColumn()))), .last = @min(last, @as(i32, @intCast(self.endColumn())) - 1) };
+    }
+};
+
+/// Device-space rectangle in whole pixels.
+pub const PixelRect = struct {
+    x: u32,
+    y: u32,
+    width: u32,
+    height: u32,
+};
+
+pub const Error = error{PathOverflow};
+
+pub const PATH_EDGE_LIMIT: usize = 4096;
+pub const AA_SUBPIXEL_GRID: u32 = 4;
+pub const AA_ROW_COVERAGE_LIMIT: usize = 8192;
+pub const CIRCLE_AA_SUBPIXEL_GRID: u32 = 16;
+pub const PIXEL_CORNER_RADIUS: f64 = 0.7071067811865476;
+/// Pixels per step in the vectorized coverage and compositing paths.
+pub const BLEND_LANES: usize = 8;
+pub const CoverageLanes = @Vector(BLEND_LANES, f64);
+const ChannelLanes = @Vector(BLEND_LANES, u32);
+
+pub const Point = ir.Point;
+
+pub const Edge = struct {
+    a: Point,
+    b: Point,
+};
+
+pub const ScanIntersection = struct {
+    x: f64,
+    delta: i32,
+};
+
+pub const Matrix = struct {
+    a: f64 = 1.0,
+    b: f64 = 0.0,
+    c: f64 = 0.0,
+    d: f64 = 1.0,
+    e: f64 = 0.0,
+    f: f64 = 0.0,
+
+    pub fn multiply(lhs: Matrix, rhs: Matrix) Matrix {
+        return .{
+            .a = lhs.a * rhs.a + lhs.c * rhs.b,
+            .b = lhs.b * rhs.a + lhs.d * rhs.b,
+            .c = lhs.a * rhs.c + lhs.c * rhs.d,
+            .d = lhs.b * rhs.c + lhs.d * rhs.d,
+            .e = lhs.a * rhs.e + lhs.c * rhs.f + lhs.e,
+            .f = lhs.b * rhs.e + lhs.d * rhs.f + lhs.f,
+        };
+    }
+
+    pub fn apply(self: Matrix, x: f64, y: f64) Point {
+        return .{
+            .x = self.a * x + self.c * y + self.e,
+            .y = self.b * x + self.d * y + self.f,
+        };
+    }
+
+    pub fn approxUniformScale(self: Matrix) f64 {
+        const sx = @sqrt(self.a * self.a + self.b * self.b);
+        const sy = @sqrt(self.c * self.c + self.d * self.d);
+        return (sx + sy) / 2.0;
+    }
+};
+
+pub const PathBuilder = struct {
+    edges: [PATH_EDGE_LIMIT]Edge = undefined,
+    edge_count: usize = 0,
+    current: Point = .{ .x = 0.0, .y = 0.0 },
+    subpath_start: Point = .{ .x = 0.0, .y = 0.0 },
+    has_current: bool = false,
+    last_cubic_ctrl: ?Point = null,
+    last_quadratic_ctrl: ?Point = null,
+    prev_cmd: u8 = 0,
+
+    pub fn moveTo(self: *PathBuilder, point: Point) void {
+        self.current = point;
+        self.subpath_start = point;
+        self.has_current = true;
+        self.last_cubic_ctrl = null;
+        self.last_quadratic_ctrl = null;
+    }
+
+    pub fn lineTo(self: *PathBuilder, transform: Matrix, point: Point) Error!void {
+        if (!self.has_current) {
+            self.moveTo(point);
+            return;
+        }
+        if (self.edge_count >= self.edges.len) return error.PathOverflow;
+        self.edges[self.edge_count] = .{
+            .a = transform.apply(self.current.x, self.current.y),
+            .b = transform.apply(point.x, point.y),
+        };
+        self.edge_count += 1;
+        self.current = point;
+        self.last_cubic_ctrl = null;
+        self.last_quadratic_ctrl = null;
+    }
+
+    pub fn cubicTo(self: *PathBuilder, transform: Matrix, ctrl1: Point, ctrl2: Point, point: Point) Error!void {
+        const start = self.current;
+        const steps = cubicStepCount(start, ctrl1, ctrl2, point, transform.approxUniformScale());
+
+        var i: u32 = 1;
+        while (i <= steps) : (i += 1) {
+            const t = @as(f64, @floatFromInt(i)) / @as(f64, @floatFromInt(steps));
+            const next = cubicPoint(start, ctrl1, ctrl2, point, t);
+            try self.lineTo(transform, next);
+        }
+        self.current = point;
+        self.last_cubic_ctrl = ctrl2;
+        self.last_quadratic_ctrl = null;
+    }
+
+    pub fn quadraticTo(self: *PathBuilder, transform: Matrix, ctrl: Point, point: Point) Error!void {
+        const start = self.current;
+        const steps = quadraticStepCount(start, ctrl, point, transform.approxUniformScale());
+
+        var i: u32 = 1;
+        while (i <= steps) : (i += 1) {
+            const t = @as(f64, @floatFromInt(i)) / @as(f64, @floatFromInt(steps));
+            const next = quadraticPoint(start, ctrl, point, t);
+            try self.lineTo(transform, next);
+        }
+        self.current = point;
+        self.last_cubic_ctrl = null;
+        self.last_quadratic_ctrl = ctrl;
+    }
+
+    pub fn closePath(self: *PathBuilder, transform: Matrix) Error!void {
+        if (!self.has_current) return;
+        if (@abs(self.current.x - self.subpath_start.x) > 0.0000001 or @abs(self.current.y - self.subpath_start.y) > 0.0000001) {
+            try self.lineTo(transform, self.subpath_start);
+        }
+        self.current = self.subpath_start;
+        self.last_cubic_ctrl = null;
+        self.last_quadratic_ctrl = null;
+    }
+};
+
+pub fn buildRoundedRectEdges(x: f64, y: f64, width: f64, height: f64, rx: f64, ry: f64, transform: Matrix, edges: *[40]Edge) usize {
+    const arc_segments: usize = 8;
+
+    var points: [41]Point = undefined;
+    var point_count: usize = 0;
+
+    points[point_count] = transform.apply(x + rx, y);
+    point_count += 1;
+    points[point_count] = transform.apply(x + width - rx, y);
+    point_count += 1;
+
+    appendRoundedCornerPoints(&points, &point_count, transform, x + width - rx, y + ry, rx, ry, -std.math.pi / 2.0, 0.0, arc_segments);
+    points[point_count] = transform.apply(x + width, y + height - ry);
+    point_count += 1;
+
+    appendRoundedCornerPoints(&points, &point_count, transform, x + width - rx, y + height - ry, rx, ry, 0.0, std.math.pi / 2.0, arc_segments);
+    points[point_count] = transform.apply(x + rx, y + height);
+    point_count += 1;
+
+    appendRoundedCornerPoints(&points, &point_count, transform, x + rx, y + height - ry, rx, ry, std.math.pi / 2.0, std.math.pi, arc_segments);
+    points[point_count] = transform.apply(x, y + ry);
+    point_count += 1;
+
+    appendRoundedCornerPoints(&points, &point_count, transform, x + rx, y + ry, rx, ry, std.math.pi, 3.0 * std.math.pi / 2.0, arc_segments);
+
+    var edge_count: usize = 0;
+    var i: usize = 0;
+    while (i < point_count) : (i += 1) {
+        const next = (i + 1) % point_count;
+        edges[edge_count] = .{ .a = points[i], .b = points[next] };
+        edge_count += 1;
+    }
+    return edge_count;
+}
+
+fn appendRoundedCornerPoints(points: *[41]Point, point_count: *usize, transform: Matrix, cx: f64, cy: f64, rx: f64, ry: f64, start_angle: f64, end_angle: f64, segments: usize) void {
+    var segment: usize = 1;
+    while (segment <= segments) : (segment += 1) {
+        const t = @as(f64, @floatFromInt(segment)) / @as(f64, @floatFromInt(segments));
+        const angle = start_angle + (end_angle - start_angle) * t;
+        points[point_count.*] = transform.apply(
+            cx + std.math.cos(angle) * rx,
+            cy + std.math.sin(angle) * ry,
+        );
+        point_count.* += 1;
+    }
+}
+
+pub fn buildEllipseEdges(cx: f64, cy: f64, rx: f64, ry: f64, transform: Matrix, edges: *[96]Edge) usize {
+    const step_count = edges.len;
+    var prev = transform.apply(cx + rx, cy);
+    var index: usize = 0;
+    while (index < step_count) : (index += 1) {
+        const angle = (2.0 * std.math.pi * @as(f64, @floatFromInt(index + 1))) / @as(f64, @floatFromInt(step_count));
+        const next = transform.apply(cx + std.math.cos(angle) * rx, cy + std.math.sin(angle) * ry);
+        edges[index] = .{ .a = prev, .b = next };
+        prev = next;
+    }
+    return step_count;
+}
+
+pub fn edgeBounds(edges: []const Edge) struct { min_x: f64, max_x: f64, min_y: f64, max_y: f64 } {
+    var min_x = edges[0].a.x;
+    var max_x = edges[0].a.x;
+    var min_y = edges[0].a.y;
+    var max_y = edges[0].a.y;
+    for (edges) |edge| {
+        min_x = @min(min_x, @min(edge.a.x, edge.b.x));
+        max_x = @max(max_x, @max(edge.a.x, edge.b.x));
+        min_y = @min(min_y, @min(edge.a.y, edge.b.y));
+        max_y = @max(max_y, @max(edge.a.y, edge.b.y));
+    }
+    return .{ .min_x = min_x, .max_x = max_x, .min_y = min_y, .max_y = max_y };
+}
+
+fn sortScanIntersections(items: []ScanIntersection) void {
+    var i: usize = 1;
+    while (i < items.len) : (i += 1) {
+        const value = items[i];
+        var j = i;
+        while (j > 0 and items[j - 1].x > value.x) : (j -= 1) {
+            items[j] = items[j - 1];
+        }
+        items[j] = value;
+    }
+}
+
+pub fn collectScanIntersections(edges: []const Edge, y: f64, out: *[PATH_EDGE_LIMIT]ScanIntersection) usize {
+    var count: usize = 0;
+    for (edges) |edge| {
+        const ay = edge.a.y;
+        const by = edge.b.y;
+        if ((ay <= y and by > y) or (by <= y and ay > y)) {
+            if (count >= out.len) break;
+            const t = (y - ay) / (by - ay);
+            out[count] = .{
+                .x = edge.a.x + (edge.b.x - edge.a.x) * t,
+                .delta = if (by > ay) 1 else -1,
+            };
+            count += 1;
+        }
+    }
+    sortScanIntersections(out[0..count]);
+    return count;
+}
+
+fn edgeTop(edge: Edge) f64 {
+    return @min(edge.a.y, edge.b.y);
+}
+
+fn edgeTopLessThan(edges: []const Edge, a: u16, b: u16) bool {
+    return edgeTop(edges[a]) < edgeTop(edges[b]);
+}
+
+/// `collectScanIntersections` over the edges listed in `active`.
+fn collectActiveIntersections(edges: []const Edge, active: []const u16, y: f64, out: *[PATH_EDGE_LIMIT]ScanIntersection) usize {
+    var count: usize = 0;
+    for (active) |index| {
+        const edge = edges[index];
+        const ay = edge.a.y;
+        const by = edge.b.y;
+        if ((ay <= y and by > y) or (by <= y and ay > y)) {
+            const t = (y - ay) / (by - ay);
+            out[count] = .{
+                .x = edge.a.x + (edge.b.x - edge.a.x) * t,
+                .delta = if (by > ay) 1 else -1,
+            };
+            count += 1;
+        }
+    }
+    sortScanIntersections(out[0..count]);
+    return count;
+}
+
+/// Drops edges that cannot cross any sample row of a banded surface. The
+/// survivors keep their order, so scan intersections sort exactly as they
+/// would over the full edge list.
+pub fn binEdges(surface: *const Surface, edges: []const Edge, out: *[PATH_EDGE_LIMIT]Edge) []const Edge {
+    if (!surface.isBanded()) return edges;
+    const top = @as(f64, @floatFromInt(surface.firstRow()));
+    const bottom = @as(f64, @floatFromInt(surface.endRow()));
+    var count: usize = 0;
+    for (edges) |edge| {
+        if (@max(edge.a.y, edge.b.y) < top or @min(edge.a.y, edge.b.y) > bottom) continue;
+        if (count >= out.len) break;
+        out[count] = edge;
+        count += 1;
+    }
+    return out[0..count];
+}
+
+/// Whether pixels spanning device x in [min_x, max_x] can reach the clip
+/// columns. Fills and strokes outside them are skipped whole.
+pub fn touchesColumns(surface: *const Surface, min_x: f64, max_x: f64) bool {
+    return max_x + 1.0 >= @as(f64, @floatFromInt(surface.firstColumn())) and min_x - 1.0 < @as(f64, @floatFromInt(surface.endColumn()));
+}
+
+pub fn fillEdges(surface: *Surface, edges: []const Edge, fill: [4]u8) void {
+    if (edges.len == 0 or fill[3] == 0) return;
+    fillCoverageRows(surface, edges, SolidRowSink{ .fill = fill });
+}
+
+fn clampedColumn(surface: *const Surface, x: f64) i32 {
+    return @intFromFloat(std.math.clamp(x, -1.0, @as(f64, @floatFromInt(surface.width))));
+}
+
+const SolidRowSink = struct {
+    fill: [4]u8,
+
+    pub fn apply(self: SolidRowSink, surface: *Surface, py: i32, first_column: u32, row: []const f64) void {
+        applyCoverageRowAt(surface, py, first_column, row, self.fill);
+    }
+};
+
+/// Accumulates the 4x vertical subsample coverage of `edges` one pixel row
+/// at a time and hands it to `sink.apply(surface, py, first_column, row)`,
+/// where `row[i]` covers column `first_column + i`. Only the columns the
+/// shape and the clip share are covered, in tiles of at most
+/// `AA_ROW_COVERAGE_LIMIT`, so any surface width stays anti-aliased. Tile
+/// origins are whole pixels: shifting the span ends by an integer is exact
+/// in f64, so every pixel's coverage matches an untiled pass.
+pub fn fillCoverageRows(surface: *Surface, edges: []const Edge, sink: anytype) void {
+    const bounds = edgeBounds(edges);
+    if (!touchesColumns(surface, bounds.min_x, bounds.max_x)) return;
+    const y0: i32 = @as(i32, @intFromFloat(@floor(bounds.min_y))) - 1;
+    const y1: i32 = @as(i32, @intFromFloat(@ceil(bounds.max_y))) + 1;
+    const span = surface.rows(y0, y1);
+    if (span.first > span.last) return;
+    const cols = surface.columns(clampedColumn(surface, @floor(bounds.min_x)) - 1, clampedColumn(surface, @ceil(bounds.max_x)) + 1);
+    if (cols.first > cols.last) return;
+
+    var intersections: [PATH_EDGE_LIMIT]ScanIntersection = undefined;
+    var binned: [PATH_EDGE_LIMIT]Edge = undefined;
+    const band_edges = binEdges(surface, edges, &binned);
+    // Edge indices by top, so each pixel row scans only the edges spanning
+    // it. Crossings are sorted by x either way, so coverage is unchanged.
+    // Longer lists than the builders produce scan every edge.
+    const scan_active = band_edges.len <= PATH_EDGE_LIMIT;
+    var by_top: [PATH_EDGE_LIMIT]u16 = undefined;
+    var active: [PATH_EDGE_LIMIT]u16 = undefined;
+    const order = by_top[0..if (scan_active) band_edges.len else 0];
+    for (order, 0..) |*index, i| index.* = @intCast(i);
+    std.sort.pdq(u16, order, band_edges, edgeTopLessThan);
+    var row_coverage: [AA_ROW_COVERAGE_LIMIT]f64 = undefined;
+    const subpixel_grid_f64 = @as(f64, @floatFromInt(AA_SUBPIXEL_GRID));
+    const row_weight = 1.0 / subpixel_grid_f64;
+    const last_column: u32 = @intCast(cols.last);
+
+    var tile_start: u32 = @intCast(cols.first);
+    while (tile_start <= last_column) {
+        const tile_end = @min(last_column + 1, tile_start + @as(u32, AA_ROW_COVERAGE_LIMIT));
+        const tile_lo = @as(f64, @floatFromInt(tile_start));
+        const tile_hi = @as(f64, @floatFromInt(tile_end));
+        const row = row_coverage[0 .. tile_end - tile_start];
+
+        var next_edge: usize = 0;
+        var active_count: usize = 0;
+        var py = span.first;
+        while (py <= span.last) : (py += 1) {
+            @memset(row, 0.0);
+
+            const first_y = @as(f64, @floatFromInt(py)) + 0.5 / subpixel_grid_f64;
+            const last_y = @as(f64, @floatFromInt(py)) + (subpixel_grid_f64 - 0.5) / subpixel_grid_f64;
+            var kept: usize = 0;
+            for (active[0..active_count]) |index| {
+                if (@max(band_edges[index].a.y, band_edges[index].b.y) <= first_y) continue;
+                active[kept] = index;
+                kept += 1;
+            }
+            active_count = kept;
+            while (next_edge < order.len and edgeTop(band_edges[order[next_edge]]) <= last_y) : (next_edge += 1) {
+                active[active_count] = order[next_edge];
+                active_count += 1;
+            }
+
+            var sub_row: u32 = 0;
+            while (sub_row < AA_SUBPIXEL_GRID) : (sub_row += 1) {
+                const y = @as(f64, @floatFromInt(py)) + (@as(f64, @floatFromInt(sub_row)) + 0.5) / subpixel_grid_f64;
+                const count = if (scan_active)
+                    collectActiveIntersections(band_edges, active[0..active_count], y, &intersections)
+                else
+                    collectScanIntersections(band_edges, y, &intersections);
+                if (count == 0) continue;
+
+                var winding: i32 = 0;
+                var prev_x: f64 = intersections[0].x;
+                var i: usize = 0;
+                while (i < count) {
+                    const current_x = intersections[i].x;
+                    if (winding != 0) accumulateScanlineCoverage(row, @max(prev_x, tile_lo) - tile_lo, @min(current_x, tile_hi) - tile_lo, row_weight);
+
+                    var delta_sum: i32 = 0;
+                    while (i < count and @abs(intersections[i].x - current_x) <= 0.0000001) : (i += 1) {
+                        delta_sum += intersections[i].delta;
+                    }
+                    winding += delta_sum;
+                    prev_x = current_x;
+                }
+            }
+
+            sink.apply(surface, py, tile_start, row);
+        }
+        tile_start = tile_end;
+    }
+}
+
+pub fn clamp01(value: f64) f64 {
+    return std.math.clamp(value, 0.0, 1.0);
+}
+
+pub fn intervalCoverage(start: f64, end: f64, pixel_index: i32) f64 {
+    if (end <= start) return 0.0;
+    const pixel_start = @as(f64, @floatFromInt(pixel_index));
+    const pixel_end = pixel_start + 1.0;
+    return clamp01(@min(end, pixel_end) - @max(start, pixel_start));
+}
+
+pub fn fillCoverageForDistance(dist: f64, radius: f64) f64 {
+    return clamp01(radius + 0.5 - dist);
+}
+
+pub fn annulusCoverageForDistance(dist: f64, inner_radius: f64, outer_radius: f64) f64 {
+    const outer = fillCoverageForDistance(dist, outer_radius);
+    const inner = if (inner_radius <= 0.0) 0.0 else fillCoverageForDistance(dist, inner_radius);
+    return clamp01(outer - inner);
+}
+
+fn sampleCircleCoverage(cx: f64, cy: f64, radius: f64, px: i32, py: i32) f64 {
+    var inside: u32 = 0;
+    var sy: u32 = 0;
+    while (sy < CIRCLE_AA_SUBPIXEL_GRID) : (sy += 1) {
+        var sx: u32 = 0;
+        while (sx < CIRCLE_AA_SUBPIXEL_GRID) : (sx += 1) {
+            const sample_x = @as(f64, @floatFromInt(px)) + (@as(f64, @floatFromInt(sx)) + 0.5) / @as(f64, @floatFromInt(CIRCLE_AA_SUBPIXEL_GRID));
+            const sample_y = @as(f64, @floatFromInt(py)) + (@as(f64, @floatFromInt(sy)) + 0.5) / @as(f64, @floatFromInt(CIRCLE_AA_SUBPIXEL_GRID));
+            const dx = sample_x - cx;
+            const dy = sample_y - cy;
+            if (dx * dx + dy * dy <= radius * radius) inside += 1;
+        }
+    }
+    const total = @as(f64, @floatFromInt(CIRCLE_AA_SUBPIXEL_GRID * CIRCLE_AA_SUBPIXEL_GRID));
+    return @as(f64, @floatFromInt(inside)) / total;
+}
+
+fn sampleAnnulusCoverage(cx: f64, cy: f64, inner_radius: f64, outer_radius: f64, px: i32, py: i32) f64 {
+    var inside: u32 = 0;
+    const inner_sq = inner_radius * inner_radius;
+    const outer_sq = outer_radius * outer_radius;
+    var sy: u32 = 0;
+    while (sy < CIRCLE_AA_SUBPIXEL_GRID) : (sy += 1) {
+        var sx: u32 = 0;
+        while (sx < CIRCLE_AA_SUBPIXEL_GRID) : (sx += 1) {
+            const sample_x = @as(f64, @floatFromInt(px)) + (@as(f64, @floatFromInt(sx)) + 0.5) / @as(f64, @floatFromInt(CIRCLE_AA_SUBPIXEL_GRID));
+            const sample_y = @as(f64, @floatFromInt(py)) + (@as(f64, @floatFromInt(sy)) + 0.5) / @as(f64, @floatFromInt(CIRCLE_AA_SUBPIXEL_GRID));
+            const dx = sample_x - cx;
+            const dy = sample_y - cy;
+            const dist_sq = dx * dx + dy * dy;
+            if (dist_sq <= outer_sq and dist_sq >= inner_sq) inside += 1;
+        }
+    }
+    const total = @as(f64, @floatFromInt(CIRCLE_AA_SUBPIXEL_GRID * CIRCLE_AA_SUBPIXEL_GRID));
+    return @as(f64, @floatFromInt(inside)) / total;
+}
+
+pub fn rectCoverage(x0: f64, y0: f64, x1: f64, y1: f64, px: i32, py: i32) f64 {
+    return intervalCoverage(x0, x1, px) * intervalCoverage(y0, y1, py);
+}
+
+fn scaledAlpha(alpha: u8, coverage: f64) u8 {
+    const scaled = @as(f64, @floatFromInt(alpha)) * clamp01(coverage);
+    return @as(u8, @intFromFloat(std.math.clamp(@floor(scaled + 0.5), 0.0, 255.0)));
+}
+
+pub fn blendCoverage(dst: *[4]u8, src: [4]u8, coverage: f64) void {
+    if (src[3] == 0 or coverage <= 0.0) return;
+    if (coverage >= 0.999999) {
+        blend(dst, src);
+        return;
+    }
+
+    var adjusted = src;
+    adjusted[3] = scaledAlpha(src[3], coverage);
+    if (adjusted[3] == 0) return;
+    blend(dst, adjusted);
+}
+
+/// Adds `row_weight` times each pixel's share of [x_start, x_end) to `row`,
+/// saturating at 1. Pixels wholly inside the span take the vector path; the
+/// partial pixels at either end go through the scalar reference.
+pub fn accumulateScanlineCoverage(row: []f64, x_start: f64, x_end: f64, row_weight: f64) void {
+    if (row_weight <= 0.0 or x_end <= x_start or row.len == 0) return;
+    const px0 = @max(0, @as(i32, @intFromFloat(@floor(x_start))));
+    const px1 = @min(@as(i32, @intCast(row.len)), @as(i32, @intFromFloat(@ceil(x_end))));
+    if (px0 >= px1) return;
+    const full0 = std.math.clamp(@as(i32, @intFromFloat(@ceil(x_start))), px0, px1);
+    const full1 = std.math.clamp(@as(i32, @intFromFloat(@floor(x_end))), full0, px1);
+
+    accumulateCoverageSpan(row, x_start, x_end, row_weight, px0, full0);
+    var px: usize = @intCast(full0);
+    const end: usize = @intCast(full1);
+    const weight: CoverageLanes = @splat(row_weight);
+    const one: CoverageLanes = @splat(1.0);
+    while (px + BLEND_LANES <= end) : (px += BLEND_LANES) {
+        const lanes: *[BLEND_LANES]f64 = row[px..][0..BLEND_LANES];
+        const current: CoverageLanes = lanes.*;
+        lanes.* = @min(one, current + weight);
+    }
+    while (px < end) : (px += 1) row[px] = @min(1.0, row[px] + row_weight);
+    accumulateCoverageSpan(row, x_start, x_end, row_weight, full1, px1);
+}
+
+/// Scalar reference for `accumulateScanlineCoverage`.
+pub fn accumulateScanlineCoverageScalar(row: []f64, x_start: f64, x_end: f64, row_weight: f64) void {
+    if (row_weight <= 0.0 or x_end <= x_start or row.len == 0) return;
+    const px0 = @max(0, @as(i32, @intFromFloat(@floor(x_start))));
+    const px1 = @min(@as(i32, @intCast(row.len)), @as(i32, @intFromFloat(@ceil(x_end))));
+    accumulateCoverageSpan(row, x_start, x_end, row_weight, px0, px1);
+}
+
+fn accumulateCoverageSpan(row: []f64, x_start: f64, x_end: f64, row_weight: f64, px0: i32, px1: i32) void {
+    var px = px0;
+    while (px < px1) : (px += 1) {
+        const coverage = intervalCoverage(x_start, x_end, px) * row_weight;
+        if (coverage <= 0.0) continue;
+        const index: usize = @intCast(px);
+        row[index] = @min(1.0, row[index] + coverage);
+    }
+}
+
+/// Blends `fill` into row `py` with the per-pixel coverage in `row`,
+/// `BLEND_LANES` pixels at a time. Bytes match `applyCoverageRowScalar`.
+pub fn applyCoverageRow(surface: *Surface, py: i32, row: []const f64, fill: [4]u8) void {
+    applyCoverageRowAt(surface, py, 0, row, fill);
+}
+
+/// `applyCoverageRow` for a coverage row whose first entry is column
+/// `first_column`.
+pub fn applyCoverageRowAt(surface: *Surface, py: i32, first_column: u32, row: []const f64, fill: [4]u8) void {
+    if (fill[3] == 0 or py < surface.firstRow() or py >= surface.endRow()) return;
+    const start = @max(first_column, surface.firstColumn());
+    const end = @min(first_column + row.len, surface.endColumn());
+    if (start >= end) return;
+    const pixels = surface.pixels[surface.offset(start, @intCast(py))..][0 .. (end - start) * 4];
+    const coverage_row = row[start - first_column .. end - first_column];
+    const zero: CoverageLanes = @splat(0.0);
+
+    var px: usize = 0;
+    while (px + BLEND_LANES <= coverage_row.len) : (px += BLEND_LANES) {
+        const coverage: CoverageLanes = coverage_row[px..][0..BLEND_LANES].*;
+        if (@reduce(.And, coverage <= zero)) continue;
+        blendCoverageLanes(pixels[px * 4 ..][0 .. BLEND_LANES * 4], fill, coverage);
+    }
+    while (px < coverage_row.len) : (px += 1) {
+        if (coverage_row[px] > 0.0) blendCoverage(pixels[px * 4 ..][0..4], fill, coverage_row[px]);
+    }
+}
+
+/// Scalar reference for `applyCoverageRow`.
+pub fn applyCoverageRowScalar(surface: *Surface, py: i32, row: []const f64, fill: [4]u8) void {
+    var px: usize = 0;
+    while (px < row.len) : (px += 1) {
+        const coverage = row[px];
+        if (coverage <= 0.0) continue;
+        if (pixelPtr(surface, @intCast(px), py)) |dst| {
+            blendCoverage(dst, fill, coverage);
+        }
+    }
+}
+
+/// `blendCoverage` over `BLEND_LANES` adjacent RGBA pixels. The alpha scale
+/// keeps the scalar path's f64 rounding; compositing is integer.
+pub fn blendCoverageLanes(dst: *[BLEND_LANES * 4]u8, src: [4]u8, coverage: CoverageLanes) void {
+    const half: CoverageLanes = @splat(0.5);
+    const clamped = std.math.clamp(coverage, @as(CoverageLanes, @splat(0.0)), @as(CoverageLanes, @splat(1.0)));
+    const scaled = @floor(@as(CoverageLanes, @splat(@floatFromInt(src[3]))) * clamped + half);
+    const scaled_alpha: ChannelLanes = @intFromFloat(std.math.clamp(scaled, @as(CoverageLanes, @splat(0.0)), @as(CoverageLanes, @splat(255.0))));
+    const full = coverage >= @as(CoverageLanes, @splat(0.999999));
+    const src_a = @select(u32, full, @as(ChannelLanes, @splat(src[3])), scaled_alpha);
+    const active = src_a > @as(ChannelLanes, @splat(0));
+    if (!@reduce(.Or, active)) return;
+
+    const bytes: @Vector(BLEND_LANES * 4, u8) = dst.*;
+    const dst_a: ChannelLanes = @shuffle(u8, bytes, undefined, channelMask(3));
+    // Fully covered lanes that are opaque, or land on empty pixels, come out
+    // as `src` exactly; interiors of fills take this path.
+    if (@reduce(.And, full) and (src[3] == 255 or @reduce(.And, dst_a == @as(ChannelLanes, @splat(0))))) {
+        dst.* = @bitCast(@as([BLEND_LANES][4]u8, @splat(src)));
+        return;
+    }
+    // Lanes with one coverage over one background pixel blend alike, so
+    // blend the first and copy it.
+    const first: [4]u8 = dst[0..4].*;
+    if (@reduce(.And, coverage == @as(CoverageLanes, @splat(coverage[0]))) and @reduce(.And, bytes == @as(@Vector(BLEND_LANES * 4, u8), @bitCast(@as([BLEND_LANES][4]u8, @splat(first)))))) {
+        var pixel = first;
+        blendCoverage(&pixel, src, coverage[0]);
+        dst.* = @bitCast(@as([BLEND_LANES][4]u8, @splat(pixel)));
+        return;
+    }
+    const inv_a = @as(ChannelLanes, @splat(255)) - src_a;
+    const out_a = src_a + (dst_a * inv_a + @as(ChannelLanes, @splat(127))) / @as(ChannelLanes, @splat(255));
+    const denom = @select(u32, active, out_a * @as(ChannelLanes, @splat(255)), @as(ChannelLanes, @splat(1)));
+    const denom_f: CoverageLanes = @floatFromInt(denom);
+    const rounding = denom >> @splat(1);
+
+    var channels: [4]@Vector(BLEND_LANES, u8) = undefined;
+    inline for (0..3) |channel| {
+        const dst_c: ChannelLanes = @shuffle(u8, bytes, undefined, channelMask(channel));
+        const numer = @as(ChannelLanes, @splat(@as(u32, src[channel]) * 255)) * src_a + dst_c * dst_a * inv_a;
+        // Both operands stay below 2^26, so the f64 quotient floors to the
+        // same integer as the scalar division.
+        const quotient: ChannelLanes = @intFromFloat(@floor(@as(CoverageLanes, @floatFromInt(numer + rounding)) / denom_f));
+        const value = @min(quotient, @as(ChannelLanes, @splat(255)));
+        channels[channel] = @intCast(@select(u32, active, value, dst_c));
+    }
+    channels[3] = @intCast(@select(u32, active, @min(out_a, @as(ChannelLanes, @splat(255))), dst_a));
+
+    const rg = @shuffle(u8, channels[0], channels[1], interleaveMask(BLEND_LANES, 1));
+    const ba = @shuffle(u8, channels[2], channels[3], interleaveMask(BLEND_LANES, 1));
+    dst.* = @shuffle(u8, rg, ba, interleaveMask(BLEND_LANES * 2, 2));
+}
+
+fn channelMask(comptime channel: usize) @Vector(BLEND_LANES, i32) {
+    var mask: [BLEND_LANES]i32 = undefined;
+    for (&mask, 0..) |*entry, lane| entry.* = @intCast(lane * 4 + channel);
+    return mask;
+}
+
+/// Interleaves `width`-element groups of two `len`-element vectors.
+fn interleaveMask(comptime len: usize, comptime width: usize) @Vector(len * 2, i32) {
+    var mask: [len * 2]i32 = undefined;
+    for (0..len / width) |group| {
+        for (0..width) |k| {
+            mask[group * width * 2 + k] = @intCast(group * width + k);
+            mask[group * width * 2 + width + k] = ~@as(i32, @intCast(group * width + k));
+        }
+    }
+    return mask;
+}
+
+pub fn strokeEdges(surface: *Surface, edges: []const Edge, stroke: [4]u8, stroke_width: f64, dash_on: f64, dash_off: f64) void {
+    if (edges.len == 0 or stroke[3] == 0 or stroke_width <= 0.0) return;
+    for (edges) |edge| {
+        strokeEdge(surface, edge, stroke, stroke_width, dash_on, dash_off);
+    }
+}
+
+fn strokeEdge(surface: *Surface, edge: Edge, stroke: [4]u8, stroke_width: f64, dash_on: f64, dash_off: f64) void {
+    const edge_length = distance(edge.a, edge.b);
+    if (edge_length <= 0.0000001) {
+        drawLineSegment(surface, edge.a, edge.b, stroke, stroke_width);
+        return;
+    }
+
+    if (dash_on <= 0.0 or dash_off <= 0.0) {
+        drawLineSegment(surface, edge.a, edge.b, stroke, stroke_width);
+        return;
+    }
+
+    var cursor: f64 = 0.0;
+    var draw = true;
+    while (cursor < edge_length - 0.0000001) {
+        const span = if (draw) dash_on else dash_off;
+        if (span <= 0.0) break;
+        const next = @min(edge_length, cursor + span);
+        if (draw and next > cursor) {
+            drawLineSegment(
+                surface,
+                lerpPoint(edge.a, edge.b, cursor / edge_length),
+                lerpPoint(edge.a, edge.b, next / edge_length),
+                stroke,
+                stroke_width,
+            );
+        }
+        cursor = next;
+        draw = !draw;
+    }
+}
+
+pub fn drawLineSegment(surface: *Surface, a: Point, b: Point, stroke: [4]u8, stroke_width: f64) void {
+    if (stroke[3] == 0 or stroke_width <= 0.0) return;
+    const half = stroke_width / 2.0;
+    const min_x: i32 = @intFromFloat(@floor(@min(a.x, b.x) - half - 1.0));
+    const max_x: i32 = @intFromFloat(@ceil(@max(a.x, b.x) + half + 1.0));
+    const min_y: i32 = @intFromFloat(@floor(@min(a.y, b.y) - half - 1.0));
+    const max_y: i32 = @intFromFloat(@ceil(@max(a.y, b.y) + half + 1.0));
+
+    const span = surface.rows(min_y, max_y);
+    const cols = surface.columns(min_x, max_x);
+    var py = span.first;
+    while (py <= span.last) : (py += 1) {
+        var px = cols.first;
+        while (px <= cols.last) : (px += 1) {
+            if (pixelPtr(surface, px, py)) |dst| {
+                const p = Point{
+                    .x = @as(f64, @floatFromInt(px)) + 0.5,
+                    .y = @as(f64, @floatFromInt(py)) + 0.5,
+                };
+                const coverage = fillCoverageForDistance(distancePointToSegment(p, a, b), half);
+                if (coverage > 0.0) blendCoverage(dst, stroke, coverage);
+            }
+        }
+    }
+}
+
+fn distancePointToSegment(p: Point, a: Point, b: Point) f64 {
+    const dx = b.x - a.x;
+    const dy = b.y - a.y;
+    const len_sq = dx * dx + dy * dy;
+    if (len_sq <= 0.0000001) return distance(p, a);
+
+    const t = std.math.clamp(((p.x - a.x) * dx + (p.y - a.y) * dy) / len_sq, 0.0, 1.0);
+    const proj = Point{
+        .x = a.x + dx * t,
+        .y = a.y + dy * t,
+    };
+    return distance(p, proj);
+}
+
+pub fn lerpPoint(a: Point, b: Point, t: f64) Point {
+    return .{
+        .x = a.x + (b.x - a.x) * t,
+        .y = a.y + (b.y - a.y) * t,
+    };
+}
+
+fn cubicPoint(p0: Point, p1: Point, p2: Point, p3: Point, t: f64) Point {
+    const u = 1.0 - t;
+    const tt = t * t;
+    const uu = u * u;
+    const uuu = uu * u;
+    const ttt = tt * t;
+    return .{
+        .x = uuu * p0.x + 3.0 * uu * t * p1.x + 3.0 * u * tt * p2.x + ttt * p3.x,
+        .y = uuu * p0.y + 3.0 * uu * t * p1.y + 3.0 * u * tt * p2.y + ttt * p3.y,
+    };
+}
+
+fn cubicStepCount(p0: Point, p1: Point, p2: Point, p3: Point, scale: f64) u32 {
+    const scaled_len = (distance(p0, p1) + distance(p1, p2) + distance(p2, p3)) * @max(scale, 0.0001);
+    const steps = @as(u32, @intFromFloat(@ceil(scaled_len / 4.0)));
+    return @max(@as(u32, 4), @min(@as(u32, 24), steps));
+}
+
+fn quadraticPoint(p0: Point, p1: Point, p2: Point, t: f64) Point {
+    const u = 1.0 - t;
+    const tt = t * t;
+    const uu = u * u;
+    return .{
+        .x = uu * p0.x + 2.0 * u * t * p1.x + tt * p2.x,
+        .y = uu * p0.y + 2.0 * u * t * p1.y + tt * p2.y,
+    };
+}
+
+fn quadraticStepCount(p0: Point, p1: Point, p2: Point, scale: f64) u32 {
+    const scaled_len = (distance(p0, p1) + distance(p1, p2)) * @max(scale, 0.0001);
+    const steps = @as(u32, @intFromFloat(@ceil(scaled_len / 4.0)));
+    return @max(@as(u32, 4), @min(@as(u32, 20), steps));
+}
+
+pub fn distance(a: Point, b: Point) f64 {
+    const dx = b.x - a.x;
+    const dy = b.y - a.y;
+    return @sqrt(dx * dx + dy * dy);
+}
+
+pub fn isAxisAligned(m: Matrix) bool {
+    const eps = 0.0000001;
+    return @abs(m.b) < eps and @abs(m.c) < eps;
+}
+
+pub fn clear(surface: *Surface, rgba: [4]u8) void {
+    const first = surface.firstColumn();
+    const end = surface.endColumn();
+    if (first >= end) return;
+    var y: u32 = @intCast(surface.firstRow());
+    while (y < surface.endRow()) : (y += 1) {
+        const row = surface.pixels[surface.offset(first, y)..][0 .. (end - first) * 4];
+        @memset(std.mem.bytesAsSlice([4]u8, row), rgba);
+    }
+}
+
+pub fn drawRect(surface: *Surface, x: f64, y: f64, width: f64, height: f64, fill: [4]u8, stroke: [4]u8, stroke_width: f64) void {
+    const x0: i32 = @intFromFloat(@floor(x));
+    const y0: i32 = @intFromFloat(@floor(y));
+    const x1: i32 = @intFromFloat(@ceil(x + width));
+    const y1: i32 = @intFromFloat(@ceil(y + height));
+    const half_stroke = stroke_width / 2.0;
+    const span = surface.rows(y0, y1 - 1);
+
+    var py = span.first;
+    while (py <= span.last) : (py += 1) {
+        var px = x0;
+        while (px < x1) : (px += 1) {
+            if (pixelPtr(surface, px, py)) |dst| {
+                const fill_coverage = if (fill[3] > 0)
+                    rectCoverage(x, y, x + width, y + height, px, py)
+                else
+                    0.0;
+                const outer_coverage = if (stroke[3] > 0 and stroke_width > 0.0)
+                    rectCoverage(x - half_stroke, y - half_stroke, x + width + half_stroke, y + height + half_stroke, px, py)
+                else
+                    0.0;
+                const inner_coverage = if (stroke[3] > 0 and stroke_width > 0.0 and width > stroke_width and height > stroke_width)
+                    rectCoverage(x + half_stroke, y + half_stroke, x + width - half_stroke, y + height - half_stroke, px, py)
+                else
+                    0.0;
+                const stroke_coverage = clamp01(outer_coverage - inner_coverage);
+                if (fill_coverage > 0.0) blendCoverage(dst, fill, fill_coverage);
+                if (stroke_coverage > 0.0) blendCoverage(dst, stroke, stroke_coverage);
+            }
+        }
+    }
+}
+
+pub fn drawCircle(surface: *Surface, cx: f64, cy: f64, r: f64, fill: [4]u8, stroke: [4]u8, stroke_width: f64) void {
+    const half_stroke = stroke_width / 2.0;
+    const inner_radius = @max(0.0, r - half_stroke);
+    const outer_radius = r + half_stroke;
+    const min_x: i32 = @intFromFloat(@floor(cx - r - half_stroke - 1.0));
+    const max_x: i32 = @intFromFloat(@ceil(cx + r + half_stroke + 1.0));
+    const min_y: i32 = @intFromFloat(@floor(cy - r - half_stroke - 1.0));
+    const max_y: i32 = @intFromFloat(@ceil(cy + r + half_stroke + 1.0));
+
+    const span = surface.rows(min_y, max_y);
+    var py = span.first;
+    while (py <= span.last) : (py += 1) {
+        var px = min_x;
+        while (px <= max_x) : (px += 1) {
+            const dx = (@as(f64, @floatFromInt(px)) + 0.5) - cx;
+            const dy = (@as(f64, @floatFromInt(py)) + 0.5) - cy;
+            const dist = @sqrt(dx * dx + dy * dy);
+            if (pixelPtr(surface, px, py)) |dst| {
+                const fill_coverage = if (fill[3] > 0)
+                    if (dist <= r - PIXEL_CORNER_RADIUS)
+                        1.0
+                    else if (dist >= r + PIXEL_CORNER_RADIUS)
+                        0.0
+                    else
+                        sampleCircleCoverage(cx, cy, r, px, py)
+                else
+                    0.0;
+                const stroke_coverage = if (stroke[3] > 0 and stroke_width > 0.0)
+                    if (dist >= inner_radius + PIXEL_CORNER_RADIUS and dist <= outer_radius - PIXEL_CORNER_RADIUS)
+                        1.0
+                    else if (dist <= inner_radius - PIXEL_CORNER_RADIUS or dist >= outer_radius + PIXEL_CORNER_RADIUS)
+                        0.0
+                    else
+                        sampleAnnulusCoverage(cx, cy, inner_radius, outer_radius, px, py)
+                else
+                    0.0;
+                if (fill_coverage > 0.0) blendCoverage(dst, fill, fill_coverage);
+                if (stroke_coverage > 0.0) blendCoverage(dst, stroke, stroke_coverage);
+            }
+        }
+    }
+}
+
+pub fn pixelPtr(surface: *Surface, x: i32, y: i32) ?*[4]u8 {
+    if (x < 0 or y < 0) return null;
+    if (x < surface.firstColumn() or x >= surface.endColumn() or y < surface.firstRow() or y >= surface.endRow()) return null;
+    const offset = surface.offset(@intCast(x), @intCast(y));
+    return @ptrCast(surface.pixels[offset .. offset + 4]);
+}
+
+pub fn blend(dst: *[4]u8, src: [4]u8) void {
+    const src_a: u32 = src[3];
+    if (src_a == 0) return;
+    const dst_a: u32 = dst[3];
+    // Opaque sources, and any source over an empty pixel, round to `src`.
+    if (src_a == 255 or dst_a == 0) {
+        dst.* = src;
+        return;
+    }
+    const out_a: u32 = src_a + ((dst_a * (255 - src_a) + 127) / 255);
+    if (out_a == 0) {
+        dst.* = .{ 0, 0, 0, 0 };
+        return;
+    }
+
+    var channel: usize = 0;
+    while (channel < 3) : (channel += 1) {
+        const src_c: u32 = src[channel];
+        const dst_c: u32 = dst[channel];
+        const numer = src_c * src_a * 255 + dst_c * dst_a * (255 - src_a);
+        const denom = out_a * 255;
+        const value = if (denom == 0) 0 else (numer + (denom / 2)) / denom;
+        dst[channel] = @intCast(@min(value, 255));
+    }
+    dst[3] = @intCast(@min(out_a, 255));
+}
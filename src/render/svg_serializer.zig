@@ -6,7 +6,11 @@ pub const Mode = enum {
     pretty,
 };
 
-pub fn write(scene: ir.Scene, writer: anytype, mode: Mode) !void {
+/// Writes a text `ir.Scene` or a numeric `ir.NumericScene`. Numeric fields are
+/// printed in shortest round-trip form, so parsing the output back (for
+/// example with `ir.toNumeric`) reproduces the same values.
+pub fn write(scene: anytype, writer: anytype, mode: Mode) !void {
+    comptime std.debug.assert(@TypeOf(scene) == ir.Scene or @TypeOf(scene) == ir.NumericScene);
     _ = mode;
     for (scene.ops) |op| {
         switch (op) {
@@ -32,15 +36,50 @@ pub fn write(scene: ir.Scene, writer: anytype, mode: Mode) !void {
     }
 }
 
-fn writeAttr(writer: anytype, key: []const u8, value: []const u8) !void {
-    try writer.print(" {s}=\"{s}\"", .{ key, value });
+fn writeAttr(writer: anytype, key: []const u8, value: anytype) !void {
+    try writer.print(" {s}=\"", .{key});
+    try writeValue(writer, value);
+    try writer.writeByte('"');
 }
 
-fn writeStyleAttr(writer: anytype, key: []const u8, value: ?[]const u8) !void {
+fn writeStyleAttr(writer: anytype, key: []const u8, value: anytype) !void {
     if (value) |v| try writeAttr(writer, key, v);
 }
 
-fn writePath(writer: anytype, path: ir.Path) !void {
+fn writeValue(writer: anytype, value: anytype) !void {
+    switch (@TypeOf(value)) {
+        []const u8 => try writer.writeAll(value),
+        f64 => try writer.print("{d}", .{value}),
+        ir.Paint => switch (value) {
+            .none => try writer.writeAll("none"),
+            .color => |color| try writeColor(writer, color),
+        },
+        []const f64 => for (value, 0..) |number, index| {
+            if (index > 0) try writer.writeByte(',');
+            try writer.print("{d}", .{number});
+        },
+        []const ir.Point => for (value, 0..) |point, index| {
+            if (index > 0) try writer.writeByte(' ');
+            try writer.print("{d},{d}", .{ point.x, point.y });
+        },
+        []const ir.PathCommand => for (value) |command| switch (command) {
+            .move_to => |to| try writer.print("M{d},{d}", .{ to.x, to.y }),
+            .line_to => |to| try writer.print("L{d},{d}", .{ to.x, to.y }),
+            .cubic_to => |c| try writer.print("C{d},{d},{d},{d},{d},{d}", .{ c.c1.x, c.c1.y, c.c2.x, c.c2.y, c.to.x, c.to.y }),
+            .quad_to => |q| try writer.print("Q{d},{d},{d},{d}", .{ q.c.x, q.c.y, q.to.x, q.to.y }),
+            .close => try writer.writeByte('Z'),
+        },
+        else => @compileError("unsupported attribute type " ++ @typeName(@TypeOf(value))),
+    }
+}
+
+fn writeColor(writer: anytype, color: ir.Color) !void {
+    if (@as(u32, @bitCast(color)) == 0) return writer.writeAll("transparent");
+    try writer.print("#{x:0>2}{x:0>2}{x:0>2}", .{ color.r, color.g, color.b });
+    if (color.a != 255) try writer.print("{x:0>2}", .{color.a});
+}
+
+fn writePath(writer: anytype, path: anytype) !void {
     try writer.writeAll("<path");
     try writeStyleAttr(writer, "stroke", path.stroke);
     try writeStyleAttr(writer, "stroke-width", path.stroke_width);
@@ -51,16 +90,20 @@ fn writePath(writer: anytype, path: ir.Path) !void {
     while (i < path.spaces_before_d) : (i += 1) {
         try writer.writeByte(' ');
     }
-    try writer.print("d=\"{s}\"/>", .{path.d});
+    try writer.writeAll("d=\"");
+    try writeValue(writer, path.d);
+    try writer.writeAll("\"/>");
     if (path.newline) try writer.writeByte('\n');
 }
 
-fn writeRect(writer: anytype, rect: ir.Rect) !void {
+fn writeRect(writer: anytype, rect: anytype) !void {
     try writer.writeAll("<rect");
     try writeAttr(writer, "x", rect.x);
     try writeAttr(writer, "y", rect.y);
     try writeAttr(writer, "width", rect.width);
     try writeAttr(writer, "height", rect.height);
+    try writeStyleAttr(writer, "rx", rect.rx);
+    try writeStyleAttr(writer, "ry", rect.ry);
     try writeStyleAttr(writer, "stroke", rect.stroke);
     try writeStyleAttr(writer, "stroke-width", rect.stroke_width);
     try writeStyleAttr(writer, "fill", rect.fill);
@@ -68,7 +111,7 @@ fn writeRect(writer: anytype, rect: ir.Rect) !void {
     if (rect.newline) try writer.writeByte('\n');
 }
 
-fn writeCircle(writer: anytype, circle: ir.Circle) !void {
+fn writeCircle(writer: anytype, circle: anytype) !void {
     try writer.writeAll("<circle");
     try writeAttr(writer, "cx", circle.cx);
     try writeAttr(writer, "cy", circle.cy);
@@ -80,7 +123,7 @@ fn writeCircle(writer: anytype, circle: ir.Circle) !void {
     if (circle.newline) try writer.writeByte('\n');
 }
 
-fn writeEllipse(writer: anytype, ellipse: ir.Ellipse) !void {
+fn writeEllipse(writer: anytype, ellipse: anytype) !void {
     try writer.writeAll("<ellipse");
     try writeAttr(writer, "cx", ellipse.cx);
     try writeAttr(writer, "cy", ellipse.cy);
@@ -93,7 +136,7 @@ fn writeEllipse(writer: anytype, ellipse: ir.Ellipse) !void {
     if (ellipse.newline) try writer.writeByte('\n');
 }
 
-fn writeLine(writer: anytype, line: ir.Line) !void {
+fn writeLine(writer: anytype, line: anytype) !void {
     try writer.writeAll("<line");
     try writeAttr(writer, "x1", line.x1);
     try writeAttr(writer, "y1", line.y1);
@@ -107,7 +150,7 @@ fn writeLine(writer: anytype, line: ir.Line) !void {
     if (line.newline) try writer.writeByte('\n');
 }
 
-fn writePolyline(writer: anytype, polyline: ir.Polyline) !void {
+fn writePolyline(writer: anytype, polyline: anytype) !void {
     try writer.writeAll("<polyline");
     try writeAttr(writer, "points", polyline.points);
     try writeStyleAttr(writer, "stroke", polyline.stroke);
@@ -118,7 +161,7 @@ fn writePolyline(writer: anytype, polyline: ir.Polyline) !void {
     if (polyline.newline) try writer.writeByte('\n');
 }
 
-fn writePolygon(writer: anytype, polygon: ir.Polygon) !void {
+fn writePolygon(writer: anytype, polygon: anytype) !void {
     try writer.writeAll("<polygon");
     try writeAttr(writer, "points", polygon.points);
     try writeStyleAttr(writer, "stroke", polygon.stroke);
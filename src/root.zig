@@ -15,6 +15,7 @@ pub const fc_components = @import("fc_components.zig");
 pub const interval_analysis = @import("interval_analysis.zig");
 pub const cluster = @import("cluster.zig");
 pub const evenness = @import("evenness.zig");
+pub const pcs_batch = @import("pcs_batch.zig");
 pub const even_compat_model = @import("even_compat_model.zig");
 pub const ordered_scale = @import("ordered_scale.zig");
 pub const scale = @import("scale.zig");
@@ -56,9 +57,17 @@ pub const svg_n_tet_chart = @import("svg/n_tet_chart.zig");
 pub const svg_majmin_scene = @import("svg/majmin_scene.zig");
 pub const harmonious_svg_compat = @import("harmonious_svg_compat.zig");
 pub const bitmap_compat = @import("bitmap_compat.zig");
+pub const compat_catalog = @import("compat_catalog.zig");
+pub const heap = @import("heap.zig");
+pub const xz_pack = @import("xz_pack.zig");
 pub const render_ir = @import("render/ir.zig");
 pub const render_svg_serializer = @import("render/svg_serializer.zig");
 pub const render_raster = @import("render/raster.zig");
+pub const render_cache = @import("render/cache.zig");
+pub const render_incremental = @import("render/incremental.zig");
+pub const render_png = @import("render/png.zig");
+pub const render_qoi = @import("render/qoi.zig");
+pub const prerendered_assets = @import("prerendered_assets.zig");
 
 test {
     _ = @import("tests/pitch_test.zig");
@@ -66,6 +75,7 @@ test {
     _ = @import("tests/set_class_test.zig");
     _ = @import("tests/interval_analysis_test.zig");
     _ = @import("tests/cluster_evenness_test.zig");
+    _ = @import("tests/pcs_batch_test.zig");
     _ = @import("tests/even_compat_model_test.zig");
     _ = @import("tests/ordered_scale_test.zig");
     _ = @import("tests/barry_harris_test.zig");
@@ -104,6 +114,15 @@ test {
     _ = @import("tests/render_ir_test.zig");
     _ = @import("tests/raster_test.zig");
     _ = @import("bitmap_compat.zig");
+    _ = @import("compat_catalog.zig");
+    _ = @import("heap.zig");
+    _ = @import("xz_pack.zig");
+    _ = @import("pack_sidecar.zig");
+    _ = @import("render/cache.zig");
+    _ = @import("render/incremental.zig");
+    _ = @import("render/png.zig");
+    _ = @import("render/qoi.zig");
+    _ = @import("prerendered_assets.zig");
     _ = @import("tests/c_api_test.zig");
     _ = @import("tests/tables_test.zig");
     _ = @import("tests/integration_test.zig");
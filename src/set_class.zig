@@ -1,5 +1,6 @@
 const pcs = @import("pitch_class_set.zig");
 const forte = @import("forte.zig");
+const set_tables = @import("tables/set_classes.zig");
 
 pub const ClassificationFlags = packed struct(u16) {
     cluster_free: bool = false,
@@ -17,7 +18,25 @@ pub const SetClass = struct {
     flags: ClassificationFlags,
 };
 
+// Runtime calls read the dense `tables.set_classes` entry for the set. The
+// rotation-based `compute*` versions build that table at comptime.
+
 pub fn primeForm(set: pcs.PitchClassSet) pcs.PitchClassSet {
+    if (@inComptime()) return computePrimeForm(set);
+    return set_tables.info(set).prime;
+}
+
+pub fn fortePrime(set: pcs.PitchClassSet) pcs.PitchClassSet {
+    if (@inComptime()) return computeFortePrime(set);
+    return set_tables.info(set).forte_prime;
+}
+
+pub fn numTranspositions(set: pcs.PitchClassSet) u4 {
+    if (@inComptime()) return computeNumTranspositions(set);
+    return set_tables.info(set).transpositions;
+}
+
+pub fn computePrimeForm(set: pcs.PitchClassSet) pcs.PitchClassSet {
     const rots = pcs.allRotations(set);
     var best = rots[0];
     for (rots[1..]) |r| {
@@ -26,13 +45,13 @@ pub fn primeForm(set: pcs.PitchClassSet) pcs.PitchClassSet {
     return best;
 }
 
-pub fn fortePrime(set: pcs.PitchClassSet) pcs.PitchClassSet {
-    const prime = primeForm(set);
-    const inverted = primeForm(pcs.invert(set));
+pub fn computeFortePrime(set: pcs.PitchClassSet) pcs.PitchClassSet {
+    const prime = computePrimeForm(set);
+    const inverted = computePrimeForm(pcs.invert(set));
     return if (inverted < prime) inverted else prime;
 }
 
-pub fn numTranspositions(set: pcs.PitchClassSet) u4 {
+pub fn computeNumTranspositions(set: pcs.PitchClassSet) u4 {
     const rots = pcs.allRotations(set);
     var seen = [_]bool{false} ** 4096;
     var count: u4 = 0;
@@ -32,6 +32,52 @@ pub fn circlePosition(pc: pitch.PitchClass, center: f64, radius: f64) Point {
     };
 }
 
+// Node markup up to the fill color, formatted at compile time. The ring
+// geometry never changes, so renders only pick a fill per node.
+const OPC_NODE_HEADS = nodeHeads(50.0, 50.0, 42.0, "<circle class=\"opc-node\" transform=\"scale(0.877),translate(7,7)\" cx=\"{d:.12}\" cy=\"{d:.12}\" r=\"9.5\" stroke=\"{s}\" stroke-width=\"3\" fill=\"");
+const OPTC_NODE_HEADS = nodeHeads(50.0, 50.0, 42.0, "<circle class=\"optc-node\" cx=\"{d:.2}\" cy=\"{d:.2}\" r=\"10\" stroke=\"{s}\" stroke-width=\"3\" fill=\"");
+const OPTIC_K_LEFT_WHEEL = wheelMarkup(68.0, 70.0);
+const OPTIC_K_RIGHT_WHEEL = wheelMarkup(212.0, 70.0);
+const OPTIC_K_TITLE = text_misc.comptimeBlockText("OPTIC/K", 140.0, 12.0, 1.55, 0.55, "#24323d", .center, "optic-k-title");
+const OPTIC_K_SELF_CHIP = opticKChip("SELF-COMPLEMENTARY");
+const OPTIC_K_PAIRED_CHIP = opticKChip("COMPLEMENT-PAIRED");
+
+fn opticKChip(comptime state: []const u8) []const u8 {
+    return text_misc.comptimeBlockText(state, 140.0, 64.0, 0.95, 0.45, "#6b5f55", .center, "optic-k-chip");
+}
+
+const WheelMarkup = struct {
+    ring: []const u8,
+    node_heads: [12][]const u8,
+};
+
+fn wheelMarkup(comptime center_x: f64, comptime center_y: f64) WheelMarkup {
+    const radius = 28.0;
+    const node_radius = 7.0;
+    const ring_radius = 13.0;
+    return .{
+        .ring = std.fmt.comptimePrint(
+            "<circle class=\"optic-k-ring\" cx=\"{d:.2}\" cy=\"{d:.2}\" r=\"{d:.2}\" fill=\"none\" stroke=\"#111\" stroke-width=\"1.75\" />\n",
+            .{ center_x, center_y, ring_radius },
+        ),
+        .node_heads = nodeHeads(center_x, center_y, radius, std.fmt.comptimePrint(
+            "<circle class=\"optic-k-node\" cx=\"{{d:.2}}\" cy=\"{{d:.2}}\" r=\"{d:.2}\" stroke=\"{{s}}\" stroke-width=\"2.8\" fill=\"",
+            .{node_radius},
+        )),
+    };
+}
+
+/// Formats `fmt` with each pitch class's ring position and stroke color.
+fn nodeHeads(comptime center_x: f64, comptime center_y: f64, comptime radius: f64, comptime fmt: []const u8) [12][]const u8 {
+    @setEvalBranchQuota(200_000);
+    var heads: [12][]const u8 = undefined;
+    for (&heads, 0..) |*head, pc| {
+        const p = circlePositionScaled(@intCast(pc), center_x, center_y, radius);
+        head.* = std.fmt.comptimePrint(fmt, .{ p.x, p.y, OPC_STROKE_COLORS[pc] });
+    }
+    return heads;
+}
+
 pub fn renderOPC(set: pcs.PitchClassSet, buf: []u8) []u8 {
     var stream = std.io.fixedBufferStream(buf);
     const w = stream.writer();
@@ -45,12 +91,7 @@ pub fn renderOPC(set: pcs.PitchClassSet, buf: []u8) []u8 {
     var pc: u4 = 0;
     while (pc < 12) : (pc += 1) {
         const present = (set & (@as(pcs.PitchClassSet, 1) << pc)) != 0;
-        const fill = if (present) OPC_FILL_COLORS[pc] else "white";
-
-        w.print(
-            "<circle class=\"opc-node\" transform=\"scale(0.877),translate(7,7)\" cx=\"{d:.12}\" cy=\"{d:.12}\" r=\"9.5\" stroke=\"{s}\" stroke-width=\"3\" fill=\"{s}\" />\n",
-            .{ circlePosition(@intCast(pc), 50.0, 42.0).x, circlePosition(@intCast(pc), 50.0, 42.0).y, OPC_STROKE_COLORS[pc], fill },
-        ) catch unreachable;
+        writeNode(w, OPC_NODE_HEADS[pc], if (present) OPC_FILL_COLORS[pc] else "white") catch unreachable;
     }
 
     w.writeAll("</svg>\n") catch unreachable;
@@ -61,36 +102,27 @@ pub fn renderOPTC(set: pcs.PitchClassSet, prime_label: []const u8, buf: []u8) []
     var stream = std.io.fixedBufferStream(buf);
     const w = stream.writer();
 
-    const cluster_info = cluster.getClusters(set);
-    svg_quality.writeSvgPrelude(w, "70", "70", "-7 -7 114 114",
+    writeOPTCPrefix(w) catch unreachable;
+    writeOPTCBody(set, prime_label, w) catch unreachable;
+    return buf[0..stream.pos];
+}
+
+/// Writes the set-independent head of an OPTC clock: prelude, background,
+/// and ring.
+pub fn writeOPTCPrefix(w: anytype) !void {
+    try svg_quality.writeSvgPrelude(w, "70", "70", "-7 -7 114 114",
         \\.optc-bg{fill:white}
         \\.optc-ring{fill:none;stroke:black;stroke-width:2}
         \\.optc-node{stroke-width:3}
         \\
-    ) catch unreachable;
-    w.writeAll("<rect class=\"optc-bg\" x=\"-7\" y=\"-7\" width=\"114\" height=\"114\" fill=\"white\" />\n") catch unreachable;
-    w.writeAll("<circle class=\"optc-ring\" cx=\"50.00\" cy=\"50.00\" r=\"20\" fill=\"none\" stroke=\"black\" stroke-width=\"2\" />\n") catch unreachable;
-
-    var pc: u4 = 0;
-    while (pc < 12) : (pc += 1) {
-        const p = circlePosition(@as(pitch.PitchClass, @intCast(pc)), 50.0, 42.0);
-        const bit = @as(pcs.PitchClassSet, 1) << pc;
-        const present = (set & bit) != 0;
-        const in_cluster = (cluster_info.cluster_mask & bit) != 0;
-
-        const stroke = OPC_STROKE_COLORS[pc];
-        const fill = if (!present)
-            "white"
-        else if (in_cluster)
-            OPC_STROKE_COLORS[pc]
-        else
-            OPC_FILL_COLORS[pc];
+    );
+    try w.writeAll("<rect class=\"optc-bg\" x=\"-7\" y=\"-7\" width=\"114\" height=\"114\" fill=\"white\" />\n");
+    try w.writeAll("<circle class=\"optc-ring\" cx=\"50.00\" cy=\"50.00\" r=\"20\" fill=\"none\" stroke=\"black\" stroke-width=\"2\" />\n");
+}
 
-        w.print(
-            "<circle class=\"optc-node\" cx=\"{d:.2}\" cy=\"{d:.2}\" r=\"10\" stroke=\"{s}\" stroke-width=\"3\" fill=\"{s}\" />\n",
-            .{ p.x, p.y, stroke, fill },
-        ) catch unreachable;
-    }
+/// Writes the set-dependent nodes and label, then closes the document.
+pub fn writeOPTCBody(set: pcs.PitchClassSet, prime_label: []const u8, w: anytype) !void {
+    try writeClusterNodes(w, set, &OPTC_NODE_HEADS);
 
     var label_path_buf: [8 * 1024]u8 = undefined;
     const label_path = text_misc.horizontalPathData(prime_label, &label_path_buf);
@@ -98,22 +130,25 @@ pub fn renderOPTC(set: pcs.PitchClassSet, prime_label: []const u8, buf: []u8) []
         const scale = @min(0.52, 22.0 / @max(horizontal.width, 1.0));
         const label_x = 50.0 - @as(f64, horizontal.width) * scale / 2.0;
         const label_y = 46.4;
-        w.print(
+        try w.print(
             "<g transform=\"translate({d:.3},{d:.3}) scale({d:.3})\"><path fill=\"#111\" d=\"{s}\" /></g>\n",
             .{ label_x, label_y, scale, horizontal.d },
-        ) catch unreachable;
+        );
     } else {
-        text_misc.writeBlockText(w, prime_label, 50.0, 43.0, 1.7, 0.45, "#111", .center, "optc-fallback-label") catch unreachable;
+        try text_misc.writeBlockText(w, prime_label, 50.0, 43.0, 1.7, 0.45, "#111", .center, "optc-fallback-label");
     }
-    w.writeAll("</svg>\n") catch unreachable;
-
-    return buf[0..stream.pos];
+    try w.writeAll("</svg>\n");
 }
 
 pub fn renderOpticKGroup(set: pcs.PitchClassSet, buf: []u8) []u8 {
     var stream = std.io.fixedBufferStream(buf);
-    const w = stream.writer();
+    writeOpticKGroup(set, stream.writer()) catch unreachable;
+    return buf[0..stream.pos];
+}
 
+/// Streams the OPTIC/K group diagram into any writer. `renderOpticKGroup`
+/// is this function over a fixed buffer.
+pub fn writeOpticKGroup(set: pcs.PitchClassSet, w: anytype) !void {
     const safe_set = set & 0x0fff;
     const left_set = set_class.fortePrime(safe_set);
     const right_set = set_class.fortePrime(pcs.complement(safe_set));
@@ -137,37 +172,34 @@ pub fn renderOpticKGroup(set: pcs.PitchClassSet, buf: []u8) []u8 {
     const right_set_label = pcs.format(right_set, &right_set_label_buf);
     const left_forte_label = forteLabel(left_forte, &left_forte_label_buf);
     const right_forte_label = forteLabel(right_forte, &right_forte_label_buf);
-    const group_state = if (left_set == right_set) "self-complementary" else "complement-paired";
 
-    svg_quality.writeSvgPrelude(w, "280", "140", "0 0 280 140",
+    try svg_quality.writeSvgPrelude(w, "280", "140", "0 0 280 140",
         \\.optic-k-bg{fill:white}
         \\.optic-k-card{fill:rgba(255,255,255,0.94);stroke:rgba(17,24,39,0.08);stroke-width:1.2}
         \\.optic-k-link{fill:none;stroke:#8d7f74;stroke-width:1.8;stroke-linecap:round;stroke-linejoin:round}
         \\.optic-k-ring{fill:none;stroke:#111;stroke-width:1.75}
         \\.optic-k-node{stroke-width:2.8}
         \\
-    ) catch unreachable;
-    w.writeAll("<rect class=\"optic-k-bg\" x=\"0\" y=\"0\" width=\"280\" height=\"140\" fill=\"white\" />\n") catch unreachable;
-    w.writeAll("<rect class=\"optic-k-card\" x=\"8\" y=\"8\" width=\"120\" height=\"124\" rx=\"18\" fill=\"rgba(255,255,255,0.94)\" stroke=\"rgba(17,24,39,0.08)\" stroke-width=\"1.2\" />\n") catch unreachable;
-    w.writeAll("<rect class=\"optic-k-card\" x=\"152\" y=\"8\" width=\"120\" height=\"124\" rx=\"18\" fill=\"rgba(255,255,255,0.94)\" stroke=\"rgba(17,24,39,0.08)\" stroke-width=\"1.2\" />\n") catch unreachable;
-    w.writeAll("<path class=\"optic-k-link\" d=\"M118 57 C138 46, 142 46, 162 57 M118 83 C138 94, 142 94, 162 83\" fill=\"none\" stroke=\"#8d7f74\" stroke-width=\"1.8\" stroke-linecap=\"round\" stroke-linejoin=\"round\" />\n") catch unreachable;
-    text_misc.writeBlockText(w, "OPTIC/K", 140.0, 12.0, 1.55, 0.55, "#24323d", .center, "optic-k-title") catch unreachable;
-    text_misc.writeBlockText(w, upperOpticKState(group_state), 140.0, 64.0, 0.95, 0.45, "#6b5f55", .center, "optic-k-chip") catch unreachable;
-
-    writeOpticKWheel(w, left_set, 68.0, 70.0, 28.0, 7.0, 13.0);
-    writeOpticKWheel(w, right_set, 212.0, 70.0, 28.0, 7.0, 13.0);
-
-    text_misc.writeBlockText(w, left_forte_label, 68.0, 100.0, 1.25, 0.42, "#111", .center, "optic-k-label") catch unreachable;
+    );
+    try w.writeAll("<rect class=\"optic-k-bg\" x=\"0\" y=\"0\" width=\"280\" height=\"140\" fill=\"white\" />\n");
+    try w.writeAll("<rect class=\"optic-k-card\" x=\"8\" y=\"8\" width=\"120\" height=\"124\" rx=\"18\" fill=\"rgba(255,255,255,0.94)\" stroke=\"rgba(17,24,39,0.08)\" stroke-width=\"1.2\" />\n");
+    try w.writeAll("<rect class=\"optic-k-card\" x=\"152\" y=\"8\" width=\"120\" height=\"124\" rx=\"18\" fill=\"rgba(255,255,255,0.94)\" stroke=\"rgba(17,24,39,0.08)\" stroke-width=\"1.2\" />\n");
+    try w.writeAll("<path class=\"optic-k-link\" d=\"M118 57 C138 46, 142 46, 162 57 M118 83 C138 94, 142 94, 162 83\" fill=\"none\" stroke=\"#8d7f74\" stroke-width=\"1.8\" stroke-linecap=\"round\" stroke-linejoin=\"round\" />\n");
+    try w.writeAll(OPTIC_K_TITLE);
+    try w.writeAll(if (left_set == right_set) OPTIC_K_SELF_CHIP else OPTIC_K_PAIRED_CHIP);
+
+    try writeOpticKWheel(w, left_set, &OPTIC_K_LEFT_WHEEL);
+    try writeOpticKWheel(w, right_set, &OPTIC_K_RIGHT_WHEEL);
+
+    try text_misc.writeBlockText(w, left_forte_label, 68.0, 100.0, 1.25, 0.42, "#111", .center, "optic-k-label");
     var left_set_display_buf: [18]u8 = undefined;
     const left_set_display = std.fmt.bufPrint(&left_set_display_buf, "[{s}]", .{left_set_label}) catch unreachable;
-    text_misc.writeBlockText(w, left_set_display, 68.0, 114.0, 0.95, 0.36, "#475569", .center, "optic-k-set") catch unreachable;
-    text_misc.writeBlockText(w, right_forte_label, 212.0, 100.0, 1.25, 0.42, "#111", .center, "optic-k-label") catch unreachable;
+    try text_misc.writeBlockText(w, left_set_display, 68.0, 114.0, 0.95, 0.36, "#475569", .center, "optic-k-set");
+    try text_misc.writeBlockText(w, right_forte_label, 212.0, 100.0, 1.25, 0.42, "#111", .center, "optic-k-label");
     var right_set_display_buf: [18]u8 = undefined;
     const right_set_display = std.fmt.bufPrint(&right_set_display_buf, "[{s}]", .{right_set_label}) catch unreachable;
-    text_misc.writeBlockText(w, right_set_display, 212.0, 114.0, 0.95, 0.36, "#475569", .center, "optic-k-set") catch unreachable;
-    w.writeAll("</svg>\n") catch unreachable;
-
-    return buf[0..stream.pos];
+    try text_misc.writeBlockText(w, right_set_display, 212.0, 114.0, 0.95, 0.36, "#475569", .center, "optic-k-set");
+    try w.writeAll("</svg>\n");
 }
 
 pub fn generateAllOPTCFiles(dir: std.fs.Dir) !void {
@@ -184,34 +216,34 @@ pub fn generateAllOPTCFiles(dir: std.fs.Dir) !void {
     }
 }
 
-fn writeOpticKWheel(w: anytype, set: pcs.PitchClassSet, center_x: f64, center_y: f64, radius: f64, node_radius: f64, ring_radius: f64) void {
-    const cluster_info = cluster.getClusters(set);
-    w.print(
-        "<circle class=\"optic-k-ring\" cx=\"{d:.2}\" cy=\"{d:.2}\" r=\"{d:.2}\" fill=\"none\" stroke=\"#111\" stroke-width=\"1.75\" />\n",
-        .{ center_x, center_y, ring_radius },
-    ) catch unreachable;
+fn writeOpticKWheel(w: anytype, set: pcs.PitchClassSet, wheel: *const WheelMarkup) !void {
+    try w.writeAll(wheel.ring);
+    try writeClusterNodes(w, set, &wheel.node_heads);
+}
 
+/// Writes one node per pitch class: white when absent, the stroke color
+/// inside a cluster, and the fill color otherwise.
+fn writeClusterNodes(w: anytype, set: pcs.PitchClassSet, heads: *const [12][]const u8) !void {
+    const cluster_info = cluster.getClusters(set);
     var pc: u4 = 0;
     while (pc < 12) : (pc += 1) {
-        const p = circlePositionScaled(@as(pitch.PitchClass, @intCast(pc)), center_x, center_y, radius);
         const bit = @as(pcs.PitchClassSet, 1) << pc;
-        const present = (set & bit) != 0;
-        const in_cluster = (cluster_info.cluster_mask & bit) != 0;
-        const stroke = OPC_STROKE_COLORS[pc];
-        const fill = if (!present)
+        const fill = if ((set & bit) == 0)
             "white"
-        else if (in_cluster)
+        else if ((cluster_info.cluster_mask & bit) != 0)
             OPC_STROKE_COLORS[pc]
         else
             OPC_FILL_COLORS[pc];
-
-        w.print(
-            "<circle class=\"optic-k-node\" cx=\"{d:.2}\" cy=\"{d:.2}\" r=\"{d:.2}\" stroke=\"{s}\" stroke-width=\"2.8\" fill=\"{s}\" />\n",
-            .{ p.x, p.y, node_radius, stroke, fill },
-        ) catch unreachable;
+        try writeNode(w, heads[pc], fill);
     }
 }
 
+fn writeNode(w: anytype, head: []const u8, fill: []const u8) !void {
+    try w.writeAll(head);
+    try w.writeAll(fill);
+    try w.writeAll("\" />\n");
+}
+
 fn circlePositionScaled(pc: pitch.PitchClass, center_x: f64, center_y: f64, radius: f64) Point {
     const angle = TAU * (@as(f64, @floatFromInt(pc)) / 12.0);
     return .{
@@ -229,8 +261,3 @@ fn forteLabel(number: forte.ForteNumber, out: *[16]u8) []u8 {
     }
     return std.fmt.bufPrint(out, "{d}-{d}", .{ number.cardinality, number.ordinal }) catch unreachable;
 }
-
-fn upperOpticKState(group_state: []const u8) []const u8 {
-    if (std.mem.eql(u8, group_state, "self-complementary")) return "SELF-COMPLEMENTARY";
-    return "COMPLEMENT-PAIRED";
-}
@@ -101,92 +101,139 @@ fn findHighlightedDot(dots: []const Dot, set: pcs.PitchClassSet) ?Dot {
 
 fn renderEvennessFieldInternal(highlight_set: ?pcs.PitchClassSet, buf: []u8) []u8 {
     var stream = std.io.fixedBufferStream(buf);
-    const w = stream.writer();
-
-    var dots_buf: [MAX_DOTS]Dot = undefined;
-    const dots = computeDots(&dots_buf);
-    const bounds = chartBounds(dots);
-    const target_width: f32 = 500.0;
-    const target_height: f32 = 650.0;
-    const pad_x: f32 = 34.0;
-    const pad_y: f32 = 38.0;
-    const scale = @min(
-        (target_width - pad_x * 2.0) / bounds.width,
-        (target_height - pad_y * 2.0) / bounds.height,
-    );
-    const center_x = bounds.min_x + bounds.width / 2.0;
-    const center_y = bounds.min_y + bounds.height / 2.0;
-
-    svg_quality.writeSvgPrelude(w, "500", "650", "0 0 500 650", "") catch unreachable;
-    w.writeAll("<rect x=\"0\" y=\"0\" width=\"500\" height=\"650\" fill=\"white\" />\n") catch unreachable;
+    writeEvennessFieldInternal(highlight_set, stream.writer()) catch unreachable;
+    return buf[0..stream.pos];
+}
+
+const FIELD_WIDTH: f32 = 500.0;
+const FIELD_HEIGHT: f32 = 650.0;
+pub const FIELD_CLOSE = "</svg>\n";
+
+/// Dot positions and chart transform shared by every evenness field render.
+/// Batch renderers build one layout and reuse it for each highlighted set.
+pub const FieldLayout = struct {
+    dots_buf: [MAX_DOTS]Dot,
+    dot_count: usize,
+    scale: f32,
+    center_x: f32,
+    center_y: f32,
+
+    pub fn init(self: *FieldLayout) void {
+        const dots_slice = computeDots(&self.dots_buf);
+        const bounds = chartBounds(dots_slice);
+        const pad_x: f32 = 34.0;
+        const pad_y: f32 = 38.0;
+        self.dot_count = dots_slice.len;
+        self.scale = @min(
+            (FIELD_WIDTH - pad_x * 2.0) / bounds.width,
+            (FIELD_HEIGHT - pad_y * 2.0) / bounds.height,
+        );
+        self.center_x = bounds.min_x + bounds.width / 2.0;
+        self.center_y = bounds.min_y + bounds.height / 2.0;
+    }
+
+    pub fn dots(self: *const FieldLayout) []const Dot {
+        return self.dots_buf[0..self.dot_count];
+    }
+
+    fn screenX(self: *const FieldLayout, x: f32) f32 {
+        return FIELD_WIDTH / 2.0 + (x - self.center_x) * self.scale;
+    }
+
+    fn screenY(self: *const FieldLayout, y: f32) f32 {
+        return FIELD_HEIGHT / 2.0 + (y - self.center_y) * self.scale;
+    }
+};
+
+/// Writes everything the chart and every field share: prelude, rings, and
+/// dots. A complete document is this, then `writeFieldHighlight`, then
+/// `FIELD_CLOSE`.
+pub fn writeFieldBackground(layout: *const FieldLayout, w: anytype) !void {
+    try svg_quality.writeSvgPrelude(w, "500", "650", "0 0 500 650", "");
+    try w.writeAll("<rect x=\"0\" y=\"0\" width=\"500\" height=\"650\" fill=\"white\" />\n");
 
     var ring: u4 = 1;
     while (ring <= 5) : (ring += 1) {
-        const r = 290.68884 * @as(f32, @floatFromInt(ring)) * scale;
-        w.print("<circle class=\"ring\" cx=\"{d:.2}\" cy=\"{d:.2}\" r=\"{d:.2}\" fill=\"none\" stroke=\"#8f949d\" stroke-width=\"2\" stroke-linecap=\"round\" />\n", .{
-            target_width / 2.0,
-            target_height / 2.0,
+        const r = 290.68884 * @as(f32, @floatFromInt(ring)) * layout.scale;
+        try w.print("<circle class=\"ring\" cx=\"{d:.2}\" cy=\"{d:.2}\" r=\"{d:.2}\" fill=\"none\" stroke=\"#8f949d\" stroke-width=\"2\" stroke-linecap=\"round\" />\n", .{
+            FIELD_WIDTH / 2.0,
+            FIELD_HEIGHT / 2.0,
             r,
-        }) catch unreachable;
+        });
     }
 
-    for (dots) |dot| {
+    for (layout.dots()) |dot| {
         const fill = if (dot.cluster_free) "#099" else "#999";
-        w.print(
+        try w.print(
             "<circle class=\"dot\" data-cardinality=\"{d}\" cx=\"{d:.2}\" cy=\"{d:.2}\" r=\"9\" fill=\"{s}\" stroke=\"white\" stroke-width=\"1.25\" />\n",
             .{
                 dot.cardinality,
-                target_width / 2.0 + (dot.x - center_x) * scale,
-                target_height / 2.0 + (dot.y - center_y) * scale,
+                layout.screenX(dot.x),
+                layout.screenY(dot.y),
                 fill,
             },
-        ) catch unreachable;
+        );
     }
+}
 
-    if (highlight_set) |set| {
-        if (findHighlightedDot(dots, set)) |dot| {
-            const highlight_x = target_width / 2.0 + (dot.x - center_x) * scale;
-            const highlight_y = target_height / 2.0 + (dot.y - center_y) * scale;
-            const safe_set = set & 0x0fff;
-            const prime = set_class.fortePrime(safe_set);
-            var set_label_buf: [12]u8 = undefined;
-            const sc = blk: {
-                for (set_class.SET_CLASSES) |candidate| {
-                    if (candidate.pcs == prime) break :blk candidate;
-                }
-                break :blk set_class.SetClass{
-                    .pcs = prime,
-                    .cardinality = pcs.cardinality(prime),
-                    .prime = set_class.primeForm(prime),
-                    .forte_prime = prime,
-                    .forte_number = .{ .cardinality = pcs.cardinality(prime), .ordinal = 0, .is_z = false },
-                    .flags = .{},
-                };
-            };
-            var forte_buf: [16]u8 = undefined;
-            const label = forteLabel(sc, &forte_buf);
-            const set_label = pcs.format(safe_set, &set_label_buf);
-            const cluster_free = !cluster.hasCluster(safe_set);
-            const chip_fill = if (cluster_free) "#0f766e" else "#5b6470";
-
-            w.print("<circle class=\"dot-highlight\" cx=\"{d:.2}\" cy=\"{d:.2}\" r=\"15.5\" fill=\"none\" stroke=\"#18242f\" stroke-width=\"3.25\" />\n", .{ highlight_x, highlight_y }) catch unreachable;
-            w.print("<circle class=\"dot-highlight\" cx=\"{d:.2}\" cy=\"{d:.2}\" r=\"21.5\" fill=\"none\" stroke=\"#18242f\" stroke-width=\"3.25\" opacity=\"0.28\" />\n", .{ highlight_x, highlight_y }) catch unreachable;
-            w.print("<rect x=\"20\" y=\"20\" width=\"160\" height=\"48\" rx=\"16\" fill=\"rgba(255,255,255,0.92)\" stroke=\"rgba(24,36,47,0.12)\" stroke-width=\"1.1\" />\n", .{}) catch unreachable;
-            var focus_text_buf: [24]u8 = undefined;
-            const focus_text = std.fmt.bufPrint(&focus_text_buf, "FOCUS {s}", .{label}) catch unreachable;
-            text_misc.writeBlockText(w, focus_text, 32.0, 31.0, 1.25, 0.45, "#18242f", .left, "highlight-label") catch unreachable;
-
-            var chip_text_buf: [48]u8 = undefined;
-            const chip_text = std.fmt.bufPrint(&chip_text_buf, "[{s}] EVEN {d:.4}", .{
-                set_label,
-                dot.evenness_distance,
-            }) catch unreachable;
-            text_misc.writeBlockText(w, chip_text, 32.0, 47.0, 0.9, 0.32, chip_fill, .left, "highlight-chip") catch unreachable;
+/// Writes the focus rings and label chip for `set`, or nothing when the set
+/// has no dot on the chart.
+pub fn writeFieldHighlight(layout: *const FieldLayout, set: pcs.PitchClassSet, w: anytype) !void {
+    const dot = findHighlightedDot(layout.dots(), set) orelse return;
+    const highlight_x = layout.screenX(dot.x);
+    const highlight_y = layout.screenY(dot.y);
+    const safe_set = set & 0x0fff;
+    const prime = set_class.fortePrime(safe_set);
+    var set_label_buf: [12]u8 = undefined;
+    const sc = blk: {
+        for (set_class.SET_CLASSES) |candidate| {
+            if (candidate.pcs == prime) break :blk candidate;
         }
-    }
+        break :blk set_class.SetClass{
+            .pcs = prime,
+            .cardinality = pcs.cardinality(prime),
+            .prime = set_class.primeForm(prime),
+            .forte_prime = prime,
+            .forte_number = .{ .cardinality = pcs.cardinality(prime), .ordinal = 0, .is_z = false },
+            .flags = .{},
+        };
+    };
+    var forte_buf: [16]u8 = undefined;
+    const label = forteLabel(sc, &forte_buf);
+    const set_label = pcs.format(safe_set, &set_label_buf);
+    const cluster_free = !cluster.hasCluster(safe_set);
+    const chip_fill = if (cluster_free) "#0f766e" else "#5b6470";
 
-    w.writeAll("</svg>\n") catch unreachable;
-    return buf[0..stream.pos];
+    try w.print("<circle class=\"dot-highlight\" cx=\"{d:.2}\" cy=\"{d:.2}\" r=\"15.5\" fill=\"none\" stroke=\"#18242f\" stroke-width=\"3.25\" />\n", .{ highlight_x, highlight_y });
+    try w.print("<circle class=\"dot-highlight\" cx=\"{d:.2}\" cy=\"{d:.2}\" r=\"21.5\" fill=\"none\" stroke=\"#18242f\" stroke-width=\"3.25\" opacity=\"0.28\" />\n", .{ highlight_x, highlight_y });
+    try w.print("<rect x=\"20\" y=\"20\" width=\"160\" height=\"48\" rx=\"16\" fill=\"rgba(255,255,255,0.92)\" stroke=\"rgba(24,36,47,0.12)\" stroke-width=\"1.1\" />\n", .{});
+    var focus_text_buf: [24]u8 = undefined;
+    const focus_text = std.fmt.bufPrint(&focus_text_buf, "FOCUS {s}", .{label}) catch unreachable;
+    try text_misc.writeBlockText(w, focus_text, 32.0, 31.0, 1.25, 0.45, "#18242f", .left, "highlight-label");
+
+    var chip_text_buf: [48]u8 = undefined;
+    const chip_text = std.fmt.bufPrint(&chip_text_buf, "[{s}] EVEN {d:.4}", .{
+        set_label,
+        dot.evenness_distance,
+    }) catch unreachable;
+    try text_misc.writeBlockText(w, chip_text, 32.0, 47.0, 0.9, 0.32, chip_fill, .left, "highlight-chip");
+}
+
+/// Writes a standalone document holding only the highlight for `set`. Raster
+/// batches composite it over a bitmap of `renderEvennessChart`, which is the
+/// shared background plus `FIELD_CLOSE`.
+pub fn writeFieldOverlay(layout: *const FieldLayout, set: pcs.PitchClassSet, w: anytype) !void {
+    try svg_quality.writeSvgPrelude(w, "500", "650", "0 0 500 650", "");
+    try writeFieldHighlight(layout, set, w);
+    try w.writeAll(FIELD_CLOSE);
+}
+
+fn writeEvennessFieldInternal(highlight_set: ?pcs.PitchClassSet, w: anytype) !void {
+    var layout: FieldLayout = undefined;
+    layout.init();
+    try writeFieldBackground(&layout, w);
+    if (highlight_set) |set| try writeFieldHighlight(&layout, set, w);
+    try w.writeAll(FIELD_CLOSE);
 }
 
 pub fn renderEvennessChart(buf: []u8) []u8 {
@@ -197,6 +244,16 @@ pub fn renderEvennessField(set: pcs.PitchClassSet, buf: []u8) []u8 {
     return renderEvennessFieldInternal(set, buf);
 }
 
+/// Streams the evenness chart into any writer.
+pub fn writeEvennessChart(w: anytype) !void {
+    return writeEvennessFieldInternal(null, w);
+}
+
+/// Streams the evenness field with `set` highlighted into any writer.
+pub fn writeEvennessField(set: pcs.PitchClassSet, w: anytype) !void {
+    return writeEvennessFieldInternal(set, w);
+}
+
 pub fn forteLabel(sc: set_class.SetClass, out: *[16]u8) []u8 {
     if (sc.forte_number.ordinal == 0) {
         return std.fmt.bufPrint(out, "{d}", .{sc.pcs}) catch unreachable;
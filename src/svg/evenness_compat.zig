@@ -1,46 +1,56 @@
 const std = @import("std");
-const builtin = @import("builtin");
-const even_segments = @import("../generated/harmonious_even_segment_xz.zig");
+const xz_pack = @import("../xz_pack.zig");
 
-pub fn renderEvennessByName(name: []const u8, buf: []u8) []u8 {
-    var out_stream = std.io.fixedBufferStream(buf);
-    if (std.mem.eql(u8, name, "grad")) {
-        if (!appendXzSegment(even_segments.COMPAT_PREFIX_XZ[0..], &out_stream)) return "";
-        if (!appendXzSegment(even_segments.COMMON_BODY_XZ[0..], &out_stream)) return "";
-        if (!appendXzSegment(even_segments.GRAD_TAIL_XZ[0..], &out_stream)) return "";
-        return buf[0..out_stream.pos];
-    }
+/// Segment order of the `.evenness` pack in `xz_pack.segments`.
+const Segment = enum {
+    compat_prefix,
+    index_prefix,
+    common_body,
+    grad_tail,
+    line_tail,
+    index_tail,
+};
 
-    if (std.mem.eql(u8, name, "line")) {
-        if (!appendXzSegment(even_segments.COMPAT_PREFIX_XZ[0..], &out_stream)) return "";
-        if (!appendXzSegment(even_segments.COMMON_BODY_XZ[0..], &out_stream)) return "";
-        if (!appendXzSegment(even_segments.LINE_TAIL_XZ[0..], &out_stream)) return "";
-        return buf[0..out_stream.pos];
-    }
+const SEGMENT_COUNT = @typeInfo(Segment).@"enum".fields.len;
 
-    if (!appendXzSegment(even_segments.INDEX_PREFIX_XZ[0..], &out_stream)) return "";
-    if (!appendXzSegment(even_segments.COMMON_BODY_XZ[0..], &out_stream)) return "";
-    if (!appendXzSegment(even_segments.INDEX_TAIL_XZ[0..], &out_stream)) return "";
-    return buf[0..out_stream.pos];
+var pack_once: xz_pack.Once = .{};
+var segment_bytes = [_][]const u8{&.{}} ** SEGMENT_COUNT;
+
+/// Expands every segment on first use so later documents are plain copies.
+pub fn warmup() bool {
+    return pack_once.run(expandSegments);
 }
 
-fn allocator() std.mem.Allocator {
-    return if (builtin.target.cpu.arch == .wasm32)
-        std.heap.wasm_allocator
-    else
-        std.heap.page_allocator;
+pub fn packStats() xz_pack.Stats {
+    return pack_once.stats();
 }
 
-fn appendXzSegment(segment: []const u8, out_stream: *std.io.FixedBufferStream([]u8)) bool {
-    var in_stream = std.io.fixedBufferStream(segment);
-    var dec = std.compress.xz.decompress(allocator(), in_stream.reader()) catch return false;
-    defer dec.deinit();
+fn expandSegments() ?xz_pack.Resident {
+    var raw: [SEGMENT_COUNT][]const u8 = undefined;
+    const expanded = xz_pack.expand(.evenness, &raw) orelse return null;
+    segment_bytes = raw;
+    return expanded;
+}
 
-    var scratch: [1024]u8 = undefined;
-    while (true) {
-        const n = dec.reader().read(&scratch) catch return false;
-        if (n == 0) break;
-        out_stream.writer().writeAll(scratch[0..n]) catch return false;
+pub fn renderEvennessByName(name: []const u8, buf: []u8) []u8 {
+    if (!warmup()) return "";
+    const parts: [3]Segment = if (std.mem.eql(u8, name, "grad"))
+        .{ .compat_prefix, .common_body, .grad_tail }
+    else if (std.mem.eql(u8, name, "line"))
+        .{ .compat_prefix, .common_body, .line_tail }
+    else
+        .{ .index_prefix, .common_body, .index_tail };
+
+    var len: usize = 0;
+    for (parts) |part| {
+        const bytes = segment_bytes[@intFromEnum(part)];
+        if (len + bytes.len > buf.len) return "";
+        @memcpy(buf[len..][0..bytes.len], bytes);
+        len += bytes.len;
     }
-    return true;
+    return buf[0..len];
+}
+
+comptime {
+    std.debug.assert(xz_pack.segments(.evenness).len == SEGMENT_COUNT);
 }
@@ -53,13 +53,63 @@ pub fn renderDiagram(spec: DiagramSpec, buf: []u8) []u8 {
     const w = stream.writer();
 
     if (spec.frets.len == 0) {
-        w.writeAll("<svg xmlns=\"http://www.w3.org/2000/svg\" width=\"100\" height=\"100\" viewBox=\"0 0 100 100\" shape-rendering=\"geometricPrecision\" text-rendering=\"geometricPrecision\">\n</svg>\n") catch unreachable;
+        w.writeAll(EMPTY_DIAGRAM) catch unreachable;
         return buf[0..stream.pos];
     }
 
     const window = genericFretWindow(spec.frets, spec.window_start, spec.visible_frets);
+    writeDiagramGrid(w, spec.frets.len, window) catch unreachable;
+    writeDiagramBody(w, spec, window) catch unreachable;
+    return buf[0..stream.pos];
+}
+
+const EMPTY_DIAGRAM = "<svg xmlns=\"http://www.w3.org/2000/svg\" width=\"100\" height=\"100\" viewBox=\"0 0 100 100\" shape-rendering=\"geometricPrecision\" text-rendering=\"geometricPrecision\">\n</svg>\n";
+
+/// Holds the prelude and grid markup for the most recent string count and
+/// fret window. Batch renderers keep one per batch so diagrams sharing a
+/// window reuse the grid instead of formatting it again.
+pub const GridCache = struct {
+    buf: [8192]u8 = undefined,
+    len: usize = 0,
+    string_count: usize = 0,
+    window: ?GenericFretWindow = null,
+
+    fn grid(self: *GridCache, string_count: usize, window: GenericFretWindow) ![]const u8 {
+        if (self.window) |cached| {
+            if (self.string_count == string_count and cached.start == window.start and cached.end == window.end) {
+                return self.buf[0..self.len];
+            }
+        }
+        self.window = null;
+        var stream = std.io.fixedBufferStream(&self.buf);
+        try writeDiagramGrid(stream.writer(), string_count, window);
+        self.len = stream.pos;
+        self.string_count = string_count;
+        self.window = window;
+        return self.buf[0..self.len];
+    }
+};
 
-    svg_quality.writeSvgPrelude(w, "100", "100", "0 0 100 100",
+pub const DiagramParts = struct {
+    prefix: []const u8,
+    body: []const u8,
+};
+
+/// Split render for batch callers: returns the cached grid prefix for
+/// `spec` and writes the remaining markup, including the closing tag, into
+/// `body_buf`. The prefix followed by the body equals `renderDiagram(spec)`.
+pub fn renderDiagramParts(spec: DiagramSpec, cache: *GridCache, body_buf: []u8) !DiagramParts {
+    if (spec.frets.len == 0) return .{ .prefix = EMPTY_DIAGRAM, .body = "" };
+
+    const window = genericFretWindow(spec.frets, spec.window_start, spec.visible_frets);
+    const prefix = try cache.grid(spec.frets.len, window);
+    var stream = std.io.fixedBufferStream(body_buf);
+    try writeDiagramBody(stream.writer(), spec, window);
+    return .{ .prefix = prefix, .body = body_buf[0..stream.pos] };
+}
+
+fn writeDiagramGrid(w: anytype, string_count: usize, window: GenericFretWindow) !void {
+    try svg_quality.writeSvgPrelude(w, "100", "100", "0 0 100 100",
         \\.string,.fret,.marker-open,.marker-muted,.position{vector-effect:non-scaling-stroke}
         \\.string{stroke:#171717;stroke-width:1.1;stroke-linecap:round}
         \\.fret{stroke:#171717;stroke-width:1.35;stroke-linecap:round}
@@ -70,17 +120,18 @@ pub fn renderDiagram(spec: DiagramSpec, buf: []u8) []u8 {
         \\.marker-muted{stroke:#111;stroke-width:1.9;stroke-linecap:round}
         \\.position{fill:#4b4338;font-size:10px;font-weight:600;font-family:"Avenir Next","Avenir","SF Pro Display","Segoe UI","Helvetica Neue",Arial,sans-serif}
         \\
-    ) catch unreachable;
-
-    drawGrid(w, spec.frets.len, window);
+    );
+    try drawGrid(w, string_count, window);
+}
 
+fn writeDiagramBody(w: anytype, spec: DiagramSpec, window: GenericFretWindow) !void {
     if (detectBarreForFrets(spec.frets)) |barre| {
         if (barre.fret > window.start and barre.fret <= window.end) {
             const y = dotY(barre.fret, window);
             const x0 = stringX(barre.low_string, spec.frets.len) - 4.0;
             const x1 = stringX(barre.high_string, spec.frets.len) + 4.0;
             const width = x1 - x0;
-            w.print("<rect class=\"barre\" x=\"{d:.2}\" y=\"{d:.2}\" width=\"{d:.2}\" height=\"8.7\" rx=\"4.35\" fill=\"#111\" fill-opacity=\"0.26\" />\n", .{ x0, y - 4.35, width }) catch unreachable;
+            try w.print("<rect class=\"barre\" x=\"{d:.2}\" y=\"{d:.2}\" width=\"{d:.2}\" height=\"8.7\" rx=\"4.35\" fill=\"#111\" fill-opacity=\"0.26\" />\n", .{ x0, y - 4.35, width });
         }
     }
 
@@ -88,20 +139,53 @@ pub fn renderDiagram(spec: DiagramSpec, buf: []u8) []u8 {
         const x = stringX(string, spec.frets.len);
 
         if (fret < 0) {
-            drawMutedMarker(w, x);
+            try drawMutedMarker(w, x);
         } else if (fret == 0) {
-            drawOpenMarker(w, x);
+            try drawOpenMarker(w, x);
         } else {
             const ufret = @as(u32, @intCast(fret));
             if (ufret <= window.start or ufret > window.end) continue;
             const y = dotY(ufret, window);
             const fill = noteFillColor(spec.tuning, string, ufret);
-            w.print("<circle class=\"dot\" cx=\"{d:.2}\" cy=\"{d:.2}\" r=\"4.35\" fill=\"{s}\" stroke=\"#101010\" stroke-width=\"1.1\" />\n", .{ x, y, fill }) catch unreachable;
+            try w.print("<circle class=\"dot\" cx=\"{d:.2}\" cy=\"{d:.2}\" r=\"4.35\" fill=\"{s}\" stroke=\"#101010\" stroke-width=\"1.1\" />\n", .{ x, y, fill });
         }
     }
 
-    w.writeAll("</svg>\n") catch unreachable;
-    return buf[0..stream.pos];
+    try w.writeAll("</svg>\n");
+}
+
+/// Window and visible barre a diagram is drawn with. Diagrams sharing a
+/// layout differ only along the strings whose frets differ.
+pub const Layout = struct {
+    window: GenericFretWindow,
+    barre: ?GenericBarre,
+
+    pub fn eql(self: Layout, other: Layout) bool {
+        return std.meta.eql(self, other);
+    }
+};
+
+pub fn diagramLayout(spec: DiagramSpec) Layout {
+    const window = genericFretWindow(spec.frets, spec.window_start, spec.visible_frets);
+    var barre = detectBarreForFrets(spec.frets);
+    if (barre) |found| {
+        if (found.fret <= window.start or found.fret > window.end) barre = null;
+    }
+    return .{ .window = window, .barre = barre };
+}
+
+/// Extent of everything string `string` can draw for its fret: the open or
+/// muted marker above the nut and a dot on any fret of the window.
+pub fn stringBounds(string: usize, string_count: usize, window: GenericFretWindow) svg_quality.Bounds {
+    const x = stringX(string, string_count);
+    // The open marker is the widest mark: radius 4.3 plus half its stroke.
+    const reach: f32 = 4.3 + 1.7 / 2.0;
+    return .{
+        .min_x = x - reach,
+        .min_y = MARKER_Y - reach,
+        .max_x = x + reach,
+        .max_y = gridBottom(window),
+    };
 }
 
 pub fn detectBarre(voicing: guitar.GuitarVoicing) ?Barre {
@@ -199,11 +283,11 @@ fn genericFretWindow(frets: []const i8, explicit_start: ?u32, explicit_visible_f
     return .{ .start = start, .end = end };
 }
 
-fn drawGrid(writer: anytype, string_count: usize, window: GenericFretWindow) void {
+fn drawGrid(writer: anytype, string_count: usize, window: GenericFretWindow) !void {
     var string: usize = 0;
     while (string < string_count) : (string += 1) {
         const x = stringX(string, string_count);
-        writer.print("<line class=\"string\" x1=\"{d:.2}\" y1=\"20\" x2=\"{d:.2}\" y2=\"{d:.2}\" stroke=\"#171717\" stroke-width=\"1.1\" stroke-linecap=\"round\" />\n", .{ x, x, gridBottom(window) }) catch unreachable;
+        try writer.print("<line class=\"string\" x1=\"{d:.2}\" y1=\"20\" x2=\"{d:.2}\" y2=\"{d:.2}\" stroke=\"#171717\" stroke-width=\"1.1\" stroke-linecap=\"round\" />\n", .{ x, x, gridBottom(window) });
     }
 
     const line_count = window.end - window.start;
@@ -212,22 +296,22 @@ fn drawGrid(writer: anytype, string_count: usize, window: GenericFretWindow) voi
         const y = GRID_TOP + @as(f32, @floatFromInt(i)) * FRET_SPACING;
         const klass = if (window.start == 0 and i == 0) "nut" else "fret";
         const stroke_width: f32 = if (window.start == 0 and i == 0) 3.6 else 1.35;
-        writer.print("<line class=\"{s}\" x1=\"20\" y1=\"{d:.2}\" x2=\"80\" y2=\"{d:.2}\" stroke=\"#171717\" stroke-width=\"{d:.2}\" stroke-linecap=\"round\" />\n", .{ klass, y, y, stroke_width }) catch unreachable;
+        try writer.print("<line class=\"{s}\" x1=\"20\" y1=\"{d:.2}\" x2=\"80\" y2=\"{d:.2}\" stroke=\"#171717\" stroke-width=\"{d:.2}\" stroke-linecap=\"round\" />\n", .{ klass, y, y, stroke_width });
     }
 
     if (window.start > 0) {
         const pos = window.start + 1;
-        writer.print("<text class=\"position\" x=\"8\" y=\"30\">{d}</text>\n", .{pos}) catch unreachable;
+        try writer.print("<text class=\"position\" x=\"8\" y=\"30\">{d}</text>\n", .{pos});
     }
 }
 
-fn drawOpenMarker(writer: anytype, x: f32) void {
-    writer.print("<circle class=\"marker-open\" cx=\"{d:.2}\" cy=\"{d:.2}\" r=\"4.3\" fill=\"#fff\" stroke=\"#111\" stroke-width=\"1.7\" />\n", .{ x, MARKER_Y }) catch unreachable;
+fn drawOpenMarker(writer: anytype, x: f32) !void {
+    try writer.print("<circle class=\"marker-open\" cx=\"{d:.2}\" cy=\"{d:.2}\" r=\"4.3\" fill=\"#fff\" stroke=\"#111\" stroke-width=\"1.7\" />\n", .{ x, MARKER_Y });
 }
 
-fn drawMutedMarker(writer: anytype, x: f32) void {
-    writer.print("<line class=\"marker-muted\" x1=\"{d:.2}\" y1=\"{d:.2}\" x2=\"{d:.2}\" y2=\"{d:.2}\" stroke=\"#111\" stroke-width=\"1.9\" stroke-linecap=\"round\" />\n", .{ x - 3.6, MARKER_Y - 3.6, x + 3.6, MARKER_Y + 3.6 }) catch unreachable;
-    writer.print("<line class=\"marker-muted\" x1=\"{d:.2}\" y1=\"{d:.2}\" x2=\"{d:.2}\" y2=\"{d:.2}\" stroke=\"#111\" stroke-width=\"1.9\" stroke-linecap=\"round\" />\n", .{ x - 3.6, MARKER_Y + 3.6, x + 3.6, MARKER_Y - 3.6 }) catch unreachable;
+fn drawMutedMarker(writer: anytype, x: f32) !void {
+    try writer.print("<line class=\"marker-muted\" x1=\"{d:.2}\" y1=\"{d:.2}\" x2=\"{d:.2}\" y2=\"{d:.2}\" stroke=\"#111\" stroke-width=\"1.9\" stroke-linecap=\"round\" />\n", .{ x - 3.6, MARKER_Y - 3.6, x + 3.6, MARKER_Y + 3.6 });
+    try writer.print("<line class=\"marker-muted\" x1=\"{d:.2}\" y1=\"{d:.2}\" x2=\"{d:.2}\" y2=\"{d:.2}\" stroke=\"#111\" stroke-width=\"1.9\" stroke-linecap=\"round\" />\n", .{ x - 3.6, MARKER_Y + 3.6, x + 3.6, MARKER_Y - 3.6 });
 }
 
 fn stringX(string: usize, string_count: usize) f32 {
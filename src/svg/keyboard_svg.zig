@@ -3,6 +3,7 @@ const pitch = @import("../pitch.zig");
 const pcs = @import("../pitch_class_set.zig");
 const keyboard = @import("../keyboard.zig");
 const svg_quality = @import("quality.zig");
+const render_ir = @import("../render/ir.zig");
 
 const PaletteColor = struct {
     r: u8,
@@ -46,9 +47,9 @@ const black_fill_alpha_exact: f32 = 0.9;
 pub fn renderKeyboard(notes: []const pitch.MidiNote, range_low: pitch.MidiNote, range_high: pitch.MidiNote, buf: []u8) []u8 {
     const low = @min(range_low, range_high);
     const high = @max(range_low, range_high);
-    const white_count = countWhiteKeys(low, high);
-    const width = margin_x * 2.0 + @as(f32, @floatFromInt(white_count)) * white_key_width;
-    const height = margin_y * 2.0 + white_key_height;
+    const size = documentSize(low, high);
+    const width = size.width;
+    const height = size.height;
 
     var width_buf: [16]u8 = undefined;
     var height_buf: [16]u8 = undefined;
@@ -77,6 +78,119 @@ pub fn renderKeyboard(notes: []const pitch.MidiNote, range_low: pitch.MidiNote,
     return buf[0..stream.pos];
 }
 
+/// Most ops `keyboardScene` emits: the background and two rects per key.
+pub const SCENE_OP_LIMIT: usize = 1 + 2 * 128;
+
+/// `renderKeyboard` as a numeric scene, for bitmaps that skip the markup.
+/// Drawn under the `documentSize` viewBox it rasterizes to the same pixels
+/// as the document. `ops` needs room for `SCENE_OP_LIMIT` ops at most.
+pub fn keyboardScene(notes: []const pitch.MidiNote, range_low: pitch.MidiNote, range_high: pitch.MidiNote, ops: []render_ir.NumericOp) render_ir.BuildError!render_ir.NumericScene {
+    const low = @min(range_low, range_high);
+    const high = @max(range_low, range_high);
+    const size = documentSize(low, high);
+    var builder = render_ir.NumericBuilder.init(ops);
+    try builder.rect(.{ .x = 0.0, .y = 0.0, .width = size.width, .height = size.height, .rx = 20.0, .fill = sceneColor(BG_FILL, 255) });
+
+    const selected_pcs: pcs.PitchClassSet = keyboard.notesPitchClassSet(notes);
+    var midi: u16 = low;
+    while (midi <= high) : (midi += 1) {
+        const note = @as(pitch.MidiNote, @intCast(midi));
+        if (isBlackKey(note)) continue;
+        const x = margin_x + @as(f32, @floatFromInt(whiteIndexBefore(low, note))) * white_key_width;
+        const color = OPC_FILL_COLORS[note % 12];
+        const key_rect = render_ir.NumericRect{ .x = x, .y = margin_y, .width = white_key_width, .height = white_key_height, .rx = 3.5, .stroke = sceneColor(WHITE_KEY_STROKE, 255), .stroke_width = 1.5 };
+        switch (noteState(notes, selected_pcs, note)) {
+            .selected => {
+                var key_fill = key_rect;
+                key_fill.fill = sceneColor(color, sceneAlpha(white_fill_alpha_exact));
+                try builder.rect(key_fill);
+                try builder.rect(.{ .x = x + 1.25, .y = margin_y + white_key_height - accent_height - 1.0, .width = white_key_width - 2.5, .height = accent_height, .fill = sceneColor(color, 255) });
+            },
+            .echo => {
+                var key_fill = key_rect;
+                key_fill.fill = sceneColor(color, sceneAlpha(white_fill_alpha_echo));
+                try builder.rect(key_fill);
+                try builder.rect(.{ .x = x + 2.0, .y = margin_y + white_key_height - accent_height + 1.0, .width = white_key_width - 4.0, .height = accent_height - 3.0, .fill = sceneColor(color, sceneAlpha(0.58)) });
+            },
+            .normal => {
+                var key_fill = key_rect;
+                key_fill.fill = sceneColor(WHITE_KEY_FILL, 255);
+                try builder.rect(key_fill);
+            },
+        }
+    }
+
+    midi = low;
+    while (midi <= high) : (midi += 1) {
+        const note = @as(pitch.MidiNote, @intCast(midi));
+        if (!isBlackKey(note)) continue;
+        const x = margin_x + @as(f32, @floatFromInt(whiteIndexBefore(low, note))) * white_key_width - black_key_width / 2.0;
+        try builder.rect(.{ .x = x, .y = margin_y, .width = black_key_width, .height = black_key_height, .rx = 3.2, .fill = sceneColor(BLACK_KEY_FILL, 255), .stroke = sceneColor(BLACK_KEY_STROKE, 255), .stroke_width = 1.35 });
+        const alpha = switch (noteState(notes, selected_pcs, note)) {
+            .selected => black_fill_alpha_exact,
+            .echo => black_fill_alpha_echo,
+            .normal => continue,
+        };
+        const blended = blendColor(BLACK_KEY_FILL, OPC_FILL_COLORS[note % 12], alpha);
+        try builder.rect(.{ .x = x, .y = margin_y, .width = black_key_width, .height = black_key_height, .rx = 3.2, .fill = sceneColor(blended, 255) });
+    }
+    return builder.scene();
+}
+
+fn sceneColor(color: PaletteColor, alpha: u8) render_ir.Paint {
+    return .{ .color = .{ .r = color.r, .g = color.g, .b = color.b, .a = alpha } };
+}
+
+/// The alpha byte the rasterizer reads back from an `rgba()` fill printed
+/// with three decimals.
+fn sceneAlpha(alpha: f32) u8 {
+    const printed = @round(@as(f64, alpha) * 1000.0) / 1000.0;
+    return @intFromFloat(@floor(printed * 255.0 + 0.5));
+}
+
+/// Width and height of the keyboard document, in viewBox units.
+pub fn documentSize(range_low: pitch.MidiNote, range_high: pitch.MidiNote) struct { width: f32, height: f32 } {
+    const low = @min(range_low, range_high);
+    const high = @max(range_low, range_high);
+    return .{
+        .width = margin_x * 2.0 + @as(f32, @floatFromInt(countWhiteKeys(low, high))) * white_key_width,
+        .height = margin_y * 2.0 + white_key_height,
+    };
+}
+
+/// Writes the state each key of [range_low, range_high] is drawn in to
+/// `out[midi - range_low]`. Incremental renderers compare two of these to
+/// find the keys whose pixels changed.
+pub fn keyStates(notes: []const pitch.MidiNote, range_low: pitch.MidiNote, range_high: pitch.MidiNote, out: []NoteState) void {
+    const selected_pcs: pcs.PitchClassSet = keyboard.notesPitchClassSet(notes);
+    var midi: u16 = range_low;
+    while (midi <= range_high and midi - range_low < out.len) : (midi += 1) {
+        out[midi - range_low] = noteState(notes, selected_pcs, @intCast(midi));
+    }
+}
+
+/// Extent of key `note` as drawn by `renderKeyboard` with `range_low`,
+/// including its stroke and any state overlay.
+pub fn keyBounds(range_low: pitch.MidiNote, note: pitch.MidiNote) svg_quality.Bounds {
+    const left = margin_x + @as(f32, @floatFromInt(whiteIndexBefore(range_low, note))) * white_key_width;
+    if (isBlackKey(note)) {
+        const half_stroke = 1.35 / 2.0;
+        return .{
+            .min_x = left - black_key_width / 2.0 - half_stroke,
+            .min_y = margin_y - half_stroke,
+            .max_x = left + black_key_width / 2.0 + half_stroke,
+            .max_y = margin_y + black_key_height + half_stroke,
+        };
+    }
+    const half_stroke = 1.5 / 2.0;
+    return .{
+        .min_x = left - half_stroke,
+        .min_y = margin_y - half_stroke,
+        .max_x = left + white_key_width + half_stroke,
+        .max_y = margin_y + white_key_height + half_stroke,
+    };
+}
+
 fn drawWhiteKeys(w: anytype, notes: []const pitch.MidiNote, selected_pcs: pcs.PitchClassSet, range_low: pitch.MidiNote, range_high: pitch.MidiNote) void {
     var midi: u16 = range_low;
     while (midi <= range_high) : (midi += 1) {
@@ -170,7 +284,7 @@ fn blendColor(base: PaletteColor, overlay: PaletteColor, alpha: f32) PaletteColo
     };
 }
 
-const NoteState = enum {
+pub const NoteState = enum {
     normal,
     echo,
     selected,
@@ -1,5 +1,5 @@
 const std = @import("std");
-const builtin = @import("builtin");
+const xz_pack = @import("../xz_pack.zig");
 const pack_data = @import("../generated/harmonious_majmin_scene_pack_xz.zig");
 const mode_geometry_data = @import("../generated/harmonious_majmin_modes_geometry_refs.zig");
 const majmin_scene = @import("majmin_scene.zig");
@@ -71,10 +71,9 @@ const ScaleFamilyModel = struct {
     d_map: [pack_data.SCALE_TRANS_COUNT][pack_data.SCALE_D_BASE_COUNT]DRef,
 };
 
-var decoded_ready: bool = false;
-var parsed_ready: bool = false;
+var pack_once: xz_pack.Once = .{};
 
-var decoded_pack: []u8 = &[_]u8{};
+var decoded_pack: []const u8 = &[_]u8{};
 
 var skeleton_off: [pack_data.SKELETON_COUNT]u32 = undefined;
 var skeleton_len: [pack_data.SKELETON_COUNT]u32 = undefined;
@@ -108,33 +107,26 @@ comptime {
     }
 }
 
-fn decodePackIfNeeded() bool {
-    if (decoded_ready) return true;
-
-    const allocator = if (builtin.target.cpu.arch == .wasm32)
-        std.heap.wasm_allocator
-    else
-        std.heap.page_allocator;
-
-    var in_stream = std.io.fixedBufferStream(pack_data.PACK_XZ[0..]);
-    var dec = std.compress.xz.decompress(allocator, in_stream.reader()) catch return false;
-    defer dec.deinit();
+/// Decodes and parses the scene pack on first use; the tables it fills live
+/// for the rest of the process.
+pub fn warmup() bool {
+    return pack_once.run(loadPack);
+}
 
-    const out = allocator.alloc(u8, pack_data.PACK_RAW_LEN) catch return false;
-    errdefer allocator.free(out);
+pub fn packStats() xz_pack.Stats {
+    return pack_once.stats();
+}
 
-    var out_pos: usize = 0;
-    while (true) {
-        if (out_pos > out.len) return false;
-        const n = dec.reader().read(out[out_pos..]) catch return false;
-        if (n == 0) break;
-        out_pos += n;
+fn loadPack() ?xz_pack.Resident {
+    var raw: [1][]const u8 = undefined;
+    const expanded = xz_pack.expand(.majmin_scenes, &raw) orelse return null;
+    decoded_pack = raw[0];
+    if (!parsePack()) {
+        decoded_pack = &[_]u8{};
+        xz_pack.release(.majmin_scenes, &raw);
+        return null;
     }
-
-    if (out_pos != out.len) return false;
-    decoded_pack = out;
-    decoded_ready = true;
-    return true;
+    return expanded;
 }
 
 fn readU16At(off: usize) ?u16 {
@@ -171,10 +163,7 @@ fn decodeSignedI8(raw: u16) ?i8 {
     return @as(i8, @intCast(signed16));
 }
 
-fn parsePackIfNeeded() bool {
-    if (parsed_ready) return true;
-    if (!decodePackIfNeeded()) return false;
-
+fn parsePack() bool {
     if (decoded_pack.len < 8) return false;
     if (!std.mem.eql(u8, decoded_pack[0..8], "MJM3\x00\x00\x00\x00")) return false;
 
@@ -507,9 +496,7 @@ fn parsePackIfNeeded() bool {
         }
     }
 
-    if (cursor != decoded_pack.len) return false;
-    parsed_ready = true;
-    return true;
+    return cursor == decoded_pack.len;
 }
 
 fn writeScaledDecimal(writer: anytype, value: i128) !void {
@@ -783,7 +770,7 @@ fn renderScales(image_index: usize, buf: []u8) []u8 {
 }
 
 pub fn render(kind: Kind, image_index: usize, buf: []u8) []u8 {
-    if (!parsePackIfNeeded()) return "";
+    if (!warmup()) return "";
     return switch (kind) {
         .modes => renderModes(image_index, buf),
         .scales => renderScales(image_index, buf),
@@ -81,16 +81,43 @@ pub fn buildTriadEdges(nodes: []const Node, out: *[MAX_EDGES]Edge) []Edge {
     return out[0..edge_count];
 }
 
+/// The 40 triads and their single-semitone voice-leading edges never
+/// change, so both tables are built at compile time.
+pub const triad_nodes: [NODE_COUNT]Node = blk: {
+    var nodes: [NODE_COUNT]Node = undefined;
+    _ = enumerateTriadNodes(&nodes);
+    break :blk nodes;
+};
+
+pub const triad_edges = blk: {
+    @setEvalBranchQuota(1_000_000);
+    var edges_buf: [MAX_EDGES]Edge = undefined;
+    const edges = buildTriadEdges(&triad_nodes, &edges_buf);
+    break :blk edges_buf[0..edges.len].*;
+};
+
+// Edge and node markup is formatted once at compile time; the document is
+// the prelude, the shell, and this body.
+const ORBIFOLD_BODY = blk: {
+    @setEvalBranchQuota(4_000_000);
+    var body: []const u8 = "";
+    for (triad_edges) |edge| {
+        const from = triad_nodes[edge.from_idx];
+        const to = triad_nodes[edge.to_idx];
+        body = body ++ std.fmt.comptimePrint("<line class=\"orbifold-edge\" x1=\"{d:.2}\" y1=\"{d:.2}\" x2=\"{d:.2}\" y2=\"{d:.2}\" />\n", .{ from.x, from.y, to.x, to.y });
+    }
+    for (triad_nodes) |node| {
+        const style = nodeStyle(node.quality);
+        body = body ++ std.fmt.comptimePrint("<circle class=\"orbifold-node\" cx=\"{d:.2}\" cy=\"{d:.2}\" r=\"8\" fill=\"{s}\" stroke=\"{s}\" />\n", .{ node.x, node.y, style.fill, style.stroke });
+        body = body ++ std.fmt.comptimePrint("<text class=\"label-sans inverse-outline orbifold-label\" x=\"{d:.2}\" y=\"{d:.2}\" text-anchor=\"middle\">{s}{s}</text>\n", .{ node.x, node.y + 2.2, rootName(node.root), qualitySuffix(node.quality) });
+    }
+    break :blk body;
+};
+
 pub fn renderTriadOrbifold(buf: []u8) []u8 {
     var stream = std.io.fixedBufferStream(buf);
     const w = stream.writer();
 
-    var nodes_buf: [NODE_COUNT]Node = undefined;
-    const nodes = enumerateTriadNodes(&nodes_buf);
-
-    var edges_buf: [MAX_EDGES]Edge = undefined;
-    const edges = buildTriadEdges(nodes, &edges_buf);
-
     svg_quality.writeSvgPrelude(w, "100%", "100%", "0 0 540 540",
         \\.orbifold-shell,.orbifold-edge,.orbifold-node{vector-effect:non-scaling-stroke}
         \\.orbifold-shell{fill:none;stroke:#b7bcc6;stroke-width:2}
@@ -101,19 +128,7 @@ pub fn renderTriadOrbifold(buf: []u8) []u8 {
     ) catch unreachable;
     w.writeAll("<rect x=\"0\" y=\"0\" width=\"540\" height=\"540\" fill=\"white\" />\n") catch unreachable;
     w.writeAll("<ellipse class=\"orbifold-shell\" cx=\"270\" cy=\"270\" rx=\"156.25\" ry=\"247.5\" />\n") catch unreachable;
-
-    for (edges) |edge| {
-        const from = nodes[edge.from_idx];
-        const to = nodes[edge.to_idx];
-        w.print("<line class=\"orbifold-edge\" x1=\"{d:.2}\" y1=\"{d:.2}\" x2=\"{d:.2}\" y2=\"{d:.2}\" />\n", .{ from.x, from.y, to.x, to.y }) catch unreachable;
-    }
-
-    for (nodes) |node| {
-        const style = nodeStyle(node.quality);
-        w.print("<circle class=\"orbifold-node\" cx=\"{d:.2}\" cy=\"{d:.2}\" r=\"8\" fill=\"{s}\" stroke=\"{s}\" />\n", .{ node.x, node.y, style.fill, style.stroke }) catch unreachable;
-        w.print("<text class=\"label-sans inverse-outline orbifold-label\" x=\"{d:.2}\" y=\"{d:.2}\" text-anchor=\"middle\">{s}{s}</text>\n", .{ node.x, node.y + 2.2, rootName(node.root), qualitySuffix(node.quality) }) catch unreachable;
-    }
-
+    w.writeAll(ORBIFOLD_BODY) catch unreachable;
     w.writeAll("</svg>\n") catch unreachable;
     return buf[0..stream.pos];
 }
@@ -4,6 +4,14 @@ pub const SANS_STACK = "\"Avenir Next\",\"Avenir\",\"SF Pro Display\",\"Segoe UI
 pub const SERIF_STACK = "\"Iowan Old Style\",\"Palatino Linotype\",\"Book Antiqua\",Georgia,serif";
 pub const MONO_STACK = "\"SFMono-Regular\",Menlo,Monaco,Consolas,\"Liberation Mono\",monospace";
 
+/// Axis-aligned extent of drawn markup in viewBox units, strokes included.
+pub const Bounds = struct {
+    min_x: f32,
+    min_y: f32,
+    max_x: f32,
+    max_y: f32,
+};
+
 pub fn writeSvgPrelude(writer: anytype, width: []const u8, height: []const u8, view_box: []const u8, extra_css: []const u8) !void {
     try writer.print(
         "<svg xmlns=\"http://www.w3.org/2000/svg\" width=\"{s}\" height=\"{s}\" viewBox=\"{s}\" shape-rendering=\"geometricPrecision\" text-rendering=\"geometricPrecision\">\n",
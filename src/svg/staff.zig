@@ -4,6 +4,7 @@ const key = @import("../key.zig");
 const note_name = @import("../note_name.zig");
 const note_spelling = @import("../note_spelling.zig");
 const svg_quality = @import("quality.zig");
+const render_ir = @import("../render/ir.zig");
 
 pub const Clef = enum {
     treble,
@@ -291,6 +292,324 @@ pub fn renderKeyStaff(notes: []const pitch.MidiNote, k: key.Key, buf: []u8) []u8
     return buf[0..stream.pos];
 }
 
+/// Op capacity of a staff scene; scenes that need more fail with
+/// `error.NoSpace` and the caller draws the markup instead.
+pub const SCENE_OP_LIMIT: usize = 1024;
+const SCENE_GROUP_LIMIT: usize = 96;
+const SCENE_TRANSFORM_BYTES: usize = 40;
+
+/// Caller-owned backing arrays for a staff scene.
+pub const SceneStorage = struct {
+    ops: [SCENE_OP_LIMIT]render_ir.NumericOp = undefined,
+    attrs: [SCENE_GROUP_LIMIT]render_ir.Attr = undefined,
+    transforms: [SCENE_GROUP_LIMIT][SCENE_TRANSFORM_BYTES]u8 = undefined,
+    brace: [4]render_ir.PathCommand = undefined,
+};
+
+/// A staff document as numeric ops plus the viewBox it is drawn under.
+pub const StaffScene = struct {
+    view_width: f64,
+    view_height: f64,
+    scene: render_ir.NumericScene,
+};
+
+/// `renderChordStaff` as a numeric scene. Drawn under its viewBox it
+/// rasterizes to the same pixels as the markup.
+pub fn chordStaffScene(notes: []const pitch.MidiNote, k: key.Key, storage: *SceneStorage) render_ir.BuildError!StaffScene {
+    return singleClefClusterScene(notes, k, .treble, storage);
+}
+
+/// `renderPianoStaff` as a numeric scene.
+pub fn pianoStaffScene(notes: []const pitch.MidiNote, k: key.Key, storage: *SceneStorage) render_ir.BuildError!StaffScene {
+    return switch (pianoStaffMode(notes)) {
+        .treble => singleClefClusterScene(notes, k, .treble, storage),
+        .bass => singleClefClusterScene(notes, k, .bass, storage),
+        .grand => grandClusterScene(notes, k, storage),
+    };
+}
+
+/// `renderKeyStaff` as a numeric scene.
+pub fn keyStaffScene(notes: []const pitch.MidiNote, k: key.Key, storage: *SceneStorage) render_ir.BuildError!StaffScene {
+    var scene = SceneWriter.init(storage);
+    const top_y = 42.0;
+    const staff_x0 = 38.0;
+    const key_sig_x = 70.0;
+    const start_x = 106.0 + keySignatureAdvance(k);
+    const slot_spacing = 36.0;
+    const measure_bar_x = start_x + 134.0;
+    const second_measure_start_x = start_x + 166.0;
+    const end_bar_x = start_x + 300.0;
+
+    try scene.staffLines(staff_x0, end_bar_x, top_y);
+    try scene.endBarline(measure_bar_x, top_y);
+    try scene.endBarline(end_bar_x, top_y);
+    try scene.clef(.treble, staff_x0 + 5.0, top_y);
+    try scene.keySignature(k, .treble, key_sig_x);
+
+    for (notes, 0..) |note, index| {
+        const spelled = spellStaffNote(note, k, .treble);
+        const measure_index = index / 4;
+        const slot_index = index % 4;
+        const base_x = if (measure_index == 0) start_x else second_measure_start_x;
+        const x = base_x + @as(f32, @floatFromInt(slot_index)) * slot_spacing;
+        try scene.singleNote(x, spelled);
+    }
+    return scene.finish(520.0, 126.0);
+}
+
+fn singleClefClusterScene(notes: []const pitch.MidiNote, k: key.Key, clef: Clef, storage: *SceneStorage) render_ir.BuildError!StaffScene {
+    var scene = SceneWriter.init(storage);
+    const top_y = 42.0;
+    const staff_x0 = 38.0;
+    const staff_x1 = 188.0;
+    const cluster_x = 124.0 + keySignatureAdvance(k);
+
+    try scene.staffLines(staff_x0, staff_x1, top_y);
+    try scene.endBarline(staff_x1, top_y);
+    try scene.clef(clef, staff_x0 + 5.0, top_y);
+    try scene.keySignature(k, clef, 70.0);
+
+    var cluster = layoutChordCluster(notes, k, clef, cluster_x);
+    try scene.chordCluster(&cluster);
+    return scene.finish(210.0, 126.0);
+}
+
+fn grandClusterScene(notes: []const pitch.MidiNote, k: key.Key, storage: *SceneStorage) render_ir.BuildError!StaffScene {
+    var scene = SceneWriter.init(storage);
+    const top_top_y = 42.0;
+    const bottom_top_y = 142.0;
+    const staff_x0 = 44.0;
+    const staff_x1 = 204.0;
+    const key_sig_x = 78.0;
+    const cluster_x = 140.0 + keySignatureAdvance(k);
+
+    try scene.grandBrace(24.0, top_top_y - 2.0, bottom_top_y + 42.0);
+    try scene.line(44.0, top_top_y, 44.0, bottom_top_y + 4.0 * staff_line_gap, SCENE_STAFF_INK, 1.2);
+    try scene.staffLines(staff_x0, staff_x1, top_top_y);
+    try scene.staffLines(staff_x0, staff_x1, bottom_top_y);
+    try scene.endBarline(staff_x1, top_top_y);
+    try scene.endBarline(staff_x1, bottom_top_y);
+    try scene.clef(.treble, staff_x0 + 5.0, top_top_y);
+    try scene.clef(.bass, staff_x0 + 5.0, bottom_top_y);
+    try scene.keySignature(k, .treble, key_sig_x);
+    try scene.keySignature(k, .bass, key_sig_x);
+
+    var treble_notes: [32]pitch.MidiNote = undefined;
+    var bass_notes: [32]pitch.MidiNote = undefined;
+    var treble_count: usize = 0;
+    var bass_count: usize = 0;
+    for (notes) |note| {
+        switch (clefForGrandStaff(note)) {
+            .treble => {
+                treble_notes[treble_count] = note;
+                treble_count += 1;
+            },
+            .bass => {
+                bass_notes[bass_count] = note;
+                bass_count += 1;
+            },
+        }
+    }
+
+    var treble_cluster = layoutChordCluster(treble_notes[0..treble_count], k, .treble, cluster_x);
+    var bass_cluster = layoutChordCluster(bass_notes[0..bass_count], k, .bass, cluster_x);
+    shiftClusterY(&bass_cluster, 100.0);
+    try scene.chordCluster(&treble_cluster);
+    try scene.chordCluster(&bass_cluster);
+    return scene.finish(228.0, 236.0);
+}
+
+const SCENE_INK = render_ir.Paint{ .color = .{ .r = 0x11, .g = 0x11, .b = 0x11, .a = 255 } };
+const SCENE_STAFF_INK = render_ir.Paint{ .color = .{ .r = 0x17, .g = 0x17, .b = 0x17, .a = 255 } };
+
+const TREBLE_CLEF_COMMANDS = scenePath(TREBLE_CLEF_PATH_D);
+const BASS_CLEF_COMMANDS = scenePath(BASS_CLEF_PATH_D);
+const FLAT_GLYPH_COMMANDS = scenePath("M0 -10 L0 9 C0 9 5.5 5.5 5.5 1.2 C5.5 -3.6 1.6 -5.2 0 -3.4");
+
+fn scenePath(comptime d: []const u8) []const render_ir.PathCommand {
+    comptime {
+        @setEvalBranchQuota(4_000_000);
+        var commands: [d.len / 2]render_ir.PathCommand = undefined;
+        const len = render_ir.tokenizePath(d, &commands) catch unreachable;
+        const final = commands[0..len].*;
+        return &final;
+    }
+}
+
+fn sceneGlyphLine(x1: f64, y1: f64, x2: f64, y2: f64) render_ir.NumericOp {
+    return .{ .line = .{ .x1 = x1, .y1 = y1, .x2 = x2, .y2 = y2, .stroke = SCENE_INK, .stroke_width = 1.25 } };
+}
+
+const SHARP_GLYPH_OPS = [_]render_ir.NumericOp{
+    sceneGlyphLine(1, -10, -1, 10),
+    sceneGlyphLine(7, -10, 5, 10),
+    sceneGlyphLine(-2, -3, 8, -5),
+    sceneGlyphLine(-1, 4, 9, 2),
+};
+const NATURAL_GLYPH_OPS = [_]render_ir.NumericOp{
+    sceneGlyphLine(0, -10, 0, 8),
+    sceneGlyphLine(6, -7, 6, 11),
+    sceneGlyphLine(0, -1, 6, -3),
+    sceneGlyphLine(0, 6, 6, 4),
+};
+const FLAT_GLYPH_OPS = [_]render_ir.NumericOp{
+    .{ .path = .{ .d = FLAT_GLYPH_COMMANDS, .stroke = SCENE_INK, .stroke_width = 1.25 } },
+};
+
+/// The value the markup holds for `value` printed with `{d:.2}`.
+fn printed(value: f32) f64 {
+    return @round(@as(f64, value) * 100.0) / 100.0;
+}
+
+/// Mirrors the staff draw functions op for op, with every coordinate
+/// rounded the way the writers print it.
+const SceneWriter = struct {
+    storage: *SceneStorage,
+    builder: render_ir.NumericBuilder,
+    groups: usize = 0,
+
+    fn init(storage: *SceneStorage) SceneWriter {
+        return .{ .storage = storage, .builder = render_ir.NumericBuilder.init(&storage.ops) };
+    }
+
+    fn finish(self: *const SceneWriter, view_width: f64, view_height: f64) StaffScene {
+        return .{ .view_width = view_width, .view_height = view_height, .scene = self.builder.scene() };
+    }
+
+    fn line(self: *SceneWriter, x1: f32, y1: f32, x2: f32, y2: f32, stroke: render_ir.Paint, width: f64) render_ir.BuildError!void {
+        try self.builder.line(.{ .x1 = printed(x1), .y1 = printed(y1), .x2 = printed(x2), .y2 = printed(y2), .stroke = stroke, .stroke_width = width });
+    }
+
+    /// Opens a group translated as `translate({d:.2},{d:.2})`; the text is
+    /// kept so the rasterizer composes the same matrix as from the markup.
+    fn translate(self: *SceneWriter, x: f32, y: f32) render_ir.BuildError!void {
+        if (self.groups >= SCENE_GROUP_LIMIT) return error.NoSpace;
+        const slot = self.groups;
+        const text = std.fmt.bufPrint(&self.storage.transforms[slot], "translate({d:.2},{d:.2})", .{ x, y }) catch return error.NoSpace;
+        self.storage.attrs[slot] = .{ .key = "transform", .value = text };
+        self.groups += 1;
+        try self.builder.groupStart(self.storage.attrs[slot .. slot + 1], true);
+    }
+
+    fn staffLines(self: *SceneWriter, x0: f32, x1: f32, top_y: f32) render_ir.BuildError!void {
+        var i: u3 = 0;
+        while (i < 5) : (i += 1) {
+            const y = top_y + @as(f32, @floatFromInt(i)) * staff_line_gap;
+            try self.line(x0, y, x1, y, SCENE_STAFF_INK, 1.2);
+        }
+    }
+
+    fn endBarline(self: *SceneWriter, x: f32, top_y: f32) render_ir.BuildError!void {
+        try self.line(x, top_y, x, top_y + 4.0 * staff_line_gap, SCENE_STAFF_INK, 1.2);
+    }
+
+    fn grandBrace(self: *SceneWriter, x: f32, top_y: f32, bottom_y: f32) render_ir.BuildError!void {
+        const mid = (top_y + bottom_y) / 2.0;
+        const brace = &self.storage.brace;
+        brace[0] = .{ .move_to = .{ .x = printed(x + 10.0), .y = printed(top_y) } };
+        brace[1] = .{ .cubic_to = .{
+            .c1 = .{ .x = printed(x - 2.0), .y = printed(top_y + 10.0) },
+            .c2 = .{ .x = printed(x - 2.0), .y = printed(mid - 12.0) },
+            .to = .{ .x = printed(x + 10.0), .y = printed(mid) },
+        } };
+        brace[2] = .{ .move_to = .{ .x = printed(x + 10.0), .y = printed(mid) } };
+        brace[3] = .{ .cubic_to = .{
+            .c1 = .{ .x = printed(x - 2.0), .y = printed(mid + 12.0) },
+            .c2 = .{ .x = printed(x - 2.0), .y = printed(bottom_y - 10.0) },
+            .to = .{ .x = printed(x + 10.0), .y = printed(bottom_y) },
+        } };
+        try self.builder.path(.{ .d = brace[0..2], .stroke = SCENE_INK, .stroke_width = 1.7 });
+        try self.builder.path(.{ .d = brace[2..4], .stroke = SCENE_INK, .stroke_width = 1.7 });
+    }
+
+    fn clef(self: *SceneWriter, which: Clef, x: f32, top_y: f32) render_ir.BuildError!void {
+        switch (which) {
+            .treble => try self.translate(x - compat_treble_clef_ref_x, top_y - compat_treble_clef_ref_top_y),
+            .bass => try self.translate(x - compat_bass_clef_ref_x, top_y - compat_bass_clef_ref_top_y),
+        }
+        const commands = switch (which) {
+            .treble => TREBLE_CLEF_COMMANDS,
+            .bass => BASS_CLEF_COMMANDS,
+        };
+        try self.builder.path(.{ .d = commands, .fill = SCENE_INK });
+        try self.builder.groupEnd(true);
+    }
+
+    fn keySignature(self: *SceneWriter, k: key.Key, which: Clef, start_x: f32) render_ir.BuildError!void {
+        const count_signed = keySignatureSymbolCount(k);
+        if (count_signed == 0) return;
+
+        const kind: AccidentalGlyph = if (count_signed > 0) .sharp else .flat;
+        const count = @as(u8, @intCast(@abs(count_signed)));
+        const anchors = keySignatureAnchors(which, kind);
+        var i: u8 = 0;
+        while (i < count) : (i += 1) {
+            try self.accidental(kind, start_x + @as(f32, @floatFromInt(i)) * 8.0, anchors[i]);
+        }
+    }
+
+    fn accidental(self: *SceneWriter, kind: AccidentalGlyph, x: f32, y: f32) render_ir.BuildError!void {
+        const glyph: []const render_ir.NumericOp = switch (kind) {
+            .sharp => &SHARP_GLYPH_OPS,
+            .flat => &FLAT_GLYPH_OPS,
+            .natural => &NATURAL_GLYPH_OPS,
+            .none => return,
+        };
+        try self.translate(x, y);
+        for (glyph) |op| switch (op) {
+            .line => |item| try self.builder.line(item),
+            .path => |item| try self.builder.path(item),
+            else => unreachable,
+        };
+        try self.builder.groupEnd(true);
+    }
+
+    fn ledgerLines(self: *SceneWriter, x: f32, position: StaffPosition) render_ir.BuildError!void {
+        var ledger_step: i16 = 10;
+        while (ledger_step <= position.diatonic_step) : (ledger_step += 2) {
+            const ly = staff_bottom_line_y - @as(f32, @floatFromInt(ledger_step)) * staff_step_gap;
+            try self.line(x - 8.8, ly, x + 8.8, ly, SCENE_STAFF_INK, 1.4);
+        }
+        ledger_step = -2;
+        while (ledger_step >= position.diatonic_step) : (ledger_step -= 2) {
+            const ly = staff_bottom_line_y - @as(f32, @floatFromInt(ledger_step)) * staff_step_gap;
+            try self.line(x - 8.8, ly, x + 8.8, ly, SCENE_STAFF_INK, 1.4);
+        }
+    }
+
+    fn notehead(self: *SceneWriter, x: f32, y: f32) render_ir.BuildError!void {
+        try self.builder.ellipse(.{ .cx = printed(x), .cy = printed(y), .rx = printed(notehead_rx), .ry = printed(notehead_ry), .fill = SCENE_INK });
+    }
+
+    fn chordCluster(self: *SceneWriter, cluster: *const ChordClusterLayout) render_ir.BuildError!void {
+        if (cluster.count == 0) return;
+        for (cluster.notes[0..cluster.count]) |note| {
+            if (note.note.accidental != .none) {
+                const accidental_x = note.note_x - 14.0 - @as(f32, @floatFromInt(note.accidental_column)) * accidental_column_gap;
+                try self.accidental(note.note.accidental, accidental_x, note.note.position.y);
+            }
+        }
+        for (cluster.notes[0..cluster.count]) |note| try self.ledgerLines(note.note_x, note.note.position);
+        for (cluster.notes[0..cluster.count]) |note| try self.notehead(note.note_x, note.note.position.y);
+        try self.line(cluster.stem_x, cluster.stem_start_y, cluster.stem_x, cluster.stem_end_y, SCENE_INK, 1.5);
+    }
+
+    fn singleNote(self: *SceneWriter, x: f32, note: SpelledStaffNote) render_ir.BuildError!void {
+        const y = note.position.y;
+        if (note.accidental != .none) {
+            const accidental_x: f32 = x - (if (note.accidental == .flat) @as(f32, 11.0) else @as(f32, 13.0));
+            try self.accidental(note.accidental, accidental_x, y);
+        }
+        try self.ledgerLines(x, note.position);
+        try self.notehead(x, y);
+        if (y >= 60.0) {
+            try self.line(x + stem_to_head, y - 0.6, x + stem_to_head, y - 29.0, SCENE_INK, 1.4);
+        } else {
+            try self.line(x - stem_to_head, y + 0.6, x - stem_to_head, y + 29.0, SCENE_INK, 1.4);
+        }
+    }
+};
+
 fn layoutChordCluster(notes: []const pitch.MidiNote, k: key.Key, clef: Clef, cluster_x: f32) ChordClusterLayout {
     var cluster = ChordClusterLayout{};
     cluster.count = @min(notes.len, cluster.notes.len);
@@ -110,13 +110,38 @@ pub fn neighborCount(tile_idx: usize, edges: []const Edge) u8 {
     return count;
 }
 
-pub fn renderScaleTessellation(buf: []u8) []u8 {
-    var tiles_buf: [TILE_COUNT]Tile = undefined;
-    const tiles = enumerateTiles(&tiles_buf);
+/// The 48 tiles and their adjacency are fixed, so both tables are built at
+/// compile time.
+pub const scale_tiles: [TILE_COUNT]Tile = blk: {
+    var out: [TILE_COUNT]Tile = undefined;
+    _ = enumerateTiles(&out);
+    break :blk out;
+};
+
+pub const scale_edges = blk: {
+    @setEvalBranchQuota(1_000_000);
+    var edge_buf: [MAX_EDGES]Edge = undefined;
+    const built = buildAdjacency(&scale_tiles, &edge_buf);
+    break :blk edge_buf[0..built.len].*;
+};
 
-    var edges_buf: [MAX_EDGES]Edge = undefined;
-    const edges = buildAdjacency(tiles, &edges_buf);
+// Edge lines and tile polygons are formatted once at compile time.
+const TESSELLATION_BODY = blk: {
+    @setEvalBranchQuota(4_000_000);
+    var body_buf: [32 * 1024]u8 = undefined;
+    var stream = std.io.fixedBufferStream(&body_buf);
+    for (scale_edges) |edge| {
+        const from = scale_tiles[edge.from_idx];
+        const to = scale_tiles[edge.to_idx];
+        stream.writer().print("<line class=\"vl-edge\" x1=\"{d:.2}\" y1=\"{d:.2}\" x2=\"{d:.2}\" y2=\"{d:.2}\" />\n", .{ from.cx, from.cy, to.cx, to.cy }) catch unreachable;
+    }
+    for (scale_tiles) |tile| {
+        drawTile(stream.writer(), tile);
+    }
+    break :blk body_buf[0..stream.pos].*;
+};
 
+pub fn renderScaleTessellation(buf: []u8) []u8 {
     var stream = std.io.fixedBufferStream(buf);
     const w = stream.writer();
 
@@ -132,17 +157,7 @@ pub fn renderScaleTessellation(buf: []u8) []u8 {
         "<rect x=\"0\" y=\"0\" width=\"{d}\" height=\"{d}\" fill=\"white\" />\n",
         .{ CANVAS_WIDTH, CANVAS_HEIGHT },
     ) catch unreachable;
-
-    for (edges) |edge| {
-        const from = tiles[edge.from_idx];
-        const to = tiles[edge.to_idx];
-        w.print("<line class=\"vl-edge\" x1=\"{d:.2}\" y1=\"{d:.2}\" x2=\"{d:.2}\" y2=\"{d:.2}\" />\n", .{ from.cx, from.cy, to.cx, to.cy }) catch unreachable;
-    }
-
-    for (tiles) |tile| {
-        drawTile(w, tile);
-    }
-
+    w.writeAll(&TESSELLATION_BODY) catch unreachable;
     w.writeAll("</svg>\n") catch unreachable;
     return buf[0..stream.pos];
 }
@@ -515,6 +515,28 @@ pub fn writeBlockText(
     try writer.writeAll("</g>\n");
 }
 
+/// `writeBlockText` evaluated at compile time, for labels whose text and
+/// anchor never change.
+pub fn comptimeBlockText(
+    comptime text: []const u8,
+    comptime x: f64,
+    comptime y: f64,
+    comptime cell: f64,
+    comptime tracking: f64,
+    comptime fill: []const u8,
+    comptime anchor: BlockTextAnchor,
+    comptime class_name: ?[]const u8,
+) []const u8 {
+    comptime {
+        @setEvalBranchQuota(4_000_000);
+        var buf: [64 * 1024]u8 = undefined;
+        var stream = std.io.fixedBufferStream(&buf);
+        writeBlockText(stream.writer(), text, x, y, cell, tracking, fill, anchor, class_name) catch unreachable;
+        const markup = buf[0..stream.pos].*;
+        return &markup;
+    }
+}
+
 pub fn centerSquarePathData(glyph: []const u8) ?[]const u8 {
     return findCenterTemplate(glyph);
 }
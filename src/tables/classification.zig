@@ -1,3 +1,4 @@
+const pcs = @import("../pitch_class_set.zig");
 const cluster = @import("../cluster.zig");
 const evenness = @import("../evenness.zig");
 const set_class = @import("../set_class.zig");
@@ -7,6 +8,7 @@ pub const CLUSTER_INFO = cluster.CLUSTER_INFO_TABLE;
 pub const EVENNESS_INFO = evenness.EVENNESS_INFO_TABLE;
 pub const CLASSIFICATION_FLAGS = buildClassificationFlags();
 pub const CLUSTER_FREE_INDICES = buildClusterFreeIndices();
+pub const PCS_FLAGS = buildPcsFlags();
 
 fn buildClassificationFlags() [set_tables.SET_CLASSES.len]set_class.ClassificationFlags {
     @setEvalBranchQuota(2_000_000);
@@ -42,3 +44,18 @@ fn buildClusterFreeIndices() [124]u16 {
 
     return out;
 }
+
+fn buildPcsFlags() [4096]set_class.ClassificationFlags {
+    @setEvalBranchQuota(20_000_000);
+
+    var out: [4096]set_class.ClassificationFlags = undefined;
+    for (&out, 0..) |*slot, raw| {
+        const set = @as(pcs.PitchClassSet, @intCast(raw));
+        slot.* = .{
+            .cluster_free = !cluster.hasCluster(set),
+            .symmetric = set_class.isSymmetric(set),
+            .limited_transposition = set_tables.transpositionPeriod(set) < 12,
+        };
+    }
+    return out;
+}
@@ -1,12 +1,40 @@
 const pcs = @import("../pitch_class_set.zig");
 const forte = @import("../forte.zig");
 const set_class = @import("../set_class.zig");
+const classification = @import("classification.zig");
 
 pub const SET_CLASSES = set_class.SET_CLASSES;
 pub const FORTE_MAP = buildForteMap();
 pub const COMPLEMENT_MAP = buildComplementMap();
 pub const INVOLUTION_MAP = buildInvolutionMap();
 
+/// Dense per-set classification, indexed by the raw pitch class set.
+/// Sets outside the 3-9 Forte catalog carry `forte_ordinal = 0`.
+pub const PcsInfo = packed struct(u64) {
+    prime: pcs.PitchClassSet,
+    forte_prime: pcs.PitchClassSet,
+    transpositions: u4,
+    forte_cardinality: u4,
+    forte_ordinal: u8,
+    forte_is_z: bool,
+    _padding: u7 = 0,
+    flags: set_class.ClassificationFlags,
+
+    pub fn forteNumber(self: PcsInfo) forte.ForteNumber {
+        return .{
+            .cardinality = self.forte_cardinality,
+            .ordinal = self.forte_ordinal,
+            .is_z = self.forte_is_z,
+        };
+    }
+};
+
+pub const PCS_INFO = buildPcsInfo();
+
+pub fn info(set: pcs.PitchClassSet) PcsInfo {
+    return PCS_INFO[set];
+}
+
 fn buildForteMap() [SET_CLASSES.len]forte.ForteNumber {
     @setEvalBranchQuota(2_000_000);
 
@@ -22,7 +50,7 @@ fn buildComplementMap() [SET_CLASSES.len]u16 {
 
     var out: [SET_CLASSES.len]u16 = undefined;
     for (SET_CLASSES, 0..) |sc, i| {
-        const comp_prime = set_class.fortePrime(pcs.complement(sc.pcs));
+        const comp_prime = set_class.computeFortePrime(pcs.complement(sc.pcs));
         out[i] = findSetClassIndex(comp_prime);
     }
     return out;
@@ -33,7 +61,7 @@ fn buildInvolutionMap() [SET_CLASSES.len]u16 {
 
     var out: [SET_CLASSES.len]u16 = undefined;
     for (SET_CLASSES, 0..) |sc, i| {
-        const inv_prime = set_class.fortePrime(pcs.invert(sc.pcs));
+        const inv_prime = set_class.computeFortePrime(pcs.invert(sc.pcs));
         out[i] = findSetClassIndex(inv_prime);
     }
     return out;
@@ -45,3 +73,40 @@ fn findSetClassIndex(target: pcs.PitchClassSet) u16 {
     }
     unreachable;
 }
+
+fn buildPcsInfo() [4096]PcsInfo {
+    @setEvalBranchQuota(20_000_000);
+
+    var forte_by_prime = [_]?forte.ForteNumber{null} ** 4096;
+    for (forte.ENTRIES) |entry| {
+        forte_by_prime[entry.prime] = entry.number;
+    }
+
+    var out: [4096]PcsInfo = undefined;
+    for (&out, 0..) |*slot, raw| {
+        const set = @as(pcs.PitchClassSet, @intCast(raw));
+        const card = pcs.cardinality(set);
+        const fprime = set_class.computeFortePrime(set);
+        const fnum = if (card >= 3 and card <= 9) forte_by_prime[fprime] else null;
+        slot.* = .{
+            .prime = set_class.computePrimeForm(set),
+            .forte_prime = fprime,
+            .transpositions = transpositionPeriod(set),
+            .forte_cardinality = card,
+            .forte_ordinal = if (fnum) |n| n.ordinal else 0,
+            .forte_is_z = if (fnum) |n| n.is_z else false,
+            .flags = classification.PCS_FLAGS[raw],
+        };
+    }
+    return out;
+}
+
+/// Distinct transpositions equal the rotational period, which avoids the
+/// 4096-entry scratch array `set_class.computeNumTranspositions` needs per set.
+pub fn transpositionPeriod(set: pcs.PitchClassSet) u4 {
+    var t: u4 = 1;
+    while (t < 12) : (t += 1) {
+        if (pcs.transpose(set, t) == set) return t;
+    }
+    return 12;
+}
@@ -1,10 +1,15 @@
 const std = @import("std");
+const builtin = @import("builtin");
 const testing = std.testing;
 
 const pcs = @import("../pitch_class_set.zig");
 const counterpoint = @import("../counterpoint.zig");
 const keyboard = @import("../keyboard.zig");
 const playability = @import("../playability.zig");
+const render_png = @import("../render/png.zig");
+const render_qoi = @import("../render/qoi.zig");
+const bitmap_compat = @import("../bitmap_compat.zig");
+const heap = @import("../heap.zig");
 
 const c = @cImport({
     @cInclude("libmusictheory.h");
@@ -66,6 +71,72 @@ const lmt_prime_form = api.lmt_prime_form;
 const lmt_forte_prime = api.lmt_forte_prime;
 const lmt_is_cluster_free = api.lmt_is_cluster_free;
 const lmt_evenness_distance = api.lmt_evenness_distance;
+const lmt_pcs_cardinality_batch = api.lmt_pcs_cardinality_batch;
+const lmt_pcs_transpose_batch = api.lmt_pcs_transpose_batch;
+const lmt_pcs_invert_batch = api.lmt_pcs_invert_batch;
+const lmt_pcs_complement_batch = api.lmt_pcs_complement_batch;
+const lmt_prime_form_batch = api.lmt_prime_form_batch;
+const lmt_forte_prime_batch = api.lmt_forte_prime_batch;
+const lmt_is_cluster_free_batch = api.lmt_is_cluster_free_batch;
+const lmt_evenness_distance_batch = api.lmt_evenness_distance_batch;
+const lmt_sizeof_set_class_info = api.lmt_sizeof_set_class_info;
+const lmt_lookup_set_class = api.lmt_lookup_set_class;
+const lmt_lookup_set_class_batch = api.lmt_lookup_set_class_batch;
+const lmt_sizeof_context = api.lmt_sizeof_context;
+const lmt_alignof_context = api.lmt_alignof_context;
+const lmt_context_init = api.lmt_context_init;
+const lmt_generate_voicings_n_ctx = api.lmt_generate_voicings_n_ctx;
+const lmt_preferred_voicing_n_ctx = api.lmt_preferred_voicing_n_ctx;
+const lmt_svg_compat_generate_ctx = api.lmt_svg_compat_generate_ctx;
+const lmt_compat_catalog_render = api.lmt_compat_catalog_render;
+const lmt_bitmap_compat_render_candidate_rgba_scaled = api.lmt_bitmap_compat_render_candidate_rgba_scaled;
+const lmt_bitmap_compat_render_candidate_rgba_scaled_ctx = api.lmt_bitmap_compat_render_candidate_rgba_scaled_ctx;
+const lmt_bitmap_compat_render_candidate_rgba_ctx = api.lmt_bitmap_compat_render_candidate_rgba_ctx;
+const lmt_bitmap_compat_render_candidate_rgba = api.lmt_bitmap_compat_render_candidate_rgba;
+const lmt_bitmap_compat_render_candidate_rgba_scaled_tiled = api.lmt_bitmap_compat_render_candidate_rgba_scaled_tiled;
+const lmt_bitmap_compat_required_rgba_bytes_scaled = api.lmt_bitmap_compat_required_rgba_bytes_scaled;
+const lmt_bitmap_compat_required_rgba_bytes = api.lmt_bitmap_compat_required_rgba_bytes;
+const LmtCompatCatalogStats = api.LmtCompatCatalogStats;
+const LmtRenderCacheStats = api.LmtRenderCacheStats;
+const lmt_render_cache_configure = api.lmt_render_cache_configure;
+const lmt_render_cache_invalidate = api.lmt_render_cache_invalidate;
+const lmt_render_cache_get_stats = api.lmt_render_cache_get_stats;
+const lmt_warmup = api.lmt_warmup;
+const lmt_pack_get_stats = api.lmt_pack_get_stats;
+const LmtPackStats = api.LmtPackStats;
+const lmt_svg_prerendered_count = api.lmt_svg_prerendered_count;
+const lmt_svg_prerendered = api.lmt_svg_prerendered;
+const LmtDirtyRect = api.LmtDirtyRect;
+const lmt_sizeof_bitmap_view = api.lmt_sizeof_bitmap_view;
+const lmt_alignof_bitmap_view = api.lmt_alignof_bitmap_view;
+const lmt_bitmap_keyboard_view_init = api.lmt_bitmap_keyboard_view_init;
+const lmt_bitmap_keyboard_view_update = api.lmt_bitmap_keyboard_view_update;
+const lmt_bitmap_fret_view_init = api.lmt_bitmap_fret_view_init;
+const lmt_bitmap_fret_view_update = api.lmt_bitmap_fret_view_update;
+const lmt_bitmap_svg_stream_rgba = api.lmt_bitmap_svg_stream_rgba;
+const lmt_bitmap_evenness_field_stream_rgba = api.lmt_bitmap_evenness_field_stream_rgba;
+const lmt_bitmap_svg_png = api.lmt_bitmap_svg_png;
+const lmt_bitmap_svg_qoi = api.lmt_bitmap_svg_qoi;
+const lmt_bitmap_evenness_field_png = api.lmt_bitmap_evenness_field_png;
+const lmt_bitmap_key_staff_png = api.lmt_bitmap_key_staff_png;
+const lmt_bitmap_keyboard_png = api.lmt_bitmap_keyboard_png;
+const lmt_svg_clock_optc_ctx = api.lmt_svg_clock_optc_ctx;
+const lmt_svg_evenness_chart_ctx = api.lmt_svg_evenness_chart_ctx;
+const lmt_svg_optic_k_group_ctx = api.lmt_svg_optic_k_group_ctx;
+const lmt_svg_key_staff_ctx = api.lmt_svg_key_staff_ctx;
+const lmt_svg_fret_tuned_n_ctx = api.lmt_svg_fret_tuned_n_ctx;
+const lmt_svg_keyboard_ctx = api.lmt_svg_keyboard_ctx;
+const lmt_context_svg_len = api.lmt_context_svg_len;
+const lmt_context_svg_copy = api.lmt_context_svg_copy;
+const lmt_svg_optic_k_group_stream = api.lmt_svg_optic_k_group_stream;
+const lmt_svg_evenness_chart_stream = api.lmt_svg_evenness_chart_stream;
+const lmt_svg_evenness_field_stream = api.lmt_svg_evenness_field_stream;
+const lmt_svg_clock_optc_batch = api.lmt_svg_clock_optc_batch;
+const lmt_svg_evenness_field_batch = api.lmt_svg_evenness_field_batch;
+const lmt_svg_fret_n_batch = api.lmt_svg_fret_n_batch;
+const lmt_bitmap_clock_optc_batch_rgba = api.lmt_bitmap_clock_optc_batch_rgba;
+const lmt_bitmap_evenness_field_batch_rgba = api.lmt_bitmap_evenness_field_batch_rgba;
+const lmt_bitmap_fret_n_batch_rgba = api.lmt_bitmap_fret_n_batch_rgba;
 const lmt_scale = api.lmt_scale;
 const lmt_mode = api.lmt_mode;
 const lmt_mode_type_count = api.lmt_mode_type_count;
@@ -277,6 +348,8 @@ test "c abi header layout and constants" {
     try testing.expectEqual(@sizeOf(c.lmt_scale_snap_candidates), @sizeOf(LmtScaleSnapCandidates));
     try testing.expectEqual(@sizeOf(c.lmt_containing_mode_match), @sizeOf(LmtContainingModeMatch));
     try testing.expectEqual(@sizeOf(c.lmt_chord_match), @sizeOf(LmtChordMatch));
+    try testing.expectEqual(@sizeOf(c.lmt_render_cache_stats), @sizeOf(LmtRenderCacheStats));
+    try testing.expectEqual(@sizeOf(c.lmt_dirty_rect), @sizeOf(LmtDirtyRect));
     try testing.expectEqual(@sizeOf(c.lmt_hand_profile), @sizeOf(LmtHandProfile));
     try testing.expectEqual(@sizeOf(c.lmt_playability_difficulty_summary), @sizeOf(LmtPlayabilityDifficultySummary));
     try testing.expectEqual(@sizeOf(c.lmt_keyboard_phrase_event), @sizeOf(LmtKeyboardPhraseEvent));
@@ -451,6 +524,738 @@ test "c abi classification" {
     try testing.expect(lmt_evenness_distance(set) > 0.0);
 }
 
+test "c abi batch set operations" {
+    const sets = [_]u16{ 0x091, 0x089, 0x0AB5, 0x007, 0x000, 0x0FFF, 0x0555, 0x0249, 0xF091 };
+    var out_u8: [sets.len]u8 = undefined;
+    var out_u16: [sets.len]u16 = undefined;
+    var out_bool: [sets.len]bool = undefined;
+    var out_f32: [sets.len]f32 = undefined;
+
+    try testing.expectEqual(@as(u32, sets.len), lmt_pcs_cardinality_batch(&sets, sets.len, &out_u8));
+    for (sets, out_u8) |set, got| try testing.expectEqual(lmt_pcs_cardinality(set), got);
+
+    try testing.expectEqual(@as(u32, sets.len), lmt_pcs_transpose_batch(&sets, sets.len, 14, &out_u16));
+    for (sets, out_u16) |set, got| try testing.expectEqual(lmt_pcs_transpose(set, 14), got);
+
+    try testing.expectEqual(@as(u32, sets.len), lmt_pcs_invert_batch(&sets, sets.len, &out_u16));
+    for (sets, out_u16) |set, got| try testing.expectEqual(lmt_pcs_invert(set), got);
+
+    try testing.expectEqual(@as(u32, sets.len), lmt_pcs_complement_batch(&sets, sets.len, &out_u16));
+    for (sets, out_u16) |set, got| try testing.expectEqual(lmt_pcs_complement(set), got);
+
+    try testing.expectEqual(@as(u32, sets.len), lmt_prime_form_batch(&sets, sets.len, &out_u16));
+    for (sets, out_u16) |set, got| try testing.expectEqual(lmt_prime_form(set), got);
+
+    try testing.expectEqual(@as(u32, sets.len), lmt_forte_prime_batch(&sets, sets.len, &out_u16));
+    for (sets, out_u16) |set, got| try testing.expectEqual(lmt_forte_prime(set), got);
+
+    try testing.expectEqual(@as(u32, sets.len), lmt_is_cluster_free_batch(&sets, sets.len, &out_bool));
+    for (sets, out_bool) |set, got| try testing.expectEqual(lmt_is_cluster_free(set), got);
+
+    try testing.expectEqual(@as(u32, sets.len), lmt_evenness_distance_batch(&sets, sets.len, &out_f32));
+    for (sets, out_f32) |set, got| try testing.expectEqual(lmt_evenness_distance(set), got);
+
+    try testing.expectEqual(@as(u32, 0), lmt_prime_form_batch(null, sets.len, &out_u16));
+    try testing.expectEqual(@as(u32, 0), lmt_prime_form_batch(&sets, sets.len, null));
+}
+
+test "c abi set class info" {
+    try testing.expectEqual(@as(u32, @sizeOf(c.lmt_set_class_info)), lmt_sizeof_set_class_info());
+
+    var info: c.lmt_set_class_info = undefined;
+    try testing.expectEqual(@as(u32, 1), lmt_lookup_set_class(0x244, @ptrCast(&info)));
+    try testing.expectEqual(@as(u16, 0x091), info.prime);
+    try testing.expectEqual(@as(u16, 0x089), info.forte_prime);
+    try testing.expectEqual(@as(u8, 3), info.cardinality);
+    try testing.expectEqual(@as(u8, 11), info.forte_ordinal);
+    try testing.expectEqual(@as(u8, 0), info.forte_is_z);
+    try testing.expectEqual(@as(u8, 12), info.transposition_count);
+    try testing.expectEqual(@as(u8, 1), info.cluster_free);
+    try testing.expectEqual(@as(u8, 0), info.symmetric);
+    try testing.expectEqual(@as(u8, 0), info.limited_transposition);
+
+    const sets = [_]u16{ 0x0555, 0x0007, 0xF000 };
+    var batch: [sets.len]c.lmt_set_class_info = undefined;
+    try testing.expectEqual(@as(u32, sets.len), lmt_lookup_set_class_batch(&sets, sets.len, @ptrCast(&batch)));
+    try testing.expectEqual(@as(u8, 2), batch[0].transposition_count);
+    try testing.expectEqual(@as(u8, 1), batch[0].symmetric);
+    try testing.expectEqual(@as(u8, 1), batch[0].limited_transposition);
+    try testing.expectEqual(@as(u8, 0), batch[1].cluster_free);
+    try testing.expectEqual(@as(u8, 1), batch[2].transposition_count);
+    try testing.expectEqual(@as(u8, 0), batch[2].forte_ordinal);
+
+    try testing.expectEqual(@as(u32, 0), lmt_lookup_set_class(0x091, null));
+}
+
+const ContextStorage = []align(16) u8;
+
+fn allocContextStorage() !ContextStorage {
+    try testing.expect(lmt_alignof_context() <= 16);
+    return testing.allocator.alignedAlloc(u8, .@"16", lmt_sizeof_context());
+}
+
+const ContextWorker = struct {
+    ctx: ?*anyopaque,
+    chord: u16,
+    expected_name: []const u8,
+    expected_rows: []const i8,
+    failures: u32 = 0,
+
+    const tuning = [_]u8{ 40, 45, 50, 55, 59, 64 };
+
+    fn run(self: *ContextWorker) void {
+        var rows: [128 * tuning.len]i8 = undefined;
+        var i: usize = 0;
+        while (i < 64) : (i += 1) {
+            const count = lmt_generate_voicings_n_ctx(self.ctx, self.chord, &tuning, tuning.len, 12, 4, &rows, 128);
+            const len = @as(usize, count) * tuning.len;
+            if (!std.mem.eql(i8, rows[0..len], self.expected_rows)) self.failures += 1;
+            const name = std.mem.span(@as([*:0]const u8, @ptrCast(lmt_chord_name(self.chord))));
+            if (!std.mem.eql(u8, name, self.expected_name)) self.failures += 1;
+        }
+    }
+};
+
+test "c abi reentrant contexts" {
+    try testing.expect(lmt_sizeof_context() > 0);
+    try testing.expect(lmt_context_init(null, lmt_sizeof_context()) == null);
+
+    const storage_a = try allocContextStorage();
+    defer testing.allocator.free(storage_a);
+    const storage_b = try allocContextStorage();
+    defer testing.allocator.free(storage_b);
+
+    try testing.expect(lmt_context_init(storage_a.ptr, lmt_sizeof_context() - 1) == null);
+    const ctx_a = lmt_context_init(storage_a.ptr, @intCast(storage_a.len));
+    const ctx_b = lmt_context_init(storage_b.ptr, @intCast(storage_b.len));
+    try testing.expect(ctx_a != null and ctx_b != null);
+
+    const tuning = ContextWorker.tuning;
+    try testing.expectEqual(@as(u32, 0), lmt_generate_voicings_n_ctx(null, pcs.C_MAJOR_TRIAD, &tuning, tuning.len, 12, 4, null, 0));
+
+    var major_rows: [128 * tuning.len]i8 = undefined;
+    const major_count = lmt_generate_voicings_n(pcs.C_MAJOR_TRIAD, &tuning, tuning.len, 12, 4, &major_rows, 128);
+    var minor_rows: [128 * tuning.len]i8 = undefined;
+    const minor_count = lmt_generate_voicings_n(pcs.C_MINOR_TRIAD, &tuning, tuning.len, 12, 4, &minor_rows, 128);
+    try testing.expect(major_count > 0 and minor_count > 0);
+
+    var preferred: [tuning.len]i8 = undefined;
+    try testing.expect(lmt_preferred_voicing_n_ctx(ctx_a, pcs.C_MAJOR_TRIAD, &tuning, tuning.len, 12, 4, 255, &preferred, preferred.len) > 0);
+    try testing.expectEqualSlices(i8, &[_]i8{ 0, 3, 2, 0, 1, 0 }, &preferred);
+
+    var workers = [_]ContextWorker{
+        .{ .ctx = ctx_a, .chord = pcs.C_MAJOR_TRIAD, .expected_name = "Major", .expected_rows = major_rows[0 .. @as(usize, major_count) * tuning.len] },
+        .{ .ctx = ctx_b, .chord = pcs.C_MINOR_TRIAD, .expected_name = "Minor", .expected_rows = minor_rows[0 .. @as(usize, minor_count) * tuning.len] },
+    };
+    var threads: [workers.len]std.Thread = undefined;
+    for (&workers, &threads) |*worker, *thread| {
+        thread.* = try std.Thread.spawn(.{}, ContextWorker.run, .{worker});
+    }
+    for (threads) |thread| thread.join();
+    for (workers) |worker| try testing.expectEqual(@as(u32, 0), worker.failures);
+
+    var legacy_svg: [4096]u8 = undefined;
+    var ctx_svg: [4096]u8 = undefined;
+    const legacy_len = lmt_svg_compat_generate(0, 0, &legacy_svg, legacy_svg.len);
+    try testing.expect(legacy_len > 0);
+    try testing.expectEqual(legacy_len, lmt_svg_compat_generate_ctx(ctx_b, 0, 0, &ctx_svg, ctx_svg.len));
+    const copied = @min(@as(usize, legacy_len), legacy_svg.len - 1);
+    try testing.expectEqualSlices(u8, legacy_svg[0..copied], ctx_svg[0..copied]);
+}
+
+test "c abi render-once svg contexts" {
+    const storage = try allocContextStorage();
+    defer testing.allocator.free(storage);
+    const ctx = lmt_context_init(storage.ptr, @intCast(storage.len));
+    try testing.expect(ctx != null);
+    try testing.expectEqual(@as(u32, 0), lmt_context_svg_len(ctx));
+    try testing.expectEqual(@as(u32, 0), lmt_svg_clock_optc_ctx(null, 0x091, null, 0));
+
+    var legacy: [64 * 1024]u8 = undefined;
+    var rendered: [64 * 1024]u8 = undefined;
+
+    const clock_len = lmt_svg_clock_optc(0x091, &legacy, legacy.len);
+    try testing.expectEqual(clock_len, lmt_svg_clock_optc_ctx(ctx, 0x091, &rendered, rendered.len));
+    try testing.expectEqualSlices(u8, legacy[0..clock_len], rendered[0..clock_len]);
+
+    const tuning = [_]u8{ 43, 48, 52, 57 };
+    const frets = [_]i8{ 0, 2, 2, 1 };
+    const fret_len = lmt_svg_fret_tuned_n(&frets, frets.len, &tuning, tuning.len, 0, 5, &legacy, legacy.len);
+    try testing.expectEqual(fret_len, lmt_svg_fret_tuned_n_ctx(ctx, &frets, frets.len, &tuning, tuning.len, 0, 5, &rendered, rendered.len));
+    try testing.expectEqualSlices(u8, legacy[0..fret_len], rendered[0..fret_len]);
+
+    const notes = [_]u8{ 60, 64, 67 };
+    const keyboard_len = lmt_svg_keyboard(&notes, notes.len, 48, 72, &legacy, legacy.len);
+    try testing.expectEqual(keyboard_len, lmt_svg_keyboard_ctx(ctx, &notes, notes.len, 48, 72, null, 0));
+    try testing.expectEqual(keyboard_len, lmt_context_svg_len(ctx));
+    try testing.expectEqual(keyboard_len, lmt_context_svg_copy(ctx, &rendered, rendered.len));
+    try testing.expectEqualSlices(u8, legacy[0..keyboard_len], rendered[0..keyboard_len]);
+
+    var small: [64]u8 = undefined;
+    const chart_len = lmt_svg_evenness_chart_ctx(ctx, &small, small.len);
+    try testing.expect(chart_len > small.len);
+    try testing.expectEqual(@as(u8, 0), small[small.len - 1]);
+    var chart: [128 * 1024]u8 = undefined;
+    try testing.expectEqual(chart_len, lmt_context_svg_copy(ctx, &chart, chart.len));
+    try testing.expectEqualSlices(u8, small[0 .. small.len - 1], chart[0 .. small.len - 1]);
+    try testing.expectEqual(chart_len, lmt_svg_evenness_chart(&legacy, legacy.len));
+    try testing.expectEqualSlices(u8, legacy[0..@min(chart_len, legacy.len - 1)], chart[0..@min(chart_len, legacy.len - 1)]);
+}
+
+const StreamCollector = struct {
+    bytes: [128 * 1024]u8 = undefined,
+    len: usize = 0,
+    calls: u32 = 0,
+    max_chunk: usize = 0,
+    abort_after: u32 = std.math.maxInt(u32),
+
+    fn write(user: ?*anyopaque, data: [*]const u8, len: u32) callconv(.c) u32 {
+        const self: *StreamCollector = @ptrCast(@alignCast(user.?));
+        if (self.calls == self.abort_after) return 0;
+        self.calls += 1;
+        self.max_chunk = @max(self.max_chunk, len);
+        @memcpy(self.bytes[self.len .. self.len + len], data[0..len]);
+        self.len += len;
+        return 1;
+    }
+};
+
+test "c abi streaming svg writers" {
+    var expected: [128 * 1024]u8 = undefined;
+    var collector = StreamCollector{};
+
+    const optic_len = lmt_svg_optic_k_group(0x091, &expected, expected.len);
+    try testing.expectEqual(optic_len, lmt_svg_optic_k_group_stream(0x091, StreamCollector.write, &collector));
+    try testing.expectEqualSlices(u8, expected[0..optic_len], collector.bytes[0..collector.len]);
+    try testing.expect(collector.calls > 1);
+    try testing.expect(collector.max_chunk <= 4096);
+
+    collector = .{};
+    const field_len = lmt_svg_evenness_field(0x091, &expected, expected.len);
+    try testing.expectEqual(field_len, lmt_svg_evenness_field_stream(0x091, StreamCollector.write, &collector));
+    try testing.expectEqualSlices(u8, expected[0..field_len], collector.bytes[0..collector.len]);
+
+    collector = .{};
+    const chart_len = lmt_svg_evenness_chart(&expected, expected.len);
+    try testing.expectEqual(chart_len, lmt_svg_evenness_chart_stream(StreamCollector.write, &collector));
+    try testing.expectEqualSlices(u8, expected[0..chart_len], collector.bytes[0..collector.len]);
+
+    collector = .{ .abort_after = 2 };
+    try testing.expectEqual(@as(u32, 0), lmt_svg_evenness_chart_stream(StreamCollector.write, &collector));
+    try testing.expectEqual(@as(u32, 2), collector.calls);
+    try testing.expectEqual(@as(u32, 0), lmt_svg_evenness_chart_stream(null, null));
+}
+
+test "c abi compat catalog renderer" {
+    try testing.expectEqual(@sizeOf(c.lmt_compat_catalog_stats), @sizeOf(LmtCompatCatalogStats));
+
+    var tmp = testing.tmpDir(.{});
+    defer tmp.cleanup();
+    const root = try tmp.dir.realpathAlloc(testing.allocator, ".");
+    defer testing.allocator.free(root);
+    const out_path = try std.fmt.allocPrintSentinel(testing.allocator, "{s}/catalog", .{root}, 0);
+    defer testing.allocator.free(out_path);
+
+    // opc (kind 3) and center-square-text (kind 7).
+    const mask: u32 = (1 << 3) | (1 << 7);
+    var stats: [16]LmtCompatCatalogStats = undefined;
+    const written = lmt_compat_catalog_render(out_path.ptr, c.LMT_COMPAT_CATALOG_SVG, c.LMT_COMPAT_CATALOG_DIRECTORY, 2, mask, &stats, stats.len);
+    try testing.expectEqual(lmt_svg_compat_image_count(3) + lmt_svg_compat_image_count(7), written);
+    try testing.expectEqual(lmt_svg_compat_image_count(7), stats[7].images);
+    try testing.expectEqual(@as(u32, 0), stats[7].failures);
+    try testing.expectEqual(@as(u32, 0), stats[0].images);
+
+    var name_buf: [256]u8 = undefined;
+    const name_len = lmt_svg_compat_image_name(3, 0, &name_buf, name_buf.len);
+    var path_buf: [512]u8 = undefined;
+    const rel = try std.fmt.bufPrint(&path_buf, "catalog/opc/{s}", .{name_buf[0..name_len]});
+    const file_bytes = try tmp.dir.readFileAlloc(testing.allocator, rel, 1024 * 1024);
+    defer testing.allocator.free(file_bytes);
+
+    var expected: [64 * 1024]u8 = undefined;
+    const expected_len = lmt_svg_compat_generate(3, 0, &expected, expected.len);
+    try testing.expectEqualSlices(u8, expected[0..expected_len], file_bytes);
+
+    try testing.expectEqual(@as(u32, 0), lmt_compat_catalog_render(null, 0, 0, 1, mask, null, 0));
+    try testing.expectEqual(@as(u32, 0), lmt_compat_catalog_render(out_path.ptr, 9, 0, 1, mask, null, 0));
+}
+
+test "c abi tiled compat render matches the single pass render" {
+    // opc (kind 3) at 400 percent.
+    const required = lmt_bitmap_compat_required_rgba_bytes_scaled(3, 5, 400, 100);
+    try testing.expect(required > 0);
+    const single = try testing.allocator.alloc(u8, required);
+    defer testing.allocator.free(single);
+    const tiled = try testing.allocator.alloc(u8, required);
+    defer testing.allocator.free(tiled);
+
+    try testing.expectEqual(required, lmt_bitmap_compat_render_candidate_rgba_scaled(3, 5, 400, 100, single.ptr, required));
+    try testing.expectEqual(required, lmt_bitmap_compat_render_candidate_rgba_scaled_tiled(3, 5, 400, 100, 4, 2, tiled.ptr, required));
+    try testing.expectEqualSlices(u8, single, tiled);
+
+    try testing.expectEqual(@as(u32, 0), lmt_bitmap_compat_render_candidate_rgba_scaled_tiled(3, 5, 400, 100, 4, 2, null, required));
+    try testing.expectEqual(@as(u32, 0), lmt_bitmap_compat_render_candidate_rgba_scaled_tiled(3, 5, 400, 100, 4, 2, tiled.ptr, required - 1));
+}
+
+const CompatCandidateWorker = struct {
+    ctx: ?*anyopaque,
+    image_index: u32,
+    expected: []const u8,
+    out: []u8,
+    failures: u32 = 0,
+
+    fn run(self: *CompatCandidateWorker) void {
+        var i: usize = 0;
+        while (i < 8) : (i += 1) {
+            @memset(self.out, 0);
+            const len = lmt_bitmap_compat_render_candidate_rgba_scaled_ctx(self.ctx, 2, self.image_index, 200, 100, self.out.ptr, @intCast(self.out.len));
+            if (len != self.expected.len or !std.mem.eql(u8, self.out, self.expected)) self.failures += 1;
+        }
+    }
+};
+
+test "c abi compat candidate renders use context scratch" {
+    // scale (kind 2) renders generated SVG markup through the scratch buffer.
+    const storage_a = try allocContextStorage();
+    defer testing.allocator.free(storage_a);
+    const storage_b = try allocContextStorage();
+    defer testing.allocator.free(storage_b);
+    const ctx_a = lmt_context_init(storage_a.ptr, @intCast(storage_a.len));
+    const ctx_b = lmt_context_init(storage_b.ptr, @intCast(storage_b.len));
+    try testing.expect(ctx_a != null and ctx_b != null);
+
+    const required = lmt_bitmap_compat_required_rgba_bytes_scaled(2, 0, 200, 100);
+    try testing.expect(required > 0);
+    try testing.expectEqual(required, lmt_bitmap_compat_required_rgba_bytes_scaled(2, 1, 200, 100));
+    const buffers = try testing.allocator.alloc(u8, @as(usize, required) * 4);
+    defer testing.allocator.free(buffers);
+    const expected_0 = buffers[0..required];
+    const expected_1 = buffers[required..][0..required];
+
+    try testing.expectEqual(required, lmt_bitmap_compat_render_candidate_rgba_scaled(2, 0, 200, 100, expected_0.ptr, required));
+    try testing.expectEqual(required, lmt_bitmap_compat_render_candidate_rgba_scaled(2, 1, 200, 100, expected_1.ptr, required));
+    try testing.expect(!std.mem.eql(u8, expected_0, expected_1));
+
+    var workers = [_]CompatCandidateWorker{
+        .{ .ctx = ctx_a, .image_index = 0, .expected = expected_0, .out = buffers[2 * required ..][0..required] },
+        .{ .ctx = ctx_b, .image_index = 1, .expected = expected_1, .out = buffers[3 * required ..][0..required] },
+    };
+    var threads: [workers.len]std.Thread = undefined;
+    for (&workers, &threads) |*worker, *thread| {
+        thread.* = try std.Thread.spawn(.{}, CompatCandidateWorker.run, .{worker});
+    }
+    for (threads) |thread| thread.join();
+    for (workers) |worker| try testing.expectEqual(@as(u32, 0), worker.failures);
+
+    const base_required = lmt_bitmap_compat_required_rgba_bytes(2, 0);
+    const legacy = try testing.allocator.alloc(u8, base_required);
+    defer testing.allocator.free(legacy);
+    const via_ctx = try testing.allocator.alloc(u8, base_required);
+    defer testing.allocator.free(via_ctx);
+    try testing.expectEqual(base_required, lmt_bitmap_compat_render_candidate_rgba(2, 0, legacy.ptr, base_required));
+    try testing.expectEqual(base_required, lmt_bitmap_compat_render_candidate_rgba_ctx(ctx_a, 2, 0, via_ctx.ptr, base_required));
+    try testing.expectEqualSlices(u8, legacy, via_ctx);
+    try testing.expectEqual(@as(u32, 0), lmt_context_svg_len(ctx_a));
+
+    try testing.expectEqual(@as(u32, 0), lmt_bitmap_compat_render_candidate_rgba_ctx(null, 2, 0, via_ctx.ptr, base_required));
+    try testing.expectEqual(@as(u32, 0), lmt_bitmap_compat_render_candidate_rgba_ctx(ctx_a, 2, 0, via_ctx.ptr, base_required - 1));
+}
+
+test "c abi render cache serves repeated svg and rgba calls" {
+    defer lmt_render_cache_configure(0);
+    var stats: LmtRenderCacheStats = undefined;
+
+    var uncached: [32 * 1024]u8 = undefined;
+    const uncached_len = lmt_svg_chord_staff(c.LMT_CHORD_MAJOR, 2, &uncached, uncached.len);
+    try testing.expect(uncached_len > 0);
+    try testing.expectEqual(@as(u32, 1), lmt_render_cache_get_stats(&stats));
+    try testing.expectEqual(@as(u32, 0), stats.entries);
+
+    var before: LmtRenderCacheStats = undefined;
+    try testing.expectEqual(@as(u32, 1), lmt_render_cache_get_stats(&before));
+    lmt_render_cache_configure(4 * 1024 * 1024);
+    var first: [32 * 1024]u8 = undefined;
+    var second: [32 * 1024]u8 = undefined;
+    try testing.expectEqual(uncached_len, lmt_svg_chord_staff(c.LMT_CHORD_MAJOR, 2, &first, first.len));
+    try testing.expectEqual(uncached_len, lmt_svg_chord_staff(c.LMT_CHORD_MAJOR, 2, &second, second.len));
+    try testing.expectEqualSlices(u8, uncached[0..uncached_len], second[0..uncached_len]);
+    // Roots are reduced mod 12, so this is the same key.
+    try testing.expectEqual(uncached_len, lmt_svg_chord_staff(c.LMT_CHORD_MAJOR, 14, null, 0));
+    var truncated: [8]u8 = undefined;
+    try testing.expectEqual(uncached_len, lmt_svg_chord_staff(c.LMT_CHORD_MAJOR, 2, &truncated, truncated.len));
+    try testing.expectEqualSlices(u8, uncached[0..7], truncated[0..7]);
+    try testing.expectEqual(@as(u8, 0), truncated[7]);
+
+    var rgba_a: [64 * 64 * 4]u8 = undefined;
+    var rgba_b: [64 * 64 * 4]u8 = undefined;
+    try testing.expectEqual(@as(u32, rgba_a.len), lmt_bitmap_clock_optc_rgba(0x091, 64, 64, &rgba_a, rgba_a.len));
+    @memset(&rgba_b, 0);
+    try testing.expectEqual(@as(u32, rgba_b.len), lmt_bitmap_clock_optc_rgba(0x091, 64, 64, &rgba_b, rgba_b.len));
+    try testing.expectEqualSlices(u8, &rgba_a, &rgba_b);
+    // A hit still honours the caller's buffer size, and a new size misses.
+    try testing.expectEqual(@as(u32, 0), lmt_bitmap_clock_optc_rgba(0x091, 64, 64, &rgba_b, rgba_b.len - 1));
+    try testing.expectEqual(@as(u32, 32 * 32 * 4), lmt_bitmap_clock_optc_rgba(0x091, 32, 32, &rgba_b, rgba_b.len));
+
+    try testing.expectEqual(@as(u32, 1), lmt_render_cache_get_stats(&stats));
+    try testing.expectEqual(before.hits + 5, stats.hits);
+    try testing.expectEqual(before.misses + 3, stats.misses);
+    try testing.expectEqual(before.insertions + 3, stats.insertions);
+    try testing.expectEqual(@as(u32, 3), stats.entries);
+    try testing.expectEqual(@as(u64, 4 * 1024 * 1024), stats.budget_bytes);
+    try testing.expect(stats.bytes > rgba_a.len);
+
+    // Shrinking the budget by one byte evicts the least recently used svg.
+    lmt_render_cache_configure(@intCast(stats.bytes - 1));
+    try testing.expectEqual(@as(u32, 1), lmt_render_cache_get_stats(&stats));
+    try testing.expectEqual(before.evictions + 1, stats.evictions);
+    try testing.expectEqual(@as(u32, 2), stats.entries);
+
+    lmt_render_cache_invalidate();
+    try testing.expectEqual(@as(u32, 1), lmt_render_cache_get_stats(&stats));
+    try testing.expectEqual(@as(u32, 0), stats.entries);
+    try testing.expectEqual(@as(u64, 0), stats.bytes);
+    try testing.expectEqual(@as(u32, 0), lmt_render_cache_get_stats(null));
+}
+
+test "c abi warmup decodes each embedded pack once across threads" {
+    const Warm = struct {
+        fn run(ready: *u32) void {
+            ready.* = lmt_warmup(c.LMT_PACK_ALL);
+        }
+    };
+    var ready = [_]u32{0} ** 4;
+    if (builtin.single_threaded) {
+        for (&ready) |*r| Warm.run(r);
+    } else {
+        var threads: [ready.len]std.Thread = undefined;
+        for (&threads, &ready) |*thread, *r| thread.* = try std.Thread.spawn(.{}, Warm.run, .{r});
+        for (threads) |thread| thread.join();
+    }
+    for (ready) |r| try testing.expectEqual(@as(u32, c.LMT_PACK_ALL), r);
+
+    var first: [3]LmtPackStats = undefined;
+    for ([_]u32{ c.LMT_PACK_NAMES, c.LMT_PACK_MAJMIN_SCENES, c.LMT_PACK_EVENNESS }, &first) |kind, *stats| {
+        try testing.expectEqual(@as(u32, 1), lmt_pack_get_stats(kind, stats));
+        try testing.expectEqual(@as(u32, 1), stats.ready);
+        try testing.expect(stats.resident_bytes > 0);
+    }
+    try testing.expect(first[1].resident_bytes > first[0].resident_bytes);
+
+    // Warm packs are served without decoding or allocating again.
+    const heap_before = heap.stats();
+    try testing.expectEqual(@as(u32, c.LMT_PACK_NAMES | c.LMT_PACK_EVENNESS), lmt_warmup(c.LMT_PACK_NAMES | c.LMT_PACK_EVENNESS | 0x80));
+    var evenness: [64 * 1024]u8 = undefined;
+    try testing.expect(lmt_svg_compat_generate(1, 0, &evenness, evenness.len) > 0);
+    try testing.expectEqual(heap_before.allocations, heap.stats().allocations);
+    var again: LmtPackStats = undefined;
+    try testing.expectEqual(@as(u32, 1), lmt_pack_get_stats(c.LMT_PACK_EVENNESS, &again));
+    try testing.expectEqual(first[2].decode_ns, again.decode_ns);
+
+    try testing.expectEqual(@as(u32, 0), lmt_warmup(0));
+    try testing.expectEqual(@as(u32, 0), lmt_pack_get_stats(c.LMT_PACK_ALL, &again));
+    try testing.expectEqual(@as(u32, 0), lmt_pack_get_stats(8, &again));
+    try testing.expectEqual(@as(u32, 0), lmt_pack_get_stats(c.LMT_PACK_NAMES, null));
+}
+
+fn renderPrerenderedReference(ctx: ?*anyopaque, domain: u8, index: u32, buf: []u8) u32 {
+    const buf_size: u32 = @intCast(buf.len);
+    return switch (domain) {
+        c.LMT_PRERENDERED_CLOCK_OPTC => lmt_svg_clock_optc_ctx(ctx, @intCast(index), buf.ptr, buf_size),
+        c.LMT_PRERENDERED_OPTIC_K_GROUP => lmt_svg_optic_k_group_ctx(ctx, @intCast(index), buf.ptr, buf_size),
+        c.LMT_PRERENDERED_KEY_STAFF => lmt_svg_key_staff_ctx(ctx, @intCast(index % 12), @intCast(index / 12), buf.ptr, buf_size),
+        else => lmt_svg_evenness_chart_ctx(ctx, buf.ptr, buf_size),
+    };
+}
+
+test "c abi prerendered svg lookups match the live renderers" {
+    const storage = try allocContextStorage();
+    defer testing.allocator.free(storage);
+    const ctx = lmt_context_init(storage.ptr, @intCast(storage.len));
+    try testing.expect(ctx != null);
+
+    const domains = [_]struct { id: u8, inputs: u32 }{
+        .{ .id = c.LMT_PRERENDERED_CLOCK_OPTC, .inputs = 4096 },
+        .{ .id = c.LMT_PRERENDERED_OPTIC_K_GROUP, .inputs = 4096 },
+        .{ .id = c.LMT_PRERENDERED_KEY_STAFF, .inputs = 24 },
+        .{ .id = c.LMT_PRERENDERED_EVENNESS_CHART, .inputs = 1 },
+    };
+    var packed_svg: [128 * 1024]u8 = undefined;
+    var live_svg: [128 * 1024]u8 = undefined;
+    for (domains) |domain| {
+        const packed_count = lmt_svg_prerendered_count(domain.id);
+        if (packed_count == 0) {
+            try testing.expectEqual(@as(u32, 0), lmt_svg_prerendered(domain.id, 0, &packed_svg, packed_svg.len));
+            continue;
+        }
+        try testing.expectEqual(domain.inputs, packed_count);
+        try testing.expectEqual(@as(u32, 0), lmt_svg_prerendered(domain.id, packed_count, &packed_svg, packed_svg.len));
+
+        // The context writers always render live, so they are the reference.
+        const stride: u32 = if (domain.inputs > 64) 97 else 1;
+        var index: u32 = 0;
+        while (index < domain.inputs) : (index += stride) {
+            const len = lmt_svg_prerendered(domain.id, index, &packed_svg, packed_svg.len);
+            try testing.expect(len > 0 and len < packed_svg.len);
+            try testing.expectEqual(len, lmt_svg_prerendered(domain.id, index, null, 0));
+            try testing.expectEqual(len, renderPrerenderedReference(ctx, domain.id, index, &live_svg));
+            try testing.expectEqualSlices(u8, live_svg[0..len], packed_svg[0..len]);
+        }
+    }
+    try testing.expectEqual(@as(u32, 0), lmt_svg_prerendered_count(4));
+    try testing.expectEqual(@as(u32, 0), lmt_svg_prerendered(4, 0, &packed_svg, packed_svg.len));
+}
+
+test "c abi bitmap views redraw changed regions and match full renders" {
+    if (lmt_raster_is_enabled() == 0) return;
+    const view_size = lmt_sizeof_bitmap_view();
+    const view_align = lmt_alignof_bitmap_view();
+    try testing.expect(view_size > 0 and view_align > 0);
+    const storage = try testing.allocator.alignedAlloc(u8, .@"16", view_size);
+    defer testing.allocator.free(storage);
+    try testing.expect(view_align <= 16);
+
+    const width = 420;
+    const height = 110;
+    const pixels = try testing.allocator.alloc(u8, width * height * 4);
+    defer testing.allocator.free(pixels);
+    const expected = try testing.allocator.alloc(u8, pixels.len);
+    defer testing.allocator.free(expected);
+    var rects: [4]LmtDirtyRect = undefined;
+
+    try testing.expect(lmt_bitmap_keyboard_view_init(storage.ptr, view_size - 1, 48, 72, width, height) == null);
+    try testing.expect(lmt_bitmap_keyboard_view_init(storage.ptr, view_size, 48, 72, 0, height) == null);
+    const keyboard_view = lmt_bitmap_keyboard_view_init(storage.ptr, view_size, 72, 48, width, height);
+    try testing.expect(keyboard_view != null);
+    // Failures return UINT32_MAX so they never read as "nothing changed".
+    const update_error = std.math.maxInt(u32);
+    try testing.expectEqual(@as(u32, update_error), lmt_bitmap_fret_view_update(keyboard_view, &[_]i8{0}, 1, pixels.ptr, @intCast(pixels.len), &rects, rects.len));
+    try testing.expectEqual(@as(u32, update_error), lmt_bitmap_keyboard_view_update(null, null, 0, pixels.ptr, @intCast(pixels.len), &rects, rects.len));
+    try testing.expectEqual(@as(u32, update_error), lmt_bitmap_keyboard_view_update(keyboard_view, null, 0, null, @intCast(pixels.len), &rects, rects.len));
+    try testing.expectEqual(@as(u32, update_error), lmt_bitmap_keyboard_view_update(keyboard_view, null, 0, pixels.ptr, @intCast(pixels.len - 1), &rects, rects.len));
+
+    const chords = [_][]const u8{ &.{ 60, 64, 67 }, &.{ 60, 64, 67 }, &.{ 60, 63, 67 }, &.{ 50, 55, 59, 62, 65, 69 }, &.{} };
+    for (chords, 0..) |notes, frame| {
+        const count = lmt_bitmap_keyboard_view_update(keyboard_view, notes.ptr, @intCast(notes.len), pixels.ptr, @intCast(pixels.len), &rects, rects.len);
+        switch (frame) {
+            // The first frame draws everything; an unchanged frame draws nothing.
+            0 => try testing.expectEqual(LmtDirtyRect{ .x = 0, .y = 0, .width = width, .height = height }, rects[0]),
+            1 => try testing.expectEqual(@as(u32, 0), count),
+            else => {
+                try testing.expect(count > 0 and count <= rects.len);
+                for (rects[0..count]) |rect| try testing.expect(rect.width < width and rect.x + rect.width <= width and rect.y + rect.height <= height);
+            },
+        }
+        try testing.expectEqual(@as(u32, @intCast(expected.len)), lmt_bitmap_keyboard_rgba(notes.ptr, @intCast(notes.len), 48, 72, width, height, expected.ptr, @intCast(expected.len)));
+        try testing.expectEqualSlices(u8, expected, pixels);
+    }
+
+    const fret_view = lmt_bitmap_fret_view_init(storage.ptr, view_size, 6, 0, 0, height, height);
+    try testing.expect(fret_view != null);
+    const fret_pixels = pixels[0 .. height * height * 4];
+    const voicings = [_][6]i8{ .{ -1, 3, 2, 0, 1, 0 }, .{ -1, 3, 2, 0, 1, 3 }, .{ -1, 0, 2, 2, 1, 0 }, .{ 3, 2, 0, 0, 0, 3 } };
+    // The last voicing moves the fret window, which redraws everything.
+    const voicing_counts = [_]u32{ 1, 1, 3, 1 };
+    for (voicings, voicing_counts) |frets, count| {
+        try testing.expectEqual(count, lmt_bitmap_fret_view_update(fret_view, &frets, frets.len, fret_pixels.ptr, @intCast(fret_pixels.len), &rects, rects.len));
+        try testing.expectEqual(@as(u32, @intCast(fret_pixels.len)), lmt_bitmap_fret_n_rgba(&frets, frets.len, 0, 0, height, height, expected.ptr, @intCast(expected.len)));
+        try testing.expectEqualSlices(u8, expected[0..fret_pixels.len], fret_pixels);
+    }
+    // Rectangles beyond the caller's capacity merge into one bounding rectangle.
+    const spread = [_]i8{ -1, 2, 4, -1, 3, -1 };
+    try testing.expectEqual(@as(u32, 1), lmt_bitmap_fret_view_update(fret_view, &spread, spread.len, fret_pixels.ptr, @intCast(fret_pixels.len), &rects, 1));
+    try testing.expect(rects[0].width < height);
+    _ = lmt_bitmap_fret_n_rgba(&spread, spread.len, 0, 0, height, height, expected.ptr, @intCast(expected.len));
+    try testing.expectEqualSlices(u8, expected[0..fret_pixels.len], fret_pixels);
+    try testing.expectEqual(@as(u32, 0), lmt_bitmap_fret_view_update(fret_view, &spread, spread.len, fret_pixels.ptr, @intCast(fret_pixels.len), &rects, rects.len));
+    try testing.expectEqual(@as(u32, update_error), lmt_bitmap_fret_view_update(fret_view, &spread, 5, fret_pixels.ptr, @intCast(fret_pixels.len), &rects, rects.len));
+    try testing.expectEqual(@as(u32, update_error), lmt_bitmap_fret_view_update(fret_view, null, spread.len, fret_pixels.ptr, @intCast(fret_pixels.len), &rects, rects.len));
+    try testing.expectEqual(@as(u32, update_error), lmt_bitmap_fret_view_update(fret_view, &spread, spread.len, fret_pixels.ptr, @intCast(fret_pixels.len - 1), &rects, rects.len));
+    try testing.expectEqual(@as(u32, 0), lmt_bitmap_fret_view_update(fret_view, &spread, spread.len, fret_pixels.ptr, @intCast(fret_pixels.len), &rects, rects.len));
+}
+
+const BandCollector = struct {
+    out: []u8,
+    stride: usize,
+    rows: u32 = 0,
+    abort_after: u32 = std.math.maxInt(u32),
+
+    fn emit(user: ?*anyopaque, first_row: u32, row_count: u32, rgba: [*]const u8, len: u32) callconv(.c) u32 {
+        const self: *BandCollector = @ptrCast(@alignCast(user.?));
+        if (first_row != self.rows or len != row_count * self.stride) return 0;
+        @memcpy(self.out[first_row * self.stride ..][0..len], rgba[0..len]);
+        self.rows += row_count;
+        return if (self.rows < self.abort_after) 1 else 0;
+    }
+};
+
+test "c abi band streams match full renders at any width" {
+    if (lmt_raster_is_enabled() == 0) return;
+    const width = 240;
+    const height = 312;
+    const expected = try testing.allocator.alloc(u8, width * height * 4);
+    defer testing.allocator.free(expected);
+    const streamed = try testing.allocator.alloc(u8, expected.len);
+    defer testing.allocator.free(streamed);
+    var band: [width * 7 * 4]u8 = undefined;
+
+    const set: u16 = 0x0ab5;
+    try testing.expectEqual(@as(u32, @intCast(expected.len)), lmt_bitmap_evenness_field_rgba(set, width, height, expected.ptr, @intCast(expected.len)));
+    var collector = BandCollector{ .out = streamed, .stride = width * 4 };
+    try testing.expectEqual(@as(u32, height), lmt_bitmap_evenness_field_stream_rgba(set, width, height, &band, band.len, BandCollector.emit, &collector));
+    try testing.expectEqualSlices(u8, expected, streamed);
+
+    var svg: [128 * 1024]u8 = undefined;
+    const svg_len = lmt_svg_evenness_field(set, &svg, svg.len);
+    collector = .{ .out = streamed, .stride = width * 4 };
+    try testing.expectEqual(@as(u32, height), lmt_bitmap_svg_stream_rgba(&svg, svg_len, width, height, &band, band.len, BandCollector.emit, &collector));
+    try testing.expectEqualSlices(u8, expected, streamed);
+
+    // Aborts, missing sinks, and bands smaller than one row deliver nothing.
+    collector = .{ .out = streamed, .stride = width * 4, .abort_after = 20 };
+    try testing.expectEqual(@as(u32, 0), lmt_bitmap_svg_stream_rgba(&svg, svg_len, width, height, &band, band.len, BandCollector.emit, &collector));
+    try testing.expectEqual(@as(u32, 21), collector.rows);
+    try testing.expectEqual(@as(u32, 0), lmt_bitmap_svg_stream_rgba(&svg, svg_len, width, height, &band, band.len, null, null));
+    try testing.expectEqual(@as(u32, 0), lmt_bitmap_svg_stream_rgba(&svg, svg_len, width, height, &band, width * 4 - 1, BandCollector.emit, &collector));
+
+    // Wider than one anti-aliasing tile: a single-row band still streams.
+    const wide = 9000;
+    const wide_band = try testing.allocator.alloc(u8, wide * 4);
+    defer testing.allocator.free(wide_band);
+    const wide_out = try testing.allocator.alloc(u8, wide * 3 * 4);
+    defer testing.allocator.free(wide_out);
+    collector = .{ .out = wide_out, .stride = wide * 4 };
+    try testing.expectEqual(@as(u32, 3), lmt_bitmap_evenness_field_stream_rgba(set, wide, 3, wide_band.ptr, @intCast(wide_band.len), BandCollector.emit, &collector));
+}
+
+/// Encodes a full RGBA render in one call, the reference the band-fed C
+/// writers must reproduce byte for byte.
+fn encodeRgbaPng(rgba: []const u8, width: u32, height: u32, compression: render_png.Compression) ![]u8 {
+    var out: std.Io.Writer.Allocating = .init(testing.allocator);
+    errdefer out.deinit();
+    var png = try render_png.encoder(testing.allocator, &out.writer, width, height, compression);
+    defer png.deinit();
+    try png.writeRows(0, height, rgba);
+    try png.finish();
+    return out.toOwnedSlice();
+}
+
+test "c abi png and qoi writers encode the rgba render" {
+    try testing.expectEqual(@as(c_int, 0), c.LMT_PNG_STORED);
+    try testing.expectEqual(@as(c_int, 1), c.LMT_PNG_FAST);
+    if (lmt_raster_is_enabled() == 0) return;
+    const width = 300;
+    const height = 220;
+    const rgba = try testing.allocator.alloc(u8, width * height * 4);
+    defer testing.allocator.free(rgba);
+    const encoded = try testing.allocator.alloc(u8, rgba.len + 4096);
+    defer testing.allocator.free(encoded);
+
+    const set: u16 = 0x0ab5;
+    try testing.expectEqual(@as(u32, @intCast(rgba.len)), lmt_bitmap_evenness_field_rgba(set, width, height, rgba.ptr, @intCast(rgba.len)));
+    for ([_]render_png.Compression{ .stored, .fast }) |compression| {
+        const expected = try encodeRgbaPng(rgba, width, height, compression);
+        defer testing.allocator.free(expected);
+        const len = lmt_bitmap_evenness_field_png(set, width, height, @intFromEnum(compression), null, 0);
+        try testing.expectEqual(@as(u32, @intCast(expected.len)), len);
+        try testing.expectEqual(len, lmt_bitmap_evenness_field_png(set, width, height, @intFromEnum(compression), encoded.ptr, @intCast(encoded.len)));
+        try testing.expectEqualSlices(u8, expected, encoded[0..len]);
+    }
+
+    var svg: [128 * 1024]u8 = undefined;
+    const svg_len = lmt_svg_evenness_field(set, &svg, svg.len);
+    const fast_len = lmt_bitmap_svg_png(&svg, svg_len, width, height, c.LMT_PNG_FAST, encoded.ptr, @intCast(encoded.len));
+    try testing.expect(fast_len > 0 and fast_len < rgba.len / 4);
+    try testing.expectEqualSlices(u8, &render_png.SIGNATURE, encoded[0..8]);
+
+    var qoi_out: std.Io.Writer.Allocating = .init(testing.allocator);
+    defer qoi_out.deinit();
+    var qoi = try render_qoi.encoder(&qoi_out.writer, width, height);
+    try qoi.writeRows(0, height, rgba);
+    try qoi.finish();
+    const qoi_len = lmt_bitmap_svg_qoi(&svg, svg_len, width, height, encoded.ptr, @intCast(encoded.len));
+    try testing.expectEqualSlices(u8, qoi_out.written(), encoded[0..qoi_len]);
+
+    // A short buffer gets a prefix and the full length; bad input gets 0.
+    var prefix: [64]u8 = undefined;
+    try testing.expectEqual(fast_len, lmt_bitmap_svg_png(&svg, svg_len, width, height, c.LMT_PNG_FAST, &prefix, prefix.len));
+    try testing.expectEqualSlices(u8, &render_png.SIGNATURE, prefix[0..8]);
+    try testing.expectEqual(@as(u32, 0), lmt_bitmap_svg_png(&svg, svg_len, width, height, 2, null, 0));
+    try testing.expectEqual(@as(u32, 0), lmt_bitmap_svg_png(&svg, svg_len, 0, height, c.LMT_PNG_FAST, null, 0));
+    try testing.expect(lmt_bitmap_key_staff_png(2, 1, 180, 90, c.LMT_PNG_FAST, null, 0) > 0);
+    const notes = [_]u8{ 60, 64, 67 };
+    try testing.expect(lmt_bitmap_keyboard_png(&notes, notes.len, 48, 72, 320, 80, c.LMT_PNG_STORED, null, 0) > 0);
+}
+
+test "c abi batch catalog renderers" {
+    const sets = [_]u16{ 0x000, 0x091, 0x0ab5, 0x0fff, 0x0d3d, 0x1091 };
+    var offsets: [sets.len + 1]u32 = undefined;
+    var single: [128 * 1024]u8 = undefined;
+
+    const arena = try testing.allocator.alloc(u8, 512 * 1024);
+    defer testing.allocator.free(arena);
+
+    try testing.expectEqual(@as(u32, sets.len), lmt_svg_clock_optc_batch(&sets, sets.len, &offsets, null, 0));
+    const optc_total = offsets[sets.len];
+    try testing.expectEqual(@as(u32, sets.len), lmt_svg_clock_optc_batch(&sets, sets.len, &offsets, arena.ptr, @intCast(arena.len)));
+    try testing.expectEqual(optc_total, offsets[sets.len]);
+    for (sets, 0..) |set, i| {
+        const len = lmt_svg_clock_optc(set, &single, single.len);
+        try testing.expectEqualSlices(u8, single[0..len], arena[offsets[i]..offsets[i + 1]]);
+    }
+
+    const partial = lmt_svg_clock_optc_batch(&sets, sets.len, &offsets, arena.ptr, optc_total / 2);
+    try testing.expect(partial > 0 and partial < sets.len);
+    try testing.expect(offsets[partial] <= optc_total / 2);
+
+    try testing.expectEqual(@as(u32, sets.len), lmt_svg_evenness_field_batch(&sets, sets.len, &offsets, arena.ptr, @intCast(arena.len)));
+    for (sets, 0..) |set, i| {
+        const len = lmt_svg_evenness_field(set, &single, single.len);
+        try testing.expectEqualSlices(u8, single[0..len], arena[offsets[i]..offsets[i + 1]]);
+    }
+
+    const rows = [_]i8{ -1, 3, 2, 0, 1, 0, 3, 5, 5, 4, 3, 3, -1, -1, 7, 7, 7, 9, 3, 5, 5, 4, 3, 3 };
+    const row_count = rows.len / 6;
+    var fret_offsets: [row_count + 1]u32 = undefined;
+    for ([_][2]u32{ .{ 0, 0 }, .{ 2, 5 } }) |window| {
+        try testing.expectEqual(@as(u32, row_count), lmt_svg_fret_n_batch(&rows, 6, row_count, window[0], window[1], &fret_offsets, arena.ptr, @intCast(arena.len)));
+        var row: usize = 0;
+        while (row < row_count) : (row += 1) {
+            const len = lmt_svg_fret_n(rows[row * 6 ..].ptr, 6, window[0], window[1], &single, single.len);
+            try testing.expectEqualSlices(u8, single[0..len], arena[fret_offsets[row]..fret_offsets[row + 1]]);
+        }
+    }
+    try testing.expectEqual(@as(u32, 0), lmt_svg_clock_optc_batch(null, sets.len, &offsets, arena.ptr, @intCast(arena.len)));
+
+    if (lmt_raster_is_enabled() == 0) return;
+
+    const width: u32 = 64;
+    const height: u32 = 80;
+    const image_bytes = width * height * 4;
+    const images = try testing.allocator.alloc(u8, image_bytes * sets.len);
+    defer testing.allocator.free(images);
+    const expected = try testing.allocator.alloc(u8, image_bytes);
+    defer testing.allocator.free(expected);
+
+    try testing.expectEqual(@as(u32, sets.len), lmt_bitmap_evenness_field_batch_rgba(&sets, sets.len, width, height, images.ptr, @intCast(images.len)));
+    for (sets, 0..) |set, i| {
+        try testing.expectEqual(image_bytes, lmt_bitmap_evenness_field_rgba(set, width, height, expected.ptr, image_bytes));
+        try testing.expectEqualSlices(u8, expected, images[i * image_bytes ..][0..image_bytes]);
+    }
+
+    try testing.expectEqual(@as(u32, 2), lmt_bitmap_clock_optc_batch_rgba(&sets, sets.len, width, height, images.ptr, image_bytes * 2));
+    for (sets[0..2], 0..) |set, i| {
+        try testing.expectEqual(image_bytes, lmt_bitmap_clock_optc_rgba(set, width, height, expected.ptr, image_bytes));
+        try testing.expectEqualSlices(u8, expected, images[i * image_bytes ..][0..image_bytes]);
+    }
+
+    try testing.expectEqual(@as(u32, row_count), lmt_bitmap_fret_n_batch_rgba(&rows, 6, row_count, 0, 0, width, height, images.ptr, @intCast(images.len)));
+    var row: usize = 0;
+    while (row < row_count) : (row += 1) {
+        try testing.expectEqual(image_bytes, lmt_bitmap_fret_n_rgba(rows[row * 6 ..].ptr, 6, 0, 0, width, height, expected.ptr, image_bytes));
+        try testing.expectEqualSlices(u8, expected, images[row * image_bytes ..][0..image_bytes]);
+    }
+}
+
 test "c abi scales modes and spelling" {
     const diatonic = lmt_scale(c.LMT_SCALE_DIATONIC, 0);
     try testing.expectEqual(@as(u16, 0x0AB5), diatonic);
@@ -1931,6 +2736,77 @@ test "c abi raster generators" {
     try testing.expect(std.mem.indexOfNone(u8, &piano_staff_rgba, &[_]u8{255}) != null);
 }
 
+fn expectSceneBitmapMatchesMarkup(svg: []const u8, width: u32, height: u32, rendered: u32, actual: []const u8) !void {
+    const expected = try testing.allocator.alloc(u8, actual.len);
+    defer testing.allocator.free(expected);
+    try testing.expectEqual(@as(u32, @intCast(actual.len)), rendered);
+    _ = try bitmap_compat.renderSvgMarkupRgba(width, height, svg, expected);
+    try testing.expectEqualSlices(u8, expected, actual);
+}
+
+test "c abi staff and keyboard bitmaps match their rasterized markup" {
+    if (lmt_raster_is_enabled() == 0) return;
+    var svg_buf: [128 * 1024]u8 = undefined;
+
+    const staff_width: u32 = 315;
+    const staff_height: u32 = 189;
+    const staff_rgba = try testing.allocator.alloc(u8, staff_width * staff_height * 4);
+    defer testing.allocator.free(staff_rgba);
+    for ([_]u8{ c.LMT_CHORD_MAJOR, c.LMT_CHORD_MINOR, c.LMT_CHORD_DIMINISHED, c.LMT_CHORD_AUGMENTED }) |kind| {
+        for (0..12) |root| {
+            const svg_len = lmt_svg_chord_staff(kind, @intCast(root), &svg_buf, svg_buf.len);
+            const rendered = lmt_bitmap_chord_staff_rgba(kind, @intCast(root), staff_width, staff_height, staff_rgba.ptr, @intCast(staff_rgba.len));
+            try expectSceneBitmapMatchesMarkup(svg_buf[0..svg_len], staff_width, staff_height, rendered, staff_rgba);
+        }
+    }
+
+    const key_width: u32 = 780;
+    const key_height: u32 = 189;
+    const key_rgba = try testing.allocator.alloc(u8, key_width * key_height * 4);
+    defer testing.allocator.free(key_rgba);
+    for ([_]u8{ c.LMT_KEY_MAJOR, c.LMT_KEY_MINOR }) |quality| {
+        for (0..12) |tonic| {
+            const svg_len = lmt_svg_key_staff(@intCast(tonic), quality, &svg_buf, svg_buf.len);
+            const rendered = lmt_bitmap_key_staff_rgba(@intCast(tonic), quality, key_width, key_height, key_rgba.ptr, @intCast(key_rgba.len));
+            try expectSceneBitmapMatchesMarkup(svg_buf[0..svg_len], key_width, key_height, rendered, key_rgba);
+        }
+    }
+
+    const piano_sets = [_][]const u8{
+        &.{ 43, 52, 60, 64 },
+        &.{ 36, 40, 43, 47 },
+        &.{ 72, 76, 79, 84, 91 },
+        &.{ 60, 61, 62, 63, 64, 66 },
+        &.{ 21, 33, 96, 108 },
+        &.{ 61, 66, 70 },
+    };
+    const piano_width: u32 = 342;
+    const piano_height: u32 = 354;
+    const piano_rgba = try testing.allocator.alloc(u8, piano_width * piano_height * 4);
+    defer testing.allocator.free(piano_rgba);
+    for (piano_sets) |notes| {
+        for ([_]u8{ 0, 1, 5, 6 }) |tonic| {
+            const svg_len = lmt_svg_piano_staff(notes.ptr, @intCast(notes.len), tonic, c.LMT_KEY_MAJOR, &svg_buf, svg_buf.len);
+            const rendered = lmt_bitmap_piano_staff_rgba(notes.ptr, @intCast(notes.len), tonic, c.LMT_KEY_MAJOR, piano_width, piano_height, piano_rgba.ptr, @intCast(piano_rgba.len));
+            try expectSceneBitmapMatchesMarkup(svg_buf[0..svg_len], piano_width, piano_height, rendered, piano_rgba);
+        }
+    }
+
+    const keyboard_cases = [_]struct { notes: []const u8, low: u8, high: u8, width: u32, height: u32 }{
+        .{ .notes = &.{ 60, 64, 67, 71 }, .low = 48, .high = 72, .width = 784, .height = 312 },
+        .{ .notes = &.{ 61, 63, 66, 68, 70, 73 }, .low = 55, .high = 79, .width = 333, .height = 157 },
+        .{ .notes = &.{ 21, 60, 108 }, .low = 21, .high = 108, .width = 1200, .height = 150 },
+        .{ .notes = &.{}, .low = 64, .high = 60, .width = 120, .height = 160 },
+    };
+    for (keyboard_cases) |case| {
+        const keyboard_rgba = try testing.allocator.alloc(u8, case.width * case.height * 4);
+        defer testing.allocator.free(keyboard_rgba);
+        const svg_len = lmt_svg_keyboard(case.notes.ptr, @intCast(case.notes.len), case.low, case.high, &svg_buf, svg_buf.len);
+        const rendered = lmt_bitmap_keyboard_rgba(case.notes.ptr, @intCast(case.notes.len), case.low, case.high, case.width, case.height, keyboard_rgba.ptr, @intCast(keyboard_rgba.len));
+        try expectSceneBitmapMatchesMarkup(svg_buf[0..svg_len], case.width, case.height, rendered, keyboard_rgba);
+    }
+}
+
 test "c abi harmonious compatibility surface" {
     try testing.expect(lmt_wasm_scratch_ptr() != null);
     try testing.expect(lmt_wasm_scratch_size() >= 4 * 1024 * 1024);
@@ -0,0 +1,87 @@
+const std = @import("std");
+const testing = std.testing;
+
+const pcs = @import("../pitch_class_set.zig");
+const set_class = @import("../set_class.zig");
+const cluster = @import("../cluster.zig");
+const evenness = @import("../evenness.zig");
+const pcs_batch = @import("../pcs_batch.zig");
+
+fn allSets() [4096]u16 {
+    var out: [4096]u16 = undefined;
+    for (&out, 0..) |*slot, i| {
+        slot.* = @as(u16, @intCast(i));
+    }
+    return out;
+}
+
+test "batch set transforms match scalar results for every set" {
+    const sets = allSets();
+    var out_u16: [4096]u16 = undefined;
+    var out_u8: [4096]u8 = undefined;
+
+    try testing.expectEqual(@as(usize, 4096), pcs_batch.cardinality(&sets, &out_u8));
+    for (sets, out_u8) |raw, got| {
+        try testing.expectEqual(@as(u8, pcs.cardinality(@intCast(raw))), got);
+    }
+
+    var semitones: u4 = 0;
+    while (semitones < 12) : (semitones += 1) {
+        _ = pcs_batch.transpose(&sets, semitones, &out_u16);
+        for (sets, out_u16) |raw, got| {
+            try testing.expectEqual(@as(u16, pcs.transpose(@intCast(raw), semitones)), got);
+        }
+    }
+
+    _ = pcs_batch.invert(&sets, &out_u16);
+    for (sets, out_u16) |raw, got| {
+        try testing.expectEqual(@as(u16, pcs.invert(@intCast(raw))), got);
+    }
+
+    _ = pcs_batch.complement(&sets, &out_u16);
+    for (sets, out_u16) |raw, got| {
+        try testing.expectEqual(@as(u16, pcs.complement(@intCast(raw))), got);
+    }
+}
+
+test "batch set classification matches scalar results for every set" {
+    const sets = allSets();
+    var out_u16: [4096]u16 = undefined;
+    var out_bool: [4096]bool = undefined;
+    var out_f32: [4096]f32 = undefined;
+
+    _ = pcs_batch.primeForm(&sets, &out_u16);
+    for (sets, out_u16) |raw, got| {
+        try testing.expectEqual(@as(u16, set_class.primeForm(@intCast(raw))), got);
+    }
+
+    _ = pcs_batch.fortePrime(&sets, &out_u16);
+    for (sets, out_u16) |raw, got| {
+        try testing.expectEqual(@as(u16, set_class.fortePrime(@intCast(raw))), got);
+    }
+
+    _ = pcs_batch.isClusterFree(&sets, &out_bool);
+    for (sets, out_bool) |raw, got| {
+        try testing.expectEqual(!cluster.hasCluster(@intCast(raw)), got);
+    }
+
+    _ = pcs_batch.evennessDistance(&sets, &out_f32);
+    for (sets, out_f32) |raw, got| {
+        try testing.expectEqual(evenness.evennessDistance(@intCast(raw)), got);
+    }
+}
+
+test "batch set operations mask high bits and handle ragged tails" {
+    const sets = [_]u16{ 0xF091, 0x1000, 0x0FFF, 0x0891, 0x0007 };
+    var out: [5]u16 = undefined;
+    try testing.expectEqual(@as(usize, 5), pcs_batch.primeForm(&sets, &out));
+    try testing.expectEqual(@as(u16, set_class.primeForm(0x091)), out[0]);
+    try testing.expectEqual(@as(u16, 0), out[1]);
+    try testing.expectEqual(@as(u16, 0x0FFF), out[2]);
+
+    var short: [3]u16 = .{ 0xAAAA, 0xAAAA, 0xAAAA };
+    try testing.expectEqual(@as(usize, 2), pcs_batch.complement(sets[0..2], &short));
+    try testing.expectEqual(@as(u16, 0x0F6E), short[0]);
+    try testing.expectEqual(@as(u16, 0x0FFF), short[1]);
+    try testing.expectEqual(@as(u16, 0xAAAA), short[2]);
+}
@@ -3,6 +3,9 @@ const testing = std.testing;
 
 const ir = @import("../render/ir.zig");
 const raster = @import("../render/raster.zig");
+const svg_serializer = @import("../render/svg_serializer.zig");
+const bitmap_compat = @import("../bitmap_compat.zig");
+const scanline = @import("../render/scanline.zig");
 
 extern fn lmt_raster_is_enabled() callconv(.c) u32;
 extern fn lmt_raster_demo_rgba(width: u32, height: u32, out_rgba: [*c]u8, out_rgba_size: u32) callconv(.c) u32;
@@ -84,6 +87,265 @@ test "raster demo anti aliases curved and diagonal edges" {
         .stroke_width = "3",
     });
 
-    raster.renderScene(builder.scene(), &surface);
+    try raster.renderScene(builder.scene(), &surface);
     try testing.expect(countPartialAlphaPixels(&pixels) > 0);
 }
+
+test "numeric demo scene matches the text scene it replaced" {
+    var text_pixels: [100 * 100 * 4]u8 = undefined;
+    var numeric_pixels: [100 * 100 * 4]u8 = undefined;
+    var text_surface = raster.Surface{ .pixels = &text_pixels, .width = 100, .height = 100, .stride = 100 * 4 };
+    var numeric_surface = raster.Surface{ .pixels = &numeric_pixels, .width = 100, .height = 100, .stride = 100 * 4 };
+
+    var ops: [3]ir.Op = undefined;
+    var builder = ir.Builder.init(&ops);
+    try builder.rect(.{ .x = "4", .y = "4", .width = "92", .height = "92", .fill = "white", .stroke = "#333", .stroke_width = "2" });
+    try builder.circle(.{ .cx = "50", .cy = "50", .r = "22", .fill = "#16b", .stroke = "black", .stroke_width = "2" });
+    try builder.line(.{ .x1 = "18", .y1 = "80", .x2 = "82", .y2 = "20", .stroke = "black", .stroke_width = "3" });
+
+    raster.clear(&text_surface, .{ 245, 245, 245, 255 });
+    try raster.renderScene(builder.scene(), &text_surface);
+    raster.renderDemoScene(&numeric_surface);
+    try testing.expectEqualSlices(u8, &text_pixels, &numeric_pixels);
+
+    var numeric_ops: [3]ir.NumericOp = undefined;
+    var storage = ir.NumericStorage{ .ops = &numeric_ops, .points = &.{}, .commands = &.{}, .numbers = &.{} };
+    const converted = try ir.toNumeric(builder.scene(), &storage);
+    raster.clear(&numeric_surface, .{ 245, 245, 245, 255 });
+    try raster.renderNumericScene(converted, &numeric_surface);
+    try testing.expectEqual(raster.hashSurface(text_surface), raster.hashSurface(numeric_surface));
+}
+
+test "raster backend matches the svg markup rasterizer for every shared op" {
+    const size = 96;
+    var ops: [16]ir.Op = undefined;
+    var builder = ir.Builder.init(&ops);
+    try builder.raw("<svg xmlns=\"http://www.w3.org/2000/svg\" viewBox=\"-8 -8 128 128\">\n");
+    try builder.rect(.{ .x = "0", .y = "0", .width = "112", .height = "112", .fill = "white", .stroke = "#333", .stroke_width = "2" });
+    try builder.ellipse(.{ .cx = "56", .cy = "30", .rx = "40", .ry = "14", .fill = "#1166bb", .stroke = "black", .stroke_width = "1.5" });
+    try builder.path(.{ .d = "M10,100 C30,60 50,120 70,80 S100,60 104,96 Q80,110 60,104 Z", .fill = "#e02", .stroke = "black", .stroke_width = "2" });
+    try builder.path(.{ .d = "M8,60 L104,60", .stroke = "#777", .stroke_width = "3", .stroke_dasharray = "4,2" });
+    try builder.rect(.{ .x = "70", .y = "8", .width = "34", .height = "44", .rx = "9", .fill = "#1478dc", .stroke = "#111", .stroke_width = "1.5" });
+    const group_attrs = [_]ir.Attr{.{ .key = "transform", .value = "translate(56,56) rotate(30) scale(1.5,0.5)" }};
+    try builder.groupStart(&group_attrs, true);
+    try builder.rect(.{ .x = "-10", .y = "-10", .width = "20", .height = "20", .fill = "#161", .stroke = "#fff" });
+    try builder.circle(.{ .cx = "0", .cy = "0", .r = "4", .fill = "gray", .stroke = "black" });
+    try builder.rect(.{ .x = "-18", .y = "-6", .width = "12", .height = "30", .rx = "3", .ry = "40", .fill = "#a4f" });
+    try builder.groupEnd(true);
+    try builder.line(.{ .x1 = "4", .y1 = "108", .x2 = "108", .y2 = "4", .stroke = "black", .stroke_width = "2.5" });
+    try builder.raw("</svg>\n");
+
+    var markup_buf: [2048]u8 = undefined;
+    var markup = std.io.fixedBufferStream(&markup_buf);
+    try svg_serializer.write(builder.scene(), markup.writer(), .strict);
+    var markup_pixels: [size * size * 4]u8 = undefined;
+    _ = try bitmap_compat.renderSvgMarkupRgba(size, size, markup.getWritten(), &markup_pixels);
+
+    var direct_pixels: [size * size * 4]u8 = undefined;
+    var surface = raster.Surface{ .pixels = &direct_pixels, .width = size, .height = size, .stride = size * 4 };
+    raster.clear(&surface, .{ 0, 0, 0, 0 });
+    try raster.renderSceneTransformed(builder.scene(), &surface, raster.viewBoxTransform(&surface, -8, -8, 128, 128));
+
+    try testing.expectEqualSlices(u8, &markup_pixels, &direct_pixels);
+    // Ellipse center, (56, 30) in viewBox units.
+    const ellipse_center = (28 * size + 48) * 4;
+    try testing.expectEqualSlices(u8, &.{ 0x11, 0x66, 0xbb, 0xff }, direct_pixels[ellipse_center .. ellipse_center + 4]);
+}
+
+test "raster polygons and polylines match the equivalent paths" {
+    var poly_ops: [1]ir.Op = undefined;
+    var path_ops: [2]ir.Op = undefined;
+    var poly_pixels: [48 * 48 * 4]u8 = undefined;
+    var path_pixels: [48 * 48 * 4]u8 = undefined;
+    var poly_surface = raster.Surface{ .pixels = &poly_pixels, .width = 48, .height = 48, .stride = 48 * 4 };
+    var path_surface = raster.Surface{ .pixels = &path_pixels, .width = 48, .height = 48, .stride = 48 * 4 };
+    const points = "4,4 44,10 24,44";
+
+    var polygon = ir.Builder.init(&poly_ops);
+    try polygon.polygon(.{ .points = points, .fill = "#16b", .stroke = "black", .stroke_width = "2" });
+    var closed_path = ir.Builder.init(&path_ops);
+    try closed_path.path(.{ .d = "M4,4 L44,10 L24,44 Z", .fill = "#16b", .stroke = "black", .stroke_width = "2" });
+    raster.clear(&poly_surface, .{ 0, 0, 0, 0 });
+    raster.clear(&path_surface, .{ 0, 0, 0, 0 });
+    try raster.renderScene(polygon.scene(), &poly_surface);
+    try raster.renderScene(closed_path.scene(), &path_surface);
+    try testing.expectEqualSlices(u8, &path_pixels, &poly_pixels);
+
+    // A polyline fills as if closed but strokes only the edges it lists.
+    var polyline = ir.Builder.init(&poly_ops);
+    try polyline.polyline(.{ .points = points, .fill = "#16b", .stroke = "black", .stroke_width = "2" });
+    var open_path = ir.Builder.init(&path_ops);
+    try open_path.path(.{ .d = "M4,4 L44,10 L24,44 Z", .fill = "#16b" });
+    try open_path.path(.{ .d = "M4,4 L44,10 L24,44", .stroke = "black", .stroke_width = "2" });
+    raster.clear(&poly_surface, .{ 0, 0, 0, 0 });
+    raster.clear(&path_surface, .{ 0, 0, 0, 0 });
+    try raster.renderScene(polyline.scene(), &poly_surface);
+    try raster.renderScene(open_path.scene(), &path_surface);
+    try testing.expectEqualSlices(u8, &path_pixels, &poly_pixels);
+}
+
+test "raster polylines past the point limit fail instead of truncating" {
+    var points: [1025]ir.Point = undefined;
+    for (&points, 0..) |*point, i| {
+        const t = @as(f64, @floatFromInt(i)) / 1024.0;
+        point.* = .{ .x = 2.0 + 12.0 * t, .y = if (i % 2 == 0) 2.0 else 14.0 };
+    }
+    var pixels: [16 * 16 * 4]u8 = undefined;
+    var surface = raster.Surface{ .pixels = &pixels, .width = 16, .height = 16, .stride = 16 * 4 };
+    const stroke = ir.Paint{ .color = ir.Color.black };
+
+    const fits = [_]ir.NumericOp{.{ .polyline = .{ .points = points[0..1024], .stroke = stroke } }};
+    try raster.renderNumericScene(.{ .ops = &fits }, &surface);
+    const too_long = [_]ir.NumericOp{.{ .polyline = .{ .points = &points, .stroke = stroke } }};
+    try testing.expectError(error.NoSpace, raster.renderNumericScene(.{ .ops = &too_long }, &surface));
+    const too_long_polygon = [_]ir.NumericOp{.{ .polygon = .{ .points = &points, .fill = stroke } }};
+    try testing.expectError(error.NoSpace, raster.renderNumericScene(.{ .ops = &too_long_polygon }, &surface));
+}
+
+test "raster groups reject bad transforms and deep nesting" {
+    try testing.expectError(error.InvalidTransform, raster.parseTransform("skewX(10)"));
+    try testing.expectError(error.InvalidTransform, raster.parseTransform("translate(1,2"));
+    try testing.expectError(error.GroupOverflow, renderNestedGroups(16));
+    try renderNestedGroups(15);
+}
+
+fn renderNestedGroups(depth: usize) !void {
+    var ops: [20]ir.Op = undefined;
+    var builder = ir.Builder.init(&ops);
+    for (0..depth) |_| try builder.groupStart(&.{}, false);
+    var pixels: [4 * 4 * 4]u8 = undefined;
+    var surface = raster.Surface{ .pixels = &pixels, .width = 4, .height = 4, .stride = 4 * 4 };
+    try raster.renderScene(builder.scene(), &surface);
+}
+
+test "vector coverage rows match the scalar reference" {
+    var prng = std.Random.DefaultPrng.init(0x5eed);
+    const random = prng.random();
+    const width = 4 * scanline.BLEND_LANES + 5;
+    const fills = [_][4]u8{ .{ 17, 102, 187, 255 }, .{ 200, 10, 60, 128 }, .{ 255, 255, 255, 1 }, .{ 9, 9, 9, 0 } };
+
+    for (0..64) |_| {
+        var row_vector: [width]f64 = @splat(0.0);
+        var row_scalar: [width]f64 = @splat(0.0);
+        for (0..6) |_| {
+            const start = random.float(f64) * (width + 8) - 4;
+            const end = if (random.boolean()) @floor(start + random.float(f64) * width) else start + random.float(f64) * width;
+            const weight = 1.0 / @as(f64, @floatFromInt(scanline.AA_SUBPIXEL_GRID));
+            scanline.accumulateScanlineCoverage(&row_vector, start, end, weight);
+            scanline.accumulateScanlineCoverageScalar(&row_scalar, start, end, weight);
+        }
+        try testing.expectEqualSlices(f64, &row_scalar, &row_vector);
+
+        // Exercise the exact thresholds the scalar path branches on.
+        row_vector[1] = 0.9999995;
+        row_vector[2] = 0.999999;
+        row_vector[3] = 1e-9;
+        row_vector[4] = -0.25;
+
+        var pixels_vector: [width * 4 * 2]u8 = undefined;
+        random.bytes(&pixels_vector);
+        for (0..width) |px| {
+            if (random.uintLessThan(u8, 4) == 0) pixels_vector[px * 4 + 3] = 0;
+        }
+        var pixels_scalar = pixels_vector;
+        var surface_vector = scanline.Surface{ .pixels = &pixels_vector, .width = width, .height = 2, .stride = width * 4 };
+        var surface_scalar = scanline.Surface{ .pixels = &pixels_scalar, .width = width, .height = 2, .stride = width * 4 };
+        const fill = fills[random.uintLessThan(usize, fills.len)];
+        scanline.applyCoverageRow(&surface_vector, 1, &row_vector, fill);
+        scanline.applyCoverageRowScalar(&surface_scalar, 1, &row_vector, fill);
+        try testing.expectEqualSlices(u8, &pixels_scalar, &pixels_vector);
+    }
+}
+
+/// `scanline.blend` without its shortcuts.
+fn referenceBlend(dst: *[4]u8, src: [4]u8) void {
+    const src_a: u32 = src[3];
+    if (src_a == 0) return;
+    const dst_a: u32 = dst[3];
+    const out_a: u32 = src_a + ((dst_a * (255 - src_a) + 127) / 255);
+    for (0..3) |channel| {
+        const numer = @as(u32, src[channel]) * src_a * 255 + @as(u32, dst[channel]) * dst_a * (255 - src_a);
+        const denom = out_a * 255;
+        dst[channel] = @intCast(@min((numer + denom / 2) / denom, 255));
+    }
+    dst[3] = @intCast(@min(out_a, 255));
+}
+
+test "blend shortcuts and uniform coverage runs match the full arithmetic" {
+    var prng = std.Random.DefaultPrng.init(0x5ca1ab1e);
+    const random = prng.random();
+    for (0..4096) |_| {
+        var src: [4]u8 = undefined;
+        var dst: [4]u8 = undefined;
+        random.bytes(&src);
+        random.bytes(&dst);
+        switch (random.uintLessThan(u8, 3)) {
+            0 => src[3] = 255,
+            1 => dst[3] = 0,
+            else => {},
+        }
+        var expected = dst;
+        referenceBlend(&expected, src);
+        var actual = dst;
+        scanline.blend(&actual, src);
+        try testing.expectEqualSlices(u8, &expected, &actual);
+    }
+
+    const width = 3 * scanline.BLEND_LANES;
+    const coverages = [_]f64{ 1.0, 0.999999, 0.9999989, 0.5, 0.125 };
+    for (0..256) |_| {
+        var background: [4]u8 = undefined;
+        random.bytes(&background);
+        if (random.boolean()) background[3] = 0;
+        var fill: [4]u8 = undefined;
+        random.bytes(&fill);
+        if (random.boolean()) fill[3] = 255;
+        const row: [width]f64 = @splat(coverages[random.uintLessThan(usize, coverages.len)]);
+
+        var pixels_vector: [width * 4]u8 = @bitCast(@as([width][4]u8, @splat(background)));
+        var pixels_scalar = pixels_vector;
+        var surface_vector = scanline.Surface{ .pixels = &pixels_vector, .width = width, .height = 1, .stride = width * 4 };
+        var surface_scalar = scanline.Surface{ .pixels = &pixels_scalar, .width = width, .height = 1, .stride = width * 4 };
+        scanline.applyCoverageRow(&surface_vector, 0, &row, fill);
+        scanline.applyCoverageRowScalar(&surface_scalar, 0, &row, fill);
+        try testing.expectEqualSlices(u8, &pixels_scalar, &pixels_vector);
+    }
+}
+
+fn appendRectEdges(edges: []scanline.Edge, x0: f64, y0: f64, x1: f64, y1: f64) void {
+    const corners = [_]scanline.Point{ .{ .x = x0, .y = y0 }, .{ .x = x1, .y = y0 }, .{ .x = x1, .y = y1 }, .{ .x = x0, .y = y1 } };
+    for (edges[0..4], 0..) |*edge, i| edge.* = .{ .a = corners[i], .b = corners[(i + 1) % 4] };
+}
+
+test "fills wider than one coverage tile match a narrow render across the tile seam" {
+    const wide_width: u32 = scanline.AA_ROW_COVERAGE_LIMIT + 64;
+    const narrow_width: u32 = 512;
+    const shift: f64 = 8000.0;
+    const fill = [4]u8{ 200, 30, 60, 255 };
+
+    const wide_pixels = try testing.allocator.alloc(u8, wide_width * 3 * 4);
+    defer testing.allocator.free(wide_pixels);
+    @memset(wide_pixels, 0);
+    var wide = scanline.Surface{ .pixels = wide_pixels, .width = wide_width, .height = 3, .stride = wide_width * 4 };
+    var wide_edges: [8]scanline.Edge = undefined;
+    appendRectEdges(wide_edges[0..4], 0.25, 0.3, 8191.5, 2.6);
+    appendRectEdges(wide_edges[4..8], 8192.25, 0.3, 8240.625, 2.6);
+    scanline.fillEdges(&wide, &wide_edges, fill);
+
+    var narrow_pixels: [narrow_width * 3 * 4]u8 = @splat(0);
+    var narrow = scanline.Surface{ .pixels = &narrow_pixels, .width = narrow_width, .height = 3, .stride = narrow_width * 4 };
+    var narrow_edges: [8]scanline.Edge = undefined;
+    appendRectEdges(narrow_edges[0..4], 0.25 - shift, 0.3, 8191.5 - shift, 2.6);
+    appendRectEdges(narrow_edges[4..8], 8192.25 - shift, 0.3, 8240.625 - shift, 2.6);
+    scanline.fillEdges(&narrow, &narrow_edges, fill);
+
+    const offset: usize = @intFromFloat(shift);
+    for (0..3) |y| {
+        const wide_row = wide_pixels[(y * wide_width + offset) * 4 ..][0 .. (wide_width - offset) * 4];
+        try testing.expectEqualSlices(u8, narrow_pixels[y * narrow_width * 4 ..][0..wide_row.len], wide_row);
+    }
+    // Both pixels at the seam are partially covered, neither is dropped.
+    const seam = (wide_width + scanline.AA_ROW_COVERAGE_LIMIT - 1) * 4;
+    try testing.expect(wide_pixels[seam + 3] > 0 and wide_pixels[seam + 3] < 255);
+    try testing.expect(wide_pixels[seam + 7] > 0 and wide_pixels[seam + 7] < 255);
+}
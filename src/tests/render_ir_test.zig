@@ -69,3 +69,86 @@ test "optc harmonious compat rendering remains deterministic" {
     try testing.expectEqualStrings(svg_a, svg_b);
     try testing.expect(std.mem.startsWith(u8, svg_a, "<?xml version=\"1.0\" encoding=\"utf-8\"?>"));
 }
+
+test "numeric ir serializes the same markup as the text ir it was parsed from" {
+    var ops: [8]ir.Op = undefined;
+    var builder = ir.Builder.init(&ops);
+    try builder.raw("<svg>\n");
+    try builder.rect(.{ .x = "0.5", .y = "-2", .width = "10", .height = "4.25", .fill = "#ffffff", .stroke = "#000000", .stroke_width = "1.5" });
+    try builder.circle(.{ .cx = "1", .cy = "2", .r = "3", .fill = "transparent" });
+    try builder.polygon(.{ .points = "0,0 10,0 5,8.5", .fill = "#11223380" });
+    try builder.path(.{ .stroke = "#000000", .stroke_width = "2", .d = "M1,2L3,4C5,6,7,8,9,10Q11,12,13,14Z", .stroke_dasharray = "4,2" });
+    // An explicit `none` differs from an absent attribute: a missing fill is black.
+    try builder.path(.{ .stroke = "#000000", .stroke_width = "1", .fill = "none", .d = "M0,0L10,10" });
+    try builder.rect(.{ .x = "0", .y = "0", .width = "1", .height = "1", .fill = "#ff0000", .stroke = "none" });
+    try builder.raw("</svg>\n");
+
+    var numeric_ops: [8]ir.NumericOp = undefined;
+    var points: [8]ir.Point = undefined;
+    var commands: [8]ir.PathCommand = undefined;
+    var numbers: [4]f64 = undefined;
+    var storage = ir.NumericStorage{ .ops = &numeric_ops, .points = &points, .commands = &commands, .numbers = &numbers };
+    const numeric = try ir.toNumeric(builder.scene(), &storage);
+
+    var text_buf: [1024]u8 = undefined;
+    var numeric_buf: [1024]u8 = undefined;
+    var text_stream = std.io.fixedBufferStream(&text_buf);
+    var numeric_stream = std.io.fixedBufferStream(&numeric_buf);
+    try svg_serializer.write(builder.scene(), text_stream.writer(), .strict);
+    try svg_serializer.write(numeric, numeric_stream.writer(), .strict);
+    try testing.expectEqualStrings(text_buf[0..text_stream.pos], numeric_buf[0..numeric_stream.pos]);
+    try testing.expect(std.mem.indexOf(u8, numeric_buf[0..numeric_stream.pos], "fill=\"none\" d=\"M0,0L10,10\"") != null);
+    try testing.expect(std.mem.indexOf(u8, numeric_buf[0..numeric_stream.pos], "stroke=\"none\"") != null);
+}
+
+test "numeric ir rejects paints it cannot represent" {
+    var numeric_ops: [1]ir.NumericOp = undefined;
+    var storage = ir.NumericStorage{ .ops = &numeric_ops, .points = &.{}, .commands = &.{}, .numbers = &.{} };
+    for ([_][]const u8{ "rgba(0,0,0,0.5)", "red", "#12345", "#ggg" }) |text| {
+        var ops = [_]ir.Op{.{ .circle = .{ .cx = "0", .cy = "0", .r = "1", .fill = text } }};
+        try testing.expectError(error.UnsupportedPaint, ir.toNumeric(.{ .ops = &ops }, &storage));
+    }
+    try testing.expect(ir.Color.parse("none") == null);
+}
+
+test "numeric ir path and number round trip is lossless" {
+    var commands: [16]ir.PathCommand = undefined;
+    const count = try ir.tokenizePath("m10 20 h5 v-5 l1e1,.5 s4,4 8,0 t10,0 Q0,0 0.30000000000000004,1z", &commands);
+    try testing.expectEqual(@as(usize, 8), count);
+    try testing.expectEqual(ir.Point{ .x = 15, .y = 15 }, commands[2].line_to);
+    try testing.expectEqual(ir.Point{ .x = 25, .y = 15.5 }, commands[3].line_to);
+    // The smooth curve reflects the previous (absent) control point onto itself.
+    try testing.expectEqual(ir.Point{ .x = 25, .y = 15.5 }, commands[4].cubic_to.c1);
+    try testing.expectEqual(ir.Point{ .x = 33, .y = 15.5 }, commands[5].quad_to.c);
+
+    var d_buf: [512]u8 = undefined;
+    var d_stream = std.io.fixedBufferStream(&d_buf);
+    var path_ops = [_]ir.NumericOp{.{ .path = .{ .d = commands[0..count], .newline = false } }};
+    try svg_serializer.write(ir.NumericScene{ .ops = &path_ops }, d_stream.writer(), .strict);
+    const markup = d_buf[0..d_stream.pos];
+    const d_start = std.mem.indexOf(u8, markup, "d=\"").? + 3;
+    const d_text = markup[d_start .. d_start + std.mem.indexOfScalar(u8, markup[d_start..], '"').?];
+
+    var reparsed: [16]ir.PathCommand = undefined;
+    const reparsed_count = try ir.tokenizePath(d_text, &reparsed);
+    try testing.expectEqualSlices(ir.PathCommand, commands[0..count], reparsed[0..reparsed_count]);
+
+    try testing.expectError(error.UnsupportedPathCommand, ir.tokenizePath("M0,0A5,5,0,0,1,10,10", &commands));
+    try testing.expectError(error.InvalidPath, ir.tokenizePath("10,10", &commands));
+    try testing.expectError(error.NoSpace, ir.tokenizePath("M0,0L1,1", commands[0..1]));
+
+    const colors = [_]struct { color: ir.Color, text: []const u8 }{
+        .{ .color = ir.Color.transparent, .text = "transparent" },
+        .{ .color = ir.Color.black, .text = "#000000" },
+        .{ .color = .{ .r = 1, .g = 2, .b = 3, .a = 4 }, .text = "#01020304" },
+        .{ .color = .{ .r = 255, .g = 0, .b = 0, .a = 0 }, .text = "#ff000000" },
+    };
+    for (colors) |case| {
+        var color_buf: [128]u8 = undefined;
+        var color_stream = std.io.fixedBufferStream(&color_buf);
+        var color_ops = [_]ir.NumericOp{.{ .circle = .{ .cx = 0, .cy = 0, .r = 1, .fill = .{ .color = case.color }, .newline = false } }};
+        try svg_serializer.write(ir.NumericScene{ .ops = &color_ops }, color_stream.writer(), .strict);
+        try testing.expect(std.mem.indexOf(u8, color_stream.getWritten(), case.text) != null);
+        try testing.expectEqual(case.color, ir.Color.parse(case.text).?);
+    }
+}
@@ -16,6 +16,18 @@ test "clock circle positions follow 30 degree steps" {
     try testing.expectApproxEqAbs(@as(f64, 50.0), p3.y, 0.0001);
 }
 
+test "precomputed clock node markup matches runtime ring positions" {
+    var buf: [16384]u8 = undefined;
+    const svg = clock.renderOPTC(0, "", &buf);
+    var expected_buf: [64]u8 = undefined;
+    var pc: u4 = 0;
+    while (pc < 12) : (pc += 1) {
+        const p = clock.circlePosition(pc, 50.0, 42.0);
+        const expected = try std.fmt.bufPrint(&expected_buf, "cx=\"{d:.2}\" cy=\"{d:.2}\" r=\"10\"", .{ p.x, p.y });
+        try testing.expect(std.mem.indexOf(u8, svg, expected) != null);
+    }
+}
+
 test "opc svg generation basic validity" {
     const set = pcs.C_MAJOR_TRIAD;
     var buf: [8192]u8 = undefined;
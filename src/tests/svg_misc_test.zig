@@ -99,6 +99,16 @@ test "orbifold graph svg validity" {
     try testing.expect(std.mem.indexOf(u8, svg, "orbifold-label") != null);
 }
 
+test "comptime orbifold tables match the runtime enumeration" {
+    var nodes_buf: [orbifold.NODE_COUNT]orbifold.Node = undefined;
+    const nodes = orbifold.enumerateTriadNodes(&nodes_buf);
+    try testing.expectEqualSlices(orbifold.Node, nodes, &orbifold.triad_nodes);
+
+    var edges_buf: [orbifold.MAX_EDGES]orbifold.Edge = undefined;
+    const edges = orbifold.buildTriadEdges(nodes, &edges_buf);
+    try testing.expectEqualSlices(orbifold.Edge, edges, &orbifold.triad_edges);
+}
+
 test "key signature renders expected sharp count" {
     var buf: [65536]u8 = undefined;
     const sig = key_signature.fromTonic(pitch.pc.Fs, .major);
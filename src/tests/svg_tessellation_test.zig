@@ -31,6 +31,16 @@ test "tessellation adjacency neighbor counts by scale type" {
     }
 }
 
+test "comptime tessellation tables match the runtime enumeration" {
+    var tile_buf: [tessellation.TILE_COUNT]tessellation.Tile = undefined;
+    const tiles = tessellation.enumerateTiles(&tile_buf);
+    try testing.expectEqualSlices(tessellation.Tile, tiles, &tessellation.scale_tiles);
+
+    var edge_buf: [tessellation.MAX_EDGES]tessellation.Edge = undefined;
+    const edges = tessellation.buildAdjacency(tiles, &edge_buf);
+    try testing.expectEqualSlices(tessellation.Edge, edges, &tessellation.scale_edges);
+}
+
 test "tessellation shape assignment matches scale type" {
     var tile_buf: [tessellation.TILE_COUNT]tessellation.Tile = undefined;
     const tiles = tessellation.enumerateTiles(&tile_buf);
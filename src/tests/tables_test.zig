@@ -3,6 +3,7 @@ const testing = std.testing;
 
 const pcs = @import("../pitch_class_set.zig");
 const set_class = @import("../set_class.zig");
+const forte = @import("../forte.zig");
 const interval_vector = @import("../interval_vector.zig");
 const fc_components = @import("../fc_components.zig");
 const cluster = @import("../cluster.zig");
@@ -35,6 +36,42 @@ test "set class tables match runtime computation" {
     }
 }
 
+test "dense per-set tables agree with the rotation algorithm for every set" {
+    var raw: u16 = 0;
+    while (raw < 4096) : (raw += 1) {
+        const set = @as(pcs.PitchClassSet, @intCast(raw));
+        const entry = tables.set_classes.info(set);
+        try testing.expectEqual(set_class.computePrimeForm(set), entry.prime);
+        try testing.expectEqual(set_class.computeFortePrime(set), entry.forte_prime);
+        try testing.expectEqual(set_class.computeNumTranspositions(set), entry.transpositions);
+        try testing.expectEqual(entry.prime, set_class.primeForm(set));
+        try testing.expectEqual(entry.forte_prime, set_class.fortePrime(set));
+        try testing.expectEqual(entry.transpositions, set_class.numTranspositions(set));
+        try testing.expectEqual(pcs.cardinality(set), entry.forte_cardinality);
+
+        const card = pcs.cardinality(set);
+        if (card >= 3 and card <= 9) {
+            const expected = forte.lookup(entry.forte_prime).?;
+            try testing.expectEqual(expected, entry.forteNumber());
+        } else {
+            try testing.expectEqual(@as(u8, 0), entry.forte_ordinal);
+        }
+
+        const flags = tables.classification.PCS_FLAGS[raw];
+        try testing.expectEqual(flags, entry.flags);
+        try testing.expectEqual(!cluster.hasCluster(set), flags.cluster_free);
+        try testing.expectEqual(set_class.computePrimeForm(set) == set_class.computePrimeForm(pcs.invert(set)), flags.symmetric);
+        try testing.expectEqual(set_class.computeNumTranspositions(set) < 12, flags.limited_transposition);
+    }
+
+    for (tables.set_classes.SET_CLASSES) |sc| {
+        const entry = tables.set_classes.info(sc.pcs);
+        try testing.expectEqual(sc.forte_number, entry.forteNumber());
+        try testing.expectEqual(sc.flags.symmetric, entry.flags.symmetric);
+        try testing.expectEqual(sc.flags.limited_transposition, entry.flags.limited_transposition);
+    }
+}
+
 test "interval and fc tables match runtime computation" {
     for (tables.set_classes.SET_CLASSES, 0..) |sc, i| {
         const iv = interval_vector.compute(sc.pcs);
@@ -0,0 +1,238 @@
+//! Once-only decoding for the xz-compressed packs embedded in the library
+//! (harmonious names, majmin scenes, evenness segments). Each pack owns a
+//! `Once`: the first caller decodes under its lock while concurrent first
+//! callers wait, and every later caller takes the lock-free acquire path.
+//! A failed decode (out of memory) leaves the pack cold so a later call can
+//! retry. Builds with a pack sidecar directory map the uncompressed packs
+//! from there instead (see `pack_sidecar.zig`).
+
+const std = @import("std");
+const builtin = @import("builtin");
+const heap = @import("heap.zig");
+const pack_sidecar = @import("pack_sidecar.zig");
+const name_pack_data = @import("generated/harmonious_name_pack_xz.zig");
+const majmin_pack_data = @import("generated/harmonious_majmin_scene_pack_xz.zig");
+const even_segments = @import("generated/harmonious_even_segment_xz.zig");
+
+/// Packs `lmt_warmup` can decode ahead of first use; the tag is the bit
+/// index in its `kinds_mask`.
+pub const Kind = enum(u5) {
+    names,
+    majmin_scenes,
+    evenness,
+
+    pub fn bit(self: Kind) u32 {
+        return @as(u32, 1) << @intFromEnum(self);
+    }
+};
+
+pub const KIND_COUNT: u32 = @typeInfo(Kind).@"enum".fields.len;
+pub const ALL_KINDS_MASK: u32 = (@as(u32, 1) << KIND_COUNT) - 1;
+
+/// One xz stream of a pack. `raw_len` is recorded for the single-stream
+/// packs; the evenness segments are sized by decoding them.
+pub const Segment = struct {
+    xz: []const u8,
+    raw_len: ?usize = null,
+};
+
+const NAMES_SEGMENTS = [_]Segment{.{ .xz = name_pack_data.PACK_XZ[0..], .raw_len = name_pack_data.PACK_RAW_LEN }};
+const MAJMIN_SCENES_SEGMENTS = [_]Segment{.{ .xz = majmin_pack_data.PACK_XZ[0..], .raw_len = majmin_pack_data.PACK_RAW_LEN }};
+const EVENNESS_SEGMENTS = [_]Segment{
+    .{ .xz = even_segments.COMPAT_PREFIX_XZ[0..] },
+    .{ .xz = even_segments.INDEX_PREFIX_XZ[0..] },
+    .{ .xz = even_segments.COMMON_BODY_XZ[0..] },
+    .{ .xz = even_segments.GRAD_TAIL_XZ[0..] },
+    .{ .xz = even_segments.LINE_TAIL_XZ[0..] },
+    .{ .xz = even_segments.INDEX_TAIL_XZ[0..] },
+};
+
+pub fn segments(kind: Kind) []const Segment {
+    return switch (kind) {
+        .names => &NAMES_SEGMENTS,
+        .majmin_scenes => &MAJMIN_SCENES_SEGMENTS,
+        .evenness => &EVENNESS_SEGMENTS,
+    };
+}
+
+/// What a pack initializer keeps for the rest of the process.
+pub const Resident = struct {
+    bytes: usize,
+    mapped: bool = false,
+};
+
+pub const Stats = struct {
+    ready: bool = false,
+    /// The expanded pack is a read-only sidecar mapping shared through the
+    /// page cache rather than a private heap copy.
+    mapped: bool = false,
+    /// Wall time of the decode that filled the pack; 0 on wasm, which has
+    /// no clock.
+    decode_ns: u64 = 0,
+    /// Bytes the expanded pack and its indexes keep alive for the rest of
+    /// the process, mapped or on the heap.
+    resident_bytes: u64 = 0,
+};
+
+const timing_supported = !builtin.target.cpu.arch.isWasm();
+
+pub const Once = struct {
+    ready: std.atomic.Value(bool) = .init(false),
+    mutex: std.Thread.Mutex = .{},
+    decode_ns: u64 = 0,
+    resident: Resident = .{ .bytes = 0 },
+
+    /// Runs `init` until it succeeds once. `init` publishes the expanded
+    /// pack into its module globals and returns what it keeps, or null on
+    /// failure.
+    pub fn run(self: *Once, comptime init: fn () ?Resident) bool {
+        if (self.ready.load(.acquire)) return true;
+
+        self.mutex.lock();
+        defer self.mutex.unlock();
+        if (self.ready.load(.monotonic)) return true;
+
+        const start = if (timing_supported) std.time.nanoTimestamp() else 0;
+        const resident = init() orelse return false;
+        const end = if (timing_supported) std.time.nanoTimestamp() else 0;
+        self.decode_ns = @intCast(@max(end - start, 0));
+        self.resident = resident;
+        self.ready.store(true, .release);
+        return true;
+    }
+
+    pub fn stats(self: *Once) Stats {
+        if (!self.ready.load(.acquire)) return .{};
+        return .{
+            .ready = true,
+            .mapped = self.resident.mapped,
+            .decode_ns = self.decode_ns,
+            .resident_bytes = self.resident.bytes,
+        };
+    }
+};
+
+var mappings = [_]?pack_sidecar.Mapping{null} ** KIND_COUNT;
+
+/// Fills `out`, one slice per segment, with pack `kind` expanded: views into
+/// its sidecar when one is configured and matches this build, otherwise heap
+/// copies decoded from the embedded streams. Call from a `Once` initializer;
+/// returns null when decoding fails.
+pub fn expand(kind: Kind, out: [][]const u8) ?Resident {
+    if (pack_sidecar.enabled) {
+        const path = switch (kind) {
+            inline else => |k| comptime pack_sidecar.dir ++ "/" ++ pack_sidecar.fileName(k),
+        };
+        if (pack_sidecar.map(std.fs.cwd(), path, kind, segments(kind), out)) |mapping| {
+            mappings[@intFromEnum(kind)] = mapping;
+            return .{ .bytes = mapping.bytes.len, .mapped = true };
+        }
+    }
+    if (!decodeAll(kind, out)) return null;
+    var bytes: usize = 0;
+    for (out) |raw| bytes += raw.len;
+    return .{ .bytes = bytes };
+}
+
+/// Undoes `expand` for an initializer that rejects the pack.
+pub fn release(kind: Kind, out: [][]const u8) void {
+    const mapping = if (pack_sidecar.enabled) mappings[@intFromEnum(kind)] else null;
+    if (mapping) |m| {
+        m.unmap();
+        mappings[@intFromEnum(kind)] = null;
+    } else {
+        for (out) |raw| heap.allocator().free(raw);
+    }
+    for (out) |*raw| raw.* = &.{};
+}
+
+/// Decodes every embedded stream of pack `kind` into heap copies, ignoring
+/// any sidecar.
+pub fn decodeAll(kind: Kind, out: [][]const u8) bool {
+    const pack_segments = segments(kind);
+    std.debug.assert(out.len == pack_segments.len);
+    for (pack_segments, out, 0..) |segment, *slot, done| {
+        const raw = if (segment.raw_len) |raw_len| decode(segment.xz, raw_len) else decodeUnsized(segment.xz);
+        slot.* = raw orelse {
+            for (out[0..done]) |bytes| heap.allocator().free(bytes);
+            return false;
+        };
+    }
+    return true;
+}
+
+/// Decodes one xz stream that must expand to exactly `raw_len` bytes. The
+/// result is allocated from `heap` and owned by the caller.
+pub fn decode(xz: []const u8, raw_len: usize) ?[]u8 {
+    const alloc = heap.allocator();
+
+    var in_stream = std.io.fixedBufferStream(xz);
+    var dec = std.compress.xz.decompress(alloc, in_stream.reader()) catch return null;
+    defer dec.deinit();
+
+    const out = alloc.alloc(u8, raw_len) catch return null;
+    var keep_out = false;
+    defer if (!keep_out) alloc.free(out);
+
+    var out_pos: usize = 0;
+    while (out_pos < out.len) {
+        const n = dec.reader().read(out[out_pos..]) catch return null;
+        if (n == 0) break;
+        out_pos += n;
+    }
+    if (out_pos != out.len) return null;
+    keep_out = true;
+    return out;
+}
+
+/// Decodes one xz stream whose expanded size is not recorded alongside it.
+pub fn decodeUnsized(xz: []const u8) ?[]u8 {
+    return decodeGrowing(xz) catch null;
+}
+
+fn decodeGrowing(xz: []const u8) ![]u8 {
+    const alloc = heap.allocator();
+
+    var in_stream = std.io.fixedBufferStream(xz);
+    var dec = try std.compress.xz.decompress(alloc, in_stream.reader());
+    defer dec.deinit();
+
+    var out: std.ArrayList(u8) = .empty;
+    errdefer out.deinit(alloc);
+    var scratch: [4096]u8 = undefined;
+    while (true) {
+        const n = try dec.reader().read(&scratch);
+        if (n == 0) break;
+        try out.appendSlice(alloc, scratch[0..n]);
+    }
+    return out.toOwnedSlice(alloc);
+}
+
+var test_once: Once = .{};
+var test_init_calls = std.atomic.Value(u32).init(0);
+
+fn testInit() ?Resident {
+    _ = test_init_calls.fetchAdd(1, .monotonic);
+    std.Thread.sleep(2 * std.time.ns_per_ms);
+    return .{ .bytes = 42 };
+}
+
+test "once runs its initializer a single time under concurrent first use" {
+    if (builtin.single_threaded) return error.SkipZigTest;
+
+    const Worker = struct {
+        fn call(ok: *bool) void {
+            ok.* = test_once.run(testInit);
+        }
+    };
+    var threads: [8]std.Thread = undefined;
+    var results = [_]bool{false} ** threads.len;
+    for (&threads, &results) |*thread, *ok| thread.* = try std.Thread.spawn(.{}, Worker.call, .{ok});
+    for (threads) |thread| thread.join();
+
+    for (results) |ok| try std.testing.expect(ok);
+    try std.testing.expectEqual(@as(u32, 1), test_init_calls.load(.monotonic));
+    const stats = test_once.stats();
+    try std.testing.expect(stats.ready);
+    try std.testing.expectEqual(@as(u64, 42), stats.resident_bytes);
+}
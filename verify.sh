@@ -310,6 +310,124 @@ if [ -f "$ROOT_DIR/docs/plans/in_progress/0138-phrase-audit-docs-and-host-adopti
     check_cmd "cd '$ROOT_DIR' && rg -n 'out-phrase-audit|lmt_audit_keyboard_phrase_n|lmt_audit_committed_keyboard_phrase_n|lmt_rank_keyboard_phrase_repairs_n|preview remains host-only|realization-only repair|music-changing repair' scripts/validate_wasm_docs_playwright.mjs >/dev/null" "0138 phrase adoption validation guardrail (docs playwright verifies the new phrase audit output surface)"
 fi
 
+if [ -f "$ROOT_DIR/docs/plans/in_progress/0139-python-binding-package.md" ] || [ -f "$ROOT_DIR/docs/plans/completed/0139-python-binding-package.md" ]; then
+    if command -v python3 >/dev/null 2>&1; then
+        check_cmd "cd '$ROOT_DIR' && python3 scripts/generate_python_bindings.py --check >/dev/null" "0139 python bindings guardrail (generated ctypes signatures match include/libmusictheory.h)"
+    else
+        unverified "0139 python bindings guardrail (python3 missing)"
+    fi
+    check_cmd "cd '$ROOT_DIR' && rg -n 'import libmusictheory|pcs_to_list|svg_into' examples/python/ctypes_example.py >/dev/null && ! rg -n '\\.argtypes\\s*=' examples/python/ctypes_example.py >/dev/null" "0139 python bindings guardrail (example uses the package instead of hand-declared argtypes)"
+fi
+
+if [ -f "$ROOT_DIR/docs/plans/in_progress/0140-batch-set-operation-abi.md" ] || [ -f "$ROOT_DIR/docs/plans/completed/0140-batch-set-operation-abi.md" ]; then
+    check_cmd "cd '$ROOT_DIR' && test -f src/pcs_batch.zig && test -f src/tests/pcs_batch_test.zig && rg -n 'pub const pcs_batch|tests/pcs_batch_test\\.zig' src/root.zig >/dev/null" "0140 batch set foundation guardrail (batch module and focused tests are wired)"
+    check_cmd "cd '$ROOT_DIR' && rg -n 'lmt_pcs_cardinality_batch|lmt_pcs_transpose_batch|lmt_pcs_invert_batch|lmt_pcs_complement_batch|lmt_prime_form_batch|lmt_forte_prime_batch|lmt_is_cluster_free_batch|lmt_evenness_distance_batch' include/libmusictheory.h src/c_api.zig build.zig scripts/check_wasm_exports.mjs src/tests/c_api_test.zig >/dev/null" "0140 batch set ABI guardrail (batch exports are declared, exported, and tested)"
+fi
+
+if [ -f "$ROOT_DIR/docs/plans/in_progress/0141-dense-set-class-table.md" ] || [ -f "$ROOT_DIR/docs/plans/completed/0141-dense-set-class-table.md" ]; then
+    check_cmd "cd '$ROOT_DIR' && rg -n 'pub const PCS_INFO|pub const PCS_FLAGS' src/tables/set_classes.zig src/tables/classification.zig >/dev/null && rg -n 'dense per-set tables match runtime computation' src/tests/tables_test.zig >/dev/null" "0141 dense set table guardrail (per-set tables exist and are checked against runtime computation)"
+    check_cmd "cd '$ROOT_DIR' && rg -n 'lmt_set_class_info|lmt_sizeof_set_class_info|lmt_lookup_set_class|lmt_lookup_set_class_batch' include/libmusictheory.h src/c_api.zig build.zig scripts/check_wasm_exports.mjs src/tests/c_api_test.zig >/dev/null" "0141 dense set table ABI guardrail (lookup exports are declared, exported, and tested)"
+fi
+
+if [ -f "$ROOT_DIR/docs/plans/in_progress/0142-reentrant-c-api-contexts.md" ] || [ -f "$ROOT_DIR/docs/plans/completed/0142-reentrant-c-api-contexts.md" ]; then
+    check_cmd "cd '$ROOT_DIR' && rg -n 'threadlocal var c_string_slots' src/c_api.zig >/dev/null && ! rg -n '^var (compat_svg_buf|generic_voicing_meta_buf|generic_voicing_fret_buf)' src/c_api.zig >/dev/null" "0142 reentrant C API guardrail (no module-level render or voicing scratch remains)"
+    check_cmd "cd '$ROOT_DIR' && rg -n 'lmt_context_init|lmt_generate_voicings_n_ctx|lmt_preferred_voicing_n_ctx' include/libmusictheory.h src/c_api.zig build.zig scripts/check_wasm_exports.mjs src/tests/c_api_test.zig >/dev/null" "0142 reentrant C API guardrail (context exports are declared, exported, and tested)"
+fi
+
+if [ -f "$ROOT_DIR/docs/plans/in_progress/0143-render-once-svg-contexts.md" ] || [ -f "$ROOT_DIR/docs/plans/completed/0143-render-once-svg-contexts.md" ]; then
+    check_cmd "cd '$ROOT_DIR' && rg -n 'lmt_svg_clock_optc_ctx|lmt_svg_keyboard_ctx|lmt_context_svg_copy' include/libmusictheory.h src/c_api.zig build.zig scripts/check_wasm_exports.mjs src/tests/c_api_test.zig >/dev/null" "0143 render-once SVG guardrail (context SVG writers and copy-out are declared, exported, and tested)"
+fi
+
+if [ -f "$ROOT_DIR/docs/plans/in_progress/0144-streaming-svg-writers.md" ] || [ -f "$ROOT_DIR/docs/plans/completed/0144-streaming-svg-writers.md" ]; then
+    check_cmd "cd '$ROOT_DIR' && rg -n 'pub fn writeOpticKGroup' src/svg/clock.zig >/dev/null && rg -n 'pub fn writeEvennessField' src/svg/evenness_chart.zig >/dev/null" "0144 streaming SVG guardrail (large renderers accept any writer)"
+    check_cmd "cd '$ROOT_DIR' && rg -n 'lmt_write_fn|lmt_svg_optic_k_group_stream|lmt_svg_evenness_field_stream' include/libmusictheory.h src/c_api.zig build.zig scripts/check_wasm_exports.mjs src/tests/c_api_test.zig >/dev/null" "0144 streaming SVG guardrail (stream exports are declared, exported, and tested)"
+fi
+
+if [ -f "$ROOT_DIR/docs/plans/in_progress/0145-batch-catalog-rendering.md" ] || [ -f "$ROOT_DIR/docs/plans/completed/0145-batch-catalog-rendering.md" ]; then
+    check_cmd "cd '$ROOT_DIR' && rg -n 'pub fn writeOPTCPrefix' src/svg/clock.zig >/dev/null && rg -n 'pub const GridCache' src/svg/fret.zig >/dev/null && rg -n 'pub fn overlaySvgMarkupRgba' src/bitmap_compat.zig >/dev/null" "0145 batch rendering guardrail (shared clock, fret-grid, and raster base setup is reusable)"
+    check_cmd "cd '$ROOT_DIR' && rg -n 'lmt_svg_clock_optc_batch|lmt_svg_evenness_field_batch|lmt_svg_fret_n_batch|lmt_bitmap_evenness_field_batch_rgba' include/libmusictheory.h src/c_api.zig build.zig scripts/check_wasm_exports.mjs src/tests/c_api_test.zig >/dev/null" "0145 batch rendering guardrail (batch exports are declared, exported, and tested)"
+fi
+
+if [ -f "$ROOT_DIR/docs/plans/in_progress/0146-parallel-compat-catalog.md" ] || [ -f "$ROOT_DIR/docs/plans/completed/0146-parallel-compat-catalog.md" ]; then
+    check_cmd "cd '$ROOT_DIR' && rg -n 'std.Thread.Pool' src/compat_catalog.zig >/dev/null && rg -n 'compat-catalog' build.zig >/dev/null && rg -n 'pub fn renderCandidateRgbaWithScratch' src/bitmap_compat.zig >/dev/null" "0146 compat catalog guardrail (pooled renderer, build step, and per-thread raster scratch are present)"
+    check_cmd "cd '$ROOT_DIR' && rg -n 'lmt_compat_catalog_render' include/libmusictheory_compat.h src/c_api.zig src/tests/c_api_test.zig docs/api.md >/dev/null" "0146 compat catalog guardrail (C entry point is declared, tested, and documented)"
+fi
+
+if [ -f "$ROOT_DIR/docs/plans/in_progress/0147-c-abi-micro-benchmarks.md" ] || [ -f "$ROOT_DIR/docs/plans/completed/0147-c-abi-micro-benchmarks.md" ]; then
+    check_cmd "cd '$ROOT_DIR' && rg -n 'b.step\\(\"bench\"' build.zig >/dev/null && rg -n 'allocations_per_op' src/bench_main.zig bench/baseline.json >/dev/null" "0147 micro-benchmark guardrail (bench step, harness, and stored baseline are present)"
+    check_cmd "cd '$ROOT_DIR' && rg -n 'heap.allocator\\(\\)' src/harmonious_name_pack.zig src/svg/majmin_compat.zig src/svg/evenness_compat.zig >/dev/null" "0147 micro-benchmark guardrail (pack decoders allocate through the counted heap)"
+fi
+
+if [ -f "$ROOT_DIR/docs/plans/in_progress/0148-python-ffi-benchmark.md" ] || [ -f "$ROOT_DIR/docs/plans/completed/0148-python-ffi-benchmark.md" ]; then
+    check_cmd "cd '$ROOT_DIR' && rg -n 'lmt_chord_name|lmt_generate_voicings_n|lmt_rank_next_steps|lmt_svg_fret_n_batch' examples/python/bench_ffi.py >/dev/null && rg -n 'overhead_ns' examples/python/bench_ffi.py >/dev/null" "0148 python FFI benchmark guardrail (all four exports are timed and overhead is reported)"
+    check_cmd "cd '$ROOT_DIR' && rg -n 'runChordName' src/bench_main.zig >/dev/null && rg -n 'chord_name' bench/baseline.json >/dev/null" "0148 python FFI benchmark guardrail (native harness covers chord_name)"
+fi
+
+if [ -f "$ROOT_DIR/docs/plans/in_progress/0149-numeric-render-ir.md" ] || [ -f "$ROOT_DIR/docs/plans/completed/0149-numeric-render-ir.md" ]; then
+    check_cmd "cd '$ROOT_DIR' && rg -n 'pub const NumericScene|pub fn toNumeric|pub fn tokenizePath' src/render/ir.zig >/dev/null && rg -n 'pub fn renderNumericScene' src/render/raster.zig >/dev/null" "0149 numeric render IR guardrail (numeric scene, conversion, and raster entry point are present)"
+    check_cmd "cd '$ROOT_DIR' && rg -n 'numeric ir path and number round trip is lossless' src/tests/render_ir_test.zig >/dev/null && rg -n 'numeric demo scene matches the text scene' src/tests/raster_test.zig >/dev/null" "0149 numeric render IR guardrail (round-trip and raster parity tests are present)"
+fi
+
+if [ -f "$ROOT_DIR/docs/plans/in_progress/0150-raster-backend-all-ir-ops.md" ] || [ -f "$ROOT_DIR/docs/plans/completed/0150-raster-backend-all-ir-ops.md" ]; then
+    check_cmd "cd '$ROOT_DIR' && rg -n 'pub fn fillEdges|pub fn accumulateScanlineCoverage|pub fn applyCoverageRow' src/render/scanline.zig >/dev/null && rg -n 'render/scanline.zig' src/bitmap_compat.zig >/dev/null" "0150 raster backend guardrail (scanline core is shared with bitmap_compat)"
+    check_cmd "cd '$ROOT_DIR' && rg -n 'fn drawPath|fn drawEllipse|fn drawPoly|group_start' src/render/raster.zig >/dev/null && rg -n 'raster backend matches the svg markup rasterizer' src/tests/raster_test.zig >/dev/null" "0150 raster backend guardrail (every IR op is drawn and checked against the markup rasterizer)"
+fi
+if [ -f "$ROOT_DIR/docs/plans/in_progress/0151-tiled-compat-raster.md" ] || [ -f "$ROOT_DIR/docs/plans/completed/0151-tiled-compat-raster.md" ]; then
+    check_cmd "cd '$ROOT_DIR' && rg -n 'pub fn binEdges|band_start' src/render/scanline.zig >/dev/null && rg -n 'pub fn renderCandidateRgbaScaledTiled' src/bitmap_compat.zig >/dev/null" "0151 tiled compat raster guardrail (bands clip the shared scanline core)"
+    check_cmd "cd '$ROOT_DIR' && rg -n 'tiled candidate render is bit-identical' src/bitmap_compat.zig >/dev/null && rg -n 'lmt_bitmap_compat_render_candidate_rgba_scaled_tiled' include/libmusictheory_compat.h >/dev/null" "0151 tiled compat raster guardrail (tiled output is checked against the single pass)"
+fi
+if [ -f "$ROOT_DIR/docs/plans/in_progress/0152-vector-coverage-blend.md" ] || [ -f "$ROOT_DIR/docs/plans/completed/0152-vector-coverage-blend.md" ]; then
+    check_cmd "cd '$ROOT_DIR' && rg -n 'pub fn blendCoverageLanes|pub fn applyCoverageRowScalar|pub fn accumulateScanlineCoverageScalar' src/render/scanline.zig >/dev/null" "0152 vector coverage guardrail (vector path keeps its scalar reference)"
+    check_cmd "cd '$ROOT_DIR' && rg -n 'vector coverage rows match the scalar reference' src/tests/raster_test.zig >/dev/null && rg -n 'coverage_row_simd_1024' src/bench_main.zig >/dev/null" "0152 vector coverage guardrail (parity test and Mpx/s bench)"
+fi
+if [ -f "$ROOT_DIR/docs/plans/in_progress/0153-render-cache.md" ] || [ -f "$ROOT_DIR/docs/plans/completed/0153-render-cache.md" ]; then
+    check_cmd "cd '$ROOT_DIR' && rg -n 'pub fn serve|pub fn invalidate' src/render/cache.zig >/dev/null && rg -n 'lmt_render_cache_get_stats' include/libmusictheory.h >/dev/null" "0153 render cache guardrail (LRU cache is exposed through the C ABI)"
+    check_cmd "cd '$ROOT_DIR' && rg -n 'render cache serves repeated svg and rgba calls' src/tests/c_api_test.zig >/dev/null && rg -n 'svg_clock_optc_cached' src/bench_main.zig >/dev/null" "0153 render cache guardrail (hit parity test and cached bench)"
+fi
+if [ -f "$ROOT_DIR/docs/plans/in_progress/0154-prerendered-asset-pack.md" ] || [ -f "$ROOT_DIR/docs/plans/completed/0154-prerendered-asset-pack.md" ]; then
+    check_cmd "cd '$ROOT_DIR' && rg -n 'prerendered-assets' build.zig >/dev/null && rg -n 'pub fn lookup' src/prerendered_assets.zig >/dev/null && test -f scripts/generate_prerendered_asset_pack.py" "0154 prerendered asset guardrail (build flag, generator, and O(1) lookup)"
+    check_cmd "cd '$ROOT_DIR' && rg -n 'prerendered svg lookups match the live renderers' src/tests/c_api_test.zig >/dev/null && rg -n 'lmt_svg_prerendered_count' include/libmusictheory.h >/dev/null" "0154 prerendered asset guardrail (pack parity test and C ABI lookup)"
+fi
+if [ -f "$ROOT_DIR/docs/plans/in_progress/0155-incremental-bitmap-views.md" ] || [ -f "$ROOT_DIR/docs/plans/completed/0155-incremental-bitmap-views.md" ]; then
+    check_cmd "cd '$ROOT_DIR' && rg -n 'pub fn redrawSvgMarkupRgbaRect' src/bitmap_compat.zig >/dev/null && rg -n 'pub const KeyboardView' src/render/incremental.zig >/dev/null" "0155 incremental bitmap view guardrail (clipped redraw and view state)"
+    check_cmd "cd '$ROOT_DIR' && rg -n 'bitmap views redraw changed regions and match full renders' src/tests/c_api_test.zig >/dev/null && rg -n 'lmt_bitmap_keyboard_view_update' include/libmusictheory.h >/dev/null" "0155 incremental bitmap view guardrail (full-render parity test and C ABI)"
+fi
+if [ -f "$ROOT_DIR/docs/plans/in_progress/0156-band-streaming-raster.md" ] || [ -f "$ROOT_DIR/docs/plans/completed/0156-band-streaming-raster.md" ]; then
+    check_cmd "cd '$ROOT_DIR' && rg -n 'pub fn fillCoverageRows' src/render/scanline.zig >/dev/null && rg -n 'pub fn streamSvgMarkupRgba' src/bitmap_compat.zig >/dev/null" "0156 band-streaming raster guardrail (tiled coverage and band renderer)"
+    check_cmd "cd '$ROOT_DIR' && rg -n 'band streams match full renders at any width' src/tests/c_api_test.zig >/dev/null && rg -n 'lmt_bitmap_svg_stream_rgba' include/libmusictheory.h >/dev/null" "0156 band-streaming raster guardrail (full-render parity test and C ABI)"
+fi
+if [ -f "$ROOT_DIR/docs/plans/in_progress/0157-png-qoi-encoders.md" ] || [ -f "$ROOT_DIR/docs/plans/completed/0157-png-qoi-encoders.md" ]; then
+    check_cmd "cd '$ROOT_DIR' && rg -n 'pub fn Encoder' src/render/png.zig >/dev/null && rg -n 'pub fn Encoder' src/render/qoi.zig >/dev/null" "0157 png/qoi encoder guardrail (streaming encoders)"
+    check_cmd "cd '$ROOT_DIR' && rg -n 'png and qoi writers encode the rgba render' src/tests/c_api_test.zig >/dev/null && rg -n 'lmt_bitmap_svg_png' include/libmusictheory.h >/dev/null" "0157 png/qoi encoder guardrail (encoded parity test and C ABI)"
+fi
+if [ -f "$ROOT_DIR/docs/plans/in_progress/0158-precomputed-geometry-tables.md" ] || [ -f "$ROOT_DIR/docs/plans/completed/0158-precomputed-geometry-tables.md" ]; then
+    check_cmd "cd '$ROOT_DIR' && rg -n 'pub const triad_edges' src/svg/orbifold.zig >/dev/null && rg -n 'pub const scale_edges' src/svg/tessellation.zig >/dev/null && rg -n 'OPTC_NODE_HEADS' src/svg/clock.zig >/dev/null" "0158 precomputed geometry guardrail (comptime tables)"
+    check_cmd "cd '$ROOT_DIR' && rg -n 'comptime orbifold tables match the runtime enumeration' src/tests/svg_misc_test.zig >/dev/null && rg -n 'comptime tessellation tables match the runtime enumeration' src/tests/svg_tessellation_test.zig >/dev/null" "0158 precomputed geometry guardrail (table parity tests)"
+fi
+
+if [ -f "$ROOT_DIR/docs/plans/in_progress/0159-direct-scene-staff-keyboard-bitmaps.md" ] || [ -f "$ROOT_DIR/docs/plans/completed/0159-direct-scene-staff-keyboard-bitmaps.md" ]; then
+    check_cmd "cd '$ROOT_DIR' && rg -n 'pub fn chordStaffScene' src/svg/staff.zig >/dev/null && rg -n 'pub fn keyboardScene' src/svg/keyboard_svg.zig >/dev/null && rg -n 'fn renderPublicSceneBitmap' src/c_api.zig >/dev/null" "0159 direct scene bitmap guardrail (scene builders)"
+    check_cmd "cd '$ROOT_DIR' && rg -n 'staff and keyboard bitmaps match their rasterized markup' src/tests/c_api_test.zig >/dev/null && rg -n 'blend shortcuts and uniform coverage runs match the full arithmetic' src/tests/raster_test.zig >/dev/null" "0159 direct scene bitmap guardrail (pixel parity tests)"
+fi
+
+if [ -f "$ROOT_DIR/docs/plans/in_progress/0160-once-only-xz-pack-warmup.md" ] || [ -f "$ROOT_DIR/docs/plans/completed/0160-once-only-xz-pack-warmup.md" ]; then
+    check_cmd "cd '$ROOT_DIR' && rg -n 'pub const Once' src/xz_pack.zig >/dev/null && rg -n 'pub export fn lmt_warmup' src/c_api.zig >/dev/null && rg -n 'lmt_pack_get_stats' include/libmusictheory.h >/dev/null" "0160 xz pack once-init guardrail (warmup and stats exports)"
+    check_cmd "cd '$ROOT_DIR' && ! rg -n 'decoded_ready|parsed_ready' src/harmonious_name_pack.zig src/svg/majmin_compat.zig >/dev/null && rg -n 'decodes each embedded pack once across threads' src/tests/c_api_test.zig >/dev/null" "0160 xz pack once-init guardrail (no unguarded ready flags)"
+fi
+
+if [ -f "$ROOT_DIR/docs/plans/in_progress/0161-mapped-pack-sidecars.md" ] || [ -f "$ROOT_DIR/docs/plans/completed/0161-mapped-pack-sidecars.md" ]; then
+    check_cmd "cd '$ROOT_DIR' && rg -n 'pub fn map' src/pack_sidecar.zig >/dev/null && rg -n 'pack-sidecar-dir' build.zig >/dev/null && rg -n 'def encode_sidecar' scripts/pack_sidecar.py >/dev/null" "0161 pack sidecar guardrail (loader, build option, python writer)"
+    check_cmd "cd '$ROOT_DIR' && rg -n 'sidecar round-trips segments and rejects a stale pack' src/pack_sidecar.zig >/dev/null" "0161 pack sidecar guardrail (round-trip test)"
+fi
+if [ -f "$ROOT_DIR/docs/plans/in_progress/0162-parallel-cached-generators.md" ] || [ -f "$ROOT_DIR/docs/plans/completed/0162-parallel-cached-generators.md" ]; then
+    check_cmd "cd '$ROOT_DIR' && rg -n 'def parse_files' scripts/generator_cache.py >/dev/null && rg -n 'ProcessPoolExecutor' scripts/generator_cache.py >/dev/null" "0162 generator cache guardrail (pool and content-hash cache)"
+    check_cmd "cd '$ROOT_DIR' && rg -n 'parse_files\\(' scripts/generate_harmonious_majmin_scene_pack.py scripts/generate_harmonious_majmin_compat.py scripts/generate_harmonious_text_primitives.py >/dev/null" "0162 generator cache guardrail (generators use parse_files)"
+fi
+if [ -f "$ROOT_DIR/docs/plans/in_progress/0163-shared-svg-path-template.md" ] || [ -f "$ROOT_DIR/docs/plans/completed/0163-shared-svg-path-template.md" ]; then
+    check_cmd "cd '$ROOT_DIR' && rg -n 'from lib.svg_path_template import make_template' scripts/generate_harmonious_majmin_compat.py scripts/generate_harmonious_majmin_scene_pack.py scripts/audit_majmin_scales_parametric.py >/dev/null && ! rg -n '^def (tokenize_path|dec_to_i128|make_template)' scripts/generate_harmonious_majmin_compat.py scripts/generate_harmonious_majmin_scene_pack.py scripts/audit_majmin_scales_parametric.py >/dev/null" "0163 shared path template guardrail (scripts import the shared module instead of copies)"
+    check_cmd "cd '$ROOT_DIR' && python3 scripts/check_svg_path_template.py >/dev/null" "0163 shared path template guardrail (parity with the previous tokenizer)"
+fi
+
 
 
 if [ -f "$ROOT_DIR/docs/plans/in_progress/0088-live-midi-composer-scene.md" ] || [ -f "$ROOT_DIR/docs/plans/completed/0088-live-midi-composer-scene.md" ]; then
@@ -0,0 +1 @@
+// Validation-focused wasm bundle: interactive demo app is not shipped in this profile.\n
\ No newline at end of file